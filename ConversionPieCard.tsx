@@ -0,0 +1,62 @@
+'use client';
+
+import { memo } from 'react';
+import { PieChart, Pie, Cell, Tooltip, Legend, ResponsiveContainer } from 'recharts';
+import { MotionDiv } from './Motion';
+import { PieChart as PieIcon } from 'lucide-react';
+import type { CampaignChartRow } from '@/lib/selectors';
+import { formatNumber } from '@/lib/utils';
+import { usePerformanceMode } from '@/lib/performanceMode';
+import { useRenderCount } from '@/lib/useRenderCount';
+
+const COLORS = ['#3B82F6', '#10B981', '#F59E0B', '#EF4444', '#8B5CF6'];
+
+// Conversion Distribution Pie Chart
+interface ConversionPieCardProps {
+  data: CampaignChartRow[];
+}
+
+export const ConversionPieCard = memo(function ConversionPieCard({ data }: ConversionPieCardProps) {
+  useRenderCount('ConversionPieCard');
+  const performanceMode = usePerformanceMode();
+
+  return (
+    <MotionDiv
+      initial={{ opacity: 0, y: 20 }}
+      animate={{ opacity: 1, y: 0 }}
+      transition={{ duration: 0.3, delay: 0.3 }}
+      className="glass-effect rounded-xl p-6"
+    >
+      <div className="flex items-center justify-between mb-4">
+        <div className="flex items-center space-x-2">
+          <PieIcon className="w-5 h-5 text-purple-600" />
+          <h3 className="text-lg font-semibold text-gray-900 dark:text-white">
+            Conversion Distribution
+          </h3>
+        </div>
+      </div>
+      <ResponsiveContainer width="100%" height={250}>
+        <PieChart>
+          <Pie
+            data={data}
+            cx="50%"
+            cy="50%"
+            innerRadius={60}
+            outerRadius={100}
+            paddingAngle={5}
+            dataKey="conversions"
+            isAnimationActive={!performanceMode}
+          >
+            {data.map((entry, index) => (
+              <Cell key={`cell-${index}`} fill={COLORS[index % COLORS.length]} />
+            ))}
+          </Pie>
+          <Tooltip
+            formatter={(value) => [formatNumber(Number(value)), 'Conversions']}
+          />
+          <Legend />
+        </PieChart>
+      </ResponsiveContainer>
+    </MotionDiv>
+  );
+});
@@ -0,0 +1,30 @@
+// Server components for the dashboard's streamed sections. Each awaits only
+// the data it renders inside its own Suspense boundary (see app/page.tsx), so
+// the metric cards flush as soon as the summary is ready while the charts and
+// table follow with the full snapshot
+import { getDashboardSnapshot, getDashboardSummary, type DashboardQuery } from '@/lib/dashboardData';
+import { LiveCharts, LiveDataTable, LiveMetricCards } from './Dashboard';
+
+interface SectionProps {
+  query: DashboardQuery;
+}
+
+export async function MetricsSection({ query }: SectionProps) {
+  const summary = await getDashboardSummary(query);
+  return summary ? <LiveMetricCards summary={summary.summary} datasetVersion={summary.datasetVersion} /> : null;
+}
+
+export async function ChartsSection({ query }: SectionProps) {
+  const snapshot = await getDashboardSnapshot(query);
+  if (!snapshot) return null;
+
+  const { totals, series, campaigns, generatedAt, datasetVersion, rowCursor } = snapshot;
+  return <LiveCharts seed={{ totals, series, campaigns, generatedAt, datasetVersion, rowCursor }} />;
+}
+
+export async function TableSection({ query }: SectionProps) {
+  const snapshot = await getDashboardSnapshot(query);
+  return snapshot ? (
+    <LiveDataTable campaigns={snapshot.campaigns} datasetVersion={snapshot.datasetVersion} />
+  ) : null;
+}
@@ -1,7 +1,7 @@
 'use client';
 
 import { useState, useMemo } from 'react';
-import { motion } from 'framer-motion';
+import { MotionDiv, MotionTr } from './Motion';
 import { 
   Search, 
   Download, 
@@ -10,15 +10,32 @@ import {
   Filter,
   X 
 } from 'lucide-react';
-import { CampaignData } from '@/data/mockData';
+import type { CampaignData } from '@/data/mockData';
 import { formatCurrency, formatNumber, formatPercentage, exportToCSV } from '@/lib/utils';
+import {
+  type TableQuery,
+  type TableSortField,
+  type TableSortDirection,
+} from '@/lib/tableQuery';
+import { useTableQuery } from '@/lib/useTableQuery';
+import { useVirtualRows } from '@/lib/useVirtualRows';
 
 interface DataTableProps {
   data: CampaignData[];
 }
 
-type SortField = keyof CampaignData;
-type SortDirection = 'asc' | 'desc';
+type SortField = TableSortField;
+type SortDirection = TableSortDirection;
+
+// Page size 0 shows every row in one scrollable list
+const ALL_ROWS = 0;
+const PAGE_SIZE_OPTIONS = [10, 25, 50, 100, ALL_ROWS];
+
+// Pages longer than this are windowed: only visible rows are mounted and
+// row entrance animations are skipped
+const VIRTUAL_ROW_THRESHOLD = 25;
+const ROW_HEIGHT = 45;
+const VIEWPORT_HEIGHT = 540;
 
 export function DataTable({ data }: DataTableProps) {
   const [searchTerm, setSearchTerm] = useState('');
@@ -28,46 +45,33 @@ export function DataTable({ data }: DataTableProps) {
   const [showFilters, setShowFilters] = useState(false);
   const [minRevenue, setMinRevenue] = useState('');
   const [maxRevenue, setMaxRevenue] = useState('');
+  const [pageSize, setPageSize] = useState(10);
+  const [exportProgress, setExportProgress] = useState<number | null>(null);
 
-  const itemsPerPage = 10;
-
-  // Filter and sort data
-  const filteredAndSortedData = useMemo(() => {
-    let filtered = data.filter(item =>
-      item.campaign.toLowerCase().includes(searchTerm.toLowerCase())
-    );
-
-    // Apply revenue filters
-    if (minRevenue) {
-      filtered = filtered.filter(item => item.revenue >= parseInt(minRevenue));
-    }
-    if (maxRevenue) {
-      filtered = filtered.filter(item => item.revenue <= parseInt(maxRevenue));
-    }
+  const itemsPerPage = pageSize === ALL_ROWS ? Math.max(data.length, 1) : pageSize;
 
-    // Sort data
-    return filtered.sort((a, b) => {
-      const aValue = a[sortField];
-      const bValue = b[sortField];
+  // Parse the revenue bounds once per change instead of on every comparison
+  const query = useMemo<TableQuery>(() => {
+    const min = parseInt(minRevenue);
+    const max = parseInt(maxRevenue);
+    return {
+      search: searchTerm,
+      minRevenue: Number.isNaN(min) ? null : min,
+      maxRevenue: Number.isNaN(max) ? null : max,
+      sortField,
+      sortDirection,
+      page: pageSize === ALL_ROWS ? 1 : currentPage,
+      pageSize: itemsPerPage,
+    };
+  }, [searchTerm, minRevenue, maxRevenue, sortField, sortDirection, currentPage, pageSize, itemsPerPage]);
 
-      if (typeof aValue === 'string' && typeof bValue === 'string') {
-        return sortDirection === 'asc' 
-          ? aValue.localeCompare(bValue)
-          : bValue.localeCompare(aValue);
-      }
+  // Filtering, sorting and pagination run in a worker
+  const { rows: paginatedData, total: totalRows, queryAll } = useTableQuery(data, query);
+  const totalPages = Math.ceil(totalRows / itemsPerPage);
 
-      return sortDirection === 'asc' 
-        ? (aValue as number) - (bValue as number)
-        : (bValue as number) - (aValue as number);
-    });
-  }, [data, searchTerm, sortField, sortDirection, minRevenue, maxRevenue]);
-
-  // Pagination
-  const totalPages = Math.ceil(filteredAndSortedData.length / itemsPerPage);
-  const paginatedData = filteredAndSortedData.slice(
-    (currentPage - 1) * itemsPerPage,
-    currentPage * itemsPerPage
-  );
+  const isVirtual = paginatedData.length > VIRTUAL_ROW_THRESHOLD;
+  const virtualRows = useVirtualRows(isVirtual ? paginatedData.length : 0, ROW_HEIGHT, VIEWPORT_HEIGHT);
+  const windowSize = virtualRows.end - virtualRows.start;
 
   const handleSort = (field: SortField) => {
     if (field === sortField) {
@@ -78,8 +82,22 @@ export function DataTable({ data }: DataTableProps) {
     }
   };
 
-  const handleExport = () => {
-    exportToCSV(filteredAndSortedData, 'campaign-data.csv');
+  const handleExport = async () => {
+    setExportProgress(0);
+    try {
+      // The worker already holds the index; only the matching row ids come back
+      const { rows, data: source } = await queryAll(query);
+      const exportRows = function* () {
+        for (let k = 0; k < rows.length; k++) yield source[rows[k]];
+      };
+
+      await exportToCSV(exportRows(), 'campaign-data.csv', {
+        total: rows.length,
+        onProgress: (written, total) => setExportProgress(total === 0 ? 100 : (written / total) * 100),
+      });
+    } finally {
+      setExportProgress(null);
+    }
   };
 
   const clearFilters = () => {
@@ -89,6 +107,34 @@ export function DataTable({ data }: DataTableProps) {
     setCurrentPage(1);
   };
 
+  const handlePageSizeChange = (size: number) => {
+    setPageSize(size);
+    setCurrentPage(1);
+  };
+
+  const renderCells = (item: CampaignData) => (
+    <>
+      <td className="px-4 py-3 text-sm font-medium text-gray-900 dark:text-white">
+        {item.campaign}
+      </td>
+      <td className="px-4 py-3 text-sm text-gray-700 dark:text-gray-300">
+        {formatCurrency(item.revenue)}
+      </td>
+      <td className="px-4 py-3 text-sm text-gray-700 dark:text-gray-300">
+        {formatNumber(item.users)}
+      </td>
+      <td className="px-4 py-3 text-sm text-gray-700 dark:text-gray-300">
+        {formatNumber(item.conversions)}
+      </td>
+      <td className="px-4 py-3 text-sm text-gray-700 dark:text-gray-300">
+        {formatPercentage(item.ctr)}
+      </td>
+      <td className="px-4 py-3 text-sm text-gray-700 dark:text-gray-300">
+        {formatCurrency(item.cost)}
+      </td>
+    </>
+  );
+
   const SortIcon = ({ field }: { field: SortField }) => {
     if (sortField !== field) return null;
     return sortDirection === 'asc' ? 
@@ -97,7 +143,7 @@ export function DataTable({ data }: DataTableProps) {
   };
 
   return (
-    <motion.div
+    <MotionDiv
       initial={{ opacity: 0, y: 20 }}
       animate={{ opacity: 1, y: 0 }}
       transition={{ duration: 0.3, delay: 0.5 }}
@@ -109,6 +155,18 @@ export function DataTable({ data }: DataTableProps) {
           Campaign Performance Data
         </h3>
         <div className="flex flex-wrap items-center gap-2">
+          <select
+            value={pageSize}
+            onChange={(e) => handlePageSizeChange(Number(e.target.value))}
+            aria-label="Rows per page"
+            className="px-3 py-2 text-sm border border-gray-300 dark:border-gray-600 rounded-lg bg-white dark:bg-gray-700 text-gray-900 dark:text-white"
+          >
+            {PAGE_SIZE_OPTIONS.map(size => (
+              <option key={size} value={size}>
+                {size === ALL_ROWS ? 'All rows' : `${size} rows`}
+              </option>
+            ))}
+          </select>
           <button
             onClick={() => setShowFilters(!showFilters)}
             className="flex items-center space-x-2 px-3 py-2 bg-blue-600 text-white rounded-lg hover:bg-blue-700 transition-colors"
@@ -118,17 +176,20 @@ export function DataTable({ data }: DataTableProps) {
           </button>
           <button
             onClick={handleExport}
-            className="flex items-center space-x-2 px-3 py-2 bg-green-600 text-white rounded-lg hover:bg-green-700 transition-colors"
+            disabled={exportProgress !== null}
+            className="flex items-center space-x-2 px-3 py-2 bg-green-600 text-white rounded-lg hover:bg-green-700 disabled:opacity-75 disabled:cursor-wait transition-colors"
           >
             <Download className="w-4 h-4" />
-            <span>Export CSV</span>
+            <span>
+              {exportProgress === null ? 'Export CSV' : `Exporting ${exportProgress.toFixed(0)}%`}
+            </span>
           </button>
         </div>
       </div>
 
       {/* Filters */}
       {showFilters && (
-        <motion.div
+        <MotionDiv
           initial={{ opacity: 0, height: 0 }}
           animate={{ opacity: 1, height: 'auto' }}
           exit={{ opacity: 0, height: 0 }}
@@ -184,13 +245,17 @@ export function DataTable({ data }: DataTableProps) {
               <span>Clear Filters</span>
             </button>
           </div>
-        </motion.div>
+        </MotionDiv>
       )}
 
       {/* Table */}
-      <div className="overflow-x-auto">
+      <div
+        className={isVirtual ? 'overflow-auto' : 'overflow-x-auto'}
+        style={isVirtual ? { maxHeight: VIEWPORT_HEIGHT } : undefined}
+        onScroll={isVirtual ? virtualRows.onScroll : undefined}
+      >
         <table className="w-full">
-          <thead>
+          <thead className={isVirtual ? 'sticky top-0 z-10 bg-white dark:bg-gray-900' : undefined}>
             <tr className="border-b border-gray-200 dark:border-gray-700">
               {[
                 { key: 'campaign', label: 'Campaign' },
@@ -214,45 +279,50 @@ export function DataTable({ data }: DataTableProps) {
             </tr>
           </thead>
           <tbody className="divide-y divide-gray-200 dark:divide-gray-700">
-            {paginatedData.map((item, index) => (
-              <motion.tr
-                key={item.campaign}
-                initial={{ opacity: 0 }}
-                animate={{ opacity: 1 }}
-                transition={{ delay: index * 0.05 }}
-                className="hover:bg-gray-50 dark:hover:bg-gray-800/50 transition-colors"
-              >
-                <td className="px-4 py-3 text-sm font-medium text-gray-900 dark:text-white">
-                  {item.campaign}
-                </td>
-                <td className="px-4 py-3 text-sm text-gray-700 dark:text-gray-300">
-                  {formatCurrency(item.revenue)}
-                </td>
-                <td className="px-4 py-3 text-sm text-gray-700 dark:text-gray-300">
-                  {formatNumber(item.users)}
-                </td>
-                <td className="px-4 py-3 text-sm text-gray-700 dark:text-gray-300">
-                  {formatNumber(item.conversions)}
-                </td>
-                <td className="px-4 py-3 text-sm text-gray-700 dark:text-gray-300">
-                  {formatPercentage(item.ctr)}
-                </td>
-                <td className="px-4 py-3 text-sm text-gray-700 dark:text-gray-300">
-                  {formatCurrency(item.cost)}
-                </td>
-              </motion.tr>
-            ))}
+            {isVirtual ? (
+              <>
+                {virtualRows.padTop > 0 && <tr style={{ height: virtualRows.padTop }} />}
+                {paginatedData.slice(virtualRows.start, virtualRows.end).map((item, offset) => (
+                  // Keys cycle through a fixed pool so scrolled-out rows are reused
+                  <tr
+                    key={(virtualRows.start + offset) % windowSize}
+                    style={{ height: ROW_HEIGHT }}
+                    className="hover:bg-gray-50 dark:hover:bg-gray-800/50 transition-colors"
+                  >
+                    {renderCells(item)}
+                  </tr>
+                ))}
+                {virtualRows.padBottom > 0 && <tr style={{ height: virtualRows.padBottom }} />}
+              </>
+            ) : (
+              paginatedData.map((item, index) => (
+                <MotionTr
+                  key={item.campaign}
+                  initial={{ opacity: 0 }}
+                  animate={{ opacity: 1 }}
+                  transition={{ delay: index * 0.05 }}
+                  className="hover:bg-gray-50 dark:hover:bg-gray-800/50 transition-colors"
+                >
+                  {renderCells(item)}
+                </MotionTr>
+              ))
+            )}
           </tbody>
         </table>
       </div>
 
       {/* Pagination */}
-      {totalPages > 1 && (
+      {pageSize === ALL_ROWS && (
+        <div className="mt-6 text-sm text-gray-700 dark:text-gray-300">
+          Showing all {totalRows} results
+        </div>
+      )}
+      {pageSize !== ALL_ROWS && totalPages > 1 && (
         <div className="flex items-center justify-between mt-6">
           <div className="text-sm text-gray-700 dark:text-gray-300">
             Showing {(currentPage - 1) * itemsPerPage + 1} to{' '}
-            {Math.min(currentPage * itemsPerPage, filteredAndSortedData.length)} of{' '}
-            {filteredAndSortedData.length} results
+            {Math.min(currentPage * itemsPerPage, totalRows)} of{' '}
+            {totalRows} results
           </div>
           <div className="flex items-center space-x-2">
             <button
@@ -275,6 +345,6 @@ export function DataTable({ data }: DataTableProps) {
           </div>
         </div>
       )}
-    </motion.div>
+    </MotionDiv>
   );
 }
@@ -0,0 +1,42 @@
+'use client';
+
+import { useEffect, useRef, useState, type ReactNode } from 'react';
+
+interface LazyPanelProps {
+  // Shown until the panel nears the viewport, sized like the real content
+  fallback: ReactNode;
+  children: ReactNode;
+  // How far outside the viewport a panel starts loading
+  rootMargin?: string;
+}
+
+// Defers mounting `children` until the panel scrolls near the viewport. Paired
+// with next/dynamic, a panel's code is only fetched and hydrated at that point,
+// so below-the-fold panels stay off the startup path. Once shown, a panel stays mounted
+export function LazyPanel({ fallback, children, rootMargin = '200px' }: LazyPanelProps) {
+  const ref = useRef<HTMLDivElement>(null);
+  const [visible, setVisible] = useState(false);
+
+  useEffect(() => {
+    const element = ref.current;
+    if (visible || !element) return;
+    if (typeof IntersectionObserver === 'undefined') {
+      setVisible(true);
+      return;
+    }
+
+    const observer = new IntersectionObserver(
+      entries => {
+        if (entries.some(entry => entry.isIntersecting)) {
+          setVisible(true);
+          observer.disconnect();
+        }
+      },
+      { rootMargin }
+    );
+    observer.observe(element);
+    return () => observer.disconnect();
+  }, [visible, rootMargin]);
+
+  return <div ref={ref}>{visible ? children : fallback}</div>;
+}
@@ -42,3 +42,32 @@ export function ChartSkeleton() {
     </div>
   );
 }
+
+export function TableSkeleton({ rows = 8 }: { rows?: number }) {
+  return (
+    <div className="glass-effect rounded-xl p-6 animate-pulse">
+      <div className="h-6 bg-gray-300 dark:bg-gray-700 rounded mb-6 w-48" />
+      <LoadingSkeleton rows={rows} />
+    </div>
+  );
+}
+
+export function MetricCardsSkeleton() {
+  return (
+    <div className="grid grid-cols-1 sm:grid-cols-2 lg:grid-cols-4 gap-6">
+      {Array.from({ length: 4 }).map((_, i) => (
+        <CardSkeleton key={i} />
+      ))}
+    </div>
+  );
+}
+
+export function ChartsSkeleton() {
+  return (
+    <div className="grid grid-cols-1 lg:grid-cols-2 gap-6">
+      {Array.from({ length: 4 }).map((_, i) => (
+        <ChartSkeleton key={i} />
+      ))}
+    </div>
+  );
+}
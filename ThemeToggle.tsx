@@ -2,7 +2,7 @@
 
 import { useState, useEffect } from 'react';
 import { Sun, Moon } from 'lucide-react';
-import { motion } from 'framer-motion';
+import { MotionButton } from './Motion';
 
 export function ThemeToggle() {
   const [isDark, setIsDark] = useState(false);
@@ -32,7 +32,7 @@ export function ThemeToggle() {
   };
 
   return (
-    <motion.button
+    <MotionButton
       whileHover={{ scale: 1.05 }}
       whileTap={{ scale: 0.95 }}
       onClick={toggleTheme}
@@ -44,6 +44,6 @@ export function ThemeToggle() {
       ) : (
         <Moon className="w-5 h-5 text-blue-600" />
       )}
-    </motion.button>
+    </MotionButton>
   );
 }
@@ -1,304 +0,0 @@
-/*
- * ATTENTION: An "eval-source-map" devtool has been used.
- * This devtool is neither made for production nor for readable output files.
- * It uses "eval()" calls to create a separate source file with attached SourceMaps in the browser devtools.
- * If you are trying to read the output file, select a different devtool (https://webpack.js.org/configuration/devtool/)
- * or disable the default devtool with "devtool: false".
- * If you are looking for production-ready output files, see mode: "production" (https://webpack.js.org/configuration/mode/).
- */
-(() => {
-var exports = {};
-exports.id = "app/page";
-exports.ids = ["app/page"];
-exports.modules = {
-
-/***/ "./action-async-storage.external":
-/*!****************************************************************************!*\
-  !*** external "next/dist/client/components/action-async-storage.external" ***!
-  \****************************************************************************/
-/***/ ((module) => {
-
-"use strict";
-module.exports = require("next/dist/client/components/action-async-storage.external");
-
-/***/ }),
-
-/***/ "../../client/components/action-async-storage.external":
-/*!*******************************************************************************!*\
-  !*** external "next/dist/client/components/action-async-storage.external.js" ***!
-  \*******************************************************************************/
-/***/ ((module) => {
-
-"use strict";
-module.exports = require("next/dist/client/components/action-async-storage.external.js");
-
-/***/ }),
-
-/***/ "./request-async-storage.external":
-/*!*****************************************************************************!*\
-  !*** external "next/dist/client/components/request-async-storage.external" ***!
-  \*****************************************************************************/
-/***/ ((module) => {
-
-"use strict";
-module.exports = require("next/dist/client/components/request-async-storage.external");
-
-/***/ }),
-
-/***/ "../../client/components/request-async-storage.external":
-/*!********************************************************************************!*\
-  !*** external "next/dist/client/components/request-async-storage.external.js" ***!
-  \********************************************************************************/
-/***/ ((module) => {
-
-"use strict";
-module.exports = require("next/dist/client/components/request-async-storage.external.js");
-
-/***/ }),
-
-/***/ "./static-generation-async-storage.external":
-/*!***************************************************************************************!*\
-  !*** external "next/dist/client/components/static-generation-async-storage.external" ***!
-  \***************************************************************************************/
-/***/ ((module) => {
-
-"use strict";
-module.exports = require("next/dist/client/components/static-generation-async-storage.external");
-
-/***/ }),
-
-/***/ "../../client/components/static-generation-async-storage.external":
-/*!******************************************************************************************!*\
-  !*** external "next/dist/client/components/static-generation-async-storage.external.js" ***!
-  \******************************************************************************************/
-/***/ ((module) => {
-
-"use strict";
-module.exports = require("next/dist/client/components/static-generation-async-storage.external.js");
-
-/***/ }),
-
-/***/ "next/dist/compiled/next-server/app-page.runtime.dev.js":
-/*!*************************************************************************!*\
-  !*** external "next/dist/compiled/next-server/app-page.runtime.dev.js" ***!
-  \*************************************************************************/
-/***/ ((module) => {
-
-"use strict";
-module.exports = require("next/dist/compiled/next-server/app-page.runtime.dev.js");
-
-/***/ }),
-
-/***/ "(rsc)/./node_modules/next/dist/build/webpack/loaders/next-app-loader.js?name=app%2Fpage&page=%2Fpage&appPaths=%2Fpage&pagePath=private-next-app-dir%2Fpage.tsx&appDir=C%3A%5CUsers%5CNikhil%5CDesktop%5Cexported-assets%5Cadmybrand-insights-complete%5Cadmybrand-insights-fixed%5Capp&pageExtensions=tsx&pageExtensions=ts&pageExtensions=jsx&pageExtensions=js&rootDir=C%3A%5CUsers%5CNikhil%5CDesktop%5Cexported-assets%5Cadmybrand-insights-complete%5Cadmybrand-insights-fixed&isDev=true&tsconfigPath=tsconfig.json&basePath=&assetPrefix=&nextConfigOutput=&preferredRegion=&middlewareConfig=e30%3D!":
-/*!**************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************!*\
-  !*** ./node_modules/next/dist/build/webpack/loaders/next-app-loader.js?name=app%2Fpage&page=%2Fpage&appPaths=%2Fpage&pagePath=private-next-app-dir%2Fpage.tsx&appDir=C%3A%5CUsers%5CNikhil%5CDesktop%5Cexported-assets%5Cadmybrand-insights-complete%5Cadmybrand-insights-fixed%5Capp&pageExtensions=tsx&pageExtensions=ts&pageExtensions=jsx&pageExtensions=js&rootDir=C%3A%5CUsers%5CNikhil%5CDesktop%5Cexported-assets%5Cadmybrand-insights-complete%5Cadmybrand-insights-fixed&isDev=true&tsconfigPath=tsconfig.json&basePath=&assetPrefix=&nextConfigOutput=&preferredRegion=&middlewareConfig=e30%3D! ***!
-  \**************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************/
-/***/ ((__unused_webpack_module, __webpack_exports__, __webpack_require__) => {
-
-"use strict";
-eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   GlobalError: () => (/* reexport default from dynamic */ next_dist_client_components_error_boundary__WEBPACK_IMPORTED_MODULE_2___default.a),\n/* harmony export */   __next_app__: () => (/* binding */ __next_app__),\n/* harmony export */   originalPathname: () => (/* binding */ originalPathname),\n/* harmony export */   pages: () => (/* binding */ pages),\n/* harmony export */   routeModule: () => (/* binding */ routeModule),\n/* harmony export */   tree: () => (/* binding */ tree)\n/* harmony export */ });\n/* harmony import */ var next_dist_server_future_route_modules_app_page_module_compiled__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! next/dist/server/future/route-modules/app-page/module.compiled */ \"(ssr)/./node_modules/next/dist/server/future/route-modules/app-page/module.compiled.js?d969\");\n/* harmony import */ var next_dist_server_future_route_modules_app_page_module_compiled__WEBPACK_IMPORTED_MODULE_0___default = /*#__PURE__*/__webpack_require__.n(next_dist_server_future_route_modules_app_page_module_compiled__WEBPACK_IMPORTED_MODULE_0__);\n/* harmony import */ var next_dist_server_future_route_kind__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! next/dist/server/future/route-kind */ \"(rsc)/./node_modules/next/dist/server/future/route-kind.js\");\n/* harmony import */ var next_dist_client_components_error_boundary__WEBPACK_IMPORTED_MODULE_2__ = __webpack_require__(/*! next/dist/client/components/error-boundary */ \"(rsc)/./node_modules/next/dist/client/components/error-boundary.js\");\n/* harmony import */ var next_dist_client_components_error_boundary__WEBPACK_IMPORTED_MODULE_2___default = /*#__PURE__*/__webpack_require__.n(next_dist_client_components_error_boundary__WEBPACK_IMPORTED_MODULE_2__);\n/* harmony import */ var next_dist_server_app_render_entry_base__WEBPACK_IMPORTED_MODULE_3__ = __webpack_require__(/*! next/dist/server/app-render/entry-base */ \"(rsc)/./node_modules/next/dist/server/app-render/entry-base.js\");\n/* harmony import */ var next_dist_server_app_render_entry_base__WEBPACK_IMPORTED_MODULE_3___default = /*#__PURE__*/__webpack_require__.n(next_dist_server_app_render_entry_base__WEBPACK_IMPORTED_MODULE_3__);\n/* harmony reexport (unknown) */ var __WEBPACK_REEXPORT_OBJECT__ = {};\n/* harmony reexport (unknown) */ for(const __WEBPACK_IMPORT_KEY__ in next_dist_server_app_render_entry_base__WEBPACK_IMPORTED_MODULE_3__) if([\"default\",\"tree\",\"pages\",\"GlobalError\",\"originalPathname\",\"__next_app__\",\"routeModule\"].indexOf(__WEBPACK_IMPORT_KEY__) < 0) __WEBPACK_REEXPORT_OBJECT__[__WEBPACK_IMPORT_KEY__] = () => next_dist_server_app_render_entry_base__WEBPACK_IMPORTED_MODULE_3__[__WEBPACK_IMPORT_KEY__]\n/* harmony reexport (unknown) */ __webpack_require__.d(__webpack_exports__, __WEBPACK_REEXPORT_OBJECT__);\n\"TURBOPACK { transition: next-ssr }\";\n\n\n// We inject the tree and pages here so that we can use them in the route\n// module.\nconst tree = {\n        children: [\n        '',\n        {\n        children: ['__PAGE__', {}, {\n          page: [() => Promise.resolve(/*! import() eager */).then(__webpack_require__.bind(__webpack_require__, /*! ./app/page.tsx */ \"(rsc)/./app/page.tsx\")), \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\app\\\\page.tsx\"],\n          \n        }]\n      },\n        {\n        'layout': [() => Promise.resolve(/*! import() eager */).then(__webpack_require__.bind(__webpack_require__, /*! ./app/layout.tsx */ \"(rsc)/./app/layout.tsx\")), \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\app\\\\layout.tsx\"],\n'not-found': [() => Promise.resolve(/*! import() eager */).then(__webpack_require__.t.bind(__webpack_require__, /*! next/dist/client/components/not-found-error */ \"(rsc)/./node_modules/next/dist/client/components/not-found-error.js\", 23)), \"next/dist/client/components/not-found-error\"],\n        \n      }\n      ]\n      }.children;\nconst pages = [\"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\app\\\\page.tsx\"];\n\n\nconst __next_app_require__ = __webpack_require__\nconst __next_app_load_chunk__ = () => Promise.resolve()\nconst originalPathname = \"/page\";\nconst __next_app__ = {\n    require: __next_app_require__,\n    loadChunk: __next_app_load_chunk__\n};\n\n// Create and export the route module that will be consumed.\nconst routeModule = new next_dist_server_future_route_modules_app_page_module_compiled__WEBPACK_IMPORTED_MODULE_0__.AppPageRouteModule({\n    definition: {\n        kind: next_dist_server_future_route_kind__WEBPACK_IMPORTED_MODULE_1__.RouteKind.APP_PAGE,\n        page: \"/page\",\n        pathname: \"/\",\n        // The following aren't used in production.\n        bundlePath: \"\",\n        filename: \"\",\n        appPaths: []\n    },\n    userland: {\n        loaderTree: tree\n    }\n});\n\n//# sourceMappingURL=app-page.js.map//# sourceURL=[module]\n//# sourceMappingURL=data:application/json;charset=utf-8;base64,eyJ2ZXJzaW9uIjozLCJmaWxlIjoiKHJzYykvLi9ub2RlX21vZHVsZXMvbmV4dC9kaXN0L2J1aWxkL3dlYnBhY2svbG9hZGVycy9uZXh0LWFwcC1sb2FkZXIuanM/bmFtZT1hcHAlMkZwYWdlJnBhZ2U9JTJGcGFnZSZhcHBQYXRocz0lMkZwYWdlJnBhZ2VQYXRoPXByaXZhdGUtbmV4dC1hcHAtZGlyJTJGcGFnZS50c3gmYXBwRGlyPUMlM0ElNUNVc2VycyU1Q05pa2hpbCU1Q0Rlc2t0b3AlNUNleHBvcnRlZC1hc3NldHMlNUNhZG15YnJhbmQtaW5zaWdodHMtY29tcGxldGUlNUNhZG15YnJhbmQtaW5zaWdodHMtZml4ZWQlNUNhcHAmcGFnZUV4dGVuc2lvbnM9dHN4JnBhZ2VFeHRlbnNpb25zPXRzJnBhZ2VFeHRlbnNpb25zPWpzeCZwYWdlRXh0ZW5zaW9ucz1qcyZyb290RGlyPUMlM0ElNUNVc2VycyU1Q05pa2hpbCU1Q0Rlc2t0b3AlNUNleHBvcnRlZC1hc3NldHMlNUNhZG15YnJhbmQtaW5zaWdodHMtY29tcGxldGUlNUNhZG15YnJhbmQtaW5zaWdodHMtZml4ZWQmaXNEZXY9dHJ1ZSZ0c2NvbmZpZ1BhdGg9dHNjb25maWcuanNvbiZiYXNlUGF0aD0mYXNzZXRQcmVmaXg9Jm5leHRDb25maWdPdXRwdXQ9JnByZWZlcnJlZFJlZ2lvbj0mbWlkZGxld2FyZUNvbmZpZz1lMzAlM0QhIiwibWFwcGluZ3MiOiI7Ozs7Ozs7Ozs7Ozs7Ozs7Ozs7QUFBQSxhQUFhLHNCQUFzQjtBQUNpRTtBQUNyQztBQUMvRDtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQSxpQ0FBaUM7QUFDakMsdUJBQXVCLHdJQUFzSjtBQUM3SztBQUNBLFNBQVM7QUFDVCxPQUFPO0FBQ1A7QUFDQSx5QkFBeUIsNElBQXdKO0FBQ2pMLG9CQUFvQiwwTkFBZ0Y7QUFDcEc7QUFDQTtBQUNBO0FBQ0EsT0FBTztBQUNQO0FBQ3VCO0FBQzZEO0FBQ3BGLDZCQUE2QixtQkFBbUI7QUFDaEQ7QUFDTztBQUNBO0FBQ1A7QUFDQTtBQUNBO0FBQ3VEO0FBQ3ZEO0FBQ08sd0JBQXdCLDhHQUFrQjtBQUNqRDtBQUNBLGNBQWMseUVBQVM7QUFDdkI7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0EsS0FBSztBQUNMO0FBQ0E7QUFDQTtBQUNBLENBQUM7O0FBRUQiLCJzb3VyY2VzIjpbIndlYnBhY2s6Ly9hZG15YnJhbmQtaW5zaWdodHMvPzI5NDQiXSwic291cmNlc0NvbnRlbnQiOlsiXCJUVVJCT1BBQ0sgeyB0cmFuc2l0aW9uOiBuZXh0LXNzciB9XCI7XG5pbXBvcnQgeyBBcHBQYWdlUm91dGVNb2R1bGUgfSBmcm9tIFwibmV4dC9kaXN0L3NlcnZlci9mdXR1cmUvcm91dGUtbW9kdWxlcy9hcHAtcGFnZS9tb2R1bGUuY29tcGlsZWRcIjtcbmltcG9ydCB7IFJvdXRlS2luZCB9IGZyb20gXCJuZXh0L2Rpc3Qvc2VydmVyL2Z1dHVyZS9yb3V0ZS1raW5kXCI7XG4vLyBXZSBpbmplY3QgdGhlIHRyZWUgYW5kIHBhZ2VzIGhlcmUgc28gdGhhdCB3ZSBjYW4gdXNlIHRoZW0gaW4gdGhlIHJvdXRlXG4vLyBtb2R1bGUuXG5jb25zdCB0cmVlID0ge1xuICAgICAgICBjaGlsZHJlbjogW1xuICAgICAgICAnJyxcbiAgICAgICAge1xuICAgICAgICBjaGlsZHJlbjogWydfX1BBR0VfXycsIHt9LCB7XG4gICAgICAgICAgcGFnZTogWygpID0+IGltcG9ydCgvKiB3ZWJwYWNrTW9kZTogXCJlYWdlclwiICovIFwiQzpcXFxcVXNlcnNcXFxcTmlraGlsXFxcXERlc2t0b3BcXFxcZXhwb3J0ZWQtYXNzZXRzXFxcXGFkbXlicmFuZC1pbnNpZ2h0cy1jb21wbGV0ZVxcXFxhZG15YnJhbmQtaW5zaWdodHMtZml4ZWRcXFxcYXBwXFxcXHBhZ2UudHN4XCIpLCBcIkM6XFxcXFVzZXJzXFxcXE5pa2hpbFxcXFxEZXNrdG9wXFxcXGV4cG9ydGVkLWFzc2V0c1xcXFxhZG15YnJhbmQtaW5zaWdodHMtY29tcGxldGVcXFxcYWRteWJyYW5kLWluc2lnaHRzLWZpeGVkXFxcXGFwcFxcXFxwYWdlLnRzeFwiXSxcbiAgICAgICAgICBcbiAgICAgICAgfV1cbiAgICAgIH0sXG4gICAgICAgIHtcbiAgICAgICAgJ2xheW91dCc6IFsoKSA9PiBpbXBvcnQoLyogd2VicGFja01vZGU6IFwiZWFnZXJcIiAqLyBcIkM6XFxcXFVzZXJzXFxcXE5pa2hpbFxcXFxEZXNrdG9wXFxcXGV4cG9ydGVkLWFzc2V0c1xcXFxhZG15YnJhbmQtaW5zaWdodHMtY29tcGxldGVcXFxcYWRteWJyYW5kLWluc2lnaHRzLWZpeGVkXFxcXGFwcFxcXFxsYXlvdXQudHN4XCIpLCBcIkM6XFxcXFVzZXJzXFxcXE5pa2hpbFxcXFxEZXNrdG9wXFxcXGV4cG9ydGVkLWFzc2V0c1xcXFxhZG15YnJhbmQtaW5zaWdodHMtY29tcGxldGVcXFxcYWRteWJyYW5kLWluc2lnaHRzLWZpeGVkXFxcXGFwcFxcXFxsYXlvdXQudHN4XCJdLFxuJ25vdC1mb3VuZCc6IFsoKSA9PiBpbXBvcnQoLyogd2VicGFja01vZGU6IFwiZWFnZXJcIiAqLyBcIm5leHQvZGlzdC9jbGllbnQvY29tcG9uZW50cy9ub3QtZm91bmQtZXJyb3JcIiksIFwibmV4dC9kaXN0L2NsaWVudC9jb21wb25lbnRzL25vdC1mb3VuZC1lcnJvclwiXSxcbiAgICAgICAgXG4gICAgICB9XG4gICAgICBdXG4gICAgICB9LmNoaWxkcmVuO1xuY29uc3QgcGFnZXMgPSBbXCJDOlxcXFxVc2Vyc1xcXFxOaWtoaWxcXFxcRGVza3RvcFxcXFxleHBvcnRlZC1hc3NldHNcXFxcYWRteWJyYW5kLWluc2lnaHRzLWNvbXBsZXRlXFxcXGFkbXlicmFuZC1pbnNpZ2h0cy1maXhlZFxcXFxhcHBcXFxccGFnZS50c3hcIl07XG5leHBvcnQgeyB0cmVlLCBwYWdlcyB9O1xuZXhwb3J0IHsgZGVmYXVsdCBhcyBHbG9iYWxFcnJvciB9IGZyb20gXCJuZXh0L2Rpc3QvY2xpZW50L2NvbXBvbmVudHMvZXJyb3ItYm91bmRhcnlcIjtcbmNvbnN0IF9fbmV4dF9hcHBfcmVxdWlyZV9fID0gX193ZWJwYWNrX3JlcXVpcmVfX1xuY29uc3QgX19uZXh0X2FwcF9sb2FkX2NodW5rX18gPSAoKSA9PiBQcm9taXNlLnJlc29sdmUoKVxuZXhwb3J0IGNvbnN0IG9yaWdpbmFsUGF0aG5hbWUgPSBcIi9wYWdlXCI7XG5leHBvcnQgY29uc3QgX19uZXh0X2FwcF9fID0ge1xuICAgIHJlcXVpcmU6IF9fbmV4dF9hcHBfcmVxdWlyZV9fLFxuICAgIGxvYWRDaHVuazogX19uZXh0X2FwcF9sb2FkX2NodW5rX19cbn07XG5leHBvcnQgKiBmcm9tIFwibmV4dC9kaXN0L3NlcnZlci9hcHAtcmVuZGVyL2VudHJ5LWJhc2VcIjtcbi8vIENyZWF0ZSBhbmQgZXhwb3J0IHRoZSByb3V0ZSBtb2R1bGUgdGhhdCB3aWxsIGJlIGNvbnN1bWVkLlxuZXhwb3J0IGNvbnN0IHJvdXRlTW9kdWxlID0gbmV3IEFwcFBhZ2VSb3V0ZU1vZHVsZSh7XG4gICAgZGVmaW5pdGlvbjoge1xuICAgICAgICBraW5kOiBSb3V0ZUtpbmQuQVBQX1BBR0UsXG4gICAgICAgIHBhZ2U6IFwiL3BhZ2VcIixcbiAgICAgICAgcGF0aG5hbWU6IFwiL1wiLFxuICAgICAgICAvLyBUaGUgZm9sbG93aW5nIGFyZW4ndCB1c2VkIGluIHByb2R1Y3Rpb24uXG4gICAgICAgIGJ1bmRsZVBhdGg6IFwiXCIsXG4gICAgICAgIGZpbGVuYW1lOiBcIlwiLFxuICAgICAgICBhcHBQYXRoczogW11cbiAgICB9LFxuICAgIHVzZXJsYW5kOiB7XG4gICAgICAgIGxvYWRlclRyZWU6IHRyZWVcbiAgICB9XG59KTtcblxuLy8jIHNvdXJjZU1hcHBpbmdVUkw9YXBwLXBhZ2UuanMubWFwIl0sIm5hbWVzIjpbXSwic291cmNlUm9vdCI6IiJ9\n//# sourceURL=webpack-internal:///(rsc)/./node_modules/next/dist/build/webpack/loaders/next-app-loader.js?name=app%2Fpage&page=%2Fpage&appPaths=%2Fpage&pagePath=private-next-app-dir%2Fpage.tsx&appDir=C%3A%5CUsers%5CNikhil%5CDesktop%5Cexported-assets%5Cadmybrand-insights-complete%5Cadmybrand-insights-fixed%5Capp&pageExtensions=tsx&pageExtensions=ts&pageExtensions=jsx&pageExtensions=js&rootDir=C%3A%5CUsers%5CNikhil%5CDesktop%5Cexported-assets%5Cadmybrand-insights-complete%5Cadmybrand-insights-fixed&isDev=true&tsconfigPath=tsconfig.json&basePath=&assetPrefix=&nextConfigOutput=&preferredRegion=&middlewareConfig=e30%3D!\n");
-
-/***/ }),
-
-/***/ "(ssr)/./node_modules/next/dist/build/webpack/loaders/next-flight-client-entry-loader.js?modules=%7B%22request%22%3A%22C%3A%5C%5CUsers%5C%5CNikhil%5C%5CDesktop%5C%5Cexported-assets%5C%5Cadmybrand-insights-complete%5C%5Cadmybrand-insights-fixed%5C%5Capp%5C%5Cpage.tsx%22%2C%22ids%22%3A%5B%5D%7D&server=true!":
-/*!*******************************************************************************************************************************************************************************************************************************************************************************************************************!*\
-  !*** ./node_modules/next/dist/build/webpack/loaders/next-flight-client-entry-loader.js?modules=%7B%22request%22%3A%22C%3A%5C%5CUsers%5C%5CNikhil%5C%5CDesktop%5C%5Cexported-assets%5C%5Cadmybrand-insights-complete%5C%5Cadmybrand-insights-fixed%5C%5Capp%5C%5Cpage.tsx%22%2C%22ids%22%3A%5B%5D%7D&server=true! ***!
-  \*******************************************************************************************************************************************************************************************************************************************************************************************************************/
-/***/ ((__unused_webpack_module, __unused_webpack_exports, __webpack_require__) => {
-
-eval("Promise.resolve(/*! import() eager */).then(__webpack_require__.bind(__webpack_require__, /*! ./app/page.tsx */ \"(ssr)/./app/page.tsx\"));\n//# sourceURL=[module]\n//# sourceMappingURL=data:application/json;charset=utf-8;base64,eyJ2ZXJzaW9uIjozLCJmaWxlIjoiKHNzcikvLi9ub2RlX21vZHVsZXMvbmV4dC9kaXN0L2J1aWxkL3dlYnBhY2svbG9hZGVycy9uZXh0LWZsaWdodC1jbGllbnQtZW50cnktbG9hZGVyLmpzP21vZHVsZXM9JTdCJTIycmVxdWVzdCUyMiUzQSUyMkMlM0ElNUMlNUNVc2VycyU1QyU1Q05pa2hpbCU1QyU1Q0Rlc2t0b3AlNUMlNUNleHBvcnRlZC1hc3NldHMlNUMlNUNhZG15YnJhbmQtaW5zaWdodHMtY29tcGxldGUlNUMlNUNhZG15YnJhbmQtaW5zaWdodHMtZml4ZWQlNUMlNUNhcHAlNUMlNUNwYWdlLnRzeCUyMiUyQyUyMmlkcyUyMiUzQSU1QiU1RCU3RCZzZXJ2ZXI9dHJ1ZSEiLCJtYXBwaW5ncyI6IkFBQUEsd0lBQXNKIiwic291cmNlcyI6WyJ3ZWJwYWNrOi8vYWRteWJyYW5kLWluc2lnaHRzLz85NWRjIl0sInNvdXJjZXNDb250ZW50IjpbImltcG9ydCgvKiB3ZWJwYWNrTW9kZTogXCJlYWdlclwiICovIFwiQzpcXFxcVXNlcnNcXFxcTmlraGlsXFxcXERlc2t0b3BcXFxcZXhwb3J0ZWQtYXNzZXRzXFxcXGFkbXlicmFuZC1pbnNpZ2h0cy1jb21wbGV0ZVxcXFxhZG15YnJhbmQtaW5zaWdodHMtZml4ZWRcXFxcYXBwXFxcXHBhZ2UudHN4XCIpO1xuIl0sIm5hbWVzIjpbXSwic291cmNlUm9vdCI6IiJ9\n//# sourceURL=webpack-internal:///(ssr)/./node_modules/next/dist/build/webpack/loaders/next-flight-client-entry-loader.js?modules=%7B%22request%22%3A%22C%3A%5C%5CUsers%5C%5CNikhil%5C%5CDesktop%5C%5Cexported-assets%5C%5Cadmybrand-insights-complete%5C%5Cadmybrand-insights-fixed%5C%5Capp%5C%5Cpage.tsx%22%2C%22ids%22%3A%5B%5D%7D&server=true!\n");
-
-/***/ }),
-
-/***/ "(ssr)/./node_modules/next/dist/build/webpack/loaders/next-flight-client-entry-loader.js?modules=%7B%22request%22%3A%22C%3A%5C%5CUsers%5C%5CNikhil%5C%5CDesktop%5C%5Cexported-assets%5C%5Cadmybrand-insights-complete%5C%5Cadmybrand-insights-fixed%5C%5Cnode_modules%5C%5Cnext%5C%5Cdist%5C%5Cclient%5C%5Ccomponents%5C%5Capp-router.js%22%2C%22ids%22%3A%5B%5D%7D&modules=%7B%22request%22%3A%22C%3A%5C%5CUsers%5C%5CNikhil%5C%5CDesktop%5C%5Cexported-assets%5C%5Cadmybrand-insights-complete%5C%5Cadmybrand-insights-fixed%5C%5Cnode_modules%5C%5Cnext%5C%5Cdist%5C%5Cclient%5C%5Ccomponents%5C%5Cclient-page.js%22%2C%22ids%22%3A%5B%5D%7D&modules=%7B%22request%22%3A%22C%3A%5C%5CUsers%5C%5CNikhil%5C%5CDesktop%5C%5Cexported-assets%5C%5Cadmybrand-insights-complete%5C%5Cadmybrand-insights-fixed%5C%5Cnode_modules%5C%5Cnext%5C%5Cdist%5C%5Cclient%5C%5Ccomponents%5C%5Cerror-boundary.js%22%2C%22ids%22%3A%5B%5D%7D&modules=%7B%22request%22%3A%22C%3A%5C%5CUsers%5C%5CNikhil%5C%5CDesktop%5C%5Cexported-assets%5C%5Cadmybrand-insights-complete%5C%5Cadmybrand-insights-fixed%5C%5Cnode_modules%5C%5Cnext%5C%5Cdist%5C%5Cclient%5C%5Ccomponents%5C%5Clayout-router.js%22%2C%22ids%22%3A%5B%5D%7D&modules=%7B%22request%22%3A%22C%3A%5C%5CUsers%5C%5CNikhil%5C%5CDesktop%5C%5Cexported-assets%5C%5Cadmybrand-insights-complete%5C%5Cadmybrand-insights-fixed%5C%5Cnode_modules%5C%5Cnext%5C%5Cdist%5C%5Cclient%5C%5Ccomponents%5C%5Cnot-found-boundary.js%22%2C%22ids%22%3A%5B%5D%7D&modules=%7B%22request%22%3A%22C%3A%5C%5CUsers%5C%5CNikhil%5C%5CDesktop%5C%5Cexported-assets%5C%5Cadmybrand-insights-complete%5C%5Cadmybrand-insights-fixed%5C%5Cnode_modules%5C%5Cnext%5C%5Cdist%5C%5Cclient%5C%5Ccomponents%5C%5Crender-from-template-context.js%22%2C%22ids%22%3A%5B%5D%7D&server=true!":
-/*!**********************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************!*\
-  !*** ./node_modules/next/dist/build/webpack/loaders/next-flight-client-entry-loader.js?modules=%7B%22request%22%3A%22C%3A%5C%5CUsers%5C%5CNikhil%5C%5CDesktop%5C%5Cexported-assets%5C%5Cadmybrand-insights-complete%5C%5Cadmybrand-insights-fixed%5C%5Cnode_modules%5C%5Cnext%5C%5Cdist%5C%5Cclient%5C%5Ccomponents%5C%5Capp-router.js%22%2C%22ids%22%3A%5B%5D%7D&modules=%7B%22request%22%3A%22C%3A%5C%5CUsers%5C%5CNikhil%5C%5CDesktop%5C%5Cexported-assets%5C%5Cadmybrand-insights-complete%5C%5Cadmybrand-insights-fixed%5C%5Cnode_modules%5C%5Cnext%5C%5Cdist%5C%5Cclient%5C%5Ccomponents%5C%5Cclient-page.js%22%2C%22ids%22%3A%5B%5D%7D&modules=%7B%22request%22%3A%22C%3A%5C%5CUsers%5C%5CNikhil%5C%5CDesktop%5C%5Cexported-assets%5C%5Cadmybrand-insights-complete%5C%5Cadmybrand-insights-fixed%5C%5Cnode_modules%5C%5Cnext%5C%5Cdist%5C%5Cclient%5C%5Ccomponents%5C%5Cerror-boundary.js%22%2C%22ids%22%3A%5B%5D%7D&modules=%7B%22request%22%3A%22C%3A%5C%5CUsers%5C%5CNikhil%5C%5CDesktop%5C%5Cexported-assets%5C%5Cadmybrand-insights-complete%5C%5Cadmybrand-insights-fixed%5C%5Cnode_modules%5C%5Cnext%5C%5Cdist%5C%5Cclient%5C%5Ccomponents%5C%5Clayout-router.js%22%2C%22ids%22%3A%5B%5D%7D&modules=%7B%22request%22%3A%22C%3A%5C%5CUsers%5C%5CNikhil%5C%5CDesktop%5C%5Cexported-assets%5C%5Cadmybrand-insights-complete%5C%5Cadmybrand-insights-fixed%5C%5Cnode_modules%5C%5Cnext%5C%5Cdist%5C%5Cclient%5C%5Ccomponents%5C%5Cnot-found-boundary.js%22%2C%22ids%22%3A%5B%5D%7D&modules=%7B%22request%22%3A%22C%3A%5C%5CUsers%5C%5CNikhil%5C%5CDesktop%5C%5Cexported-assets%5C%5Cadmybrand-insights-complete%5C%5Cadmybrand-insights-fixed%5C%5Cnode_modules%5C%5Cnext%5C%5Cdist%5C%5Cclient%5C%5Ccomponents%5C%5Crender-from-template-context.js%22%2C%22ids%22%3A%5B%5D%7D&server=true! ***!
-  \**********************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************/
-/***/ ((__unused_webpack_module, __unused_webpack_exports, __webpack_require__) => {
-
-eval("Promise.resolve(/*! import() eager */).then(__webpack_require__.t.bind(__webpack_require__, /*! ./node_modules/next/dist/client/components/app-router.js */ \"(ssr)/./node_modules/next/dist/client/components/app-router.js\", 23));\n;\nPromise.resolve(/*! import() eager */).then(__webpack_require__.t.bind(__webpack_require__, /*! ./node_modules/next/dist/client/components/client-page.js */ \"(ssr)/./node_modules/next/dist/client/components/client-page.js\", 23));\n;\nPromise.resolve(/*! import() eager */).then(__webpack_require__.t.bind(__webpack_require__, /*! ./node_modules/next/dist/client/components/error-boundary.js */ \"(ssr)/./node_modules/next/dist/client/components/error-boundary.js\", 23));\n;\nPromise.resolve(/*! import() eager */).then(__webpack_require__.t.bind(__webpack_require__, /*! ./node_modules/next/dist/client/components/layout-router.js */ \"(ssr)/./node_modules/next/dist/client/components/layout-router.js\", 23));\n;\nPromise.resolve(/*! import() eager */).then(__webpack_require__.t.bind(__webpack_require__, /*! ./node_modules/next/dist/client/components/not-found-boundary.js */ \"(ssr)/./node_modules/next/dist/client/components/not-found-boundary.js\", 23));\n;\nPromise.resolve(/*! import() eager */).then(__webpack_require__.t.bind(__webpack_require__, /*! ./node_modules/next/dist/client/components/render-from-template-context.js */ \"(ssr)/./node_modules/next/dist/client/components/render-from-template-context.js\", 23));\n//# sourceURL=[module]\n//# sourceMappingURL=data:application/json;charset=utf-8;base64,eyJ2ZXJzaW9uIjozLCJmaWxlIjoiKHNzcikvLi9ub2RlX21vZHVsZXMvbmV4dC9kaXN0L2J1aWxkL3dlYnBhY2svbG9hZGVycy9uZXh0LWZsaWdodC1jbGllbnQtZW50cnktbG9hZGVyLmpzP21vZHVsZXM9JTdCJTIycmVxdWVzdCUyMiUzQSUyMkMlM0ElNUMlNUNVc2VycyU1QyU1Q05pa2hpbCU1QyU1Q0Rlc2t0b3AlNUMlNUNleHBvcnRlZC1hc3NldHMlNUMlNUNhZG15YnJhbmQtaW5zaWdodHMtY29tcGxldGUlNUMlNUNhZG15YnJhbmQtaW5zaWdodHMtZml4ZWQlNUMlNUNub2RlX21vZHVsZXMlNUMlNUNuZXh0JTVDJTVDZGlzdCU1QyU1Q2NsaWVudCU1QyU1Q2NvbXBvbmVudHMlNUMlNUNhcHAtcm91dGVyLmpzJTIyJTJDJTIyaWRzJTIyJTNBJTVCJTVEJTdEJm1vZHVsZXM9JTdCJTIycmVxdWVzdCUyMiUzQSUyMkMlM0ElNUMlNUNVc2VycyU1QyU1Q05pa2hpbCU1QyU1Q0Rlc2t0b3AlNUMlNUNleHBvcnRlZC1hc3NldHMlNUMlNUNhZG15YnJhbmQtaW5zaWdodHMtY29tcGxldGUlNUMlNUNhZG15YnJhbmQtaW5zaWdodHMtZml4ZWQlNUMlNUNub2RlX21vZHVsZXMlNUMlNUNuZXh0JTVDJTVDZGlzdCU1QyU1Q2NsaWVudCU1QyU1Q2NvbXBvbmVudHMlNUMlNUNjbGllbnQtcGFnZS5qcyUyMiUyQyUyMmlkcyUyMiUzQSU1QiU1RCU3RCZtb2R1bGVzPSU3QiUyMnJlcXVlc3QlMjIlM0ElMjJDJTNBJTVDJTVDVXNlcnMlNUMlNUNOaWtoaWwlNUMlNUNEZXNrdG9wJTVDJTVDZXhwb3J0ZWQtYXNzZXRzJTVDJTVDYWRteWJyYW5kLWluc2lnaHRzLWNvbXBsZXRlJTVDJTVDYWRteWJyYW5kLWluc2lnaHRzLWZpeGVkJTVDJTVDbm9kZV9tb2R1bGVzJTVDJTVDbmV4dCU1QyU1Q2Rpc3QlNUMlNUNjbGllbnQlNUMlNUNjb21wb25lbnRzJTVDJTVDZXJyb3ItYm91bmRhcnkuanMlMjIlMkMlMjJpZHMlMjIlM0ElNUIlNUQlN0QmbW9kdWxlcz0lN0IlMjJyZXF1ZXN0JTIyJTNBJTIyQyUzQSU1QyU1Q1VzZXJzJTVDJTVDTmlraGlsJTVDJTVDRGVza3RvcCU1QyU1Q2V4cG9ydGVkLWFzc2V0cyU1QyU1Q2FkbXlicmFuZC1pbnNpZ2h0cy1jb21wbGV0ZSU1QyU1Q2FkbXlicmFuZC1pbnNpZ2h0cy1maXhlZCU1QyU1Q25vZGVfbW9kdWxlcyU1QyU1Q25leHQlNUMlNUNkaXN0JTVDJTVDY2xpZW50JTVDJTVDY29tcG9uZW50cyU1QyU1Q2xheW91dC1yb3V0ZXIuanMlMjIlMkMlMjJpZHMlMjIlM0ElNUIlNUQlN0QmbW9kdWxlcz0lN0IlMjJyZXF1ZXN0JTIyJTNBJTIyQyUzQSU1QyU1Q1VzZXJzJTVDJTVDTmlraGlsJTVDJTVDRGVza3RvcCU1QyU1Q2V4cG9ydGVkLWFzc2V0cyU1QyU1Q2FkbXlicmFuZC1pbnNpZ2h0cy1jb21wbGV0ZSU1QyU1Q2FkbXlicmFuZC1pbnNpZ2h0cy1maXhlZCU1QyU1Q25vZGVfbW9kdWxlcyU1QyU1Q25leHQlNUMlNUNkaXN0JTVDJTVDY2xpZW50JTVDJTVDY29tcG9uZW50cyU1QyU1Q25vdC1mb3VuZC1ib3VuZGFyeS5qcyUyMiUyQyUyMmlkcyUyMiUzQSU1QiU1RCU3RCZtb2R1bGVzPSU3QiUyMnJlcXVlc3QlMjIlM0ElMjJDJTNBJTVDJTVDVXNlcnMlNUMlNUNOaWtoaWwlNUMlNUNEZXNrdG9wJTVDJTVDZXhwb3J0ZWQtYXNzZXRzJTVDJTVDYWRteWJyYW5kLWluc2lnaHRzLWNvbXBsZXRlJTVDJTVDYWRteWJyYW5kLWluc2lnaHRzLWZpeGVkJTVDJTVDbm9kZV9tb2R1bGVzJTVDJTVDbmV4dCU1QyU1Q2Rpc3QlNUMlNUNjbGllbnQlNUMlNUNjb21wb25lbnRzJTVDJTVDcmVuZGVyLWZyb20tdGVtcGxhdGUtY29udGV4dC5qcyUyMiUyQyUyMmlkcyUyMiUzQSU1QiU1RCU3RCZzZXJ2ZXI9dHJ1ZSEiLCJtYXBwaW5ncyI6IkFBQUEsa09BQW9NO0FBQ3BNO0FBQ0Esb09BQXFNO0FBQ3JNO0FBQ0EsME9BQXdNO0FBQ3hNO0FBQ0Esd09BQXVNO0FBQ3ZNO0FBQ0Esa1BBQTRNO0FBQzVNO0FBQ0Esc1FBQXNOIiwic291cmNlcyI6WyJ3ZWJwYWNrOi8vYWRteWJyYW5kLWluc2lnaHRzLz85Y2ZkIl0sInNvdXJjZXNDb250ZW50IjpbImltcG9ydCgvKiB3ZWJwYWNrTW9kZTogXCJlYWdlclwiICovIFwiQzpcXFxcVXNlcnNcXFxcTmlraGlsXFxcXERlc2t0b3BcXFxcZXhwb3J0ZWQtYXNzZXRzXFxcXGFkbXlicmFuZC1pbnNpZ2h0cy1jb21wbGV0ZVxcXFxhZG15YnJhbmQtaW5zaWdodHMtZml4ZWRcXFxcbm9kZV9tb2R1bGVzXFxcXG5leHRcXFxcZGlzdFxcXFxjbGllbnRcXFxcY29tcG9uZW50c1xcXFxhcHAtcm91dGVyLmpzXCIpO1xuO1xuaW1wb3J0KC8qIHdlYnBhY2tNb2RlOiBcImVhZ2VyXCIgKi8gXCJDOlxcXFxVc2Vyc1xcXFxOaWtoaWxcXFxcRGVza3RvcFxcXFxleHBvcnRlZC1hc3NldHNcXFxcYWRteWJyYW5kLWluc2lnaHRzLWNvbXBsZXRlXFxcXGFkbXlicmFuZC1pbnNpZ2h0cy1maXhlZFxcXFxub2RlX21vZHVsZXNcXFxcbmV4dFxcXFxkaXN0XFxcXGNsaWVudFxcXFxjb21wb25lbnRzXFxcXGNsaWVudC1wYWdlLmpzXCIpO1xuO1xuaW1wb3J0KC8qIHdlYnBhY2tNb2RlOiBcImVhZ2VyXCIgKi8gXCJDOlxcXFxVc2Vyc1xcXFxOaWtoaWxcXFxcRGVza3RvcFxcXFxleHBvcnRlZC1hc3NldHNcXFxcYWRteWJyYW5kLWluc2lnaHRzLWNvbXBsZXRlXFxcXGFkbXlicmFuZC1pbnNpZ2h0cy1maXhlZFxcXFxub2RlX21vZHVsZXNcXFxcbmV4dFxcXFxkaXN0XFxcXGNsaWVudFxcXFxjb21wb25lbnRzXFxcXGVycm9yLWJvdW5kYXJ5LmpzXCIpO1xuO1xuaW1wb3J0KC8qIHdlYnBhY2tNb2RlOiBcImVhZ2VyXCIgKi8gXCJDOlxcXFxVc2Vyc1xcXFxOaWtoaWxcXFxcRGVza3RvcFxcXFxleHBvcnRlZC1hc3NldHNcXFxcYWRteWJyYW5kLWluc2lnaHRzLWNvbXBsZXRlXFxcXGFkbXlicmFuZC1pbnNpZ2h0cy1maXhlZFxcXFxub2RlX21vZHVsZXNcXFxcbmV4dFxcXFxkaXN0XFxcXGNsaWVudFxcXFxjb21wb25lbnRzXFxcXGxheW91dC1yb3V0ZXIuanNcIik7XG47XG5pbXBvcnQoLyogd2VicGFja01vZGU6IFwiZWFnZXJcIiAqLyBcIkM6XFxcXFVzZXJzXFxcXE5pa2hpbFxcXFxEZXNrdG9wXFxcXGV4cG9ydGVkLWFzc2V0c1xcXFxhZG15YnJhbmQtaW5zaWdodHMtY29tcGxldGVcXFxcYWRteWJyYW5kLWluc2lnaHRzLWZpeGVkXFxcXG5vZGVfbW9kdWxlc1xcXFxuZXh0XFxcXGRpc3RcXFxcY2xpZW50XFxcXGNvbXBvbmVudHNcXFxcbm90LWZvdW5kLWJvdW5kYXJ5LmpzXCIpO1xuO1xuaW1wb3J0KC8qIHdlYnBhY2tNb2RlOiBcImVhZ2VyXCIgKi8gXCJDOlxcXFxVc2Vyc1xcXFxOaWtoaWxcXFxcRGVza3RvcFxcXFxleHBvcnRlZC1hc3NldHNcXFxcYWRteWJyYW5kLWluc2lnaHRzLWNvbXBsZXRlXFxcXGFkbXlicmFuZC1pbnNpZ2h0cy1maXhlZFxcXFxub2RlX21vZHVsZXNcXFxcbmV4dFxcXFxkaXN0XFxcXGNsaWVudFxcXFxjb21wb25lbnRzXFxcXHJlbmRlci1mcm9tLXRlbXBsYXRlLWNvbnRleHQuanNcIik7XG4iXSwibmFtZXMiOltdLCJzb3VyY2VSb290IjoiIn0=\n//# sourceURL=webpack-internal:///(ssr)/./node_modules/next/dist/build/webpack/loaders/next-flight-client-entry-loader.js?modules=%7B%22request%22%3A%22C%3A%5C%5CUsers%5C%5CNikhil%5C%5CDesktop%5C%5Cexported-assets%5C%5Cadmybrand-insights-complete%5C%5Cadmybrand-insights-fixed%5C%5Cnode_modules%5C%5Cnext%5C%5Cdist%5C%5Cclient%5C%5Ccomponents%5C%5Capp-router.js%22%2C%22ids%22%3A%5B%5D%7D&modules=%7B%22request%22%3A%22C%3A%5C%5CUsers%5C%5CNikhil%5C%5CDesktop%5C%5Cexported-assets%5C%5Cadmybrand-insights-complete%5C%5Cadmybrand-insights-fixed%5C%5Cnode_modules%5C%5Cnext%5C%5Cdist%5C%5Cclient%5C%5Ccomponents%5C%5Cclient-page.js%22%2C%22ids%22%3A%5B%5D%7D&modules=%7B%22request%22%3A%22C%3A%5C%5CUsers%5C%5CNikhil%5C%5CDesktop%5C%5Cexported-assets%5C%5Cadmybrand-insights-complete%5C%5Cadmybrand-insights-fixed%5C%5Cnode_modules%5C%5Cnext%5C%5Cdist%5C%5Cclient%5C%5Ccomponents%5C%5Cerror-boundary.js%22%2C%22ids%22%3A%5B%5D%7D&modules=%7B%22request%22%3A%22C%3A%5C%5CUsers%5C%5CNikhil%5C%5CDesktop%5C%5Cexported-assets%5C%5Cadmybrand-insights-complete%5C%5Cadmybrand-insights-fixed%5C%5Cnode_modules%5C%5Cnext%5C%5Cdist%5C%5Cclient%5C%5Ccomponents%5C%5Clayout-router.js%22%2C%22ids%22%3A%5B%5D%7D&modules=%7B%22request%22%3A%22C%3A%5C%5CUsers%5C%5CNikhil%5C%5CDesktop%5C%5Cexported-assets%5C%5Cadmybrand-insights-complete%5C%5Cadmybrand-insights-fixed%5C%5Cnode_modules%5C%5Cnext%5C%5Cdist%5C%5Cclient%5C%5Ccomponents%5C%5Cnot-found-boundary.js%22%2C%22ids%22%3A%5B%5D%7D&modules=%7B%22request%22%3A%22C%3A%5C%5CUsers%5C%5CNikhil%5C%5CDesktop%5C%5Cexported-assets%5C%5Cadmybrand-insights-complete%5C%5Cadmybrand-insights-fixed%5C%5Cnode_modules%5C%5Cnext%5C%5Cdist%5C%5Cclient%5C%5Ccomponents%5C%5Crender-from-template-context.js%22%2C%22ids%22%3A%5B%5D%7D&server=true!\n");
-
-/***/ }),
-
-/***/ "(ssr)/./node_modules/next/dist/build/webpack/loaders/next-flight-client-entry-loader.js?modules=%7B%22request%22%3A%22C%3A%5C%5CUsers%5C%5CNikhil%5C%5CDesktop%5C%5Cexported-assets%5C%5Cadmybrand-insights-complete%5C%5Cadmybrand-insights-fixed%5C%5Cnode_modules%5C%5Cnext%5C%5Cfont%5C%5Cgoogle%5C%5Ctarget.css%3F%7B%5C%22path%5C%22%3A%5C%22app%5C%5C%5C%5Clayout.tsx%5C%22%2C%5C%22import%5C%22%3A%5C%22Inter%5C%22%2C%5C%22arguments%5C%22%3A%5B%7B%5C%22subsets%5C%22%3A%5B%5C%22latin%5C%22%5D%7D%5D%2C%5C%22variableName%5C%22%3A%5C%22inter%5C%22%7D%22%2C%22ids%22%3A%5B%5D%7D&modules=%7B%22request%22%3A%22C%3A%5C%5CUsers%5C%5CNikhil%5C%5CDesktop%5C%5Cexported-assets%5C%5Cadmybrand-insights-complete%5C%5Cadmybrand-insights-fixed%5C%5Cstyles%5C%5Cglobals.css%22%2C%22ids%22%3A%5B%5D%7D&server=true!":
-/*!******************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************!*\
-  !*** ./node_modules/next/dist/build/webpack/loaders/next-flight-client-entry-loader.js?modules=%7B%22request%22%3A%22C%3A%5C%5CUsers%5C%5CNikhil%5C%5CDesktop%5C%5Cexported-assets%5C%5Cadmybrand-insights-complete%5C%5Cadmybrand-insights-fixed%5C%5Cnode_modules%5C%5Cnext%5C%5Cfont%5C%5Cgoogle%5C%5Ctarget.css%3F%7B%5C%22path%5C%22%3A%5C%22app%5C%5C%5C%5Clayout.tsx%5C%22%2C%5C%22import%5C%22%3A%5C%22Inter%5C%22%2C%5C%22arguments%5C%22%3A%5B%7B%5C%22subsets%5C%22%3A%5B%5C%22latin%5C%22%5D%7D%5D%2C%5C%22variableName%5C%22%3A%5C%22inter%5C%22%7D%22%2C%22ids%22%3A%5B%5D%7D&modules=%7B%22request%22%3A%22C%3A%5C%5CUsers%5C%5CNikhil%5C%5CDesktop%5C%5Cexported-assets%5C%5Cadmybrand-insights-complete%5C%5Cadmybrand-insights-fixed%5C%5Cstyles%5C%5Cglobals.css%22%2C%22ids%22%3A%5B%5D%7D&server=true! ***!
-  \******************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************************/
-/***/ (() => {
-
-
-
-/***/ }),
-
-/***/ "(ssr)/./app/page.tsx":
-/*!**********************!*\
-  !*** ./app/page.tsx ***!
-  \**********************/
-/***/ ((__unused_webpack_module, __webpack_exports__, __webpack_require__) => {
-
-"use strict";
-eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ Home)\n/* harmony export */ });\n/* harmony import */ var react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! react/jsx-dev-runtime */ \"(ssr)/./node_modules/next/dist/server/future/route-modules/app-page/vendored/ssr/react-jsx-dev-runtime.js\");\n/* harmony import */ var react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0___default = /*#__PURE__*/__webpack_require__.n(react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__);\n/* harmony import */ var _components_Sidebar__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! @/components/Sidebar */ \"(ssr)/./components/Sidebar.tsx\");\n/* harmony import */ var _components_Dashboard__WEBPACK_IMPORTED_MODULE_2__ = __webpack_require__(/*! @/components/Dashboard */ \"(ssr)/./components/Dashboard.tsx\");\n/* __next_internal_client_entry_do_not_use__ default auto */ \n\n\nfunction Home() {\n    return /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_components_Sidebar__WEBPACK_IMPORTED_MODULE_1__.Sidebar, {\n        children: /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_components_Dashboard__WEBPACK_IMPORTED_MODULE_2__.Dashboard, {}, void 0, false, {\n            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\app\\\\page.tsx\",\n            lineNumber: 9,\n            columnNumber: 7\n        }, this)\n    }, void 0, false, {\n        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\app\\\\page.tsx\",\n        lineNumber: 8,\n        columnNumber: 5\n    }, this);\n}\n//# sourceURL=[module]\n//# sourceMappingURL=data:application/json;charset=utf-8;base64,eyJ2ZXJzaW9uIjozLCJmaWxlIjoiKHNzcikvLi9hcHAvcGFnZS50c3giLCJtYXBwaW5ncyI6Ijs7Ozs7Ozs7O0FBRStDO0FBQ0k7QUFFcEMsU0FBU0U7SUFDdEIscUJBQ0UsOERBQUNGLHdEQUFPQTtrQkFDTiw0RUFBQ0MsNERBQVNBOzs7Ozs7Ozs7O0FBR2hCIiwic291cmNlcyI6WyJ3ZWJwYWNrOi8vYWRteWJyYW5kLWluc2lnaHRzLy4vYXBwL3BhZ2UudHN4Pzc2MDMiXSwic291cmNlc0NvbnRlbnQiOlsiJ3VzZSBjbGllbnQnO1xuXG5pbXBvcnQgeyBTaWRlYmFyIH0gZnJvbSAnQC9jb21wb25lbnRzL1NpZGViYXInO1xuaW1wb3J0IHsgRGFzaGJvYXJkIH0gZnJvbSAnQC9jb21wb25lbnRzL0Rhc2hib2FyZCc7XG5cbmV4cG9ydCBkZWZhdWx0IGZ1bmN0aW9uIEhvbWUoKSB7XG4gIHJldHVybiAoXG4gICAgPFNpZGViYXI+XG4gICAgICA8RGFzaGJvYXJkIC8+XG4gICAgPC9TaWRlYmFyPlxuICApO1xufVxuIl0sIm5hbWVzIjpbIlNpZGViYXIiLCJEYXNoYm9hcmQiLCJIb21lIl0sInNvdXJjZVJvb3QiOiIifQ==\n//# sourceURL=webpack-internal:///(ssr)/./app/page.tsx\n");
-
-/***/ }),
-
-/***/ "(ssr)/./components/Charts.tsx":
-/*!*******************************!*\
-  !*** ./components/Charts.tsx ***!
-  \*******************************/
-/***/ ((__unused_webpack_module, __webpack_exports__, __webpack_require__) => {
-
-"use strict";
-eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   Charts: () => (/* binding */ Charts)\n/* harmony export */ });\n/* harmony import */ var react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! react/jsx-dev-runtime */ \"(ssr)/./node_modules/next/dist/server/future/route-modules/app-page/vendored/ssr/react-jsx-dev-runtime.js\");\n/* harmony import */ var react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0___default = /*#__PURE__*/__webpack_require__.n(react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__);\n/* harmony import */ var react__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! react */ \"(ssr)/./node_modules/next/dist/server/future/route-modules/app-page/vendored/ssr/react.js\");\n/* harmony import */ var react__WEBPACK_IMPORTED_MODULE_1___default = /*#__PURE__*/__webpack_require__.n(react__WEBPACK_IMPORTED_MODULE_1__);\n/* harmony import */ var _barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_5__ = __webpack_require__(/*! __barrel_optimize__?names=Area,AreaChart,Bar,BarChart,CartesianGrid,Cell,Legend,Line,LineChart,Pie,PieChart,ResponsiveContainer,Tooltip,XAxis,YAxis!=!recharts */ \"(ssr)/./node_modules/recharts/es6/component/ResponsiveContainer.js\");\n/* harmony import */ var _barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_6__ = __webpack_require__(/*! __barrel_optimize__?names=Area,AreaChart,Bar,BarChart,CartesianGrid,Cell,Legend,Line,LineChart,Pie,PieChart,ResponsiveContainer,Tooltip,XAxis,YAxis!=!recharts */ \"(ssr)/./node_modules/recharts/es6/chart/AreaChart.js\");\n/* harmony import */ var _barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_7__ = __webpack_require__(/*! __barrel_optimize__?names=Area,AreaChart,Bar,BarChart,CartesianGrid,Cell,Legend,Line,LineChart,Pie,PieChart,ResponsiveContainer,Tooltip,XAxis,YAxis!=!recharts */ \"(ssr)/./node_modules/recharts/es6/cartesian/CartesianGrid.js\");\n/* harmony import */ var _barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_8__ = __webpack_require__(/*! __barrel_optimize__?names=Area,AreaChart,Bar,BarChart,CartesianGrid,Cell,Legend,Line,LineChart,Pie,PieChart,ResponsiveContainer,Tooltip,XAxis,YAxis!=!recharts */ \"(ssr)/./node_modules/recharts/es6/cartesian/XAxis.js\");\n/* harmony import */ var _barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_9__ = __webpack_require__(/*! __barrel_optimize__?names=Area,AreaChart,Bar,BarChart,CartesianGrid,Cell,Legend,Line,LineChart,Pie,PieChart,ResponsiveContainer,Tooltip,XAxis,YAxis!=!recharts */ \"(ssr)/./node_modules/recharts/es6/cartesian/YAxis.js\");\n/* harmony import */ var _barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_10__ = __webpack_require__(/*! __barrel_optimize__?names=Area,AreaChart,Bar,BarChart,CartesianGrid,Cell,Legend,Line,LineChart,Pie,PieChart,ResponsiveContainer,Tooltip,XAxis,YAxis!=!recharts */ \"(ssr)/./node_modules/recharts/es6/component/Tooltip.js\");\n/* harmony import */ var _barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_11__ = __webpack_require__(/*! __barrel_optimize__?names=Area,AreaChart,Bar,BarChart,CartesianGrid,Cell,Legend,Line,LineChart,Pie,PieChart,ResponsiveContainer,Tooltip,XAxis,YAxis!=!recharts */ \"(ssr)/./node_modules/recharts/es6/cartesian/Area.js\");\n/* harmony import */ var _barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_13__ = __webpack_require__(/*! __barrel_optimize__?names=Area,AreaChart,Bar,BarChart,CartesianGrid,Cell,Legend,Line,LineChart,Pie,PieChart,ResponsiveContainer,Tooltip,XAxis,YAxis!=!recharts */ \"(ssr)/./node_modules/recharts/es6/chart/BarChart.js\");\n/* harmony import */ var _barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_14__ = __webpack_require__(/*! __barrel_optimize__?names=Area,AreaChart,Bar,BarChart,CartesianGrid,Cell,Legend,Line,LineChart,Pie,PieChart,ResponsiveContainer,Tooltip,XAxis,YAxis!=!recharts */ \"(ssr)/./node_modules/recharts/es6/cartesian/Bar.js\");\n/* harmony import */ var _barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_16__ = __webpack_require__(/*! __barrel_optimize__?names=Area,AreaChart,Bar,BarChart,CartesianGrid,Cell,Legend,Line,LineChart,Pie,PieChart,ResponsiveContainer,Tooltip,XAxis,YAxis!=!recharts */ \"(ssr)/./node_modules/recharts/es6/chart/PieChart.js\");\n/* harmony import */ var _barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_17__ = __webpack_require__(/*! __barrel_optimize__?names=Area,AreaChart,Bar,BarChart,CartesianGrid,Cell,Legend,Line,LineChart,Pie,PieChart,ResponsiveContainer,Tooltip,XAxis,YAxis!=!recharts */ \"(ssr)/./node_modules/recharts/es6/polar/Pie.js\");\n/* harmony import */ var _barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_18__ = __webpack_require__(/*! __barrel_optimize__?names=Area,AreaChart,Bar,BarChart,CartesianGrid,Cell,Legend,Line,LineChart,Pie,PieChart,ResponsiveContainer,Tooltip,XAxis,YAxis!=!recharts */ \"(ssr)/./node_modules/recharts/es6/component/Cell.js\");\n/* harmony import */ var _barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_19__ = __webpack_require__(/*! __barrel_optimize__?names=Area,AreaChart,Bar,BarChart,CartesianGrid,Cell,Legend,Line,LineChart,Pie,PieChart,ResponsiveContainer,Tooltip,XAxis,YAxis!=!recharts */ \"(ssr)/./node_modules/recharts/es6/component/Legend.js\");\n/* harmony import */ var _barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_21__ = __webpack_require__(/*! __barrel_optimize__?names=Area,AreaChart,Bar,BarChart,CartesianGrid,Cell,Legend,Line,LineChart,Pie,PieChart,ResponsiveContainer,Tooltip,XAxis,YAxis!=!recharts */ \"(ssr)/./node_modules/recharts/es6/chart/LineChart.js\");\n/* harmony import */ var _barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_22__ = __webpack_require__(/*! __barrel_optimize__?names=Area,AreaChart,Bar,BarChart,CartesianGrid,Cell,Legend,Line,LineChart,Pie,PieChart,ResponsiveContainer,Tooltip,XAxis,YAxis!=!recharts */ \"(ssr)/./node_modules/recharts/es6/cartesian/Line.js\");\n/* harmony import */ var framer_motion__WEBPACK_IMPORTED_MODULE_3__ = __webpack_require__(/*! framer-motion */ \"(ssr)/./node_modules/framer-motion/dist/es/render/components/motion/proxy.mjs\");\n/* harmony import */ var _barrel_optimize_names_Activity_BarChart3_PieChart_TrendingUp_lucide_react__WEBPACK_IMPORTED_MODULE_4__ = __webpack_require__(/*! __barrel_optimize__?names=Activity,BarChart3,PieChart,TrendingUp!=!lucide-react */ \"(ssr)/./node_modules/lucide-react/dist/esm/icons/trending-up.js\");\n/* harmony import */ var _barrel_optimize_names_Activity_BarChart3_PieChart_TrendingUp_lucide_react__WEBPACK_IMPORTED_MODULE_12__ = __webpack_require__(/*! __barrel_optimize__?names=Activity,BarChart3,PieChart,TrendingUp!=!lucide-react */ \"(ssr)/./node_modules/lucide-react/dist/esm/icons/chart-column.js\");\n/* harmony import */ var _barrel_optimize_names_Activity_BarChart3_PieChart_TrendingUp_lucide_react__WEBPACK_IMPORTED_MODULE_15__ = __webpack_require__(/*! __barrel_optimize__?names=Activity,BarChart3,PieChart,TrendingUp!=!lucide-react */ \"(ssr)/./node_modules/lucide-react/dist/esm/icons/chart-pie.js\");\n/* harmony import */ var _barrel_optimize_names_Activity_BarChart3_PieChart_TrendingUp_lucide_react__WEBPACK_IMPORTED_MODULE_20__ = __webpack_require__(/*! __barrel_optimize__?names=Activity,BarChart3,PieChart,TrendingUp!=!lucide-react */ \"(ssr)/./node_modules/lucide-react/dist/esm/icons/activity.js\");\n/* harmony import */ var _lib_utils__WEBPACK_IMPORTED_MODULE_2__ = __webpack_require__(/*! @/lib/utils */ \"(ssr)/./lib/utils.ts\");\n/* __next_internal_client_entry_do_not_use__ Charts auto */ \n\n\n\n\n\nconst COLORS = [\n    \"#3B82F6\",\n    \"#10B981\",\n    \"#F59E0B\",\n    \"#EF4444\",\n    \"#8B5CF6\"\n];\nfunction Charts({ data, campaignData }) {\n    const [activeChart, setActiveChart] = (0,react__WEBPACK_IMPORTED_MODULE_1__.useState)(\"revenue\");\n    // Prepare data for line/area charts (daily aggregates)\n    const dailyData = data.reduce((acc, item)=>{\n        const existingDay = acc.find((d)=>d.date === item.date);\n        if (existingDay) {\n            existingDay.revenue += item.revenue;\n            existingDay.users += item.users;\n            existingDay.conversions += item.conversions;\n        } else {\n            acc.push({\n                date: item.date,\n                revenue: item.revenue,\n                users: item.users,\n                conversions: item.conversions\n            });\n        }\n        return acc;\n    }, []).slice(-14); // Last 14 days\n    // Prepare data for campaign performance\n    const campaignChartData = campaignData.map((campaign)=>({\n            name: campaign.campaign,\n            revenue: campaign.revenue,\n            users: campaign.users,\n            conversions: campaign.conversions\n        }));\n    const CustomTooltip = ({ active, payload, label })=>{\n        if (active && payload && payload.length) {\n            return /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                className: \"glass-effect rounded-lg p-3 border border-white/20\",\n                children: [\n                    /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"p\", {\n                        className: \"text-sm font-medium text-gray-900 dark:text-white\",\n                        children: label\n                    }, void 0, false, {\n                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                        lineNumber: 66,\n                        columnNumber: 11\n                    }, this),\n                    payload.map((entry, index)=>/*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"p\", {\n                            className: \"text-sm\",\n                            style: {\n                                color: entry.color\n                            },\n                            children: [\n                                entry.name,\n                                \": \",\n                                entry.name === \"revenue\" ? (0,_lib_utils__WEBPACK_IMPORTED_MODULE_2__.formatCurrency)(entry.value) : (0,_lib_utils__WEBPACK_IMPORTED_MODULE_2__.formatNumber)(entry.value)\n                            ]\n                        }, index, true, {\n                            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                            lineNumber: 70,\n                            columnNumber: 13\n                        }, this))\n                ]\n            }, void 0, true, {\n                fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                lineNumber: 65,\n                columnNumber: 9\n            }, this);\n        }\n        return null;\n    };\n    return /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n        className: \"grid grid-cols-1 lg:grid-cols-2 gap-6\",\n        children: [\n            /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(framer_motion__WEBPACK_IMPORTED_MODULE_3__.motion.div, {\n                initial: {\n                    opacity: 0,\n                    y: 20\n                },\n                animate: {\n                    opacity: 1,\n                    y: 0\n                },\n                transition: {\n                    duration: 0.3,\n                    delay: 0.1\n                },\n                className: \"glass-effect rounded-xl p-6\",\n                children: [\n                    /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                        className: \"flex items-center justify-between mb-4\",\n                        children: /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                            className: \"flex items-center space-x-2\",\n                            children: [\n                                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_Activity_BarChart3_PieChart_TrendingUp_lucide_react__WEBPACK_IMPORTED_MODULE_4__[\"default\"], {\n                                    className: \"w-5 h-5 text-blue-600\"\n                                }, void 0, false, {\n                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                                    lineNumber: 95,\n                                    columnNumber: 13\n                                }, this),\n                                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"h3\", {\n                                    className: \"text-lg font-semibold text-gray-900 dark:text-white\",\n                                    children: \"Revenue Trend\"\n                                }, void 0, false, {\n                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                                    lineNumber: 96,\n                                    columnNumber: 13\n                                }, this)\n                            ]\n                        }, void 0, true, {\n                            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                            lineNumber: 94,\n                            columnNumber: 11\n                        }, this)\n                    }, void 0, false, {\n                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                        lineNumber: 93,\n                        columnNumber: 9\n                    }, this),\n                    /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_5__.ResponsiveContainer, {\n                        width: \"100%\",\n                        height: 250,\n                        children: /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_6__.AreaChart, {\n                            data: dailyData,\n                            children: [\n                                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"defs\", {\n                                    children: /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"linearGradient\", {\n                                        id: \"revenueGradient\",\n                                        x1: \"0\",\n                                        y1: \"0\",\n                                        x2: \"0\",\n                                        y2: \"1\",\n                                        children: [\n                                            /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"stop\", {\n                                                offset: \"5%\",\n                                                stopColor: \"#3B82F6\",\n                                                stopOpacity: 0.3\n                                            }, void 0, false, {\n                                                fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                                                lineNumber: 105,\n                                                columnNumber: 17\n                                            }, this),\n                                            /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"stop\", {\n                                                offset: \"95%\",\n                                                stopColor: \"#3B82F6\",\n                                                stopOpacity: 0\n                                            }, void 0, false, {\n                                                fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                                                lineNumber: 106,\n                                                columnNumber: 17\n                                            }, this)\n                                        ]\n                                    }, void 0, true, {\n                                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                                        lineNumber: 104,\n                                        columnNumber: 15\n                                    }, this)\n                                }, void 0, false, {\n                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                                    lineNumber: 103,\n                                    columnNumber: 13\n                                }, this),\n                                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_7__.CartesianGrid, {\n                                    strokeDasharray: \"3 3\",\n                                    opacity: 0.3\n                                }, void 0, false, {\n                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                                    lineNumber: 109,\n                                    columnNumber: 13\n                                }, this),\n                                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_8__.XAxis, {\n                                    dataKey: \"date\",\n                                    tick: {\n                                        fontSize: 12\n                                    },\n                                    tickFormatter: (value)=>new Date(value).toLocaleDateString(\"en-US\", {\n                                            month: \"short\",\n                                            day: \"numeric\"\n                                        })\n                                }, void 0, false, {\n                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                                    lineNumber: 110,\n                                    columnNumber: 13\n                                }, this),\n                                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_9__.YAxis, {\n                                    tick: {\n                                        fontSize: 12\n                                    },\n                                    tickFormatter: (value)=>`$${value}`\n                                }, void 0, false, {\n                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                                    lineNumber: 115,\n                                    columnNumber: 13\n                                }, this),\n                                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_10__.Tooltip, {\n                                    content: /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(CustomTooltip, {}, void 0, false, {\n                                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                                        lineNumber: 116,\n                                        columnNumber: 31\n                                    }, void 0)\n                                }, void 0, false, {\n                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                                    lineNumber: 116,\n                                    columnNumber: 13\n                                }, this),\n                                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_11__.Area, {\n                                    type: \"monotone\",\n                                    dataKey: \"revenue\",\n                                    stroke: \"#3B82F6\",\n                                    strokeWidth: 2,\n                                    fill: \"url(#revenueGradient)\"\n                                }, void 0, false, {\n                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                                    lineNumber: 117,\n                                    columnNumber: 13\n                                }, this)\n                            ]\n                        }, void 0, true, {\n                            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                            lineNumber: 102,\n                            columnNumber: 11\n                        }, this)\n                    }, void 0, false, {\n                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                        lineNumber: 101,\n                        columnNumber: 9\n                    }, this)\n                ]\n            }, void 0, true, {\n                fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                lineNumber: 87,\n                columnNumber: 7\n            }, this),\n            /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(framer_motion__WEBPACK_IMPORTED_MODULE_3__.motion.div, {\n                initial: {\n                    opacity: 0,\n                    y: 20\n                },\n                animate: {\n                    opacity: 1,\n                    y: 0\n                },\n                transition: {\n                    duration: 0.3,\n                    delay: 0.2\n                },\n                className: \"glass-effect rounded-xl p-6\",\n                children: [\n                    /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                        className: \"flex items-center justify-between mb-4\",\n                        children: /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                            className: \"flex items-center space-x-2\",\n                            children: [\n                                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_Activity_BarChart3_PieChart_TrendingUp_lucide_react__WEBPACK_IMPORTED_MODULE_12__[\"default\"], {\n                                    className: \"w-5 h-5 text-green-600\"\n                                }, void 0, false, {\n                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                                    lineNumber: 137,\n                                    columnNumber: 13\n                                }, this),\n                                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"h3\", {\n                                    className: \"text-lg font-semibold text-gray-900 dark:text-white\",\n                                    children: \"Campaign Performance\"\n                                }, void 0, false, {\n                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                                    lineNumber: 138,\n                                    columnNumber: 13\n                                }, this)\n                            ]\n                        }, void 0, true, {\n                            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                            lineNumber: 136,\n                            columnNumber: 11\n                        }, this)\n                    }, void 0, false, {\n                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                        lineNumber: 135,\n                        columnNumber: 9\n                    }, this),\n                    /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_5__.ResponsiveContainer, {\n                        width: \"100%\",\n                        height: 250,\n                        children: /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_13__.BarChart, {\n                            data: campaignChartData,\n                            children: [\n                                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_7__.CartesianGrid, {\n                                    strokeDasharray: \"3 3\",\n                                    opacity: 0.3\n                                }, void 0, false, {\n                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                                    lineNumber: 145,\n                                    columnNumber: 13\n                                }, this),\n                                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_8__.XAxis, {\n                                    dataKey: \"name\",\n                                    tick: {\n                                        fontSize: 12\n                                    }\n                                }, void 0, false, {\n                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                                    lineNumber: 146,\n                                    columnNumber: 13\n                                }, this),\n                                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_9__.YAxis, {\n                                    tick: {\n                                        fontSize: 12\n                                    },\n                                    tickFormatter: (value)=>`$${value}`\n                                }, void 0, false, {\n                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                                    lineNumber: 147,\n                                    columnNumber: 13\n                                }, this),\n                                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_10__.Tooltip, {\n                                    content: /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(CustomTooltip, {}, void 0, false, {\n                                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                                        lineNumber: 148,\n                                        columnNumber: 31\n                                    }, void 0)\n                                }, void 0, false, {\n                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                                    lineNumber: 148,\n                                    columnNumber: 13\n                                }, this),\n                                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_14__.Bar, {\n                                    dataKey: \"revenue\",\n                                    fill: \"#10B981\",\n                                    radius: [\n                                        4,\n                                        4,\n                                        0,\n                                        0\n                                    ]\n                                }, void 0, false, {\n                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                                    lineNumber: 149,\n                                    columnNumber: 13\n                                }, this)\n                            ]\n                        }, void 0, true, {\n                            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                            lineNumber: 144,\n                            columnNumber: 11\n                        }, this)\n                    }, void 0, false, {\n                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                        lineNumber: 143,\n                        columnNumber: 9\n                    }, this)\n                ]\n            }, void 0, true, {\n                fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                lineNumber: 129,\n                columnNumber: 7\n            }, this),\n            /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(framer_motion__WEBPACK_IMPORTED_MODULE_3__.motion.div, {\n                initial: {\n                    opacity: 0,\n                    y: 20\n                },\n                animate: {\n                    opacity: 1,\n                    y: 0\n                },\n                transition: {\n                    duration: 0.3,\n                    delay: 0.3\n                },\n                className: \"glass-effect rounded-xl p-6\",\n                children: [\n                    /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                        className: \"flex items-center justify-between mb-4\",\n                        children: /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                            className: \"flex items-center space-x-2\",\n                            children: [\n                                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_Activity_BarChart3_PieChart_TrendingUp_lucide_react__WEBPACK_IMPORTED_MODULE_15__[\"default\"], {\n                                    className: \"w-5 h-5 text-purple-600\"\n                                }, void 0, false, {\n                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                                    lineNumber: 163,\n                                    columnNumber: 13\n                                }, this),\n                                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"h3\", {\n                                    className: \"text-lg font-semibold text-gray-900 dark:text-white\",\n                                    children: \"Conversion Distribution\"\n                                }, void 0, false, {\n                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                                    lineNumber: 164,\n                                    columnNumber: 13\n                                }, this)\n                            ]\n                        }, void 0, true, {\n                            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                            lineNumber: 162,\n                            columnNumber: 11\n                        }, this)\n                    }, void 0, false, {\n                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                        lineNumber: 161,\n                        columnNumber: 9\n                    }, this),\n                    /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_5__.ResponsiveContainer, {\n                        width: \"100%\",\n                        height: 250,\n                        children: /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_16__.PieChart, {\n                            children: [\n                                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_17__.Pie, {\n                                    data: campaignChartData,\n                                    cx: \"50%\",\n                                    cy: \"50%\",\n                                    innerRadius: 60,\n                                    outerRadius: 100,\n                                    paddingAngle: 5,\n                                    dataKey: \"conversions\",\n                                    children: campaignChartData.map((entry, index)=>/*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_18__.Cell, {\n                                            fill: COLORS[index % COLORS.length]\n                                        }, `cell-${index}`, false, {\n                                            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                                            lineNumber: 181,\n                                            columnNumber: 17\n                                        }, this))\n                                }, void 0, false, {\n                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                                    lineNumber: 171,\n                                    columnNumber: 13\n                                }, this),\n                                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_10__.Tooltip, {\n                                    formatter: (value)=>[\n                                            (0,_lib_utils__WEBPACK_IMPORTED_MODULE_2__.formatNumber)(Number(value)),\n                                            \"Conversions\"\n                                        ]\n                                }, void 0, false, {\n                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                                    lineNumber: 184,\n                                    columnNumber: 13\n                                }, this),\n                                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_19__.Legend, {}, void 0, false, {\n                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                                    lineNumber: 187,\n                                    columnNumber: 13\n                                }, this)\n                            ]\n                        }, void 0, true, {\n                            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                            lineNumber: 170,\n                            columnNumber: 11\n                        }, this)\n                    }, void 0, false, {\n                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                        lineNumber: 169,\n                        columnNumber: 9\n                    }, this)\n                ]\n            }, void 0, true, {\n                fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                lineNumber: 155,\n                columnNumber: 7\n            }, this),\n            /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(framer_motion__WEBPACK_IMPORTED_MODULE_3__.motion.div, {\n                initial: {\n                    opacity: 0,\n                    y: 20\n                },\n                animate: {\n                    opacity: 1,\n                    y: 0\n                },\n                transition: {\n                    duration: 0.3,\n                    delay: 0.4\n                },\n                className: \"glass-effect rounded-xl p-6\",\n                children: [\n                    /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                        className: \"flex items-center justify-between mb-4\",\n                        children: /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                            className: \"flex items-center space-x-2\",\n                            children: [\n                                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_Activity_BarChart3_PieChart_TrendingUp_lucide_react__WEBPACK_IMPORTED_MODULE_20__[\"default\"], {\n                                    className: \"w-5 h-5 text-orange-600\"\n                                }, void 0, false, {\n                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                                    lineNumber: 201,\n                                    columnNumber: 13\n                                }, this),\n                                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"h3\", {\n                                    className: \"text-lg font-semibold text-gray-900 dark:text-white\",\n                                    children: \"Multi-Metric Overview\"\n                                }, void 0, false, {\n                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                                    lineNumber: 202,\n                                    columnNumber: 13\n                                }, this)\n                            ]\n                        }, void 0, true, {\n                            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                            lineNumber: 200,\n                            columnNumber: 11\n                        }, this)\n                    }, void 0, false, {\n                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                        lineNumber: 199,\n                        columnNumber: 9\n                    }, this),\n                    /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_5__.ResponsiveContainer, {\n                        width: \"100%\",\n                        height: 250,\n                        children: /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_21__.LineChart, {\n                            data: dailyData,\n                            children: [\n                                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_7__.CartesianGrid, {\n                                    strokeDasharray: \"3 3\",\n                                    opacity: 0.3\n                                }, void 0, false, {\n                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                                    lineNumber: 209,\n                                    columnNumber: 13\n                                }, this),\n                                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_8__.XAxis, {\n                                    dataKey: \"date\",\n                                    tick: {\n                                        fontSize: 12\n                                    },\n                                    tickFormatter: (value)=>new Date(value).toLocaleDateString(\"en-US\", {\n                                            month: \"short\",\n                                            day: \"numeric\"\n                                        })\n                                }, void 0, false, {\n                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                                    lineNumber: 210,\n                                    columnNumber: 13\n                                }, this),\n                                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_9__.YAxis, {\n                                    yAxisId: \"left\",\n                                    tick: {\n                                        fontSize: 12\n                                    }\n                                }, void 0, false, {\n                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                                    lineNumber: 215,\n                                    columnNumber: 13\n                                }, this),\n                                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_9__.YAxis, {\n                                    yAxisId: \"right\",\n                                    orientation: \"right\",\n                                    tick: {\n                                        fontSize: 12\n                                    }\n                                }, void 0, false, {\n                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                                    lineNumber: 216,\n                                    columnNumber: 13\n                                }, this),\n                                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_10__.Tooltip, {\n                                    content: /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(CustomTooltip, {}, void 0, false, {\n                                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                                        lineNumber: 217,\n                                        columnNumber: 31\n                                    }, void 0)\n                                }, void 0, false, {\n                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                                    lineNumber: 217,\n                                    columnNumber: 13\n                                }, this),\n                                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_19__.Legend, {}, void 0, false, {\n                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                                    lineNumber: 218,\n                                    columnNumber: 13\n                                }, this),\n                                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_22__.Line, {\n                                    yAxisId: \"left\",\n                                    type: \"monotone\",\n                                    dataKey: \"users\",\n                                    stroke: \"#3B82F6\",\n                                    strokeWidth: 2,\n                                    dot: {\n                                        r: 4\n                                    },\n                                    name: \"Users\"\n                                }, void 0, false, {\n                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                                    lineNumber: 219,\n                                    columnNumber: 13\n                                }, this),\n                                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_Area_AreaChart_Bar_BarChart_CartesianGrid_Cell_Legend_Line_LineChart_Pie_PieChart_ResponsiveContainer_Tooltip_XAxis_YAxis_recharts__WEBPACK_IMPORTED_MODULE_22__.Line, {\n                                    yAxisId: \"right\",\n                                    type: \"monotone\",\n                                    dataKey: \"conversions\",\n                                    stroke: \"#10B981\",\n                                    strokeWidth: 2,\n                                    dot: {\n                                        r: 4\n                                    },\n                                    name: \"Conversions\"\n                                }, void 0, false, {\n                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                                    lineNumber: 228,\n                                    columnNumber: 13\n                                }, this)\n                            ]\n                        }, void 0, true, {\n                            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                            lineNumber: 208,\n                            columnNumber: 11\n                        }, this)\n                    }, void 0, false, {\n                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                        lineNumber: 207,\n                        columnNumber: 9\n                    }, this)\n                ]\n            }, void 0, true, {\n                fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n                lineNumber: 193,\n                columnNumber: 7\n            }, this)\n        ]\n    }, void 0, true, {\n        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Charts.tsx\",\n        lineNumber: 85,\n        columnNumber: 5\n    }, this);\n}\n//# sourceURL=[module]\n//# sourceMappingURL=data:application/json;charset=utf-8;base64,eyJ2ZXJzaW9uIjozLCJmaWxlIjoiKHNzcikvLi9jb21wb25lbnRzL0NoYXJ0cy50c3giLCJtYXBwaW5ncyI6Ijs7Ozs7Ozs7Ozs7Ozs7Ozs7Ozs7Ozs7Ozs7Ozs7O0FBRWlDO0FBaUJmO0FBQ3FCO0FBQzZDO0FBRXpCO0FBRTNELE1BQU11QixTQUFTO0lBQUM7SUFBVztJQUFXO0lBQVc7SUFBVztDQUFVO0FBTy9ELFNBQVNDLE9BQU8sRUFBRUMsSUFBSSxFQUFFQyxZQUFZLEVBQWU7SUFDeEQsTUFBTSxDQUFDQyxhQUFhQyxlQUFlLEdBQUc1QiwrQ0FBUUEsQ0FBc0M7SUFFcEYsdURBQXVEO0lBQ3ZELE1BQU02QixZQUFZSixLQUFLSyxNQUFNLENBQUMsQ0FBQ0MsS0FBS0M7UUFDbEMsTUFBTUMsY0FBY0YsSUFBSUcsSUFBSSxDQUFDQyxDQUFBQSxJQUFLQSxFQUFFQyxJQUFJLEtBQUtKLEtBQUtJLElBQUk7UUFDdEQsSUFBSUgsYUFBYTtZQUNmQSxZQUFZSSxPQUFPLElBQUlMLEtBQUtLLE9BQU87WUFDbkNKLFlBQVlLLEtBQUssSUFBSU4sS0FBS00sS0FBSztZQUMvQkwsWUFBWU0sV0FBVyxJQUFJUCxLQUFLTyxXQUFXO1FBQzdDLE9BQU87WUFDTFIsSUFBSVMsSUFBSSxDQUFDO2dCQUNQSixNQUFNSixLQUFLSSxJQUFJO2dCQUNmQyxTQUFTTCxLQUFLSyxPQUFPO2dCQUNyQkMsT0FBT04sS0FBS00sS0FBSztnQkFDakJDLGFBQWFQLEtBQUtPLFdBQVc7WUFDL0I7UUFDRjtRQUNBLE9BQU9SO0lBQ1QsR0FBRyxFQUFFLEVBQVdVLEtBQUssQ0FBQyxDQUFDLEtBQUssZUFBZTtJQUUzQyx3Q0FBd0M7SUFDeEMsTUFBTUMsb0JBQW9CaEIsYUFBYWlCLEdBQUcsQ0FBQ0MsQ0FBQUEsV0FBYTtZQUN0REMsTUFBTUQsU0FBU0EsUUFBUTtZQUN2QlAsU0FBU08sU0FBU1AsT0FBTztZQUN6QkMsT0FBT00sU0FBU04sS0FBSztZQUNyQkMsYUFBYUssU0FBU0wsV0FBVztRQUNuQztJQUVBLE1BQU1PLGdCQUFnQixDQUFDLEVBQUVDLE1BQU0sRUFBRUMsT0FBTyxFQUFFQyxLQUFLLEVBQU87UUFDcEQsSUFBSUYsVUFBVUMsV0FBV0EsUUFBUUUsTUFBTSxFQUFFO1lBQ3ZDLHFCQUNFLDhEQUFDQztnQkFBSUMsV0FBVTs7a0NBQ2IsOERBQUNDO3dCQUFFRCxXQUFVO2tDQUNWSDs7Ozs7O29CQUVGRCxRQUFRTCxHQUFHLENBQUMsQ0FBQ1csT0FBWUMsc0JBQ3hCLDhEQUFDRjs0QkFBY0QsV0FBVTs0QkFBVUksT0FBTztnQ0FBRUMsT0FBT0gsTUFBTUcsS0FBSzs0QkFBQzs7Z0NBQzVESCxNQUFNVCxJQUFJO2dDQUFDO2dDQUNWUyxNQUFNVCxJQUFJLEtBQUssWUFDWHhCLDBEQUFjQSxDQUFDaUMsTUFBTUksS0FBSyxJQUMxQnBDLHdEQUFZQSxDQUFDZ0MsTUFBTUksS0FBSzs7MkJBSnhCSDs7Ozs7Ozs7Ozs7UUFVaEI7UUFDQSxPQUFPO0lBQ1Q7SUFFQSxxQkFDRSw4REFBQ0o7UUFBSUMsV0FBVTs7MEJBRWIsOERBQUNwQyxpREFBTUEsQ0FBQ21DLEdBQUc7Z0JBQ1RRLFNBQVM7b0JBQUVDLFNBQVM7b0JBQUdDLEdBQUc7Z0JBQUc7Z0JBQzdCQyxTQUFTO29CQUFFRixTQUFTO29CQUFHQyxHQUFHO2dCQUFFO2dCQUM1QkUsWUFBWTtvQkFBRUMsVUFBVTtvQkFBS0MsT0FBTztnQkFBSTtnQkFDeENiLFdBQVU7O2tDQUVWLDhEQUFDRDt3QkFBSUMsV0FBVTtrQ0FDYiw0RUFBQ0Q7NEJBQUlDLFdBQVU7OzhDQUNiLDhEQUFDbkMsa0hBQVVBO29DQUFDbUMsV0FBVTs7Ozs7OzhDQUN0Qiw4REFBQ2M7b0NBQUdkLFdBQVU7OENBQXNEOzs7Ozs7Ozs7Ozs7Ozs7OztrQ0FLeEUsOERBQUNyQywwTUFBbUJBO3dCQUFDb0QsT0FBTTt3QkFBT0MsUUFBUTtrQ0FDeEMsNEVBQUNqRSxnTUFBU0E7NEJBQUNzQixNQUFNSTs7OENBQ2YsOERBQUN3Qzs4Q0FDQyw0RUFBQ0M7d0NBQWVDLElBQUc7d0NBQWtCQyxJQUFHO3dDQUFJQyxJQUFHO3dDQUFJQyxJQUFHO3dDQUFJQyxJQUFHOzswREFDM0QsOERBQUNDO2dEQUFLQyxRQUFPO2dEQUFLQyxXQUFVO2dEQUFVQyxhQUFhOzs7Ozs7MERBQ25ELDhEQUFDSDtnREFBS0MsUUFBTztnREFBTUMsV0FBVTtnREFBVUMsYUFBYTs7Ozs7Ozs7Ozs7Ozs7Ozs7OENBR3hELDhEQUFDbkUsb01BQWFBO29DQUFDb0UsaUJBQWdCO29DQUFNcEIsU0FBUzs7Ozs7OzhDQUM5Qyw4REFBQ2xELDRMQUFLQTtvQ0FDSnVFLFNBQVE7b0NBQ1JDLE1BQU07d0NBQUVDLFVBQVU7b0NBQUc7b0NBQ3JCQyxlQUFlLENBQUMxQixRQUFVLElBQUkyQixLQUFLM0IsT0FBTzRCLGtCQUFrQixDQUFDLFNBQVM7NENBQUVDLE9BQU87NENBQVNDLEtBQUs7d0NBQVU7Ozs7Ozs4Q0FFekcsOERBQUM3RSw0TEFBS0E7b0NBQUN1RSxNQUFNO3dDQUFFQyxVQUFVO29DQUFHO29DQUFHQyxlQUFlLENBQUMxQixRQUFVLENBQUMsQ0FBQyxFQUFFQSxNQUFNLENBQUM7Ozs7Ozs4Q0FDcEUsOERBQUM3QywrTEFBT0E7b0NBQUM0RSx1QkFBUyw4REFBQzNDOzs7Ozs7Ozs7OzhDQUNuQiw4REFBQzFDLDRMQUFJQTtvQ0FDSHNGLE1BQUs7b0NBQ0xULFNBQVE7b0NBQ1JVLFFBQU87b0NBQ1BDLGFBQWE7b0NBQ2JDLE1BQUs7Ozs7Ozs7Ozs7Ozs7Ozs7Ozs7Ozs7OzBCQU9iLDhEQUFDN0UsaURBQU1BLENBQUNtQyxHQUFHO2dCQUNUUSxTQUFTO29CQUFFQyxTQUFTO29CQUFHQyxHQUFHO2dCQUFHO2dCQUM3QkMsU0FBUztvQkFBRUYsU0FBUztvQkFBR0MsR0FBRztnQkFBRTtnQkFDNUJFLFlBQVk7b0JBQUVDLFVBQVU7b0JBQUtDLE9BQU87Z0JBQUk7Z0JBQ3hDYixXQUFVOztrQ0FFViw4REFBQ0Q7d0JBQUlDLFdBQVU7a0NBQ2IsNEVBQUNEOzRCQUFJQyxXQUFVOzs4Q0FDYiw4REFBQ2xDLG1IQUFTQTtvQ0FBQ2tDLFdBQVU7Ozs7Ozs4Q0FDckIsOERBQUNjO29DQUFHZCxXQUFVOzhDQUFzRDs7Ozs7Ozs7Ozs7Ozs7Ozs7a0NBS3hFLDhEQUFDckMsME1BQW1CQTt3QkFBQ29ELE9BQU07d0JBQU9DLFFBQVE7a0NBQ3hDLDRFQUFDL0QsZ01BQVFBOzRCQUFDb0IsTUFBTWlCOzs4Q0FDZCw4REFBQzlCLG9NQUFhQTtvQ0FBQ29FLGlCQUFnQjtvQ0FBTXBCLFNBQVM7Ozs7Ozs4Q0FDOUMsOERBQUNsRCw0TEFBS0E7b0NBQUN1RSxTQUFRO29DQUFPQyxNQUFNO3dDQUFFQyxVQUFVO29DQUFHOzs7Ozs7OENBQzNDLDhEQUFDeEUsNExBQUtBO29DQUFDdUUsTUFBTTt3Q0FBRUMsVUFBVTtvQ0FBRztvQ0FBR0MsZUFBZSxDQUFDMUIsUUFBVSxDQUFDLENBQUMsRUFBRUEsTUFBTSxDQUFDOzs7Ozs7OENBQ3BFLDhEQUFDN0MsK0xBQU9BO29DQUFDNEUsdUJBQVMsOERBQUMzQzs7Ozs7Ozs7Ozs4Q0FDbkIsOERBQUN4QywyTEFBR0E7b0NBQUMyRSxTQUFRO29DQUFVWSxNQUFLO29DQUFVQyxRQUFRO3dDQUFDO3dDQUFHO3dDQUFHO3dDQUFHO3FDQUFFOzs7Ozs7Ozs7Ozs7Ozs7Ozs7Ozs7OzswQkFNaEUsOERBQUM5RSxpREFBTUEsQ0FBQ21DLEdBQUc7Z0JBQ1RRLFNBQVM7b0JBQUVDLFNBQVM7b0JBQUdDLEdBQUc7Z0JBQUc7Z0JBQzdCQyxTQUFTO29CQUFFRixTQUFTO29CQUFHQyxHQUFHO2dCQUFFO2dCQUM1QkUsWUFBWTtvQkFBRUMsVUFBVTtvQkFBS0MsT0FBTztnQkFBSTtnQkFDeENiLFdBQVU7O2tDQUVWLDhEQUFDRDt3QkFBSUMsV0FBVTtrQ0FDYiw0RUFBQ0Q7NEJBQUlDLFdBQVU7OzhDQUNiLDhEQUFDakMsbUhBQU9BO29DQUFDaUMsV0FBVTs7Ozs7OzhDQUNuQiw4REFBQ2M7b0NBQUdkLFdBQVU7OENBQXNEOzs7Ozs7Ozs7Ozs7Ozs7OztrQ0FLeEUsOERBQUNyQywwTUFBbUJBO3dCQUFDb0QsT0FBTTt3QkFBT0MsUUFBUTtrQ0FDeEMsNEVBQUM3RCxnTUFBUUE7OzhDQUNQLDhEQUFDQywyTEFBR0E7b0NBQ0ZpQixNQUFNaUI7b0NBQ05xRCxJQUFHO29DQUNIQyxJQUFHO29DQUNIQyxhQUFhO29DQUNiQyxhQUFhO29DQUNiQyxjQUFjO29DQUNkbEIsU0FBUTs4Q0FFUHZDLGtCQUFrQkMsR0FBRyxDQUFDLENBQUNXLE9BQU9DLHNCQUM3Qiw4REFBQzlDLDRMQUFJQTs0Q0FBdUJvRixNQUFNdEUsTUFBTSxDQUFDZ0MsUUFBUWhDLE9BQU8yQixNQUFNLENBQUM7MkNBQXBELENBQUMsS0FBSyxFQUFFSyxNQUFNLENBQUM7Ozs7Ozs7Ozs7OENBRzlCLDhEQUFDMUMsK0xBQU9BO29DQUNOdUYsV0FBVyxDQUFDMUMsUUFBVTs0Q0FBQ3BDLHdEQUFZQSxDQUFDK0UsT0FBTzNDOzRDQUFTO3lDQUFjOzs7Ozs7OENBRXBFLDhEQUFDNUMsOExBQU1BOzs7Ozs7Ozs7Ozs7Ozs7Ozs7Ozs7OzBCQU1iLDhEQUFDRSxpREFBTUEsQ0FBQ21DLEdBQUc7Z0JBQ1RRLFNBQVM7b0JBQUVDLFNBQVM7b0JBQUdDLEdBQUc7Z0JBQUc7Z0JBQzdCQyxTQUFTO29CQUFFRixTQUFTO29CQUFHQyxHQUFHO2dCQUFFO2dCQUM1QkUsWUFBWTtvQkFBRUMsVUFBVTtvQkFBS0MsT0FBTztnQkFBSTtnQkFDeENiLFdBQVU7O2tDQUVWLDhEQUFDRDt3QkFBSUMsV0FBVTtrQ0FDYiw0RUFBQ0Q7NEJBQUlDLFdBQVU7OzhDQUNiLDhEQUFDaEMsbUhBQVFBO29DQUFDZ0MsV0FBVTs7Ozs7OzhDQUNwQiw4REFBQ2M7b0NBQUdkLFdBQVU7OENBQXNEOzs7Ozs7Ozs7Ozs7Ozs7OztrQ0FLeEUsOERBQUNyQywwTUFBbUJBO3dCQUFDb0QsT0FBTTt3QkFBT0MsUUFBUTtrQ0FDeEMsNEVBQUNuRSxpTUFBU0E7NEJBQUN3QixNQUFNSTs7OENBQ2YsOERBQUNqQixvTUFBYUE7b0NBQUNvRSxpQkFBZ0I7b0NBQU1wQixTQUFTOzs7Ozs7OENBQzlDLDhEQUFDbEQsNExBQUtBO29DQUNKdUUsU0FBUTtvQ0FDUkMsTUFBTTt3Q0FBRUMsVUFBVTtvQ0FBRztvQ0FDckJDLGVBQWUsQ0FBQzFCLFFBQVUsSUFBSTJCLEtBQUszQixPQUFPNEIsa0JBQWtCLENBQUMsU0FBUzs0Q0FBRUMsT0FBTzs0Q0FBU0MsS0FBSzt3Q0FBVTs7Ozs7OzhDQUV6Ryw4REFBQzdFLDRMQUFLQTtvQ0FBQzJGLFNBQVE7b0NBQU9wQixNQUFNO3dDQUFFQyxVQUFVO29DQUFHOzs7Ozs7OENBQzNDLDhEQUFDeEUsNExBQUtBO29DQUFDMkYsU0FBUTtvQ0FBUUMsYUFBWTtvQ0FBUXJCLE1BQU07d0NBQUVDLFVBQVU7b0NBQUc7Ozs7Ozs4Q0FDaEUsOERBQUN0RSwrTEFBT0E7b0NBQUM0RSx1QkFBUyw4REFBQzNDOzs7Ozs7Ozs7OzhDQUNuQiw4REFBQ2hDLDhMQUFNQTs7Ozs7OENBQ1AsOERBQUNaLDRMQUFJQTtvQ0FDSG9HLFNBQVE7b0NBQ1JaLE1BQUs7b0NBQ0xULFNBQVE7b0NBQ1JVLFFBQU87b0NBQ1BDLGFBQWE7b0NBQ2JZLEtBQUs7d0NBQUVDLEdBQUc7b0NBQUU7b0NBQ1o1RCxNQUFLOzs7Ozs7OENBRVAsOERBQUMzQyw0TEFBSUE7b0NBQ0hvRyxTQUFRO29DQUNSWixNQUFLO29DQUNMVCxTQUFRO29DQUNSVSxRQUFPO29DQUNQQyxhQUFhO29DQUNiWSxLQUFLO3dDQUFFQyxHQUFHO29DQUFFO29DQUNaNUQsTUFBSzs7Ozs7Ozs7Ozs7Ozs7Ozs7Ozs7Ozs7Ozs7Ozs7QUFPbkIiLCJzb3VyY2VzIjpbIndlYnBhY2s6Ly9hZG15YnJhbmQtaW5zaWdodHMvLi9jb21wb25lbnRzL0NoYXJ0cy50c3g/YTYzZCJdLCJzb3VyY2VzQ29udGVudCI6WyIndXNlIGNsaWVudCc7XG5cbmltcG9ydCB7IHVzZVN0YXRlIH0gZnJvbSAncmVhY3QnO1xuaW1wb3J0IHtcbiAgTGluZUNoYXJ0LFxuICBMaW5lLFxuICBBcmVhQ2hhcnQsXG4gIEFyZWEsXG4gIEJhckNoYXJ0LFxuICBCYXIsXG4gIFBpZUNoYXJ0LFxuICBQaWUsXG4gIENlbGwsXG4gIFhBeGlzLFxuICBZQXhpcyxcbiAgQ2FydGVzaWFuR3JpZCxcbiAgVG9vbHRpcCxcbiAgTGVnZW5kLFxuICBSZXNwb25zaXZlQ29udGFpbmVyLFxufSBmcm9tICdyZWNoYXJ0cyc7XG5pbXBvcnQgeyBtb3Rpb24gfSBmcm9tICdmcmFtZXItbW90aW9uJztcbmltcG9ydCB7IFRyZW5kaW5nVXAsIEJhckNoYXJ0MywgUGllQ2hhcnQgYXMgUGllSWNvbiwgQWN0aXZpdHkgfSBmcm9tICdsdWNpZGUtcmVhY3QnO1xuaW1wb3J0IHsgTWV0cmljRGF0YSwgQ2FtcGFpZ25EYXRhIH0gZnJvbSAnQC9kYXRhL21vY2tEYXRhJztcbmltcG9ydCB7IGZvcm1hdEN1cnJlbmN5LCBmb3JtYXROdW1iZXIgfSBmcm9tICdAL2xpYi91dGlscyc7XG5cbmNvbnN0IENPTE9SUyA9IFsnIzNCODJGNicsICcjMTBCOTgxJywgJyNGNTlFMEInLCAnI0VGNDQ0NCcsICcjOEI1Q0Y2J107XG5cbmludGVyZmFjZSBDaGFydHNQcm9wcyB7XG4gIGRhdGE6IE1ldHJpY0RhdGFbXTtcbiAgY2FtcGFpZ25EYXRhOiBDYW1wYWlnbkRhdGFbXTtcbn1cblxuZXhwb3J0IGZ1bmN0aW9uIENoYXJ0cyh7IGRhdGEsIGNhbXBhaWduRGF0YSB9OiBDaGFydHNQcm9wcykge1xuICBjb25zdCBbYWN0aXZlQ2hhcnQsIHNldEFjdGl2ZUNoYXJ0XSA9IHVzZVN0YXRlPCdyZXZlbnVlJyB8ICd1c2VycycgfCAnY29udmVyc2lvbnMnPigncmV2ZW51ZScpO1xuXG4gIC8vIFByZXBhcmUgZGF0YSBmb3IgbGluZS9hcmVhIGNoYXJ0cyAoZGFpbHkgYWdncmVnYXRlcylcbiAgY29uc3QgZGFpbHlEYXRhID0gZGF0YS5yZWR1Y2UoKGFjYywgaXRlbSkgPT4ge1xuICAgIGNvbnN0IGV4aXN0aW5nRGF5ID0gYWNjLmZpbmQoZCA9PiBkLmRhdGUgPT09IGl0ZW0uZGF0ZSk7XG4gICAgaWYgKGV4aXN0aW5nRGF5KSB7XG4gICAgICBleGlzdGluZ0RheS5yZXZlbnVlICs9IGl0ZW0ucmV2ZW51ZTtcbiAgICAgIGV4aXN0aW5nRGF5LnVzZXJzICs9IGl0ZW0udXNlcnM7XG4gICAgICBleGlzdGluZ0RheS5jb252ZXJzaW9ucyArPSBpdGVtLmNvbnZlcnNpb25zO1xuICAgIH0gZWxzZSB7XG4gICAgICBhY2MucHVzaCh7XG4gICAgICAgIGRhdGU6IGl0ZW0uZGF0ZSxcbiAgICAgICAgcmV2ZW51ZTogaXRlbS5yZXZlbnVlLFxuICAgICAgICB1c2VyczogaXRlbS51c2VycyxcbiAgICAgICAgY29udmVyc2lvbnM6IGl0ZW0uY29udmVyc2lvbnMsXG4gICAgICB9KTtcbiAgICB9XG4gICAgcmV0dXJuIGFjYztcbiAgfSwgW10gYXMgYW55W10pLnNsaWNlKC0xNCk7IC8vIExhc3QgMTQgZGF5c1xuXG4gIC8vIFByZXBhcmUgZGF0YSBmb3IgY2FtcGFpZ24gcGVyZm9ybWFuY2VcbiAgY29uc3QgY2FtcGFpZ25DaGFydERhdGEgPSBjYW1wYWlnbkRhdGEubWFwKGNhbXBhaWduID0+ICh7XG4gICAgbmFtZTogY2FtcGFpZ24uY2FtcGFpZ24sXG4gICAgcmV2ZW51ZTogY2FtcGFpZ24ucmV2ZW51ZSxcbiAgICB1c2VyczogY2FtcGFpZ24udXNlcnMsXG4gICAgY29udmVyc2lvbnM6IGNhbXBhaWduLmNvbnZlcnNpb25zLFxuICB9KSk7XG5cbiAgY29uc3QgQ3VzdG9tVG9vbHRpcCA9ICh7IGFjdGl2ZSwgcGF5bG9hZCwgbGFiZWwgfTogYW55KSA9PiB7XG4gICAgaWYgKGFjdGl2ZSAmJiBwYXlsb2FkICYmIHBheWxvYWQubGVuZ3RoKSB7XG4gICAgICByZXR1cm4gKFxuICAgICAgICA8ZGl2IGNsYXNzTmFtZT1cImdsYXNzLWVmZmVjdCByb3VuZGVkLWxnIHAtMyBib3JkZXIgYm9yZGVyLXdoaXRlLzIwXCI+XG4gICAgICAgICAgPHAgY2xhc3NOYW1lPVwidGV4dC1zbSBmb250LW1lZGl1bSB0ZXh0LWdyYXktOTAwIGRhcms6dGV4dC13aGl0ZVwiPlxuICAgICAgICAgICAge2xhYmVsfVxuICAgICAgICAgIDwvcD5cbiAgICAgICAgICB7cGF5bG9hZC5tYXAoKGVudHJ5OiBhbnksIGluZGV4OiBudW1iZXIpID0+IChcbiAgICAgICAgICAgIDxwIGtleT17aW5kZXh9IGNsYXNzTmFtZT1cInRleHQtc21cIiBzdHlsZT17eyBjb2xvcjogZW50cnkuY29sb3IgfX0+XG4gICAgICAgICAgICAgIHtlbnRyeS5uYW1lfToge1xuICAgICAgICAgICAgICAgIGVudHJ5Lm5hbWUgPT09ICdyZXZlbnVlJyBcbiAgICAgICAgICAgICAgICAgID8gZm9ybWF0Q3VycmVuY3koZW50cnkudmFsdWUpXG4gICAgICAgICAgICAgICAgICA6IGZvcm1hdE51bWJlcihlbnRyeS52YWx1ZSlcbiAgICAgICAgICAgICAgfVxuICAgICAgICAgICAgPC9wPlxuICAgICAgICAgICkpfVxuICAgICAgICA8L2Rpdj5cbiAgICAgICk7XG4gICAgfVxuICAgIHJldHVybiBudWxsO1xuICB9O1xuXG4gIHJldHVybiAoXG4gICAgPGRpdiBjbGFzc05hbWU9XCJncmlkIGdyaWQtY29scy0xIGxnOmdyaWQtY29scy0yIGdhcC02XCI+XG4gICAgICB7LyogUmV2ZW51ZSBUcmVuZCBDaGFydCAqL31cbiAgICAgIDxtb3Rpb24uZGl2XG4gICAgICAgIGluaXRpYWw9e3sgb3BhY2l0eTogMCwgeTogMjAgfX1cbiAgICAgICAgYW5pbWF0ZT17eyBvcGFjaXR5OiAxLCB5OiAwIH19XG4gICAgICAgIHRyYW5zaXRpb249e3sgZHVyYXRpb246IDAuMywgZGVsYXk6IDAuMSB9fVxuICAgICAgICBjbGFzc05hbWU9XCJnbGFzcy1lZmZlY3Qgcm91bmRlZC14bCBwLTZcIlxuICAgICAgPlxuICAgICAgICA8ZGl2IGNsYXNzTmFtZT1cImZsZXggaXRlbXMtY2VudGVyIGp1c3RpZnktYmV0d2VlbiBtYi00XCI+XG4gICAgICAgICAgPGRpdiBjbGFzc05hbWU9XCJmbGV4IGl0ZW1zLWNlbnRlciBzcGFjZS14LTJcIj5cbiAgICAgICAgICAgIDxUcmVuZGluZ1VwIGNsYXNzTmFtZT1cInctNSBoLTUgdGV4dC1ibHVlLTYwMFwiIC8+XG4gICAgICAgICAgICA8aDMgY2xhc3NOYW1lPVwidGV4dC1sZyBmb250LXNlbWlib2xkIHRleHQtZ3JheS05MDAgZGFyazp0ZXh0LXdoaXRlXCI+XG4gICAgICAgICAgICAgIFJldmVudWUgVHJlbmRcbiAgICAgICAgICAgIDwvaDM+XG4gICAgICAgICAgPC9kaXY+XG4gICAgICAgIDwvZGl2PlxuICAgICAgICA8UmVzcG9uc2l2ZUNvbnRhaW5lciB3aWR0aD1cIjEwMCVcIiBoZWlnaHQ9ezI1MH0+XG4gICAgICAgICAgPEFyZWFDaGFydCBkYXRhPXtkYWlseURhdGF9PlxuICAgICAgICAgICAgPGRlZnM+XG4gICAgICAgICAgICAgIDxsaW5lYXJHcmFkaWVudCBpZD1cInJldmVudWVHcmFkaWVudFwiIHgxPVwiMFwiIHkxPVwiMFwiIHgyPVwiMFwiIHkyPVwiMVwiPlxuICAgICAgICAgICAgICAgIDxzdG9wIG9mZnNldD1cIjUlXCIgc3RvcENvbG9yPVwiIzNCODJGNlwiIHN0b3BPcGFjaXR5PXswLjN9Lz5cbiAgICAgICAgICAgICAgICA8c3RvcCBvZmZzZXQ9XCI5NSVcIiBzdG9wQ29sb3I9XCIjM0I4MkY2XCIgc3RvcE9wYWNpdHk9ezB9Lz5cbiAgICAgICAgICAgICAgPC9saW5lYXJHcmFkaWVudD5cbiAgICAgICAgICAgIDwvZGVmcz5cbiAgICAgICAgICAgIDxDYXJ0ZXNpYW5HcmlkIHN0cm9rZURhc2hhcnJheT1cIjMgM1wiIG9wYWNpdHk9ezAuM30gLz5cbiAgICAgICAgICAgIDxYQXhpcyBcbiAgICAgICAgICAgICAgZGF0YUtleT1cImRhdGVcIiBcbiAgICAgICAgICAgICAgdGljaz17eyBmb250U2l6ZTogMTIgfX1cbiAgICAgICAgICAgICAgdGlja0Zvcm1hdHRlcj17KHZhbHVlKSA9PiBuZXcgRGF0ZSh2YWx1ZSkudG9Mb2NhbGVEYXRlU3RyaW5nKCdlbi1VUycsIHsgbW9udGg6ICdzaG9ydCcsIGRheTogJ251bWVyaWMnIH0pfVxuICAgICAgICAgICAgLz5cbiAgICAgICAgICAgIDxZQXhpcyB0aWNrPXt7IGZvbnRTaXplOiAxMiB9fSB0aWNrRm9ybWF0dGVyPXsodmFsdWUpID0+IGAkJHt2YWx1ZX1gfSAvPlxuICAgICAgICAgICAgPFRvb2x0aXAgY29udGVudD17PEN1c3RvbVRvb2x0aXAgLz59IC8+XG4gICAgICAgICAgICA8QXJlYVxuICAgICAgICAgICAgICB0eXBlPVwibW9ub3RvbmVcIlxuICAgICAgICAgICAgICBkYXRhS2V5PVwicmV2ZW51ZVwiXG4gICAgICAgICAgICAgIHN0cm9rZT1cIiMzQjgyRjZcIlxuICAgICAgICAgICAgICBzdHJva2VXaWR0aD17Mn1cbiAgICAgICAgICAgICAgZmlsbD1cInVybCgjcmV2ZW51ZUdyYWRpZW50KVwiXG4gICAgICAgICAgICAvPlxuICAgICAgICAgIDwvQXJlYUNoYXJ0PlxuICAgICAgICA8L1Jlc3BvbnNpdmVDb250YWluZXI+XG4gICAgICA8L21vdGlvbi5kaXY+XG5cbiAgICAgIHsvKiBDYW1wYWlnbiBQZXJmb3JtYW5jZSBCYXIgQ2hhcnQgKi99XG4gICAgICA8bW90aW9uLmRpdlxuICAgICAgICBpbml0aWFsPXt7IG9wYWNpdHk6IDAsIHk6IDIwIH19XG4gICAgICAgIGFuaW1hdGU9e3sgb3BhY2l0eTogMSwgeTogMCB9fVxuICAgICAgICB0cmFuc2l0aW9uPXt7IGR1cmF0aW9uOiAwLjMsIGRlbGF5OiAwLjIgfX1cbiAgICAgICAgY2xhc3NOYW1lPVwiZ2xhc3MtZWZmZWN0IHJvdW5kZWQteGwgcC02XCJcbiAgICAgID5cbiAgICAgICAgPGRpdiBjbGFzc05hbWU9XCJmbGV4IGl0ZW1zLWNlbnRlciBqdXN0aWZ5LWJldHdlZW4gbWItNFwiPlxuICAgICAgICAgIDxkaXYgY2xhc3NOYW1lPVwiZmxleCBpdGVtcy1jZW50ZXIgc3BhY2UteC0yXCI+XG4gICAgICAgICAgICA8QmFyQ2hhcnQzIGNsYXNzTmFtZT1cInctNSBoLTUgdGV4dC1ncmVlbi02MDBcIiAvPlxuICAgICAgICAgICAgPGgzIGNsYXNzTmFtZT1cInRleHQtbGcgZm9udC1zZW1pYm9sZCB0ZXh0LWdyYXktOTAwIGRhcms6dGV4dC13aGl0ZVwiPlxuICAgICAgICAgICAgICBDYW1wYWlnbiBQZXJmb3JtYW5jZVxuICAgICAgICAgICAgPC9oMz5cbiAgICAgICAgICA8L2Rpdj5cbiAgICAgICAgPC9kaXY+XG4gICAgICAgIDxSZXNwb25zaXZlQ29udGFpbmVyIHdpZHRoPVwiMTAwJVwiIGhlaWdodD17MjUwfT5cbiAgICAgICAgICA8QmFyQ2hhcnQgZGF0YT17Y2FtcGFpZ25DaGFydERhdGF9PlxuICAgICAgICAgICAgPENhcnRlc2lhbkdyaWQgc3Ryb2tlRGFzaGFycmF5PVwiMyAzXCIgb3BhY2l0eT17MC4zfSAvPlxuICAgICAgICAgICAgPFhBeGlzIGRhdGFLZXk9XCJuYW1lXCIgdGljaz17eyBmb250U2l6ZTogMTIgfX0gLz5cbiAgICAgICAgICAgIDxZQXhpcyB0aWNrPXt7IGZvbnRTaXplOiAxMiB9fSB0aWNrRm9ybWF0dGVyPXsodmFsdWUpID0+IGAkJHt2YWx1ZX1gfSAvPlxuICAgICAgICAgICAgPFRvb2x0aXAgY29udGVudD17PEN1c3RvbVRvb2x0aXAgLz59IC8+XG4gICAgICAgICAgICA8QmFyIGRhdGFLZXk9XCJyZXZlbnVlXCIgZmlsbD1cIiMxMEI5ODFcIiByYWRpdXM9e1s0LCA0LCAwLCAwXX0gLz5cbiAgICAgICAgICA8L0JhckNoYXJ0PlxuICAgICAgICA8L1Jlc3BvbnNpdmVDb250YWluZXI+XG4gICAgICA8L21vdGlvbi5kaXY+XG5cbiAgICAgIHsvKiBDb252ZXJzaW9uIERpc3RyaWJ1dGlvbiBQaWUgQ2hhcnQgKi99XG4gICAgICA8bW90aW9uLmRpdlxuICAgICAgICBpbml0aWFsPXt7IG9wYWNpdHk6IDAsIHk6IDIwIH19XG4gICAgICAgIGFuaW1hdGU9e3sgb3BhY2l0eTogMSwgeTogMCB9fVxuICAgICAgICB0cmFuc2l0aW9uPXt7IGR1cmF0aW9uOiAwLjMsIGRlbGF5OiAwLjMgfX1cbiAgICAgICAgY2xhc3NOYW1lPVwiZ2xhc3MtZWZmZWN0IHJvdW5kZWQteGwgcC02XCJcbiAgICAgID5cbiAgICAgICAgPGRpdiBjbGFzc05hbWU9XCJmbGV4IGl0ZW1zLWNlbnRlciBqdXN0aWZ5LWJldHdlZW4gbWItNFwiPlxuICAgICAgICAgIDxkaXYgY2xhc3NOYW1lPVwiZmxleCBpdGVtcy1jZW50ZXIgc3BhY2UteC0yXCI+XG4gICAgICAgICAgICA8UGllSWNvbiBjbGFzc05hbWU9XCJ3LTUgaC01IHRleHQtcHVycGxlLTYwMFwiIC8+XG4gICAgICAgICAgICA8aDMgY2xhc3NOYW1lPVwidGV4dC1sZyBmb250LXNlbWlib2xkIHRleHQtZ3JheS05MDAgZGFyazp0ZXh0LXdoaXRlXCI+XG4gICAgICAgICAgICAgIENvbnZlcnNpb24gRGlzdHJpYnV0aW9uXG4gICAgICAgICAgICA8L2gzPlxuICAgICAgICAgIDwvZGl2PlxuICAgICAgICA8L2Rpdj5cbiAgICAgICAgPFJlc3BvbnNpdmVDb250YWluZXIgd2lkdGg9XCIxMDAlXCIgaGVpZ2h0PXsyNTB9PlxuICAgICAgICAgIDxQaWVDaGFydD5cbiAgICAgICAgICAgIDxQaWVcbiAgICAgICAgICAgICAgZGF0YT17Y2FtcGFpZ25DaGFydERhdGF9XG4gICAgICAgICAgICAgIGN4PVwiNTAlXCJcbiAgICAgICAgICAgICAgY3k9XCI1MCVcIlxuICAgICAgICAgICAgICBpbm5lclJhZGl1cz17NjB9XG4gICAgICAgICAgICAgIG91dGVyUmFkaXVzPXsxMDB9XG4gICAgICAgICAgICAgIHBhZGRpbmdBbmdsZT17NX1cbiAgICAgICAgICAgICAgZGF0YUtleT1cImNvbnZlcnNpb25zXCJcbiAgICAgICAgICAgID5cbiAgICAgICAgICAgICAge2NhbXBhaWduQ2hhcnREYXRhLm1hcCgoZW50cnksIGluZGV4KSA9PiAoXG4gICAgICAgICAgICAgICAgPENlbGwga2V5PXtgY2VsbC0ke2luZGV4fWB9IGZpbGw9e0NPTE9SU1tpbmRleCAlIENPTE9SUy5sZW5ndGhdfSAvPlxuICAgICAgICAgICAgICApKX1cbiAgICAgICAgICAgIDwvUGllPlxuICAgICAgICAgICAgPFRvb2x0aXBcbiAgICAgICAgICAgICAgZm9ybWF0dGVyPXsodmFsdWUpID0+IFtmb3JtYXROdW1iZXIoTnVtYmVyKHZhbHVlKSksICdDb252ZXJzaW9ucyddfVxuICAgICAgICAgICAgLz5cbiAgICAgICAgICAgIDxMZWdlbmQgLz5cbiAgICAgICAgICA8L1BpZUNoYXJ0PlxuICAgICAgICA8L1Jlc3BvbnNpdmVDb250YWluZXI+XG4gICAgICA8L21vdGlvbi5kaXY+XG5cbiAgICAgIHsvKiBNdWx0aS1NZXRyaWMgTGluZSBDaGFydCAqL31cbiAgICAgIDxtb3Rpb24uZGl2XG4gICAgICAgIGluaXRpYWw9e3sgb3BhY2l0eTogMCwgeTogMjAgfX1cbiAgICAgICAgYW5pbWF0ZT17eyBvcGFjaXR5OiAxLCB5OiAwIH19XG4gICAgICAgIHRyYW5zaXRpb249e3sgZHVyYXRpb246IDAuMywgZGVsYXk6IDAuNCB9fVxuICAgICAgICBjbGFzc05hbWU9XCJnbGFzcy1lZmZlY3Qgcm91bmRlZC14bCBwLTZcIlxuICAgICAgPlxuICAgICAgICA8ZGl2IGNsYXNzTmFtZT1cImZsZXggaXRlbXMtY2VudGVyIGp1c3RpZnktYmV0d2VlbiBtYi00XCI+XG4gICAgICAgICAgPGRpdiBjbGFzc05hbWU9XCJmbGV4IGl0ZW1zLWNlbnRlciBzcGFjZS14LTJcIj5cbiAgICAgICAgICAgIDxBY3Rpdml0eSBjbGFzc05hbWU9XCJ3LTUgaC01IHRleHQtb3JhbmdlLTYwMFwiIC8+XG4gICAgICAgICAgICA8aDMgY2xhc3NOYW1lPVwidGV4dC1sZyBmb250LXNlbWlib2xkIHRleHQtZ3JheS05MDAgZGFyazp0ZXh0LXdoaXRlXCI+XG4gICAgICAgICAgICAgIE11bHRpLU1ldHJpYyBPdmVydmlld1xuICAgICAgICAgICAgPC9oMz5cbiAgICAgICAgICA8L2Rpdj5cbiAgICAgICAgPC9kaXY+XG4gICAgICAgIDxSZXNwb25zaXZlQ29udGFpbmVyIHdpZHRoPVwiMTAwJVwiIGhlaWdodD17MjUwfT5cbiAgICAgICAgICA8TGluZUNoYXJ0IGRhdGE9e2RhaWx5RGF0YX0+XG4gICAgICAgICAgICA8Q2FydGVzaWFuR3JpZCBzdHJva2VEYXNoYXJyYXk9XCIzIDNcIiBvcGFjaXR5PXswLjN9IC8+XG4gICAgICAgICAgICA8WEF4aXMgXG4gICAgICAgICAgICAgIGRhdGFLZXk9XCJkYXRlXCIgXG4gICAgICAgICAgICAgIHRpY2s9e3sgZm9udFNpemU6IDEyIH19XG4gICAgICAgICAgICAgIHRpY2tGb3JtYXR0ZXI9eyh2YWx1ZSkgPT4gbmV3IERhdGUodmFsdWUpLnRvTG9jYWxlRGF0ZVN0cmluZygnZW4tVVMnLCB7IG1vbnRoOiAnc2hvcnQnLCBkYXk6ICdudW1lcmljJyB9KX1cbiAgICAgICAgICAgIC8+XG4gICAgICAgICAgICA8WUF4aXMgeUF4aXNJZD1cImxlZnRcIiB0aWNrPXt7IGZvbnRTaXplOiAxMiB9fSAvPlxuICAgICAgICAgICAgPFlBeGlzIHlBeGlzSWQ9XCJyaWdodFwiIG9yaWVudGF0aW9uPVwicmlnaHRcIiB0aWNrPXt7IGZvbnRTaXplOiAxMiB9fSAvPlxuICAgICAgICAgICAgPFRvb2x0aXAgY29udGVudD17PEN1c3RvbVRvb2x0aXAgLz59IC8+XG4gICAgICAgICAgICA8TGVnZW5kIC8+XG4gICAgICAgICAgICA8TGluZVxuICAgICAgICAgICAgICB5QXhpc0lkPVwibGVmdFwiXG4gICAgICAgICAgICAgIHR5cGU9XCJtb25vdG9uZVwiXG4gICAgICAgICAgICAgIGRhdGFLZXk9XCJ1c2Vyc1wiXG4gICAgICAgICAgICAgIHN0cm9rZT1cIiMzQjgyRjZcIlxuICAgICAgICAgICAgICBzdHJva2VXaWR0aD17Mn1cbiAgICAgICAgICAgICAgZG90PXt7IHI6IDQgfX1cbiAgICAgICAgICAgICAgbmFtZT1cIlVzZXJzXCJcbiAgICAgICAgICAgIC8+XG4gICAgICAgICAgICA8TGluZVxuICAgICAgICAgICAgICB5QXhpc0lkPVwicmlnaHRcIlxuICAgICAgICAgICAgICB0eXBlPVwibW9ub3RvbmVcIlxuICAgICAgICAgICAgICBkYXRhS2V5PVwiY29udmVyc2lvbnNcIlxuICAgICAgICAgICAgICBzdHJva2U9XCIjMTBCOTgxXCJcbiAgICAgICAgICAgICAgc3Ryb2tlV2lkdGg9ezJ9XG4gICAgICAgICAgICAgIGRvdD17eyByOiA0IH19XG4gICAgICAgICAgICAgIG5hbWU9XCJDb252ZXJzaW9uc1wiXG4gICAgICAgICAgICAvPlxuICAgICAgICAgIDwvTGluZUNoYXJ0PlxuICAgICAgICA8L1Jlc3BvbnNpdmVDb250YWluZXI+XG4gICAgICA8L21vdGlvbi5kaXY+XG4gICAgPC9kaXY+XG4gICk7XG59XG4iXSwibmFtZXMiOlsidXNlU3RhdGUiLCJMaW5lQ2hhcnQiLCJMaW5lIiwiQXJlYUNoYXJ0IiwiQXJlYSIsIkJhckNoYXJ0IiwiQmFyIiwiUGllQ2hhcnQiLCJQaWUiLCJDZWxsIiwiWEF4aXMiLCJZQXhpcyIsIkNhcnRlc2lhbkdyaWQiLCJUb29sdGlwIiwiTGVnZW5kIiwiUmVzcG9uc2l2ZUNvbnRhaW5lciIsIm1vdGlvbiIsIlRyZW5kaW5nVXAiLCJCYXJDaGFydDMiLCJQaWVJY29uIiwiQWN0aXZpdHkiLCJmb3JtYXRDdXJyZW5jeSIsImZvcm1hdE51bWJlciIsIkNPTE9SUyIsIkNoYXJ0cyIsImRhdGEiLCJjYW1wYWlnbkRhdGEiLCJhY3RpdmVDaGFydCIsInNldEFjdGl2ZUNoYXJ0IiwiZGFpbHlEYXRhIiwicmVkdWNlIiwiYWNjIiwiaXRlbSIsImV4aXN0aW5nRGF5IiwiZmluZCIsImQiLCJkYXRlIiwicmV2ZW51ZSIsInVzZXJzIiwiY29udmVyc2lvbnMiLCJwdXNoIiwic2xpY2UiLCJjYW1wYWlnbkNoYXJ0RGF0YSIsIm1hcCIsImNhbXBhaWduIiwibmFtZSIsIkN1c3RvbVRvb2x0aXAiLCJhY3RpdmUiLCJwYXlsb2FkIiwibGFiZWwiLCJsZW5ndGgiLCJkaXYiLCJjbGFzc05hbWUiLCJwIiwiZW50cnkiLCJpbmRleCIsInN0eWxlIiwiY29sb3IiLCJ2YWx1ZSIsImluaXRpYWwiLCJvcGFjaXR5IiwieSIsImFuaW1hdGUiLCJ0cmFuc2l0aW9uIiwiZHVyYXRpb24iLCJkZWxheSIsImgzIiwid2lkdGgiLCJoZWlnaHQiLCJkZWZzIiwibGluZWFyR3JhZGllbnQiLCJpZCIsIngxIiwieTEiLCJ4MiIsInkyIiwic3RvcCIsIm9mZnNldCIsInN0b3BDb2xvciIsInN0b3BPcGFjaXR5Iiwic3Ryb2tlRGFzaGFycmF5IiwiZGF0YUtleSIsInRpY2siLCJmb250U2l6ZSIsInRpY2tGb3JtYXR0ZXIiLCJEYXRlIiwidG9Mb2NhbGVEYXRlU3RyaW5nIiwibW9udGgiLCJkYXkiLCJjb250ZW50IiwidHlwZSIsInN0cm9rZSIsInN0cm9rZVdpZHRoIiwiZmlsbCIsInJhZGl1cyIsImN4IiwiY3kiLCJpbm5lclJhZGl1cyIsIm91dGVyUmFkaXVzIiwicGFkZGluZ0FuZ2xlIiwiZm9ybWF0dGVyIiwiTnVtYmVyIiwieUF4aXNJZCIsIm9yaWVudGF0aW9uIiwiZG90IiwiciJdLCJzb3VyY2VSb290IjoiIn0=\n//# sourceURL=webpack-internal:///(ssr)/./components/Charts.tsx\n");
-
-/***/ }),
-
-/***/ "(ssr)/./components/Dashboard.tsx":
-/*!**********************************!*\
-  !*** ./components/Dashboard.tsx ***!
-  \**********************************/
-/***/ ((__unused_webpack_module, __webpack_exports__, __webpack_require__) => {
-
-"use strict";
-eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   Dashboard: () => (/* binding */ Dashboard)\n/* harmony export */ });\n/* harmony import */ var react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! react/jsx-dev-runtime */ \"(ssr)/./node_modules/next/dist/server/future/route-modules/app-page/vendored/ssr/react-jsx-dev-runtime.js\");\n/* harmony import */ var react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0___default = /*#__PURE__*/__webpack_require__.n(react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__);\n/* harmony import */ var react__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! react */ \"(ssr)/./node_modules/next/dist/server/future/route-modules/app-page/vendored/ssr/react.js\");\n/* harmony import */ var react__WEBPACK_IMPORTED_MODULE_1___default = /*#__PURE__*/__webpack_require__.n(react__WEBPACK_IMPORTED_MODULE_1__);\n/* harmony import */ var framer_motion__WEBPACK_IMPORTED_MODULE_13__ = __webpack_require__(/*! framer-motion */ \"(ssr)/./node_modules/framer-motion/dist/es/render/components/motion/proxy.mjs\");\n/* harmony import */ var _barrel_optimize_names_DollarSign_RefreshCw_Target_TrendingUp_Users_lucide_react__WEBPACK_IMPORTED_MODULE_8__ = __webpack_require__(/*! __barrel_optimize__?names=DollarSign,RefreshCw,Target,TrendingUp,Users!=!lucide-react */ \"(ssr)/./node_modules/lucide-react/dist/esm/icons/refresh-cw.js\");\n/* harmony import */ var _barrel_optimize_names_DollarSign_RefreshCw_Target_TrendingUp_Users_lucide_react__WEBPACK_IMPORTED_MODULE_9__ = __webpack_require__(/*! __barrel_optimize__?names=DollarSign,RefreshCw,Target,TrendingUp,Users!=!lucide-react */ \"(ssr)/./node_modules/lucide-react/dist/esm/icons/dollar-sign.js\");\n/* harmony import */ var _barrel_optimize_names_DollarSign_RefreshCw_Target_TrendingUp_Users_lucide_react__WEBPACK_IMPORTED_MODULE_10__ = __webpack_require__(/*! __barrel_optimize__?names=DollarSign,RefreshCw,Target,TrendingUp,Users!=!lucide-react */ \"(ssr)/./node_modules/lucide-react/dist/esm/icons/users.js\");\n/* harmony import */ var _barrel_optimize_names_DollarSign_RefreshCw_Target_TrendingUp_Users_lucide_react__WEBPACK_IMPORTED_MODULE_11__ = __webpack_require__(/*! __barrel_optimize__?names=DollarSign,RefreshCw,Target,TrendingUp,Users!=!lucide-react */ \"(ssr)/./node_modules/lucide-react/dist/esm/icons/target.js\");\n/* harmony import */ var _barrel_optimize_names_DollarSign_RefreshCw_Target_TrendingUp_Users_lucide_react__WEBPACK_IMPORTED_MODULE_12__ = __webpack_require__(/*! __barrel_optimize__?names=DollarSign,RefreshCw,Target,TrendingUp,Users!=!lucide-react */ \"(ssr)/./node_modules/lucide-react/dist/esm/icons/trending-up.js\");\n/* harmony import */ var _MetricCard__WEBPACK_IMPORTED_MODULE_2__ = __webpack_require__(/*! ./MetricCard */ \"(ssr)/./components/MetricCard.tsx\");\n/* harmony import */ var _Charts__WEBPACK_IMPORTED_MODULE_3__ = __webpack_require__(/*! ./Charts */ \"(ssr)/./components/Charts.tsx\");\n/* harmony import */ var _DataTable__WEBPACK_IMPORTED_MODULE_4__ = __webpack_require__(/*! ./DataTable */ \"(ssr)/./components/DataTable.tsx\");\n/* harmony import */ var _LoadingSkeleton__WEBPACK_IMPORTED_MODULE_5__ = __webpack_require__(/*! ./LoadingSkeleton */ \"(ssr)/./components/LoadingSkeleton.tsx\");\n/* harmony import */ var _data_mockData__WEBPACK_IMPORTED_MODULE_6__ = __webpack_require__(/*! @/data/mockData */ \"(ssr)/./data/mockData.ts\");\n/* harmony import */ var _lib_utils__WEBPACK_IMPORTED_MODULE_7__ = __webpack_require__(/*! @/lib/utils */ \"(ssr)/./lib/utils.ts\");\n/* __next_internal_client_entry_do_not_use__ Dashboard auto */ \n\n\n\n\n\n\n\n\n\nfunction Dashboard() {\n    const [isLoading, setIsLoading] = (0,react__WEBPACK_IMPORTED_MODULE_1__.useState)(true);\n    const [isRealTimeEnabled, setIsRealTimeEnabled] = (0,react__WEBPACK_IMPORTED_MODULE_1__.useState)(false);\n    const [lastUpdated, setLastUpdated] = (0,react__WEBPACK_IMPORTED_MODULE_1__.useState)(new Date());\n    // Simulate loading\n    (0,react__WEBPACK_IMPORTED_MODULE_1__.useEffect)(()=>{\n        const timer = setTimeout(()=>{\n            setIsLoading(false);\n        }, 1500);\n        return ()=>clearTimeout(timer);\n    }, []);\n    // Real-time updates simulation\n    (0,react__WEBPACK_IMPORTED_MODULE_1__.useEffect)(()=>{\n        if (!isRealTimeEnabled) return;\n        const interval = setInterval(()=>{\n            setLastUpdated(new Date());\n        // In a real app, you would fetch new data here\n        }, 5000);\n        return ()=>clearInterval(interval);\n    }, [\n        isRealTimeEnabled\n    ]);\n    // Calculate growth percentages (simulated)\n    const growthMetrics = {\n        revenue: (0,_lib_utils__WEBPACK_IMPORTED_MODULE_7__.calculateGrowth)(_data_mockData__WEBPACK_IMPORTED_MODULE_6__.summaryMetrics.totalRevenue, _data_mockData__WEBPACK_IMPORTED_MODULE_6__.summaryMetrics.totalRevenue * 0.9),\n        users: (0,_lib_utils__WEBPACK_IMPORTED_MODULE_7__.calculateGrowth)(_data_mockData__WEBPACK_IMPORTED_MODULE_6__.summaryMetrics.totalUsers, _data_mockData__WEBPACK_IMPORTED_MODULE_6__.summaryMetrics.totalUsers * 0.85),\n        conversions: (0,_lib_utils__WEBPACK_IMPORTED_MODULE_7__.calculateGrowth)(_data_mockData__WEBPACK_IMPORTED_MODULE_6__.summaryMetrics.totalConversions, _data_mockData__WEBPACK_IMPORTED_MODULE_6__.summaryMetrics.totalConversions * 0.95),\n        conversionRate: (0,_lib_utils__WEBPACK_IMPORTED_MODULE_7__.calculateGrowth)(_data_mockData__WEBPACK_IMPORTED_MODULE_6__.summaryMetrics.conversionRate, _data_mockData__WEBPACK_IMPORTED_MODULE_6__.summaryMetrics.conversionRate * 0.88)\n    };\n    if (isLoading) {\n        return /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n            className: \"space-y-6\",\n            children: [\n                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                    className: \"grid grid-cols-1 sm:grid-cols-2 lg:grid-cols-4 gap-6\",\n                    children: Array.from({\n                        length: 4\n                    }).map((_, i)=>/*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_LoadingSkeleton__WEBPACK_IMPORTED_MODULE_5__.CardSkeleton, {}, i, false, {\n                            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Dashboard.tsx\",\n                            lineNumber: 59,\n                            columnNumber: 13\n                        }, this))\n                }, void 0, false, {\n                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Dashboard.tsx\",\n                    lineNumber: 57,\n                    columnNumber: 9\n                }, this),\n                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                    className: \"grid grid-cols-1 lg:grid-cols-2 gap-6\",\n                    children: Array.from({\n                        length: 4\n                    }).map((_, i)=>/*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_LoadingSkeleton__WEBPACK_IMPORTED_MODULE_5__.ChartSkeleton, {}, i, false, {\n                            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Dashboard.tsx\",\n                            lineNumber: 66,\n                            columnNumber: 13\n                        }, this))\n                }, void 0, false, {\n                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Dashboard.tsx\",\n                    lineNumber: 64,\n                    columnNumber: 9\n                }, this)\n            ]\n        }, void 0, true, {\n            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Dashboard.tsx\",\n            lineNumber: 55,\n            columnNumber: 7\n        }, this);\n    }\n    return /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n        className: \"space-y-6\",\n        children: [\n            /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                className: \"flex justify-between items-center\",\n                children: [\n                    /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"h2\", {\n                        className: \"text-3xl font-bold text-gray-900 dark:text-white\",\n                        children: \"Dashboard Overview\"\n                    }, void 0, false, {\n                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Dashboard.tsx\",\n                        lineNumber: 77,\n                        columnNumber: 9\n                    }, this),\n                    /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                        className: \"flex items-center space-x-4\",\n                        children: [\n                            /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                                className: \"flex items-center space-x-2\",\n                                children: [\n                                    /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"label\", {\n                                        className: \"text-sm font-medium text-gray-700 dark:text-gray-300\",\n                                        children: \"Real-time Updates\"\n                                    }, void 0, false, {\n                                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Dashboard.tsx\",\n                                        lineNumber: 82,\n                                        columnNumber: 13\n                                    }, this),\n                                    /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"button\", {\n                                        onClick: ()=>setIsRealTimeEnabled(!isRealTimeEnabled),\n                                        className: `relative inline-flex h-6 w-11 items-center rounded-full transition-colors ${isRealTimeEnabled ? \"bg-blue-600\" : \"bg-gray-200 dark:bg-gray-700\"}`,\n                                        children: /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"span\", {\n                                            className: `inline-block h-4 w-4 transform rounded-full bg-white transition-transform ${isRealTimeEnabled ? \"translate-x-6\" : \"translate-x-1\"}`\n                                        }, void 0, false, {\n                                            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Dashboard.tsx\",\n                                            lineNumber: 91,\n                                            columnNumber: 15\n                                        }, this)\n                                    }, void 0, false, {\n                                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Dashboard.tsx\",\n                                        lineNumber: 85,\n                                        columnNumber: 13\n                                    }, this)\n                                ]\n                            }, void 0, true, {\n                                fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Dashboard.tsx\",\n                                lineNumber: 81,\n                                columnNumber: 11\n                            }, this),\n                            isRealTimeEnabled && /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                                className: \"flex items-center space-x-2 text-sm text-green-600 dark:text-green-400\",\n                                children: [\n                                    /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_DollarSign_RefreshCw_Target_TrendingUp_Users_lucide_react__WEBPACK_IMPORTED_MODULE_8__[\"default\"], {\n                                        className: \"w-4 h-4 animate-spin\"\n                                    }, void 0, false, {\n                                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Dashboard.tsx\",\n                                        lineNumber: 100,\n                                        columnNumber: 15\n                                    }, this),\n                                    /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"span\", {\n                                        children: \"Live\"\n                                    }, void 0, false, {\n                                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Dashboard.tsx\",\n                                        lineNumber: 101,\n                                        columnNumber: 15\n                                    }, this)\n                                ]\n                            }, void 0, true, {\n                                fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Dashboard.tsx\",\n                                lineNumber: 99,\n                                columnNumber: 13\n                            }, this)\n                        ]\n                    }, void 0, true, {\n                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Dashboard.tsx\",\n                        lineNumber: 80,\n                        columnNumber: 9\n                    }, this)\n                ]\n            }, void 0, true, {\n                fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Dashboard.tsx\",\n                lineNumber: 76,\n                columnNumber: 7\n            }, this),\n            /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                className: \"grid grid-cols-1 sm:grid-cols-2 lg:grid-cols-4 gap-6\",\n                children: [\n                    /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_MetricCard__WEBPACK_IMPORTED_MODULE_2__.MetricCard, {\n                        title: \"Total Revenue\",\n                        value: (0,_lib_utils__WEBPACK_IMPORTED_MODULE_7__.formatCurrency)(_data_mockData__WEBPACK_IMPORTED_MODULE_6__.summaryMetrics.totalRevenue),\n                        change: growthMetrics.revenue,\n                        icon: /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_DollarSign_RefreshCw_Target_TrendingUp_Users_lucide_react__WEBPACK_IMPORTED_MODULE_9__[\"default\"], {\n                            className: \"w-6 h-6\"\n                        }, void 0, false, {\n                            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Dashboard.tsx\",\n                            lineNumber: 113,\n                            columnNumber: 17\n                        }, void 0)\n                    }, void 0, false, {\n                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Dashboard.tsx\",\n                        lineNumber: 109,\n                        columnNumber: 9\n                    }, this),\n                    /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_MetricCard__WEBPACK_IMPORTED_MODULE_2__.MetricCard, {\n                        title: \"Total Users\",\n                        value: (0,_lib_utils__WEBPACK_IMPORTED_MODULE_7__.formatNumber)(_data_mockData__WEBPACK_IMPORTED_MODULE_6__.summaryMetrics.totalUsers),\n                        change: growthMetrics.users,\n                        icon: /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_DollarSign_RefreshCw_Target_TrendingUp_Users_lucide_react__WEBPACK_IMPORTED_MODULE_10__[\"default\"], {\n                            className: \"w-6 h-6\"\n                        }, void 0, false, {\n                            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Dashboard.tsx\",\n                            lineNumber: 119,\n                            columnNumber: 17\n                        }, void 0)\n                    }, void 0, false, {\n                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Dashboard.tsx\",\n                        lineNumber: 115,\n                        columnNumber: 9\n                    }, this),\n                    /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_MetricCard__WEBPACK_IMPORTED_MODULE_2__.MetricCard, {\n                        title: \"Conversions\",\n                        value: (0,_lib_utils__WEBPACK_IMPORTED_MODULE_7__.formatNumber)(_data_mockData__WEBPACK_IMPORTED_MODULE_6__.summaryMetrics.totalConversions),\n                        change: growthMetrics.conversions,\n                        icon: /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_DollarSign_RefreshCw_Target_TrendingUp_Users_lucide_react__WEBPACK_IMPORTED_MODULE_11__[\"default\"], {\n                            className: \"w-6 h-6\"\n                        }, void 0, false, {\n                            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Dashboard.tsx\",\n                            lineNumber: 125,\n                            columnNumber: 17\n                        }, void 0)\n                    }, void 0, false, {\n                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Dashboard.tsx\",\n                        lineNumber: 121,\n                        columnNumber: 9\n                    }, this),\n                    /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_MetricCard__WEBPACK_IMPORTED_MODULE_2__.MetricCard, {\n                        title: \"Conversion Rate\",\n                        value: (0,_lib_utils__WEBPACK_IMPORTED_MODULE_7__.formatPercentage)(_data_mockData__WEBPACK_IMPORTED_MODULE_6__.summaryMetrics.conversionRate),\n                        change: growthMetrics.conversionRate,\n                        icon: /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_DollarSign_RefreshCw_Target_TrendingUp_Users_lucide_react__WEBPACK_IMPORTED_MODULE_12__[\"default\"], {\n                            className: \"w-6 h-6\"\n                        }, void 0, false, {\n                            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Dashboard.tsx\",\n                            lineNumber: 131,\n                            columnNumber: 17\n                        }, void 0)\n                    }, void 0, false, {\n                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Dashboard.tsx\",\n                        lineNumber: 127,\n                        columnNumber: 9\n                    }, this)\n                ]\n            }, void 0, true, {\n                fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Dashboard.tsx\",\n                lineNumber: 108,\n                columnNumber: 7\n            }, this),\n            /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_Charts__WEBPACK_IMPORTED_MODULE_3__.Charts, {\n                data: _data_mockData__WEBPACK_IMPORTED_MODULE_6__.mockData,\n                campaignData: _data_mockData__WEBPACK_IMPORTED_MODULE_6__.campaignData\n            }, void 0, false, {\n                fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Dashboard.tsx\",\n                lineNumber: 136,\n                columnNumber: 7\n            }, this),\n            /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_DataTable__WEBPACK_IMPORTED_MODULE_4__.DataTable, {\n                data: _data_mockData__WEBPACK_IMPORTED_MODULE_6__.campaignData\n            }, void 0, false, {\n                fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Dashboard.tsx\",\n                lineNumber: 139,\n                columnNumber: 7\n            }, this),\n            /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(framer_motion__WEBPACK_IMPORTED_MODULE_13__.motion.div, {\n                initial: {\n                    opacity: 0\n                },\n                animate: {\n                    opacity: 1\n                },\n                transition: {\n                    delay: 0.8\n                },\n                className: \"text-center text-sm text-gray-500 dark:text-gray-400 mt-8\",\n                children: [\n                    \"Last updated: \",\n                    lastUpdated.toLocaleString(),\n                    \" | Data refreshes every \",\n                    isRealTimeEnabled ? \"5 seconds\" : \"manual refresh\"\n                ]\n            }, void 0, true, {\n                fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Dashboard.tsx\",\n                lineNumber: 142,\n                columnNumber: 7\n            }, this)\n        ]\n    }, void 0, true, {\n        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Dashboard.tsx\",\n        lineNumber: 74,\n        columnNumber: 5\n    }, this);\n}\n//# sourceURL=[module]\n//# sourceMappingURL=data:application/json;charset=utf-8;base64,eyJ2ZXJzaW9uIjozLCJmaWxlIjoiKHNzcikvLi9jb21wb25lbnRzL0Rhc2hib2FyZC50c3giLCJtYXBwaW5ncyI6Ijs7Ozs7Ozs7Ozs7Ozs7Ozs7Ozs7O0FBRTRDO0FBQ0w7QUFPakI7QUFDb0I7QUFDUjtBQUNNO0FBQ3dCO0FBQ1M7QUFDcUI7QUFFdkYsU0FBU29CO0lBQ2QsTUFBTSxDQUFDQyxXQUFXQyxhQUFhLEdBQUd0QiwrQ0FBUUEsQ0FBQztJQUMzQyxNQUFNLENBQUN1QixtQkFBbUJDLHFCQUFxQixHQUFHeEIsK0NBQVFBLENBQUM7SUFDM0QsTUFBTSxDQUFDeUIsYUFBYUMsZUFBZSxHQUFHMUIsK0NBQVFBLENBQUMsSUFBSTJCO0lBRW5ELG1CQUFtQjtJQUNuQjFCLGdEQUFTQSxDQUFDO1FBQ1IsTUFBTTJCLFFBQVFDLFdBQVc7WUFDdkJQLGFBQWE7UUFDZixHQUFHO1FBRUgsT0FBTyxJQUFNUSxhQUFhRjtJQUM1QixHQUFHLEVBQUU7SUFFTCwrQkFBK0I7SUFDL0IzQixnREFBU0EsQ0FBQztRQUNSLElBQUksQ0FBQ3NCLG1CQUFtQjtRQUV4QixNQUFNUSxXQUFXQyxZQUFZO1lBQzNCTixlQUFlLElBQUlDO1FBQ25CLCtDQUErQztRQUNqRCxHQUFHO1FBRUgsT0FBTyxJQUFNTSxjQUFjRjtJQUM3QixHQUFHO1FBQUNSO0tBQWtCO0lBRXRCLDJDQUEyQztJQUMzQyxNQUFNVyxnQkFBZ0I7UUFDcEJDLFNBQVNoQiwyREFBZUEsQ0FBQ0osMERBQWNBLENBQUNxQixZQUFZLEVBQUVyQiwwREFBY0EsQ0FBQ3FCLFlBQVksR0FBRztRQUNwRkMsT0FBT2xCLDJEQUFlQSxDQUFDSiwwREFBY0EsQ0FBQ3VCLFVBQVUsRUFBRXZCLDBEQUFjQSxDQUFDdUIsVUFBVSxHQUFHO1FBQzlFQyxhQUFhcEIsMkRBQWVBLENBQUNKLDBEQUFjQSxDQUFDeUIsZ0JBQWdCLEVBQUV6QiwwREFBY0EsQ0FBQ3lCLGdCQUFnQixHQUFHO1FBQ2hHQyxnQkFBZ0J0QiwyREFBZUEsQ0FBQ0osMERBQWNBLENBQUMwQixjQUFjLEVBQUUxQiwwREFBY0EsQ0FBQzBCLGNBQWMsR0FBRztJQUNqRztJQUVBLElBQUlwQixXQUFXO1FBQ2IscUJBQ0UsOERBQUNxQjtZQUFJQyxXQUFVOzs4QkFFYiw4REFBQ0Q7b0JBQUlDLFdBQVU7OEJBQ1pDLE1BQU1DLElBQUksQ0FBQzt3QkFBRUMsUUFBUTtvQkFBRSxHQUFHQyxHQUFHLENBQUMsQ0FBQ0MsR0FBR0Msa0JBQ2pDLDhEQUFDdEMsMERBQVlBLE1BQU1zQzs7Ozs7Ozs7Ozs4QkFLdkIsOERBQUNQO29CQUFJQyxXQUFVOzhCQUNaQyxNQUFNQyxJQUFJLENBQUM7d0JBQUVDLFFBQVE7b0JBQUUsR0FBR0MsR0FBRyxDQUFDLENBQUNDLEdBQUdDLGtCQUNqQyw4REFBQ3JDLDJEQUFhQSxNQUFNcUM7Ozs7Ozs7Ozs7Ozs7Ozs7SUFLOUI7SUFFQSxxQkFDRSw4REFBQ1A7UUFBSUMsV0FBVTs7MEJBRWIsOERBQUNEO2dCQUFJQyxXQUFVOztrQ0FDYiw4REFBQ087d0JBQUdQLFdBQVU7a0NBQW1EOzs7Ozs7a0NBR2pFLDhEQUFDRDt3QkFBSUMsV0FBVTs7MENBQ2IsOERBQUNEO2dDQUFJQyxXQUFVOztrREFDYiw4REFBQ1E7d0NBQU1SLFdBQVU7a0RBQXVEOzs7Ozs7a0RBR3hFLDhEQUFDUzt3Q0FDQ0MsU0FBUyxJQUFNN0IscUJBQXFCLENBQUNEO3dDQUNyQ29CLFdBQVcsQ0FBQywwRUFBMEUsRUFDcEZwQixvQkFBb0IsZ0JBQWdCLCtCQUNyQyxDQUFDO2tEQUVGLDRFQUFDK0I7NENBQ0NYLFdBQVcsQ0FBQywwRUFBMEUsRUFDcEZwQixvQkFBb0Isa0JBQWtCLGdCQUN2QyxDQUFDOzs7Ozs7Ozs7Ozs7Ozs7Ozs0QkFJUEEsbUNBQ0MsOERBQUNtQjtnQ0FBSUMsV0FBVTs7a0RBQ2IsOERBQUNwQyx3SEFBU0E7d0NBQUNvQyxXQUFVOzs7Ozs7a0RBQ3JCLDhEQUFDVztrREFBSzs7Ozs7Ozs7Ozs7Ozs7Ozs7Ozs7Ozs7OzBCQU9kLDhEQUFDWjtnQkFBSUMsV0FBVTs7a0NBQ2IsOERBQUNuQyxtREFBVUE7d0JBQ1QrQyxPQUFNO3dCQUNOQyxPQUFPeEMsMERBQWNBLENBQUNELDBEQUFjQSxDQUFDcUIsWUFBWTt3QkFDakRxQixRQUFRdkIsY0FBY0MsT0FBTzt3QkFDN0J1QixvQkFBTSw4REFBQ3ZELHdIQUFVQTs0QkFBQ3dDLFdBQVU7Ozs7Ozs7Ozs7O2tDQUU5Qiw4REFBQ25DLG1EQUFVQTt3QkFDVCtDLE9BQU07d0JBQ05DLE9BQU92Qyx3REFBWUEsQ0FBQ0YsMERBQWNBLENBQUN1QixVQUFVO3dCQUM3Q21CLFFBQVF2QixjQUFjRyxLQUFLO3dCQUMzQnFCLG9CQUFNLDhEQUFDdEQseUhBQUtBOzRCQUFDdUMsV0FBVTs7Ozs7Ozs7Ozs7a0NBRXpCLDhEQUFDbkMsbURBQVVBO3dCQUNUK0MsT0FBTTt3QkFDTkMsT0FBT3ZDLHdEQUFZQSxDQUFDRiwwREFBY0EsQ0FBQ3lCLGdCQUFnQjt3QkFDbkRpQixRQUFRdkIsY0FBY0ssV0FBVzt3QkFDakNtQixvQkFBTSw4REFBQ3JELHlIQUFNQTs0QkFBQ3NDLFdBQVU7Ozs7Ozs7Ozs7O2tDQUUxQiw4REFBQ25DLG1EQUFVQTt3QkFDVCtDLE9BQU07d0JBQ05DLE9BQU90Qyw0REFBZ0JBLENBQUNILDBEQUFjQSxDQUFDMEIsY0FBYzt3QkFDckRnQixRQUFRdkIsY0FBY08sY0FBYzt3QkFDcENpQixvQkFBTSw4REFBQ3BELHlIQUFVQTs0QkFBQ3FDLFdBQVU7Ozs7Ozs7Ozs7Ozs7Ozs7OzBCQUtoQyw4REFBQ2xDLDJDQUFNQTtnQkFBQ2tELE1BQU05QyxvREFBUUE7Z0JBQUVDLGNBQWNBLHdEQUFZQTs7Ozs7OzBCQUdsRCw4REFBQ0osaURBQVNBO2dCQUFDaUQsTUFBTTdDLHdEQUFZQTs7Ozs7OzBCQUc3Qiw4REFBQ1osa0RBQU1BLENBQUN3QyxHQUFHO2dCQUNUa0IsU0FBUztvQkFBRUMsU0FBUztnQkFBRTtnQkFDdEJDLFNBQVM7b0JBQUVELFNBQVM7Z0JBQUU7Z0JBQ3RCRSxZQUFZO29CQUFFQyxPQUFPO2dCQUFJO2dCQUN6QnJCLFdBQVU7O29CQUNYO29CQUNnQmxCLFlBQVl3QyxjQUFjO29CQUFHO29CQUN0QjFDLG9CQUFvQixjQUFjOzs7Ozs7Ozs7Ozs7O0FBSWhFIiwic291cmNlcyI6WyJ3ZWJwYWNrOi8vYWRteWJyYW5kLWluc2lnaHRzLy4vY29tcG9uZW50cy9EYXNoYm9hcmQudHN4PzY5ZWYiXSwic291cmNlc0NvbnRlbnQiOlsiJ3VzZSBjbGllbnQnO1xuXG5pbXBvcnQgeyB1c2VTdGF0ZSwgdXNlRWZmZWN0IH0gZnJvbSAncmVhY3QnO1xuaW1wb3J0IHsgbW90aW9uIH0gZnJvbSAnZnJhbWVyLW1vdGlvbic7XG5pbXBvcnQgeyBcbiAgRG9sbGFyU2lnbiwgXG4gIFVzZXJzLCBcbiAgVGFyZ2V0LCBcbiAgVHJlbmRpbmdVcCxcbiAgUmVmcmVzaEN3IFxufSBmcm9tICdsdWNpZGUtcmVhY3QnO1xuaW1wb3J0IHsgTWV0cmljQ2FyZCB9IGZyb20gJy4vTWV0cmljQ2FyZCc7XG5pbXBvcnQgeyBDaGFydHMgfSBmcm9tICcuL0NoYXJ0cyc7XG5pbXBvcnQgeyBEYXRhVGFibGUgfSBmcm9tICcuL0RhdGFUYWJsZSc7XG5pbXBvcnQgeyBDYXJkU2tlbGV0b24sIENoYXJ0U2tlbGV0b24gfSBmcm9tICcuL0xvYWRpbmdTa2VsZXRvbic7XG5pbXBvcnQgeyBtb2NrRGF0YSwgY2FtcGFpZ25EYXRhLCBzdW1tYXJ5TWV0cmljcyB9IGZyb20gJ0AvZGF0YS9tb2NrRGF0YSc7XG5pbXBvcnQgeyBmb3JtYXRDdXJyZW5jeSwgZm9ybWF0TnVtYmVyLCBmb3JtYXRQZXJjZW50YWdlLCBjYWxjdWxhdGVHcm93dGggfSBmcm9tICdAL2xpYi91dGlscyc7XG5cbmV4cG9ydCBmdW5jdGlvbiBEYXNoYm9hcmQoKSB7XG4gIGNvbnN0IFtpc0xvYWRpbmcsIHNldElzTG9hZGluZ10gPSB1c2VTdGF0ZSh0cnVlKTtcbiAgY29uc3QgW2lzUmVhbFRpbWVFbmFibGVkLCBzZXRJc1JlYWxUaW1lRW5hYmxlZF0gPSB1c2VTdGF0ZShmYWxzZSk7XG4gIGNvbnN0IFtsYXN0VXBkYXRlZCwgc2V0TGFzdFVwZGF0ZWRdID0gdXNlU3RhdGUobmV3IERhdGUoKSk7XG5cbiAgLy8gU2ltdWxhdGUgbG9hZGluZ1xuICB1c2VFZmZlY3QoKCkgPT4ge1xuICAgIGNvbnN0IHRpbWVyID0gc2V0VGltZW91dCgoKSA9PiB7XG4gICAgICBzZXRJc0xvYWRpbmcoZmFsc2UpO1xuICAgIH0sIDE1MDApO1xuXG4gICAgcmV0dXJuICgpID0+IGNsZWFyVGltZW91dCh0aW1lcik7XG4gIH0sIFtdKTtcblxuICAvLyBSZWFsLXRpbWUgdXBkYXRlcyBzaW11bGF0aW9uXG4gIHVzZUVmZmVjdCgoKSA9PiB7XG4gICAgaWYgKCFpc1JlYWxUaW1lRW5hYmxlZCkgcmV0dXJuO1xuXG4gICAgY29uc3QgaW50ZXJ2YWwgPSBzZXRJbnRlcnZhbCgoKSA9PiB7XG4gICAgICBzZXRMYXN0VXBkYXRlZChuZXcgRGF0ZSgpKTtcbiAgICAgIC8vIEluIGEgcmVhbCBhcHAsIHlvdSB3b3VsZCBmZXRjaCBuZXcgZGF0YSBoZXJlXG4gICAgfSwgNTAwMCk7XG5cbiAgICByZXR1cm4gKCkgPT4gY2xlYXJJbnRlcnZhbChpbnRlcnZhbCk7XG4gIH0sIFtpc1JlYWxUaW1lRW5hYmxlZF0pO1xuXG4gIC8vIENhbGN1bGF0ZSBncm93dGggcGVyY2VudGFnZXMgKHNpbXVsYXRlZClcbiAgY29uc3QgZ3Jvd3RoTWV0cmljcyA9IHtcbiAgICByZXZlbnVlOiBjYWxjdWxhdGVHcm93dGgoc3VtbWFyeU1ldHJpY3MudG90YWxSZXZlbnVlLCBzdW1tYXJ5TWV0cmljcy50b3RhbFJldmVudWUgKiAwLjkpLFxuICAgIHVzZXJzOiBjYWxjdWxhdGVHcm93dGgoc3VtbWFyeU1ldHJpY3MudG90YWxVc2Vycywgc3VtbWFyeU1ldHJpY3MudG90YWxVc2VycyAqIDAuODUpLFxuICAgIGNvbnZlcnNpb25zOiBjYWxjdWxhdGVHcm93dGgoc3VtbWFyeU1ldHJpY3MudG90YWxDb252ZXJzaW9ucywgc3VtbWFyeU1ldHJpY3MudG90YWxDb252ZXJzaW9ucyAqIDAuOTUpLFxuICAgIGNvbnZlcnNpb25SYXRlOiBjYWxjdWxhdGVHcm93dGgoc3VtbWFyeU1ldHJpY3MuY29udmVyc2lvblJhdGUsIHN1bW1hcnlNZXRyaWNzLmNvbnZlcnNpb25SYXRlICogMC44OCksXG4gIH07XG5cbiAgaWYgKGlzTG9hZGluZykge1xuICAgIHJldHVybiAoXG4gICAgICA8ZGl2IGNsYXNzTmFtZT1cInNwYWNlLXktNlwiPlxuICAgICAgICB7LyogU2tlbGV0b24gZm9yIG1ldHJpYyBjYXJkcyAqL31cbiAgICAgICAgPGRpdiBjbGFzc05hbWU9XCJncmlkIGdyaWQtY29scy0xIHNtOmdyaWQtY29scy0yIGxnOmdyaWQtY29scy00IGdhcC02XCI+XG4gICAgICAgICAge0FycmF5LmZyb20oeyBsZW5ndGg6IDQgfSkubWFwKChfLCBpKSA9PiAoXG4gICAgICAgICAgICA8Q2FyZFNrZWxldG9uIGtleT17aX0gLz5cbiAgICAgICAgICApKX1cbiAgICAgICAgPC9kaXY+XG5cbiAgICAgICAgey8qIFNrZWxldG9uIGZvciBjaGFydHMgKi99XG4gICAgICAgIDxkaXYgY2xhc3NOYW1lPVwiZ3JpZCBncmlkLWNvbHMtMSBsZzpncmlkLWNvbHMtMiBnYXAtNlwiPlxuICAgICAgICAgIHtBcnJheS5mcm9tKHsgbGVuZ3RoOiA0IH0pLm1hcCgoXywgaSkgPT4gKFxuICAgICAgICAgICAgPENoYXJ0U2tlbGV0b24ga2V5PXtpfSAvPlxuICAgICAgICAgICkpfVxuICAgICAgICA8L2Rpdj5cbiAgICAgIDwvZGl2PlxuICAgICk7XG4gIH1cblxuICByZXR1cm4gKFxuICAgIDxkaXYgY2xhc3NOYW1lPVwic3BhY2UteS02XCI+XG4gICAgICB7LyogUmVhbC10aW1lIHRvZ2dsZSAqL31cbiAgICAgIDxkaXYgY2xhc3NOYW1lPVwiZmxleCBqdXN0aWZ5LWJldHdlZW4gaXRlbXMtY2VudGVyXCI+XG4gICAgICAgIDxoMiBjbGFzc05hbWU9XCJ0ZXh0LTN4bCBmb250LWJvbGQgdGV4dC1ncmF5LTkwMCBkYXJrOnRleHQtd2hpdGVcIj5cbiAgICAgICAgICBEYXNoYm9hcmQgT3ZlcnZpZXdcbiAgICAgICAgPC9oMj5cbiAgICAgICAgPGRpdiBjbGFzc05hbWU9XCJmbGV4IGl0ZW1zLWNlbnRlciBzcGFjZS14LTRcIj5cbiAgICAgICAgICA8ZGl2IGNsYXNzTmFtZT1cImZsZXggaXRlbXMtY2VudGVyIHNwYWNlLXgtMlwiPlxuICAgICAgICAgICAgPGxhYmVsIGNsYXNzTmFtZT1cInRleHQtc20gZm9udC1tZWRpdW0gdGV4dC1ncmF5LTcwMCBkYXJrOnRleHQtZ3JheS0zMDBcIj5cbiAgICAgICAgICAgICAgUmVhbC10aW1lIFVwZGF0ZXNcbiAgICAgICAgICAgIDwvbGFiZWw+XG4gICAgICAgICAgICA8YnV0dG9uXG4gICAgICAgICAgICAgIG9uQ2xpY2s9eygpID0+IHNldElzUmVhbFRpbWVFbmFibGVkKCFpc1JlYWxUaW1lRW5hYmxlZCl9XG4gICAgICAgICAgICAgIGNsYXNzTmFtZT17YHJlbGF0aXZlIGlubGluZS1mbGV4IGgtNiB3LTExIGl0ZW1zLWNlbnRlciByb3VuZGVkLWZ1bGwgdHJhbnNpdGlvbi1jb2xvcnMgJHtcbiAgICAgICAgICAgICAgICBpc1JlYWxUaW1lRW5hYmxlZCA/ICdiZy1ibHVlLTYwMCcgOiAnYmctZ3JheS0yMDAgZGFyazpiZy1ncmF5LTcwMCdcbiAgICAgICAgICAgICAgfWB9XG4gICAgICAgICAgICA+XG4gICAgICAgICAgICAgIDxzcGFuXG4gICAgICAgICAgICAgICAgY2xhc3NOYW1lPXtgaW5saW5lLWJsb2NrIGgtNCB3LTQgdHJhbnNmb3JtIHJvdW5kZWQtZnVsbCBiZy13aGl0ZSB0cmFuc2l0aW9uLXRyYW5zZm9ybSAke1xuICAgICAgICAgICAgICAgICAgaXNSZWFsVGltZUVuYWJsZWQgPyAndHJhbnNsYXRlLXgtNicgOiAndHJhbnNsYXRlLXgtMSdcbiAgICAgICAgICAgICAgICB9YH1cbiAgICAgICAgICAgICAgLz5cbiAgICAgICAgICAgIDwvYnV0dG9uPlxuICAgICAgICAgIDwvZGl2PlxuICAgICAgICAgIHtpc1JlYWxUaW1lRW5hYmxlZCAmJiAoXG4gICAgICAgICAgICA8ZGl2IGNsYXNzTmFtZT1cImZsZXggaXRlbXMtY2VudGVyIHNwYWNlLXgtMiB0ZXh0LXNtIHRleHQtZ3JlZW4tNjAwIGRhcms6dGV4dC1ncmVlbi00MDBcIj5cbiAgICAgICAgICAgICAgPFJlZnJlc2hDdyBjbGFzc05hbWU9XCJ3LTQgaC00IGFuaW1hdGUtc3BpblwiIC8+XG4gICAgICAgICAgICAgIDxzcGFuPkxpdmU8L3NwYW4+XG4gICAgICAgICAgICA8L2Rpdj5cbiAgICAgICAgICApfVxuICAgICAgICA8L2Rpdj5cbiAgICAgIDwvZGl2PlxuXG4gICAgICB7LyogTWV0cmljIENhcmRzICovfVxuICAgICAgPGRpdiBjbGFzc05hbWU9XCJncmlkIGdyaWQtY29scy0xIHNtOmdyaWQtY29scy0yIGxnOmdyaWQtY29scy00IGdhcC02XCI+XG4gICAgICAgIDxNZXRyaWNDYXJkXG4gICAgICAgICAgdGl0bGU9XCJUb3RhbCBSZXZlbnVlXCJcbiAgICAgICAgICB2YWx1ZT17Zm9ybWF0Q3VycmVuY3koc3VtbWFyeU1ldHJpY3MudG90YWxSZXZlbnVlKX1cbiAgICAgICAgICBjaGFuZ2U9e2dyb3d0aE1ldHJpY3MucmV2ZW51ZX1cbiAgICAgICAgICBpY29uPXs8RG9sbGFyU2lnbiBjbGFzc05hbWU9XCJ3LTYgaC02XCIgLz59XG4gICAgICAgIC8+XG4gICAgICAgIDxNZXRyaWNDYXJkXG4gICAgICAgICAgdGl0bGU9XCJUb3RhbCBVc2Vyc1wiXG4gICAgICAgICAgdmFsdWU9e2Zvcm1hdE51bWJlcihzdW1tYXJ5TWV0cmljcy50b3RhbFVzZXJzKX1cbiAgICAgICAgICBjaGFuZ2U9e2dyb3d0aE1ldHJpY3MudXNlcnN9XG4gICAgICAgICAgaWNvbj17PFVzZXJzIGNsYXNzTmFtZT1cInctNiBoLTZcIiAvPn1cbiAgICAgICAgLz5cbiAgICAgICAgPE1ldHJpY0NhcmRcbiAgICAgICAgICB0aXRsZT1cIkNvbnZlcnNpb25zXCJcbiAgICAgICAgICB2YWx1ZT17Zm9ybWF0TnVtYmVyKHN1bW1hcnlNZXRyaWNzLnRvdGFsQ29udmVyc2lvbnMpfVxuICAgICAgICAgIGNoYW5nZT17Z3Jvd3RoTWV0cmljcy5jb252ZXJzaW9uc31cbiAgICAgICAgICBpY29uPXs8VGFyZ2V0IGNsYXNzTmFtZT1cInctNiBoLTZcIiAvPn1cbiAgICAgICAgLz5cbiAgICAgICAgPE1ldHJpY0NhcmRcbiAgICAgICAgICB0aXRsZT1cIkNvbnZlcnNpb24gUmF0ZVwiXG4gICAgICAgICAgdmFsdWU9e2Zvcm1hdFBlcmNlbnRhZ2Uoc3VtbWFyeU1ldHJpY3MuY29udmVyc2lvblJhdGUpfVxuICAgICAgICAgIGNoYW5nZT17Z3Jvd3RoTWV0cmljcy5jb252ZXJzaW9uUmF0ZX1cbiAgICAgICAgICBpY29uPXs8VHJlbmRpbmdVcCBjbGFzc05hbWU9XCJ3LTYgaC02XCIgLz59XG4gICAgICAgIC8+XG4gICAgICA8L2Rpdj5cblxuICAgICAgey8qIENoYXJ0cyAqL31cbiAgICAgIDxDaGFydHMgZGF0YT17bW9ja0RhdGF9IGNhbXBhaWduRGF0YT17Y2FtcGFpZ25EYXRhfSAvPlxuXG4gICAgICB7LyogRGF0YSBUYWJsZSAqL31cbiAgICAgIDxEYXRhVGFibGUgZGF0YT17Y2FtcGFpZ25EYXRhfSAvPlxuXG4gICAgICB7LyogRm9vdGVyIGluZm8gKi99XG4gICAgICA8bW90aW9uLmRpdlxuICAgICAgICBpbml0aWFsPXt7IG9wYWNpdHk6IDAgfX1cbiAgICAgICAgYW5pbWF0ZT17eyBvcGFjaXR5OiAxIH19XG4gICAgICAgIHRyYW5zaXRpb249e3sgZGVsYXk6IDAuOCB9fVxuICAgICAgICBjbGFzc05hbWU9XCJ0ZXh0LWNlbnRlciB0ZXh0LXNtIHRleHQtZ3JheS01MDAgZGFyazp0ZXh0LWdyYXktNDAwIG10LThcIlxuICAgICAgPlxuICAgICAgICBMYXN0IHVwZGF0ZWQ6IHtsYXN0VXBkYXRlZC50b0xvY2FsZVN0cmluZygpfSB8IFxuICAgICAgICBEYXRhIHJlZnJlc2hlcyBldmVyeSB7aXNSZWFsVGltZUVuYWJsZWQgPyAnNSBzZWNvbmRzJyA6ICdtYW51YWwgcmVmcmVzaCd9XG4gICAgICA8L21vdGlvbi5kaXY+XG4gICAgPC9kaXY+XG4gICk7XG59XG4iXSwibmFtZXMiOlsidXNlU3RhdGUiLCJ1c2VFZmZlY3QiLCJtb3Rpb24iLCJEb2xsYXJTaWduIiwiVXNlcnMiLCJUYXJnZXQiLCJUcmVuZGluZ1VwIiwiUmVmcmVzaEN3IiwiTWV0cmljQ2FyZCIsIkNoYXJ0cyIsIkRhdGFUYWJsZSIsIkNhcmRTa2VsZXRvbiIsIkNoYXJ0U2tlbGV0b24iLCJtb2NrRGF0YSIsImNhbXBhaWduRGF0YSIsInN1bW1hcnlNZXRyaWNzIiwiZm9ybWF0Q3VycmVuY3kiLCJmb3JtYXROdW1iZXIiLCJmb3JtYXRQZXJjZW50YWdlIiwiY2FsY3VsYXRlR3Jvd3RoIiwiRGFzaGJvYXJkIiwiaXNMb2FkaW5nIiwic2V0SXNMb2FkaW5nIiwiaXNSZWFsVGltZUVuYWJsZWQiLCJzZXRJc1JlYWxUaW1lRW5hYmxlZCIsImxhc3RVcGRhdGVkIiwic2V0TGFzdFVwZGF0ZWQiLCJEYXRlIiwidGltZXIiLCJzZXRUaW1lb3V0IiwiY2xlYXJUaW1lb3V0IiwiaW50ZXJ2YWwiLCJzZXRJbnRlcnZhbCIsImNsZWFySW50ZXJ2YWwiLCJncm93dGhNZXRyaWNzIiwicmV2ZW51ZSIsInRvdGFsUmV2ZW51ZSIsInVzZXJzIiwidG90YWxVc2VycyIsImNvbnZlcnNpb25zIiwidG90YWxDb252ZXJzaW9ucyIsImNvbnZlcnNpb25SYXRlIiwiZGl2IiwiY2xhc3NOYW1lIiwiQXJyYXkiLCJmcm9tIiwibGVuZ3RoIiwibWFwIiwiXyIsImkiLCJoMiIsImxhYmVsIiwiYnV0dG9uIiwib25DbGljayIsInNwYW4iLCJ0aXRsZSIsInZhbHVlIiwiY2hhbmdlIiwiaWNvbiIsImRhdGEiLCJpbml0aWFsIiwib3BhY2l0eSIsImFuaW1hdGUiLCJ0cmFuc2l0aW9uIiwiZGVsYXkiLCJ0b0xvY2FsZVN0cmluZyJdLCJzb3VyY2VSb290IjoiIn0=\n//# sourceURL=webpack-internal:///(ssr)/./components/Dashboard.tsx\n");
-
-/***/ }),
-
-/***/ "(ssr)/./components/DataTable.tsx":
-/*!**********************************!*\
-  !*** ./components/DataTable.tsx ***!
-  \**********************************/
-/***/ ((__unused_webpack_module, __webpack_exports__, __webpack_require__) => {
-
-"use strict";
-eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   DataTable: () => (/* binding */ DataTable)\n/* harmony export */ });\n/* harmony import */ var react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! react/jsx-dev-runtime */ \"(ssr)/./node_modules/next/dist/server/future/route-modules/app-page/vendored/ssr/react-jsx-dev-runtime.js\");\n/* harmony import */ var react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0___default = /*#__PURE__*/__webpack_require__.n(react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__);\n/* harmony import */ var react__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! react */ \"(ssr)/./node_modules/next/dist/server/future/route-modules/app-page/vendored/ssr/react.js\");\n/* harmony import */ var react__WEBPACK_IMPORTED_MODULE_1___default = /*#__PURE__*/__webpack_require__.n(react__WEBPACK_IMPORTED_MODULE_1__);\n/* harmony import */ var framer_motion__WEBPACK_IMPORTED_MODULE_5__ = __webpack_require__(/*! framer-motion */ \"(ssr)/./node_modules/framer-motion/dist/es/render/components/motion/proxy.mjs\");\n/* harmony import */ var _barrel_optimize_names_ChevronDown_ChevronUp_Download_Filter_Search_X_lucide_react__WEBPACK_IMPORTED_MODULE_3__ = __webpack_require__(/*! __barrel_optimize__?names=ChevronDown,ChevronUp,Download,Filter,Search,X!=!lucide-react */ \"(ssr)/./node_modules/lucide-react/dist/esm/icons/chevron-up.js\");\n/* harmony import */ var _barrel_optimize_names_ChevronDown_ChevronUp_Download_Filter_Search_X_lucide_react__WEBPACK_IMPORTED_MODULE_4__ = __webpack_require__(/*! __barrel_optimize__?names=ChevronDown,ChevronUp,Download,Filter,Search,X!=!lucide-react */ \"(ssr)/./node_modules/lucide-react/dist/esm/icons/chevron-down.js\");\n/* harmony import */ var _barrel_optimize_names_ChevronDown_ChevronUp_Download_Filter_Search_X_lucide_react__WEBPACK_IMPORTED_MODULE_6__ = __webpack_require__(/*! __barrel_optimize__?names=ChevronDown,ChevronUp,Download,Filter,Search,X!=!lucide-react */ \"(ssr)/./node_modules/lucide-react/dist/esm/icons/filter.js\");\n/* harmony import */ var _barrel_optimize_names_ChevronDown_ChevronUp_Download_Filter_Search_X_lucide_react__WEBPACK_IMPORTED_MODULE_7__ = __webpack_require__(/*! __barrel_optimize__?names=ChevronDown,ChevronUp,Download,Filter,Search,X!=!lucide-react */ \"(ssr)/./node_modules/lucide-react/dist/esm/icons/download.js\");\n/* harmony import */ var _barrel_optimize_names_ChevronDown_ChevronUp_Download_Filter_Search_X_lucide_react__WEBPACK_IMPORTED_MODULE_8__ = __webpack_require__(/*! __barrel_optimize__?names=ChevronDown,ChevronUp,Download,Filter,Search,X!=!lucide-react */ \"(ssr)/./node_modules/lucide-react/dist/esm/icons/search.js\");\n/* harmony import */ var _barrel_optimize_names_ChevronDown_ChevronUp_Download_Filter_Search_X_lucide_react__WEBPACK_IMPORTED_MODULE_9__ = __webpack_require__(/*! __barrel_optimize__?names=ChevronDown,ChevronUp,Download,Filter,Search,X!=!lucide-react */ \"(ssr)/./node_modules/lucide-react/dist/esm/icons/x.js\");\n/* harmony import */ var _lib_utils__WEBPACK_IMPORTED_MODULE_2__ = __webpack_require__(/*! @/lib/utils */ \"(ssr)/./lib/utils.ts\");\n/* __next_internal_client_entry_do_not_use__ DataTable auto */ \n\n\n\n\nfunction DataTable({ data }) {\n    const [searchTerm, setSearchTerm] = (0,react__WEBPACK_IMPORTED_MODULE_1__.useState)(\"\");\n    const [sortField, setSortField] = (0,react__WEBPACK_IMPORTED_MODULE_1__.useState)(\"revenue\");\n    const [sortDirection, setSortDirection] = (0,react__WEBPACK_IMPORTED_MODULE_1__.useState)(\"desc\");\n    const [currentPage, setCurrentPage] = (0,react__WEBPACK_IMPORTED_MODULE_1__.useState)(1);\n    const [showFilters, setShowFilters] = (0,react__WEBPACK_IMPORTED_MODULE_1__.useState)(false);\n    const [minRevenue, setMinRevenue] = (0,react__WEBPACK_IMPORTED_MODULE_1__.useState)(\"\");\n    const [maxRevenue, setMaxRevenue] = (0,react__WEBPACK_IMPORTED_MODULE_1__.useState)(\"\");\n    const itemsPerPage = 10;\n    // Filter and sort data\n    const filteredAndSortedData = (0,react__WEBPACK_IMPORTED_MODULE_1__.useMemo)(()=>{\n        let filtered = data.filter((item)=>item.campaign.toLowerCase().includes(searchTerm.toLowerCase()));\n        // Apply revenue filters\n        if (minRevenue) {\n            filtered = filtered.filter((item)=>item.revenue >= parseInt(minRevenue));\n        }\n        if (maxRevenue) {\n            filtered = filtered.filter((item)=>item.revenue <= parseInt(maxRevenue));\n        }\n        // Sort data\n        return filtered.sort((a, b)=>{\n            const aValue = a[sortField];\n            const bValue = b[sortField];\n            if (typeof aValue === \"string\" && typeof bValue === \"string\") {\n                return sortDirection === \"asc\" ? aValue.localeCompare(bValue) : bValue.localeCompare(aValue);\n            }\n            return sortDirection === \"asc\" ? aValue - bValue : bValue - aValue;\n        });\n    }, [\n        data,\n        searchTerm,\n        sortField,\n        sortDirection,\n        minRevenue,\n        maxRevenue\n    ]);\n    // Pagination\n    const totalPages = Math.ceil(filteredAndSortedData.length / itemsPerPage);\n    const paginatedData = filteredAndSortedData.slice((currentPage - 1) * itemsPerPage, currentPage * itemsPerPage);\n    const handleSort = (field)=>{\n        if (field === sortField) {\n            setSortDirection(sortDirection === \"asc\" ? \"desc\" : \"asc\");\n        } else {\n            setSortField(field);\n            setSortDirection(\"desc\");\n        }\n    };\n    const handleExport = ()=>{\n        (0,_lib_utils__WEBPACK_IMPORTED_MODULE_2__.exportToCSV)(filteredAndSortedData, \"campaign-data.csv\");\n    };\n    const clearFilters = ()=>{\n        setSearchTerm(\"\");\n        setMinRevenue(\"\");\n        setMaxRevenue(\"\");\n        setCurrentPage(1);\n    };\n    const SortIcon = ({ field })=>{\n        if (sortField !== field) return null;\n        return sortDirection === \"asc\" ? /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_ChevronDown_ChevronUp_Download_Filter_Search_X_lucide_react__WEBPACK_IMPORTED_MODULE_3__[\"default\"], {\n            className: \"w-4 h-4\"\n        }, void 0, false, {\n            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n            lineNumber: 95,\n            columnNumber: 7\n        }, this) : /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_ChevronDown_ChevronUp_Download_Filter_Search_X_lucide_react__WEBPACK_IMPORTED_MODULE_4__[\"default\"], {\n            className: \"w-4 h-4\"\n        }, void 0, false, {\n            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n            lineNumber: 96,\n            columnNumber: 7\n        }, this);\n    };\n    return /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(framer_motion__WEBPACK_IMPORTED_MODULE_5__.motion.div, {\n        initial: {\n            opacity: 0,\n            y: 20\n        },\n        animate: {\n            opacity: 1,\n            y: 0\n        },\n        transition: {\n            duration: 0.3,\n            delay: 0.5\n        },\n        className: \"glass-effect rounded-xl p-6\",\n        children: [\n            /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                className: \"flex flex-col sm:flex-row justify-between items-start sm:items-center mb-6 space-y-4 sm:space-y-0\",\n                children: [\n                    /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"h3\", {\n                        className: \"text-lg font-semibold text-gray-900 dark:text-white\",\n                        children: \"Campaign Performance Data\"\n                    }, void 0, false, {\n                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                        lineNumber: 108,\n                        columnNumber: 9\n                    }, this),\n                    /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                        className: \"flex flex-wrap items-center gap-2\",\n                        children: [\n                            /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"button\", {\n                                onClick: ()=>setShowFilters(!showFilters),\n                                className: \"flex items-center space-x-2 px-3 py-2 bg-blue-600 text-white rounded-lg hover:bg-blue-700 transition-colors\",\n                                children: [\n                                    /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_ChevronDown_ChevronUp_Download_Filter_Search_X_lucide_react__WEBPACK_IMPORTED_MODULE_6__[\"default\"], {\n                                        className: \"w-4 h-4\"\n                                    }, void 0, false, {\n                                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                                        lineNumber: 116,\n                                        columnNumber: 13\n                                    }, this),\n                                    /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"span\", {\n                                        children: \"Filters\"\n                                    }, void 0, false, {\n                                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                                        lineNumber: 117,\n                                        columnNumber: 13\n                                    }, this)\n                                ]\n                            }, void 0, true, {\n                                fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                                lineNumber: 112,\n                                columnNumber: 11\n                            }, this),\n                            /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"button\", {\n                                onClick: handleExport,\n                                className: \"flex items-center space-x-2 px-3 py-2 bg-green-600 text-white rounded-lg hover:bg-green-700 transition-colors\",\n                                children: [\n                                    /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_ChevronDown_ChevronUp_Download_Filter_Search_X_lucide_react__WEBPACK_IMPORTED_MODULE_7__[\"default\"], {\n                                        className: \"w-4 h-4\"\n                                    }, void 0, false, {\n                                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                                        lineNumber: 123,\n                                        columnNumber: 13\n                                    }, this),\n                                    /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"span\", {\n                                        children: \"Export CSV\"\n                                    }, void 0, false, {\n                                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                                        lineNumber: 124,\n                                        columnNumber: 13\n                                    }, this)\n                                ]\n                            }, void 0, true, {\n                                fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                                lineNumber: 119,\n                                columnNumber: 11\n                            }, this)\n                        ]\n                    }, void 0, true, {\n                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                        lineNumber: 111,\n                        columnNumber: 9\n                    }, this)\n                ]\n            }, void 0, true, {\n                fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                lineNumber: 107,\n                columnNumber: 7\n            }, this),\n            showFilters && /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(framer_motion__WEBPACK_IMPORTED_MODULE_5__.motion.div, {\n                initial: {\n                    opacity: 0,\n                    height: 0\n                },\n                animate: {\n                    opacity: 1,\n                    height: \"auto\"\n                },\n                exit: {\n                    opacity: 0,\n                    height: 0\n                },\n                className: \"mb-6 p-4 bg-gray-50 dark:bg-gray-800/50 rounded-lg\",\n                children: [\n                    /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                        className: \"grid grid-cols-1 sm:grid-cols-3 gap-4\",\n                        children: [\n                            /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                                children: [\n                                    /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"label\", {\n                                        className: \"block text-sm font-medium text-gray-700 dark:text-gray-300 mb-1\",\n                                        children: \"Search Campaign\"\n                                    }, void 0, false, {\n                                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                                        lineNumber: 139,\n                                        columnNumber: 15\n                                    }, this),\n                                    /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                                        className: \"relative\",\n                                        children: [\n                                            /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_ChevronDown_ChevronUp_Download_Filter_Search_X_lucide_react__WEBPACK_IMPORTED_MODULE_8__[\"default\"], {\n                                                className: \"absolute left-3 top-1/2 transform -translate-y-1/2 w-4 h-4 text-gray-400\"\n                                            }, void 0, false, {\n                                                fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                                                lineNumber: 143,\n                                                columnNumber: 17\n                                            }, this),\n                                            /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"input\", {\n                                                type: \"text\",\n                                                value: searchTerm,\n                                                onChange: (e)=>setSearchTerm(e.target.value),\n                                                placeholder: \"Search campaigns...\",\n                                                className: \"w-full pl-10 pr-4 py-2 border border-gray-300 dark:border-gray-600 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent bg-white dark:bg-gray-700 text-gray-900 dark:text-white\"\n                                            }, void 0, false, {\n                                                fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                                                lineNumber: 144,\n                                                columnNumber: 17\n                                            }, this)\n                                        ]\n                                    }, void 0, true, {\n                                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                                        lineNumber: 142,\n                                        columnNumber: 15\n                                    }, this)\n                                ]\n                            }, void 0, true, {\n                                fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                                lineNumber: 138,\n                                columnNumber: 13\n                            }, this),\n                            /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                                children: [\n                                    /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"label\", {\n                                        className: \"block text-sm font-medium text-gray-700 dark:text-gray-300 mb-1\",\n                                        children: \"Min Revenue\"\n                                    }, void 0, false, {\n                                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                                        lineNumber: 154,\n                                        columnNumber: 15\n                                    }, this),\n                                    /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"input\", {\n                                        type: \"number\",\n                                        value: minRevenue,\n                                        onChange: (e)=>setMinRevenue(e.target.value),\n                                        placeholder: \"0\",\n                                        className: \"w-full px-3 py-2 border border-gray-300 dark:border-gray-600 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent bg-white dark:bg-gray-700 text-gray-900 dark:text-white\"\n                                    }, void 0, false, {\n                                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                                        lineNumber: 157,\n                                        columnNumber: 15\n                                    }, this)\n                                ]\n                            }, void 0, true, {\n                                fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                                lineNumber: 153,\n                                columnNumber: 13\n                            }, this),\n                            /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                                children: [\n                                    /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"label\", {\n                                        className: \"block text-sm font-medium text-gray-700 dark:text-gray-300 mb-1\",\n                                        children: \"Max Revenue\"\n                                    }, void 0, false, {\n                                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                                        lineNumber: 166,\n                                        columnNumber: 15\n                                    }, this),\n                                    /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"input\", {\n                                        type: \"number\",\n                                        value: maxRevenue,\n                                        onChange: (e)=>setMaxRevenue(e.target.value),\n                                        placeholder: \"100000\",\n                                        className: \"w-full px-3 py-2 border border-gray-300 dark:border-gray-600 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent bg-white dark:bg-gray-700 text-gray-900 dark:text-white\"\n                                    }, void 0, false, {\n                                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                                        lineNumber: 169,\n                                        columnNumber: 15\n                                    }, this)\n                                ]\n                            }, void 0, true, {\n                                fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                                lineNumber: 165,\n                                columnNumber: 13\n                            }, this)\n                        ]\n                    }, void 0, true, {\n                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                        lineNumber: 137,\n                        columnNumber: 11\n                    }, this),\n                    /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                        className: \"mt-4 flex justify-end\",\n                        children: /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"button\", {\n                            onClick: clearFilters,\n                            className: \"flex items-center space-x-2 px-3 py-2 text-red-600 hover:bg-red-50 dark:hover:bg-red-900/20 rounded-lg transition-colors\",\n                            children: [\n                                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_ChevronDown_ChevronUp_Download_Filter_Search_X_lucide_react__WEBPACK_IMPORTED_MODULE_9__[\"default\"], {\n                                    className: \"w-4 h-4\"\n                                }, void 0, false, {\n                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                                    lineNumber: 183,\n                                    columnNumber: 15\n                                }, this),\n                                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"span\", {\n                                    children: \"Clear Filters\"\n                                }, void 0, false, {\n                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                                    lineNumber: 184,\n                                    columnNumber: 15\n                                }, this)\n                            ]\n                        }, void 0, true, {\n                            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                            lineNumber: 179,\n                            columnNumber: 13\n                        }, this)\n                    }, void 0, false, {\n                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                        lineNumber: 178,\n                        columnNumber: 11\n                    }, this)\n                ]\n            }, void 0, true, {\n                fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                lineNumber: 131,\n                columnNumber: 9\n            }, this),\n            /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                className: \"overflow-x-auto\",\n                children: /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"table\", {\n                    className: \"w-full\",\n                    children: [\n                        /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"thead\", {\n                            children: /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"tr\", {\n                                className: \"border-b border-gray-200 dark:border-gray-700\",\n                                children: [\n                                    {\n                                        key: \"campaign\",\n                                        label: \"Campaign\"\n                                    },\n                                    {\n                                        key: \"revenue\",\n                                        label: \"Revenue\"\n                                    },\n                                    {\n                                        key: \"users\",\n                                        label: \"Users\"\n                                    },\n                                    {\n                                        key: \"conversions\",\n                                        label: \"Conversions\"\n                                    },\n                                    {\n                                        key: \"ctr\",\n                                        label: \"CTR\"\n                                    },\n                                    {\n                                        key: \"cost\",\n                                        label: \"Cost\"\n                                    }\n                                ].map(({ key, label })=>/*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"th\", {\n                                        onClick: ()=>handleSort(key),\n                                        className: \"px-4 py-3 text-left text-sm font-medium text-gray-700 dark:text-gray-300 cursor-pointer hover:bg-gray-50 dark:hover:bg-gray-800/50 transition-colors\",\n                                        children: /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                                            className: \"flex items-center space-x-1\",\n                                            children: [\n                                                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"span\", {\n                                                    children: label\n                                                }, void 0, false, {\n                                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                                                    lineNumber: 209,\n                                                    columnNumber: 21\n                                                }, this),\n                                                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(SortIcon, {\n                                                    field: key\n                                                }, void 0, false, {\n                                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                                                    lineNumber: 210,\n                                                    columnNumber: 21\n                                                }, this)\n                                            ]\n                                        }, void 0, true, {\n                                            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                                            lineNumber: 208,\n                                            columnNumber: 19\n                                        }, this)\n                                    }, key, false, {\n                                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                                        lineNumber: 203,\n                                        columnNumber: 17\n                                    }, this))\n                            }, void 0, false, {\n                                fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                                lineNumber: 194,\n                                columnNumber: 13\n                            }, this)\n                        }, void 0, false, {\n                            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                            lineNumber: 193,\n                            columnNumber: 11\n                        }, this),\n                        /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"tbody\", {\n                            className: \"divide-y divide-gray-200 dark:divide-gray-700\",\n                            children: paginatedData.map((item, index)=>/*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(framer_motion__WEBPACK_IMPORTED_MODULE_5__.motion.tr, {\n                                    initial: {\n                                        opacity: 0\n                                    },\n                                    animate: {\n                                        opacity: 1\n                                    },\n                                    transition: {\n                                        delay: index * 0.05\n                                    },\n                                    className: \"hover:bg-gray-50 dark:hover:bg-gray-800/50 transition-colors\",\n                                    children: [\n                                        /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"td\", {\n                                            className: \"px-4 py-3 text-sm font-medium text-gray-900 dark:text-white\",\n                                            children: item.campaign\n                                        }, void 0, false, {\n                                            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                                            lineNumber: 225,\n                                            columnNumber: 17\n                                        }, this),\n                                        /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"td\", {\n                                            className: \"px-4 py-3 text-sm text-gray-700 dark:text-gray-300\",\n                                            children: (0,_lib_utils__WEBPACK_IMPORTED_MODULE_2__.formatCurrency)(item.revenue)\n                                        }, void 0, false, {\n                                            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                                            lineNumber: 228,\n                                            columnNumber: 17\n                                        }, this),\n                                        /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"td\", {\n                                            className: \"px-4 py-3 text-sm text-gray-700 dark:text-gray-300\",\n                                            children: (0,_lib_utils__WEBPACK_IMPORTED_MODULE_2__.formatNumber)(item.users)\n                                        }, void 0, false, {\n                                            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                                            lineNumber: 231,\n                                            columnNumber: 17\n                                        }, this),\n                                        /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"td\", {\n                                            className: \"px-4 py-3 text-sm text-gray-700 dark:text-gray-300\",\n                                            children: (0,_lib_utils__WEBPACK_IMPORTED_MODULE_2__.formatNumber)(item.conversions)\n                                        }, void 0, false, {\n                                            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                                            lineNumber: 234,\n                                            columnNumber: 17\n                                        }, this),\n                                        /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"td\", {\n                                            className: \"px-4 py-3 text-sm text-gray-700 dark:text-gray-300\",\n                                            children: (0,_lib_utils__WEBPACK_IMPORTED_MODULE_2__.formatPercentage)(item.ctr)\n                                        }, void 0, false, {\n                                            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                                            lineNumber: 237,\n                                            columnNumber: 17\n                                        }, this),\n                                        /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"td\", {\n                                            className: \"px-4 py-3 text-sm text-gray-700 dark:text-gray-300\",\n                                            children: (0,_lib_utils__WEBPACK_IMPORTED_MODULE_2__.formatCurrency)(item.cost)\n                                        }, void 0, false, {\n                                            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                                            lineNumber: 240,\n                                            columnNumber: 17\n                                        }, this)\n                                    ]\n                                }, item.campaign, true, {\n                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                                    lineNumber: 218,\n                                    columnNumber: 15\n                                }, this))\n                        }, void 0, false, {\n                            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                            lineNumber: 216,\n                            columnNumber: 11\n                        }, this)\n                    ]\n                }, void 0, true, {\n                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                    lineNumber: 192,\n                    columnNumber: 9\n                }, this)\n            }, void 0, false, {\n                fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                lineNumber: 191,\n                columnNumber: 7\n            }, this),\n            totalPages > 1 && /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                className: \"flex items-center justify-between mt-6\",\n                children: [\n                    /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                        className: \"text-sm text-gray-700 dark:text-gray-300\",\n                        children: [\n                            \"Showing \",\n                            (currentPage - 1) * itemsPerPage + 1,\n                            \" to\",\n                            \" \",\n                            Math.min(currentPage * itemsPerPage, filteredAndSortedData.length),\n                            \" of\",\n                            \" \",\n                            filteredAndSortedData.length,\n                            \" results\"\n                        ]\n                    }, void 0, true, {\n                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                        lineNumber: 252,\n                        columnNumber: 11\n                    }, this),\n                    /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                        className: \"flex items-center space-x-2\",\n                        children: [\n                            /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"button\", {\n                                onClick: ()=>setCurrentPage(Math.max(1, currentPage - 1)),\n                                disabled: currentPage === 1,\n                                className: \"px-3 py-2 text-sm border border-gray-300 dark:border-gray-600 rounded-lg hover:bg-gray-50 dark:hover:bg-gray-800 disabled:opacity-50 disabled:cursor-not-allowed transition-colors\",\n                                children: \"Previous\"\n                            }, void 0, false, {\n                                fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                                lineNumber: 258,\n                                columnNumber: 13\n                            }, this),\n                            /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"span\", {\n                                className: \"text-sm text-gray-700 dark:text-gray-300\",\n                                children: [\n                                    \"Page \",\n                                    currentPage,\n                                    \" of \",\n                                    totalPages\n                                ]\n                            }, void 0, true, {\n                                fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                                lineNumber: 265,\n                                columnNumber: 13\n                            }, this),\n                            /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"button\", {\n                                onClick: ()=>setCurrentPage(Math.min(totalPages, currentPage + 1)),\n                                disabled: currentPage === totalPages,\n                                className: \"px-3 py-2 text-sm border border-gray-300 dark:border-gray-600 rounded-lg hover:bg-gray-50 dark:hover:bg-gray-800 disabled:opacity-50 disabled:cursor-not-allowed transition-colors\",\n                                children: \"Next\"\n                            }, void 0, false, {\n                                fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                                lineNumber: 268,\n                                columnNumber: 13\n                            }, this)\n                        ]\n                    }, void 0, true, {\n                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                        lineNumber: 257,\n                        columnNumber: 11\n                    }, this)\n                ]\n            }, void 0, true, {\n                fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n                lineNumber: 251,\n                columnNumber: 9\n            }, this)\n        ]\n    }, void 0, true, {\n        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\DataTable.tsx\",\n        lineNumber: 100,\n        columnNumber: 5\n    }, this);\n}\n//# sourceURL=[module]\n//# sourceMappingURL=data:application/json;charset=utf-8;base64,eyJ2ZXJzaW9uIjozLCJmaWxlIjoiKHNzcikvLi9jb21wb25lbnRzL0RhdGFUYWJsZS50c3giLCJtYXBwaW5ncyI6Ijs7Ozs7Ozs7Ozs7Ozs7Ozs7QUFFMEM7QUFDSDtBQVFqQjtBQUVvRTtBQVNuRixTQUFTYSxVQUFVLEVBQUVDLElBQUksRUFBa0I7SUFDaEQsTUFBTSxDQUFDQyxZQUFZQyxjQUFjLEdBQUdoQiwrQ0FBUUEsQ0FBQztJQUM3QyxNQUFNLENBQUNpQixXQUFXQyxhQUFhLEdBQUdsQiwrQ0FBUUEsQ0FBWTtJQUN0RCxNQUFNLENBQUNtQixlQUFlQyxpQkFBaUIsR0FBR3BCLCtDQUFRQSxDQUFnQjtJQUNsRSxNQUFNLENBQUNxQixhQUFhQyxlQUFlLEdBQUd0QiwrQ0FBUUEsQ0FBQztJQUMvQyxNQUFNLENBQUN1QixhQUFhQyxlQUFlLEdBQUd4QiwrQ0FBUUEsQ0FBQztJQUMvQyxNQUFNLENBQUN5QixZQUFZQyxjQUFjLEdBQUcxQiwrQ0FBUUEsQ0FBQztJQUM3QyxNQUFNLENBQUMyQixZQUFZQyxjQUFjLEdBQUc1QiwrQ0FBUUEsQ0FBQztJQUU3QyxNQUFNNkIsZUFBZTtJQUVyQix1QkFBdUI7SUFDdkIsTUFBTUMsd0JBQXdCN0IsOENBQU9BLENBQUM7UUFDcEMsSUFBSThCLFdBQVdqQixLQUFLa0IsTUFBTSxDQUFDQyxDQUFBQSxPQUN6QkEsS0FBS0MsUUFBUSxDQUFDQyxXQUFXLEdBQUdDLFFBQVEsQ0FBQ3JCLFdBQVdvQixXQUFXO1FBRzdELHdCQUF3QjtRQUN4QixJQUFJVixZQUFZO1lBQ2RNLFdBQVdBLFNBQVNDLE1BQU0sQ0FBQ0MsQ0FBQUEsT0FBUUEsS0FBS0ksT0FBTyxJQUFJQyxTQUFTYjtRQUM5RDtRQUNBLElBQUlFLFlBQVk7WUFDZEksV0FBV0EsU0FBU0MsTUFBTSxDQUFDQyxDQUFBQSxPQUFRQSxLQUFLSSxPQUFPLElBQUlDLFNBQVNYO1FBQzlEO1FBRUEsWUFBWTtRQUNaLE9BQU9JLFNBQVNRLElBQUksQ0FBQyxDQUFDQyxHQUFHQztZQUN2QixNQUFNQyxTQUFTRixDQUFDLENBQUN2QixVQUFVO1lBQzNCLE1BQU0wQixTQUFTRixDQUFDLENBQUN4QixVQUFVO1lBRTNCLElBQUksT0FBT3lCLFdBQVcsWUFBWSxPQUFPQyxXQUFXLFVBQVU7Z0JBQzVELE9BQU94QixrQkFBa0IsUUFDckJ1QixPQUFPRSxhQUFhLENBQUNELFVBQ3JCQSxPQUFPQyxhQUFhLENBQUNGO1lBQzNCO1lBRUEsT0FBT3ZCLGtCQUFrQixRQUNyQixTQUFzQndCLFNBQ3RCLFNBQXNCRDtRQUM1QjtJQUNGLEdBQUc7UUFBQzVCO1FBQU1DO1FBQVlFO1FBQVdFO1FBQWVNO1FBQVlFO0tBQVc7SUFFdkUsYUFBYTtJQUNiLE1BQU1rQixhQUFhQyxLQUFLQyxJQUFJLENBQUNqQixzQkFBc0JrQixNQUFNLEdBQUduQjtJQUM1RCxNQUFNb0IsZ0JBQWdCbkIsc0JBQXNCb0IsS0FBSyxDQUMvQyxDQUFDN0IsY0FBYyxLQUFLUSxjQUNwQlIsY0FBY1E7SUFHaEIsTUFBTXNCLGFBQWEsQ0FBQ0M7UUFDbEIsSUFBSUEsVUFBVW5DLFdBQVc7WUFDdkJHLGlCQUFpQkQsa0JBQWtCLFFBQVEsU0FBUztRQUN0RCxPQUFPO1lBQ0xELGFBQWFrQztZQUNiaEMsaUJBQWlCO1FBQ25CO0lBQ0Y7SUFFQSxNQUFNaUMsZUFBZTtRQUNuQnpDLHVEQUFXQSxDQUFDa0IsdUJBQXVCO0lBQ3JDO0lBRUEsTUFBTXdCLGVBQWU7UUFDbkJ0QyxjQUFjO1FBQ2RVLGNBQWM7UUFDZEUsY0FBYztRQUNkTixlQUFlO0lBQ2pCO0lBRUEsTUFBTWlDLFdBQVcsQ0FBQyxFQUFFSCxLQUFLLEVBQXdCO1FBQy9DLElBQUluQyxjQUFjbUMsT0FBTyxPQUFPO1FBQ2hDLE9BQU9qQyxrQkFBa0Isc0JBQ3ZCLDhEQUFDZCwwSEFBU0E7WUFBQ21ELFdBQVU7Ozs7O2lDQUNyQiw4REFBQ2xELDBIQUFXQTtZQUFDa0QsV0FBVTs7Ozs7O0lBQzNCO0lBRUEscUJBQ0UsOERBQUN0RCxpREFBTUEsQ0FBQ3VELEdBQUc7UUFDVEMsU0FBUztZQUFFQyxTQUFTO1lBQUdDLEdBQUc7UUFBRztRQUM3QkMsU0FBUztZQUFFRixTQUFTO1lBQUdDLEdBQUc7UUFBRTtRQUM1QkUsWUFBWTtZQUFFQyxVQUFVO1lBQUtDLE9BQU87UUFBSTtRQUN4Q1IsV0FBVTs7MEJBR1YsOERBQUNDO2dCQUFJRCxXQUFVOztrQ0FDYiw4REFBQ1M7d0JBQUdULFdBQVU7a0NBQXNEOzs7Ozs7a0NBR3BFLDhEQUFDQzt3QkFBSUQsV0FBVTs7MENBQ2IsOERBQUNVO2dDQUNDQyxTQUFTLElBQU0zQyxlQUFlLENBQUNEO2dDQUMvQmlDLFdBQVU7O2tEQUVWLDhEQUFDakQsMEhBQU1BO3dDQUFDaUQsV0FBVTs7Ozs7O2tEQUNsQiw4REFBQ1k7a0RBQUs7Ozs7Ozs7Ozs7OzswQ0FFUiw4REFBQ0Y7Z0NBQ0NDLFNBQVNkO2dDQUNURyxXQUFVOztrREFFViw4REFBQ3BELDBIQUFRQTt3Q0FBQ29ELFdBQVU7Ozs7OztrREFDcEIsOERBQUNZO2tEQUFLOzs7Ozs7Ozs7Ozs7Ozs7Ozs7Ozs7Ozs7WUFNWDdDLDZCQUNDLDhEQUFDckIsaURBQU1BLENBQUN1RCxHQUFHO2dCQUNUQyxTQUFTO29CQUFFQyxTQUFTO29CQUFHVSxRQUFRO2dCQUFFO2dCQUNqQ1IsU0FBUztvQkFBRUYsU0FBUztvQkFBR1UsUUFBUTtnQkFBTztnQkFDdENDLE1BQU07b0JBQUVYLFNBQVM7b0JBQUdVLFFBQVE7Z0JBQUU7Z0JBQzlCYixXQUFVOztrQ0FFViw4REFBQ0M7d0JBQUlELFdBQVU7OzBDQUNiLDhEQUFDQzs7a0RBQ0MsOERBQUNjO3dDQUFNZixXQUFVO2tEQUFrRTs7Ozs7O2tEQUduRiw4REFBQ0M7d0NBQUlELFdBQVU7OzBEQUNiLDhEQUFDckQsMEhBQU1BO2dEQUFDcUQsV0FBVTs7Ozs7OzBEQUNsQiw4REFBQ2dCO2dEQUNDQyxNQUFLO2dEQUNMQyxPQUFPM0Q7Z0RBQ1A0RCxVQUFVLENBQUNDLElBQU01RCxjQUFjNEQsRUFBRUMsTUFBTSxDQUFDSCxLQUFLO2dEQUM3Q0ksYUFBWTtnREFDWnRCLFdBQVU7Ozs7Ozs7Ozs7Ozs7Ozs7OzswQ0FJaEIsOERBQUNDOztrREFDQyw4REFBQ2M7d0NBQU1mLFdBQVU7a0RBQWtFOzs7Ozs7a0RBR25GLDhEQUFDZ0I7d0NBQ0NDLE1BQUs7d0NBQ0xDLE9BQU9qRDt3Q0FDUGtELFVBQVUsQ0FBQ0MsSUFBTWxELGNBQWNrRCxFQUFFQyxNQUFNLENBQUNILEtBQUs7d0NBQzdDSSxhQUFZO3dDQUNadEIsV0FBVTs7Ozs7Ozs7Ozs7OzBDQUdkLDhEQUFDQzs7a0RBQ0MsOERBQUNjO3dDQUFNZixXQUFVO2tEQUFrRTs7Ozs7O2tEQUduRiw4REFBQ2dCO3dDQUNDQyxNQUFLO3dDQUNMQyxPQUFPL0M7d0NBQ1BnRCxVQUFVLENBQUNDLElBQU1oRCxjQUFjZ0QsRUFBRUMsTUFBTSxDQUFDSCxLQUFLO3dDQUM3Q0ksYUFBWTt3Q0FDWnRCLFdBQVU7Ozs7Ozs7Ozs7Ozs7Ozs7OztrQ0FJaEIsOERBQUNDO3dCQUFJRCxXQUFVO2tDQUNiLDRFQUFDVTs0QkFDQ0MsU0FBU2I7NEJBQ1RFLFdBQVU7OzhDQUVWLDhEQUFDaEQsMEhBQUNBO29DQUFDZ0QsV0FBVTs7Ozs7OzhDQUNiLDhEQUFDWTs4Q0FBSzs7Ozs7Ozs7Ozs7Ozs7Ozs7Ozs7Ozs7MEJBT2QsOERBQUNYO2dCQUFJRCxXQUFVOzBCQUNiLDRFQUFDdUI7b0JBQU12QixXQUFVOztzQ0FDZiw4REFBQ3dCO3NDQUNDLDRFQUFDQztnQ0FBR3pCLFdBQVU7MENBQ1g7b0NBQ0M7d0NBQUUwQixLQUFLO3dDQUFZWCxPQUFPO29DQUFXO29DQUNyQzt3Q0FBRVcsS0FBSzt3Q0FBV1gsT0FBTztvQ0FBVTtvQ0FDbkM7d0NBQUVXLEtBQUs7d0NBQVNYLE9BQU87b0NBQVE7b0NBQy9CO3dDQUFFVyxLQUFLO3dDQUFlWCxPQUFPO29DQUFjO29DQUMzQzt3Q0FBRVcsS0FBSzt3Q0FBT1gsT0FBTztvQ0FBTTtvQ0FDM0I7d0NBQUVXLEtBQUs7d0NBQVFYLE9BQU87b0NBQU87aUNBQzlCLENBQUNZLEdBQUcsQ0FBQyxDQUFDLEVBQUVELEdBQUcsRUFBRVgsS0FBSyxFQUFFLGlCQUNuQiw4REFBQ2E7d0NBRUNqQixTQUFTLElBQU1oQixXQUFXK0I7d0NBQzFCMUIsV0FBVTtrREFFViw0RUFBQ0M7NENBQUlELFdBQVU7OzhEQUNiLDhEQUFDWTs4REFBTUc7Ozs7Ozs4REFDUCw4REFBQ2hCO29EQUFTSCxPQUFPOEI7Ozs7Ozs7Ozs7Ozt1Q0FOZEE7Ozs7Ozs7Ozs7Ozs7OztzQ0FZYiw4REFBQ0c7NEJBQU03QixXQUFVO3NDQUNkUCxjQUFja0MsR0FBRyxDQUFDLENBQUNsRCxNQUFNcUQsc0JBQ3hCLDhEQUFDcEYsaURBQU1BLENBQUMrRSxFQUFFO29DQUVSdkIsU0FBUzt3Q0FBRUMsU0FBUztvQ0FBRTtvQ0FDdEJFLFNBQVM7d0NBQUVGLFNBQVM7b0NBQUU7b0NBQ3RCRyxZQUFZO3dDQUFFRSxPQUFPc0IsUUFBUTtvQ0FBSztvQ0FDbEM5QixXQUFVOztzREFFViw4REFBQytCOzRDQUFHL0IsV0FBVTtzREFDWHZCLEtBQUtDLFFBQVE7Ozs7OztzREFFaEIsOERBQUNxRDs0Q0FBRy9CLFdBQVU7c0RBQ1gvQywwREFBY0EsQ0FBQ3dCLEtBQUtJLE9BQU87Ozs7OztzREFFOUIsOERBQUNrRDs0Q0FBRy9CLFdBQVU7c0RBQ1g5Qyx3REFBWUEsQ0FBQ3VCLEtBQUt1RCxLQUFLOzs7Ozs7c0RBRTFCLDhEQUFDRDs0Q0FBRy9CLFdBQVU7c0RBQ1g5Qyx3REFBWUEsQ0FBQ3VCLEtBQUt3RCxXQUFXOzs7Ozs7c0RBRWhDLDhEQUFDRjs0Q0FBRy9CLFdBQVU7c0RBQ1g3Qyw0REFBZ0JBLENBQUNzQixLQUFLeUQsR0FBRzs7Ozs7O3NEQUU1Qiw4REFBQ0g7NENBQUcvQixXQUFVO3NEQUNYL0MsMERBQWNBLENBQUN3QixLQUFLMEQsSUFBSTs7Ozs7OzttQ0F0QnRCMUQsS0FBS0MsUUFBUTs7Ozs7Ozs7Ozs7Ozs7Ozs7Ozs7O1lBK0IzQlcsYUFBYSxtQkFDWiw4REFBQ1k7Z0JBQUlELFdBQVU7O2tDQUNiLDhEQUFDQzt3QkFBSUQsV0FBVTs7NEJBQTJDOzRCQUM5Q25DLENBQUFBLGNBQWMsS0FBS1EsZUFBZTs0QkFBRTs0QkFBSTs0QkFDakRpQixLQUFLOEMsR0FBRyxDQUFDdkUsY0FBY1EsY0FBY0Msc0JBQXNCa0IsTUFBTTs0QkFBRTs0QkFBSTs0QkFDdkVsQixzQkFBc0JrQixNQUFNOzRCQUFDOzs7Ozs7O2tDQUVoQyw4REFBQ1M7d0JBQUlELFdBQVU7OzBDQUNiLDhEQUFDVTtnQ0FDQ0MsU0FBUyxJQUFNN0MsZUFBZXdCLEtBQUsrQyxHQUFHLENBQUMsR0FBR3hFLGNBQWM7Z0NBQ3hEeUUsVUFBVXpFLGdCQUFnQjtnQ0FDMUJtQyxXQUFVOzBDQUNYOzs7Ozs7MENBR0QsOERBQUNZO2dDQUFLWixXQUFVOztvQ0FBMkM7b0NBQ25EbkM7b0NBQVk7b0NBQUt3Qjs7Ozs7OzswQ0FFekIsOERBQUNxQjtnQ0FDQ0MsU0FBUyxJQUFNN0MsZUFBZXdCLEtBQUs4QyxHQUFHLENBQUMvQyxZQUFZeEIsY0FBYztnQ0FDakV5RSxVQUFVekUsZ0JBQWdCd0I7Z0NBQzFCVyxXQUFVOzBDQUNYOzs7Ozs7Ozs7Ozs7Ozs7Ozs7Ozs7Ozs7QUFRYiIsInNvdXJjZXMiOlsid2VicGFjazovL2FkbXlicmFuZC1pbnNpZ2h0cy8uL2NvbXBvbmVudHMvRGF0YVRhYmxlLnRzeD9hOTI3Il0sInNvdXJjZXNDb250ZW50IjpbIid1c2UgY2xpZW50JztcblxuaW1wb3J0IHsgdXNlU3RhdGUsIHVzZU1lbW8gfSBmcm9tICdyZWFjdCc7XG5pbXBvcnQgeyBtb3Rpb24gfSBmcm9tICdmcmFtZXItbW90aW9uJztcbmltcG9ydCB7IFxuICBTZWFyY2gsIFxuICBEb3dubG9hZCwgXG4gIENoZXZyb25VcCwgXG4gIENoZXZyb25Eb3duLCBcbiAgRmlsdGVyLFxuICBYIFxufSBmcm9tICdsdWNpZGUtcmVhY3QnO1xuaW1wb3J0IHsgQ2FtcGFpZ25EYXRhIH0gZnJvbSAnQC9kYXRhL21vY2tEYXRhJztcbmltcG9ydCB7IGZvcm1hdEN1cnJlbmN5LCBmb3JtYXROdW1iZXIsIGZvcm1hdFBlcmNlbnRhZ2UsIGV4cG9ydFRvQ1NWIH0gZnJvbSAnQC9saWIvdXRpbHMnO1xuXG5pbnRlcmZhY2UgRGF0YVRhYmxlUHJvcHMge1xuICBkYXRhOiBDYW1wYWlnbkRhdGFbXTtcbn1cblxudHlwZSBTb3J0RmllbGQgPSBrZXlvZiBDYW1wYWlnbkRhdGE7XG50eXBlIFNvcnREaXJlY3Rpb24gPSAnYXNjJyB8ICdkZXNjJztcblxuZXhwb3J0IGZ1bmN0aW9uIERhdGFUYWJsZSh7IGRhdGEgfTogRGF0YVRhYmxlUHJvcHMpIHtcbiAgY29uc3QgW3NlYXJjaFRlcm0sIHNldFNlYXJjaFRlcm1dID0gdXNlU3RhdGUoJycpO1xuICBjb25zdCBbc29ydEZpZWxkLCBzZXRTb3J0RmllbGRdID0gdXNlU3RhdGU8U29ydEZpZWxkPigncmV2ZW51ZScpO1xuICBjb25zdCBbc29ydERpcmVjdGlvbiwgc2V0U29ydERpcmVjdGlvbl0gPSB1c2VTdGF0ZTxTb3J0RGlyZWN0aW9uPignZGVzYycpO1xuICBjb25zdCBbY3VycmVudFBhZ2UsIHNldEN1cnJlbnRQYWdlXSA9IHVzZVN0YXRlKDEpO1xuICBjb25zdCBbc2hvd0ZpbHRlcnMsIHNldFNob3dGaWx0ZXJzXSA9IHVzZVN0YXRlKGZhbHNlKTtcbiAgY29uc3QgW21pblJldmVudWUsIHNldE1pblJldmVudWVdID0gdXNlU3RhdGUoJycpO1xuICBjb25zdCBbbWF4UmV2ZW51ZSwgc2V0TWF4UmV2ZW51ZV0gPSB1c2VTdGF0ZSgnJyk7XG5cbiAgY29uc3QgaXRlbXNQZXJQYWdlID0gMTA7XG5cbiAgLy8gRmlsdGVyIGFuZCBzb3J0IGRhdGFcbiAgY29uc3QgZmlsdGVyZWRBbmRTb3J0ZWREYXRhID0gdXNlTWVtbygoKSA9PiB7XG4gICAgbGV0IGZpbHRlcmVkID0gZGF0YS5maWx0ZXIoaXRlbSA9PlxuICAgICAgaXRlbS5jYW1wYWlnbi50b0xvd2VyQ2FzZSgpLmluY2x1ZGVzKHNlYXJjaFRlcm0udG9Mb3dlckNhc2UoKSlcbiAgICApO1xuXG4gICAgLy8gQXBwbHkgcmV2ZW51ZSBmaWx0ZXJzXG4gICAgaWYgKG1pblJldmVudWUpIHtcbiAgICAgIGZpbHRlcmVkID0gZmlsdGVyZWQuZmlsdGVyKGl0ZW0gPT4gaXRlbS5yZXZlbnVlID49IHBhcnNlSW50KG1pblJldmVudWUpKTtcbiAgICB9XG4gICAgaWYgKG1heFJldmVudWUpIHtcbiAgICAgIGZpbHRlcmVkID0gZmlsdGVyZWQuZmlsdGVyKGl0ZW0gPT4gaXRlbS5yZXZlbnVlIDw9IHBhcnNlSW50KG1heFJldmVudWUpKTtcbiAgICB9XG5cbiAgICAvLyBTb3J0IGRhdGFcbiAgICByZXR1cm4gZmlsdGVyZWQuc29ydCgoYSwgYikgPT4ge1xuICAgICAgY29uc3QgYVZhbHVlID0gYVtzb3J0RmllbGRdO1xuICAgICAgY29uc3QgYlZhbHVlID0gYltzb3J0RmllbGRdO1xuXG4gICAgICBpZiAodHlwZW9mIGFWYWx1ZSA9PT0gJ3N0cmluZycgJiYgdHlwZW9mIGJWYWx1ZSA9PT0gJ3N0cmluZycpIHtcbiAgICAgICAgcmV0dXJuIHNvcnREaXJlY3Rpb24gPT09ICdhc2MnIFxuICAgICAgICAgID8gYVZhbHVlLmxvY2FsZUNvbXBhcmUoYlZhbHVlKVxuICAgICAgICAgIDogYlZhbHVlLmxvY2FsZUNvbXBhcmUoYVZhbHVlKTtcbiAgICAgIH1cblxuICAgICAgcmV0dXJuIHNvcnREaXJlY3Rpb24gPT09ICdhc2MnIFxuICAgICAgICA/IChhVmFsdWUgYXMgbnVtYmVyKSAtIChiVmFsdWUgYXMgbnVtYmVyKVxuICAgICAgICA6IChiVmFsdWUgYXMgbnVtYmVyKSAtIChhVmFsdWUgYXMgbnVtYmVyKTtcbiAgICB9KTtcbiAgfSwgW2RhdGEsIHNlYXJjaFRlcm0sIHNvcnRGaWVsZCwgc29ydERpcmVjdGlvbiwgbWluUmV2ZW51ZSwgbWF4UmV2ZW51ZV0pO1xuXG4gIC8vIFBhZ2luYXRpb25cbiAgY29uc3QgdG90YWxQYWdlcyA9IE1hdGguY2VpbChmaWx0ZXJlZEFuZFNvcnRlZERhdGEubGVuZ3RoIC8gaXRlbXNQZXJQYWdlKTtcbiAgY29uc3QgcGFnaW5hdGVkRGF0YSA9IGZpbHRlcmVkQW5kU29ydGVkRGF0YS5zbGljZShcbiAgICAoY3VycmVudFBhZ2UgLSAxKSAqIGl0ZW1zUGVyUGFnZSxcbiAgICBjdXJyZW50UGFnZSAqIGl0ZW1zUGVyUGFnZVxuICApO1xuXG4gIGNvbnN0IGhhbmRsZVNvcnQgPSAoZmllbGQ6IFNvcnRGaWVsZCkgPT4ge1xuICAgIGlmIChmaWVsZCA9PT0gc29ydEZpZWxkKSB7XG4gICAgICBzZXRTb3J0RGlyZWN0aW9uKHNvcnREaXJlY3Rpb24gPT09ICdhc2MnID8gJ2Rlc2MnIDogJ2FzYycpO1xuICAgIH0gZWxzZSB7XG4gICAgICBzZXRTb3J0RmllbGQoZmllbGQpO1xuICAgICAgc2V0U29ydERpcmVjdGlvbignZGVzYycpO1xuICAgIH1cbiAgfTtcblxuICBjb25zdCBoYW5kbGVFeHBvcnQgPSAoKSA9PiB7XG4gICAgZXhwb3J0VG9DU1YoZmlsdGVyZWRBbmRTb3J0ZWREYXRhLCAnY2FtcGFpZ24tZGF0YS5jc3YnKTtcbiAgfTtcblxuICBjb25zdCBjbGVhckZpbHRlcnMgPSAoKSA9PiB7XG4gICAgc2V0U2VhcmNoVGVybSgnJyk7XG4gICAgc2V0TWluUmV2ZW51ZSgnJyk7XG4gICAgc2V0TWF4UmV2ZW51ZSgnJyk7XG4gICAgc2V0Q3VycmVudFBhZ2UoMSk7XG4gIH07XG5cbiAgY29uc3QgU29ydEljb24gPSAoeyBmaWVsZCB9OiB7IGZpZWxkOiBTb3J0RmllbGQgfSkgPT4ge1xuICAgIGlmIChzb3J0RmllbGQgIT09IGZpZWxkKSByZXR1cm4gbnVsbDtcbiAgICByZXR1cm4gc29ydERpcmVjdGlvbiA9PT0gJ2FzYycgPyBcbiAgICAgIDxDaGV2cm9uVXAgY2xhc3NOYW1lPVwidy00IGgtNFwiIC8+IDogXG4gICAgICA8Q2hldnJvbkRvd24gY2xhc3NOYW1lPVwidy00IGgtNFwiIC8+O1xuICB9O1xuXG4gIHJldHVybiAoXG4gICAgPG1vdGlvbi5kaXZcbiAgICAgIGluaXRpYWw9e3sgb3BhY2l0eTogMCwgeTogMjAgfX1cbiAgICAgIGFuaW1hdGU9e3sgb3BhY2l0eTogMSwgeTogMCB9fVxuICAgICAgdHJhbnNpdGlvbj17eyBkdXJhdGlvbjogMC4zLCBkZWxheTogMC41IH19XG4gICAgICBjbGFzc05hbWU9XCJnbGFzcy1lZmZlY3Qgcm91bmRlZC14bCBwLTZcIlxuICAgID5cbiAgICAgIHsvKiBIZWFkZXIgKi99XG4gICAgICA8ZGl2IGNsYXNzTmFtZT1cImZsZXggZmxleC1jb2wgc206ZmxleC1yb3cganVzdGlmeS1iZXR3ZWVuIGl0ZW1zLXN0YXJ0IHNtOml0ZW1zLWNlbnRlciBtYi02IHNwYWNlLXktNCBzbTpzcGFjZS15LTBcIj5cbiAgICAgICAgPGgzIGNsYXNzTmFtZT1cInRleHQtbGcgZm9udC1zZW1pYm9sZCB0ZXh0LWdyYXktOTAwIGRhcms6dGV4dC13aGl0ZVwiPlxuICAgICAgICAgIENhbXBhaWduIFBlcmZvcm1hbmNlIERhdGFcbiAgICAgICAgPC9oMz5cbiAgICAgICAgPGRpdiBjbGFzc05hbWU9XCJmbGV4IGZsZXgtd3JhcCBpdGVtcy1jZW50ZXIgZ2FwLTJcIj5cbiAgICAgICAgICA8YnV0dG9uXG4gICAgICAgICAgICBvbkNsaWNrPXsoKSA9PiBzZXRTaG93RmlsdGVycyghc2hvd0ZpbHRlcnMpfVxuICAgICAgICAgICAgY2xhc3NOYW1lPVwiZmxleCBpdGVtcy1jZW50ZXIgc3BhY2UteC0yIHB4LTMgcHktMiBiZy1ibHVlLTYwMCB0ZXh0LXdoaXRlIHJvdW5kZWQtbGcgaG92ZXI6YmctYmx1ZS03MDAgdHJhbnNpdGlvbi1jb2xvcnNcIlxuICAgICAgICAgID5cbiAgICAgICAgICAgIDxGaWx0ZXIgY2xhc3NOYW1lPVwidy00IGgtNFwiIC8+XG4gICAgICAgICAgICA8c3Bhbj5GaWx0ZXJzPC9zcGFuPlxuICAgICAgICAgIDwvYnV0dG9uPlxuICAgICAgICAgIDxidXR0b25cbiAgICAgICAgICAgIG9uQ2xpY2s9e2hhbmRsZUV4cG9ydH1cbiAgICAgICAgICAgIGNsYXNzTmFtZT1cImZsZXggaXRlbXMtY2VudGVyIHNwYWNlLXgtMiBweC0zIHB5LTIgYmctZ3JlZW4tNjAwIHRleHQtd2hpdGUgcm91bmRlZC1sZyBob3ZlcjpiZy1ncmVlbi03MDAgdHJhbnNpdGlvbi1jb2xvcnNcIlxuICAgICAgICAgID5cbiAgICAgICAgICAgIDxEb3dubG9hZCBjbGFzc05hbWU9XCJ3LTQgaC00XCIgLz5cbiAgICAgICAgICAgIDxzcGFuPkV4cG9ydCBDU1Y8L3NwYW4+XG4gICAgICAgICAgPC9idXR0b24+XG4gICAgICAgIDwvZGl2PlxuICAgICAgPC9kaXY+XG5cbiAgICAgIHsvKiBGaWx0ZXJzICovfVxuICAgICAge3Nob3dGaWx0ZXJzICYmIChcbiAgICAgICAgPG1vdGlvbi5kaXZcbiAgICAgICAgICBpbml0aWFsPXt7IG9wYWNpdHk6IDAsIGhlaWdodDogMCB9fVxuICAgICAgICAgIGFuaW1hdGU9e3sgb3BhY2l0eTogMSwgaGVpZ2h0OiAnYXV0bycgfX1cbiAgICAgICAgICBleGl0PXt7IG9wYWNpdHk6IDAsIGhlaWdodDogMCB9fVxuICAgICAgICAgIGNsYXNzTmFtZT1cIm1iLTYgcC00IGJnLWdyYXktNTAgZGFyazpiZy1ncmF5LTgwMC81MCByb3VuZGVkLWxnXCJcbiAgICAgICAgPlxuICAgICAgICAgIDxkaXYgY2xhc3NOYW1lPVwiZ3JpZCBncmlkLWNvbHMtMSBzbTpncmlkLWNvbHMtMyBnYXAtNFwiPlxuICAgICAgICAgICAgPGRpdj5cbiAgICAgICAgICAgICAgPGxhYmVsIGNsYXNzTmFtZT1cImJsb2NrIHRleHQtc20gZm9udC1tZWRpdW0gdGV4dC1ncmF5LTcwMCBkYXJrOnRleHQtZ3JheS0zMDAgbWItMVwiPlxuICAgICAgICAgICAgICAgIFNlYXJjaCBDYW1wYWlnblxuICAgICAgICAgICAgICA8L2xhYmVsPlxuICAgICAgICAgICAgICA8ZGl2IGNsYXNzTmFtZT1cInJlbGF0aXZlXCI+XG4gICAgICAgICAgICAgICAgPFNlYXJjaCBjbGFzc05hbWU9XCJhYnNvbHV0ZSBsZWZ0LTMgdG9wLTEvMiB0cmFuc2Zvcm0gLXRyYW5zbGF0ZS15LTEvMiB3LTQgaC00IHRleHQtZ3JheS00MDBcIiAvPlxuICAgICAgICAgICAgICAgIDxpbnB1dFxuICAgICAgICAgICAgICAgICAgdHlwZT1cInRleHRcIlxuICAgICAgICAgICAgICAgICAgdmFsdWU9e3NlYXJjaFRlcm19XG4gICAgICAgICAgICAgICAgICBvbkNoYW5nZT17KGUpID0+IHNldFNlYXJjaFRlcm0oZS50YXJnZXQudmFsdWUpfVxuICAgICAgICAgICAgICAgICAgcGxhY2Vob2xkZXI9XCJTZWFyY2ggY2FtcGFpZ25zLi4uXCJcbiAgICAgICAgICAgICAgICAgIGNsYXNzTmFtZT1cInctZnVsbCBwbC0xMCBwci00IHB5LTIgYm9yZGVyIGJvcmRlci1ncmF5LTMwMCBkYXJrOmJvcmRlci1ncmF5LTYwMCByb3VuZGVkLWxnIGZvY3VzOnJpbmctMiBmb2N1czpyaW5nLWJsdWUtNTAwIGZvY3VzOmJvcmRlci10cmFuc3BhcmVudCBiZy13aGl0ZSBkYXJrOmJnLWdyYXktNzAwIHRleHQtZ3JheS05MDAgZGFyazp0ZXh0LXdoaXRlXCJcbiAgICAgICAgICAgICAgICAvPlxuICAgICAgICAgICAgICA8L2Rpdj5cbiAgICAgICAgICAgIDwvZGl2PlxuICAgICAgICAgICAgPGRpdj5cbiAgICAgICAgICAgICAgPGxhYmVsIGNsYXNzTmFtZT1cImJsb2NrIHRleHQtc20gZm9udC1tZWRpdW0gdGV4dC1ncmF5LTcwMCBkYXJrOnRleHQtZ3JheS0zMDAgbWItMVwiPlxuICAgICAgICAgICAgICAgIE1pbiBSZXZlbnVlXG4gICAgICAgICAgICAgIDwvbGFiZWw+XG4gICAgICAgICAgICAgIDxpbnB1dFxuICAgICAgICAgICAgICAgIHR5cGU9XCJudW1iZXJcIlxuICAgICAgICAgICAgICAgIHZhbHVlPXttaW5SZXZlbnVlfVxuICAgICAgICAgICAgICAgIG9uQ2hhbmdlPXsoZSkgPT4gc2V0TWluUmV2ZW51ZShlLnRhcmdldC52YWx1ZSl9XG4gICAgICAgICAgICAgICAgcGxhY2Vob2xkZXI9XCIwXCJcbiAgICAgICAgICAgICAgICBjbGFzc05hbWU9XCJ3LWZ1bGwgcHgtMyBweS0yIGJvcmRlciBib3JkZXItZ3JheS0zMDAgZGFyazpib3JkZXItZ3JheS02MDAgcm91bmRlZC1sZyBmb2N1czpyaW5nLTIgZm9jdXM6cmluZy1ibHVlLTUwMCBmb2N1czpib3JkZXItdHJhbnNwYXJlbnQgYmctd2hpdGUgZGFyazpiZy1ncmF5LTcwMCB0ZXh0LWdyYXktOTAwIGRhcms6dGV4dC13aGl0ZVwiXG4gICAgICAgICAgICAgIC8+XG4gICAgICAgICAgICA8L2Rpdj5cbiAgICAgICAgICAgIDxkaXY+XG4gICAgICAgICAgICAgIDxsYWJlbCBjbGFzc05hbWU9XCJibG9jayB0ZXh0LXNtIGZvbnQtbWVkaXVtIHRleHQtZ3JheS03MDAgZGFyazp0ZXh0LWdyYXktMzAwIG1iLTFcIj5cbiAgICAgICAgICAgICAgICBNYXggUmV2ZW51ZVxuICAgICAgICAgICAgICA8L2xhYmVsPlxuICAgICAgICAgICAgICA8aW5wdXRcbiAgICAgICAgICAgICAgICB0eXBlPVwibnVtYmVyXCJcbiAgICAgICAgICAgICAgICB2YWx1ZT17bWF4UmV2ZW51ZX1cbiAgICAgICAgICAgICAgICBvbkNoYW5nZT17KGUpID0+IHNldE1heFJldmVudWUoZS50YXJnZXQudmFsdWUpfVxuICAgICAgICAgICAgICAgIHBsYWNlaG9sZGVyPVwiMTAwMDAwXCJcbiAgICAgICAgICAgICAgICBjbGFzc05hbWU9XCJ3LWZ1bGwgcHgtMyBweS0yIGJvcmRlciBib3JkZXItZ3JheS0zMDAgZGFyazpib3JkZXItZ3JheS02MDAgcm91bmRlZC1sZyBmb2N1czpyaW5nLTIgZm9jdXM6cmluZy1ibHVlLTUwMCBmb2N1czpib3JkZXItdHJhbnNwYXJlbnQgYmctd2hpdGUgZGFyazpiZy1ncmF5LTcwMCB0ZXh0LWdyYXktOTAwIGRhcms6dGV4dC13aGl0ZVwiXG4gICAgICAgICAgICAgIC8+XG4gICAgICAgICAgICA8L2Rpdj5cbiAgICAgICAgICA8L2Rpdj5cbiAgICAgICAgICA8ZGl2IGNsYXNzTmFtZT1cIm10LTQgZmxleCBqdXN0aWZ5LWVuZFwiPlxuICAgICAgICAgICAgPGJ1dHRvblxuICAgICAgICAgICAgICBvbkNsaWNrPXtjbGVhckZpbHRlcnN9XG4gICAgICAgICAgICAgIGNsYXNzTmFtZT1cImZsZXggaXRlbXMtY2VudGVyIHNwYWNlLXgtMiBweC0zIHB5LTIgdGV4dC1yZWQtNjAwIGhvdmVyOmJnLXJlZC01MCBkYXJrOmhvdmVyOmJnLXJlZC05MDAvMjAgcm91bmRlZC1sZyB0cmFuc2l0aW9uLWNvbG9yc1wiXG4gICAgICAgICAgICA+XG4gICAgICAgICAgICAgIDxYIGNsYXNzTmFtZT1cInctNCBoLTRcIiAvPlxuICAgICAgICAgICAgICA8c3Bhbj5DbGVhciBGaWx0ZXJzPC9zcGFuPlxuICAgICAgICAgICAgPC9idXR0b24+XG4gICAgICAgICAgPC9kaXY+XG4gICAgICAgIDwvbW90aW9uLmRpdj5cbiAgICAgICl9XG5cbiAgICAgIHsvKiBUYWJsZSAqL31cbiAgICAgIDxkaXYgY2xhc3NOYW1lPVwib3ZlcmZsb3cteC1hdXRvXCI+XG4gICAgICAgIDx0YWJsZSBjbGFzc05hbWU9XCJ3LWZ1bGxcIj5cbiAgICAgICAgICA8dGhlYWQ+XG4gICAgICAgICAgICA8dHIgY2xhc3NOYW1lPVwiYm9yZGVyLWIgYm9yZGVyLWdyYXktMjAwIGRhcms6Ym9yZGVyLWdyYXktNzAwXCI+XG4gICAgICAgICAgICAgIHtbXG4gICAgICAgICAgICAgICAgeyBrZXk6ICdjYW1wYWlnbicsIGxhYmVsOiAnQ2FtcGFpZ24nIH0sXG4gICAgICAgICAgICAgICAgeyBrZXk6ICdyZXZlbnVlJywgbGFiZWw6ICdSZXZlbnVlJyB9LFxuICAgICAgICAgICAgICAgIHsga2V5OiAndXNlcnMnLCBsYWJlbDogJ1VzZXJzJyB9LFxuICAgICAgICAgICAgICAgIHsga2V5OiAnY29udmVyc2lvbnMnLCBsYWJlbDogJ0NvbnZlcnNpb25zJyB9LFxuICAgICAgICAgICAgICAgIHsga2V5OiAnY3RyJywgbGFiZWw6ICdDVFInIH0sXG4gICAgICAgICAgICAgICAgeyBrZXk6ICdjb3N0JywgbGFiZWw6ICdDb3N0JyB9LFxuICAgICAgICAgICAgICBdLm1hcCgoeyBrZXksIGxhYmVsIH0pID0+IChcbiAgICAgICAgICAgICAgICA8dGhcbiAgICAgICAgICAgICAgICAgIGtleT17a2V5fVxuICAgICAgICAgICAgICAgICAgb25DbGljaz17KCkgPT4gaGFuZGxlU29ydChrZXkgYXMgU29ydEZpZWxkKX1cbiAgICAgICAgICAgICAgICAgIGNsYXNzTmFtZT1cInB4LTQgcHktMyB0ZXh0LWxlZnQgdGV4dC1zbSBmb250LW1lZGl1bSB0ZXh0LWdyYXktNzAwIGRhcms6dGV4dC1ncmF5LTMwMCBjdXJzb3ItcG9pbnRlciBob3ZlcjpiZy1ncmF5LTUwIGRhcms6aG92ZXI6YmctZ3JheS04MDAvNTAgdHJhbnNpdGlvbi1jb2xvcnNcIlxuICAgICAgICAgICAgICAgID5cbiAgICAgICAgICAgICAgICAgIDxkaXYgY2xhc3NOYW1lPVwiZmxleCBpdGVtcy1jZW50ZXIgc3BhY2UteC0xXCI+XG4gICAgICAgICAgICAgICAgICAgIDxzcGFuPntsYWJlbH08L3NwYW4+XG4gICAgICAgICAgICAgICAgICAgIDxTb3J0SWNvbiBmaWVsZD17a2V5IGFzIFNvcnRGaWVsZH0gLz5cbiAgICAgICAgICAgICAgICAgIDwvZGl2PlxuICAgICAgICAgICAgICAgIDwvdGg+XG4gICAgICAgICAgICAgICkpfVxuICAgICAgICAgICAgPC90cj5cbiAgICAgICAgICA8L3RoZWFkPlxuICAgICAgICAgIDx0Ym9keSBjbGFzc05hbWU9XCJkaXZpZGUteSBkaXZpZGUtZ3JheS0yMDAgZGFyazpkaXZpZGUtZ3JheS03MDBcIj5cbiAgICAgICAgICAgIHtwYWdpbmF0ZWREYXRhLm1hcCgoaXRlbSwgaW5kZXgpID0+IChcbiAgICAgICAgICAgICAgPG1vdGlvbi50clxuICAgICAgICAgICAgICAgIGtleT17aXRlbS5jYW1wYWlnbn1cbiAgICAgICAgICAgICAgICBpbml0aWFsPXt7IG9wYWNpdHk6IDAgfX1cbiAgICAgICAgICAgICAgICBhbmltYXRlPXt7IG9wYWNpdHk6IDEgfX1cbiAgICAgICAgICAgICAgICB0cmFuc2l0aW9uPXt7IGRlbGF5OiBpbmRleCAqIDAuMDUgfX1cbiAgICAgICAgICAgICAgICBjbGFzc05hbWU9XCJob3ZlcjpiZy1ncmF5LTUwIGRhcms6aG92ZXI6YmctZ3JheS04MDAvNTAgdHJhbnNpdGlvbi1jb2xvcnNcIlxuICAgICAgICAgICAgICA+XG4gICAgICAgICAgICAgICAgPHRkIGNsYXNzTmFtZT1cInB4LTQgcHktMyB0ZXh0LXNtIGZvbnQtbWVkaXVtIHRleHQtZ3JheS05MDAgZGFyazp0ZXh0LXdoaXRlXCI+XG4gICAgICAgICAgICAgICAgICB7aXRlbS5jYW1wYWlnbn1cbiAgICAgICAgICAgICAgICA8L3RkPlxuICAgICAgICAgICAgICAgIDx0ZCBjbGFzc05hbWU9XCJweC00IHB5LTMgdGV4dC1zbSB0ZXh0LWdyYXktNzAwIGRhcms6dGV4dC1ncmF5LTMwMFwiPlxuICAgICAgICAgICAgICAgICAge2Zvcm1hdEN1cnJlbmN5KGl0ZW0ucmV2ZW51ZSl9XG4gICAgICAgICAgICAgICAgPC90ZD5cbiAgICAgICAgICAgICAgICA8dGQgY2xhc3NOYW1lPVwicHgtNCBweS0zIHRleHQtc20gdGV4dC1ncmF5LTcwMCBkYXJrOnRleHQtZ3JheS0zMDBcIj5cbiAgICAgICAgICAgICAgICAgIHtmb3JtYXROdW1iZXIoaXRlbS51c2Vycyl9XG4gICAgICAgICAgICAgICAgPC90ZD5cbiAgICAgICAgICAgICAgICA8dGQgY2xhc3NOYW1lPVwicHgtNCBweS0zIHRleHQtc20gdGV4dC1ncmF5LTcwMCBkYXJrOnRleHQtZ3JheS0zMDBcIj5cbiAgICAgICAgICAgICAgICAgIHtmb3JtYXROdW1iZXIoaXRlbS5jb252ZXJzaW9ucyl9XG4gICAgICAgICAgICAgICAgPC90ZD5cbiAgICAgICAgICAgICAgICA8dGQgY2xhc3NOYW1lPVwicHgtNCBweS0zIHRleHQtc20gdGV4dC1ncmF5LTcwMCBkYXJrOnRleHQtZ3JheS0zMDBcIj5cbiAgICAgICAgICAgICAgICAgIHtmb3JtYXRQZXJjZW50YWdlKGl0ZW0uY3RyKX1cbiAgICAgICAgICAgICAgICA8L3RkPlxuICAgICAgICAgICAgICAgIDx0ZCBjbGFzc05hbWU9XCJweC00IHB5LTMgdGV4dC1zbSB0ZXh0LWdyYXktNzAwIGRhcms6dGV4dC1ncmF5LTMwMFwiPlxuICAgICAgICAgICAgICAgICAge2Zvcm1hdEN1cnJlbmN5KGl0ZW0uY29zdCl9XG4gICAgICAgICAgICAgICAgPC90ZD5cbiAgICAgICAgICAgICAgPC9tb3Rpb24udHI+XG4gICAgICAgICAgICApKX1cbiAgICAgICAgICA8L3Rib2R5PlxuICAgICAgICA8L3RhYmxlPlxuICAgICAgPC9kaXY+XG5cbiAgICAgIHsvKiBQYWdpbmF0aW9uICovfVxuICAgICAge3RvdGFsUGFnZXMgPiAxICYmIChcbiAgICAgICAgPGRpdiBjbGFzc05hbWU9XCJmbGV4IGl0ZW1zLWNlbnRlciBqdXN0aWZ5LWJldHdlZW4gbXQtNlwiPlxuICAgICAgICAgIDxkaXYgY2xhc3NOYW1lPVwidGV4dC1zbSB0ZXh0LWdyYXktNzAwIGRhcms6dGV4dC1ncmF5LTMwMFwiPlxuICAgICAgICAgICAgU2hvd2luZyB7KGN1cnJlbnRQYWdlIC0gMSkgKiBpdGVtc1BlclBhZ2UgKyAxfSB0b3snICd9XG4gICAgICAgICAgICB7TWF0aC5taW4oY3VycmVudFBhZ2UgKiBpdGVtc1BlclBhZ2UsIGZpbHRlcmVkQW5kU29ydGVkRGF0YS5sZW5ndGgpfSBvZnsnICd9XG4gICAgICAgICAgICB7ZmlsdGVyZWRBbmRTb3J0ZWREYXRhLmxlbmd0aH0gcmVzdWx0c1xuICAgICAgICAgIDwvZGl2PlxuICAgICAgICAgIDxkaXYgY2xhc3NOYW1lPVwiZmxleCBpdGVtcy1jZW50ZXIgc3BhY2UteC0yXCI+XG4gICAgICAgICAgICA8YnV0dG9uXG4gICAgICAgICAgICAgIG9uQ2xpY2s9eygpID0+IHNldEN1cnJlbnRQYWdlKE1hdGgubWF4KDEsIGN1cnJlbnRQYWdlIC0gMSkpfVxuICAgICAgICAgICAgICBkaXNhYmxlZD17Y3VycmVudFBhZ2UgPT09IDF9XG4gICAgICAgICAgICAgIGNsYXNzTmFtZT1cInB4LTMgcHktMiB0ZXh0LXNtIGJvcmRlciBib3JkZXItZ3JheS0zMDAgZGFyazpib3JkZXItZ3JheS02MDAgcm91bmRlZC1sZyBob3ZlcjpiZy1ncmF5LTUwIGRhcms6aG92ZXI6YmctZ3JheS04MDAgZGlzYWJsZWQ6b3BhY2l0eS01MCBkaXNhYmxlZDpjdXJzb3Itbm90LWFsbG93ZWQgdHJhbnNpdGlvbi1jb2xvcnNcIlxuICAgICAgICAgICAgPlxuICAgICAgICAgICAgICBQcmV2aW91c1xuICAgICAgICAgICAgPC9idXR0b24+XG4gICAgICAgICAgICA8c3BhbiBjbGFzc05hbWU9XCJ0ZXh0LXNtIHRleHQtZ3JheS03MDAgZGFyazp0ZXh0LWdyYXktMzAwXCI+XG4gICAgICAgICAgICAgIFBhZ2Uge2N1cnJlbnRQYWdlfSBvZiB7dG90YWxQYWdlc31cbiAgICAgICAgICAgIDwvc3Bhbj5cbiAgICAgICAgICAgIDxidXR0b25cbiAgICAgICAgICAgICAgb25DbGljaz17KCkgPT4gc2V0Q3VycmVudFBhZ2UoTWF0aC5taW4odG90YWxQYWdlcywgY3VycmVudFBhZ2UgKyAxKSl9XG4gICAgICAgICAgICAgIGRpc2FibGVkPXtjdXJyZW50UGFnZSA9PT0gdG90YWxQYWdlc31cbiAgICAgICAgICAgICAgY2xhc3NOYW1lPVwicHgtMyBweS0yIHRleHQtc20gYm9yZGVyIGJvcmRlci1ncmF5LTMwMCBkYXJrOmJvcmRlci1ncmF5LTYwMCByb3VuZGVkLWxnIGhvdmVyOmJnLWdyYXktNTAgZGFyazpob3ZlcjpiZy1ncmF5LTgwMCBkaXNhYmxlZDpvcGFjaXR5LTUwIGRpc2FibGVkOmN1cnNvci1ub3QtYWxsb3dlZCB0cmFuc2l0aW9uLWNvbG9yc1wiXG4gICAgICAgICAgICA+XG4gICAgICAgICAgICAgIE5leHRcbiAgICAgICAgICAgIDwvYnV0dG9uPlxuICAgICAgICAgIDwvZGl2PlxuICAgICAgICA8L2Rpdj5cbiAgICAgICl9XG4gICAgPC9tb3Rpb24uZGl2PlxuICApO1xufVxuIl0sIm5hbWVzIjpbInVzZVN0YXRlIiwidXNlTWVtbyIsIm1vdGlvbiIsIlNlYXJjaCIsIkRvd25sb2FkIiwiQ2hldnJvblVwIiwiQ2hldnJvbkRvd24iLCJGaWx0ZXIiLCJYIiwiZm9ybWF0Q3VycmVuY3kiLCJmb3JtYXROdW1iZXIiLCJmb3JtYXRQZXJjZW50YWdlIiwiZXhwb3J0VG9DU1YiLCJEYXRhVGFibGUiLCJkYXRhIiwic2VhcmNoVGVybSIsInNldFNlYXJjaFRlcm0iLCJzb3J0RmllbGQiLCJzZXRTb3J0RmllbGQiLCJzb3J0RGlyZWN0aW9uIiwic2V0U29ydERpcmVjdGlvbiIsImN1cnJlbnRQYWdlIiwic2V0Q3VycmVudFBhZ2UiLCJzaG93RmlsdGVycyIsInNldFNob3dGaWx0ZXJzIiwibWluUmV2ZW51ZSIsInNldE1pblJldmVudWUiLCJtYXhSZXZlbnVlIiwic2V0TWF4UmV2ZW51ZSIsIml0ZW1zUGVyUGFnZSIsImZpbHRlcmVkQW5kU29ydGVkRGF0YSIsImZpbHRlcmVkIiwiZmlsdGVyIiwiaXRlbSIsImNhbXBhaWduIiwidG9Mb3dlckNhc2UiLCJpbmNsdWRlcyIsInJldmVudWUiLCJwYXJzZUludCIsInNvcnQiLCJhIiwiYiIsImFWYWx1ZSIsImJWYWx1ZSIsImxvY2FsZUNvbXBhcmUiLCJ0b3RhbFBhZ2VzIiwiTWF0aCIsImNlaWwiLCJsZW5ndGgiLCJwYWdpbmF0ZWREYXRhIiwic2xpY2UiLCJoYW5kbGVTb3J0IiwiZmllbGQiLCJoYW5kbGVFeHBvcnQiLCJjbGVhckZpbHRlcnMiLCJTb3J0SWNvbiIsImNsYXNzTmFtZSIsImRpdiIsImluaXRpYWwiLCJvcGFjaXR5IiwieSIsImFuaW1hdGUiLCJ0cmFuc2l0aW9uIiwiZHVyYXRpb24iLCJkZWxheSIsImgzIiwiYnV0dG9uIiwib25DbGljayIsInNwYW4iLCJoZWlnaHQiLCJleGl0IiwibGFiZWwiLCJpbnB1dCIsInR5cGUiLCJ2YWx1ZSIsIm9uQ2hhbmdlIiwiZSIsInRhcmdldCIsInBsYWNlaG9sZGVyIiwidGFibGUiLCJ0aGVhZCIsInRyIiwia2V5IiwibWFwIiwidGgiLCJ0Ym9keSIsImluZGV4IiwidGQiLCJ1c2VycyIsImNvbnZlcnNpb25zIiwiY3RyIiwiY29zdCIsIm1pbiIsIm1heCIsImRpc2FibGVkIl0sInNvdXJjZVJvb3QiOiIifQ==\n//# sourceURL=webpack-internal:///(ssr)/./components/DataTable.tsx\n");
-
-/***/ }),
-
-/***/ "(ssr)/./components/LoadingSkeleton.tsx":
-/*!****************************************!*\
-  !*** ./components/LoadingSkeleton.tsx ***!
-  \****************************************/
-/***/ ((__unused_webpack_module, __webpack_exports__, __webpack_require__) => {
-
-"use strict";
-eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   CardSkeleton: () => (/* binding */ CardSkeleton),\n/* harmony export */   ChartSkeleton: () => (/* binding */ ChartSkeleton),\n/* harmony export */   LoadingSkeleton: () => (/* binding */ LoadingSkeleton)\n/* harmony export */ });\n/* harmony import */ var react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! react/jsx-dev-runtime */ \"(ssr)/./node_modules/next/dist/server/future/route-modules/app-page/vendored/ssr/react-jsx-dev-runtime.js\");\n/* harmony import */ var react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0___default = /*#__PURE__*/__webpack_require__.n(react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__);\n/* harmony import */ var _lib_utils__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! @/lib/utils */ \"(ssr)/./lib/utils.ts\");\n/* __next_internal_client_entry_do_not_use__ LoadingSkeleton,CardSkeleton,ChartSkeleton auto */ \n\nfunction LoadingSkeleton({ className, rows = 1 }) {\n    return /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n        className: (0,_lib_utils__WEBPACK_IMPORTED_MODULE_1__.cn)(\"animate-pulse\", className),\n        children: Array.from({\n            length: rows\n        }).map((_, i)=>/*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                className: \"h-4 bg-gray-300 dark:bg-gray-700 rounded mb-2 last:mb-0\"\n            }, i, false, {\n                fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\LoadingSkeleton.tsx\",\n                lineNumber: 14,\n                columnNumber: 9\n            }, this))\n    }, void 0, false, {\n        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\LoadingSkeleton.tsx\",\n        lineNumber: 12,\n        columnNumber: 5\n    }, this);\n}\nfunction CardSkeleton() {\n    return /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n        className: \"glass-effect rounded-xl p-6 animate-pulse\",\n        children: /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n            className: \"flex items-center space-x-3\",\n            children: [\n                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                    className: \"w-10 h-10 bg-gray-300 dark:bg-gray-700 rounded-lg\"\n                }, void 0, false, {\n                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\LoadingSkeleton.tsx\",\n                    lineNumber: 27,\n                    columnNumber: 9\n                }, this),\n                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                    className: \"flex-1\",\n                    children: [\n                        /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                            className: \"h-4 bg-gray-300 dark:bg-gray-700 rounded mb-2\"\n                        }, void 0, false, {\n                            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\LoadingSkeleton.tsx\",\n                            lineNumber: 29,\n                            columnNumber: 11\n                        }, this),\n                        /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                            className: \"h-6 bg-gray-300 dark:bg-gray-700 rounded w-24\"\n                        }, void 0, false, {\n                            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\LoadingSkeleton.tsx\",\n                            lineNumber: 30,\n                            columnNumber: 11\n                        }, this)\n                    ]\n                }, void 0, true, {\n                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\LoadingSkeleton.tsx\",\n                    lineNumber: 28,\n                    columnNumber: 9\n                }, this)\n            ]\n        }, void 0, true, {\n            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\LoadingSkeleton.tsx\",\n            lineNumber: 26,\n            columnNumber: 7\n        }, this)\n    }, void 0, false, {\n        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\LoadingSkeleton.tsx\",\n        lineNumber: 25,\n        columnNumber: 5\n    }, this);\n}\nfunction ChartSkeleton() {\n    return /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n        className: \"glass-effect rounded-xl p-6 animate-pulse\",\n        children: [\n            /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                className: \"h-4 bg-gray-300 dark:bg-gray-700 rounded mb-4 w-32\"\n            }, void 0, false, {\n                fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\LoadingSkeleton.tsx\",\n                lineNumber: 40,\n                columnNumber: 7\n            }, this),\n            /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                className: \"h-64 bg-gray-300 dark:bg-gray-700 rounded\"\n            }, void 0, false, {\n                fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\LoadingSkeleton.tsx\",\n                lineNumber: 41,\n                columnNumber: 7\n            }, this)\n        ]\n    }, void 0, true, {\n        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\LoadingSkeleton.tsx\",\n        lineNumber: 39,\n        columnNumber: 5\n    }, this);\n}\n//# sourceURL=[module]\n//# sourceMappingURL=data:application/json;charset=utf-8;base64,eyJ2ZXJzaW9uIjozLCJmaWxlIjoiKHNzcikvLi9jb21wb25lbnRzL0xvYWRpbmdTa2VsZXRvbi50c3giLCJtYXBwaW5ncyI6Ijs7Ozs7Ozs7OztBQUVpQztBQU8xQixTQUFTQyxnQkFBZ0IsRUFBRUMsU0FBUyxFQUFFQyxPQUFPLENBQUMsRUFBd0I7SUFDM0UscUJBQ0UsOERBQUNDO1FBQUlGLFdBQVdGLDhDQUFFQSxDQUFDLGlCQUFpQkU7a0JBQ2pDRyxNQUFNQyxJQUFJLENBQUM7WUFBRUMsUUFBUUo7UUFBSyxHQUFHSyxHQUFHLENBQUMsQ0FBQ0MsR0FBR0Msa0JBQ3BDLDhEQUFDTjtnQkFFQ0YsV0FBVTtlQURMUTs7Ozs7Ozs7OztBQU1mO0FBRU8sU0FBU0M7SUFDZCxxQkFDRSw4REFBQ1A7UUFBSUYsV0FBVTtrQkFDYiw0RUFBQ0U7WUFBSUYsV0FBVTs7OEJBQ2IsOERBQUNFO29CQUFJRixXQUFVOzs7Ozs7OEJBQ2YsOERBQUNFO29CQUFJRixXQUFVOztzQ0FDYiw4REFBQ0U7NEJBQUlGLFdBQVU7Ozs7OztzQ0FDZiw4REFBQ0U7NEJBQUlGLFdBQVU7Ozs7Ozs7Ozs7Ozs7Ozs7Ozs7Ozs7O0FBS3pCO0FBRU8sU0FBU1U7SUFDZCxxQkFDRSw4REFBQ1I7UUFBSUYsV0FBVTs7MEJBQ2IsOERBQUNFO2dCQUFJRixXQUFVOzs7Ozs7MEJBQ2YsOERBQUNFO2dCQUFJRixXQUFVOzs7Ozs7Ozs7Ozs7QUFHckIiLCJzb3VyY2VzIjpbIndlYnBhY2s6Ly9hZG15YnJhbmQtaW5zaWdodHMvLi9jb21wb25lbnRzL0xvYWRpbmdTa2VsZXRvbi50c3g/ODJkMCJdLCJzb3VyY2VzQ29udGVudCI6WyIndXNlIGNsaWVudCc7XG5cbmltcG9ydCB7IGNuIH0gZnJvbSAnQC9saWIvdXRpbHMnO1xuXG5pbnRlcmZhY2UgTG9hZGluZ1NrZWxldG9uUHJvcHMge1xuICBjbGFzc05hbWU/OiBzdHJpbmc7XG4gIHJvd3M/OiBudW1iZXI7XG59XG5cbmV4cG9ydCBmdW5jdGlvbiBMb2FkaW5nU2tlbGV0b24oeyBjbGFzc05hbWUsIHJvd3MgPSAxIH06IExvYWRpbmdTa2VsZXRvblByb3BzKSB7XG4gIHJldHVybiAoXG4gICAgPGRpdiBjbGFzc05hbWU9e2NuKFwiYW5pbWF0ZS1wdWxzZVwiLCBjbGFzc05hbWUpfT5cbiAgICAgIHtBcnJheS5mcm9tKHsgbGVuZ3RoOiByb3dzIH0pLm1hcCgoXywgaSkgPT4gKFxuICAgICAgICA8ZGl2XG4gICAgICAgICAga2V5PXtpfVxuICAgICAgICAgIGNsYXNzTmFtZT1cImgtNCBiZy1ncmF5LTMwMCBkYXJrOmJnLWdyYXktNzAwIHJvdW5kZWQgbWItMiBsYXN0Om1iLTBcIlxuICAgICAgICAvPlxuICAgICAgKSl9XG4gICAgPC9kaXY+XG4gICk7XG59XG5cbmV4cG9ydCBmdW5jdGlvbiBDYXJkU2tlbGV0b24oKSB7XG4gIHJldHVybiAoXG4gICAgPGRpdiBjbGFzc05hbWU9XCJnbGFzcy1lZmZlY3Qgcm91bmRlZC14bCBwLTYgYW5pbWF0ZS1wdWxzZVwiPlxuICAgICAgPGRpdiBjbGFzc05hbWU9XCJmbGV4IGl0ZW1zLWNlbnRlciBzcGFjZS14LTNcIj5cbiAgICAgICAgPGRpdiBjbGFzc05hbWU9XCJ3LTEwIGgtMTAgYmctZ3JheS0zMDAgZGFyazpiZy1ncmF5LTcwMCByb3VuZGVkLWxnXCIgLz5cbiAgICAgICAgPGRpdiBjbGFzc05hbWU9XCJmbGV4LTFcIj5cbiAgICAgICAgICA8ZGl2IGNsYXNzTmFtZT1cImgtNCBiZy1ncmF5LTMwMCBkYXJrOmJnLWdyYXktNzAwIHJvdW5kZWQgbWItMlwiIC8+XG4gICAgICAgICAgPGRpdiBjbGFzc05hbWU9XCJoLTYgYmctZ3JheS0zMDAgZGFyazpiZy1ncmF5LTcwMCByb3VuZGVkIHctMjRcIiAvPlxuICAgICAgICA8L2Rpdj5cbiAgICAgIDwvZGl2PlxuICAgIDwvZGl2PlxuICApO1xufVxuXG5leHBvcnQgZnVuY3Rpb24gQ2hhcnRTa2VsZXRvbigpIHtcbiAgcmV0dXJuIChcbiAgICA8ZGl2IGNsYXNzTmFtZT1cImdsYXNzLWVmZmVjdCByb3VuZGVkLXhsIHAtNiBhbmltYXRlLXB1bHNlXCI+XG4gICAgICA8ZGl2IGNsYXNzTmFtZT1cImgtNCBiZy1ncmF5LTMwMCBkYXJrOmJnLWdyYXktNzAwIHJvdW5kZWQgbWItNCB3LTMyXCIgLz5cbiAgICAgIDxkaXYgY2xhc3NOYW1lPVwiaC02NCBiZy1ncmF5LTMwMCBkYXJrOmJnLWdyYXktNzAwIHJvdW5kZWRcIiAvPlxuICAgIDwvZGl2PlxuICApO1xufVxuIl0sIm5hbWVzIjpbImNuIiwiTG9hZGluZ1NrZWxldG9uIiwiY2xhc3NOYW1lIiwicm93cyIsImRpdiIsIkFycmF5IiwiZnJvbSIsImxlbmd0aCIsIm1hcCIsIl8iLCJpIiwiQ2FyZFNrZWxldG9uIiwiQ2hhcnRTa2VsZXRvbiJdLCJzb3VyY2VSb290IjoiIn0=\n//# sourceURL=webpack-internal:///(ssr)/./components/LoadingSkeleton.tsx\n");
-
-/***/ }),
-
-/***/ "(ssr)/./components/MetricCard.tsx":
-/*!***********************************!*\
-  !*** ./components/MetricCard.tsx ***!
-  \***********************************/
-/***/ ((__unused_webpack_module, __webpack_exports__, __webpack_require__) => {
-
-"use strict";
-eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   MetricCard: () => (/* binding */ MetricCard)\n/* harmony export */ });\n/* harmony import */ var react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! react/jsx-dev-runtime */ \"(ssr)/./node_modules/next/dist/server/future/route-modules/app-page/vendored/ssr/react-jsx-dev-runtime.js\");\n/* harmony import */ var react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0___default = /*#__PURE__*/__webpack_require__.n(react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__);\n/* harmony import */ var framer_motion__WEBPACK_IMPORTED_MODULE_2__ = __webpack_require__(/*! framer-motion */ \"(ssr)/./node_modules/framer-motion/dist/es/render/components/motion/proxy.mjs\");\n/* harmony import */ var _barrel_optimize_names_TrendingDown_TrendingUp_lucide_react__WEBPACK_IMPORTED_MODULE_3__ = __webpack_require__(/*! __barrel_optimize__?names=TrendingDown,TrendingUp!=!lucide-react */ \"(ssr)/./node_modules/lucide-react/dist/esm/icons/trending-up.js\");\n/* harmony import */ var _barrel_optimize_names_TrendingDown_TrendingUp_lucide_react__WEBPACK_IMPORTED_MODULE_4__ = __webpack_require__(/*! __barrel_optimize__?names=TrendingDown,TrendingUp!=!lucide-react */ \"(ssr)/./node_modules/lucide-react/dist/esm/icons/trending-down.js\");\n/* harmony import */ var _lib_utils__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! @/lib/utils */ \"(ssr)/./lib/utils.ts\");\n/* __next_internal_client_entry_do_not_use__ MetricCard auto */ \n\n\n\nfunction MetricCard({ title, value, change, icon, className }) {\n    const isPositive = change && change > 0;\n    const isNegative = change && change < 0;\n    return /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(framer_motion__WEBPACK_IMPORTED_MODULE_2__.motion.div, {\n        initial: {\n            opacity: 0,\n            y: 20\n        },\n        animate: {\n            opacity: 1,\n            y: 0\n        },\n        transition: {\n            duration: 0.3\n        },\n        className: (0,_lib_utils__WEBPACK_IMPORTED_MODULE_1__.cn)(\"glass-effect rounded-xl p-6 hover:scale-105 transition-all duration-200\", className),\n        children: /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n            className: \"flex items-center justify-between\",\n            children: [\n                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                    className: \"flex items-center space-x-3\",\n                    children: [\n                        /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                            className: \"p-2 rounded-lg bg-blue-500/20 text-blue-600 dark:text-blue-400\",\n                            children: icon\n                        }, void 0, false, {\n                            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\MetricCard.tsx\",\n                            lineNumber: 31,\n                            columnNumber: 11\n                        }, this),\n                        /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                            children: [\n                                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"p\", {\n                                    className: \"text-sm text-gray-600 dark:text-gray-400\",\n                                    children: title\n                                }, void 0, false, {\n                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\MetricCard.tsx\",\n                                    lineNumber: 35,\n                                    columnNumber: 13\n                                }, this),\n                                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"p\", {\n                                    className: \"text-2xl font-bold text-gray-900 dark:text-white\",\n                                    children: value\n                                }, void 0, false, {\n                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\MetricCard.tsx\",\n                                    lineNumber: 36,\n                                    columnNumber: 13\n                                }, this)\n                            ]\n                        }, void 0, true, {\n                            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\MetricCard.tsx\",\n                            lineNumber: 34,\n                            columnNumber: 11\n                        }, this)\n                    ]\n                }, void 0, true, {\n                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\MetricCard.tsx\",\n                    lineNumber: 30,\n                    columnNumber: 9\n                }, this),\n                change !== undefined && /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                    className: (0,_lib_utils__WEBPACK_IMPORTED_MODULE_1__.cn)(\"flex items-center space-x-1 text-sm font-medium\", isPositive && \"text-green-600\", isNegative && \"text-red-600\", !isPositive && !isNegative && \"text-gray-600\"),\n                    children: [\n                        isPositive && /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_TrendingDown_TrendingUp_lucide_react__WEBPACK_IMPORTED_MODULE_3__[\"default\"], {\n                            className: \"w-4 h-4\"\n                        }, void 0, false, {\n                            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\MetricCard.tsx\",\n                            lineNumber: 46,\n                            columnNumber: 28\n                        }, this),\n                        isNegative && /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_TrendingDown_TrendingUp_lucide_react__WEBPACK_IMPORTED_MODULE_4__[\"default\"], {\n                            className: \"w-4 h-4\"\n                        }, void 0, false, {\n                            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\MetricCard.tsx\",\n                            lineNumber: 47,\n                            columnNumber: 28\n                        }, this),\n                        /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"span\", {\n                            children: [\n                                Math.abs(change).toFixed(1),\n                                \"%\"\n                            ]\n                        }, void 0, true, {\n                            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\MetricCard.tsx\",\n                            lineNumber: 48,\n                            columnNumber: 13\n                        }, this)\n                    ]\n                }, void 0, true, {\n                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\MetricCard.tsx\",\n                    lineNumber: 40,\n                    columnNumber: 11\n                }, this)\n            ]\n        }, void 0, true, {\n            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\MetricCard.tsx\",\n            lineNumber: 29,\n            columnNumber: 7\n        }, this)\n    }, void 0, false, {\n        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\MetricCard.tsx\",\n        lineNumber: 20,\n        columnNumber: 5\n    }, this);\n}\n//# sourceURL=[module]\n//# sourceMappingURL=data:application/json;charset=utf-8;base64,eyJ2ZXJzaW9uIjozLCJmaWxlIjoiKHNzcikvLi9jb21wb25lbnRzL01ldHJpY0NhcmQudHN4IiwibWFwcGluZ3MiOiI7Ozs7Ozs7Ozs7O0FBRXVDO0FBQ2lCO0FBQ3ZCO0FBVTFCLFNBQVNJLFdBQVcsRUFBRUMsS0FBSyxFQUFFQyxLQUFLLEVBQUVDLE1BQU0sRUFBRUMsSUFBSSxFQUFFQyxTQUFTLEVBQW1CO0lBQ25GLE1BQU1DLGFBQWFILFVBQVVBLFNBQVM7SUFDdEMsTUFBTUksYUFBYUosVUFBVUEsU0FBUztJQUV0QyxxQkFDRSw4REFBQ1AsaURBQU1BLENBQUNZLEdBQUc7UUFDVEMsU0FBUztZQUFFQyxTQUFTO1lBQUdDLEdBQUc7UUFBRztRQUM3QkMsU0FBUztZQUFFRixTQUFTO1lBQUdDLEdBQUc7UUFBRTtRQUM1QkUsWUFBWTtZQUFFQyxVQUFVO1FBQUk7UUFDNUJULFdBQVdOLDhDQUFFQSxDQUNYLDJFQUNBTTtrQkFHRiw0RUFBQ0c7WUFBSUgsV0FBVTs7OEJBQ2IsOERBQUNHO29CQUFJSCxXQUFVOztzQ0FDYiw4REFBQ0c7NEJBQUlILFdBQVU7c0NBQ1pEOzs7Ozs7c0NBRUgsOERBQUNJOzs4Q0FDQyw4REFBQ087b0NBQUVWLFdBQVU7OENBQTRDSjs7Ozs7OzhDQUN6RCw4REFBQ2M7b0NBQUVWLFdBQVU7OENBQW9ESDs7Ozs7Ozs7Ozs7Ozs7Ozs7O2dCQUdwRUMsV0FBV2EsMkJBQ1YsOERBQUNSO29CQUFJSCxXQUFXTiw4Q0FBRUEsQ0FDaEIsbURBQ0FPLGNBQWMsa0JBQ2RDLGNBQWMsZ0JBQ2QsQ0FBQ0QsY0FBYyxDQUFDQyxjQUFjOzt3QkFFN0JELDRCQUFjLDhEQUFDVCxtR0FBVUE7NEJBQUNRLFdBQVU7Ozs7Ozt3QkFDcENFLDRCQUFjLDhEQUFDVCxtR0FBWUE7NEJBQUNPLFdBQVU7Ozs7OztzQ0FDdkMsOERBQUNZOztnQ0FBTUMsS0FBS0MsR0FBRyxDQUFDaEIsUUFBUWlCLE9BQU8sQ0FBQztnQ0FBRzs7Ozs7Ozs7Ozs7Ozs7Ozs7Ozs7Ozs7O0FBTS9DIiwic291cmNlcyI6WyJ3ZWJwYWNrOi8vYWRteWJyYW5kLWluc2lnaHRzLy4vY29tcG9uZW50cy9NZXRyaWNDYXJkLnRzeD84NjQ3Il0sInNvdXJjZXNDb250ZW50IjpbIid1c2UgY2xpZW50JztcblxuaW1wb3J0IHsgbW90aW9uIH0gZnJvbSAnZnJhbWVyLW1vdGlvbic7XG5pbXBvcnQgeyBUcmVuZGluZ1VwLCBUcmVuZGluZ0Rvd24gfSBmcm9tICdsdWNpZGUtcmVhY3QnO1xuaW1wb3J0IHsgY24gfSBmcm9tICdAL2xpYi91dGlscyc7XG5cbmludGVyZmFjZSBNZXRyaWNDYXJkUHJvcHMge1xuICB0aXRsZTogc3RyaW5nO1xuICB2YWx1ZTogc3RyaW5nO1xuICBjaGFuZ2U/OiBudW1iZXI7XG4gIGljb246IFJlYWN0LlJlYWN0Tm9kZTtcbiAgY2xhc3NOYW1lPzogc3RyaW5nO1xufVxuXG5leHBvcnQgZnVuY3Rpb24gTWV0cmljQ2FyZCh7IHRpdGxlLCB2YWx1ZSwgY2hhbmdlLCBpY29uLCBjbGFzc05hbWUgfTogTWV0cmljQ2FyZFByb3BzKSB7XG4gIGNvbnN0IGlzUG9zaXRpdmUgPSBjaGFuZ2UgJiYgY2hhbmdlID4gMDtcbiAgY29uc3QgaXNOZWdhdGl2ZSA9IGNoYW5nZSAmJiBjaGFuZ2UgPCAwO1xuXG4gIHJldHVybiAoXG4gICAgPG1vdGlvbi5kaXZcbiAgICAgIGluaXRpYWw9e3sgb3BhY2l0eTogMCwgeTogMjAgfX1cbiAgICAgIGFuaW1hdGU9e3sgb3BhY2l0eTogMSwgeTogMCB9fVxuICAgICAgdHJhbnNpdGlvbj17eyBkdXJhdGlvbjogMC4zIH19XG4gICAgICBjbGFzc05hbWU9e2NuKFxuICAgICAgICBcImdsYXNzLWVmZmVjdCByb3VuZGVkLXhsIHAtNiBob3ZlcjpzY2FsZS0xMDUgdHJhbnNpdGlvbi1hbGwgZHVyYXRpb24tMjAwXCIsXG4gICAgICAgIGNsYXNzTmFtZVxuICAgICAgKX1cbiAgICA+XG4gICAgICA8ZGl2IGNsYXNzTmFtZT1cImZsZXggaXRlbXMtY2VudGVyIGp1c3RpZnktYmV0d2VlblwiPlxuICAgICAgICA8ZGl2IGNsYXNzTmFtZT1cImZsZXggaXRlbXMtY2VudGVyIHNwYWNlLXgtM1wiPlxuICAgICAgICAgIDxkaXYgY2xhc3NOYW1lPVwicC0yIHJvdW5kZWQtbGcgYmctYmx1ZS01MDAvMjAgdGV4dC1ibHVlLTYwMCBkYXJrOnRleHQtYmx1ZS00MDBcIj5cbiAgICAgICAgICAgIHtpY29ufVxuICAgICAgICAgIDwvZGl2PlxuICAgICAgICAgIDxkaXY+XG4gICAgICAgICAgICA8cCBjbGFzc05hbWU9XCJ0ZXh0LXNtIHRleHQtZ3JheS02MDAgZGFyazp0ZXh0LWdyYXktNDAwXCI+e3RpdGxlfTwvcD5cbiAgICAgICAgICAgIDxwIGNsYXNzTmFtZT1cInRleHQtMnhsIGZvbnQtYm9sZCB0ZXh0LWdyYXktOTAwIGRhcms6dGV4dC13aGl0ZVwiPnt2YWx1ZX08L3A+XG4gICAgICAgICAgPC9kaXY+XG4gICAgICAgIDwvZGl2PlxuICAgICAgICB7Y2hhbmdlICE9PSB1bmRlZmluZWQgJiYgKFxuICAgICAgICAgIDxkaXYgY2xhc3NOYW1lPXtjbihcbiAgICAgICAgICAgIFwiZmxleCBpdGVtcy1jZW50ZXIgc3BhY2UteC0xIHRleHQtc20gZm9udC1tZWRpdW1cIixcbiAgICAgICAgICAgIGlzUG9zaXRpdmUgJiYgXCJ0ZXh0LWdyZWVuLTYwMFwiLFxuICAgICAgICAgICAgaXNOZWdhdGl2ZSAmJiBcInRleHQtcmVkLTYwMFwiLFxuICAgICAgICAgICAgIWlzUG9zaXRpdmUgJiYgIWlzTmVnYXRpdmUgJiYgXCJ0ZXh0LWdyYXktNjAwXCJcbiAgICAgICAgICApfT5cbiAgICAgICAgICAgIHtpc1Bvc2l0aXZlICYmIDxUcmVuZGluZ1VwIGNsYXNzTmFtZT1cInctNCBoLTRcIiAvPn1cbiAgICAgICAgICAgIHtpc05lZ2F0aXZlICYmIDxUcmVuZGluZ0Rvd24gY2xhc3NOYW1lPVwidy00IGgtNFwiIC8+fVxuICAgICAgICAgICAgPHNwYW4+e01hdGguYWJzKGNoYW5nZSkudG9GaXhlZCgxKX0lPC9zcGFuPlxuICAgICAgICAgIDwvZGl2PlxuICAgICAgICApfVxuICAgICAgPC9kaXY+XG4gICAgPC9tb3Rpb24uZGl2PlxuICApO1xufVxuIl0sIm5hbWVzIjpbIm1vdGlvbiIsIlRyZW5kaW5nVXAiLCJUcmVuZGluZ0Rvd24iLCJjbiIsIk1ldHJpY0NhcmQiLCJ0aXRsZSIsInZhbHVlIiwiY2hhbmdlIiwiaWNvbiIsImNsYXNzTmFtZSIsImlzUG9zaXRpdmUiLCJpc05lZ2F0aXZlIiwiZGl2IiwiaW5pdGlhbCIsIm9wYWNpdHkiLCJ5IiwiYW5pbWF0ZSIsInRyYW5zaXRpb24iLCJkdXJhdGlvbiIsInAiLCJ1bmRlZmluZWQiLCJzcGFuIiwiTWF0aCIsImFicyIsInRvRml4ZWQiXSwic291cmNlUm9vdCI6IiJ9\n//# sourceURL=webpack-internal:///(ssr)/./components/MetricCard.tsx\n");
-
-/***/ }),
-
-/***/ "(ssr)/./components/Sidebar.tsx":
-/*!********************************!*\
-  !*** ./components/Sidebar.tsx ***!
-  \********************************/
-/***/ ((__unused_webpack_module, __webpack_exports__, __webpack_require__) => {
-
-"use strict";
-eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   Sidebar: () => (/* binding */ Sidebar)\n/* harmony export */ });\n/* harmony import */ var react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! react/jsx-dev-runtime */ \"(ssr)/./node_modules/next/dist/server/future/route-modules/app-page/vendored/ssr/react-jsx-dev-runtime.js\");\n/* harmony import */ var react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0___default = /*#__PURE__*/__webpack_require__.n(react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__);\n/* harmony import */ var react__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! react */ \"(ssr)/./node_modules/next/dist/server/future/route-modules/app-page/vendored/ssr/react.js\");\n/* harmony import */ var react__WEBPACK_IMPORTED_MODULE_1___default = /*#__PURE__*/__webpack_require__.n(react__WEBPACK_IMPORTED_MODULE_1__);\n/* harmony import */ var framer_motion__WEBPACK_IMPORTED_MODULE_10__ = __webpack_require__(/*! framer-motion */ \"(ssr)/./node_modules/framer-motion/dist/es/render/components/motion/proxy.mjs\");\n/* harmony import */ var _barrel_optimize_names_BarChart3_DollarSign_Home_Menu_Settings_Target_TrendingUp_Users_X_lucide_react__WEBPACK_IMPORTED_MODULE_3__ = __webpack_require__(/*! __barrel_optimize__?names=BarChart3,DollarSign,Home,Menu,Settings,Target,TrendingUp,Users,X!=!lucide-react */ \"(ssr)/./node_modules/lucide-react/dist/esm/icons/house.js\");\n/* harmony import */ var _barrel_optimize_names_BarChart3_DollarSign_Home_Menu_Settings_Target_TrendingUp_Users_X_lucide_react__WEBPACK_IMPORTED_MODULE_4__ = __webpack_require__(/*! __barrel_optimize__?names=BarChart3,DollarSign,Home,Menu,Settings,Target,TrendingUp,Users,X!=!lucide-react */ \"(ssr)/./node_modules/lucide-react/dist/esm/icons/chart-column.js\");\n/* harmony import */ var _barrel_optimize_names_BarChart3_DollarSign_Home_Menu_Settings_Target_TrendingUp_Users_X_lucide_react__WEBPACK_IMPORTED_MODULE_5__ = __webpack_require__(/*! __barrel_optimize__?names=BarChart3,DollarSign,Home,Menu,Settings,Target,TrendingUp,Users,X!=!lucide-react */ \"(ssr)/./node_modules/lucide-react/dist/esm/icons/target.js\");\n/* harmony import */ var _barrel_optimize_names_BarChart3_DollarSign_Home_Menu_Settings_Target_TrendingUp_Users_X_lucide_react__WEBPACK_IMPORTED_MODULE_6__ = __webpack_require__(/*! __barrel_optimize__?names=BarChart3,DollarSign,Home,Menu,Settings,Target,TrendingUp,Users,X!=!lucide-react */ \"(ssr)/./node_modules/lucide-react/dist/esm/icons/dollar-sign.js\");\n/* harmony import */ var _barrel_optimize_names_BarChart3_DollarSign_Home_Menu_Settings_Target_TrendingUp_Users_X_lucide_react__WEBPACK_IMPORTED_MODULE_7__ = __webpack_require__(/*! __barrel_optimize__?names=BarChart3,DollarSign,Home,Menu,Settings,Target,TrendingUp,Users,X!=!lucide-react */ \"(ssr)/./node_modules/lucide-react/dist/esm/icons/users.js\");\n/* harmony import */ var _barrel_optimize_names_BarChart3_DollarSign_Home_Menu_Settings_Target_TrendingUp_Users_X_lucide_react__WEBPACK_IMPORTED_MODULE_8__ = __webpack_require__(/*! __barrel_optimize__?names=BarChart3,DollarSign,Home,Menu,Settings,Target,TrendingUp,Users,X!=!lucide-react */ \"(ssr)/./node_modules/lucide-react/dist/esm/icons/trending-up.js\");\n/* harmony import */ var _barrel_optimize_names_BarChart3_DollarSign_Home_Menu_Settings_Target_TrendingUp_Users_X_lucide_react__WEBPACK_IMPORTED_MODULE_9__ = __webpack_require__(/*! __barrel_optimize__?names=BarChart3,DollarSign,Home,Menu,Settings,Target,TrendingUp,Users,X!=!lucide-react */ \"(ssr)/./node_modules/lucide-react/dist/esm/icons/settings.js\");\n/* harmony import */ var _barrel_optimize_names_BarChart3_DollarSign_Home_Menu_Settings_Target_TrendingUp_Users_X_lucide_react__WEBPACK_IMPORTED_MODULE_11__ = __webpack_require__(/*! __barrel_optimize__?names=BarChart3,DollarSign,Home,Menu,Settings,Target,TrendingUp,Users,X!=!lucide-react */ \"(ssr)/./node_modules/lucide-react/dist/esm/icons/x.js\");\n/* harmony import */ var _barrel_optimize_names_BarChart3_DollarSign_Home_Menu_Settings_Target_TrendingUp_Users_X_lucide_react__WEBPACK_IMPORTED_MODULE_12__ = __webpack_require__(/*! __barrel_optimize__?names=BarChart3,DollarSign,Home,Menu,Settings,Target,TrendingUp,Users,X!=!lucide-react */ \"(ssr)/./node_modules/lucide-react/dist/esm/icons/menu.js\");\n/* harmony import */ var _ThemeToggle__WEBPACK_IMPORTED_MODULE_2__ = __webpack_require__(/*! ./ThemeToggle */ \"(ssr)/./components/ThemeToggle.tsx\");\n/* __next_internal_client_entry_do_not_use__ Sidebar auto */ \n\n\n\n\nconst navigation = [\n    {\n        name: \"Dashboard\",\n        icon: _barrel_optimize_names_BarChart3_DollarSign_Home_Menu_Settings_Target_TrendingUp_Users_X_lucide_react__WEBPACK_IMPORTED_MODULE_3__[\"default\"],\n        current: true\n    },\n    {\n        name: \"Analytics\",\n        icon: _barrel_optimize_names_BarChart3_DollarSign_Home_Menu_Settings_Target_TrendingUp_Users_X_lucide_react__WEBPACK_IMPORTED_MODULE_4__[\"default\"],\n        current: false\n    },\n    {\n        name: \"Campaigns\",\n        icon: _barrel_optimize_names_BarChart3_DollarSign_Home_Menu_Settings_Target_TrendingUp_Users_X_lucide_react__WEBPACK_IMPORTED_MODULE_5__[\"default\"],\n        current: false\n    },\n    {\n        name: \"Revenue\",\n        icon: _barrel_optimize_names_BarChart3_DollarSign_Home_Menu_Settings_Target_TrendingUp_Users_X_lucide_react__WEBPACK_IMPORTED_MODULE_6__[\"default\"],\n        current: false\n    },\n    {\n        name: \"Users\",\n        icon: _barrel_optimize_names_BarChart3_DollarSign_Home_Menu_Settings_Target_TrendingUp_Users_X_lucide_react__WEBPACK_IMPORTED_MODULE_7__[\"default\"],\n        current: false\n    },\n    {\n        name: \"Trends\",\n        icon: _barrel_optimize_names_BarChart3_DollarSign_Home_Menu_Settings_Target_TrendingUp_Users_X_lucide_react__WEBPACK_IMPORTED_MODULE_8__[\"default\"],\n        current: false\n    },\n    {\n        name: \"Settings\",\n        icon: _barrel_optimize_names_BarChart3_DollarSign_Home_Menu_Settings_Target_TrendingUp_Users_X_lucide_react__WEBPACK_IMPORTED_MODULE_9__[\"default\"],\n        current: false\n    }\n];\nfunction Sidebar({ children }) {\n    const [sidebarOpen, setSidebarOpen] = (0,react__WEBPACK_IMPORTED_MODULE_1__.useState)(false);\n    return /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n        className: \"flex h-screen bg-gray-50 dark:bg-gray-900\",\n        children: [\n            sidebarOpen && /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                className: \"fixed inset-0 z-40 lg:hidden\",\n                onClick: ()=>setSidebarOpen(false),\n                children: /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                    className: \"absolute inset-0 bg-black opacity-50\"\n                }, void 0, false, {\n                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Sidebar.tsx\",\n                    lineNumber: 43,\n                    columnNumber: 11\n                }, this)\n            }, void 0, false, {\n                fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Sidebar.tsx\",\n                lineNumber: 39,\n                columnNumber: 9\n            }, this),\n            /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(framer_motion__WEBPACK_IMPORTED_MODULE_10__.motion.div, {\n                initial: false,\n                animate: {\n                    x: sidebarOpen ? 0 : \"-100%\"\n                },\n                className: `fixed inset-y-0 left-0 z-50 w-64 bg-white dark:bg-gray-800 shadow-lg lg:static lg:translate-x-0 lg:shadow-none`,\n                children: /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                    className: \"flex h-full flex-col\",\n                    children: [\n                        /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                            className: \"flex items-center justify-between px-6 py-4 border-b border-gray-200 dark:border-gray-700\",\n                            children: [\n                                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                                    className: \"flex items-center space-x-3\",\n                                    children: [\n                                        /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                                            className: \"w-8 h-8 bg-gradient-to-r from-blue-600 to-purple-600 rounded-lg flex items-center justify-center\",\n                                            children: /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_BarChart3_DollarSign_Home_Menu_Settings_Target_TrendingUp_Users_X_lucide_react__WEBPACK_IMPORTED_MODULE_4__[\"default\"], {\n                                                className: \"w-5 h-5 text-white\"\n                                            }, void 0, false, {\n                                                fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Sidebar.tsx\",\n                                                lineNumber: 60,\n                                                columnNumber: 17\n                                            }, this)\n                                        }, void 0, false, {\n                                            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Sidebar.tsx\",\n                                            lineNumber: 59,\n                                            columnNumber: 15\n                                        }, this),\n                                        /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"span\", {\n                                            className: \"text-xl font-bold text-gray-900 dark:text-white\",\n                                            children: \"ADmyBRAND\"\n                                        }, void 0, false, {\n                                            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Sidebar.tsx\",\n                                            lineNumber: 62,\n                                            columnNumber: 15\n                                        }, this)\n                                    ]\n                                }, void 0, true, {\n                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Sidebar.tsx\",\n                                    lineNumber: 58,\n                                    columnNumber: 13\n                                }, this),\n                                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"button\", {\n                                    onClick: ()=>setSidebarOpen(false),\n                                    className: \"lg:hidden p-1 rounded-md hover:bg-gray-100 dark:hover:bg-gray-700\",\n                                    children: /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_BarChart3_DollarSign_Home_Menu_Settings_Target_TrendingUp_Users_X_lucide_react__WEBPACK_IMPORTED_MODULE_11__[\"default\"], {\n                                        className: \"w-5 h-5\"\n                                    }, void 0, false, {\n                                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Sidebar.tsx\",\n                                        lineNumber: 70,\n                                        columnNumber: 15\n                                    }, this)\n                                }, void 0, false, {\n                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Sidebar.tsx\",\n                                    lineNumber: 66,\n                                    columnNumber: 13\n                                }, this)\n                            ]\n                        }, void 0, true, {\n                            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Sidebar.tsx\",\n                            lineNumber: 57,\n                            columnNumber: 11\n                        }, this),\n                        /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"nav\", {\n                            className: \"flex-1 px-4 py-6 space-y-2\",\n                            children: navigation.map((item)=>{\n                                const Icon = item.icon;\n                                return /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"a\", {\n                                    href: \"#\",\n                                    className: `flex items-center space-x-3 px-3 py-2 rounded-lg text-sm font-medium transition-colors ${item.current ? \"bg-blue-50 dark:bg-blue-900/20 text-blue-700 dark:text-blue-300\" : \"text-gray-700 dark:text-gray-300 hover:bg-gray-100 dark:hover:bg-gray-700\"}`,\n                                    children: [\n                                        /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(Icon, {\n                                            className: \"w-5 h-5\"\n                                        }, void 0, false, {\n                                            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Sidebar.tsx\",\n                                            lineNumber: 88,\n                                            columnNumber: 19\n                                        }, this),\n                                        /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"span\", {\n                                            children: item.name\n                                        }, void 0, false, {\n                                            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Sidebar.tsx\",\n                                            lineNumber: 89,\n                                            columnNumber: 19\n                                        }, this)\n                                    ]\n                                }, item.name, true, {\n                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Sidebar.tsx\",\n                                    lineNumber: 79,\n                                    columnNumber: 17\n                                }, this);\n                            })\n                        }, void 0, false, {\n                            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Sidebar.tsx\",\n                            lineNumber: 75,\n                            columnNumber: 11\n                        }, this),\n                        /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                            className: \"px-4 py-4 border-t border-gray-200 dark:border-gray-700\",\n                            children: [\n                                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                                    className: \"flex items-center justify-between\",\n                                    children: [\n                                        /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                                            className: \"text-sm text-gray-600 dark:text-gray-400\",\n                                            children: \"Theme\"\n                                        }, void 0, false, {\n                                            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Sidebar.tsx\",\n                                            lineNumber: 98,\n                                            columnNumber: 15\n                                        }, this),\n                                        /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_ThemeToggle__WEBPACK_IMPORTED_MODULE_2__.ThemeToggle, {}, void 0, false, {\n                                            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Sidebar.tsx\",\n                                            lineNumber: 101,\n                                            columnNumber: 15\n                                        }, this)\n                                    ]\n                                }, void 0, true, {\n                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Sidebar.tsx\",\n                                    lineNumber: 97,\n                                    columnNumber: 13\n                                }, this),\n                                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                                    className: \"mt-4 text-xs text-gray-500 dark:text-gray-400\",\n                                    children: \"\\xa9 2025 ADmyBRAND Insights\"\n                                }, void 0, false, {\n                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Sidebar.tsx\",\n                                    lineNumber: 103,\n                                    columnNumber: 13\n                                }, this)\n                            ]\n                        }, void 0, true, {\n                            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Sidebar.tsx\",\n                            lineNumber: 96,\n                            columnNumber: 11\n                        }, this)\n                    ]\n                }, void 0, true, {\n                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Sidebar.tsx\",\n                    lineNumber: 55,\n                    columnNumber: 9\n                }, this)\n            }, void 0, false, {\n                fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Sidebar.tsx\",\n                lineNumber: 48,\n                columnNumber: 7\n            }, this),\n            /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                className: \"flex-1 flex flex-col overflow-hidden\",\n                children: [\n                    /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"header\", {\n                        className: \"bg-white dark:bg-gray-800 shadow-sm border-b border-gray-200 dark:border-gray-700\",\n                        children: /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                            className: \"flex items-center justify-between px-6 py-4\",\n                            children: [\n                                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"button\", {\n                                    onClick: ()=>setSidebarOpen(true),\n                                    className: \"lg:hidden p-2 rounded-md hover:bg-gray-100 dark:hover:bg-gray-700\",\n                                    children: /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_BarChart3_DollarSign_Home_Menu_Settings_Target_TrendingUp_Users_X_lucide_react__WEBPACK_IMPORTED_MODULE_12__[\"default\"], {\n                                        className: \"w-5 h-5\"\n                                    }, void 0, false, {\n                                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Sidebar.tsx\",\n                                        lineNumber: 119,\n                                        columnNumber: 15\n                                    }, this)\n                                }, void 0, false, {\n                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Sidebar.tsx\",\n                                    lineNumber: 115,\n                                    columnNumber: 13\n                                }, this),\n                                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"h1\", {\n                                    className: \"text-2xl font-bold text-gray-900 dark:text-white\",\n                                    children: \"Analytics Dashboard\"\n                                }, void 0, false, {\n                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Sidebar.tsx\",\n                                    lineNumber: 121,\n                                    columnNumber: 13\n                                }, this),\n                                /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                                    className: \"flex items-center space-x-4\",\n                                    children: /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"div\", {\n                                        className: \"hidden sm:block text-sm text-gray-600 dark:text-gray-400\",\n                                        children: [\n                                            \"Last updated: \",\n                                            new Date().toLocaleTimeString()\n                                        ]\n                                    }, void 0, true, {\n                                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Sidebar.tsx\",\n                                        lineNumber: 125,\n                                        columnNumber: 15\n                                    }, this)\n                                }, void 0, false, {\n                                    fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Sidebar.tsx\",\n                                    lineNumber: 124,\n                                    columnNumber: 13\n                                }, this)\n                            ]\n                        }, void 0, true, {\n                            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Sidebar.tsx\",\n                            lineNumber: 114,\n                            columnNumber: 11\n                        }, this)\n                    }, void 0, false, {\n                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Sidebar.tsx\",\n                        lineNumber: 113,\n                        columnNumber: 9\n                    }, this),\n                    /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"main\", {\n                        className: \"flex-1 overflow-auto p-6\",\n                        children: children\n                    }, void 0, false, {\n                        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Sidebar.tsx\",\n                        lineNumber: 133,\n                        columnNumber: 9\n                    }, this)\n                ]\n            }, void 0, true, {\n                fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Sidebar.tsx\",\n                lineNumber: 111,\n                columnNumber: 7\n            }, this)\n        ]\n    }, void 0, true, {\n        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\Sidebar.tsx\",\n        lineNumber: 36,\n        columnNumber: 5\n    }, this);\n}\n//# sourceURL=[module]\n//# sourceMappingURL=data:application/json;charset=utf-8;base64,eyJ2ZXJzaW9uIjozLCJmaWxlIjoiKHNzcikvLi9jb21wb25lbnRzL1NpZGViYXIudHN4IiwibWFwcGluZ3MiOiI7Ozs7Ozs7Ozs7Ozs7Ozs7Ozs7O0FBRWlDO0FBQ007QUFXakI7QUFDc0I7QUFFNUMsTUFBTVksYUFBYTtJQUNqQjtRQUFFQyxNQUFNO1FBQWFDLE1BQU1OLDZJQUFJQTtRQUFFTyxTQUFTO0lBQUs7SUFDL0M7UUFBRUYsTUFBTTtRQUFhQyxNQUFNWiw2SUFBU0E7UUFBRWEsU0FBUztJQUFNO0lBQ3JEO1FBQUVGLE1BQU07UUFBYUMsTUFBTUwsNklBQU1BO1FBQUVNLFNBQVM7SUFBTTtJQUNsRDtRQUFFRixNQUFNO1FBQVdDLE1BQU1KLDZJQUFVQTtRQUFFSyxTQUFTO0lBQU07SUFDcEQ7UUFBRUYsTUFBTTtRQUFTQyxNQUFNWCw2SUFBS0E7UUFBRVksU0FBUztJQUFNO0lBQzdDO1FBQUVGLE1BQU07UUFBVUMsTUFBTVYsNklBQVVBO1FBQUVXLFNBQVM7SUFBTTtJQUNuRDtRQUFFRixNQUFNO1FBQVlDLE1BQU1ULDZJQUFRQTtRQUFFVSxTQUFTO0lBQU07Q0FDcEQ7QUFNTSxTQUFTQyxRQUFRLEVBQUVDLFFBQVEsRUFBZ0I7SUFDaEQsTUFBTSxDQUFDQyxhQUFhQyxlQUFlLEdBQUduQiwrQ0FBUUEsQ0FBQztJQUUvQyxxQkFDRSw4REFBQ29CO1FBQUlDLFdBQVU7O1lBRVpILDZCQUNDLDhEQUFDRTtnQkFDQ0MsV0FBVTtnQkFDVkMsU0FBUyxJQUFNSCxlQUFlOzBCQUU5Qiw0RUFBQ0M7b0JBQUlDLFdBQVU7Ozs7Ozs7Ozs7OzBCQUtuQiw4REFBQ3BCLGtEQUFNQSxDQUFDbUIsR0FBRztnQkFDVEcsU0FBUztnQkFDVEMsU0FBUztvQkFDUEMsR0FBR1AsY0FBYyxJQUFJO2dCQUN2QjtnQkFDQUcsV0FBVyxDQUFDLDhHQUE4RyxDQUFDOzBCQUUzSCw0RUFBQ0Q7b0JBQUlDLFdBQVU7O3NDQUViLDhEQUFDRDs0QkFBSUMsV0FBVTs7OENBQ2IsOERBQUNEO29DQUFJQyxXQUFVOztzREFDYiw4REFBQ0Q7NENBQUlDLFdBQVU7c0RBQ2IsNEVBQUNuQiw2SUFBU0E7Z0RBQUNtQixXQUFVOzs7Ozs7Ozs7OztzREFFdkIsOERBQUNLOzRDQUFLTCxXQUFVO3NEQUFrRDs7Ozs7Ozs7Ozs7OzhDQUlwRSw4REFBQ007b0NBQ0NMLFNBQVMsSUFBTUgsZUFBZTtvQ0FDOUJFLFdBQVU7OENBRVYsNEVBQUNkLDhJQUFDQTt3Q0FBQ2MsV0FBVTs7Ozs7Ozs7Ozs7Ozs7Ozs7c0NBS2pCLDhEQUFDTzs0QkFBSVAsV0FBVTtzQ0FDWlQsV0FBV2lCLEdBQUcsQ0FBQyxDQUFDQztnQ0FDZixNQUFNQyxPQUFPRCxLQUFLaEIsSUFBSTtnQ0FDdEIscUJBQ0UsOERBQUNrQjtvQ0FFQ0MsTUFBSztvQ0FDTFosV0FBVyxDQUFDLHVGQUF1RixFQUNqR1MsS0FBS2YsT0FBTyxHQUNSLG9FQUNBLDRFQUNMLENBQUM7O3NEQUVGLDhEQUFDZ0I7NENBQUtWLFdBQVU7Ozs7OztzREFDaEIsOERBQUNLO3NEQUFNSSxLQUFLakIsSUFBSTs7Ozs7OzttQ0FUWGlCLEtBQUtqQixJQUFJOzs7Ozs0QkFZcEI7Ozs7OztzQ0FJRiw4REFBQ087NEJBQUlDLFdBQVU7OzhDQUNiLDhEQUFDRDtvQ0FBSUMsV0FBVTs7c0RBQ2IsOERBQUNEOzRDQUFJQyxXQUFVO3NEQUEyQzs7Ozs7O3NEQUcxRCw4REFBQ1YscURBQVdBOzs7Ozs7Ozs7Ozs4Q0FFZCw4REFBQ1M7b0NBQUlDLFdBQVU7OENBQWdEOzs7Ozs7Ozs7Ozs7Ozs7Ozs7Ozs7OzswQkFRckUsOERBQUNEO2dCQUFJQyxXQUFVOztrQ0FFYiw4REFBQ2E7d0JBQU9iLFdBQVU7a0NBQ2hCLDRFQUFDRDs0QkFBSUMsV0FBVTs7OENBQ2IsOERBQUNNO29DQUNDTCxTQUFTLElBQU1ILGVBQWU7b0NBQzlCRSxXQUFVOzhDQUVWLDRFQUFDZiw4SUFBSUE7d0NBQUNlLFdBQVU7Ozs7Ozs7Ozs7OzhDQUVsQiw4REFBQ2M7b0NBQUdkLFdBQVU7OENBQW1EOzs7Ozs7OENBR2pFLDhEQUFDRDtvQ0FBSUMsV0FBVTs4Q0FDYiw0RUFBQ0Q7d0NBQUlDLFdBQVU7OzRDQUEyRDs0Q0FDekQsSUFBSWUsT0FBT0Msa0JBQWtCOzs7Ozs7Ozs7Ozs7Ozs7Ozs7Ozs7OztrQ0FPcEQsOERBQUNDO3dCQUFLakIsV0FBVTtrQ0FDYko7Ozs7Ozs7Ozs7Ozs7Ozs7OztBQUtYIiwic291cmNlcyI6WyJ3ZWJwYWNrOi8vYWRteWJyYW5kLWluc2lnaHRzLy4vY29tcG9uZW50cy9TaWRlYmFyLnRzeD82YmE5Il0sInNvdXJjZXNDb250ZW50IjpbIid1c2UgY2xpZW50JztcblxuaW1wb3J0IHsgdXNlU3RhdGUgfSBmcm9tICdyZWFjdCc7XG5pbXBvcnQgeyBtb3Rpb24gfSBmcm9tICdmcmFtZXItbW90aW9uJztcbmltcG9ydCB7XG4gIEJhckNoYXJ0MyxcbiAgVXNlcnMsXG4gIFRyZW5kaW5nVXAsXG4gIFNldHRpbmdzLFxuICBNZW51LFxuICBYLFxuICBIb21lLFxuICBUYXJnZXQsXG4gIERvbGxhclNpZ24sXG59IGZyb20gJ2x1Y2lkZS1yZWFjdCc7XG5pbXBvcnQgeyBUaGVtZVRvZ2dsZSB9IGZyb20gJy4vVGhlbWVUb2dnbGUnO1xuXG5jb25zdCBuYXZpZ2F0aW9uID0gW1xuICB7IG5hbWU6ICdEYXNoYm9hcmQnLCBpY29uOiBIb21lLCBjdXJyZW50OiB0cnVlIH0sXG4gIHsgbmFtZTogJ0FuYWx5dGljcycsIGljb246IEJhckNoYXJ0MywgY3VycmVudDogZmFsc2UgfSxcbiAgeyBuYW1lOiAnQ2FtcGFpZ25zJywgaWNvbjogVGFyZ2V0LCBjdXJyZW50OiBmYWxzZSB9LFxuICB7IG5hbWU6ICdSZXZlbnVlJywgaWNvbjogRG9sbGFyU2lnbiwgY3VycmVudDogZmFsc2UgfSxcbiAgeyBuYW1lOiAnVXNlcnMnLCBpY29uOiBVc2VycywgY3VycmVudDogZmFsc2UgfSxcbiAgeyBuYW1lOiAnVHJlbmRzJywgaWNvbjogVHJlbmRpbmdVcCwgY3VycmVudDogZmFsc2UgfSxcbiAgeyBuYW1lOiAnU2V0dGluZ3MnLCBpY29uOiBTZXR0aW5ncywgY3VycmVudDogZmFsc2UgfSxcbl07XG5cbmludGVyZmFjZSBTaWRlYmFyUHJvcHMge1xuICBjaGlsZHJlbjogUmVhY3QuUmVhY3ROb2RlO1xufVxuXG5leHBvcnQgZnVuY3Rpb24gU2lkZWJhcih7IGNoaWxkcmVuIH06IFNpZGViYXJQcm9wcykge1xuICBjb25zdCBbc2lkZWJhck9wZW4sIHNldFNpZGViYXJPcGVuXSA9IHVzZVN0YXRlKGZhbHNlKTtcblxuICByZXR1cm4gKFxuICAgIDxkaXYgY2xhc3NOYW1lPVwiZmxleCBoLXNjcmVlbiBiZy1ncmF5LTUwIGRhcms6YmctZ3JheS05MDBcIj5cbiAgICAgIHsvKiBNb2JpbGUgc2lkZWJhciBvdmVybGF5ICovfVxuICAgICAge3NpZGViYXJPcGVuICYmIChcbiAgICAgICAgPGRpdlxuICAgICAgICAgIGNsYXNzTmFtZT1cImZpeGVkIGluc2V0LTAgei00MCBsZzpoaWRkZW5cIlxuICAgICAgICAgIG9uQ2xpY2s9eygpID0+IHNldFNpZGViYXJPcGVuKGZhbHNlKX1cbiAgICAgICAgPlxuICAgICAgICAgIDxkaXYgY2xhc3NOYW1lPVwiYWJzb2x1dGUgaW5zZXQtMCBiZy1ibGFjayBvcGFjaXR5LTUwXCIgLz5cbiAgICAgICAgPC9kaXY+XG4gICAgICApfVxuXG4gICAgICB7LyogU2lkZWJhciAqL31cbiAgICAgIDxtb3Rpb24uZGl2XG4gICAgICAgIGluaXRpYWw9e2ZhbHNlfVxuICAgICAgICBhbmltYXRlPXt7XG4gICAgICAgICAgeDogc2lkZWJhck9wZW4gPyAwIDogJy0xMDAlJyxcbiAgICAgICAgfX1cbiAgICAgICAgY2xhc3NOYW1lPXtgZml4ZWQgaW5zZXQteS0wIGxlZnQtMCB6LTUwIHctNjQgYmctd2hpdGUgZGFyazpiZy1ncmF5LTgwMCBzaGFkb3ctbGcgbGc6c3RhdGljIGxnOnRyYW5zbGF0ZS14LTAgbGc6c2hhZG93LW5vbmVgfVxuICAgICAgPlxuICAgICAgICA8ZGl2IGNsYXNzTmFtZT1cImZsZXggaC1mdWxsIGZsZXgtY29sXCI+XG4gICAgICAgICAgey8qIExvZ28gKi99XG4gICAgICAgICAgPGRpdiBjbGFzc05hbWU9XCJmbGV4IGl0ZW1zLWNlbnRlciBqdXN0aWZ5LWJldHdlZW4gcHgtNiBweS00IGJvcmRlci1iIGJvcmRlci1ncmF5LTIwMCBkYXJrOmJvcmRlci1ncmF5LTcwMFwiPlxuICAgICAgICAgICAgPGRpdiBjbGFzc05hbWU9XCJmbGV4IGl0ZW1zLWNlbnRlciBzcGFjZS14LTNcIj5cbiAgICAgICAgICAgICAgPGRpdiBjbGFzc05hbWU9XCJ3LTggaC04IGJnLWdyYWRpZW50LXRvLXIgZnJvbS1ibHVlLTYwMCB0by1wdXJwbGUtNjAwIHJvdW5kZWQtbGcgZmxleCBpdGVtcy1jZW50ZXIganVzdGlmeS1jZW50ZXJcIj5cbiAgICAgICAgICAgICAgICA8QmFyQ2hhcnQzIGNsYXNzTmFtZT1cInctNSBoLTUgdGV4dC13aGl0ZVwiIC8+XG4gICAgICAgICAgICAgIDwvZGl2PlxuICAgICAgICAgICAgICA8c3BhbiBjbGFzc05hbWU9XCJ0ZXh0LXhsIGZvbnQtYm9sZCB0ZXh0LWdyYXktOTAwIGRhcms6dGV4dC13aGl0ZVwiPlxuICAgICAgICAgICAgICAgIEFEbXlCUkFORFxuICAgICAgICAgICAgICA8L3NwYW4+XG4gICAgICAgICAgICA8L2Rpdj5cbiAgICAgICAgICAgIDxidXR0b25cbiAgICAgICAgICAgICAgb25DbGljaz17KCkgPT4gc2V0U2lkZWJhck9wZW4oZmFsc2UpfVxuICAgICAgICAgICAgICBjbGFzc05hbWU9XCJsZzpoaWRkZW4gcC0xIHJvdW5kZWQtbWQgaG92ZXI6YmctZ3JheS0xMDAgZGFyazpob3ZlcjpiZy1ncmF5LTcwMFwiXG4gICAgICAgICAgICA+XG4gICAgICAgICAgICAgIDxYIGNsYXNzTmFtZT1cInctNSBoLTVcIiAvPlxuICAgICAgICAgICAgPC9idXR0b24+XG4gICAgICAgICAgPC9kaXY+XG5cbiAgICAgICAgICB7LyogTmF2aWdhdGlvbiAqL31cbiAgICAgICAgICA8bmF2IGNsYXNzTmFtZT1cImZsZXgtMSBweC00IHB5LTYgc3BhY2UteS0yXCI+XG4gICAgICAgICAgICB7bmF2aWdhdGlvbi5tYXAoKGl0ZW0pID0+IHtcbiAgICAgICAgICAgICAgY29uc3QgSWNvbiA9IGl0ZW0uaWNvbjtcbiAgICAgICAgICAgICAgcmV0dXJuIChcbiAgICAgICAgICAgICAgICA8YVxuICAgICAgICAgICAgICAgICAga2V5PXtpdGVtLm5hbWV9XG4gICAgICAgICAgICAgICAgICBocmVmPVwiI1wiXG4gICAgICAgICAgICAgICAgICBjbGFzc05hbWU9e2BmbGV4IGl0ZW1zLWNlbnRlciBzcGFjZS14LTMgcHgtMyBweS0yIHJvdW5kZWQtbGcgdGV4dC1zbSBmb250LW1lZGl1bSB0cmFuc2l0aW9uLWNvbG9ycyAke1xuICAgICAgICAgICAgICAgICAgICBpdGVtLmN1cnJlbnRcbiAgICAgICAgICAgICAgICAgICAgICA/ICdiZy1ibHVlLTUwIGRhcms6YmctYmx1ZS05MDAvMjAgdGV4dC1ibHVlLTcwMCBkYXJrOnRleHQtYmx1ZS0zMDAnXG4gICAgICAgICAgICAgICAgICAgICAgOiAndGV4dC1ncmF5LTcwMCBkYXJrOnRleHQtZ3JheS0zMDAgaG92ZXI6YmctZ3JheS0xMDAgZGFyazpob3ZlcjpiZy1ncmF5LTcwMCdcbiAgICAgICAgICAgICAgICAgIH1gfVxuICAgICAgICAgICAgICAgID5cbiAgICAgICAgICAgICAgICAgIDxJY29uIGNsYXNzTmFtZT1cInctNSBoLTVcIiAvPlxuICAgICAgICAgICAgICAgICAgPHNwYW4+e2l0ZW0ubmFtZX08L3NwYW4+XG4gICAgICAgICAgICAgICAgPC9hPlxuICAgICAgICAgICAgICApO1xuICAgICAgICAgICAgfSl9XG4gICAgICAgICAgPC9uYXY+XG5cbiAgICAgICAgICB7LyogQm90dG9tIHNlY3Rpb24gKi99XG4gICAgICAgICAgPGRpdiBjbGFzc05hbWU9XCJweC00IHB5LTQgYm9yZGVyLXQgYm9yZGVyLWdyYXktMjAwIGRhcms6Ym9yZGVyLWdyYXktNzAwXCI+XG4gICAgICAgICAgICA8ZGl2IGNsYXNzTmFtZT1cImZsZXggaXRlbXMtY2VudGVyIGp1c3RpZnktYmV0d2VlblwiPlxuICAgICAgICAgICAgICA8ZGl2IGNsYXNzTmFtZT1cInRleHQtc20gdGV4dC1ncmF5LTYwMCBkYXJrOnRleHQtZ3JheS00MDBcIj5cbiAgICAgICAgICAgICAgICBUaGVtZVxuICAgICAgICAgICAgICA8L2Rpdj5cbiAgICAgICAgICAgICAgPFRoZW1lVG9nZ2xlIC8+XG4gICAgICAgICAgICA8L2Rpdj5cbiAgICAgICAgICAgIDxkaXYgY2xhc3NOYW1lPVwibXQtNCB0ZXh0LXhzIHRleHQtZ3JheS01MDAgZGFyazp0ZXh0LWdyYXktNDAwXCI+XG4gICAgICAgICAgICAgIMKpIDIwMjUgQURteUJSQU5EIEluc2lnaHRzXG4gICAgICAgICAgICA8L2Rpdj5cbiAgICAgICAgICA8L2Rpdj5cbiAgICAgICAgPC9kaXY+XG4gICAgICA8L21vdGlvbi5kaXY+XG5cbiAgICAgIHsvKiBNYWluIGNvbnRlbnQgKi99XG4gICAgICA8ZGl2IGNsYXNzTmFtZT1cImZsZXgtMSBmbGV4IGZsZXgtY29sIG92ZXJmbG93LWhpZGRlblwiPlxuICAgICAgICB7LyogVG9wIGJhciAqL31cbiAgICAgICAgPGhlYWRlciBjbGFzc05hbWU9XCJiZy13aGl0ZSBkYXJrOmJnLWdyYXktODAwIHNoYWRvdy1zbSBib3JkZXItYiBib3JkZXItZ3JheS0yMDAgZGFyazpib3JkZXItZ3JheS03MDBcIj5cbiAgICAgICAgICA8ZGl2IGNsYXNzTmFtZT1cImZsZXggaXRlbXMtY2VudGVyIGp1c3RpZnktYmV0d2VlbiBweC02IHB5LTRcIj5cbiAgICAgICAgICAgIDxidXR0b25cbiAgICAgICAgICAgICAgb25DbGljaz17KCkgPT4gc2V0U2lkZWJhck9wZW4odHJ1ZSl9XG4gICAgICAgICAgICAgIGNsYXNzTmFtZT1cImxnOmhpZGRlbiBwLTIgcm91bmRlZC1tZCBob3ZlcjpiZy1ncmF5LTEwMCBkYXJrOmhvdmVyOmJnLWdyYXktNzAwXCJcbiAgICAgICAgICAgID5cbiAgICAgICAgICAgICAgPE1lbnUgY2xhc3NOYW1lPVwidy01IGgtNVwiIC8+XG4gICAgICAgICAgICA8L2J1dHRvbj5cbiAgICAgICAgICAgIDxoMSBjbGFzc05hbWU9XCJ0ZXh0LTJ4bCBmb250LWJvbGQgdGV4dC1ncmF5LTkwMCBkYXJrOnRleHQtd2hpdGVcIj5cbiAgICAgICAgICAgICAgQW5hbHl0aWNzIERhc2hib2FyZFxuICAgICAgICAgICAgPC9oMT5cbiAgICAgICAgICAgIDxkaXYgY2xhc3NOYW1lPVwiZmxleCBpdGVtcy1jZW50ZXIgc3BhY2UteC00XCI+XG4gICAgICAgICAgICAgIDxkaXYgY2xhc3NOYW1lPVwiaGlkZGVuIHNtOmJsb2NrIHRleHQtc20gdGV4dC1ncmF5LTYwMCBkYXJrOnRleHQtZ3JheS00MDBcIj5cbiAgICAgICAgICAgICAgICBMYXN0IHVwZGF0ZWQ6IHtuZXcgRGF0ZSgpLnRvTG9jYWxlVGltZVN0cmluZygpfVxuICAgICAgICAgICAgICA8L2Rpdj5cbiAgICAgICAgICAgIDwvZGl2PlxuICAgICAgICAgIDwvZGl2PlxuICAgICAgICA8L2hlYWRlcj5cblxuICAgICAgICB7LyogTWFpbiBjb250ZW50IGFyZWEgKi99XG4gICAgICAgIDxtYWluIGNsYXNzTmFtZT1cImZsZXgtMSBvdmVyZmxvdy1hdXRvIHAtNlwiPlxuICAgICAgICAgIHtjaGlsZHJlbn1cbiAgICAgICAgPC9tYWluPlxuICAgICAgPC9kaXY+XG4gICAgPC9kaXY+XG4gICk7XG59XG4iXSwibmFtZXMiOlsidXNlU3RhdGUiLCJtb3Rpb24iLCJCYXJDaGFydDMiLCJVc2VycyIsIlRyZW5kaW5nVXAiLCJTZXR0aW5ncyIsIk1lbnUiLCJYIiwiSG9tZSIsIlRhcmdldCIsIkRvbGxhclNpZ24iLCJUaGVtZVRvZ2dsZSIsIm5hdmlnYXRpb24iLCJuYW1lIiwiaWNvbiIsImN1cnJlbnQiLCJTaWRlYmFyIiwiY2hpbGRyZW4iLCJzaWRlYmFyT3BlbiIsInNldFNpZGViYXJPcGVuIiwiZGl2IiwiY2xhc3NOYW1lIiwib25DbGljayIsImluaXRpYWwiLCJhbmltYXRlIiwieCIsInNwYW4iLCJidXR0b24iLCJuYXYiLCJtYXAiLCJpdGVtIiwiSWNvbiIsImEiLCJocmVmIiwiaGVhZGVyIiwiaDEiLCJEYXRlIiwidG9Mb2NhbGVUaW1lU3RyaW5nIiwibWFpbiJdLCJzb3VyY2VSb290IjoiIn0=\n//# sourceURL=webpack-internal:///(ssr)/./components/Sidebar.tsx\n");
-
-/***/ }),
-
-/***/ "(ssr)/./components/ThemeToggle.tsx":
-/*!************************************!*\
-  !*** ./components/ThemeToggle.tsx ***!
-  \************************************/
-/***/ ((__unused_webpack_module, __webpack_exports__, __webpack_require__) => {
-
-"use strict";
-eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   ThemeToggle: () => (/* binding */ ThemeToggle)\n/* harmony export */ });\n/* harmony import */ var react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! react/jsx-dev-runtime */ \"(ssr)/./node_modules/next/dist/server/future/route-modules/app-page/vendored/ssr/react-jsx-dev-runtime.js\");\n/* harmony import */ var react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0___default = /*#__PURE__*/__webpack_require__.n(react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__);\n/* harmony import */ var react__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! react */ \"(ssr)/./node_modules/next/dist/server/future/route-modules/app-page/vendored/ssr/react.js\");\n/* harmony import */ var react__WEBPACK_IMPORTED_MODULE_1___default = /*#__PURE__*/__webpack_require__.n(react__WEBPACK_IMPORTED_MODULE_1__);\n/* harmony import */ var _barrel_optimize_names_Moon_Sun_lucide_react__WEBPACK_IMPORTED_MODULE_3__ = __webpack_require__(/*! __barrel_optimize__?names=Moon,Sun!=!lucide-react */ \"(ssr)/./node_modules/lucide-react/dist/esm/icons/sun.js\");\n/* harmony import */ var _barrel_optimize_names_Moon_Sun_lucide_react__WEBPACK_IMPORTED_MODULE_4__ = __webpack_require__(/*! __barrel_optimize__?names=Moon,Sun!=!lucide-react */ \"(ssr)/./node_modules/lucide-react/dist/esm/icons/moon.js\");\n/* harmony import */ var framer_motion__WEBPACK_IMPORTED_MODULE_2__ = __webpack_require__(/*! framer-motion */ \"(ssr)/./node_modules/framer-motion/dist/es/render/components/motion/proxy.mjs\");\n/* __next_internal_client_entry_do_not_use__ ThemeToggle auto */ \n\n\n\nfunction ThemeToggle() {\n    const [isDark, setIsDark] = (0,react__WEBPACK_IMPORTED_MODULE_1__.useState)(false);\n    (0,react__WEBPACK_IMPORTED_MODULE_1__.useEffect)(()=>{\n        // Check if theme is stored in localStorage\n        const stored = localStorage.getItem(\"theme\");\n        const prefersDark = window.matchMedia(\"(prefers-color-scheme: dark)\").matches;\n        if (stored === \"dark\" || !stored && prefersDark) {\n            setIsDark(true);\n            document.documentElement.classList.add(\"dark\");\n        }\n    }, []);\n    const toggleTheme = ()=>{\n        const newTheme = !isDark;\n        setIsDark(newTheme);\n        if (newTheme) {\n            document.documentElement.classList.add(\"dark\");\n            localStorage.setItem(\"theme\", \"dark\");\n        } else {\n            document.documentElement.classList.remove(\"dark\");\n            localStorage.setItem(\"theme\", \"light\");\n        }\n    };\n    return /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(framer_motion__WEBPACK_IMPORTED_MODULE_2__.motion.button, {\n        whileHover: {\n            scale: 1.05\n        },\n        whileTap: {\n            scale: 0.95\n        },\n        onClick: toggleTheme,\n        className: \"p-2 rounded-lg glass-effect hover:bg-white/20 dark:hover:bg-black/20 transition-colors\",\n        \"aria-label\": \"Toggle theme\",\n        children: isDark ? /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_Moon_Sun_lucide_react__WEBPACK_IMPORTED_MODULE_3__[\"default\"], {\n            className: \"w-5 h-5 text-yellow-500\"\n        }, void 0, false, {\n            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\ThemeToggle.tsx\",\n            lineNumber: 43,\n            columnNumber: 9\n        }, this) : /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(_barrel_optimize_names_Moon_Sun_lucide_react__WEBPACK_IMPORTED_MODULE_4__[\"default\"], {\n            className: \"w-5 h-5 text-blue-600\"\n        }, void 0, false, {\n            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\ThemeToggle.tsx\",\n            lineNumber: 45,\n            columnNumber: 9\n        }, this)\n    }, void 0, false, {\n        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\components\\\\ThemeToggle.tsx\",\n        lineNumber: 35,\n        columnNumber: 5\n    }, this);\n}\n//# sourceURL=[module]\n//# sourceMappingURL=data:application/json;charset=utf-8;base64,eyJ2ZXJzaW9uIjozLCJmaWxlIjoiKHNzcikvLi9jb21wb25lbnRzL1RoZW1lVG9nZ2xlLnRzeCIsIm1hcHBpbmdzIjoiOzs7Ozs7Ozs7Ozs7QUFFNEM7QUFDSDtBQUNGO0FBRWhDLFNBQVNLO0lBQ2QsTUFBTSxDQUFDQyxRQUFRQyxVQUFVLEdBQUdQLCtDQUFRQSxDQUFDO0lBRXJDQyxnREFBU0EsQ0FBQztRQUNSLDJDQUEyQztRQUMzQyxNQUFNTyxTQUFTQyxhQUFhQyxPQUFPLENBQUM7UUFDcEMsTUFBTUMsY0FBY0MsT0FBT0MsVUFBVSxDQUFDLGdDQUFnQ0MsT0FBTztRQUU3RSxJQUFJTixXQUFXLFVBQVcsQ0FBQ0EsVUFBVUcsYUFBYztZQUNqREosVUFBVTtZQUNWUSxTQUFTQyxlQUFlLENBQUNDLFNBQVMsQ0FBQ0MsR0FBRyxDQUFDO1FBQ3pDO0lBQ0YsR0FBRyxFQUFFO0lBRUwsTUFBTUMsY0FBYztRQUNsQixNQUFNQyxXQUFXLENBQUNkO1FBQ2xCQyxVQUFVYTtRQUVWLElBQUlBLFVBQVU7WUFDWkwsU0FBU0MsZUFBZSxDQUFDQyxTQUFTLENBQUNDLEdBQUcsQ0FBQztZQUN2Q1QsYUFBYVksT0FBTyxDQUFDLFNBQVM7UUFDaEMsT0FBTztZQUNMTixTQUFTQyxlQUFlLENBQUNDLFNBQVMsQ0FBQ0ssTUFBTSxDQUFDO1lBQzFDYixhQUFhWSxPQUFPLENBQUMsU0FBUztRQUNoQztJQUNGO0lBRUEscUJBQ0UsOERBQUNqQixpREFBTUEsQ0FBQ21CLE1BQU07UUFDWkMsWUFBWTtZQUFFQyxPQUFPO1FBQUs7UUFDMUJDLFVBQVU7WUFBRUQsT0FBTztRQUFLO1FBQ3hCRSxTQUFTUjtRQUNUUyxXQUFVO1FBQ1ZDLGNBQVc7a0JBRVZ2Qix1QkFDQyw4REFBQ0osb0ZBQUdBO1lBQUMwQixXQUFVOzs7OztpQ0FFZiw4REFBQ3pCLG9GQUFJQTtZQUFDeUIsV0FBVTs7Ozs7Ozs7Ozs7QUFJeEIiLCJzb3VyY2VzIjpbIndlYnBhY2s6Ly9hZG15YnJhbmQtaW5zaWdodHMvLi9jb21wb25lbnRzL1RoZW1lVG9nZ2xlLnRzeD9kYzE0Il0sInNvdXJjZXNDb250ZW50IjpbIid1c2UgY2xpZW50JztcblxuaW1wb3J0IHsgdXNlU3RhdGUsIHVzZUVmZmVjdCB9IGZyb20gJ3JlYWN0JztcbmltcG9ydCB7IFN1biwgTW9vbiB9IGZyb20gJ2x1Y2lkZS1yZWFjdCc7XG5pbXBvcnQgeyBtb3Rpb24gfSBmcm9tICdmcmFtZXItbW90aW9uJztcblxuZXhwb3J0IGZ1bmN0aW9uIFRoZW1lVG9nZ2xlKCkge1xuICBjb25zdCBbaXNEYXJrLCBzZXRJc0RhcmtdID0gdXNlU3RhdGUoZmFsc2UpO1xuXG4gIHVzZUVmZmVjdCgoKSA9PiB7XG4gICAgLy8gQ2hlY2sgaWYgdGhlbWUgaXMgc3RvcmVkIGluIGxvY2FsU3RvcmFnZVxuICAgIGNvbnN0IHN0b3JlZCA9IGxvY2FsU3RvcmFnZS5nZXRJdGVtKCd0aGVtZScpO1xuICAgIGNvbnN0IHByZWZlcnNEYXJrID0gd2luZG93Lm1hdGNoTWVkaWEoJyhwcmVmZXJzLWNvbG9yLXNjaGVtZTogZGFyayknKS5tYXRjaGVzO1xuXG4gICAgaWYgKHN0b3JlZCA9PT0gJ2RhcmsnIHx8ICghc3RvcmVkICYmIHByZWZlcnNEYXJrKSkge1xuICAgICAgc2V0SXNEYXJrKHRydWUpO1xuICAgICAgZG9jdW1lbnQuZG9jdW1lbnRFbGVtZW50LmNsYXNzTGlzdC5hZGQoJ2RhcmsnKTtcbiAgICB9XG4gIH0sIFtdKTtcblxuICBjb25zdCB0b2dnbGVUaGVtZSA9ICgpID0+IHtcbiAgICBjb25zdCBuZXdUaGVtZSA9ICFpc0Rhcms7XG4gICAgc2V0SXNEYXJrKG5ld1RoZW1lKTtcblxuICAgIGlmIChuZXdUaGVtZSkge1xuICAgICAgZG9jdW1lbnQuZG9jdW1lbnRFbGVtZW50LmNsYXNzTGlzdC5hZGQoJ2RhcmsnKTtcbiAgICAgIGxvY2FsU3RvcmFnZS5zZXRJdGVtKCd0aGVtZScsICdkYXJrJyk7XG4gICAgfSBlbHNlIHtcbiAgICAgIGRvY3VtZW50LmRvY3VtZW50RWxlbWVudC5jbGFzc0xpc3QucmVtb3ZlKCdkYXJrJyk7XG4gICAgICBsb2NhbFN0b3JhZ2Uuc2V0SXRlbSgndGhlbWUnLCAnbGlnaHQnKTtcbiAgICB9XG4gIH07XG5cbiAgcmV0dXJuIChcbiAgICA8bW90aW9uLmJ1dHRvblxuICAgICAgd2hpbGVIb3Zlcj17eyBzY2FsZTogMS4wNSB9fVxuICAgICAgd2hpbGVUYXA9e3sgc2NhbGU6IDAuOTUgfX1cbiAgICAgIG9uQ2xpY2s9e3RvZ2dsZVRoZW1lfVxuICAgICAgY2xhc3NOYW1lPVwicC0yIHJvdW5kZWQtbGcgZ2xhc3MtZWZmZWN0IGhvdmVyOmJnLXdoaXRlLzIwIGRhcms6aG92ZXI6YmctYmxhY2svMjAgdHJhbnNpdGlvbi1jb2xvcnNcIlxuICAgICAgYXJpYS1sYWJlbD1cIlRvZ2dsZSB0aGVtZVwiXG4gICAgPlxuICAgICAge2lzRGFyayA/IChcbiAgICAgICAgPFN1biBjbGFzc05hbWU9XCJ3LTUgaC01IHRleHQteWVsbG93LTUwMFwiIC8+XG4gICAgICApIDogKFxuICAgICAgICA8TW9vbiBjbGFzc05hbWU9XCJ3LTUgaC01IHRleHQtYmx1ZS02MDBcIiAvPlxuICAgICAgKX1cbiAgICA8L21vdGlvbi5idXR0b24+XG4gICk7XG59XG4iXSwibmFtZXMiOlsidXNlU3RhdGUiLCJ1c2VFZmZlY3QiLCJTdW4iLCJNb29uIiwibW90aW9uIiwiVGhlbWVUb2dnbGUiLCJpc0RhcmsiLCJzZXRJc0RhcmsiLCJzdG9yZWQiLCJsb2NhbFN0b3JhZ2UiLCJnZXRJdGVtIiwicHJlZmVyc0RhcmsiLCJ3aW5kb3ciLCJtYXRjaE1lZGlhIiwibWF0Y2hlcyIsImRvY3VtZW50IiwiZG9jdW1lbnRFbGVtZW50IiwiY2xhc3NMaXN0IiwiYWRkIiwidG9nZ2xlVGhlbWUiLCJuZXdUaGVtZSIsInNldEl0ZW0iLCJyZW1vdmUiLCJidXR0b24iLCJ3aGlsZUhvdmVyIiwic2NhbGUiLCJ3aGlsZVRhcCIsIm9uQ2xpY2siLCJjbGFzc05hbWUiLCJhcmlhLWxhYmVsIl0sInNvdXJjZVJvb3QiOiIifQ==\n//# sourceURL=webpack-internal:///(ssr)/./components/ThemeToggle.tsx\n");
-
-/***/ }),
-
-/***/ "(ssr)/./data/mockData.ts":
-/*!**************************!*\
-  !*** ./data/mockData.ts ***!
-  \**************************/
-/***/ ((__unused_webpack_module, __webpack_exports__, __webpack_require__) => {
-
-"use strict";
-eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   campaignData: () => (/* binding */ campaignData),\n/* harmony export */   mockData: () => (/* binding */ mockData),\n/* harmony export */   summaryMetrics: () => (/* binding */ summaryMetrics)\n/* harmony export */ });\n// Generate realistic marketing data for the last 30 days\nconst generateMockData = ()=>{\n    const data = [];\n    const campaigns = [\n        \"Search\",\n        \"Social\",\n        \"Display\",\n        \"Email\"\n    ];\n    const baseDate = new Date();\n    baseDate.setDate(baseDate.getDate() - 30);\n    for(let i = 0; i < 30; i++){\n        const currentDate = new Date(baseDate);\n        currentDate.setDate(baseDate.getDate() + i);\n        campaigns.forEach((campaign)=>{\n            const users = Math.floor(Math.random() * 500) + 200;\n            const conversionRate = Math.random() * 0.15 + 0.05; // 5-20% conversion rate\n            const conversions = Math.floor(users * conversionRate);\n            const revenuePerConversion = Math.random() * 50 + 25; // $25-75 per conversion\n            const revenue = Math.floor(conversions * revenuePerConversion);\n            data.push({\n                date: currentDate.toISOString().split(\"T\")[0],\n                revenue,\n                users,\n                conversions,\n                campaign\n            });\n        });\n    }\n    return data;\n};\nconst mockData = generateMockData();\n// Aggregate campaign performance\nconst campaignData = [\n    \"Search\",\n    \"Social\",\n    \"Display\",\n    \"Email\"\n].map((campaign)=>{\n    const campaignMetrics = mockData.filter((d)=>d.campaign === campaign);\n    const totalRevenue = campaignMetrics.reduce((sum, d)=>sum + d.revenue, 0);\n    const totalUsers = campaignMetrics.reduce((sum, d)=>sum + d.users, 0);\n    const totalConversions = campaignMetrics.reduce((sum, d)=>sum + d.conversions, 0);\n    return {\n        campaign,\n        revenue: totalRevenue,\n        users: totalUsers,\n        conversions: totalConversions,\n        ctr: Math.random() * 5 + 2,\n        cost: Math.floor(totalRevenue * (Math.random() * 0.3 + 0.2)) // 20-50% of revenue as cost\n    };\n});\n// Summary metrics\nconst summaryMetrics = {\n    totalRevenue: mockData.reduce((sum, d)=>sum + d.revenue, 0),\n    totalUsers: mockData.reduce((sum, d)=>sum + d.users, 0),\n    totalConversions: mockData.reduce((sum, d)=>sum + d.conversions, 0),\n    averageOrderValue: mockData.reduce((sum, d)=>sum + d.revenue, 0) / mockData.reduce((sum, d)=>sum + d.conversions, 0),\n    conversionRate: mockData.reduce((sum, d)=>sum + d.conversions, 0) / mockData.reduce((sum, d)=>sum + d.users, 0) * 100\n};\n//# sourceURL=[module]\n//# sourceMappingURL=data:application/json;charset=utf-8;base64,eyJ2ZXJzaW9uIjozLCJmaWxlIjoiKHNzcikvLi9kYXRhL21vY2tEYXRhLnRzIiwibWFwcGluZ3MiOiI7Ozs7OztBQWlCQSx5REFBeUQ7QUFDekQsTUFBTUEsbUJBQW1CO0lBQ3ZCLE1BQU1DLE9BQXFCLEVBQUU7SUFDN0IsTUFBTUMsWUFBWTtRQUFDO1FBQVU7UUFBVTtRQUFXO0tBQVE7SUFDMUQsTUFBTUMsV0FBVyxJQUFJQztJQUNyQkQsU0FBU0UsT0FBTyxDQUFDRixTQUFTRyxPQUFPLEtBQUs7SUFFdEMsSUFBSyxJQUFJQyxJQUFJLEdBQUdBLElBQUksSUFBSUEsSUFBSztRQUMzQixNQUFNQyxjQUFjLElBQUlKLEtBQUtEO1FBQzdCSyxZQUFZSCxPQUFPLENBQUNGLFNBQVNHLE9BQU8sS0FBS0M7UUFFekNMLFVBQVVPLE9BQU8sQ0FBQ0MsQ0FBQUE7WUFDaEIsTUFBTUMsUUFBUUMsS0FBS0MsS0FBSyxDQUFDRCxLQUFLRSxNQUFNLEtBQUssT0FBTztZQUNoRCxNQUFNQyxpQkFBaUJILEtBQUtFLE1BQU0sS0FBSyxPQUFPLE1BQU0sd0JBQXdCO1lBQzVFLE1BQU1FLGNBQWNKLEtBQUtDLEtBQUssQ0FBQ0YsUUFBUUk7WUFDdkMsTUFBTUUsdUJBQXVCTCxLQUFLRSxNQUFNLEtBQUssS0FBSyxJQUFJLHdCQUF3QjtZQUM5RSxNQUFNSSxVQUFVTixLQUFLQyxLQUFLLENBQUNHLGNBQWNDO1lBRXpDaEIsS0FBS2tCLElBQUksQ0FBQztnQkFDUkMsTUFBTVosWUFBWWEsV0FBVyxHQUFHQyxLQUFLLENBQUMsSUFBSSxDQUFDLEVBQUU7Z0JBQzdDSjtnQkFDQVA7Z0JBQ0FLO2dCQUNBTjtZQUNGO1FBQ0Y7SUFDRjtJQUVBLE9BQU9UO0FBQ1Q7QUFFTyxNQUFNc0IsV0FBeUJ2QixtQkFBbUI7QUFFekQsaUNBQWlDO0FBQzFCLE1BQU13QixlQUErQjtJQUMxQztJQUFVO0lBQVU7SUFBVztDQUNoQyxDQUFDQyxHQUFHLENBQUNmLENBQUFBO0lBQ0osTUFBTWdCLGtCQUFrQkgsU0FBU0ksTUFBTSxDQUFDQyxDQUFBQSxJQUFLQSxFQUFFbEIsUUFBUSxLQUFLQTtJQUM1RCxNQUFNbUIsZUFBZUgsZ0JBQWdCSSxNQUFNLENBQUMsQ0FBQ0MsS0FBS0gsSUFBTUcsTUFBTUgsRUFBRVYsT0FBTyxFQUFFO0lBQ3pFLE1BQU1jLGFBQWFOLGdCQUFnQkksTUFBTSxDQUFDLENBQUNDLEtBQUtILElBQU1HLE1BQU1ILEVBQUVqQixLQUFLLEVBQUU7SUFDckUsTUFBTXNCLG1CQUFtQlAsZ0JBQWdCSSxNQUFNLENBQUMsQ0FBQ0MsS0FBS0gsSUFBTUcsTUFBTUgsRUFBRVosV0FBVyxFQUFFO0lBRWpGLE9BQU87UUFDTE47UUFDQVEsU0FBU1c7UUFDVGxCLE9BQU9xQjtRQUNQaEIsYUFBYWlCO1FBQ2JDLEtBQUt0QixLQUFLRSxNQUFNLEtBQUssSUFBSTtRQUN6QnFCLE1BQU12QixLQUFLQyxLQUFLLENBQUNnQixlQUFnQmpCLENBQUFBLEtBQUtFLE1BQU0sS0FBSyxNQUFNLEdBQUUsR0FBSSw0QkFBNEI7SUFDM0Y7QUFDRixHQUFHO0FBRUgsa0JBQWtCO0FBQ1gsTUFBTXNCLGlCQUFpQjtJQUM1QlAsY0FBY04sU0FBU08sTUFBTSxDQUFDLENBQUNDLEtBQUtILElBQU1HLE1BQU1ILEVBQUVWLE9BQU8sRUFBRTtJQUMzRGMsWUFBWVQsU0FBU08sTUFBTSxDQUFDLENBQUNDLEtBQUtILElBQU1HLE1BQU1ILEVBQUVqQixLQUFLLEVBQUU7SUFDdkRzQixrQkFBa0JWLFNBQVNPLE1BQU0sQ0FBQyxDQUFDQyxLQUFLSCxJQUFNRyxNQUFNSCxFQUFFWixXQUFXLEVBQUU7SUFDbkVxQixtQkFBbUJkLFNBQVNPLE1BQU0sQ0FBQyxDQUFDQyxLQUFLSCxJQUFNRyxNQUFNSCxFQUFFVixPQUFPLEVBQUUsS0FBS0ssU0FBU08sTUFBTSxDQUFDLENBQUNDLEtBQUtILElBQU1HLE1BQU1ILEVBQUVaLFdBQVcsRUFBRTtJQUN0SEQsZ0JBQWdCLFNBQVVlLE1BQU0sQ0FBQyxDQUFDQyxLQUFLSCxJQUFNRyxNQUFNSCxFQUFFWixXQUFXLEVBQUUsS0FBS08sU0FBU08sTUFBTSxDQUFDLENBQUNDLEtBQUtILElBQU1HLE1BQU1ILEVBQUVqQixLQUFLLEVBQUUsS0FBTTtBQUMxSCxFQUFFIiwic291cmNlcyI6WyJ3ZWJwYWNrOi8vYWRteWJyYW5kLWluc2lnaHRzLy4vZGF0YS9tb2NrRGF0YS50cz81MzY0Il0sInNvdXJjZXNDb250ZW50IjpbImV4cG9ydCBpbnRlcmZhY2UgTWV0cmljRGF0YSB7XG4gIGRhdGU6IHN0cmluZztcbiAgcmV2ZW51ZTogbnVtYmVyO1xuICB1c2VyczogbnVtYmVyO1xuICBjb252ZXJzaW9uczogbnVtYmVyO1xuICBjYW1wYWlnbjogc3RyaW5nO1xufVxuXG5leHBvcnQgaW50ZXJmYWNlIENhbXBhaWduRGF0YSB7XG4gIGNhbXBhaWduOiBzdHJpbmc7XG4gIHJldmVudWU6IG51bWJlcjtcbiAgdXNlcnM6IG51bWJlcjtcbiAgY29udmVyc2lvbnM6IG51bWJlcjtcbiAgY3RyOiBudW1iZXI7XG4gIGNvc3Q6IG51bWJlcjtcbn1cblxuLy8gR2VuZXJhdGUgcmVhbGlzdGljIG1hcmtldGluZyBkYXRhIGZvciB0aGUgbGFzdCAzMCBkYXlzXG5jb25zdCBnZW5lcmF0ZU1vY2tEYXRhID0gKCk6IE1ldHJpY0RhdGFbXSA9PiB7XG4gIGNvbnN0IGRhdGE6IE1ldHJpY0RhdGFbXSA9IFtdO1xuICBjb25zdCBjYW1wYWlnbnMgPSBbJ1NlYXJjaCcsICdTb2NpYWwnLCAnRGlzcGxheScsICdFbWFpbCddO1xuICBjb25zdCBiYXNlRGF0ZSA9IG5ldyBEYXRlKCk7XG4gIGJhc2VEYXRlLnNldERhdGUoYmFzZURhdGUuZ2V0RGF0ZSgpIC0gMzApO1xuXG4gIGZvciAobGV0IGkgPSAwOyBpIDwgMzA7IGkrKykge1xuICAgIGNvbnN0IGN1cnJlbnREYXRlID0gbmV3IERhdGUoYmFzZURhdGUpO1xuICAgIGN1cnJlbnREYXRlLnNldERhdGUoYmFzZURhdGUuZ2V0RGF0ZSgpICsgaSk7XG5cbiAgICBjYW1wYWlnbnMuZm9yRWFjaChjYW1wYWlnbiA9PiB7XG4gICAgICBjb25zdCB1c2VycyA9IE1hdGguZmxvb3IoTWF0aC5yYW5kb20oKSAqIDUwMCkgKyAyMDA7XG4gICAgICBjb25zdCBjb252ZXJzaW9uUmF0ZSA9IE1hdGgucmFuZG9tKCkgKiAwLjE1ICsgMC4wNTsgLy8gNS0yMCUgY29udmVyc2lvbiByYXRlXG4gICAgICBjb25zdCBjb252ZXJzaW9ucyA9IE1hdGguZmxvb3IodXNlcnMgKiBjb252ZXJzaW9uUmF0ZSk7XG4gICAgICBjb25zdCByZXZlbnVlUGVyQ29udmVyc2lvbiA9IE1hdGgucmFuZG9tKCkgKiA1MCArIDI1OyAvLyAkMjUtNzUgcGVyIGNvbnZlcnNpb25cbiAgICAgIGNvbnN0IHJldmVudWUgPSBNYXRoLmZsb29yKGNvbnZlcnNpb25zICogcmV2ZW51ZVBlckNvbnZlcnNpb24pO1xuXG4gICAgICBkYXRhLnB1c2goe1xuICAgICAgICBkYXRlOiBjdXJyZW50RGF0ZS50b0lTT1N0cmluZygpLnNwbGl0KCdUJylbMF0sXG4gICAgICAgIHJldmVudWUsXG4gICAgICAgIHVzZXJzLFxuICAgICAgICBjb252ZXJzaW9ucyxcbiAgICAgICAgY2FtcGFpZ25cbiAgICAgIH0pO1xuICAgIH0pO1xuICB9XG5cbiAgcmV0dXJuIGRhdGE7XG59O1xuXG5leHBvcnQgY29uc3QgbW9ja0RhdGE6IE1ldHJpY0RhdGFbXSA9IGdlbmVyYXRlTW9ja0RhdGEoKTtcblxuLy8gQWdncmVnYXRlIGNhbXBhaWduIHBlcmZvcm1hbmNlXG5leHBvcnQgY29uc3QgY2FtcGFpZ25EYXRhOiBDYW1wYWlnbkRhdGFbXSA9IFtcbiAgJ1NlYXJjaCcsICdTb2NpYWwnLCAnRGlzcGxheScsICdFbWFpbCdcbl0ubWFwKGNhbXBhaWduID0+IHtcbiAgY29uc3QgY2FtcGFpZ25NZXRyaWNzID0gbW9ja0RhdGEuZmlsdGVyKGQgPT4gZC5jYW1wYWlnbiA9PT0gY2FtcGFpZ24pO1xuICBjb25zdCB0b3RhbFJldmVudWUgPSBjYW1wYWlnbk1ldHJpY3MucmVkdWNlKChzdW0sIGQpID0+IHN1bSArIGQucmV2ZW51ZSwgMCk7XG4gIGNvbnN0IHRvdGFsVXNlcnMgPSBjYW1wYWlnbk1ldHJpY3MucmVkdWNlKChzdW0sIGQpID0+IHN1bSArIGQudXNlcnMsIDApO1xuICBjb25zdCB0b3RhbENvbnZlcnNpb25zID0gY2FtcGFpZ25NZXRyaWNzLnJlZHVjZSgoc3VtLCBkKSA9PiBzdW0gKyBkLmNvbnZlcnNpb25zLCAwKTtcblxuICByZXR1cm4ge1xuICAgIGNhbXBhaWduLFxuICAgIHJldmVudWU6IHRvdGFsUmV2ZW51ZSxcbiAgICB1c2VyczogdG90YWxVc2VycyxcbiAgICBjb252ZXJzaW9uczogdG90YWxDb252ZXJzaW9ucyxcbiAgICBjdHI6IE1hdGgucmFuZG9tKCkgKiA1ICsgMiwgLy8gMi03JSBDVFJcbiAgICBjb3N0OiBNYXRoLmZsb29yKHRvdGFsUmV2ZW51ZSAqIChNYXRoLnJhbmRvbSgpICogMC4zICsgMC4yKSkgLy8gMjAtNTAlIG9mIHJldmVudWUgYXMgY29zdFxuICB9O1xufSk7XG5cbi8vIFN1bW1hcnkgbWV0cmljc1xuZXhwb3J0IGNvbnN0IHN1bW1hcnlNZXRyaWNzID0ge1xuICB0b3RhbFJldmVudWU6IG1vY2tEYXRhLnJlZHVjZSgoc3VtLCBkKSA9PiBzdW0gKyBkLnJldmVudWUsIDApLFxuICB0b3RhbFVzZXJzOiBtb2NrRGF0YS5yZWR1Y2UoKHN1bSwgZCkgPT4gc3VtICsgZC51c2VycywgMCksXG4gIHRvdGFsQ29udmVyc2lvbnM6IG1vY2tEYXRhLnJlZHVjZSgoc3VtLCBkKSA9PiBzdW0gKyBkLmNvbnZlcnNpb25zLCAwKSxcbiAgYXZlcmFnZU9yZGVyVmFsdWU6IG1vY2tEYXRhLnJlZHVjZSgoc3VtLCBkKSA9PiBzdW0gKyBkLnJldmVudWUsIDApIC8gbW9ja0RhdGEucmVkdWNlKChzdW0sIGQpID0+IHN1bSArIGQuY29udmVyc2lvbnMsIDApLFxuICBjb252ZXJzaW9uUmF0ZTogKG1vY2tEYXRhLnJlZHVjZSgoc3VtLCBkKSA9PiBzdW0gKyBkLmNvbnZlcnNpb25zLCAwKSAvIG1vY2tEYXRhLnJlZHVjZSgoc3VtLCBkKSA9PiBzdW0gKyBkLnVzZXJzLCAwKSkgKiAxMDBcbn07XG4iXSwibmFtZXMiOlsiZ2VuZXJhdGVNb2NrRGF0YSIsImRhdGEiLCJjYW1wYWlnbnMiLCJiYXNlRGF0ZSIsIkRhdGUiLCJzZXREYXRlIiwiZ2V0RGF0ZSIsImkiLCJjdXJyZW50RGF0ZSIsImZvckVhY2giLCJjYW1wYWlnbiIsInVzZXJzIiwiTWF0aCIsImZsb29yIiwicmFuZG9tIiwiY29udmVyc2lvblJhdGUiLCJjb252ZXJzaW9ucyIsInJldmVudWVQZXJDb252ZXJzaW9uIiwicmV2ZW51ZSIsInB1c2giLCJkYXRlIiwidG9JU09TdHJpbmciLCJzcGxpdCIsIm1vY2tEYXRhIiwiY2FtcGFpZ25EYXRhIiwibWFwIiwiY2FtcGFpZ25NZXRyaWNzIiwiZmlsdGVyIiwiZCIsInRvdGFsUmV2ZW51ZSIsInJlZHVjZSIsInN1bSIsInRvdGFsVXNlcnMiLCJ0b3RhbENvbnZlcnNpb25zIiwiY3RyIiwiY29zdCIsInN1bW1hcnlNZXRyaWNzIiwiYXZlcmFnZU9yZGVyVmFsdWUiXSwic291cmNlUm9vdCI6IiJ9\n//# sourceURL=webpack-internal:///(ssr)/./data/mockData.ts\n");
-
-/***/ }),
-
-/***/ "(ssr)/./lib/utils.ts":
-/*!**********************!*\
-  !*** ./lib/utils.ts ***!
-  \**********************/
-/***/ ((__unused_webpack_module, __webpack_exports__, __webpack_require__) => {
-
-"use strict";
-eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   calculateGrowth: () => (/* binding */ calculateGrowth),\n/* harmony export */   cn: () => (/* binding */ cn),\n/* harmony export */   exportToCSV: () => (/* binding */ exportToCSV),\n/* harmony export */   formatCurrency: () => (/* binding */ formatCurrency),\n/* harmony export */   formatNumber: () => (/* binding */ formatNumber),\n/* harmony export */   formatPercentage: () => (/* binding */ formatPercentage)\n/* harmony export */ });\n/* harmony import */ var clsx__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! clsx */ \"(ssr)/./node_modules/clsx/dist/clsx.mjs\");\n/* harmony import */ var tailwind_merge__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! tailwind-merge */ \"(ssr)/./node_modules/tailwind-merge/dist/bundle-mjs.mjs\");\n\n\nfunction cn(...inputs) {\n    return (0,tailwind_merge__WEBPACK_IMPORTED_MODULE_1__.twMerge)((0,clsx__WEBPACK_IMPORTED_MODULE_0__.clsx)(inputs));\n}\n// Format currency\nfunction formatCurrency(amount) {\n    return new Intl.NumberFormat(\"en-US\", {\n        style: \"currency\",\n        currency: \"USD\",\n        minimumFractionDigits: 0,\n        maximumFractionDigits: 0\n    }).format(amount);\n}\n// Format number with commas\nfunction formatNumber(num) {\n    return new Intl.NumberFormat(\"en-US\").format(num);\n}\n// Format percentage\nfunction formatPercentage(num) {\n    return `${num.toFixed(1)}%`;\n}\n// Calculate growth percentage\nfunction calculateGrowth(current, previous) {\n    if (previous === 0) return 0;\n    return (current - previous) / previous * 100;\n}\n// Export to CSV functionality\nfunction exportToCSV(data, filename) {\n    const csvContent = convertToCSV(data);\n    downloadCSV(csvContent, filename);\n}\nfunction convertToCSV(data) {\n    if (data.length === 0) return \"\";\n    const headers = Object.keys(data[0]);\n    const csvRows = [\n        headers.join(\",\"),\n        ...data.map((row)=>headers.map((header)=>{\n                const value = row[header];\n                return typeof value === \"string\" ? `\"${value}\"` : value;\n            }).join(\",\"))\n    ];\n    return csvRows.join(\"\\n\");\n}\nfunction downloadCSV(csvContent, filename) {\n    const blob = new Blob([\n        csvContent\n    ], {\n        type: \"text/csv;charset=utf-8;\"\n    });\n    const link = document.createElement(\"a\");\n    const url = URL.createObjectURL(blob);\n    link.setAttribute(\"href\", url);\n    link.setAttribute(\"download\", filename);\n    link.style.visibility = \"hidden\";\n    document.body.appendChild(link);\n    link.click();\n    document.body.removeChild(link);\n}\n//# sourceURL=[module]\n//# sourceMappingURL=data:application/json;charset=utf-8;base64,eyJ2ZXJzaW9uIjozLCJmaWxlIjoiKHNzcikvLi9saWIvdXRpbHMudHMiLCJtYXBwaW5ncyI6Ijs7Ozs7Ozs7Ozs7QUFBNkM7QUFDSjtBQUVsQyxTQUFTRSxHQUFHLEdBQUdDLE1BQW9CO0lBQ3hDLE9BQU9GLHVEQUFPQSxDQUFDRCwwQ0FBSUEsQ0FBQ0c7QUFDdEI7QUFFQSxrQkFBa0I7QUFDWCxTQUFTQyxlQUFlQyxNQUFjO0lBQzNDLE9BQU8sSUFBSUMsS0FBS0MsWUFBWSxDQUFDLFNBQVM7UUFDcENDLE9BQU87UUFDUEMsVUFBVTtRQUNWQyx1QkFBdUI7UUFDdkJDLHVCQUF1QjtJQUN6QixHQUFHQyxNQUFNLENBQUNQO0FBQ1o7QUFFQSw0QkFBNEI7QUFDckIsU0FBU1EsYUFBYUMsR0FBVztJQUN0QyxPQUFPLElBQUlSLEtBQUtDLFlBQVksQ0FBQyxTQUFTSyxNQUFNLENBQUNFO0FBQy9DO0FBRUEsb0JBQW9CO0FBQ2IsU0FBU0MsaUJBQWlCRCxHQUFXO0lBQzFDLE9BQU8sQ0FBQyxFQUFFQSxJQUFJRSxPQUFPLENBQUMsR0FBRyxDQUFDLENBQUM7QUFDN0I7QUFFQSw4QkFBOEI7QUFDdkIsU0FBU0MsZ0JBQWdCQyxPQUFlLEVBQUVDLFFBQWdCO0lBQy9ELElBQUlBLGFBQWEsR0FBRyxPQUFPO0lBQzNCLE9BQU8sQ0FBRUQsVUFBVUMsUUFBTyxJQUFLQSxXQUFZO0FBQzdDO0FBRUEsOEJBQThCO0FBQ3ZCLFNBQVNDLFlBQVlDLElBQVcsRUFBRUMsUUFBZ0I7SUFDdkQsTUFBTUMsYUFBYUMsYUFBYUg7SUFDaENJLFlBQVlGLFlBQVlEO0FBQzFCO0FBRUEsU0FBU0UsYUFBYUgsSUFBVztJQUMvQixJQUFJQSxLQUFLSyxNQUFNLEtBQUssR0FBRyxPQUFPO0lBRTlCLE1BQU1DLFVBQVVDLE9BQU9DLElBQUksQ0FBQ1IsSUFBSSxDQUFDLEVBQUU7SUFDbkMsTUFBTVMsVUFBVTtRQUNkSCxRQUFRSSxJQUFJLENBQUM7V0FDVlYsS0FBS1csR0FBRyxDQUFDQyxDQUFBQSxNQUNWTixRQUFRSyxHQUFHLENBQUNFLENBQUFBO2dCQUNWLE1BQU1DLFFBQVFGLEdBQUcsQ0FBQ0MsT0FBTztnQkFDekIsT0FBTyxPQUFPQyxVQUFVLFdBQVcsQ0FBQyxDQUFDLEVBQUVBLE1BQU0sQ0FBQyxDQUFDLEdBQUdBO1lBQ3BELEdBQUdKLElBQUksQ0FBQztLQUVYO0lBRUQsT0FBT0QsUUFBUUMsSUFBSSxDQUFDO0FBQ3RCO0FBRUEsU0FBU04sWUFBWUYsVUFBa0IsRUFBRUQsUUFBZ0I7SUFDdkQsTUFBTWMsT0FBTyxJQUFJQyxLQUFLO1FBQUNkO0tBQVcsRUFBRTtRQUFFZSxNQUFNO0lBQTBCO0lBQ3RFLE1BQU1DLE9BQU9DLFNBQVNDLGFBQWEsQ0FBQztJQUNwQyxNQUFNQyxNQUFNQyxJQUFJQyxlQUFlLENBQUNSO0lBRWhDRyxLQUFLTSxZQUFZLENBQUMsUUFBUUg7SUFDMUJILEtBQUtNLFlBQVksQ0FBQyxZQUFZdkI7SUFDOUJpQixLQUFLL0IsS0FBSyxDQUFDc0MsVUFBVSxHQUFHO0lBRXhCTixTQUFTTyxJQUFJLENBQUNDLFdBQVcsQ0FBQ1Q7SUFDMUJBLEtBQUtVLEtBQUs7SUFDVlQsU0FBU08sSUFBSSxDQUFDRyxXQUFXLENBQUNYO0FBQzVCIiwic291cmNlcyI6WyJ3ZWJwYWNrOi8vYWRteWJyYW5kLWluc2lnaHRzLy4vbGliL3V0aWxzLnRzP2Y3NDUiXSwic291cmNlc0NvbnRlbnQiOlsiaW1wb3J0IHsgdHlwZSBDbGFzc1ZhbHVlLCBjbHN4IH0gZnJvbSBcImNsc3hcIjtcbmltcG9ydCB7IHR3TWVyZ2UgfSBmcm9tIFwidGFpbHdpbmQtbWVyZ2VcIjtcblxuZXhwb3J0IGZ1bmN0aW9uIGNuKC4uLmlucHV0czogQ2xhc3NWYWx1ZVtdKSB7XG4gIHJldHVybiB0d01lcmdlKGNsc3goaW5wdXRzKSk7XG59XG5cbi8vIEZvcm1hdCBjdXJyZW5jeVxuZXhwb3J0IGZ1bmN0aW9uIGZvcm1hdEN1cnJlbmN5KGFtb3VudDogbnVtYmVyKTogc3RyaW5nIHtcbiAgcmV0dXJuIG5ldyBJbnRsLk51bWJlckZvcm1hdCgnZW4tVVMnLCB7XG4gICAgc3R5bGU6ICdjdXJyZW5jeScsXG4gICAgY3VycmVuY3k6ICdVU0QnLFxuICAgIG1pbmltdW1GcmFjdGlvbkRpZ2l0czogMCxcbiAgICBtYXhpbXVtRnJhY3Rpb25EaWdpdHM6IDAsXG4gIH0pLmZvcm1hdChhbW91bnQpO1xufVxuXG4vLyBGb3JtYXQgbnVtYmVyIHdpdGggY29tbWFzXG5leHBvcnQgZnVuY3Rpb24gZm9ybWF0TnVtYmVyKG51bTogbnVtYmVyKTogc3RyaW5nIHtcbiAgcmV0dXJuIG5ldyBJbnRsLk51bWJlckZvcm1hdCgnZW4tVVMnKS5mb3JtYXQobnVtKTtcbn1cblxuLy8gRm9ybWF0IHBlcmNlbnRhZ2VcbmV4cG9ydCBmdW5jdGlvbiBmb3JtYXRQZXJjZW50YWdlKG51bTogbnVtYmVyKTogc3RyaW5nIHtcbiAgcmV0dXJuIGAke251bS50b0ZpeGVkKDEpfSVgO1xufVxuXG4vLyBDYWxjdWxhdGUgZ3Jvd3RoIHBlcmNlbnRhZ2VcbmV4cG9ydCBmdW5jdGlvbiBjYWxjdWxhdGVHcm93dGgoY3VycmVudDogbnVtYmVyLCBwcmV2aW91czogbnVtYmVyKTogbnVtYmVyIHtcbiAgaWYgKHByZXZpb3VzID09PSAwKSByZXR1cm4gMDtcbiAgcmV0dXJuICgoY3VycmVudCAtIHByZXZpb3VzKSAvIHByZXZpb3VzKSAqIDEwMDtcbn1cblxuLy8gRXhwb3J0IHRvIENTViBmdW5jdGlvbmFsaXR5XG5leHBvcnQgZnVuY3Rpb24gZXhwb3J0VG9DU1YoZGF0YTogYW55W10sIGZpbGVuYW1lOiBzdHJpbmcpIHtcbiAgY29uc3QgY3N2Q29udGVudCA9IGNvbnZlcnRUb0NTVihkYXRhKTtcbiAgZG93bmxvYWRDU1YoY3N2Q29udGVudCwgZmlsZW5hbWUpO1xufVxuXG5mdW5jdGlvbiBjb252ZXJ0VG9DU1YoZGF0YTogYW55W10pOiBzdHJpbmcge1xuICBpZiAoZGF0YS5sZW5ndGggPT09IDApIHJldHVybiAnJztcblxuICBjb25zdCBoZWFkZXJzID0gT2JqZWN0LmtleXMoZGF0YVswXSk7XG4gIGNvbnN0IGNzdlJvd3MgPSBbXG4gICAgaGVhZGVycy5qb2luKCcsJyksXG4gICAgLi4uZGF0YS5tYXAocm93ID0+IFxuICAgICAgaGVhZGVycy5tYXAoaGVhZGVyID0+IHtcbiAgICAgICAgY29uc3QgdmFsdWUgPSByb3dbaGVhZGVyXTtcbiAgICAgICAgcmV0dXJuIHR5cGVvZiB2YWx1ZSA9PT0gJ3N0cmluZycgPyBgXCIke3ZhbHVlfVwiYCA6IHZhbHVlO1xuICAgICAgfSkuam9pbignLCcpXG4gICAgKVxuICBdO1xuXG4gIHJldHVybiBjc3ZSb3dzLmpvaW4oJ1xcbicpO1xufVxuXG5mdW5jdGlvbiBkb3dubG9hZENTVihjc3ZDb250ZW50OiBzdHJpbmcsIGZpbGVuYW1lOiBzdHJpbmcpIHtcbiAgY29uc3QgYmxvYiA9IG5ldyBCbG9iKFtjc3ZDb250ZW50XSwgeyB0eXBlOiAndGV4dC9jc3Y7Y2hhcnNldD11dGYtODsnIH0pO1xuICBjb25zdCBsaW5rID0gZG9jdW1lbnQuY3JlYXRlRWxlbWVudCgnYScpO1xuICBjb25zdCB1cmwgPSBVUkwuY3JlYXRlT2JqZWN0VVJMKGJsb2IpO1xuXG4gIGxpbmsuc2V0QXR0cmlidXRlKCdocmVmJywgdXJsKTtcbiAgbGluay5zZXRBdHRyaWJ1dGUoJ2Rvd25sb2FkJywgZmlsZW5hbWUpO1xuICBsaW5rLnN0eWxlLnZpc2liaWxpdHkgPSAnaGlkZGVuJztcblxuICBkb2N1bWVudC5ib2R5LmFwcGVuZENoaWxkKGxpbmspO1xuICBsaW5rLmNsaWNrKCk7XG4gIGRvY3VtZW50LmJvZHkucmVtb3ZlQ2hpbGQobGluayk7XG59XG4iXSwibmFtZXMiOlsiY2xzeCIsInR3TWVyZ2UiLCJjbiIsImlucHV0cyIsImZvcm1hdEN1cnJlbmN5IiwiYW1vdW50IiwiSW50bCIsIk51bWJlckZvcm1hdCIsInN0eWxlIiwiY3VycmVuY3kiLCJtaW5pbXVtRnJhY3Rpb25EaWdpdHMiLCJtYXhpbXVtRnJhY3Rpb25EaWdpdHMiLCJmb3JtYXQiLCJmb3JtYXROdW1iZXIiLCJudW0iLCJmb3JtYXRQZXJjZW50YWdlIiwidG9GaXhlZCIsImNhbGN1bGF0ZUdyb3d0aCIsImN1cnJlbnQiLCJwcmV2aW91cyIsImV4cG9ydFRvQ1NWIiwiZGF0YSIsImZpbGVuYW1lIiwiY3N2Q29udGVudCIsImNvbnZlcnRUb0NTViIsImRvd25sb2FkQ1NWIiwibGVuZ3RoIiwiaGVhZGVycyIsIk9iamVjdCIsImtleXMiLCJjc3ZSb3dzIiwiam9pbiIsIm1hcCIsInJvdyIsImhlYWRlciIsInZhbHVlIiwiYmxvYiIsIkJsb2IiLCJ0eXBlIiwibGluayIsImRvY3VtZW50IiwiY3JlYXRlRWxlbWVudCIsInVybCIsIlVSTCIsImNyZWF0ZU9iamVjdFVSTCIsInNldEF0dHJpYnV0ZSIsInZpc2liaWxpdHkiLCJib2R5IiwiYXBwZW5kQ2hpbGQiLCJjbGljayIsInJlbW92ZUNoaWxkIl0sInNvdXJjZVJvb3QiOiIifQ==\n//# sourceURL=webpack-internal:///(ssr)/./lib/utils.ts\n");
-
-/***/ }),
-
-/***/ "(rsc)/./styles/globals.css":
-/*!****************************!*\
-  !*** ./styles/globals.css ***!
-  \****************************/
-/***/ ((__unused_webpack_module, __webpack_exports__, __webpack_require__) => {
-
-"use strict";
-eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (__WEBPACK_DEFAULT_EXPORT__)\n/* harmony export */ });\n/* harmony default export */ const __WEBPACK_DEFAULT_EXPORT__ = (\"c828777c2a00\");\nif (false) {}\n//# sourceURL=[module]\n//# sourceMappingURL=data:application/json;charset=utf-8;base64,eyJ2ZXJzaW9uIjozLCJmaWxlIjoiKHJzYykvLi9zdHlsZXMvZ2xvYmFscy5jc3MiLCJtYXBwaW5ncyI6Ijs7OztBQUFBLGlFQUFlLGNBQWM7QUFDN0IsSUFBSSxLQUFVLEVBQUUsRUFBdUIiLCJzb3VyY2VzIjpbIndlYnBhY2s6Ly9hZG15YnJhbmQtaW5zaWdodHMvLi9zdHlsZXMvZ2xvYmFscy5jc3M/NDVhMiJdLCJzb3VyY2VzQ29udGVudCI6WyJleHBvcnQgZGVmYXVsdCBcImM4Mjg3NzdjMmEwMFwiXG5pZiAobW9kdWxlLmhvdCkgeyBtb2R1bGUuaG90LmFjY2VwdCgpIH1cbiJdLCJuYW1lcyI6W10sInNvdXJjZVJvb3QiOiIifQ==\n//# sourceURL=webpack-internal:///(rsc)/./styles/globals.css\n");
-
-/***/ }),
-
-/***/ "(rsc)/./app/layout.tsx":
-/*!************************!*\
-  !*** ./app/layout.tsx ***!
-  \************************/
-/***/ ((__unused_webpack_module, __webpack_exports__, __webpack_require__) => {
-
-"use strict";
-eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (/* binding */ RootLayout),\n/* harmony export */   metadata: () => (/* binding */ metadata)\n/* harmony export */ });\n/* harmony import */ var react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! react/jsx-dev-runtime */ \"(rsc)/./node_modules/next/dist/server/future/route-modules/app-page/vendored/rsc/react-jsx-dev-runtime.js\");\n/* harmony import */ var react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0___default = /*#__PURE__*/__webpack_require__.n(react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__);\n/* harmony import */ var next_font_google_target_css_path_app_layout_tsx_import_Inter_arguments_subsets_latin_variableName_inter___WEBPACK_IMPORTED_MODULE_2__ = __webpack_require__(/*! next/font/google/target.css?{\"path\":\"app\\\\layout.tsx\",\"import\":\"Inter\",\"arguments\":[{\"subsets\":[\"latin\"]}],\"variableName\":\"inter\"} */ \"(rsc)/./node_modules/next/font/google/target.css?{\\\"path\\\":\\\"app\\\\\\\\layout.tsx\\\",\\\"import\\\":\\\"Inter\\\",\\\"arguments\\\":[{\\\"subsets\\\":[\\\"latin\\\"]}],\\\"variableName\\\":\\\"inter\\\"}\");\n/* harmony import */ var next_font_google_target_css_path_app_layout_tsx_import_Inter_arguments_subsets_latin_variableName_inter___WEBPACK_IMPORTED_MODULE_2___default = /*#__PURE__*/__webpack_require__.n(next_font_google_target_css_path_app_layout_tsx_import_Inter_arguments_subsets_latin_variableName_inter___WEBPACK_IMPORTED_MODULE_2__);\n/* harmony import */ var _styles_globals_css__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! ../styles/globals.css */ \"(rsc)/./styles/globals.css\");\n\n\n\nconst metadata = {\n    title: \"ADmyBRAND Insights - Analytics Dashboard\",\n    description: \"Modern analytics dashboard for digital marketing agencies\",\n    keywords: \"analytics, dashboard, marketing, data visualization, Next.js\"\n};\nfunction RootLayout({ children }) {\n    return /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"html\", {\n        lang: \"en\",\n        suppressHydrationWarning: true,\n        children: /*#__PURE__*/ (0,react_jsx_dev_runtime__WEBPACK_IMPORTED_MODULE_0__.jsxDEV)(\"body\", {\n            className: (next_font_google_target_css_path_app_layout_tsx_import_Inter_arguments_subsets_latin_variableName_inter___WEBPACK_IMPORTED_MODULE_2___default().className),\n            children: children\n        }, void 0, false, {\n            fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\app\\\\layout.tsx\",\n            lineNumber: 20,\n            columnNumber: 7\n        }, this)\n    }, void 0, false, {\n        fileName: \"C:\\\\Users\\\\Nikhil\\\\Desktop\\\\exported-assets\\\\admybrand-insights-complete\\\\admybrand-insights-fixed\\\\app\\\\layout.tsx\",\n        lineNumber: 19,\n        columnNumber: 5\n    }, this);\n}\n//# sourceURL=[module]\n//# sourceMappingURL=data:application/json;charset=utf-8;base64,eyJ2ZXJzaW9uIjozLCJmaWxlIjoiKHJzYykvLi9hcHAvbGF5b3V0LnRzeCIsIm1hcHBpbmdzIjoiOzs7Ozs7Ozs7OztBQUlNQTtBQUZ5QjtBQUl4QixNQUFNQyxXQUFxQjtJQUNoQ0MsT0FBTztJQUNQQyxhQUFhO0lBQ2JDLFVBQVU7QUFDWixFQUFFO0FBRWEsU0FBU0MsV0FBVyxFQUNqQ0MsUUFBUSxFQUdUO0lBQ0MscUJBQ0UsOERBQUNDO1FBQUtDLE1BQUs7UUFBS0Msd0JBQXdCO2tCQUN0Qyw0RUFBQ0M7WUFBS0MsV0FBV1gsMkpBQWU7c0JBQzdCTTs7Ozs7Ozs7Ozs7QUFJVCIsInNvdXJjZXMiOlsid2VicGFjazovL2FkbXlicmFuZC1pbnNpZ2h0cy8uL2FwcC9sYXlvdXQudHN4Pzk5ODgiXSwic291cmNlc0NvbnRlbnQiOlsiaW1wb3J0IHR5cGUgeyBNZXRhZGF0YSB9IGZyb20gJ25leHQnO1xuaW1wb3J0IHsgSW50ZXIgfSBmcm9tICduZXh0L2ZvbnQvZ29vZ2xlJztcbmltcG9ydCAnLi4vc3R5bGVzL2dsb2JhbHMuY3NzJztcblxuY29uc3QgaW50ZXIgPSBJbnRlcih7IHN1YnNldHM6IFsnbGF0aW4nXSB9KTtcblxuZXhwb3J0IGNvbnN0IG1ldGFkYXRhOiBNZXRhZGF0YSA9IHtcbiAgdGl0bGU6ICdBRG15QlJBTkQgSW5zaWdodHMgLSBBbmFseXRpY3MgRGFzaGJvYXJkJyxcbiAgZGVzY3JpcHRpb246ICdNb2Rlcm4gYW5hbHl0aWNzIGRhc2hib2FyZCBmb3IgZGlnaXRhbCBtYXJrZXRpbmcgYWdlbmNpZXMnLFxuICBrZXl3b3JkczogJ2FuYWx5dGljcywgZGFzaGJvYXJkLCBtYXJrZXRpbmcsIGRhdGEgdmlzdWFsaXphdGlvbiwgTmV4dC5qcycsXG59O1xuXG5leHBvcnQgZGVmYXVsdCBmdW5jdGlvbiBSb290TGF5b3V0KHtcbiAgY2hpbGRyZW4sXG59OiB7XG4gIGNoaWxkcmVuOiBSZWFjdC5SZWFjdE5vZGU7XG59KSB7XG4gIHJldHVybiAoXG4gICAgPGh0bWwgbGFuZz1cImVuXCIgc3VwcHJlc3NIeWRyYXRpb25XYXJuaW5nPlxuICAgICAgPGJvZHkgY2xhc3NOYW1lPXtpbnRlci5jbGFzc05hbWV9PlxuICAgICAgICB7Y2hpbGRyZW59XG4gICAgICA8L2JvZHk+XG4gICAgPC9odG1sPlxuICApO1xufVxuIl0sIm5hbWVzIjpbImludGVyIiwibWV0YWRhdGEiLCJ0aXRsZSIsImRlc2NyaXB0aW9uIiwia2V5d29yZHMiLCJSb290TGF5b3V0IiwiY2hpbGRyZW4iLCJodG1sIiwibGFuZyIsInN1cHByZXNzSHlkcmF0aW9uV2FybmluZyIsImJvZHkiLCJjbGFzc05hbWUiXSwic291cmNlUm9vdCI6IiJ9\n//# sourceURL=webpack-internal:///(rsc)/./app/layout.tsx\n");
-
-/***/ }),
-
-/***/ "(rsc)/./app/page.tsx":
-/*!**********************!*\
-  !*** ./app/page.tsx ***!
-  \**********************/
-/***/ ((__unused_webpack_module, __webpack_exports__, __webpack_require__) => {
-
-"use strict";
-__webpack_require__.r(__webpack_exports__);
-/* harmony export */ __webpack_require__.d(__webpack_exports__, {
-/* harmony export */   $$typeof: () => (/* binding */ $$typeof),
-/* harmony export */   __esModule: () => (/* binding */ __esModule),
-/* harmony export */   "default": () => (__WEBPACK_DEFAULT_EXPORT__)
-/* harmony export */ });
-/* harmony import */ var next_dist_build_webpack_loaders_next_flight_loader_module_proxy__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! next/dist/build/webpack/loaders/next-flight-loader/module-proxy */ "(rsc)/./node_modules/next/dist/build/webpack/loaders/next-flight-loader/module-proxy.js");
-
-const proxy = (0,next_dist_build_webpack_loaders_next_flight_loader_module_proxy__WEBPACK_IMPORTED_MODULE_0__.createProxy)(String.raw`C:\Users\Nikhil\Desktop\exported-assets\admybrand-insights-complete\admybrand-insights-fixed\app\page.tsx`)
-
-// Accessing the __esModule property and exporting $$typeof are required here.
-// The __esModule getter forces the proxy target to create the default export
-// and the $$typeof value is for rendering logic to determine if the module
-// is a client boundary.
-const { __esModule, $$typeof } = proxy;
-const __default__ = proxy.default;
-
-/* harmony default export */ const __WEBPACK_DEFAULT_EXPORT__ = ((0,next_dist_build_webpack_loaders_next_flight_loader_module_proxy__WEBPACK_IMPORTED_MODULE_0__.createProxy)(String.raw`C:\Users\Nikhil\Desktop\exported-assets\admybrand-insights-complete\admybrand-insights-fixed\app\page.tsx#default`));
-
-
-/***/ })
-
-};
-;
-
-// load runtime
-var __webpack_require__ = require("../webpack-runtime.js");
-__webpack_require__.C(exports);
-var __webpack_exec__ = (moduleId) => (__webpack_require__(__webpack_require__.s = moduleId))
-var __webpack_exports__ = __webpack_require__.X(0, ["vendor-chunks/framer-motion","vendor-chunks/lodash","vendor-chunks/next","vendor-chunks/recharts","vendor-chunks/d3-shape","vendor-chunks/motion-dom","vendor-chunks/lucide-react","vendor-chunks/d3-scale","vendor-chunks/d3-array","vendor-chunks/d3-format","vendor-chunks/d3-interpolate","vendor-chunks/d3-time","vendor-chunks/react-smooth","vendor-chunks/react-transition-group","vendor-chunks/motion-utils","vendor-chunks/@swc","vendor-chunks/@babel","vendor-chunks/prop-types","vendor-chunks/recharts-scale","vendor-chunks/d3-time-format","vendor-chunks/d3-color","vendor-chunks/victory-vendor","vendor-chunks/react-is","vendor-chunks/tiny-invariant","vendor-chunks/tailwind-merge","vendor-chunks/internmap","vendor-chunks/fast-equals","vendor-chunks/decimal.js-light","vendor-chunks/d3-path","vendor-chunks/clsx","vendor-chunks/object-assign","vendor-chunks/eventemitter3"], () => (__webpack_exec__("(rsc)/./node_modules/next/dist/build/webpack/loaders/next-app-loader.js?name=app%2Fpage&page=%2Fpage&appPaths=%2Fpage&pagePath=private-next-app-dir%2Fpage.tsx&appDir=C%3A%5CUsers%5CNikhil%5CDesktop%5Cexported-assets%5Cadmybrand-insights-complete%5Cadmybrand-insights-fixed%5Capp&pageExtensions=tsx&pageExtensions=ts&pageExtensions=jsx&pageExtensions=js&rootDir=C%3A%5CUsers%5CNikhil%5CDesktop%5Cexported-assets%5Cadmybrand-insights-complete%5Cadmybrand-insights-fixed&isDev=true&tsconfigPath=tsconfig.json&basePath=&assetPrefix=&nextConfigOutput=&preferredRegion=&middlewareConfig=e30%3D!")));
-module.exports = __webpack_exports__;
-
-})();
\ No newline at end of file
@@ -1 +0,0 @@
-self.__REACT_LOADABLE_MANIFEST="{}"
\ No newline at end of file
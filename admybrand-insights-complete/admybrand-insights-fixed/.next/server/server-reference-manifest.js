@@ -1 +0,0 @@
-self.__RSC_SERVER_MANIFEST="{\n  \"node\": {},\n  \"edge\": {},\n  \"encryptionKey\": \"1d8/Z2IsXDQFNzzRmZybSTXE/VK8/+ZEYhwtXDDLkF8=\"\n}"
\ No newline at end of file
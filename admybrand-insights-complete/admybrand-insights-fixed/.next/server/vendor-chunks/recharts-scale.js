@@ -1,62 +0,0 @@
-"use strict";
-/*
- * ATTENTION: An "eval-source-map" devtool has been used.
- * This devtool is neither made for production nor for readable output files.
- * It uses "eval()" calls to create a separate source file with attached SourceMaps in the browser devtools.
- * If you are trying to read the output file, select a different devtool (https://webpack.js.org/configuration/devtool/)
- * or disable the default devtool with "devtool: false".
- * If you are looking for production-ready output files, see mode: "production" (https://webpack.js.org/configuration/mode/).
- */
-exports.id = "vendor-chunks/recharts-scale";
-exports.ids = ["vendor-chunks/recharts-scale"];
-exports.modules = {
-
-/***/ "(ssr)/./node_modules/recharts-scale/es6/getNiceTickValues.js":
-/*!**************************************************************!*\
-  !*** ./node_modules/recharts-scale/es6/getNiceTickValues.js ***!
-  \**************************************************************/
-/***/ ((__unused_webpack_module, __webpack_exports__, __webpack_require__) => {
-
-eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   getNiceTickValues: () => (/* binding */ getNiceTickValues),\n/* harmony export */   getTickValues: () => (/* binding */ getTickValues),\n/* harmony export */   getTickValuesFixedDomain: () => (/* binding */ getTickValuesFixedDomain)\n/* harmony export */ });\n/* harmony import */ var decimal_js_light__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! decimal.js-light */ \"(ssr)/./node_modules/decimal.js-light/decimal.mjs\");\n/* harmony import */ var _util_utils__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! ./util/utils */ \"(ssr)/./node_modules/recharts-scale/es6/util/utils.js\");\n/* harmony import */ var _util_arithmetic__WEBPACK_IMPORTED_MODULE_2__ = __webpack_require__(/*! ./util/arithmetic */ \"(ssr)/./node_modules/recharts-scale/es6/util/arithmetic.js\");\nfunction _toConsumableArray(arr) { return _arrayWithoutHoles(arr) || _iterableToArray(arr) || _unsupportedIterableToArray(arr) || _nonIterableSpread(); }\n\nfunction _nonIterableSpread() { throw new TypeError(\"Invalid attempt to spread non-iterable instance.\\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.\"); }\n\nfunction _iterableToArray(iter) { if (typeof Symbol !== \"undefined\" && Symbol.iterator in Object(iter)) return Array.from(iter); }\n\nfunction _arrayWithoutHoles(arr) { if (Array.isArray(arr)) return _arrayLikeToArray(arr); }\n\nfunction _slicedToArray(arr, i) { return _arrayWithHoles(arr) || _iterableToArrayLimit(arr, i) || _unsupportedIterableToArray(arr, i) || _nonIterableRest(); }\n\nfunction _nonIterableRest() { throw new TypeError(\"Invalid attempt to destructure non-iterable instance.\\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.\"); }\n\nfunction _unsupportedIterableToArray(o, minLen) { if (!o) return; if (typeof o === \"string\") return _arrayLikeToArray(o, minLen); var n = Object.prototype.toString.call(o).slice(8, -1); if (n === \"Object\" && o.constructor) n = o.constructor.name; if (n === \"Map\" || n === \"Set\") return Array.from(o); if (n === \"Arguments\" || /^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)) return _arrayLikeToArray(o, minLen); }\n\nfunction _arrayLikeToArray(arr, len) { if (len == null || len > arr.length) len = arr.length; for (var i = 0, arr2 = new Array(len); i < len; i++) { arr2[i] = arr[i]; } return arr2; }\n\nfunction _iterableToArrayLimit(arr, i) { if (typeof Symbol === \"undefined\" || !(Symbol.iterator in Object(arr))) return; var _arr = []; var _n = true; var _d = false; var _e = undefined; try { for (var _i = arr[Symbol.iterator](), _s; !(_n = (_s = _i.next()).done); _n = true) { _arr.push(_s.value); if (i && _arr.length === i) break; } } catch (err) { _d = true; _e = err; } finally { try { if (!_n && _i[\"return\"] != null) _i[\"return\"](); } finally { if (_d) throw _e; } } return _arr; }\n\nfunction _arrayWithHoles(arr) { if (Array.isArray(arr)) return arr; }\n\n/**\n * @fileOverview calculate tick values of scale\n * @author xile611, arcthur\n * @date 2015-09-17\n */\n\n\n\n/**\n * Calculate a interval of a minimum value and a maximum value\n *\n * @param  {Number} min       The minimum value\n * @param  {Number} max       The maximum value\n * @return {Array} An interval\n */\n\nfunction getValidInterval(_ref) {\n  var _ref2 = _slicedToArray(_ref, 2),\n      min = _ref2[0],\n      max = _ref2[1];\n\n  var validMin = min,\n      validMax = max; // exchange\n\n  if (min > max) {\n    validMin = max;\n    validMax = min;\n  }\n\n  return [validMin, validMax];\n}\n/**\n * Calculate the step which is easy to understand between ticks, like 10, 20, 25\n *\n * @param  {Decimal} roughStep        The rough step calculated by deviding the\n * difference by the tickCount\n * @param  {Boolean} allowDecimals    Allow the ticks to be decimals or not\n * @param  {Integer} correctionFactor A correction factor\n * @return {Decimal} The step which is easy to understand between two ticks\n */\n\n\nfunction getFormatStep(roughStep, allowDecimals, correctionFactor) {\n  if (roughStep.lte(0)) {\n    return new decimal_js_light__WEBPACK_IMPORTED_MODULE_0__[\"default\"](0);\n  }\n\n  var digitCount = _util_arithmetic__WEBPACK_IMPORTED_MODULE_2__[\"default\"].getDigitCount(roughStep.toNumber()); // The ratio between the rough step and the smallest number which has a bigger\n  // order of magnitudes than the rough step\n\n  var digitCountValue = new decimal_js_light__WEBPACK_IMPORTED_MODULE_0__[\"default\"](10).pow(digitCount);\n  var stepRatio = roughStep.div(digitCountValue); // When an integer and a float multiplied, the accuracy of result may be wrong\n\n  var stepRatioScale = digitCount !== 1 ? 0.05 : 0.1;\n  var amendStepRatio = new decimal_js_light__WEBPACK_IMPORTED_MODULE_0__[\"default\"](Math.ceil(stepRatio.div(stepRatioScale).toNumber())).add(correctionFactor).mul(stepRatioScale);\n  var formatStep = amendStepRatio.mul(digitCountValue);\n  return allowDecimals ? formatStep : new decimal_js_light__WEBPACK_IMPORTED_MODULE_0__[\"default\"](Math.ceil(formatStep));\n}\n/**\n * calculate the ticks when the minimum value equals to the maximum value\n *\n * @param  {Number}  value         The minimum valuue which is also the maximum value\n * @param  {Integer} tickCount     The count of ticks\n * @param  {Boolean} allowDecimals Allow the ticks to be decimals or not\n * @return {Array}                 ticks\n */\n\n\nfunction getTickOfSingleValue(value, tickCount, allowDecimals) {\n  var step = 1; // calculate the middle value of ticks\n\n  var middle = new decimal_js_light__WEBPACK_IMPORTED_MODULE_0__[\"default\"](value);\n\n  if (!middle.isint() && allowDecimals) {\n    var absVal = Math.abs(value);\n\n    if (absVal < 1) {\n      // The step should be a float number when the difference is smaller than 1\n      step = new decimal_js_light__WEBPACK_IMPORTED_MODULE_0__[\"default\"](10).pow(_util_arithmetic__WEBPACK_IMPORTED_MODULE_2__[\"default\"].getDigitCount(value) - 1);\n      middle = new decimal_js_light__WEBPACK_IMPORTED_MODULE_0__[\"default\"](Math.floor(middle.div(step).toNumber())).mul(step);\n    } else if (absVal > 1) {\n      // Return the maximum integer which is smaller than 'value' when 'value' is greater than 1\n      middle = new decimal_js_light__WEBPACK_IMPORTED_MODULE_0__[\"default\"](Math.floor(value));\n    }\n  } else if (value === 0) {\n    middle = new decimal_js_light__WEBPACK_IMPORTED_MODULE_0__[\"default\"](Math.floor((tickCount - 1) / 2));\n  } else if (!allowDecimals) {\n    middle = new decimal_js_light__WEBPACK_IMPORTED_MODULE_0__[\"default\"](Math.floor(value));\n  }\n\n  var middleIndex = Math.floor((tickCount - 1) / 2);\n  var fn = (0,_util_utils__WEBPACK_IMPORTED_MODULE_1__.compose)((0,_util_utils__WEBPACK_IMPORTED_MODULE_1__.map)(function (n) {\n    return middle.add(new decimal_js_light__WEBPACK_IMPORTED_MODULE_0__[\"default\"](n - middleIndex).mul(step)).toNumber();\n  }), _util_utils__WEBPACK_IMPORTED_MODULE_1__.range);\n  return fn(0, tickCount);\n}\n/**\n * Calculate the step\n *\n * @param  {Number}  min              The minimum value of an interval\n * @param  {Number}  max              The maximum value of an interval\n * @param  {Integer} tickCount        The count of ticks\n * @param  {Boolean} allowDecimals    Allow the ticks to be decimals or not\n * @param  {Number}  correctionFactor A correction factor\n * @return {Object}  The step, minimum value of ticks, maximum value of ticks\n */\n\n\nfunction calculateStep(min, max, tickCount, allowDecimals) {\n  var correctionFactor = arguments.length > 4 && arguments[4] !== undefined ? arguments[4] : 0;\n\n  // dirty hack (for recharts' test)\n  if (!Number.isFinite((max - min) / (tickCount - 1))) {\n    return {\n      step: new decimal_js_light__WEBPACK_IMPORTED_MODULE_0__[\"default\"](0),\n      tickMin: new decimal_js_light__WEBPACK_IMPORTED_MODULE_0__[\"default\"](0),\n      tickMax: new decimal_js_light__WEBPACK_IMPORTED_MODULE_0__[\"default\"](0)\n    };\n  } // The step which is easy to understand between two ticks\n\n\n  var step = getFormatStep(new decimal_js_light__WEBPACK_IMPORTED_MODULE_0__[\"default\"](max).sub(min).div(tickCount - 1), allowDecimals, correctionFactor); // A medial value of ticks\n\n  var middle; // When 0 is inside the interval, 0 should be a tick\n\n  if (min <= 0 && max >= 0) {\n    middle = new decimal_js_light__WEBPACK_IMPORTED_MODULE_0__[\"default\"](0);\n  } else {\n    // calculate the middle value\n    middle = new decimal_js_light__WEBPACK_IMPORTED_MODULE_0__[\"default\"](min).add(max).div(2); // minus modulo value\n\n    middle = middle.sub(new decimal_js_light__WEBPACK_IMPORTED_MODULE_0__[\"default\"](middle).mod(step));\n  }\n\n  var belowCount = Math.ceil(middle.sub(min).div(step).toNumber());\n  var upCount = Math.ceil(new decimal_js_light__WEBPACK_IMPORTED_MODULE_0__[\"default\"](max).sub(middle).div(step).toNumber());\n  var scaleCount = belowCount + upCount + 1;\n\n  if (scaleCount > tickCount) {\n    // When more ticks need to cover the interval, step should be bigger.\n    return calculateStep(min, max, tickCount, allowDecimals, correctionFactor + 1);\n  }\n\n  if (scaleCount < tickCount) {\n    // When less ticks can cover the interval, we should add some additional ticks\n    upCount = max > 0 ? upCount + (tickCount - scaleCount) : upCount;\n    belowCount = max > 0 ? belowCount : belowCount + (tickCount - scaleCount);\n  }\n\n  return {\n    step: step,\n    tickMin: middle.sub(new decimal_js_light__WEBPACK_IMPORTED_MODULE_0__[\"default\"](belowCount).mul(step)),\n    tickMax: middle.add(new decimal_js_light__WEBPACK_IMPORTED_MODULE_0__[\"default\"](upCount).mul(step))\n  };\n}\n/**\n * Calculate the ticks of an interval, the count of ticks will be guraranteed\n *\n * @param  {Number}  min, max      min: The minimum value, max: The maximum value\n * @param  {Integer} tickCount     The count of ticks\n * @param  {Boolean} allowDecimals Allow the ticks to be decimals or not\n * @return {Array}   ticks\n */\n\n\nfunction getNiceTickValuesFn(_ref3) {\n  var _ref4 = _slicedToArray(_ref3, 2),\n      min = _ref4[0],\n      max = _ref4[1];\n\n  var tickCount = arguments.length > 1 && arguments[1] !== undefined ? arguments[1] : 6;\n  var allowDecimals = arguments.length > 2 && arguments[2] !== undefined ? arguments[2] : true;\n  // More than two ticks should be return\n  var count = Math.max(tickCount, 2);\n\n  var _getValidInterval = getValidInterval([min, max]),\n      _getValidInterval2 = _slicedToArray(_getValidInterval, 2),\n      cormin = _getValidInterval2[0],\n      cormax = _getValidInterval2[1];\n\n  if (cormin === -Infinity || cormax === Infinity) {\n    var _values = cormax === Infinity ? [cormin].concat(_toConsumableArray((0,_util_utils__WEBPACK_IMPORTED_MODULE_1__.range)(0, tickCount - 1).map(function () {\n      return Infinity;\n    }))) : [].concat(_toConsumableArray((0,_util_utils__WEBPACK_IMPORTED_MODULE_1__.range)(0, tickCount - 1).map(function () {\n      return -Infinity;\n    })), [cormax]);\n\n    return min > max ? (0,_util_utils__WEBPACK_IMPORTED_MODULE_1__.reverse)(_values) : _values;\n  }\n\n  if (cormin === cormax) {\n    return getTickOfSingleValue(cormin, tickCount, allowDecimals);\n  } // Get the step between two ticks\n\n\n  var _calculateStep = calculateStep(cormin, cormax, count, allowDecimals),\n      step = _calculateStep.step,\n      tickMin = _calculateStep.tickMin,\n      tickMax = _calculateStep.tickMax;\n\n  var values = _util_arithmetic__WEBPACK_IMPORTED_MODULE_2__[\"default\"].rangeStep(tickMin, tickMax.add(new decimal_js_light__WEBPACK_IMPORTED_MODULE_0__[\"default\"](0.1).mul(step)), step);\n  return min > max ? (0,_util_utils__WEBPACK_IMPORTED_MODULE_1__.reverse)(values) : values;\n}\n/**\n * Calculate the ticks of an interval, the count of ticks won't be guraranteed\n *\n * @param  {Number}  min, max      min: The minimum value, max: The maximum value\n * @param  {Integer} tickCount     The count of ticks\n * @param  {Boolean} allowDecimals Allow the ticks to be decimals or not\n * @return {Array}   ticks\n */\n\n\nfunction getTickValuesFn(_ref5) {\n  var _ref6 = _slicedToArray(_ref5, 2),\n      min = _ref6[0],\n      max = _ref6[1];\n\n  var tickCount = arguments.length > 1 && arguments[1] !== undefined ? arguments[1] : 6;\n  var allowDecimals = arguments.length > 2 && arguments[2] !== undefined ? arguments[2] : true;\n  // More than two ticks should be return\n  var count = Math.max(tickCount, 2);\n\n  var _getValidInterval3 = getValidInterval([min, max]),\n      _getValidInterval4 = _slicedToArray(_getValidInterval3, 2),\n      cormin = _getValidInterval4[0],\n      cormax = _getValidInterval4[1];\n\n  if (cormin === -Infinity || cormax === Infinity) {\n    return [min, max];\n  }\n\n  if (cormin === cormax) {\n    return getTickOfSingleValue(cormin, tickCount, allowDecimals);\n  }\n\n  var step = getFormatStep(new decimal_js_light__WEBPACK_IMPORTED_MODULE_0__[\"default\"](cormax).sub(cormin).div(count - 1), allowDecimals, 0);\n  var fn = (0,_util_utils__WEBPACK_IMPORTED_MODULE_1__.compose)((0,_util_utils__WEBPACK_IMPORTED_MODULE_1__.map)(function (n) {\n    return new decimal_js_light__WEBPACK_IMPORTED_MODULE_0__[\"default\"](cormin).add(new decimal_js_light__WEBPACK_IMPORTED_MODULE_0__[\"default\"](n).mul(step)).toNumber();\n  }), _util_utils__WEBPACK_IMPORTED_MODULE_1__.range);\n  var values = fn(0, count).filter(function (entry) {\n    return entry >= cormin && entry <= cormax;\n  });\n  return min > max ? (0,_util_utils__WEBPACK_IMPORTED_MODULE_1__.reverse)(values) : values;\n}\n/**\n * Calculate the ticks of an interval, the count of ticks won't be guraranteed,\n * but the domain will be guaranteed\n *\n * @param  {Number}  min, max      min: The minimum value, max: The maximum value\n * @param  {Integer} tickCount     The count of ticks\n * @param  {Boolean} allowDecimals Allow the ticks to be decimals or not\n * @return {Array}   ticks\n */\n\n\nfunction getTickValuesFixedDomainFn(_ref7, tickCount) {\n  var _ref8 = _slicedToArray(_ref7, 2),\n      min = _ref8[0],\n      max = _ref8[1];\n\n  var allowDecimals = arguments.length > 2 && arguments[2] !== undefined ? arguments[2] : true;\n\n  // More than two ticks should be return\n  var _getValidInterval5 = getValidInterval([min, max]),\n      _getValidInterval6 = _slicedToArray(_getValidInterval5, 2),\n      cormin = _getValidInterval6[0],\n      cormax = _getValidInterval6[1];\n\n  if (cormin === -Infinity || cormax === Infinity) {\n    return [min, max];\n  }\n\n  if (cormin === cormax) {\n    return [cormin];\n  }\n\n  var count = Math.max(tickCount, 2);\n  var step = getFormatStep(new decimal_js_light__WEBPACK_IMPORTED_MODULE_0__[\"default\"](cormax).sub(cormin).div(count - 1), allowDecimals, 0);\n  var values = [].concat(_toConsumableArray(_util_arithmetic__WEBPACK_IMPORTED_MODULE_2__[\"default\"].rangeStep(new decimal_js_light__WEBPACK_IMPORTED_MODULE_0__[\"default\"](cormin), new decimal_js_light__WEBPACK_IMPORTED_MODULE_0__[\"default\"](cormax).sub(new decimal_js_light__WEBPACK_IMPORTED_MODULE_0__[\"default\"](0.99).mul(step)), step)), [cormax]);\n  return min > max ? (0,_util_utils__WEBPACK_IMPORTED_MODULE_1__.reverse)(values) : values;\n}\n\nvar getNiceTickValues = (0,_util_utils__WEBPACK_IMPORTED_MODULE_1__.memoize)(getNiceTickValuesFn);\nvar getTickValues = (0,_util_utils__WEBPACK_IMPORTED_MODULE_1__.memoize)(getTickValuesFn);\nvar getTickValuesFixedDomain = (0,_util_utils__WEBPACK_IMPORTED_MODULE_1__.memoize)(getTickValuesFixedDomainFn);//# sourceURL=[module]\n//# sourceMappingURL=data:application/json;charset=utf-8;base64,eyJ2ZXJzaW9uIjozLCJmaWxlIjoiKHNzcikvLi9ub2RlX21vZHVsZXMvcmVjaGFydHMtc2NhbGUvZXM2L2dldE5pY2VUaWNrVmFsdWVzLmpzIiwibWFwcGluZ3MiOiI7Ozs7Ozs7OztBQUFBLG1DQUFtQzs7QUFFbkMsZ0NBQWdDOztBQUVoQyxrQ0FBa0M7O0FBRWxDLG1DQUFtQzs7QUFFbkMsa0NBQWtDOztBQUVsQyw4QkFBOEI7O0FBRTlCLGtEQUFrRCxnQkFBZ0IsZ0VBQWdFLHdEQUF3RCw2REFBNkQsc0RBQXNEOztBQUU3Uyx1Q0FBdUMsdURBQXVELHVDQUF1QyxTQUFTLE9BQU8sb0JBQW9COztBQUV6Syx5Q0FBeUMsZ0ZBQWdGLGVBQWUsZUFBZSxnQkFBZ0Isb0JBQW9CLE1BQU0sMENBQTBDLCtCQUErQixhQUFhLHFCQUFxQix1Q0FBdUMsY0FBYyxXQUFXLFlBQVksVUFBVSxNQUFNLG1EQUFtRCxVQUFVLHNCQUFzQjs7QUFFM2QsZ0NBQWdDOztBQUVoQztBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ3VDO0FBQzhCO0FBQzFCO0FBQzNDO0FBQ0E7QUFDQTtBQUNBLFlBQVksUUFBUTtBQUNwQixZQUFZLFFBQVE7QUFDcEIsWUFBWSxPQUFPO0FBQ25COztBQUVBO0FBQ0E7QUFDQTtBQUNBOztBQUVBO0FBQ0Esc0JBQXNCOztBQUV0QjtBQUNBO0FBQ0E7QUFDQTs7QUFFQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0EsWUFBWSxTQUFTO0FBQ3JCO0FBQ0EsWUFBWSxTQUFTO0FBQ3JCLFlBQVksU0FBUztBQUNyQixZQUFZLFNBQVM7QUFDckI7OztBQUdBO0FBQ0E7QUFDQSxlQUFlLHdEQUFPO0FBQ3RCOztBQUVBLG1CQUFtQix3REFBVSxzQ0FBc0M7QUFDbkU7O0FBRUEsNEJBQTRCLHdEQUFPO0FBQ25DLGtEQUFrRDs7QUFFbEQ7QUFDQSwyQkFBMkIsd0RBQU87QUFDbEM7QUFDQSwwQ0FBMEMsd0RBQU87QUFDakQ7QUFDQTtBQUNBO0FBQ0E7QUFDQSxZQUFZLFNBQVM7QUFDckIsWUFBWSxTQUFTO0FBQ3JCLFlBQVksU0FBUztBQUNyQixZQUFZLHVCQUF1QjtBQUNuQzs7O0FBR0E7QUFDQSxnQkFBZ0I7O0FBRWhCLG1CQUFtQix3REFBTzs7QUFFMUI7QUFDQTs7QUFFQTtBQUNBO0FBQ0EsaUJBQWlCLHdEQUFPLFNBQVMsd0RBQVU7QUFDM0MsbUJBQW1CLHdEQUFPO0FBQzFCLE1BQU07QUFDTjtBQUNBLG1CQUFtQix3REFBTztBQUMxQjtBQUNBLElBQUk7QUFDSixpQkFBaUIsd0RBQU87QUFDeEIsSUFBSTtBQUNKLGlCQUFpQix3REFBTztBQUN4Qjs7QUFFQTtBQUNBLFdBQVcsb0RBQU8sQ0FBQyxnREFBRztBQUN0QiwwQkFBMEIsd0RBQU87QUFDakMsR0FBRyxHQUFHLDhDQUFLO0FBQ1g7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBLFlBQVksU0FBUztBQUNyQixZQUFZLFNBQVM7QUFDckIsWUFBWSxTQUFTO0FBQ3JCLFlBQVksU0FBUztBQUNyQixZQUFZLFNBQVM7QUFDckIsWUFBWSxTQUFTO0FBQ3JCOzs7QUFHQTtBQUNBOztBQUVBO0FBQ0E7QUFDQTtBQUNBLGdCQUFnQix3REFBTztBQUN2QixtQkFBbUIsd0RBQU87QUFDMUIsbUJBQW1CLHdEQUFPO0FBQzFCO0FBQ0EsSUFBSTs7O0FBR0osK0JBQStCLHdEQUFPLHFFQUFxRTs7QUFFM0csY0FBYzs7QUFFZDtBQUNBLGlCQUFpQix3REFBTztBQUN4QixJQUFJO0FBQ0o7QUFDQSxpQkFBaUIsd0RBQU8sdUJBQXVCOztBQUUvQyw0QkFBNEIsd0RBQU87QUFDbkM7O0FBRUE7QUFDQSw4QkFBOEIsd0RBQU87QUFDckM7O0FBRUE7QUFDQTtBQUNBO0FBQ0E7O0FBRUE7QUFDQTtBQUNBO0FBQ0E7QUFDQTs7QUFFQTtBQUNBO0FBQ0EsNEJBQTRCLHdEQUFPO0FBQ25DLDRCQUE0Qix3REFBTztBQUNuQztBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0EsWUFBWSxTQUFTO0FBQ3JCLFlBQVksU0FBUztBQUNyQixZQUFZLFNBQVM7QUFDckIsWUFBWSxTQUFTO0FBQ3JCOzs7QUFHQTtBQUNBO0FBQ0E7QUFDQTs7QUFFQTtBQUNBO0FBQ0E7QUFDQTs7QUFFQTtBQUNBO0FBQ0E7QUFDQTs7QUFFQTtBQUNBLDJFQUEyRSxrREFBSztBQUNoRjtBQUNBLEtBQUssbUNBQW1DLGtEQUFLO0FBQzdDO0FBQ0EsS0FBSzs7QUFFTCx1QkFBdUIsb0RBQU87QUFDOUI7O0FBRUE7QUFDQTtBQUNBLElBQUk7OztBQUdKO0FBQ0E7QUFDQTtBQUNBOztBQUVBLGVBQWUsd0RBQVUsb0NBQW9DLHdEQUFPO0FBQ3BFLHFCQUFxQixvREFBTztBQUM1QjtBQUNBO0FBQ0E7QUFDQTtBQUNBLFlBQVksU0FBUztBQUNyQixZQUFZLFNBQVM7QUFDckIsWUFBWSxTQUFTO0FBQ3JCLFlBQVksU0FBUztBQUNyQjs7O0FBR0E7QUFDQTtBQUNBO0FBQ0E7O0FBRUE7QUFDQTtBQUNBO0FBQ0E7O0FBRUE7QUFDQTtBQUNBO0FBQ0E7O0FBRUE7QUFDQTtBQUNBOztBQUVBO0FBQ0E7QUFDQTs7QUFFQSwrQkFBK0Isd0RBQU87QUFDdEMsV0FBVyxvREFBTyxDQUFDLGdEQUFHO0FBQ3RCLGVBQWUsd0RBQU8saUJBQWlCLHdEQUFPO0FBQzlDLEdBQUcsR0FBRyw4Q0FBSztBQUNYO0FBQ0E7QUFDQSxHQUFHO0FBQ0gscUJBQXFCLG9EQUFPO0FBQzVCO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQSxZQUFZLFNBQVM7QUFDckIsWUFBWSxTQUFTO0FBQ3JCLFlBQVksU0FBUztBQUNyQixZQUFZLFNBQVM7QUFDckI7OztBQUdBO0FBQ0E7QUFDQTtBQUNBOztBQUVBOztBQUVBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7O0FBRUE7QUFDQTtBQUNBOztBQUVBO0FBQ0E7QUFDQTs7QUFFQTtBQUNBLCtCQUErQix3REFBTztBQUN0Qyw0Q0FBNEMsd0RBQVUsZUFBZSx3REFBTyxjQUFjLHdEQUFPLGlCQUFpQix3REFBTztBQUN6SCxxQkFBcUIsb0RBQU87QUFDNUI7O0FBRU8sd0JBQXdCLG9EQUFPO0FBQy9CLG9CQUFvQixvREFBTztBQUMzQiwrQkFBK0Isb0RBQU8iLCJzb3VyY2VzIjpbIndlYnBhY2s6Ly9hZG15YnJhbmQtaW5zaWdodHMvLi9ub2RlX21vZHVsZXMvcmVjaGFydHMtc2NhbGUvZXM2L2dldE5pY2VUaWNrVmFsdWVzLmpzP2Q0MDciXSwic291cmNlc0NvbnRlbnQiOlsiZnVuY3Rpb24gX3RvQ29uc3VtYWJsZUFycmF5KGFycikgeyByZXR1cm4gX2FycmF5V2l0aG91dEhvbGVzKGFycikgfHwgX2l0ZXJhYmxlVG9BcnJheShhcnIpIHx8IF91bnN1cHBvcnRlZEl0ZXJhYmxlVG9BcnJheShhcnIpIHx8IF9ub25JdGVyYWJsZVNwcmVhZCgpOyB9XG5cbmZ1bmN0aW9uIF9ub25JdGVyYWJsZVNwcmVhZCgpIHsgdGhyb3cgbmV3IFR5cGVFcnJvcihcIkludmFsaWQgYXR0ZW1wdCB0byBzcHJlYWQgbm9uLWl0ZXJhYmxlIGluc3RhbmNlLlxcbkluIG9yZGVyIHRvIGJlIGl0ZXJhYmxlLCBub24tYXJyYXkgb2JqZWN0cyBtdXN0IGhhdmUgYSBbU3ltYm9sLml0ZXJhdG9yXSgpIG1ldGhvZC5cIik7IH1cblxuZnVuY3Rpb24gX2l0ZXJhYmxlVG9BcnJheShpdGVyKSB7IGlmICh0eXBlb2YgU3ltYm9sICE9PSBcInVuZGVmaW5lZFwiICYmIFN5bWJvbC5pdGVyYXRvciBpbiBPYmplY3QoaXRlcikpIHJldHVybiBBcnJheS5mcm9tKGl0ZXIpOyB9XG5cbmZ1bmN0aW9uIF9hcnJheVdpdGhvdXRIb2xlcyhhcnIpIHsgaWYgKEFycmF5LmlzQXJyYXkoYXJyKSkgcmV0dXJuIF9hcnJheUxpa2VUb0FycmF5KGFycik7IH1cblxuZnVuY3Rpb24gX3NsaWNlZFRvQXJyYXkoYXJyLCBpKSB7IHJldHVybiBfYXJyYXlXaXRoSG9sZXMoYXJyKSB8fCBfaXRlcmFibGVUb0FycmF5TGltaXQoYXJyLCBpKSB8fCBfdW5zdXBwb3J0ZWRJdGVyYWJsZVRvQXJyYXkoYXJyLCBpKSB8fCBfbm9uSXRlcmFibGVSZXN0KCk7IH1cblxuZnVuY3Rpb24gX25vbkl0ZXJhYmxlUmVzdCgpIHsgdGhyb3cgbmV3IFR5cGVFcnJvcihcIkludmFsaWQgYXR0ZW1wdCB0byBkZXN0cnVjdHVyZSBub24taXRlcmFibGUgaW5zdGFuY2UuXFxuSW4gb3JkZXIgdG8gYmUgaXRlcmFibGUsIG5vbi1hcnJheSBvYmplY3RzIG11c3QgaGF2ZSBhIFtTeW1ib2wuaXRlcmF0b3JdKCkgbWV0aG9kLlwiKTsgfVxuXG5mdW5jdGlvbiBfdW5zdXBwb3J0ZWRJdGVyYWJsZVRvQXJyYXkobywgbWluTGVuKSB7IGlmICghbykgcmV0dXJuOyBpZiAodHlwZW9mIG8gPT09IFwic3RyaW5nXCIpIHJldHVybiBfYXJyYXlMaWtlVG9BcnJheShvLCBtaW5MZW4pOyB2YXIgbiA9IE9iamVjdC5wcm90b3R5cGUudG9TdHJpbmcuY2FsbChvKS5zbGljZSg4LCAtMSk7IGlmIChuID09PSBcIk9iamVjdFwiICYmIG8uY29uc3RydWN0b3IpIG4gPSBvLmNvbnN0cnVjdG9yLm5hbWU7IGlmIChuID09PSBcIk1hcFwiIHx8IG4gPT09IFwiU2V0XCIpIHJldHVybiBBcnJheS5mcm9tKG8pOyBpZiAobiA9PT0gXCJBcmd1bWVudHNcIiB8fCAvXig/OlVpfEkpbnQoPzo4fDE2fDMyKSg/OkNsYW1wZWQpP0FycmF5JC8udGVzdChuKSkgcmV0dXJuIF9hcnJheUxpa2VUb0FycmF5KG8sIG1pbkxlbik7IH1cblxuZnVuY3Rpb24gX2FycmF5TGlrZVRvQXJyYXkoYXJyLCBsZW4pIHsgaWYgKGxlbiA9PSBudWxsIHx8IGxlbiA+IGFyci5sZW5ndGgpIGxlbiA9IGFyci5sZW5ndGg7IGZvciAodmFyIGkgPSAwLCBhcnIyID0gbmV3IEFycmF5KGxlbik7IGkgPCBsZW47IGkrKykgeyBhcnIyW2ldID0gYXJyW2ldOyB9IHJldHVybiBhcnIyOyB9XG5cbmZ1bmN0aW9uIF9pdGVyYWJsZVRvQXJyYXlMaW1pdChhcnIsIGkpIHsgaWYgKHR5cGVvZiBTeW1ib2wgPT09IFwidW5kZWZpbmVkXCIgfHwgIShTeW1ib2wuaXRlcmF0b3IgaW4gT2JqZWN0KGFycikpKSByZXR1cm47IHZhciBfYXJyID0gW107IHZhciBfbiA9IHRydWU7IHZhciBfZCA9IGZhbHNlOyB2YXIgX2UgPSB1bmRlZmluZWQ7IHRyeSB7IGZvciAodmFyIF9pID0gYXJyW1N5bWJvbC5pdGVyYXRvcl0oKSwgX3M7ICEoX24gPSAoX3MgPSBfaS5uZXh0KCkpLmRvbmUpOyBfbiA9IHRydWUpIHsgX2Fyci5wdXNoKF9zLnZhbHVlKTsgaWYgKGkgJiYgX2Fyci5sZW5ndGggPT09IGkpIGJyZWFrOyB9IH0gY2F0Y2ggKGVycikgeyBfZCA9IHRydWU7IF9lID0gZXJyOyB9IGZpbmFsbHkgeyB0cnkgeyBpZiAoIV9uICYmIF9pW1wicmV0dXJuXCJdICE9IG51bGwpIF9pW1wicmV0dXJuXCJdKCk7IH0gZmluYWxseSB7IGlmIChfZCkgdGhyb3cgX2U7IH0gfSByZXR1cm4gX2FycjsgfVxuXG5mdW5jdGlvbiBfYXJyYXlXaXRoSG9sZXMoYXJyKSB7IGlmIChBcnJheS5pc0FycmF5KGFycikpIHJldHVybiBhcnI7IH1cblxuLyoqXG4gKiBAZmlsZU92ZXJ2aWV3IGNhbGN1bGF0ZSB0aWNrIHZhbHVlcyBvZiBzY2FsZVxuICogQGF1dGhvciB4aWxlNjExLCBhcmN0aHVyXG4gKiBAZGF0ZSAyMDE1LTA5LTE3XG4gKi9cbmltcG9ydCBEZWNpbWFsIGZyb20gJ2RlY2ltYWwuanMtbGlnaHQnO1xuaW1wb3J0IHsgY29tcG9zZSwgcmFuZ2UsIG1lbW9pemUsIG1hcCwgcmV2ZXJzZSB9IGZyb20gJy4vdXRpbC91dGlscyc7XG5pbXBvcnQgQXJpdGhtZXRpYyBmcm9tICcuL3V0aWwvYXJpdGhtZXRpYyc7XG4vKipcbiAqIENhbGN1bGF0ZSBhIGludGVydmFsIG9mIGEgbWluaW11bSB2YWx1ZSBhbmQgYSBtYXhpbXVtIHZhbHVlXG4gKlxuICogQHBhcmFtICB7TnVtYmVyfSBtaW4gICAgICAgVGhlIG1pbmltdW0gdmFsdWVcbiAqIEBwYXJhbSAge051bWJlcn0gbWF4ICAgICAgIFRoZSBtYXhpbXVtIHZhbHVlXG4gKiBAcmV0dXJuIHtBcnJheX0gQW4gaW50ZXJ2YWxcbiAqL1xuXG5mdW5jdGlvbiBnZXRWYWxpZEludGVydmFsKF9yZWYpIHtcbiAgdmFyIF9yZWYyID0gX3NsaWNlZFRvQXJyYXkoX3JlZiwgMiksXG4gICAgICBtaW4gPSBfcmVmMlswXSxcbiAgICAgIG1heCA9IF9yZWYyWzFdO1xuXG4gIHZhciB2YWxpZE1pbiA9IG1pbixcbiAgICAgIHZhbGlkTWF4ID0gbWF4OyAvLyBleGNoYW5nZVxuXG4gIGlmIChtaW4gPiBtYXgpIHtcbiAgICB2YWxpZE1pbiA9IG1heDtcbiAgICB2YWxpZE1heCA9IG1pbjtcbiAgfVxuXG4gIHJldHVybiBbdmFsaWRNaW4sIHZhbGlkTWF4XTtcbn1cbi8qKlxuICogQ2FsY3VsYXRlIHRoZSBzdGVwIHdoaWNoIGlzIGVhc3kgdG8gdW5kZXJzdGFuZCBiZXR3ZWVuIHRpY2tzLCBsaWtlIDEwLCAyMCwgMjVcbiAqXG4gKiBAcGFyYW0gIHtEZWNpbWFsfSByb3VnaFN0ZXAgICAgICAgIFRoZSByb3VnaCBzdGVwIGNhbGN1bGF0ZWQgYnkgZGV2aWRpbmcgdGhlXG4gKiBkaWZmZXJlbmNlIGJ5IHRoZSB0aWNrQ291bnRcbiAqIEBwYXJhbSAge0Jvb2xlYW59IGFsbG93RGVjaW1hbHMgICAgQWxsb3cgdGhlIHRpY2tzIHRvIGJlIGRlY2ltYWxzIG9yIG5vdFxuICogQHBhcmFtICB7SW50ZWdlcn0gY29ycmVjdGlvbkZhY3RvciBBIGNvcnJlY3Rpb24gZmFjdG9yXG4gKiBAcmV0dXJuIHtEZWNpbWFsfSBUaGUgc3RlcCB3aGljaCBpcyBlYXN5IHRvIHVuZGVyc3RhbmQgYmV0d2VlbiB0d28gdGlja3NcbiAqL1xuXG5cbmZ1bmN0aW9uIGdldEZvcm1hdFN0ZXAocm91Z2hTdGVwLCBhbGxvd0RlY2ltYWxzLCBjb3JyZWN0aW9uRmFjdG9yKSB7XG4gIGlmIChyb3VnaFN0ZXAubHRlKDApKSB7XG4gICAgcmV0dXJuIG5ldyBEZWNpbWFsKDApO1xuICB9XG5cbiAgdmFyIGRpZ2l0Q291bnQgPSBBcml0aG1ldGljLmdldERpZ2l0Q291bnQocm91Z2hTdGVwLnRvTnVtYmVyKCkpOyAvLyBUaGUgcmF0aW8gYmV0d2VlbiB0aGUgcm91Z2ggc3RlcCBhbmQgdGhlIHNtYWxsZXN0IG51bWJlciB3aGljaCBoYXMgYSBiaWdnZXJcbiAgLy8gb3JkZXIgb2YgbWFnbml0dWRlcyB0aGFuIHRoZSByb3VnaCBzdGVwXG5cbiAgdmFyIGRpZ2l0Q291bnRWYWx1ZSA9IG5ldyBEZWNpbWFsKDEwKS5wb3coZGlnaXRDb3VudCk7XG4gIHZhciBzdGVwUmF0aW8gPSByb3VnaFN0ZXAuZGl2KGRpZ2l0Q291bnRWYWx1ZSk7IC8vIFdoZW4gYW4gaW50ZWdlciBhbmQgYSBmbG9hdCBtdWx0aXBsaWVkLCB0aGUgYWNjdXJhY3kgb2YgcmVzdWx0IG1heSBiZSB3cm9uZ1xuXG4gIHZhciBzdGVwUmF0aW9TY2FsZSA9IGRpZ2l0Q291bnQgIT09IDEgPyAwLjA1IDogMC4xO1xuICB2YXIgYW1lbmRTdGVwUmF0aW8gPSBuZXcgRGVjaW1hbChNYXRoLmNlaWwoc3RlcFJhdGlvLmRpdihzdGVwUmF0aW9TY2FsZSkudG9OdW1iZXIoKSkpLmFkZChjb3JyZWN0aW9uRmFjdG9yKS5tdWwoc3RlcFJhdGlvU2NhbGUpO1xuICB2YXIgZm9ybWF0U3RlcCA9IGFtZW5kU3RlcFJhdGlvLm11bChkaWdpdENvdW50VmFsdWUpO1xuICByZXR1cm4gYWxsb3dEZWNpbWFscyA/IGZvcm1hdFN0ZXAgOiBuZXcgRGVjaW1hbChNYXRoLmNlaWwoZm9ybWF0U3RlcCkpO1xufVxuLyoqXG4gKiBjYWxjdWxhdGUgdGhlIHRpY2tzIHdoZW4gdGhlIG1pbmltdW0gdmFsdWUgZXF1YWxzIHRvIHRoZSBtYXhpbXVtIHZhbHVlXG4gKlxuICogQHBhcmFtICB7TnVtYmVyfSAgdmFsdWUgICAgICAgICBUaGUgbWluaW11bSB2YWx1dWUgd2hpY2ggaXMgYWxzbyB0aGUgbWF4aW11bSB2YWx1ZVxuICogQHBhcmFtICB7SW50ZWdlcn0gdGlja0NvdW50ICAgICBUaGUgY291bnQgb2YgdGlja3NcbiAqIEBwYXJhbSAge0Jvb2xlYW59IGFsbG93RGVjaW1hbHMgQWxsb3cgdGhlIHRpY2tzIHRvIGJlIGRlY2ltYWxzIG9yIG5vdFxuICogQHJldHVybiB7QXJyYXl9ICAgICAgICAgICAgICAgICB0aWNrc1xuICovXG5cblxuZnVuY3Rpb24gZ2V0VGlja09mU2luZ2xlVmFsdWUodmFsdWUsIHRpY2tDb3VudCwgYWxsb3dEZWNpbWFscykge1xuICB2YXIgc3RlcCA9IDE7IC8vIGNhbGN1bGF0ZSB0aGUgbWlkZGxlIHZhbHVlIG9mIHRpY2tzXG5cbiAgdmFyIG1pZGRsZSA9IG5ldyBEZWNpbWFsKHZhbHVlKTtcblxuICBpZiAoIW1pZGRsZS5pc2ludCgpICYmIGFsbG93RGVjaW1hbHMpIHtcbiAgICB2YXIgYWJzVmFsID0gTWF0aC5hYnModmFsdWUpO1xuXG4gICAgaWYgKGFic1ZhbCA8IDEpIHtcbiAgICAgIC8vIFRoZSBzdGVwIHNob3VsZCBiZSBhIGZsb2F0IG51bWJlciB3aGVuIHRoZSBkaWZmZXJlbmNlIGlzIHNtYWxsZXIgdGhhbiAxXG4gICAgICBzdGVwID0gbmV3IERlY2ltYWwoMTApLnBvdyhBcml0aG1ldGljLmdldERpZ2l0Q291bnQodmFsdWUpIC0gMSk7XG4gICAgICBtaWRkbGUgPSBuZXcgRGVjaW1hbChNYXRoLmZsb29yKG1pZGRsZS5kaXYoc3RlcCkudG9OdW1iZXIoKSkpLm11bChzdGVwKTtcbiAgICB9IGVsc2UgaWYgKGFic1ZhbCA+IDEpIHtcbiAgICAgIC8vIFJldHVybiB0aGUgbWF4aW11bSBpbnRlZ2VyIHdoaWNoIGlzIHNtYWxsZXIgdGhhbiAndmFsdWUnIHdoZW4gJ3ZhbHVlJyBpcyBncmVhdGVyIHRoYW4gMVxuICAgICAgbWlkZGxlID0gbmV3IERlY2ltYWwoTWF0aC5mbG9vcih2YWx1ZSkpO1xuICAgIH1cbiAgfSBlbHNlIGlmICh2YWx1ZSA9PT0gMCkge1xuICAgIG1pZGRsZSA9IG5ldyBEZWNpbWFsKE1hdGguZmxvb3IoKHRpY2tDb3VudCAtIDEpIC8gMikpO1xuICB9IGVsc2UgaWYgKCFhbGxvd0RlY2ltYWxzKSB7XG4gICAgbWlkZGxlID0gbmV3IERlY2ltYWwoTWF0aC5mbG9vcih2YWx1ZSkpO1xuICB9XG5cbiAgdmFyIG1pZGRsZUluZGV4ID0gTWF0aC5mbG9vcigodGlja0NvdW50IC0gMSkgLyAyKTtcbiAgdmFyIGZuID0gY29tcG9zZShtYXAoZnVuY3Rpb24gKG4pIHtcbiAgICByZXR1cm4gbWlkZGxlLmFkZChuZXcgRGVjaW1hbChuIC0gbWlkZGxlSW5kZXgpLm11bChzdGVwKSkudG9OdW1iZXIoKTtcbiAgfSksIHJhbmdlKTtcbiAgcmV0dXJuIGZuKDAsIHRpY2tDb3VudCk7XG59XG4vKipcbiAqIENhbGN1bGF0ZSB0aGUgc3RlcFxuICpcbiAqIEBwYXJhbSAge051bWJlcn0gIG1pbiAgICAgICAgICAgICAgVGhlIG1pbmltdW0gdmFsdWUgb2YgYW4gaW50ZXJ2YWxcbiAqIEBwYXJhbSAge051bWJlcn0gIG1heCAgICAgICAgICAgICAgVGhlIG1heGltdW0gdmFsdWUgb2YgYW4gaW50ZXJ2YWxcbiAqIEBwYXJhbSAge0ludGVnZXJ9IHRpY2tDb3VudCAgICAgICAgVGhlIGNvdW50IG9mIHRpY2tzXG4gKiBAcGFyYW0gIHtCb29sZWFufSBhbGxvd0RlY2ltYWxzICAgIEFsbG93IHRoZSB0aWNrcyB0byBiZSBkZWNpbWFscyBvciBub3RcbiAqIEBwYXJhbSAge051bWJlcn0gIGNvcnJlY3Rpb25GYWN0b3IgQSBjb3JyZWN0aW9uIGZhY3RvclxuICogQHJldHVybiB7T2JqZWN0fSAgVGhlIHN0ZXAsIG1pbmltdW0gdmFsdWUgb2YgdGlja3MsIG1heGltdW0gdmFsdWUgb2YgdGlja3NcbiAqL1xuXG5cbmZ1bmN0aW9uIGNhbGN1bGF0ZVN0ZXAobWluLCBtYXgsIHRpY2tDb3VudCwgYWxsb3dEZWNpbWFscykge1xuICB2YXIgY29ycmVjdGlvbkZhY3RvciA9IGFyZ3VtZW50cy5sZW5ndGggPiA0ICYmIGFyZ3VtZW50c1s0XSAhPT0gdW5kZWZpbmVkID8gYXJndW1lbnRzWzRdIDogMDtcblxuICAvLyBkaXJ0eSBoYWNrIChmb3IgcmVjaGFydHMnIHRlc3QpXG4gIGlmICghTnVtYmVyLmlzRmluaXRlKChtYXggLSBtaW4pIC8gKHRpY2tDb3VudCAtIDEpKSkge1xuICAgIHJldHVybiB7XG4gICAgICBzdGVwOiBuZXcgRGVjaW1hbCgwKSxcbiAgICAgIHRpY2tNaW46IG5ldyBEZWNpbWFsKDApLFxuICAgICAgdGlja01heDogbmV3IERlY2ltYWwoMClcbiAgICB9O1xuICB9IC8vIFRoZSBzdGVwIHdoaWNoIGlzIGVhc3kgdG8gdW5kZXJzdGFuZCBiZXR3ZWVuIHR3byB0aWNrc1xuXG5cbiAgdmFyIHN0ZXAgPSBnZXRGb3JtYXRTdGVwKG5ldyBEZWNpbWFsKG1heCkuc3ViKG1pbikuZGl2KHRpY2tDb3VudCAtIDEpLCBhbGxvd0RlY2ltYWxzLCBjb3JyZWN0aW9uRmFjdG9yKTsgLy8gQSBtZWRpYWwgdmFsdWUgb2YgdGlja3NcblxuICB2YXIgbWlkZGxlOyAvLyBXaGVuIDAgaXMgaW5zaWRlIHRoZSBpbnRlcnZhbCwgMCBzaG91bGQgYmUgYSB0aWNrXG5cbiAgaWYgKG1pbiA8PSAwICYmIG1heCA+PSAwKSB7XG4gICAgbWlkZGxlID0gbmV3IERlY2ltYWwoMCk7XG4gIH0gZWxzZSB7XG4gICAgLy8gY2FsY3VsYXRlIHRoZSBtaWRkbGUgdmFsdWVcbiAgICBtaWRkbGUgPSBuZXcgRGVjaW1hbChtaW4pLmFkZChtYXgpLmRpdigyKTsgLy8gbWludXMgbW9kdWxvIHZhbHVlXG5cbiAgICBtaWRkbGUgPSBtaWRkbGUuc3ViKG5ldyBEZWNpbWFsKG1pZGRsZSkubW9kKHN0ZXApKTtcbiAgfVxuXG4gIHZhciBiZWxvd0NvdW50ID0gTWF0aC5jZWlsKG1pZGRsZS5zdWIobWluKS5kaXYoc3RlcCkudG9OdW1iZXIoKSk7XG4gIHZhciB1cENvdW50ID0gTWF0aC5jZWlsKG5ldyBEZWNpbWFsKG1heCkuc3ViKG1pZGRsZSkuZGl2KHN0ZXApLnRvTnVtYmVyKCkpO1xuICB2YXIgc2NhbGVDb3VudCA9IGJlbG93Q291bnQgKyB1cENvdW50ICsgMTtcblxuICBpZiAoc2NhbGVDb3VudCA+IHRpY2tDb3VudCkge1xuICAgIC8vIFdoZW4gbW9yZSB0aWNrcyBuZWVkIHRvIGNvdmVyIHRoZSBpbnRlcnZhbCwgc3RlcCBzaG91bGQgYmUgYmlnZ2VyLlxuICAgIHJldHVybiBjYWxjdWxhdGVTdGVwKG1pbiwgbWF4LCB0aWNrQ291bnQsIGFsbG93RGVjaW1hbHMsIGNvcnJlY3Rpb25GYWN0b3IgKyAxKTtcbiAgfVxuXG4gIGlmIChzY2FsZUNvdW50IDwgdGlja0NvdW50KSB7XG4gICAgLy8gV2hlbiBsZXNzIHRpY2tzIGNhbiBjb3ZlciB0aGUgaW50ZXJ2YWwsIHdlIHNob3VsZCBhZGQgc29tZSBhZGRpdGlvbmFsIHRpY2tzXG4gICAgdXBDb3VudCA9IG1heCA+IDAgPyB1cENvdW50ICsgKHRpY2tDb3VudCAtIHNjYWxlQ291bnQpIDogdXBDb3VudDtcbiAgICBiZWxvd0NvdW50ID0gbWF4ID4gMCA/IGJlbG93Q291bnQgOiBiZWxvd0NvdW50ICsgKHRpY2tDb3VudCAtIHNjYWxlQ291bnQpO1xuICB9XG5cbiAgcmV0dXJuIHtcbiAgICBzdGVwOiBzdGVwLFxuICAgIHRpY2tNaW46IG1pZGRsZS5zdWIobmV3IERlY2ltYWwoYmVsb3dDb3VudCkubXVsKHN0ZXApKSxcbiAgICB0aWNrTWF4OiBtaWRkbGUuYWRkKG5ldyBEZWNpbWFsKHVwQ291bnQpLm11bChzdGVwKSlcbiAgfTtcbn1cbi8qKlxuICogQ2FsY3VsYXRlIHRoZSB0aWNrcyBvZiBhbiBpbnRlcnZhbCwgdGhlIGNvdW50IG9mIHRpY2tzIHdpbGwgYmUgZ3VyYXJhbnRlZWRcbiAqXG4gKiBAcGFyYW0gIHtOdW1iZXJ9ICBtaW4sIG1heCAgICAgIG1pbjogVGhlIG1pbmltdW0gdmFsdWUsIG1heDogVGhlIG1heGltdW0gdmFsdWVcbiAqIEBwYXJhbSAge0ludGVnZXJ9IHRpY2tDb3VudCAgICAgVGhlIGNvdW50IG9mIHRpY2tzXG4gKiBAcGFyYW0gIHtCb29sZWFufSBhbGxvd0RlY2ltYWxzIEFsbG93IHRoZSB0aWNrcyB0byBiZSBkZWNpbWFscyBvciBub3RcbiAqIEByZXR1cm4ge0FycmF5fSAgIHRpY2tzXG4gKi9cblxuXG5mdW5jdGlvbiBnZXROaWNlVGlja1ZhbHVlc0ZuKF9yZWYzKSB7XG4gIHZhciBfcmVmNCA9IF9zbGljZWRUb0FycmF5KF9yZWYzLCAyKSxcbiAgICAgIG1pbiA9IF9yZWY0WzBdLFxuICAgICAgbWF4ID0gX3JlZjRbMV07XG5cbiAgdmFyIHRpY2tDb3VudCA9IGFyZ3VtZW50cy5sZW5ndGggPiAxICYmIGFyZ3VtZW50c1sxXSAhPT0gdW5kZWZpbmVkID8gYXJndW1lbnRzWzFdIDogNjtcbiAgdmFyIGFsbG93RGVjaW1hbHMgPSBhcmd1bWVudHMubGVuZ3RoID4gMiAmJiBhcmd1bWVudHNbMl0gIT09IHVuZGVmaW5lZCA/IGFyZ3VtZW50c1syXSA6IHRydWU7XG4gIC8vIE1vcmUgdGhhbiB0d28gdGlja3Mgc2hvdWxkIGJlIHJldHVyblxuICB2YXIgY291bnQgPSBNYXRoLm1heCh0aWNrQ291bnQsIDIpO1xuXG4gIHZhciBfZ2V0VmFsaWRJbnRlcnZhbCA9IGdldFZhbGlkSW50ZXJ2YWwoW21pbiwgbWF4XSksXG4gICAgICBfZ2V0VmFsaWRJbnRlcnZhbDIgPSBfc2xpY2VkVG9BcnJheShfZ2V0VmFsaWRJbnRlcnZhbCwgMiksXG4gICAgICBjb3JtaW4gPSBfZ2V0VmFsaWRJbnRlcnZhbDJbMF0sXG4gICAgICBjb3JtYXggPSBfZ2V0VmFsaWRJbnRlcnZhbDJbMV07XG5cbiAgaWYgKGNvcm1pbiA9PT0gLUluZmluaXR5IHx8IGNvcm1heCA9PT0gSW5maW5pdHkpIHtcbiAgICB2YXIgX3ZhbHVlcyA9IGNvcm1heCA9PT0gSW5maW5pdHkgPyBbY29ybWluXS5jb25jYXQoX3RvQ29uc3VtYWJsZUFycmF5KHJhbmdlKDAsIHRpY2tDb3VudCAtIDEpLm1hcChmdW5jdGlvbiAoKSB7XG4gICAgICByZXR1cm4gSW5maW5pdHk7XG4gICAgfSkpKSA6IFtdLmNvbmNhdChfdG9Db25zdW1hYmxlQXJyYXkocmFuZ2UoMCwgdGlja0NvdW50IC0gMSkubWFwKGZ1bmN0aW9uICgpIHtcbiAgICAgIHJldHVybiAtSW5maW5pdHk7XG4gICAgfSkpLCBbY29ybWF4XSk7XG5cbiAgICByZXR1cm4gbWluID4gbWF4ID8gcmV2ZXJzZShfdmFsdWVzKSA6IF92YWx1ZXM7XG4gIH1cblxuICBpZiAoY29ybWluID09PSBjb3JtYXgpIHtcbiAgICByZXR1cm4gZ2V0VGlja09mU2luZ2xlVmFsdWUoY29ybWluLCB0aWNrQ291bnQsIGFsbG93RGVjaW1hbHMpO1xuICB9IC8vIEdldCB0aGUgc3RlcCBiZXR3ZWVuIHR3byB0aWNrc1xuXG5cbiAgdmFyIF9jYWxjdWxhdGVTdGVwID0gY2FsY3VsYXRlU3RlcChjb3JtaW4sIGNvcm1heCwgY291bnQsIGFsbG93RGVjaW1hbHMpLFxuICAgICAgc3RlcCA9IF9jYWxjdWxhdGVTdGVwLnN0ZXAsXG4gICAgICB0aWNrTWluID0gX2NhbGN1bGF0ZVN0ZXAudGlja01pbixcbiAgICAgIHRpY2tNYXggPSBfY2FsY3VsYXRlU3RlcC50aWNrTWF4O1xuXG4gIHZhciB2YWx1ZXMgPSBBcml0aG1ldGljLnJhbmdlU3RlcCh0aWNrTWluLCB0aWNrTWF4LmFkZChuZXcgRGVjaW1hbCgwLjEpLm11bChzdGVwKSksIHN0ZXApO1xuICByZXR1cm4gbWluID4gbWF4ID8gcmV2ZXJzZSh2YWx1ZXMpIDogdmFsdWVzO1xufVxuLyoqXG4gKiBDYWxjdWxhdGUgdGhlIHRpY2tzIG9mIGFuIGludGVydmFsLCB0aGUgY291bnQgb2YgdGlja3Mgd29uJ3QgYmUgZ3VyYXJhbnRlZWRcbiAqXG4gKiBAcGFyYW0gIHtOdW1iZXJ9ICBtaW4sIG1heCAgICAgIG1pbjogVGhlIG1pbmltdW0gdmFsdWUsIG1heDogVGhlIG1heGltdW0gdmFsdWVcbiAqIEBwYXJhbSAge0ludGVnZXJ9IHRpY2tDb3VudCAgICAgVGhlIGNvdW50IG9mIHRpY2tzXG4gKiBAcGFyYW0gIHtCb29sZWFufSBhbGxvd0RlY2ltYWxzIEFsbG93IHRoZSB0aWNrcyB0byBiZSBkZWNpbWFscyBvciBub3RcbiAqIEByZXR1cm4ge0FycmF5fSAgIHRpY2tzXG4gKi9cblxuXG5mdW5jdGlvbiBnZXRUaWNrVmFsdWVzRm4oX3JlZjUpIHtcbiAgdmFyIF9yZWY2ID0gX3NsaWNlZFRvQXJyYXkoX3JlZjUsIDIpLFxuICAgICAgbWluID0gX3JlZjZbMF0sXG4gICAgICBtYXggPSBfcmVmNlsxXTtcblxuICB2YXIgdGlja0NvdW50ID0gYXJndW1lbnRzLmxlbmd0aCA+IDEgJiYgYXJndW1lbnRzWzFdICE9PSB1bmRlZmluZWQgPyBhcmd1bWVudHNbMV0gOiA2O1xuICB2YXIgYWxsb3dEZWNpbWFscyA9IGFyZ3VtZW50cy5sZW5ndGggPiAyICYmIGFyZ3VtZW50c1syXSAhPT0gdW5kZWZpbmVkID8gYXJndW1lbnRzWzJdIDogdHJ1ZTtcbiAgLy8gTW9yZSB0aGFuIHR3byB0aWNrcyBzaG91bGQgYmUgcmV0dXJuXG4gIHZhciBjb3VudCA9IE1hdGgubWF4KHRpY2tDb3VudCwgMik7XG5cbiAgdmFyIF9nZXRWYWxpZEludGVydmFsMyA9IGdldFZhbGlkSW50ZXJ2YWwoW21pbiwgbWF4XSksXG4gICAgICBfZ2V0VmFsaWRJbnRlcnZhbDQgPSBfc2xpY2VkVG9BcnJheShfZ2V0VmFsaWRJbnRlcnZhbDMsIDIpLFxuICAgICAgY29ybWluID0gX2dldFZhbGlkSW50ZXJ2YWw0WzBdLFxuICAgICAgY29ybWF4ID0gX2dldFZhbGlkSW50ZXJ2YWw0WzFdO1xuXG4gIGlmIChjb3JtaW4gPT09IC1JbmZpbml0eSB8fCBjb3JtYXggPT09IEluZmluaXR5KSB7XG4gICAgcmV0dXJuIFttaW4sIG1heF07XG4gIH1cblxuICBpZiAoY29ybWluID09PSBjb3JtYXgpIHtcbiAgICByZXR1cm4gZ2V0VGlja09mU2luZ2xlVmFsdWUoY29ybWluLCB0aWNrQ291bnQsIGFsbG93RGVjaW1hbHMpO1xuICB9XG5cbiAgdmFyIHN0ZXAgPSBnZXRGb3JtYXRTdGVwKG5ldyBEZWNpbWFsKGNvcm1heCkuc3ViKGNvcm1pbikuZGl2KGNvdW50IC0gMSksIGFsbG93RGVjaW1hbHMsIDApO1xuICB2YXIgZm4gPSBjb21wb3NlKG1hcChmdW5jdGlvbiAobikge1xuICAgIHJldHVybiBuZXcgRGVjaW1hbChjb3JtaW4pLmFkZChuZXcgRGVjaW1hbChuKS5tdWwoc3RlcCkpLnRvTnVtYmVyKCk7XG4gIH0pLCByYW5nZSk7XG4gIHZhciB2YWx1ZXMgPSBmbigwLCBjb3VudCkuZmlsdGVyKGZ1bmN0aW9uIChlbnRyeSkge1xuICAgIHJldHVybiBlbnRyeSA+PSBjb3JtaW4gJiYgZW50cnkgPD0gY29ybWF4O1xuICB9KTtcbiAgcmV0dXJuIG1pbiA+IG1heCA/IHJldmVyc2UodmFsdWVzKSA6IHZhbHVlcztcbn1cbi8qKlxuICogQ2FsY3VsYXRlIHRoZSB0aWNrcyBvZiBhbiBpbnRlcnZhbCwgdGhlIGNvdW50IG9mIHRpY2tzIHdvbid0IGJlIGd1cmFyYW50ZWVkLFxuICogYnV0IHRoZSBkb21haW4gd2lsbCBiZSBndWFyYW50ZWVkXG4gKlxuICogQHBhcmFtICB7TnVtYmVyfSAgbWluLCBtYXggICAgICBtaW46IFRoZSBtaW5pbXVtIHZhbHVlLCBtYXg6IFRoZSBtYXhpbXVtIHZhbHVlXG4gKiBAcGFyYW0gIHtJbnRlZ2VyfSB0aWNrQ291bnQgICAgIFRoZSBjb3VudCBvZiB0aWNrc1xuICogQHBhcmFtICB7Qm9vbGVhbn0gYWxsb3dEZWNpbWFscyBBbGxvdyB0aGUgdGlja3MgdG8gYmUgZGVjaW1hbHMgb3Igbm90XG4gKiBAcmV0dXJuIHtBcnJheX0gICB0aWNrc1xuICovXG5cblxuZnVuY3Rpb24gZ2V0VGlja1ZhbHVlc0ZpeGVkRG9tYWluRm4oX3JlZjcsIHRpY2tDb3VudCkge1xuICB2YXIgX3JlZjggPSBfc2xpY2VkVG9BcnJheShfcmVmNywgMiksXG4gICAgICBtaW4gPSBfcmVmOFswXSxcbiAgICAgIG1heCA9IF9yZWY4WzFdO1xuXG4gIHZhciBhbGxvd0RlY2ltYWxzID0gYXJndW1lbnRzLmxlbmd0aCA+IDIgJiYgYXJndW1lbnRzWzJdICE9PSB1bmRlZmluZWQgPyBhcmd1bWVudHNbMl0gOiB0cnVlO1xuXG4gIC8vIE1vcmUgdGhhbiB0d28gdGlja3Mgc2hvdWxkIGJlIHJldHVyblxuICB2YXIgX2dldFZhbGlkSW50ZXJ2YWw1ID0gZ2V0VmFsaWRJbnRlcnZhbChbbWluLCBtYXhdKSxcbiAgICAgIF9nZXRWYWxpZEludGVydmFsNiA9IF9zbGljZWRUb0FycmF5KF9nZXRWYWxpZEludGVydmFsNSwgMiksXG4gICAgICBjb3JtaW4gPSBfZ2V0VmFsaWRJbnRlcnZhbDZbMF0sXG4gICAgICBjb3JtYXggPSBfZ2V0VmFsaWRJbnRlcnZhbDZbMV07XG5cbiAgaWYgKGNvcm1pbiA9PT0gLUluZmluaXR5IHx8IGNvcm1heCA9PT0gSW5maW5pdHkpIHtcbiAgICByZXR1cm4gW21pbiwgbWF4XTtcbiAgfVxuXG4gIGlmIChjb3JtaW4gPT09IGNvcm1heCkge1xuICAgIHJldHVybiBbY29ybWluXTtcbiAgfVxuXG4gIHZhciBjb3VudCA9IE1hdGgubWF4KHRpY2tDb3VudCwgMik7XG4gIHZhciBzdGVwID0gZ2V0Rm9ybWF0U3RlcChuZXcgRGVjaW1hbChjb3JtYXgpLnN1Yihjb3JtaW4pLmRpdihjb3VudCAtIDEpLCBhbGxvd0RlY2ltYWxzLCAwKTtcbiAgdmFyIHZhbHVlcyA9IFtdLmNvbmNhdChfdG9Db25zdW1hYmxlQXJyYXkoQXJpdGhtZXRpYy5yYW5nZVN0ZXAobmV3IERlY2ltYWwoY29ybWluKSwgbmV3IERlY2ltYWwoY29ybWF4KS5zdWIobmV3IERlY2ltYWwoMC45OSkubXVsKHN0ZXApKSwgc3RlcCkpLCBbY29ybWF4XSk7XG4gIHJldHVybiBtaW4gPiBtYXggPyByZXZlcnNlKHZhbHVlcykgOiB2YWx1ZXM7XG59XG5cbmV4cG9ydCB2YXIgZ2V0TmljZVRpY2tWYWx1ZXMgPSBtZW1vaXplKGdldE5pY2VUaWNrVmFsdWVzRm4pO1xuZXhwb3J0IHZhciBnZXRUaWNrVmFsdWVzID0gbWVtb2l6ZShnZXRUaWNrVmFsdWVzRm4pO1xuZXhwb3J0IHZhciBnZXRUaWNrVmFsdWVzRml4ZWREb21haW4gPSBtZW1vaXplKGdldFRpY2tWYWx1ZXNGaXhlZERvbWFpbkZuKTsiXSwibmFtZXMiOltdLCJzb3VyY2VSb290IjoiIn0=\n//# sourceURL=webpack-internal:///(ssr)/./node_modules/recharts-scale/es6/getNiceTickValues.js\n");
-
-/***/ }),
-
-/***/ "(ssr)/./node_modules/recharts-scale/es6/index.js":
-/*!**************************************************!*\
-  !*** ./node_modules/recharts-scale/es6/index.js ***!
-  \**************************************************/
-/***/ ((__unused_webpack_module, __webpack_exports__, __webpack_require__) => {
-
-__webpack_require__.r(__webpack_exports__);
-/* harmony export */ __webpack_require__.d(__webpack_exports__, {
-/* harmony export */   getNiceTickValues: () => (/* reexport safe */ _getNiceTickValues__WEBPACK_IMPORTED_MODULE_0__.getNiceTickValues),
-/* harmony export */   getTickValues: () => (/* reexport safe */ _getNiceTickValues__WEBPACK_IMPORTED_MODULE_0__.getTickValues),
-/* harmony export */   getTickValuesFixedDomain: () => (/* reexport safe */ _getNiceTickValues__WEBPACK_IMPORTED_MODULE_0__.getTickValuesFixedDomain)
-/* harmony export */ });
-/* harmony import */ var _getNiceTickValues__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! ./getNiceTickValues */ "(ssr)/./node_modules/recharts-scale/es6/getNiceTickValues.js");
-
-
-/***/ }),
-
-/***/ "(ssr)/./node_modules/recharts-scale/es6/util/arithmetic.js":
-/*!************************************************************!*\
-  !*** ./node_modules/recharts-scale/es6/util/arithmetic.js ***!
-  \************************************************************/
-/***/ ((__unused_webpack_module, __webpack_exports__, __webpack_require__) => {
-
-eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   \"default\": () => (__WEBPACK_DEFAULT_EXPORT__)\n/* harmony export */ });\n/* harmony import */ var decimal_js_light__WEBPACK_IMPORTED_MODULE_0__ = __webpack_require__(/*! decimal.js-light */ \"(ssr)/./node_modules/decimal.js-light/decimal.mjs\");\n/* harmony import */ var _utils__WEBPACK_IMPORTED_MODULE_1__ = __webpack_require__(/*! ./utils */ \"(ssr)/./node_modules/recharts-scale/es6/util/utils.js\");\n/**\n * @fileOverview 一些公用的运算方法\n * @author xile611\n * @date 2015-09-17\n */\n\n\n/**\n * 获取数值的位数\n * 其中绝对值属于区间[0.1, 1)， 得到的值为0\n * 绝对值属于区间[0.01, 0.1)，得到的位数为 -1\n * 绝对值属于区间[0.001, 0.01)，得到的位数为 -2\n *\n * @param  {Number} value 数值\n * @return {Integer} 位数\n */\n\nfunction getDigitCount(value) {\n  var result;\n\n  if (value === 0) {\n    result = 1;\n  } else {\n    result = Math.floor(new decimal_js_light__WEBPACK_IMPORTED_MODULE_0__[\"default\"](value).abs().log(10).toNumber()) + 1;\n  }\n\n  return result;\n}\n/**\n * 按照固定的步长获取[start, end)这个区间的数据\n * 并且需要处理js计算精度的问题\n *\n * @param  {Decimal} start 起点\n * @param  {Decimal} end   终点，不包含该值\n * @param  {Decimal} step  步长\n * @return {Array}         若干数值\n */\n\n\nfunction rangeStep(start, end, step) {\n  var num = new decimal_js_light__WEBPACK_IMPORTED_MODULE_0__[\"default\"](start);\n  var i = 0;\n  var result = []; // magic number to prevent infinite loop\n\n  while (num.lt(end) && i < 100000) {\n    result.push(num.toNumber());\n    num = num.add(step);\n    i++;\n  }\n\n  return result;\n}\n/**\n * 对数值进行线性插值\n *\n * @param  {Number} a  定义域的极点\n * @param  {Number} b  定义域的极点\n * @param  {Number} t  [0, 1]内的某个值\n * @return {Number}    定义域内的某个值\n */\n\n\nvar interpolateNumber = (0,_utils__WEBPACK_IMPORTED_MODULE_1__.curry)(function (a, b, t) {\n  var newA = +a;\n  var newB = +b;\n  return newA + t * (newB - newA);\n});\n/**\n * 线性插值的逆运算\n *\n * @param  {Number} a 定义域的极点\n * @param  {Number} b 定义域的极点\n * @param  {Number} x 可以认为是插值后的一个输出值\n * @return {Number}   当x在 a ~ b这个范围内时，返回值属于[0, 1]\n */\n\nvar uninterpolateNumber = (0,_utils__WEBPACK_IMPORTED_MODULE_1__.curry)(function (a, b, x) {\n  var diff = b - +a;\n  diff = diff || Infinity;\n  return (x - a) / diff;\n});\n/**\n * 线性插值的逆运算，并且有截断的操作\n *\n * @param  {Number} a 定义域的极点\n * @param  {Number} b 定义域的极点\n * @param  {Number} x 可以认为是插值后的一个输出值\n * @return {Number}   当x在 a ~ b这个区间内时，返回值属于[0, 1]，\n * 当x不在 a ~ b这个区间时，会截断到 a ~ b 这个区间\n */\n\nvar uninterpolateTruncation = (0,_utils__WEBPACK_IMPORTED_MODULE_1__.curry)(function (a, b, x) {\n  var diff = b - +a;\n  diff = diff || Infinity;\n  return Math.max(0, Math.min(1, (x - a) / diff));\n});\n/* harmony default export */ const __WEBPACK_DEFAULT_EXPORT__ = ({\n  rangeStep: rangeStep,\n  getDigitCount: getDigitCount,\n  interpolateNumber: interpolateNumber,\n  uninterpolateNumber: uninterpolateNumber,\n  uninterpolateTruncation: uninterpolateTruncation\n});//# sourceURL=[module]\n//# sourceMappingURL=data:application/json;charset=utf-8;base64,eyJ2ZXJzaW9uIjozLCJmaWxlIjoiKHNzcikvLi9ub2RlX21vZHVsZXMvcmVjaGFydHMtc2NhbGUvZXM2L3V0aWwvYXJpdGhtZXRpYy5qcyIsIm1hcHBpbmdzIjoiOzs7Ozs7QUFBQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ3VDO0FBQ1A7QUFDaEM7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBO0FBQ0EsWUFBWSxRQUFRO0FBQ3BCLFlBQVksU0FBUztBQUNyQjs7QUFFQTtBQUNBOztBQUVBO0FBQ0E7QUFDQSxJQUFJO0FBQ0osNEJBQTRCLHdEQUFPO0FBQ25DOztBQUVBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBLFlBQVksU0FBUztBQUNyQixZQUFZLFNBQVM7QUFDckIsWUFBWSxTQUFTO0FBQ3JCLFlBQVksZUFBZTtBQUMzQjs7O0FBR0E7QUFDQSxnQkFBZ0Isd0RBQU87QUFDdkI7QUFDQSxtQkFBbUI7O0FBRW5CO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7O0FBRUE7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBLFlBQVksUUFBUTtBQUNwQixZQUFZLFFBQVE7QUFDcEIsWUFBWSxRQUFRO0FBQ3BCLFlBQVksV0FBVztBQUN2Qjs7O0FBR0Esd0JBQXdCLDZDQUFLO0FBQzdCO0FBQ0E7QUFDQTtBQUNBLENBQUM7QUFDRDtBQUNBO0FBQ0E7QUFDQSxZQUFZLFFBQVE7QUFDcEIsWUFBWSxRQUFRO0FBQ3BCLFlBQVksUUFBUTtBQUNwQixZQUFZLFVBQVU7QUFDdEI7O0FBRUEsMEJBQTBCLDZDQUFLO0FBQy9CO0FBQ0E7QUFDQTtBQUNBLENBQUM7QUFDRDtBQUNBO0FBQ0E7QUFDQSxZQUFZLFFBQVE7QUFDcEIsWUFBWSxRQUFRO0FBQ3BCLFlBQVksUUFBUTtBQUNwQixZQUFZLFVBQVU7QUFDdEI7QUFDQTs7QUFFQSw4QkFBOEIsNkNBQUs7QUFDbkM7QUFDQTtBQUNBO0FBQ0EsQ0FBQztBQUNELGlFQUFlO0FBQ2Y7QUFDQTtBQUNBO0FBQ0E7QUFDQTtBQUNBLENBQUMiLCJzb3VyY2VzIjpbIndlYnBhY2s6Ly9hZG15YnJhbmQtaW5zaWdodHMvLi9ub2RlX21vZHVsZXMvcmVjaGFydHMtc2NhbGUvZXM2L3V0aWwvYXJpdGhtZXRpYy5qcz9jMzAyIl0sInNvdXJjZXNDb250ZW50IjpbIi8qKlxuICogQGZpbGVPdmVydmlldyDkuIDkupvlhaznlKjnmoTov5Dnrpfmlrnms5VcbiAqIEBhdXRob3IgeGlsZTYxMVxuICogQGRhdGUgMjAxNS0wOS0xN1xuICovXG5pbXBvcnQgRGVjaW1hbCBmcm9tICdkZWNpbWFsLmpzLWxpZ2h0JztcbmltcG9ydCB7IGN1cnJ5IH0gZnJvbSAnLi91dGlscyc7XG4vKipcbiAqIOiOt+WPluaVsOWAvOeahOS9jeaVsFxuICog5YW25Lit57ud5a+55YC85bGe5LqO5Yy66Ze0WzAuMSwgMSnvvIwg5b6X5Yiw55qE5YC85Li6MFxuICog57ud5a+55YC85bGe5LqO5Yy66Ze0WzAuMDEsIDAuMSnvvIzlvpfliLDnmoTkvY3mlbDkuLogLTFcbiAqIOe7neWvueWAvOWxnuS6juWMuumXtFswLjAwMSwgMC4wMSnvvIzlvpfliLDnmoTkvY3mlbDkuLogLTJcbiAqXG4gKiBAcGFyYW0gIHtOdW1iZXJ9IHZhbHVlIOaVsOWAvFxuICogQHJldHVybiB7SW50ZWdlcn0g5L2N5pWwXG4gKi9cblxuZnVuY3Rpb24gZ2V0RGlnaXRDb3VudCh2YWx1ZSkge1xuICB2YXIgcmVzdWx0O1xuXG4gIGlmICh2YWx1ZSA9PT0gMCkge1xuICAgIHJlc3VsdCA9IDE7XG4gIH0gZWxzZSB7XG4gICAgcmVzdWx0ID0gTWF0aC5mbG9vcihuZXcgRGVjaW1hbCh2YWx1ZSkuYWJzKCkubG9nKDEwKS50b051bWJlcigpKSArIDE7XG4gIH1cblxuICByZXR1cm4gcmVzdWx0O1xufVxuLyoqXG4gKiDmjInnhaflm7rlrprnmoTmraXplb/ojrflj5Zbc3RhcnQsIGVuZCnov5nkuKrljLrpl7TnmoTmlbDmja5cbiAqIOW5tuS4lOmcgOimgeWkhOeQhmpz6K6h566X57K+5bqm55qE6Zeu6aKYXG4gKlxuICogQHBhcmFtICB7RGVjaW1hbH0gc3RhcnQg6LW354K5XG4gKiBAcGFyYW0gIHtEZWNpbWFsfSBlbmQgICDnu4jngrnvvIzkuI3ljIXlkKvor6XlgLxcbiAqIEBwYXJhbSAge0RlY2ltYWx9IHN0ZXAgIOatpemVv1xuICogQHJldHVybiB7QXJyYXl9ICAgICAgICAg6Iul5bmy5pWw5YC8XG4gKi9cblxuXG5mdW5jdGlvbiByYW5nZVN0ZXAoc3RhcnQsIGVuZCwgc3RlcCkge1xuICB2YXIgbnVtID0gbmV3IERlY2ltYWwoc3RhcnQpO1xuICB2YXIgaSA9IDA7XG4gIHZhciByZXN1bHQgPSBbXTsgLy8gbWFnaWMgbnVtYmVyIHRvIHByZXZlbnQgaW5maW5pdGUgbG9vcFxuXG4gIHdoaWxlIChudW0ubHQoZW5kKSAmJiBpIDwgMTAwMDAwKSB7XG4gICAgcmVzdWx0LnB1c2gobnVtLnRvTnVtYmVyKCkpO1xuICAgIG51bSA9IG51bS5hZGQoc3RlcCk7XG4gICAgaSsrO1xuICB9XG5cbiAgcmV0dXJuIHJlc3VsdDtcbn1cbi8qKlxuICog5a+55pWw5YC86L+b6KGM57q/5oCn5o+S5YC8XG4gKlxuICogQHBhcmFtICB7TnVtYmVyfSBhICDlrprkuYnln5/nmoTmnoHngrlcbiAqIEBwYXJhbSAge051bWJlcn0gYiAg5a6a5LmJ5Z+f55qE5p6B54K5XG4gKiBAcGFyYW0gIHtOdW1iZXJ9IHQgIFswLCAxXeWGheeahOafkOS4quWAvFxuICogQHJldHVybiB7TnVtYmVyfSAgICDlrprkuYnln5/lhoXnmoTmn5DkuKrlgLxcbiAqL1xuXG5cbnZhciBpbnRlcnBvbGF0ZU51bWJlciA9IGN1cnJ5KGZ1bmN0aW9uIChhLCBiLCB0KSB7XG4gIHZhciBuZXdBID0gK2E7XG4gIHZhciBuZXdCID0gK2I7XG4gIHJldHVybiBuZXdBICsgdCAqIChuZXdCIC0gbmV3QSk7XG59KTtcbi8qKlxuICog57q/5oCn5o+S5YC855qE6YCG6L+Q566XXG4gKlxuICogQHBhcmFtICB7TnVtYmVyfSBhIOWumuS5ieWfn+eahOaegeeCuVxuICogQHBhcmFtICB7TnVtYmVyfSBiIOWumuS5ieWfn+eahOaegeeCuVxuICogQHBhcmFtICB7TnVtYmVyfSB4IOWPr+S7peiupOS4uuaYr+aPkuWAvOWQjueahOS4gOS4qui+k+WHuuWAvFxuICogQHJldHVybiB7TnVtYmVyfSAgIOW9k3jlnKggYSB+IGLov5nkuKrojIPlm7TlhoXml7bvvIzov5Tlm57lgLzlsZ7kuo5bMCwgMV1cbiAqL1xuXG52YXIgdW5pbnRlcnBvbGF0ZU51bWJlciA9IGN1cnJ5KGZ1bmN0aW9uIChhLCBiLCB4KSB7XG4gIHZhciBkaWZmID0gYiAtICthO1xuICBkaWZmID0gZGlmZiB8fCBJbmZpbml0eTtcbiAgcmV0dXJuICh4IC0gYSkgLyBkaWZmO1xufSk7XG4vKipcbiAqIOe6v+aAp+aPkuWAvOeahOmAhui/kOeul++8jOW5tuS4lOacieaIquaWreeahOaTjeS9nFxuICpcbiAqIEBwYXJhbSAge051bWJlcn0gYSDlrprkuYnln5/nmoTmnoHngrlcbiAqIEBwYXJhbSAge051bWJlcn0gYiDlrprkuYnln5/nmoTmnoHngrlcbiAqIEBwYXJhbSAge051bWJlcn0geCDlj6/ku6XorqTkuLrmmK/mj5LlgLzlkI7nmoTkuIDkuKrovpPlh7rlgLxcbiAqIEByZXR1cm4ge051bWJlcn0gICDlvZN45ZyoIGEgfiBi6L+Z5Liq5Yy66Ze05YaF5pe277yM6L+U5Zue5YC85bGe5LqOWzAsIDFd77yMXG4gKiDlvZN45LiN5ZyoIGEgfiBi6L+Z5Liq5Yy66Ze05pe277yM5Lya5oiq5pat5YiwIGEgfiBiIOi/meS4quWMuumXtFxuICovXG5cbnZhciB1bmludGVycG9sYXRlVHJ1bmNhdGlvbiA9IGN1cnJ5KGZ1bmN0aW9uIChhLCBiLCB4KSB7XG4gIHZhciBkaWZmID0gYiAtICthO1xuICBkaWZmID0gZGlmZiB8fCBJbmZpbml0eTtcbiAgcmV0dXJuIE1hdGgubWF4KDAsIE1hdGgubWluKDEsICh4IC0gYSkgLyBkaWZmKSk7XG59KTtcbmV4cG9ydCBkZWZhdWx0IHtcbiAgcmFuZ2VTdGVwOiByYW5nZVN0ZXAsXG4gIGdldERpZ2l0Q291bnQ6IGdldERpZ2l0Q291bnQsXG4gIGludGVycG9sYXRlTnVtYmVyOiBpbnRlcnBvbGF0ZU51bWJlcixcbiAgdW5pbnRlcnBvbGF0ZU51bWJlcjogdW5pbnRlcnBvbGF0ZU51bWJlcixcbiAgdW5pbnRlcnBvbGF0ZVRydW5jYXRpb246IHVuaW50ZXJwb2xhdGVUcnVuY2F0aW9uXG59OyJdLCJuYW1lcyI6W10sInNvdXJjZVJvb3QiOiIifQ==\n//# sourceURL=webpack-internal:///(ssr)/./node_modules/recharts-scale/es6/util/arithmetic.js\n");
-
-/***/ }),
-
-/***/ "(ssr)/./node_modules/recharts-scale/es6/util/utils.js":
-/*!*******************************************************!*\
-  !*** ./node_modules/recharts-scale/es6/util/utils.js ***!
-  \*******************************************************/
-/***/ ((__unused_webpack_module, __webpack_exports__, __webpack_require__) => {
-
-eval("__webpack_require__.r(__webpack_exports__);\n/* harmony export */ __webpack_require__.d(__webpack_exports__, {\n/* harmony export */   PLACE_HOLDER: () => (/* binding */ PLACE_HOLDER),\n/* harmony export */   compose: () => (/* binding */ compose),\n/* harmony export */   curry: () => (/* binding */ curry),\n/* harmony export */   map: () => (/* binding */ map),\n/* harmony export */   memoize: () => (/* binding */ memoize),\n/* harmony export */   range: () => (/* binding */ range),\n/* harmony export */   reverse: () => (/* binding */ reverse)\n/* harmony export */ });\nfunction _toConsumableArray(arr) { return _arrayWithoutHoles(arr) || _iterableToArray(arr) || _unsupportedIterableToArray(arr) || _nonIterableSpread(); }\n\nfunction _nonIterableSpread() { throw new TypeError(\"Invalid attempt to spread non-iterable instance.\\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.\"); }\n\nfunction _unsupportedIterableToArray(o, minLen) { if (!o) return; if (typeof o === \"string\") return _arrayLikeToArray(o, minLen); var n = Object.prototype.toString.call(o).slice(8, -1); if (n === \"Object\" && o.constructor) n = o.constructor.name; if (n === \"Map\" || n === \"Set\") return Array.from(o); if (n === \"Arguments\" || /^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)) return _arrayLikeToArray(o, minLen); }\n\nfunction _iterableToArray(iter) { if (typeof Symbol !== \"undefined\" && Symbol.iterator in Object(iter)) return Array.from(iter); }\n\nfunction _arrayWithoutHoles(arr) { if (Array.isArray(arr)) return _arrayLikeToArray(arr); }\n\nfunction _arrayLikeToArray(arr, len) { if (len == null || len > arr.length) len = arr.length; for (var i = 0, arr2 = new Array(len); i < len; i++) { arr2[i] = arr[i]; } return arr2; }\n\nvar identity = function identity(i) {\n  return i;\n};\n\nvar PLACE_HOLDER = {\n  '@@functional/placeholder': true\n};\n\nvar isPlaceHolder = function isPlaceHolder(val) {\n  return val === PLACE_HOLDER;\n};\n\nvar curry0 = function curry0(fn) {\n  return function _curried() {\n    if (arguments.length === 0 || arguments.length === 1 && isPlaceHolder(arguments.length <= 0 ? undefined : arguments[0])) {\n      return _curried;\n    }\n\n    return fn.apply(void 0, arguments);\n  };\n};\n\nvar curryN = function curryN(n, fn) {\n  if (n === 1) {\n    return fn;\n  }\n\n  return curry0(function () {\n    for (var _len = arguments.length, args = new Array(_len), _key = 0; _key < _len; _key++) {\n      args[_key] = arguments[_key];\n    }\n\n    var argsLength = args.filter(function (arg) {\n      return arg !== PLACE_HOLDER;\n    }).length;\n\n    if (argsLength >= n) {\n      return fn.apply(void 0, args);\n    }\n\n    return curryN(n - argsLength, curry0(function () {\n      for (var _len2 = arguments.length, restArgs = new Array(_len2), _key2 = 0; _key2 < _len2; _key2++) {\n        restArgs[_key2] = arguments[_key2];\n      }\n\n      var newArgs = args.map(function (arg) {\n        return isPlaceHolder(arg) ? restArgs.shift() : arg;\n      });\n      return fn.apply(void 0, _toConsumableArray(newArgs).concat(restArgs));\n    }));\n  });\n};\n\nvar curry = function curry(fn) {\n  return curryN(fn.length, fn);\n};\nvar range = function range(begin, end) {\n  var arr = [];\n\n  for (var i = begin; i < end; ++i) {\n    arr[i - begin] = i;\n  }\n\n  return arr;\n};\nvar map = curry(function (fn, arr) {\n  if (Array.isArray(arr)) {\n    return arr.map(fn);\n  }\n\n  return Object.keys(arr).map(function (key) {\n    return arr[key];\n  }).map(fn);\n});\nvar compose = function compose() {\n  for (var _len3 = arguments.length, args = new Array(_len3), _key3 = 0; _key3 < _len3; _key3++) {\n    args[_key3] = arguments[_key3];\n  }\n\n  if (!args.length) {\n    return identity;\n  }\n\n  var fns = args.reverse(); // first function can receive multiply arguments\n\n  var firstFn = fns[0];\n  var tailsFn = fns.slice(1);\n  return function () {\n    return tailsFn.reduce(function (res, fn) {\n      return fn(res);\n    }, firstFn.apply(void 0, arguments));\n  };\n};\nvar reverse = function reverse(arr) {\n  if (Array.isArray(arr)) {\n    return arr.reverse();\n  } // can be string\n\n\n  return arr.split('').reverse.join('');\n};\nvar memoize = function memoize(fn) {\n  var lastArgs = null;\n  var lastResult = null;\n  return function () {\n    for (var _len4 = arguments.length, args = new Array(_len4), _key4 = 0; _key4 < _len4; _key4++) {\n      args[_key4] = arguments[_key4];\n    }\n\n    if (lastArgs && args.every(function (val, i) {\n      return val === lastArgs[i];\n    })) {\n      return lastResult;\n    }\n\n    lastArgs = args;\n    lastResult = fn.apply(void 0, args);\n    return lastResult;\n  };\n};//# sourceURL=[module]\n//# sourceMappingURL=data:application/json;charset=utf-8;base64,eyJ2ZXJzaW9uIjozLCJmaWxlIjoiKHNzcikvLi9ub2RlX21vZHVsZXMvcmVjaGFydHMtc2NhbGUvZXM2L3V0aWwvdXRpbHMuanMiLCJtYXBwaW5ncyI6Ijs7Ozs7Ozs7OztBQUFBLG1DQUFtQzs7QUFFbkMsZ0NBQWdDOztBQUVoQyxrREFBa0QsZ0JBQWdCLGdFQUFnRSx3REFBd0QsNkRBQTZELHNEQUFzRDs7QUFFN1Msa0NBQWtDOztBQUVsQyxtQ0FBbUM7O0FBRW5DLHVDQUF1Qyx1REFBdUQsdUNBQXVDLFNBQVMsT0FBTyxvQkFBb0I7O0FBRXpLO0FBQ0E7QUFDQTs7QUFFTztBQUNQO0FBQ0E7O0FBRUE7QUFDQTtBQUNBOztBQUVBO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7O0FBRUE7QUFDQTtBQUNBOztBQUVBO0FBQ0E7QUFDQTtBQUNBOztBQUVBO0FBQ0Esd0VBQXdFLGFBQWE7QUFDckY7QUFDQTs7QUFFQTtBQUNBO0FBQ0EsS0FBSzs7QUFFTDtBQUNBO0FBQ0E7O0FBRUE7QUFDQSxpRkFBaUYsZUFBZTtBQUNoRztBQUNBOztBQUVBO0FBQ0E7QUFDQSxPQUFPO0FBQ1A7QUFDQSxLQUFLO0FBQ0wsR0FBRztBQUNIOztBQUVPO0FBQ1A7QUFDQTtBQUNPO0FBQ1A7O0FBRUEsc0JBQXNCLFNBQVM7QUFDL0I7QUFDQTs7QUFFQTtBQUNBO0FBQ087QUFDUDtBQUNBO0FBQ0E7O0FBRUE7QUFDQTtBQUNBLEdBQUc7QUFDSCxDQUFDO0FBQ007QUFDUCx5RUFBeUUsZUFBZTtBQUN4RjtBQUNBOztBQUVBO0FBQ0E7QUFDQTs7QUFFQSw0QkFBNEI7O0FBRTVCO0FBQ0E7QUFDQTtBQUNBO0FBQ0E7QUFDQSxLQUFLO0FBQ0w7QUFDQTtBQUNPO0FBQ1A7QUFDQTtBQUNBLElBQUk7OztBQUdKO0FBQ0E7QUFDTztBQUNQO0FBQ0E7QUFDQTtBQUNBLDJFQUEyRSxlQUFlO0FBQzFGO0FBQ0E7O0FBRUE7QUFDQTtBQUNBLEtBQUs7QUFDTDtBQUNBOztBQUVBO0FBQ0E7QUFDQTtBQUNBO0FBQ0EiLCJzb3VyY2VzIjpbIndlYnBhY2s6Ly9hZG15YnJhbmQtaW5zaWdodHMvLi9ub2RlX21vZHVsZXMvcmVjaGFydHMtc2NhbGUvZXM2L3V0aWwvdXRpbHMuanM/NDU2NyJdLCJzb3VyY2VzQ29udGVudCI6WyJmdW5jdGlvbiBfdG9Db25zdW1hYmxlQXJyYXkoYXJyKSB7IHJldHVybiBfYXJyYXlXaXRob3V0SG9sZXMoYXJyKSB8fCBfaXRlcmFibGVUb0FycmF5KGFycikgfHwgX3Vuc3VwcG9ydGVkSXRlcmFibGVUb0FycmF5KGFycikgfHwgX25vbkl0ZXJhYmxlU3ByZWFkKCk7IH1cblxuZnVuY3Rpb24gX25vbkl0ZXJhYmxlU3ByZWFkKCkgeyB0aHJvdyBuZXcgVHlwZUVycm9yKFwiSW52YWxpZCBhdHRlbXB0IHRvIHNwcmVhZCBub24taXRlcmFibGUgaW5zdGFuY2UuXFxuSW4gb3JkZXIgdG8gYmUgaXRlcmFibGUsIG5vbi1hcnJheSBvYmplY3RzIG11c3QgaGF2ZSBhIFtTeW1ib2wuaXRlcmF0b3JdKCkgbWV0aG9kLlwiKTsgfVxuXG5mdW5jdGlvbiBfdW5zdXBwb3J0ZWRJdGVyYWJsZVRvQXJyYXkobywgbWluTGVuKSB7IGlmICghbykgcmV0dXJuOyBpZiAodHlwZW9mIG8gPT09IFwic3RyaW5nXCIpIHJldHVybiBfYXJyYXlMaWtlVG9BcnJheShvLCBtaW5MZW4pOyB2YXIgbiA9IE9iamVjdC5wcm90b3R5cGUudG9TdHJpbmcuY2FsbChvKS5zbGljZSg4LCAtMSk7IGlmIChuID09PSBcIk9iamVjdFwiICYmIG8uY29uc3RydWN0b3IpIG4gPSBvLmNvbnN0cnVjdG9yLm5hbWU7IGlmIChuID09PSBcIk1hcFwiIHx8IG4gPT09IFwiU2V0XCIpIHJldHVybiBBcnJheS5mcm9tKG8pOyBpZiAobiA9PT0gXCJBcmd1bWVudHNcIiB8fCAvXig/OlVpfEkpbnQoPzo4fDE2fDMyKSg/OkNsYW1wZWQpP0FycmF5JC8udGVzdChuKSkgcmV0dXJuIF9hcnJheUxpa2VUb0FycmF5KG8sIG1pbkxlbik7IH1cblxuZnVuY3Rpb24gX2l0ZXJhYmxlVG9BcnJheShpdGVyKSB7IGlmICh0eXBlb2YgU3ltYm9sICE9PSBcInVuZGVmaW5lZFwiICYmIFN5bWJvbC5pdGVyYXRvciBpbiBPYmplY3QoaXRlcikpIHJldHVybiBBcnJheS5mcm9tKGl0ZXIpOyB9XG5cbmZ1bmN0aW9uIF9hcnJheVdpdGhvdXRIb2xlcyhhcnIpIHsgaWYgKEFycmF5LmlzQXJyYXkoYXJyKSkgcmV0dXJuIF9hcnJheUxpa2VUb0FycmF5KGFycik7IH1cblxuZnVuY3Rpb24gX2FycmF5TGlrZVRvQXJyYXkoYXJyLCBsZW4pIHsgaWYgKGxlbiA9PSBudWxsIHx8IGxlbiA+IGFyci5sZW5ndGgpIGxlbiA9IGFyci5sZW5ndGg7IGZvciAodmFyIGkgPSAwLCBhcnIyID0gbmV3IEFycmF5KGxlbik7IGkgPCBsZW47IGkrKykgeyBhcnIyW2ldID0gYXJyW2ldOyB9IHJldHVybiBhcnIyOyB9XG5cbnZhciBpZGVudGl0eSA9IGZ1bmN0aW9uIGlkZW50aXR5KGkpIHtcbiAgcmV0dXJuIGk7XG59O1xuXG5leHBvcnQgdmFyIFBMQUNFX0hPTERFUiA9IHtcbiAgJ0BAZnVuY3Rpb25hbC9wbGFjZWhvbGRlcic6IHRydWVcbn07XG5cbnZhciBpc1BsYWNlSG9sZGVyID0gZnVuY3Rpb24gaXNQbGFjZUhvbGRlcih2YWwpIHtcbiAgcmV0dXJuIHZhbCA9PT0gUExBQ0VfSE9MREVSO1xufTtcblxudmFyIGN1cnJ5MCA9IGZ1bmN0aW9uIGN1cnJ5MChmbikge1xuICByZXR1cm4gZnVuY3Rpb24gX2N1cnJpZWQoKSB7XG4gICAgaWYgKGFyZ3VtZW50cy5sZW5ndGggPT09IDAgfHwgYXJndW1lbnRzLmxlbmd0aCA9PT0gMSAmJiBpc1BsYWNlSG9sZGVyKGFyZ3VtZW50cy5sZW5ndGggPD0gMCA/IHVuZGVmaW5lZCA6IGFyZ3VtZW50c1swXSkpIHtcbiAgICAgIHJldHVybiBfY3VycmllZDtcbiAgICB9XG5cbiAgICByZXR1cm4gZm4uYXBwbHkodm9pZCAwLCBhcmd1bWVudHMpO1xuICB9O1xufTtcblxudmFyIGN1cnJ5TiA9IGZ1bmN0aW9uIGN1cnJ5TihuLCBmbikge1xuICBpZiAobiA9PT0gMSkge1xuICAgIHJldHVybiBmbjtcbiAgfVxuXG4gIHJldHVybiBjdXJyeTAoZnVuY3Rpb24gKCkge1xuICAgIGZvciAodmFyIF9sZW4gPSBhcmd1bWVudHMubGVuZ3RoLCBhcmdzID0gbmV3IEFycmF5KF9sZW4pLCBfa2V5ID0gMDsgX2tleSA8IF9sZW47IF9rZXkrKykge1xuICAgICAgYXJnc1tfa2V5XSA9IGFyZ3VtZW50c1tfa2V5XTtcbiAgICB9XG5cbiAgICB2YXIgYXJnc0xlbmd0aCA9IGFyZ3MuZmlsdGVyKGZ1bmN0aW9uIChhcmcpIHtcbiAgICAgIHJldHVybiBhcmcgIT09IFBMQUNFX0hPTERFUjtcbiAgICB9KS5sZW5ndGg7XG5cbiAgICBpZiAoYXJnc0xlbmd0aCA+PSBuKSB7XG4gICAgICByZXR1cm4gZm4uYXBwbHkodm9pZCAwLCBhcmdzKTtcbiAgICB9XG5cbiAgICByZXR1cm4gY3VycnlOKG4gLSBhcmdzTGVuZ3RoLCBjdXJyeTAoZnVuY3Rpb24gKCkge1xuICAgICAgZm9yICh2YXIgX2xlbjIgPSBhcmd1bWVudHMubGVuZ3RoLCByZXN0QXJncyA9IG5ldyBBcnJheShfbGVuMiksIF9rZXkyID0gMDsgX2tleTIgPCBfbGVuMjsgX2tleTIrKykge1xuICAgICAgICByZXN0QXJnc1tfa2V5Ml0gPSBhcmd1bWVudHNbX2tleTJdO1xuICAgICAgfVxuXG4gICAgICB2YXIgbmV3QXJncyA9IGFyZ3MubWFwKGZ1bmN0aW9uIChhcmcpIHtcbiAgICAgICAgcmV0dXJuIGlzUGxhY2VIb2xkZXIoYXJnKSA/IHJlc3RBcmdzLnNoaWZ0KCkgOiBhcmc7XG4gICAgICB9KTtcbiAgICAgIHJldHVybiBmbi5hcHBseSh2b2lkIDAsIF90b0NvbnN1bWFibGVBcnJheShuZXdBcmdzKS5jb25jYXQocmVzdEFyZ3MpKTtcbiAgICB9KSk7XG4gIH0pO1xufTtcblxuZXhwb3J0IHZhciBjdXJyeSA9IGZ1bmN0aW9uIGN1cnJ5KGZuKSB7XG4gIHJldHVybiBjdXJyeU4oZm4ubGVuZ3RoLCBmbik7XG59O1xuZXhwb3J0IHZhciByYW5nZSA9IGZ1bmN0aW9uIHJhbmdlKGJlZ2luLCBlbmQpIHtcbiAgdmFyIGFyciA9IFtdO1xuXG4gIGZvciAodmFyIGkgPSBiZWdpbjsgaSA8IGVuZDsgKytpKSB7XG4gICAgYXJyW2kgLSBiZWdpbl0gPSBpO1xuICB9XG5cbiAgcmV0dXJuIGFycjtcbn07XG5leHBvcnQgdmFyIG1hcCA9IGN1cnJ5KGZ1bmN0aW9uIChmbiwgYXJyKSB7XG4gIGlmIChBcnJheS5pc0FycmF5KGFycikpIHtcbiAgICByZXR1cm4gYXJyLm1hcChmbik7XG4gIH1cblxuICByZXR1cm4gT2JqZWN0LmtleXMoYXJyKS5tYXAoZnVuY3Rpb24gKGtleSkge1xuICAgIHJldHVybiBhcnJba2V5XTtcbiAgfSkubWFwKGZuKTtcbn0pO1xuZXhwb3J0IHZhciBjb21wb3NlID0gZnVuY3Rpb24gY29tcG9zZSgpIHtcbiAgZm9yICh2YXIgX2xlbjMgPSBhcmd1bWVudHMubGVuZ3RoLCBhcmdzID0gbmV3IEFycmF5KF9sZW4zKSwgX2tleTMgPSAwOyBfa2V5MyA8IF9sZW4zOyBfa2V5MysrKSB7XG4gICAgYXJnc1tfa2V5M10gPSBhcmd1bWVudHNbX2tleTNdO1xuICB9XG5cbiAgaWYgKCFhcmdzLmxlbmd0aCkge1xuICAgIHJldHVybiBpZGVudGl0eTtcbiAgfVxuXG4gIHZhciBmbnMgPSBhcmdzLnJldmVyc2UoKTsgLy8gZmlyc3QgZnVuY3Rpb24gY2FuIHJlY2VpdmUgbXVsdGlwbHkgYXJndW1lbnRzXG5cbiAgdmFyIGZpcnN0Rm4gPSBmbnNbMF07XG4gIHZhciB0YWlsc0ZuID0gZm5zLnNsaWNlKDEpO1xuICByZXR1cm4gZnVuY3Rpb24gKCkge1xuICAgIHJldHVybiB0YWlsc0ZuLnJlZHVjZShmdW5jdGlvbiAocmVzLCBmbikge1xuICAgICAgcmV0dXJuIGZuKHJlcyk7XG4gICAgfSwgZmlyc3RGbi5hcHBseSh2b2lkIDAsIGFyZ3VtZW50cykpO1xuICB9O1xufTtcbmV4cG9ydCB2YXIgcmV2ZXJzZSA9IGZ1bmN0aW9uIHJldmVyc2UoYXJyKSB7XG4gIGlmIChBcnJheS5pc0FycmF5KGFycikpIHtcbiAgICByZXR1cm4gYXJyLnJldmVyc2UoKTtcbiAgfSAvLyBjYW4gYmUgc3RyaW5nXG5cblxuICByZXR1cm4gYXJyLnNwbGl0KCcnKS5yZXZlcnNlLmpvaW4oJycpO1xufTtcbmV4cG9ydCB2YXIgbWVtb2l6ZSA9IGZ1bmN0aW9uIG1lbW9pemUoZm4pIHtcbiAgdmFyIGxhc3RBcmdzID0gbnVsbDtcbiAgdmFyIGxhc3RSZXN1bHQgPSBudWxsO1xuICByZXR1cm4gZnVuY3Rpb24gKCkge1xuICAgIGZvciAodmFyIF9sZW40ID0gYXJndW1lbnRzLmxlbmd0aCwgYXJncyA9IG5ldyBBcnJheShfbGVuNCksIF9rZXk0ID0gMDsgX2tleTQgPCBfbGVuNDsgX2tleTQrKykge1xuICAgICAgYXJnc1tfa2V5NF0gPSBhcmd1bWVudHNbX2tleTRdO1xuICAgIH1cblxuICAgIGlmIChsYXN0QXJncyAmJiBhcmdzLmV2ZXJ5KGZ1bmN0aW9uICh2YWwsIGkpIHtcbiAgICAgIHJldHVybiB2YWwgPT09IGxhc3RBcmdzW2ldO1xuICAgIH0pKSB7XG4gICAgICByZXR1cm4gbGFzdFJlc3VsdDtcbiAgICB9XG5cbiAgICBsYXN0QXJncyA9IGFyZ3M7XG4gICAgbGFzdFJlc3VsdCA9IGZuLmFwcGx5KHZvaWQgMCwgYXJncyk7XG4gICAgcmV0dXJuIGxhc3RSZXN1bHQ7XG4gIH07XG59OyJdLCJuYW1lcyI6W10sInNvdXJjZVJvb3QiOiIifQ==\n//# sourceURL=webpack-internal:///(ssr)/./node_modules/recharts-scale/es6/util/utils.js\n");
-
-/***/ })
-
-};
-;
\ No newline at end of file
@@ -0,0 +1,36 @@
+import { NextResponse, type NextRequest } from 'next/server';
+import { DEFAULT_TENANT, getDashboardBreakdown } from '@/lib/dashboardData';
+import { DIMENSIONS, isDimension, type DimensionFilter } from '@/lib/dimensions';
+import { parseRangeParams } from '../params';
+
+// GET /api/dashboard/breakdown?by=region,device&campaign=Search&days=30
+// Totals per combination of the `by` dimensions; any dimension given as a
+// parameter narrows the rows first, so each level of a drill-down is one request
+export async function GET(request: NextRequest) {
+  const params = request.nextUrl.searchParams;
+  const query = parseRangeParams(params, DEFAULT_TENANT);
+  if (query instanceof NextResponse) return query;
+
+  const by = (params.get('by') ?? '').split(',').filter(Boolean);
+  if (by.length === 0 || !by.every(isDimension) || new Set(by).size !== by.length) {
+    return NextResponse.json(
+      { error: `by must list distinct dimensions out of ${DIMENSIONS.join(', ')}` },
+      { status: 400 }
+    );
+  }
+
+  const where: DimensionFilter = {};
+  DIMENSIONS.forEach(dimension => {
+    const value = params.get(dimension);
+    if (value !== null) where[dimension] = value;
+  });
+
+  const breakdown = await getDashboardBreakdown({ ...query, by: by.filter(isDimension), where });
+  if (!breakdown) {
+    return NextResponse.json({ error: `Unknown tenant: ${query.tenant}` }, { status: 404 });
+  }
+
+  return NextResponse.json(breakdown, {
+    headers: { 'Cache-Control': 'private, max-age=60' },
+  });
+}
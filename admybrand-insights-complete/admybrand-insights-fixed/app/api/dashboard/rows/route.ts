@@ -0,0 +1,36 @@
+import { NextResponse, type NextRequest } from 'next/server';
+import { DEFAULT_TENANT, getRowDelta } from '@/lib/dashboardData';
+import { parseCursor } from '@/lib/rowDelta';
+
+// GET /api/dashboard/rows?tenant=acme&since=<cursor>
+// Rows appended since a cursor, taken from the dashboard snapshot or the
+// previous response, in the compact encoding of lib/rowDelta.ts; without
+// `since`, an empty delta whose cursor is the log's current end. The cursor is also the ETag, so a poll sent with
+// If-None-Match gets an empty 304 while nothing has changed
+export async function GET(request: NextRequest) {
+  const params = request.nextUrl.searchParams;
+  const tenant = params.get('tenant') ?? DEFAULT_TENANT;
+  const sinceParam = params.get('since');
+  const since = sinceParam === null ? null : parseCursor(sinceParam);
+  if (sinceParam !== null && !since) {
+    return NextResponse.json({ error: 'since must be a cursor from a snapshot or a previous response' }, { status: 400 });
+  }
+
+  const delta = await getRowDelta(tenant, since);
+  if (!delta) {
+    return NextResponse.json({ error: `Unknown tenant: ${tenant}` }, { status: 404 });
+  }
+
+  // Revalidated on every poll; the body is never reused without asking
+  const headers = { ETag: `"${delta.cursor}"`, 'Cache-Control': 'private, no-cache' };
+  const ifNoneMatch = request.headers.get('if-none-match');
+  const matches =
+    ifNoneMatch !== null &&
+    ifNoneMatch.split(',').some(tag => {
+      const value = tag.trim().replace(/^W\//, '');
+      return value === '*' || value === headers.ETag;
+    });
+  if (matches && !delta.reset) return new NextResponse(null, { status: 304, headers });
+
+  return NextResponse.json(delta, { headers });
+}
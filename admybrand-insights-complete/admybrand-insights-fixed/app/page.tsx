@@ -1,12 +1,43 @@
-'use client';
-
+import { Suspense } from 'react';
+import { notFound } from 'next/navigation';
 import { Sidebar } from '@/components/Sidebar';
 import { Dashboard } from '@/components/Dashboard';
+import { ChartsSection, MetricsSection, TableSection } from '@/components/DashboardSections';
+import { ChartsSkeleton, MetricCardsSkeleton, TableSkeleton } from '@/components/LoadingSkeleton';
+import { DEFAULT_TENANT, hasTenant } from '@/lib/dashboardData';
+
+interface HomeProps {
+  searchParams: { tenant?: string };
+}
+
+// Aggregates are computed on the server so the page ships totals and daily
+// buckets instead of every raw row. The shell is sent at once; each section
+// streams in behind its skeleton as soon as its own data resolves
+export default async function Home({ searchParams }: HomeProps) {
+  const query = { tenant: searchParams.tenant ?? DEFAULT_TENANT };
+  // Checked before streaming starts, so an unknown tenant still gets a 404 status
+  if (!(await hasTenant(query.tenant))) notFound();
 
-export default function Home() {
   return (
     <Sidebar>
-      <Dashboard />
+      <Dashboard
+        query={query}
+        metrics={
+          <Suspense fallback={<MetricCardsSkeleton />}>
+            <MetricsSection query={query} />
+          </Suspense>
+        }
+        charts={
+          <Suspense fallback={<ChartsSkeleton />}>
+            <ChartsSection query={query} />
+          </Suspense>
+        }
+        table={
+          <Suspense fallback={<TableSkeleton />}>
+            <TableSection query={query} />
+          </Suspense>
+        }
+      />
     </Sidebar>
   );
 }
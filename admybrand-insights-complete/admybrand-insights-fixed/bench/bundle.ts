@@ -0,0 +1,219 @@
+// Per-chunk bundle size report with budgets, read from a production build.
+//
+//   npm run build && npm run bundle -- [--initial-budget 220] [--chunk-budget 160]
+//                                      [--out bundle.json]
+//
+// Every JavaScript chunk in .next/static/chunks is listed with its raw and
+// gzip size and the routes that load it at startup. Chunks no route loads at
+// startup are lazy (next/dynamic panels). Budgets are gzip KiB: the startup
+// JavaScript of each route, and any single lazy chunk. Exceeding either fails
+// the run, so the report can gate CI.
+import { execSync } from 'child_process';
+import { existsSync, mkdirSync, readdirSync, readFileSync, statSync, writeFileSync } from 'fs';
+import path from 'path';
+import { gzipSync } from 'zlib';
+
+type ChunkKind = 'initial' | 'lazy' | 'legacy';
+
+interface ChunkSize {
+  file: string;
+  kind: ChunkKind;
+  bytes: number;
+  gzipBytes: number;
+  // Routes that load the chunk at startup
+  routes: string[];
+}
+
+interface RouteSize {
+  route: string;
+  chunks: number;
+  bytes: number;
+  gzipBytes: number;
+}
+
+interface BundleReport {
+  version: number;
+  commit: string | null;
+  date: string;
+  budgets: { initialGzipBytes: number; chunkGzipBytes: number };
+  routes: RouteSize[];
+  chunks: ChunkSize[];
+  overBudget: string[];
+}
+
+const REPORT_VERSION = 1;
+const KIB = 1024;
+const NEXT_DIR = path.join(process.cwd(), '.next');
+const RESULTS_DIR = path.join(process.cwd(), 'bench', 'results');
+
+function parseArgs(argv: string[]) {
+  const options = {
+    initialBudgetKib: 220,
+    chunkBudgetKib: 160,
+    out: null as string | null,
+  };
+
+  for (let i = 0; i < argv.length; i++) {
+    const value = () => {
+      if (i + 1 >= argv.length) throw new Error(`Missing value for ${argv[i]}`);
+      return argv[++i];
+    };
+    switch (argv[i]) {
+      case '--initial-budget':
+        options.initialBudgetKib = Number(value());
+        break;
+      case '--chunk-budget':
+        options.chunkBudgetKib = Number(value());
+        break;
+      case '--out':
+        options.out = value();
+        break;
+      default:
+        throw new Error(`Unknown option ${argv[i]}`);
+    }
+  }
+
+  return options;
+}
+
+function currentCommit(): string | null {
+  try {
+    return execSync('git rev-parse --short HEAD', { stdio: ['ignore', 'pipe', 'ignore'] }).toString().trim();
+  } catch {
+    return null;
+  }
+}
+
+function readManifest<T>(name: string): T {
+  const file = path.join(NEXT_DIR, name);
+  if (!existsSync(file)) {
+    throw new Error(`${file} not found. Run \`npm run build\` first.`);
+  }
+  return JSON.parse(readFileSync(file, 'utf8'));
+}
+
+// Every .js file under dir, relative to .next (the form manifests use)
+function listChunks(dir: string): string[] {
+  if (!existsSync(dir)) return [];
+  const files: string[] = [];
+  readdirSync(dir).forEach(name => {
+    const full = path.join(dir, name);
+    if (statSync(full).isDirectory()) files.push(...listChunks(full));
+    else if (name.endsWith('.js')) files.push(path.relative(NEXT_DIR, full).split(path.sep).join('/'));
+  });
+  return files;
+}
+
+// Startup chunks per app route: the route's page entry plus the entries of
+// every layout above it, e.g. /reports/page -> /layout, /reports/layout
+function routeChunks(pages: Record<string, string[]>, rootMainFiles: string[]): Map<string, Set<string>> {
+  const routes = new Map<string, Set<string>>();
+  Object.keys(pages)
+    .filter(entry => entry.endsWith('/page'))
+    .forEach(entry => {
+      const segments = entry.split('/').slice(1, -1);
+      const files = new Set(rootMainFiles);
+      for (let depth = 0; depth <= segments.length; depth++) {
+        const layout = ['', ...segments.slice(0, depth), 'layout'].join('/');
+        (pages[layout] ?? []).forEach(file => files.add(file));
+      }
+      pages[entry].forEach(file => files.add(file));
+      const route = entry.slice(0, -'/page'.length) || '/';
+      routes.set(route, new Set(Array.from(files).filter(file => file.endsWith('.js'))));
+    });
+  return routes;
+}
+
+function formatKib(bytes: number): string {
+  return `${(bytes / KIB).toFixed(1)} KiB`;
+}
+
+function main() {
+  const options = parseArgs(process.argv.slice(2));
+  const appManifest = readManifest<{ pages: Record<string, string[]> }>('app-build-manifest.json');
+  const buildManifest = readManifest<{
+    rootMainFiles?: string[];
+    polyfillFiles?: string[];
+    pages?: Record<string, string[]>;
+  }>('build-manifest.json');
+
+  const routes = routeChunks(appManifest.pages, buildManifest.rootMainFiles ?? []);
+  // Pages-router runtime and polyfills; only loaded by legacy browsers or error pages
+  const legacy = new Set(buildManifest.polyfillFiles ?? []);
+  Object.keys(buildManifest.pages ?? {}).forEach(page => {
+    (buildManifest.pages ?? {})[page].forEach(file => legacy.add(file));
+  });
+
+  const chunks: ChunkSize[] = listChunks(path.join(NEXT_DIR, 'static', 'chunks')).map(file => {
+    const source = readFileSync(path.join(NEXT_DIR, file));
+    const loadedBy: string[] = [];
+    routes.forEach((files, route) => {
+      if (files.has(file)) loadedBy.push(route);
+    });
+    const kind: ChunkKind = loadedBy.length > 0 ? 'initial' : legacy.has(file) ? 'legacy' : 'lazy';
+    return { file, kind, bytes: source.length, gzipBytes: gzipSync(source).length, routes: loadedBy };
+  });
+  chunks.sort((a, b) => b.gzipBytes - a.gzipBytes);
+
+  const sizes = new Map(chunks.map(chunk => [chunk.file, chunk]));
+  const routeSizes: RouteSize[] = [];
+  routes.forEach((files, route) => {
+    let bytes = 0;
+    let gzipBytes = 0;
+    files.forEach(file => {
+      const chunk = sizes.get(file);
+      bytes += chunk ? chunk.bytes : 0;
+      gzipBytes += chunk ? chunk.gzipBytes : 0;
+    });
+    routeSizes.push({ route, chunks: files.size, bytes, gzipBytes });
+  });
+  routeSizes.sort((a, b) => (a.route < b.route ? -1 : 1));
+
+  const budgets = {
+    initialGzipBytes: options.initialBudgetKib * KIB,
+    chunkGzipBytes: options.chunkBudgetKib * KIB,
+  };
+  const overBudget: string[] = [];
+  routeSizes.forEach(({ route, gzipBytes }) => {
+    if (gzipBytes > budgets.initialGzipBytes) {
+      overBudget.push(`${route}: startup JS ${formatKib(gzipBytes)} > ${formatKib(budgets.initialGzipBytes)}`);
+    }
+  });
+  chunks.forEach(({ file, kind, gzipBytes }) => {
+    if (kind === 'lazy' && gzipBytes > budgets.chunkGzipBytes) {
+      overBudget.push(`${file}: ${formatKib(gzipBytes)} > ${formatKib(budgets.chunkGzipBytes)}`);
+    }
+  });
+
+  console.log('Startup JavaScript per route (gzip):');
+  routeSizes.forEach(({ route, chunks: count, bytes, gzipBytes }) => {
+    console.log(`  ${route.padEnd(32)} ${formatKib(gzipBytes).padStart(11)}  (${formatKib(bytes)} raw, ${count} chunks)`);
+  });
+  console.log('\nChunks (gzip, largest first):');
+  chunks.forEach(({ file, kind, bytes, gzipBytes, routes: loadedBy }) => {
+    const where = kind === 'initial' ? loadedBy.join(', ') : kind;
+    console.log(`  ${formatKib(gzipBytes).padStart(11)} ${formatKib(bytes).padStart(11)}  ${file}  [${where}]`);
+  });
+
+  const report: BundleReport = {
+    version: REPORT_VERSION,
+    commit: currentCommit(),
+    date: new Date().toISOString(),
+    budgets,
+    routes: routeSizes,
+    chunks,
+    overBudget,
+  };
+  mkdirSync(RESULTS_DIR, { recursive: true });
+  const out = options.out ?? path.join(RESULTS_DIR, `bundle-${report.commit ?? 'local'}.json`);
+  writeFileSync(out, JSON.stringify(report, null, 2));
+  console.log(`\nReport written to ${path.relative(process.cwd(), out)}`);
+
+  if (overBudget.length > 0) {
+    console.error('\nOver budget:');
+    overBudget.forEach(line => console.error(`  ${line}`));
+    process.exitCode = 1;
+  }
+}
+
+main();
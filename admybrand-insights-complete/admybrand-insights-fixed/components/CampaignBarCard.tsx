@@ -0,0 +1,68 @@
+'use client';
+
+import { memo } from 'react';
+import { BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, ResponsiveContainer } from 'recharts';
+import { MotionDiv } from './Motion';
+import { BarChart3 } from 'lucide-react';
+import type { CampaignChartRow } from '@/lib/selectors';
+import { usePerformanceMode } from '@/lib/performanceMode';
+import { useRenderCount } from '@/lib/useRenderCount';
+import { CanvasChart, type CanvasSeries } from './CanvasChart';
+import { CANVAS_POINT_THRESHOLD, ChartTooltip, formatDollars } from './ChartTooltip';
+
+// Canvas series mirroring the Recharts <Bar> below
+const CAMPAIGN_SERIES: CanvasSeries<CampaignChartRow>[] = [{ key: 'revenue', color: '#10B981' }];
+
+// Campaign Performance Bar Chart
+interface CampaignBarCardProps {
+  data: CampaignChartRow[];
+}
+
+export const CampaignBarCard = memo(function CampaignBarCard({ data }: CampaignBarCardProps) {
+  useRenderCount('CampaignBarCard');
+  const performanceMode = usePerformanceMode();
+
+  return (
+    <MotionDiv
+      initial={{ opacity: 0, y: 20 }}
+      animate={{ opacity: 1, y: 0 }}
+      transition={{ duration: 0.3, delay: 0.2 }}
+      className="glass-effect rounded-xl p-6"
+    >
+      <div className="flex items-center justify-between mb-4">
+        <div className="flex items-center space-x-2">
+          <BarChart3 className="w-5 h-5 text-green-600" />
+          <h3 className="text-lg font-semibold text-gray-900 dark:text-white">
+            Campaign Performance
+          </h3>
+        </div>
+      </div>
+      {data.length > CANVAS_POINT_THRESHOLD ? (
+        <CanvasChart
+          kind="bar"
+          data={data}
+          xKey="name"
+          series={CAMPAIGN_SERIES}
+          height={250}
+          tooltip={ChartTooltip}
+          formatY={formatDollars}
+        />
+      ) : (
+        <ResponsiveContainer width="100%" height={250}>
+          <BarChart data={data}>
+            <CartesianGrid strokeDasharray="3 3" opacity={0.3} />
+            <XAxis dataKey="name" tick={{ fontSize: 12 }} />
+            <YAxis tick={{ fontSize: 12 }} tickFormatter={formatDollars} />
+            <Tooltip content={<ChartTooltip />} />
+            <Bar
+              dataKey="revenue"
+              fill="#10B981"
+              radius={[4, 4, 0, 0]}
+              isAnimationActive={!performanceMode}
+            />
+          </BarChart>
+        </ResponsiveContainer>
+      )}
+    </MotionDiv>
+  );
+});
@@ -0,0 +1,367 @@
+'use client';
+
+import { useCallback, useEffect, useMemo, useRef, useState, type ComponentType, type MouseEvent } from 'react';
+
+export interface CanvasSeries<T> {
+  key: keyof T & string;
+  // #RRGGBB; the area fill derives its transparency from it
+  color: string;
+  // Shown in the tooltip and legend; defaults to the key, as in Recharts
+  name?: string;
+  // Plot against a second scale on the right
+  axis?: 'left' | 'right';
+}
+
+// The props Recharts passes to a custom tooltip `content` component
+export interface CanvasTooltipProps {
+  active: boolean;
+  label: string;
+  payload: { name: string; value: number; color: string; dataKey: string }[];
+}
+
+interface CanvasChartProps<T> {
+  kind: 'line' | 'area' | 'bar';
+  data: T[];
+  xKey: keyof T & string;
+  series: CanvasSeries<T>[];
+  height: number;
+  tooltip: ComponentType<CanvasTooltipProps>;
+  // Formatters are redraw inputs: pass module-level or memoized functions
+  formatX?: (value: string) => string;
+  formatY?: (value: number) => string;
+  formatRightY?: (value: number) => string;
+  dots?: boolean;
+  legend?: boolean;
+  onResize?: (width: number) => void;
+}
+
+interface Layout {
+  left: number;
+  top: number;
+  width: number;
+  height: number;
+}
+
+// Matches Recharts' default tick, grid and cursor styling
+const TICK_COLOR = '#666';
+const GRID_COLOR = 'rgba(204, 204, 204, 0.3)';
+const CURSOR_COLOR = '#ccc';
+const FONT = '12px sans-serif';
+const MARGIN = { top: 8, right: 12, bottom: 28, axis: 56 };
+const Y_TICKS = 5;
+const X_LABEL_SPACING = 80;
+
+// Default formatters live at module scope so they never trigger a redraw
+const formatLabel = (value: string) => value;
+const formatValue = (value: number) => String(value);
+
+// Round the axis maximum up to 1, 2, 2.5 or 5 times a power of ten
+function niceMax(value: number): number {
+  if (value <= 0) return 1;
+  const magnitude = Math.pow(10, Math.floor(Math.log10(value)));
+  const steps = [1, 2, 2.5, 5, 10];
+  for (let i = 0; i < steps.length; i++) {
+    if (value <= steps[i] * magnitude) return steps[i] * magnitude;
+  }
+  return 10 * magnitude;
+}
+
+function seriesMax<T>(data: T[], series: CanvasSeries<T>[], axis: 'left' | 'right'): number {
+  let max = 0;
+  series.forEach(entry => {
+    if ((entry.axis ?? 'left') !== axis) return;
+    for (let i = 0; i < data.length; i++) max = Math.max(max, Number(data[i][entry.key]));
+  });
+  return niceMax(max);
+}
+
+// Canvas renderer for line, area and bar charts with too many points for SVG.
+// The chart is drawn once per data or size change; hovering only repaints a
+// transparent overlay (cursor and active dots), so a hover frame costs
+// O(series) regardless of how many points are plotted
+export function CanvasChart<T extends object>({
+  kind,
+  data,
+  xKey,
+  series,
+  height,
+  tooltip: Tooltip,
+  formatX = formatLabel,
+  formatY = formatValue,
+  formatRightY = formatY,
+  dots = false,
+  legend = false,
+  onResize,
+}: CanvasChartProps<T>) {
+  const containerRef = useRef<HTMLDivElement>(null);
+  const chartRef = useRef<HTMLCanvasElement>(null);
+  const overlayRef = useRef<HTMLCanvasElement>(null);
+  const frameRef = useRef(0);
+  const onResizeRef = useRef(onResize);
+  onResizeRef.current = onResize;
+  const [width, setWidth] = useState(0);
+  const [hover, setHover] = useState<{ index: number; x: number; y: number } | null>(null);
+
+  const hasRightAxis = series.some(entry => entry.axis === 'right');
+  // Scales scan every point, so they are kept out of the per-hover render
+  const leftMax = useMemo(() => seriesMax(data, series, 'left'), [data, series]);
+  const rightMax = useMemo(() => seriesMax(data, series, 'right'), [data, series]);
+
+  // Plot geometry, rebuilt only when a scale or the size changes
+  const scale = useMemo(() => {
+    const count = data.length;
+    const layout: Layout = {
+      left: MARGIN.axis,
+      top: MARGIN.top,
+      width: Math.max(0, width - MARGIN.axis - (hasRightAxis ? MARGIN.axis : MARGIN.right)),
+      height: Math.max(0, height - MARGIN.top - MARGIN.bottom),
+    };
+    const band = count > 0 ? layout.width / count : 0;
+    const xAt = (index: number) => {
+      if (kind === 'bar') return layout.left + band * (index + 0.5);
+      if (count < 2) return layout.left + layout.width / 2;
+      return layout.left + (index / (count - 1)) * layout.width;
+    };
+    const yAt = (value: number, axis: 'left' | 'right' = 'left') =>
+      layout.top + layout.height * (1 - value / (axis === 'right' ? rightMax : leftMax));
+    return { layout, band, xAt, yAt };
+  }, [data.length, kind, width, height, hasRightAxis, leftMax, rightMax]);
+  const { layout, band } = scale;
+
+  useEffect(() => {
+    const container = containerRef.current;
+    if (!container) return;
+    const observer = new ResizeObserver(entries => {
+      const next = Math.floor(entries[0].contentRect.width);
+      setWidth(next);
+      onResizeRef.current?.(next);
+    });
+    observer.observe(container);
+    return () => observer.disconnect();
+  }, []);
+
+  // Size a canvas for the device pixel ratio and return its context in CSS pixels
+  const prepare = useCallback((canvas: HTMLCanvasElement | null) => {
+    if (!canvas || width === 0) return null;
+    const ratio = window.devicePixelRatio || 1;
+    // Backing stores are whole pixels; comparing unrounded sizes at fractional
+    // ratios (1.25, 1.5) would reallocate, and so clear, the canvas every draw
+    const pixelWidth = Math.round(width * ratio);
+    const pixelHeight = Math.round(height * ratio);
+    if (canvas.width !== pixelWidth || canvas.height !== pixelHeight) {
+      canvas.width = pixelWidth;
+      canvas.height = pixelHeight;
+    }
+    const context = canvas.getContext('2d');
+    if (!context) return null;
+    context.setTransform(ratio, 0, 0, ratio, 0, 0);
+    context.clearRect(0, 0, width, height);
+    return context;
+  }, [width, height]);
+
+  // Full redraw: grid, axes and every series
+  useEffect(() => {
+    const context = prepare(chartRef.current);
+    if (!context) return;
+    const { layout, band, xAt, yAt } = scale;
+
+    context.font = FONT;
+    context.fillStyle = TICK_COLOR;
+    context.strokeStyle = GRID_COLOR;
+    context.lineWidth = 1;
+    context.setLineDash([3, 3]);
+    for (let t = 0; t <= Y_TICKS; t++) {
+      const y = layout.top + (layout.height * t) / Y_TICKS;
+      context.beginPath();
+      context.moveTo(layout.left, y);
+      context.lineTo(layout.left + layout.width, y);
+      context.stroke();
+
+      context.textBaseline = 'middle';
+      context.textAlign = 'right';
+      context.fillText(formatY(leftMax * (1 - t / Y_TICKS)), layout.left - 6, y);
+      if (hasRightAxis) {
+        context.textAlign = 'left';
+        context.fillText(formatRightY(rightMax * (1 - t / Y_TICKS)), layout.left + layout.width + 6, y);
+      }
+    }
+    context.setLineDash([]);
+
+    const labelEvery = Math.max(1, Math.ceil(data.length / Math.max(1, layout.width / X_LABEL_SPACING)));
+    context.textAlign = 'center';
+    context.textBaseline = 'top';
+    for (let i = 0; i < data.length; i += labelEvery) {
+      context.fillText(formatX(String(data[i][xKey])), xAt(i), layout.top + layout.height + 8);
+    }
+
+    series.forEach((entry, s) => {
+      const axis = entry.axis ?? 'left';
+      if (kind === 'bar') {
+        const barWidth = Math.max(1, (band * 0.8) / series.length);
+        context.fillStyle = entry.color;
+        for (let i = 0; i < data.length; i++) {
+          const x = layout.left + band * i + band * 0.1 + barWidth * s;
+          const y = yAt(Number(data[i][entry.key]), axis);
+          const barHeight = layout.top + layout.height - y;
+          context.beginPath();
+          if (barWidth >= 8) context.roundRect(x, y, barWidth, barHeight, [4, 4, 0, 0]);
+          else context.rect(x, y, barWidth, barHeight);
+          context.fill();
+        }
+        return;
+      }
+
+      context.beginPath();
+      for (let i = 0; i < data.length; i++) {
+        const x = xAt(i);
+        const y = yAt(Number(data[i][entry.key]), axis);
+        if (i === 0) context.moveTo(x, y);
+        else context.lineTo(x, y);
+      }
+      context.strokeStyle = entry.color;
+      context.lineWidth = 2;
+      context.stroke();
+
+      if (kind === 'area' && data.length > 0) {
+        context.lineTo(xAt(data.length - 1), layout.top + layout.height);
+        context.lineTo(xAt(0), layout.top + layout.height);
+        context.closePath();
+        const gradient = context.createLinearGradient(0, layout.top, 0, layout.top + layout.height);
+        gradient.addColorStop(0.05, `${entry.color}4D`);
+        gradient.addColorStop(0.95, `${entry.color}00`);
+        context.fillStyle = gradient;
+        context.fill();
+      }
+
+      if (dots) {
+        context.fillStyle = '#fff';
+        for (let i = 0; i < data.length; i++) {
+          context.beginPath();
+          context.arc(xAt(i), yAt(Number(data[i][entry.key]), axis), 4, 0, Math.PI * 2);
+          context.fill();
+          context.stroke();
+        }
+      }
+    });
+  }, [
+    prepare,
+    scale,
+    data,
+    xKey,
+    series,
+    kind,
+    dots,
+    hasRightAxis,
+    leftMax,
+    rightMax,
+    formatX,
+    formatY,
+    formatRightY,
+  ]);
+
+  // Hover repaint: only the overlay canvas is touched
+  useEffect(() => {
+    const context = prepare(overlayRef.current);
+    if (!context || !hover || hover.index >= data.length) return;
+    const { layout, band, xAt, yAt } = scale;
+    const x = xAt(hover.index);
+
+    if (kind === 'bar') {
+      context.fillStyle = 'rgba(204, 204, 204, 0.5)';
+      context.fillRect(layout.left + band * hover.index, layout.top, band, layout.height);
+      return;
+    }
+
+    context.strokeStyle = CURSOR_COLOR;
+    context.lineWidth = 1;
+    context.beginPath();
+    context.moveTo(x, layout.top);
+    context.lineTo(x, layout.top + layout.height);
+    context.stroke();
+
+    context.lineWidth = 2;
+    context.strokeStyle = '#fff';
+    series.forEach(entry => {
+      context.fillStyle = entry.color;
+      context.beginPath();
+      context.arc(x, yAt(Number(data[hover.index][entry.key]), entry.axis), 4, 0, Math.PI * 2);
+      context.fill();
+      context.stroke();
+    });
+  }, [prepare, scale, hover, data, series, kind]);
+
+  useEffect(() => () => cancelAnimationFrame(frameRef.current), []);
+
+  // Pointer moves are coalesced to one hit test per animation frame
+  const handleMouseMove = (event: MouseEvent<HTMLCanvasElement>) => {
+    const bounds = event.currentTarget.getBoundingClientRect();
+    const x = event.clientX - bounds.left;
+    const y = event.clientY - bounds.top;
+    cancelAnimationFrame(frameRef.current);
+    frameRef.current = requestAnimationFrame(() => {
+      if (data.length === 0 || x < layout.left || x > layout.left + layout.width) {
+        setHover(null);
+        return;
+      }
+      const index =
+        kind === 'bar'
+          ? Math.min(data.length - 1, Math.floor((x - layout.left) / band))
+          : Math.round(((x - layout.left) / Math.max(1, layout.width)) * (data.length - 1));
+      setHover(current => (current && current.index === index && current.y === y ? current : { index, x, y }));
+    });
+  };
+
+  const handleMouseLeave = () => {
+    cancelAnimationFrame(frameRef.current);
+    setHover(null);
+  };
+
+  const active = hover !== null && hover.index < data.length;
+  const row = active ? data[hover.index] : null;
+
+  return (
+    <div>
+      <div ref={containerRef} className="relative w-full" style={{ height }}>
+        <canvas ref={chartRef} className="absolute inset-0" style={{ width: '100%', height }} />
+        <canvas
+          ref={overlayRef}
+          className="absolute inset-0"
+          style={{ width: '100%', height }}
+          onMouseMove={handleMouseMove}
+          onMouseLeave={handleMouseLeave}
+        />
+        {active && row && (
+          <div
+            className="absolute pointer-events-none z-10"
+            style={{
+              left: hover.x > width / 2 ? undefined : hover.x + 12,
+              right: hover.x > width / 2 ? width - hover.x + 12 : undefined,
+              top: Math.max(0, Math.min(hover.y, height - 80)),
+            }}
+          >
+            <Tooltip
+              active
+              label={String(row[xKey])}
+              payload={series.map(entry => ({
+                name: entry.name ?? entry.key,
+                value: Number(row[entry.key]),
+                color: entry.color,
+                dataKey: entry.key,
+              }))}
+            />
+          </div>
+        )}
+      </div>
+      {legend && (
+        <ul className="flex justify-center space-x-4 text-sm">
+          {series.map(entry => (
+            <li key={entry.key} className="flex items-center space-x-1" style={{ color: entry.color }}>
+              <span className="inline-block w-3 h-0.5" style={{ backgroundColor: entry.color }} />
+              <span>{entry.name ?? entry.key}</span>
+            </li>
+          ))}
+        </ul>
+      )}
+    </div>
+  );
+}
@@ -0,0 +1,32 @@
+'use client';
+
+import { formatCurrency, formatNumber } from '@/lib/utils';
+
+// Above this many points a chart is drawn on canvas instead of as SVG nodes
+export const CANVAS_POINT_THRESHOLD = 500;
+
+export const formatDollars = (value: number) => `$${value}`;
+
+// Shared by every chart card, and by CanvasChart as its tooltip; defined at
+// module scope so each chart sees a stable component type
+export function ChartTooltip({ active, payload, label }: any) {
+  if (active && payload && payload.length) {
+    return (
+      <div className="glass-effect rounded-lg p-3 border border-white/20">
+        <p className="text-sm font-medium text-gray-900 dark:text-white">
+          {label}
+        </p>
+        {payload.map((entry: any, index: number) => (
+          <p key={index} className="text-sm" style={{ color: entry.color }}>
+            {entry.name}: {
+              entry.name === 'revenue' 
+                ? formatCurrency(entry.value)
+                : formatNumber(entry.value)
+            }
+          </p>
+        ))}
+      </div>
+    );
+  }
+  return null;
+}
@@ -1,6 +1,6 @@
 'use client';
 
-import { motion } from 'framer-motion';
+import { MotionDiv } from './Motion';
 import { TrendingUp, TrendingDown } from 'lucide-react';
 import { cn } from '@/lib/utils';
 
@@ -17,7 +17,7 @@ export function MetricCard({ title, value, change, icon, className }: MetricCard
   const isNegative = change && change < 0;
 
   return (
-    <motion.div
+    <MotionDiv
       initial={{ opacity: 0, y: 20 }}
       animate={{ opacity: 1, y: 0 }}
       transition={{ duration: 0.3 }}
@@ -49,6 +49,6 @@ export function MetricCard({ title, value, change, icon, className }: MetricCard
           </div>
         )}
       </div>
-    </motion.div>
+    </MotionDiv>
   );
 }
@@ -0,0 +1,97 @@
+'use client';
+
+import { memo } from 'react';
+import { LineChart, Line, XAxis, YAxis, CartesianGrid, Tooltip, Legend, ResponsiveContainer } from 'recharts';
+import { MotionDiv } from './Motion';
+import { Activity } from 'lucide-react';
+import type { RollupPoint } from '@/lib/rollups';
+import { usePerformanceMode } from '@/lib/performanceMode';
+import { useRenderCount } from '@/lib/useRenderCount';
+import { CanvasChart, type CanvasSeries } from './CanvasChart';
+import { CANVAS_POINT_THRESHOLD, ChartTooltip } from './ChartTooltip';
+
+const DOT = { r: 4 };
+
+// Canvas series mirroring the Recharts <Line> elements below
+const METRIC_SERIES: CanvasSeries<RollupPoint>[] = [
+  { key: 'users', color: '#3B82F6', name: 'Users' },
+  { key: 'conversions', color: '#10B981', name: 'Conversions', axis: 'right' },
+];
+
+// Multi-Metric Line Chart
+interface MetricTrendCardProps {
+  data: RollupPoint[];
+  formatBucket: (value: string) => string;
+  showDots: boolean;
+}
+
+export const MetricTrendCard = memo(function MetricTrendCard({ data, formatBucket, showDots }: MetricTrendCardProps) {
+  useRenderCount('MetricTrendCard');
+  const performanceMode = usePerformanceMode();
+
+  return (
+    <MotionDiv
+      initial={{ opacity: 0, y: 20 }}
+      animate={{ opacity: 1, y: 0 }}
+      transition={{ duration: 0.3, delay: 0.4 }}
+      className="glass-effect rounded-xl p-6"
+    >
+      <div className="flex items-center justify-between mb-4">
+        <div className="flex items-center space-x-2">
+          <Activity className="w-5 h-5 text-orange-600" />
+          <h3 className="text-lg font-semibold text-gray-900 dark:text-white">
+            Multi-Metric Overview
+          </h3>
+        </div>
+      </div>
+      {data.length > CANVAS_POINT_THRESHOLD ? (
+        <CanvasChart
+          kind="line"
+          data={data}
+          xKey="date"
+          series={METRIC_SERIES}
+          height={250}
+          tooltip={ChartTooltip}
+          formatX={formatBucket}
+          dots={showDots}
+          legend
+        />
+      ) : (
+        <ResponsiveContainer width="100%" height={250}>
+          <LineChart data={data}>
+            <CartesianGrid strokeDasharray="3 3" opacity={0.3} />
+            <XAxis 
+              dataKey="date" 
+              tick={{ fontSize: 12 }}
+              tickFormatter={formatBucket}
+            />
+            <YAxis yAxisId="left" tick={{ fontSize: 12 }} />
+            <YAxis yAxisId="right" orientation="right" tick={{ fontSize: 12 }} />
+            <Tooltip content={<ChartTooltip />} />
+            <Legend />
+            <Line
+              yAxisId="left"
+              type="monotone"
+              dataKey="users"
+              stroke="#3B82F6"
+              strokeWidth={2}
+              dot={showDots ? DOT : false}
+              name="Users"
+              isAnimationActive={!performanceMode}
+            />
+            <Line
+              yAxisId="right"
+              type="monotone"
+              dataKey="conversions"
+              stroke="#10B981"
+              strokeWidth={2}
+              dot={showDots ? DOT : false}
+              name="Conversions"
+              isAnimationActive={!performanceMode}
+            />
+          </LineChart>
+        </ResponsiveContainer>
+      )}
+    </MotionDiv>
+  );
+});
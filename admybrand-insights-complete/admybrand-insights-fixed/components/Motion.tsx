@@ -0,0 +1,34 @@
+'use client';
+
+import { forwardRef } from 'react';
+import { motion, type HTMLMotionProps } from 'framer-motion';
+import { usePerformanceMode } from '@/lib/performanceMode';
+
+// Laid over the caller's props in performance mode: elements mount in their
+// `animate` state, later targets are applied in a single frame, and hover and
+// tap effects are off. The motion element itself is kept, so switching modes
+// never remounts the subtree or loses its state.
+const STILL = {
+  initial: false,
+  transition: { duration: 0 },
+  whileHover: undefined,
+  whileTap: undefined,
+  whileFocus: undefined,
+} as const;
+
+// Drop-in replacements for motion.div / motion.tr / motion.button that skip
+// their animations in performance mode
+export const MotionDiv = forwardRef<HTMLDivElement, HTMLMotionProps<'div'>>(function MotionDiv(props, ref) {
+  const performanceMode = usePerformanceMode();
+  return <motion.div ref={ref} {...props} {...(performanceMode ? STILL : null)} />;
+});
+
+export const MotionTr = forwardRef<HTMLTableRowElement, HTMLMotionProps<'tr'>>(function MotionTr(props, ref) {
+  const performanceMode = usePerformanceMode();
+  return <motion.tr ref={ref} {...props} {...(performanceMode ? STILL : null)} />;
+});
+
+export const MotionButton = forwardRef<HTMLButtonElement, HTMLMotionProps<'button'>>(function MotionButton(props, ref) {
+  const performanceMode = usePerformanceMode();
+  return <motion.button ref={ref} {...props} {...(performanceMode ? STILL : null)} />;
+});
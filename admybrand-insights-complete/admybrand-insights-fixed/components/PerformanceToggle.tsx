@@ -0,0 +1,31 @@
+'use client';
+
+import { useEffect } from 'react';
+import { Gauge } from 'lucide-react';
+import { MotionButton } from './Motion';
+import { initPerformanceMode, setPerformanceMode, usePerformanceMode } from '@/lib/performanceMode';
+
+export function PerformanceToggle() {
+  const performanceMode = usePerformanceMode();
+
+  useEffect(() => {
+    // Restore the stored choice, or detect reduced motion / a slow frame rate
+    initPerformanceMode();
+  }, []);
+
+  return (
+    <MotionButton
+      whileHover={{ scale: 1.05 }}
+      whileTap={{ scale: 0.95 }}
+      onClick={() => setPerformanceMode(!performanceMode)}
+      className={`p-2 rounded-lg glass-effect hover:bg-white/20 dark:hover:bg-black/20 transition-colors ${
+        performanceMode ? 'text-green-600 dark:text-green-400' : 'text-gray-500 dark:text-gray-400'
+      }`}
+      aria-label="Toggle performance mode"
+      aria-pressed={performanceMode}
+      title={performanceMode ? 'Performance mode on: animations and blur off' : 'Performance mode off'}
+    >
+      <Gauge className="w-5 h-5" />
+    </MotionButton>
+  );
+}
@@ -0,0 +1,116 @@
+'use client';
+
+import { memo } from 'react';
+import { AreaChart, Area, XAxis, YAxis, CartesianGrid, Tooltip, ResponsiveContainer } from 'recharts';
+import { MotionDiv } from './Motion';
+import { TrendingUp } from 'lucide-react';
+import type { RollupPoint } from '@/lib/rollups';
+import { usePerformanceMode } from '@/lib/performanceMode';
+import { useRenderCount } from '@/lib/useRenderCount';
+import { CanvasChart, type CanvasSeries } from './CanvasChart';
+import { CANVAS_POINT_THRESHOLD, ChartTooltip, formatDollars } from './ChartTooltip';
+
+const DAY_RANGES = [
+  { days: 1, label: '1d' },
+  { days: 7, label: '7d' },
+  { days: 30, label: '30d' },
+  { days: 90, label: '90d' },
+  { days: 365, label: '1y' },
+  { days: 730, label: '2y' },
+];
+
+// Canvas series mirroring the Recharts <Area> below
+const REVENUE_SERIES: CanvasSeries<RollupPoint>[] = [{ key: 'revenue', color: '#3B82F6' }];
+
+// Revenue Trend Chart
+interface RevenueTrendCardProps {
+  data: RollupPoint[];
+  rangeDays: number;
+  onRangeChange: (days: number) => void;
+  formatBucket: (value: string) => string;
+  onResize: (width: number) => void;
+}
+
+export const RevenueTrendCard = memo(function RevenueTrendCard({
+  data,
+  rangeDays,
+  onRangeChange,
+  formatBucket,
+  onResize,
+}: RevenueTrendCardProps) {
+  useRenderCount('RevenueTrendCard');
+  const performanceMode = usePerformanceMode();
+
+  return (
+    <MotionDiv
+      initial={{ opacity: 0, y: 20 }}
+      animate={{ opacity: 1, y: 0 }}
+      transition={{ duration: 0.3, delay: 0.1 }}
+      className="glass-effect rounded-xl p-6"
+    >
+      <div className="flex items-center justify-between mb-4">
+        <div className="flex items-center space-x-2">
+          <TrendingUp className="w-5 h-5 text-blue-600" />
+          <h3 className="text-lg font-semibold text-gray-900 dark:text-white">
+            Revenue Trend
+          </h3>
+        </div>
+        <div className="flex items-center space-x-1">
+          {DAY_RANGES.map(({ days, label }) => (
+            <button
+              key={days}
+              onClick={() => onRangeChange(days)}
+              className={`px-2 py-1 text-xs rounded-md transition-colors ${
+                rangeDays === days
+                  ? 'bg-blue-600 text-white'
+                  : 'text-gray-600 dark:text-gray-400 hover:bg-gray-100 dark:hover:bg-gray-700'
+              }`}
+            >
+              {label}
+            </button>
+          ))}
+        </div>
+      </div>
+      {data.length > CANVAS_POINT_THRESHOLD ? (
+        <CanvasChart
+          kind="area"
+          data={data}
+          xKey="date"
+          series={REVENUE_SERIES}
+          height={250}
+          tooltip={ChartTooltip}
+          formatX={formatBucket}
+          formatY={formatDollars}
+          onResize={onResize}
+        />
+      ) : (
+        <ResponsiveContainer width="100%" height={250} onResize={onResize}>
+          <AreaChart data={data}>
+            <defs>
+              <linearGradient id="revenueGradient" x1="0" y1="0" x2="0" y2="1">
+                <stop offset="5%" stopColor="#3B82F6" stopOpacity={0.3}/>
+                <stop offset="95%" stopColor="#3B82F6" stopOpacity={0}/>
+              </linearGradient>
+            </defs>
+            <CartesianGrid strokeDasharray="3 3" opacity={0.3} />
+            <XAxis 
+              dataKey="date" 
+              tick={{ fontSize: 12 }}
+              tickFormatter={formatBucket}
+            />
+            <YAxis tick={{ fontSize: 12 }} tickFormatter={formatDollars} />
+            <Tooltip content={<ChartTooltip />} />
+            <Area
+              type="monotone"
+              dataKey="revenue"
+              stroke="#3B82F6"
+              strokeWidth={2}
+              fill="url(#revenueGradient)"
+              isAnimationActive={!performanceMode}
+            />
+          </AreaChart>
+        </ResponsiveContainer>
+      )}
+    </MotionDiv>
+  );
+});
@@ -1,7 +1,6 @@
 'use client';
 
 import { useState } from 'react';
-import { motion } from 'framer-motion';
 import {
   BarChart3,
   Users,
@@ -14,6 +13,8 @@ import {
   DollarSign,
 } from 'lucide-react';
 import { ThemeToggle } from './ThemeToggle';
+import { PerformanceToggle } from './PerformanceToggle';
+import { MotionDiv } from './Motion';
 
 const navigation = [
   { name: 'Dashboard', icon: Home, current: true },
@@ -45,7 +46,7 @@ export function Sidebar({ children }: SidebarProps) {
       )}
 
       {/* Sidebar */}
-      <motion.div
+      <MotionDiv
         initial={false}
         animate={{
           x: sidebarOpen ? 0 : '-100%',
@@ -98,14 +99,17 @@ export function Sidebar({ children }: SidebarProps) {
               <div className="text-sm text-gray-600 dark:text-gray-400">
                 Theme
               </div>
-              <ThemeToggle />
+              <div className="flex items-center space-x-2">
+                <PerformanceToggle />
+                <ThemeToggle />
+              </div>
             </div>
             <div className="mt-4 text-xs text-gray-500 dark:text-gray-400">
               © 2025 ADmyBRAND Insights
             </div>
           </div>
         </div>
-      </motion.div>
+      </MotionDiv>
 
       {/* Main content */}
       <div className="flex-1 flex flex-col overflow-hidden">
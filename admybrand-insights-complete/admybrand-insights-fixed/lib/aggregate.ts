@@ -0,0 +1,330 @@
+import type { MetricData } from '@/data/mockData';
+
+// Optional row attributes besides campaign, each dictionary-encoded like it
+export type AttributeDimension = 'channel' | 'region' | 'device' | 'creative';
+
+export const ATTRIBUTE_DIMENSIONS: AttributeDimension[] = ['channel', 'region', 'device', 'creative'];
+
+// Code 0 of every attribute dictionary, for rows without a value
+export const UNSET_DIMENSION_VALUE = '(not set)';
+
+// One dictionary-encoded attribute: codes[i] indexes into `values`
+export interface DimensionColumn {
+  codes: Uint16Array;
+  values: string[];
+}
+
+// Columnar layout of MetricData rows: one typed array per measure plus
+// dictionary-encoded campaign and date columns (codes index into `campaigns` / `dates`).
+// Attributes only get a column when the data carries them
+export interface MetricColumns {
+  length: number;
+  revenue: Float64Array;
+  users: Int32Array;
+  conversions: Int32Array;
+  campaign: Uint32Array;
+  date: Uint32Array;
+  campaigns: string[];
+  dates: string[];
+  dimensions: Partial<Record<AttributeDimension, DimensionColumn>>;
+}
+
+export interface MetricTotals {
+  revenue: number;
+  users: number;
+  conversions: number;
+}
+
+export interface CampaignTotals extends MetricTotals {
+  campaign: string;
+}
+
+export interface DailyTotals extends MetricTotals {
+  date: string;
+}
+
+export interface SummaryMetrics {
+  totalRevenue: number;
+  totalUsers: number;
+  totalConversions: number;
+  averageOrderValue: number;
+  conversionRate: number;
+}
+
+// Per-campaign daily sums in a compact, JSON-friendly layout: the
+// [revenue, users, conversions] of day k and campaign c start at
+// values[(k * campaigns.length + c) * 3]
+export interface CampaignSeries {
+  days: string[];
+  campaigns: string[];
+  values: number[];
+}
+
+export interface MetricAggregates {
+  totals: MetricTotals;
+  byCampaign: CampaignTotals[];
+  byDate: DailyTotals[];
+  averageOrderValue: number;
+  conversionRate: number;
+}
+
+// Look up (or assign) the dictionary code for a value
+function encode(dictionary: string[], index: Map<string, number>, value: string): number {
+  let code = index.get(value);
+  if (code === undefined) {
+    code = dictionary.length;
+    index.set(value, code);
+    dictionary.push(value);
+  }
+  return code;
+}
+
+// Convert row objects into typed-array columns
+export function toColumns(rows: MetricData[]): MetricColumns {
+  const length = rows.length;
+  const columns: MetricColumns = {
+    length,
+    revenue: new Float64Array(length),
+    users: new Int32Array(length),
+    conversions: new Int32Array(length),
+    campaign: new Uint32Array(length),
+    date: new Uint32Array(length),
+    campaigns: [],
+    dates: [],
+    dimensions: {},
+  };
+  const campaignIndex = new Map<string, number>();
+  const dateIndex = new Map<string, number>();
+  const attributeIndexes: Partial<Record<AttributeDimension, Map<string, number>>> = {};
+
+  for (let i = 0; i < length; i++) {
+    const row = rows[i];
+    columns.revenue[i] = row.revenue;
+    columns.users[i] = row.users;
+    columns.conversions[i] = row.conversions;
+    columns.campaign[i] = encode(columns.campaigns, campaignIndex, row.campaign);
+    columns.date[i] = encode(columns.dates, dateIndex, row.date);
+
+    for (let a = 0; a < ATTRIBUTE_DIMENSIONS.length; a++) {
+      const dimension = ATTRIBUTE_DIMENSIONS[a];
+      const value = row[dimension];
+      if (value === undefined) continue;
+
+      // Created on first use; earlier rows keep code 0, the unset value
+      let column = columns.dimensions[dimension];
+      let index = attributeIndexes[dimension];
+      if (!column || !index) {
+        column = { codes: new Uint16Array(length), values: [UNSET_DIMENSION_VALUE] };
+        index = new Map([[UNSET_DIMENSION_VALUE, 0]]);
+        columns.dimensions[dimension] = column;
+        attributeIndexes[dimension] = index;
+      }
+      const code = encode(column.values, index, value);
+      if (code > 0xffff) throw new RangeError(`More than 65536 distinct ${dimension} values`);
+      column.codes[i] = code;
+    }
+  }
+
+  return columns;
+}
+
+function ratio(numerator: number, denominator: number): number {
+  return denominator === 0 ? 0 : numerator / denominator;
+}
+
+// Summary card values derived from running totals
+export function summarize(totals: MetricTotals): SummaryMetrics {
+  return {
+    totalRevenue: totals.revenue,
+    totalUsers: totals.users,
+    totalConversions: totals.conversions,
+    averageOrderValue: ratio(totals.revenue, totals.conversions),
+    conversionRate: ratio(totals.conversions, totals.users) * 100,
+  };
+}
+
+// Unpack interleaved [revenue, users, conversions] group sums
+function unpackGroups<K extends string>(sums: Float64Array, keys: string[], keyName: K) {
+  return keys.map((key, code) => ({
+    [keyName]: key,
+    revenue: sums[code * 3],
+    users: sums[code * 3 + 1],
+    conversions: sums[code * 3 + 2],
+  })) as (MetricTotals & Record<K, string>)[];
+}
+
+// Compute totals, per-campaign and per-date groups in a single scan
+export function aggregateColumns(columns: MetricColumns): MetricAggregates {
+  const { revenue, users, conversions, campaign, date } = columns;
+  const campaignSums = new Float64Array(columns.campaigns.length * 3);
+  const dateSums = new Float64Array(columns.dates.length * 3);
+  let totalRevenue = 0;
+  let totalUsers = 0;
+  let totalConversions = 0;
+
+  for (let i = 0; i < columns.length; i++) {
+    const r = revenue[i];
+    const u = users[i];
+    const c = conversions[i];
+    totalRevenue += r;
+    totalUsers += u;
+    totalConversions += c;
+
+    const g = campaign[i] * 3;
+    campaignSums[g] += r;
+    campaignSums[g + 1] += u;
+    campaignSums[g + 2] += c;
+
+    const d = date[i] * 3;
+    dateSums[d] += r;
+    dateSums[d + 1] += u;
+    dateSums[d + 2] += c;
+  }
+
+  return {
+    totals: { revenue: totalRevenue, users: totalUsers, conversions: totalConversions },
+    byCampaign: unpackGroups(campaignSums, columns.campaigns, 'campaign'),
+    byDate: unpackGroups(dateSums, columns.dates, 'date'),
+    averageOrderValue: ratio(totalRevenue, totalConversions),
+    conversionRate: ratio(totalConversions, totalUsers) * 100,
+  };
+}
+
+// Date-ordered index over a column set: row ids grouped by day, days ascending.
+// Rows of day k are rows[offsets[k]] .. rows[offsets[k + 1] - 1]
+export interface DailyIndex {
+  columns: MetricColumns;
+  days: string[];
+  offsets: Uint32Array;
+  rows: Uint32Array;
+}
+
+// Build the daily index with a counting sort over the date codes
+export function buildDailyIndex(columns: MetricColumns): DailyIndex {
+  const { dates, date } = columns;
+  const order = dates.map((_, code) => code).sort((a, b) => (dates[a] < dates[b] ? -1 : 1));
+  const rank = new Uint32Array(dates.length);
+  order.forEach((code, k) => {
+    rank[code] = k;
+  });
+
+  const offsets = new Uint32Array(order.length + 1);
+  for (let i = 0; i < columns.length; i++) {
+    offsets[rank[date[i]] + 1]++;
+  }
+  for (let k = 0; k < order.length; k++) {
+    offsets[k + 1] += offsets[k];
+  }
+
+  const cursor = offsets.slice(0, order.length);
+  const rows = new Uint32Array(columns.length);
+  for (let i = 0; i < columns.length; i++) {
+    rows[cursor[rank[date[i]]]++] = i;
+  }
+
+  return { columns, days: order.map(code => dates[code]), offsets, rows };
+}
+
+// Daily totals for the last `days` days; only rows inside the window are scanned
+export function queryLastDays(index: DailyIndex, days: number): DailyTotals[] {
+  const { columns, offsets, rows } = index;
+  const start = Math.max(0, index.days.length - days);
+  const result: DailyTotals[] = [];
+
+  for (let k = start; k < index.days.length; k++) {
+    let revenue = 0;
+    let users = 0;
+    let conversions = 0;
+    for (let j = offsets[k]; j < offsets[k + 1]; j++) {
+      const i = rows[j];
+      revenue += columns.revenue[i];
+      users += columns.users[i];
+      conversions += columns.conversions[i];
+    }
+    result.push({ date: index.days[k], revenue, users, conversions });
+  }
+
+  return result;
+}
+
+// Positions [start, end) of the index's days within the inclusive ISO date range
+export function dayRange(index: DailyIndex, from?: string, to?: string): [number, number] {
+  const lowerBound = (date: string, inclusive: boolean) => {
+    let low = 0;
+    let high = index.days.length;
+    while (low < high) {
+      const mid = (low + high) >>> 1;
+      if (index.days[mid] < date || (inclusive && index.days[mid] === date)) low = mid + 1;
+      else high = mid;
+    }
+    return low;
+  };
+
+  const start = from === undefined ? 0 : lowerBound(from, false);
+  const end = to === undefined ? index.days.length : lowerBound(to, true);
+  return [start, Math.max(start, end)];
+}
+
+// Totals, per-campaign and per-day groups over days [start, end) of the index.
+// Only rows inside the range are scanned
+export function aggregateDays(index: DailyIndex, start: number, end: number): MetricAggregates {
+  const { columns, offsets, rows } = index;
+  const campaignSums = new Float64Array(columns.campaigns.length * 3);
+  const byDate: DailyTotals[] = [];
+  let totalRevenue = 0;
+  let totalUsers = 0;
+  let totalConversions = 0;
+
+  for (let k = start; k < end; k++) {
+    let revenue = 0;
+    let users = 0;
+    let conversions = 0;
+    for (let j = offsets[k]; j < offsets[k + 1]; j++) {
+      const i = rows[j];
+      const r = columns.revenue[i];
+      const u = columns.users[i];
+      const c = columns.conversions[i];
+      revenue += r;
+      users += u;
+      conversions += c;
+
+      const g = columns.campaign[i] * 3;
+      campaignSums[g] += r;
+      campaignSums[g + 1] += u;
+      campaignSums[g + 2] += c;
+    }
+    byDate.push({ date: index.days[k], revenue, users, conversions });
+    totalRevenue += revenue;
+    totalUsers += users;
+    totalConversions += conversions;
+  }
+
+  return {
+    totals: { revenue: totalRevenue, users: totalUsers, conversions: totalConversions },
+    byCampaign: unpackGroups(campaignSums, columns.campaigns, 'campaign'),
+    byDate,
+    averageOrderValue: ratio(totalRevenue, totalConversions),
+    conversionRate: ratio(totalConversions, totalUsers) * 100,
+  };
+}
+
+// Per-campaign sums for each of days [start, end) of the index
+export function campaignSeries(index: DailyIndex, start: number, end: number): CampaignSeries {
+  const { columns, offsets, rows } = index;
+  const stride = columns.campaigns.length * 3;
+  const values = new Array<number>((end - start) * stride);
+  for (let v = 0; v < values.length; v++) values[v] = 0;
+
+  for (let k = start; k < end; k++) {
+    const base = (k - start) * stride;
+    for (let j = offsets[k]; j < offsets[k + 1]; j++) {
+      const i = rows[j];
+      const g = base + columns.campaign[i] * 3;
+      values[g] += columns.revenue[i];
+      values[g + 1] += columns.users[i];
+      values[g + 2] += columns.conversions[i];
+    }
+  }
+
+  return { days: index.days.slice(start, end), campaigns: columns.campaigns.slice(), values };
+}
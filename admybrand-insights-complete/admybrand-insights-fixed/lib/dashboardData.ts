@@ -0,0 +1,348 @@
+// Server-side data layer: raw rows stay on the server and are reduced to the
+// compact aggregates the dashboard renders. Imports node modules, so only
+// server components and route handlers may import it.
+import { createHash } from 'crypto';
+import { access, readFile } from 'fs/promises';
+import path from 'path';
+import type { CampaignData } from '@/data/mockData';
+import { generateMetricRow } from '@/data/generators';
+import {
+  aggregateDays,
+  buildDailyIndex,
+  campaignSeries,
+  dayRange,
+  summarize,
+  type CampaignSeries,
+  type DailyIndex,
+  type MetricTotals,
+  type SummaryMetrics,
+} from './aggregate';
+import { groupBy, type Dimension, type DimensionFilter, type GroupTotals } from './dimensions';
+import { decodeFixture, type FixtureManifest } from './fixtures';
+import { encodeRowDelta, formatCursor, type RowCursor, type RowDelta } from './rowDelta';
+import { createRowLog, type RowLog } from './rowLog';
+
+export const DEFAULT_TENANT = 'default';
+// Enough days for the widest chart range
+export const DEFAULT_SNAPSHOT_DAYS = 730;
+
+export interface DashboardQuery {
+  tenant?: string;
+  // Inclusive ISO dates; `days` counts back from the newest day when `from` is unset
+  from?: string;
+  to?: string;
+  days?: number;
+}
+
+// Everything the client renders, independent of the number of raw rows
+export interface DashboardSnapshot {
+  tenant: string;
+  range: { from: string | null; to: string | null };
+  totals: MetricTotals;
+  summary: SummaryMetrics;
+  campaigns: CampaignData[];
+  // Per-campaign daily sums; the client rolls them up into chart buckets
+  series: CampaignSeries;
+  // Changes whenever the tenant's rows do; clients drop cached copies of other versions
+  datasetVersion: string;
+  // Position of the tenant's row log when the snapshot was taken; live rows
+  // are polled from here, so none appended in between are missed
+  rowCursor: string;
+  generatedAt: string;
+}
+
+// The headline numbers alone; cheaper than a snapshot, so the metric cards
+// can render before the chart series are ready
+export interface DashboardSummary {
+  tenant: string;
+  range: { from: string | null; to: string | null };
+  totals: MetricTotals;
+  summary: SummaryMetrics;
+  datasetVersion: string;
+  generatedAt: string;
+}
+
+export interface BreakdownQuery extends DashboardQuery {
+  // Dimensions to group by, e.g. ['region', 'device']
+  by: Dimension[];
+  // Drill-down filter, e.g. { campaign: 'Search' }
+  where?: DimensionFilter;
+}
+
+// Totals per dimension combination, highest revenue first
+export interface DashboardBreakdown {
+  tenant: string;
+  range: { from: string | null; to: string | null };
+  by: Dimension[];
+  where: DimensionFilter;
+  groups: GroupTotals[];
+  generatedAt: string;
+}
+
+interface TenantDataset {
+  version: string;
+  index: DailyIndex;
+  // Per-campaign CTR and the cost/revenue pair its cost ratio derives from
+  rates: Map<string, { ctr: number; cost: number; revenue: number }>;
+}
+
+const SNAPSHOT_TTL_MS = 60_000;
+// The stand-in row feed adds one row per campaign every tick, and at most
+// MAX_CATCH_UP_TICKS of them for a tenant nobody polled for a while
+const LIVE_TICK_MS = 5000;
+const MAX_CATCH_UP_TICKS = 60;
+const MAX_CACHED_SNAPSHOTS = 256;
+const FIXTURE_DIR = path.join(process.cwd(), 'public', 'fixtures');
+const TENANT_NAME = /^[a-z0-9][a-z0-9._-]*$/;
+
+const datasets = new Map<string, Promise<TenantDataset | null>>();
+type CachedResult = DashboardSnapshot | DashboardSummary | DashboardBreakdown;
+
+const snapshots = new Map<string, { snapshot: CachedResult; expires: number }>();
+const rowFeeds = new Map<string, { log: RowLog; tickedAt: number }>();
+
+function campaignRates(campaigns: CampaignData[]): TenantDataset['rates'] {
+  return new Map(
+    campaigns.map(({ campaign, ctr, cost, revenue }) => [campaign, { ctr, cost, revenue }])
+  );
+}
+
+function manifestPath(tenant: string): string {
+  return path.join(FIXTURE_DIR, `${tenant}.manifest.json`);
+}
+
+// Hash of a dataset's rows and campaign rates, so every server process holding
+// the same data reports the same version. The mock rows are random, so each
+// process that generates them (every restart, and each instance behind a load
+// balancer) has its own version, and browsers re-cache on reaching another one
+function contentVersion(parts: (ArrayBufferView | string)[]): string {
+  const hash = createHash('sha1');
+  parts.forEach(part =>
+    hash.update(typeof part === 'string' ? part : new Uint8Array(part.buffer, part.byteOffset, part.byteLength))
+  );
+  return hash.digest('hex').slice(0, 16);
+}
+
+// The built-in mock dataset serves the default tenant; any other tenant is a
+// fixture written by generate_fixtures.py as public/fixtures/<tenant>.manifest.json
+async function loadDataset(tenant: string): Promise<TenantDataset | null> {
+  if (tenant === DEFAULT_TENANT) {
+    const { metricColumns, campaignData } = await import('@/data/mockData');
+    const { revenue, users, conversions, campaign, date, campaigns, dates } = metricColumns;
+    return {
+      version: contentVersion([revenue, users, conversions, campaign, date, JSON.stringify([campaigns, dates, campaignData])]),
+      index: buildDailyIndex(metricColumns),
+      rates: campaignRates(campaignData),
+    };
+  }
+  if (!TENANT_NAME.test(tenant)) return null;
+
+  let manifestText: string;
+  let manifest: FixtureManifest;
+  try {
+    manifestText = await readFile(manifestPath(tenant), 'utf8');
+    manifest = JSON.parse(manifestText);
+  } catch {
+    return null;
+  }
+  if (!manifest.binary) return null;
+
+  const file = await readFile(path.join(FIXTURE_DIR, manifest.binary));
+  const buffer = file.buffer.slice(file.byteOffset, file.byteOffset + file.byteLength) as ArrayBuffer;
+  return {
+    version: contentVersion([file, manifestText]),
+    index: buildDailyIndex(decodeFixture(manifest, buffer)),
+    rates: campaignRates(manifest.campaignData),
+  };
+}
+
+// Whether the tenant exists, without loading its rows
+export async function hasTenant(tenant: string): Promise<boolean> {
+  if (tenant === DEFAULT_TENANT) return true;
+  if (!TENANT_NAME.test(tenant)) return false;
+  try {
+    await access(manifestPath(tenant));
+    return true;
+  } catch {
+    return false;
+  }
+}
+
+function getDataset(tenant: string): Promise<TenantDataset | null> {
+  let dataset = datasets.get(tenant);
+  if (!dataset) {
+    dataset = loadDataset(tenant);
+    datasets.set(tenant, dataset);
+  }
+  return dataset;
+}
+
+// Day positions [start, end) of the query's range
+function queryDays(index: DailyIndex, query: DashboardQuery): [number, number] {
+  const [start, end] = dayRange(index, query.from, query.to);
+  if (query.from !== undefined) return [start, end];
+  return [Math.max(start, end - (query.days ?? DEFAULT_SNAPSHOT_DAYS)), end];
+}
+
+function buildSnapshot(tenant: string, dataset: TenantDataset, query: DashboardQuery): DashboardSnapshot {
+  const { version, index, rates } = dataset;
+  const [start, end] = queryDays(index, query);
+  const aggregates = aggregateDays(index, start, end);
+  const campaigns = aggregates.byCampaign
+    .filter(({ users }) => users > 0)
+    .map(({ campaign, revenue, users, conversions }) => {
+      const rate = rates.get(campaign);
+      const cost = rate && rate.revenue !== 0 ? Math.floor((revenue * rate.cost) / rate.revenue) : 0;
+      return { campaign, revenue, users, conversions, ctr: rate ? rate.ctr : 0, cost };
+    });
+
+  return {
+    tenant,
+    range: { from: index.days[start] ?? null, to: index.days[end - 1] ?? null },
+    totals: aggregates.totals,
+    summary: summarize(aggregates.totals),
+    campaigns,
+    series: campaignSeries(index, start, end),
+    datasetVersion: version,
+    rowCursor: formatCursor(rowFeed(tenant, dataset).cursor()),
+    generatedAt: new Date().toISOString(),
+  };
+}
+
+function buildSummary(tenant: string, { version, index }: TenantDataset, query: DashboardQuery): DashboardSummary {
+  const [start, end] = queryDays(index, query);
+  const { totals } = aggregateDays(index, start, end);
+  return {
+    tenant,
+    range: { from: index.days[start] ?? null, to: index.days[end - 1] ?? null },
+    totals,
+    summary: summarize(totals),
+    datasetVersion: version,
+    generatedAt: new Date().toISOString(),
+  };
+}
+
+function buildBreakdown(tenant: string, { index }: TenantDataset, query: BreakdownQuery): DashboardBreakdown {
+  const [start, end] = queryDays(index, query);
+  const where = query.where ?? {};
+  const groups = groupBy(index.columns, query.by, {
+    where,
+    rows: index.rows.subarray(index.offsets[start], index.offsets[end]),
+  });
+  groups.sort((a, b) => b.revenue - a.revenue);
+
+  return {
+    tenant,
+    range: { from: index.days[start] ?? null, to: index.days[end - 1] ?? null },
+    by: query.by,
+    where,
+    groups,
+    generatedAt: new Date().toISOString(),
+  };
+}
+
+// The tenant's row log, first appended with the rows of the ticks elapsed
+// since it was last read. The log is a local stand-in for a real event store:
+// rows are simulated on demand, so no timer runs on the server
+function rowFeed(tenant: string, dataset: TenantDataset): RowLog {
+  const now = Date.now();
+  let feed = rowFeeds.get(tenant);
+  if (!feed) {
+    feed = { log: createRowLog(), tickedAt: now };
+    rowFeeds.set(tenant, feed);
+  }
+  const ticks = Math.floor((now - feed.tickedAt) / LIVE_TICK_MS);
+  if (ticks > 0) {
+    feed.tickedAt += ticks * LIVE_TICK_MS;
+    const date = new Date(now).toISOString().slice(0, 10);
+    const { campaigns } = dataset.index.columns;
+    for (let tick = Math.max(0, ticks - MAX_CATCH_UP_TICKS); tick < ticks; tick++) {
+      feed.log.append(campaigns.map(campaign => generateMetricRow(date, campaign)));
+    }
+  }
+  return feed.log;
+}
+
+// Cached per key for SNAPSHOT_TTL_MS; the least recently used entries are
+// dropped beyond MAX_CACHED_SNAPSHOTS. Null for an unknown tenant
+async function cachedSnapshot<T extends CachedResult>(
+  tenant: string,
+  key: string,
+  build: (dataset: TenantDataset) => T
+): Promise<T | null> {
+  const now = Date.now();
+  const cached = snapshots.get(key);
+  if (cached && cached.expires > now) {
+    snapshots.delete(key);
+    snapshots.set(key, cached);
+    return cached.snapshot as T;
+  }
+
+  const dataset = await getDataset(tenant);
+  if (!dataset) {
+    datasets.delete(tenant);
+    return null;
+  }
+
+  // Concurrent requests for the same key (e.g. two streamed sections) all
+  // waited on the dataset; only the first builds the result
+  const built = snapshots.get(key);
+  if (built && built.expires > Date.now()) return built.snapshot as T;
+
+  const snapshot = build(dataset);
+  snapshots.delete(key);
+  snapshots.set(key, { snapshot, expires: now + SNAPSHOT_TTL_MS });
+  if (snapshots.size > MAX_CACHED_SNAPSHOTS) {
+    snapshots.delete(snapshots.keys().next().value as string);
+  }
+  return snapshot;
+}
+
+// Aggregated dashboard data for a tenant and date range, or null for an
+// unknown tenant
+export function getDashboardSnapshot(query: DashboardQuery = {}): Promise<DashboardSnapshot | null> {
+  const tenant = query.tenant ?? DEFAULT_TENANT;
+  const key = JSON.stringify([tenant, query.from ?? null, query.to ?? null, query.days ?? null]);
+  return cachedSnapshot(tenant, key, dataset => buildSnapshot(tenant, dataset, query));
+}
+
+// Totals and summary metrics for a tenant and date range, or null for an
+// unknown tenant
+export function getDashboardSummary(query: DashboardQuery = {}): Promise<DashboardSummary | null> {
+  const tenant = query.tenant ?? DEFAULT_TENANT;
+  const key = JSON.stringify(['summary', tenant, query.from ?? null, query.to ?? null, query.days ?? null]);
+  return cachedSnapshot(tenant, key, dataset => buildSummary(tenant, dataset, query));
+}
+
+// Totals grouped by any combination of dimensions within a date range, for
+// drill-down views; null for an unknown tenant
+export function getDashboardBreakdown(query: BreakdownQuery): Promise<DashboardBreakdown | null> {
+  const tenant = query.tenant ?? DEFAULT_TENANT;
+  const where = query.where ?? {};
+  const filter = Object.keys(where)
+    .sort()
+    .map(dimension => [dimension, where[dimension as Dimension]]);
+  const key = JSON.stringify([
+    'breakdown',
+    tenant,
+    query.from ?? null,
+    query.to ?? null,
+    query.days ?? null,
+    query.by,
+    filter,
+  ]);
+  return cachedSnapshot(tenant, key, dataset => buildBreakdown(tenant, dataset, query));
+}
+
+// Rows appended to the tenant's row log after `since` (from now on when null),
+// encoded for /api/dashboard/rows; null for an unknown tenant
+export async function getRowDelta(tenant: string, since: RowCursor | null): Promise<RowDelta | null> {
+  const dataset = await getDataset(tenant);
+  if (!dataset) {
+    datasets.delete(tenant);
+    return null;
+  }
+
+  const { rows, cursor, reset } = rowFeed(tenant, dataset).read(since);
+  return encodeRowDelta(rows, cursor, reset);
+}
@@ -0,0 +1,178 @@
+import {
+  ATTRIBUTE_DIMENSIONS,
+  UNSET_DIMENSION_VALUE,
+  type AttributeDimension,
+  type MetricColumns,
+  type MetricTotals,
+} from './aggregate';
+
+export type Dimension = 'campaign' | AttributeDimension;
+
+export const DIMENSIONS: Dimension[] = ['campaign', ...ATTRIBUTE_DIMENSIONS];
+
+// Dimension values to keep, e.g. { campaign: 'Search', region: 'Europe' } to
+// drill into one campaign's European rows
+export type DimensionFilter = Partial<Record<Dimension, string>>;
+
+export interface GroupByOptions {
+  where?: DimensionFilter;
+  // Only scan these row ids, e.g. one date range of a DailyIndex
+  rows?: ArrayLike<number>;
+}
+
+export interface GroupTotals extends MetricTotals {
+  // The group's value for each requested dimension
+  key: DimensionFilter;
+  rows: number;
+}
+
+// Above this many possible groups the sums are kept sparse
+const DENSE_GROUP_LIMIT = 1 << 20;
+
+// Codes and dictionary of a dimension. A missing attribute reads as a single
+// unset value, so it can still be grouped or filtered on
+export function dimensionColumn(
+  columns: MetricColumns,
+  dimension: Dimension
+): { codes: ArrayLike<number> | null; values: string[] } {
+  if (dimension === 'campaign') return { codes: columns.campaign, values: columns.campaigns };
+  const column = columns.dimensions[dimension];
+  return column ?? { codes: null, values: [UNSET_DIMENSION_VALUE] };
+}
+
+export function isDimension(value: string): value is Dimension {
+  return (DIMENSIONS as string[]).indexOf(value) >= 0;
+}
+
+// Totals per combination of `dimensions`, e.g. ['campaign', 'device'].
+// Each row's group is a mixed-radix number built from its dictionary codes,
+// so the scan compares and hashes integers only; filter values are turned
+// into codes once up front. Past 2^53 possible groups that number would lose
+// precision and merge groups, so such scans key groups by their code tuple
+// instead. Groups without rows are left out, and the rest come in ascending
+// code order
+export function groupBy(
+  columns: MetricColumns,
+  dimensions: Dimension[],
+  { where = {}, rows }: GroupByOptions = {}
+): GroupTotals[] {
+  const grouped = dimensions.map(dimension => dimensionColumn(columns, dimension));
+  const strides: number[] = [];
+  let groupCount = 1;
+  grouped.forEach(({ values }) => {
+    strides.push(groupCount);
+    groupCount *= values.length;
+  });
+
+  const filterCodes: ArrayLike<number>[] = [];
+  const filterValues: number[] = [];
+  for (let d = 0; d < DIMENSIONS.length; d++) {
+    const dimension = DIMENSIONS[d];
+    const value = where[dimension];
+    if (value === undefined) continue;
+    const { codes, values } = dimensionColumn(columns, dimension);
+    const code = values.indexOf(value);
+    if (code < 0) return [];
+    // A missing attribute is unset on every row, which only its unset value matches
+    if (codes === null) continue;
+    filterCodes.push(codes);
+    filterValues.push(code);
+  }
+
+  // Dense: the group number is the slot. Sparse: slots are handed out in scan order
+  const dense = groupCount <= DENSE_GROUP_LIMIT;
+  const wide = groupCount > Number.MAX_SAFE_INTEGER;
+  const slotOf = new Map<number | string, number>();
+  const groupKeys: (number | string)[] = [];
+  let sums = new Float64Array(dense ? groupCount * 3 : 3 * 64);
+  let counts = new Uint32Array(dense ? groupCount : 64);
+
+  const length = rows ? rows.length : columns.length;
+  for (let j = 0; j < length; j++) {
+    const i = rows ? rows[j] : j;
+
+    let matches = true;
+    for (let f = 0; f < filterCodes.length; f++) {
+      if (filterCodes[f][i] !== filterValues[f]) {
+        matches = false;
+        break;
+      }
+    }
+    if (!matches) continue;
+
+    let group = 0;
+    let tuple = '';
+    for (let d = 0; d < grouped.length; d++) {
+      const codes = grouped[d].codes;
+      const code = codes === null ? 0 : codes[i];
+      if (wide) tuple += `${code},`;
+      else group += code * strides[d];
+    }
+
+    let slot = group;
+    if (!dense) {
+      const id = wide ? tuple : group;
+      const known = slotOf.get(id);
+      if (known === undefined) {
+        slot = groupKeys.length;
+        slotOf.set(id, slot);
+        groupKeys.push(id);
+        if (slot >= counts.length) {
+          const grownSums = new Float64Array(sums.length * 2);
+          grownSums.set(sums);
+          sums = grownSums;
+          const grownCounts = new Uint32Array(counts.length * 2);
+          grownCounts.set(counts);
+          counts = grownCounts;
+        }
+      } else {
+        slot = known;
+      }
+    }
+
+    sums[slot * 3] += columns.revenue[i];
+    sums[slot * 3 + 1] += columns.users[i];
+    sums[slot * 3 + 2] += columns.conversions[i];
+    counts[slot]++;
+  }
+
+  // Dictionary codes of a group, one per dimension
+  const codesOf = (group: number | string): number[] =>
+    typeof group === 'string'
+      ? group.split(',', grouped.length).map(Number)
+      : grouped.map(({ values }, d) => Math.floor(group / strides[d]) % values.length);
+
+  const toTotals = (codes: number[], slot: number): GroupTotals => {
+    const key: DimensionFilter = {};
+    grouped.forEach(({ values }, d) => {
+      key[dimensions[d]] = values[codes[d]];
+    });
+    return {
+      key,
+      revenue: sums[slot * 3],
+      users: sums[slot * 3 + 1],
+      conversions: sums[slot * 3 + 2],
+      rows: counts[slot],
+    };
+  };
+
+  const result: GroupTotals[] = [];
+  if (dense) {
+    for (let group = 0; group < groupCount; group++) {
+      if (counts[group] > 0) result.push(toTotals(codesOf(group), group));
+    }
+  } else {
+    // The last dimension is the most significant digit of the group number
+    const compare = (a: number[], b: number[]) => {
+      for (let d = a.length - 1; d >= 0; d--) {
+        if (a[d] !== b[d]) return a[d] - b[d];
+      }
+      return 0;
+    };
+    groupKeys
+      .map((group, slot) => ({ codes: codesOf(group), slot }))
+      .sort((a, b) => compare(a.codes, b.codes))
+      .forEach(({ codes, slot }) => result.push(toTotals(codes, slot)));
+  }
+  return result;
+}
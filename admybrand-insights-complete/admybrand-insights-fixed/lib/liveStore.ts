@@ -0,0 +1,262 @@
+import { useSyncExternalStore } from 'react';
+import type { MetricData, CampaignData } from '@/data/mockData';
+import {
+  summarize,
+  type CampaignSeries,
+  type MetricTotals,
+  type SummaryMetrics,
+} from '@/lib/aggregate';
+import { createRollupStore, type RollupSnapshot, type RollupStore } from '@/lib/rollups';
+
+// Each slice keeps its reference until an ingested row touches it, so
+// subscribers selecting one slice skip re-renders caused by the others
+export interface LiveState {
+  // False until the seed aggregates have been loaded
+  seeded: boolean;
+  // True while the seed is a cached copy that no fresh snapshot has confirmed yet
+  stale: boolean;
+  datasetVersion: string | null;
+  summary: SummaryMetrics;
+  campaigns: CampaignData[];
+  // Bumped whenever ingested rows change the rollup buckets
+  rollupVersion: number;
+  lastUpdated: Date;
+}
+
+export interface LiveStore {
+  getState(): LiveState;
+  subscribe(listener: () => void): () => void;
+  // Load the seed aggregates. Once seeded, later calls are ignored unless the
+  // store holds a restored seed: one of the same dataset version confirms it,
+  // any other replaces it. Subscribers are notified synchronously, so call it
+  // from an effect rather than during render
+  seed(seed: LiveSeed): void;
+  // Load a cached seed while unseeded, marked stale until `seed` revalidates it
+  restore(seed: LiveSeed): void;
+  // The last seed loaded by `seed` rather than `restore`, or null; a new
+  // reference means fresh data worth persisting
+  freshSeed(): LiveSeed | null;
+  // Row log cursor the store is current to: the seed's, then that of the last
+  // rows ingested. Null until known, e.g. for a restored seed
+  rowCursor(): string | null;
+  // Fold in live rows; `cursor` is the row log position they bring the store to
+  ingest(rows: MetricData[], cursor?: string): void;
+  recentRows(limit?: number): MetricData[];
+  // Time-bucketed sums for the charts; read it when `rollupVersion` changes
+  rollups: RollupStore;
+}
+
+// Seed aggregates, as served by the dashboard snapshot
+export interface LiveSeed {
+  totals: MetricTotals;
+  series: CampaignSeries;
+  campaigns: CampaignData[];
+  generatedAt?: string;
+  datasetVersion?: string;
+  rowCursor?: string;
+  // Buckets already built from `series`, e.g. by a cached copy; saves rebuilding them
+  rollups?: RollupSnapshot;
+}
+
+interface LiveStoreOptions {
+  // Omit to create the store before its data arrives and seed it later
+  seed?: LiveSeed;
+  capacity?: number;
+  // Rates used for campaigns that first appear in the live feed
+  campaignRates?: () => { ctr: number; costRatio: number };
+}
+
+// Create a store seeded from pre-aggregated totals that afterwards absorbs deltas
+// in O(rows ingested): totals, campaign sums and rollup buckets are updated in place.
+// Rows should only be ingested once the store is seeded
+export function createLiveStore({
+  seed: initialSeed,
+  capacity = 4096,
+  campaignRates = () => ({ ctr: 0, costRatio: 0 }),
+}: LiveStoreOptions = {}): LiveStore {
+  const totals: MetricTotals = { revenue: 0, users: 0, conversions: 0 };
+  const campaignPosition = new Map<string, number>();
+  const costRatios: number[] = [];
+  const rollups = createRollupStore();
+
+  let state: LiveState = {
+    seeded: false,
+    stale: false,
+    datasetVersion: null,
+    summary: summarize(totals),
+    campaigns: [],
+    rollupVersion: 0,
+    lastUpdated: new Date(),
+  };
+  const listeners = new Set<() => void>();
+  let freshSeed: LiveSeed | null = null;
+  let rowCursor: string | null = null;
+
+  // Replaces everything, including rows ingested on top of an earlier seed
+  const applySeed = (seed: LiveSeed, stale: boolean) => {
+    const { totals: seedTotals, series, campaigns, generatedAt, datasetVersion } = seed;
+    totals.revenue = seedTotals.revenue;
+    totals.users = seedTotals.users;
+    totals.conversions = seedTotals.conversions;
+    campaignPosition.clear();
+    costRatios.length = 0;
+    campaigns.forEach((campaign, position) => {
+      campaignPosition.set(campaign.campaign, position);
+      costRatios.push(campaign.revenue === 0 ? 0 : campaign.cost / campaign.revenue);
+    });
+    if (seed.rollups) {
+      rollups.load(seed.rollups);
+    } else {
+      rollups.clear();
+      rollups.addSeries(series);
+    }
+    ring.next = 0;
+    ring.size = 0;
+    rowCursor = seed.rowCursor ?? null;
+
+    state = {
+      seeded: true,
+      stale,
+      datasetVersion: datasetVersion ?? null,
+      summary: summarize(totals),
+      campaigns: campaigns.slice(),
+      rollupVersion: state.rollupVersion + 1,
+      lastUpdated: generatedAt ? new Date(generatedAt) : new Date(),
+    };
+  };
+
+  // Ring buffer of the most recent raw rows, oldest overwritten first
+  const ring = {
+    revenue: new Float64Array(capacity),
+    users: new Int32Array(capacity),
+    conversions: new Int32Array(capacity),
+    campaign: new Array<string>(capacity),
+    date: new Array<string>(capacity),
+    next: 0,
+    size: 0,
+  };
+  if (initialSeed) {
+    applySeed(initialSeed, false);
+    freshSeed = initialSeed;
+  }
+
+  const pushRow = (row: MetricData) => {
+    const slot = ring.next;
+    ring.revenue[slot] = row.revenue;
+    ring.users[slot] = row.users;
+    ring.conversions[slot] = row.conversions;
+    ring.campaign[slot] = row.campaign;
+    ring.date[slot] = row.date;
+    ring.next = (slot + 1) % capacity;
+    ring.size = Math.min(ring.size + 1, capacity);
+  };
+
+  // The first touch in a batch clones the entry; later rows mutate the clone
+  const addCampaign = (nextCampaigns: CampaignData[], touched: Set<number>, row: MetricData) => {
+    let position = campaignPosition.get(row.campaign);
+    if (position === undefined) {
+      const { ctr, costRatio } = campaignRates();
+      position = nextCampaigns.length;
+      campaignPosition.set(row.campaign, position);
+      costRatios.push(costRatio);
+      nextCampaigns.push({ campaign: row.campaign, revenue: 0, users: 0, conversions: 0, ctr, cost: 0 });
+      touched.add(position);
+    } else if (!touched.has(position)) {
+      nextCampaigns[position] = { ...nextCampaigns[position] };
+      touched.add(position);
+    }
+    const entry = nextCampaigns[position];
+    entry.revenue += row.revenue;
+    entry.users += row.users;
+    entry.conversions += row.conversions;
+    entry.cost = Math.floor(entry.revenue * costRatios[position]);
+  };
+
+  return {
+    getState: () => state,
+
+    subscribe(listener) {
+      listeners.add(listener);
+      return () => {
+        listeners.delete(listener);
+      };
+    },
+
+    seed(seed) {
+      if (state.seeded && !state.stale) return;
+      if (state.stale && seed.datasetVersion !== undefined && seed.datasetVersion === state.datasetVersion) {
+        state = { ...state, stale: false };
+        // Rows polled on top of the restored seed stay, and so does their cursor
+        rowCursor = rowCursor ?? seed.rowCursor ?? null;
+      } else {
+        applySeed(seed, false);
+        freshSeed = seed;
+      }
+      listeners.forEach(listener => listener());
+    },
+
+    freshSeed: () => freshSeed,
+
+    rowCursor: () => rowCursor,
+
+    restore(seed) {
+      if (state.seeded) return;
+      applySeed(seed, true);
+      listeners.forEach(listener => listener());
+    },
+
+    ingest(rows, cursor) {
+      if (cursor !== undefined) rowCursor = cursor;
+      if (rows.length === 0) return;
+      const nextCampaigns = state.campaigns.slice();
+      const touchedCampaigns = new Set<number>();
+
+      for (const row of rows) {
+        pushRow(row);
+        totals.revenue += row.revenue;
+        totals.users += row.users;
+        totals.conversions += row.conversions;
+        addCampaign(nextCampaigns, touchedCampaigns, row);
+      }
+      rollups.addRows(rows);
+
+      state = {
+        seeded: state.seeded,
+        stale: state.stale,
+        datasetVersion: state.datasetVersion,
+        summary: summarize(totals),
+        campaigns: nextCampaigns,
+        rollupVersion: state.rollupVersion + 1,
+        lastUpdated: new Date(),
+      };
+      listeners.forEach(listener => listener());
+    },
+
+    rollups,
+
+    recentRows(limit = ring.size) {
+      const count = Math.min(limit, ring.size);
+      const result: MetricData[] = [];
+      for (let k = 1; k <= count; k++) {
+        const slot = (ring.next - k + capacity) % capacity;
+        result.push({
+          date: ring.date[slot],
+          revenue: ring.revenue[slot],
+          users: ring.users[slot],
+          conversions: ring.conversions[slot],
+          campaign: ring.campaign[slot],
+        });
+      }
+      return result;
+    },
+  };
+}
+
+// Subscribe a component to one slice of the live store
+export function useLiveSlice<T>(store: LiveStore, selector: (state: LiveState) => T): T {
+  return useSyncExternalStore(
+    store.subscribe,
+    () => selector(store.getState()),
+    () => selector(store.getState())
+  );
+}
@@ -0,0 +1,50 @@
+import type { MetricData } from '@/data/mockData';
+import type { RowCursor } from './rowDelta';
+
+export interface RowLogRead {
+  rows: MetricData[];
+  cursor: RowCursor;
+  // The requested cursor could not be continued; see RowDelta.reset
+  reset: boolean;
+}
+
+export interface RowLog {
+  cursor(): RowCursor;
+  append(rows: MetricData[]): void;
+  // Rows appended after `since`, or from the current end when since is null
+  read(since: RowCursor | null): RowLogRead;
+}
+
+// Append-only log of a tenant's newest rows; the local stand-in for an event
+// store the dashboard would poll in production. Only the last `capacity` rows
+// are kept, so a client that falls further behind is told to reset.
+export function createRowLog(capacity = 20_000): RowLog {
+  const epoch = `${Date.now().toString(36)}${Math.floor(Math.random() * 1296).toString(36)}`;
+  const ring = new Array<MetricData>(capacity);
+  // Rows ever appended; row v (0-based) sits at ring[v % capacity]
+  let version = 0;
+
+  return {
+    cursor: () => ({ epoch, version }),
+
+    append(rows) {
+      rows.forEach(row => {
+        ring[version % capacity] = row;
+        version++;
+      });
+    },
+
+    read(since) {
+      const oldest = Math.max(0, version - capacity);
+      const cursor = { epoch, version };
+      if (since === null) return { rows: [], cursor, reset: false };
+      if (since.epoch !== epoch || since.version < oldest || since.version > version) {
+        return { rows: [], cursor, reset: true };
+      }
+
+      const rows: MetricData[] = [];
+      for (let v = since.version; v < version; v++) rows.push(ring[v % capacity]);
+      return { rows, cursor, reset: false };
+    },
+  };
+}
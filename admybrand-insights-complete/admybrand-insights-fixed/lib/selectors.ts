@@ -0,0 +1,73 @@
+import type { LiveState } from '@/lib/liveStore';
+import type { SummaryMetrics } from '@/lib/aggregate';
+import type { CampaignData } from '@/data/mockData';
+import { calculateGrowth } from '@/lib/utils';
+
+type Selector<S, R> = (state: S) => R;
+
+// Memoize a derivation on the identity of its inputs. The live store replaces
+// a slice only when ingested rows touch it, so each slice reference acts as
+// that slice's dataset version: the result keeps its reference (and memoized
+// consumers skip rendering) until an input actually changes
+export function createSelector<S, I extends unknown[], R>(
+  inputs: { [K in keyof I]: Selector<S, I[K]> },
+  compute: (...args: I) => R
+): Selector<S, R> {
+  let lastArgs: unknown[] | null = null;
+  let lastResult: R;
+
+  return state => {
+    const args = inputs.map(input => input(state));
+    if (lastArgs && args.every((arg, i) => arg === lastArgs![i])) return lastResult;
+    lastArgs = args;
+    lastResult = compute(...(args as I));
+    return lastResult;
+  };
+}
+
+export interface GrowthMetrics {
+  revenue: number;
+  users: number;
+  conversions: number;
+  conversionRate: number;
+}
+
+export interface CampaignChartRow {
+  name: string;
+  revenue: number;
+  users: number;
+  conversions: number;
+}
+
+export const selectSeeded = (state: LiveState) => state.seeded;
+export const selectStale = (state: LiveState) => state.stale;
+export const selectDatasetVersion = (state: LiveState) => state.datasetVersion;
+export const selectSummary = (state: LiveState) => state.summary;
+export const selectCampaigns = (state: LiveState) => state.campaigns;
+export const selectRollupVersion = (state: LiveState) => state.rollupVersion;
+export const selectLastUpdated = (state: LiveState) => state.lastUpdated;
+
+// Growth percentages against simulated previous-period values
+export function growthMetrics(summary: SummaryMetrics): GrowthMetrics {
+  return {
+    revenue: calculateGrowth(summary.totalRevenue, summary.totalRevenue * 0.9),
+    users: calculateGrowth(summary.totalUsers, summary.totalUsers * 0.85),
+    conversions: calculateGrowth(summary.totalConversions, summary.totalConversions * 0.95),
+    conversionRate: calculateGrowth(summary.conversionRate, summary.conversionRate * 0.88),
+  };
+}
+
+// Rows for the campaign bar and pie charts; Charts memoizes them on the campaigns slice
+export function campaignChartRows(campaigns: CampaignData[]): CampaignChartRow[] {
+  return campaigns.map(campaign => ({
+    name: campaign.campaign,
+    revenue: campaign.revenue,
+    users: campaign.users,
+    conversions: campaign.conversions,
+  }));
+}
+
+export const selectGrowthMetrics = createSelector<LiveState, [SummaryMetrics], GrowthMetrics>(
+  [selectSummary],
+  growthMetrics
+);
@@ -0,0 +1,281 @@
+import type { CampaignData } from '@/data/mockData';
+import type { MetricTotals } from '@/lib/aggregate';
+import type { DashboardQuery } from '@/lib/dashboardData';
+import type { LiveSeed } from '@/lib/liveStore';
+import { GRANULARITIES, type RollupSnapshot } from '@/lib/rollups';
+
+// Browser-side persistence of dashboard snapshots in IndexedDB, so a reload
+// renders the last seen aggregates at once while the server revalidates them
+// (see components/Dashboard.tsx). Each entry holds a snapshot's seed, with its
+// per-campaign daily series in a Float64Array, and the rollup buckets built
+// from it, so neither has to be fetched or recomputed before the first paint.
+//
+// Entries are keyed by (schema version, tenant, date range). Small metadata
+// records live apart from the payloads so eviction never reads a payload:
+// storing a tenant's snapshot drops its entries of any other dataset version,
+// then the least recently used entries beyond the byte budget. In the console:
+//
+//   __snapshotCache.usage()   // { entries: 2, bytes: 1843200 }
+//   __snapshotCache.clear()
+//
+// Every operation is best effort: where IndexedDB is unavailable or fails
+// (server rendering, some private windows, quota errors) reads miss and
+// writes are dropped.
+
+// Bump when the stored layout of LiveSeed or RollupSnapshot changes; entries
+// of other schema versions are never read and are dropped on the next write
+export const SNAPSHOT_SCHEMA_VERSION = 1;
+export const DEFAULT_CACHE_BUDGET_BYTES = 32 * 1024 * 1024;
+
+const DB_NAME = 'admybrand-insights';
+const DB_VERSION = 1;
+const ENTRIES = 'snapshotEntries';
+const PAYLOADS = 'snapshotPayloads';
+
+// The tenant is required so entries can be invalidated per tenant
+export type SnapshotCacheQuery = DashboardQuery & { tenant: string };
+
+interface SnapshotEntry {
+  key: string;
+  tenant: string;
+  schemaVersion: number;
+  datasetVersion: string;
+  bytes: number;
+  storedAt: number;
+  lastUsed: number;
+}
+
+interface SnapshotPayload {
+  key: string;
+  totals: MetricTotals;
+  campaigns: CampaignData[];
+  series: { days: string[]; campaigns: string[]; values: Float64Array };
+  generatedAt?: string;
+  rollups: RollupSnapshot;
+}
+
+export interface SnapshotCacheOptions {
+  budgetBytes?: number;
+  dbName?: string;
+}
+
+export interface SnapshotCache {
+  // The cached seed for the query, rollups included, or null; marks it recently used
+  get(query: SnapshotCacheQuery): Promise<LiveSeed | null>;
+  // Store a fresh seed and its buckets, then evict; seeds without a dataset version are skipped
+  put(query: SnapshotCacheQuery, seed: LiveSeed, rollups: RollupSnapshot): Promise<void>;
+  // Drop the tenant's entries of every dataset version except `keepVersion`
+  invalidate(tenant: string, keepVersion?: string): Promise<void>;
+  usage(): Promise<{ entries: number; bytes: number }>;
+  clear(): Promise<void>;
+}
+
+function snapshotKey({ tenant, from, to, days }: SnapshotCacheQuery): string {
+  return JSON.stringify([SNAPSHOT_SCHEMA_VERSION, tenant, from ?? null, to ?? null, days ?? null]);
+}
+
+function request<T>(req: IDBRequest<T>): Promise<T> {
+  return new Promise((resolve, reject) => {
+    req.onsuccess = () => resolve(req.result);
+    req.onerror = () => reject(req.error);
+  });
+}
+
+function completion(tx: IDBTransaction): Promise<void> {
+  return new Promise((resolve, reject) => {
+    tx.oncomplete = () => resolve();
+    tx.onerror = () => reject(tx.error);
+    tx.onabort = () => reject(tx.error);
+  });
+}
+
+// Typed arrays at their byte length, everything else at two bytes per JSON character
+function payloadBytes(payload: SnapshotPayload): number {
+  let bytes = payload.series.values.byteLength;
+  GRANULARITIES.forEach(granularity => {
+    const { keys, sums } = payload.rollups.levels[granularity];
+    bytes += keys.byteLength + sums.byteLength;
+  });
+  const { totals, campaigns, series, rollups } = payload;
+  return bytes + 2 * JSON.stringify([totals, campaigns, series.days, series.campaigns, rollups.campaigns]).length;
+}
+
+export function createSnapshotCache({
+  budgetBytes = DEFAULT_CACHE_BUDGET_BYTES,
+  dbName = DB_NAME,
+}: SnapshotCacheOptions = {}): SnapshotCache {
+  let opened: Promise<IDBDatabase | null> | null = null;
+
+  // Opened on first use; resolves to null where IndexedDB cannot be used
+  const open = (): Promise<IDBDatabase | null> => {
+    if (!opened) {
+      opened = new Promise<IDBDatabase | null>(resolve => {
+        if (typeof indexedDB === 'undefined') {
+          resolve(null);
+          return;
+        }
+        const req = indexedDB.open(dbName, DB_VERSION);
+        req.onupgradeneeded = () => {
+          const db = req.result;
+          if (!db.objectStoreNames.contains(ENTRIES)) db.createObjectStore(ENTRIES, { keyPath: 'key' });
+          if (!db.objectStoreNames.contains(PAYLOADS)) db.createObjectStore(PAYLOADS, { keyPath: 'key' });
+        };
+        req.onsuccess = () => {
+          const db = req.result;
+          // Let another tab upgrade the database; the next call reopens it
+          db.onversionchange = () => {
+            db.close();
+            opened = null;
+          };
+          resolve(db);
+        };
+        req.onerror = () => resolve(null);
+        req.onblocked = () => resolve(null);
+      });
+    }
+    return opened;
+  };
+
+  // Run `body` in one transaction over both stores; null when the cache is unusable
+  const transact = async <T>(
+    mode: IDBTransactionMode,
+    body: (entries: IDBObjectStore, payloads: IDBObjectStore) => Promise<T>
+  ): Promise<T | null> => {
+    try {
+      const db = await open();
+      if (!db) return null;
+      const tx = db.transaction([ENTRIES, PAYLOADS], mode);
+      const done = completion(tx);
+      const result = await body(tx.objectStore(ENTRIES), tx.objectStore(PAYLOADS));
+      await done;
+      return result;
+    } catch {
+      return null;
+    }
+  };
+
+  const remove = (entries: IDBObjectStore, payloads: IDBObjectStore, key: string) => {
+    entries.delete(key);
+    payloads.delete(key);
+  };
+
+  return {
+    async get(query) {
+      const key = snapshotKey(query);
+      return transact('readwrite', async (entries, payloads) => {
+        const entry: SnapshotEntry | undefined = await request(entries.get(key));
+        if (!entry) return null;
+        const payload: SnapshotPayload | undefined = await request(payloads.get(key));
+        if (!payload) {
+          entries.delete(key);
+          return null;
+        }
+        entries.put({ ...entry, lastUsed: Date.now() });
+
+        const { totals, campaigns, series, generatedAt, rollups } = payload;
+        return {
+          totals,
+          campaigns,
+          series: { days: series.days, campaigns: series.campaigns, values: Array.from(series.values) },
+          generatedAt,
+          datasetVersion: entry.datasetVersion,
+          rollups,
+        };
+      });
+    },
+
+    async put(query, seed, rollups) {
+      const { datasetVersion } = seed;
+      if (datasetVersion === undefined) return;
+      const key = snapshotKey(query);
+      const payload: SnapshotPayload = {
+        key,
+        totals: seed.totals,
+        campaigns: seed.campaigns,
+        series: {
+          days: seed.series.days,
+          campaigns: seed.series.campaigns,
+          values: Float64Array.from(seed.series.values),
+        },
+        generatedAt: seed.generatedAt,
+        rollups,
+      };
+      const bytes = payloadBytes(payload);
+      // A snapshot larger than the whole budget is not kept, nor does it evict others
+      const fits = bytes <= budgetBytes;
+      const now = Date.now();
+
+      await transact('readwrite', async (entries, payloads) => {
+        const existing: SnapshotEntry[] = await request(entries.getAll());
+        // Outdated entries go first, then the least recently used beyond the budget
+        let used = fits ? bytes : 0;
+        existing
+          .filter(entry => {
+            const outdated =
+              entry.key === key ||
+              entry.schemaVersion !== SNAPSHOT_SCHEMA_VERSION ||
+              (entry.tenant === query.tenant && entry.datasetVersion !== datasetVersion);
+            if (outdated) remove(entries, payloads, entry.key);
+            return !outdated;
+          })
+          .sort((a, b) => b.lastUsed - a.lastUsed)
+          .forEach(entry => {
+            used += entry.bytes;
+            if (used > budgetBytes) remove(entries, payloads, entry.key);
+          });
+
+        if (!fits) return;
+        const entry: SnapshotEntry = {
+          key,
+          tenant: query.tenant,
+          schemaVersion: SNAPSHOT_SCHEMA_VERSION,
+          datasetVersion,
+          bytes,
+          storedAt: now,
+          lastUsed: now,
+        };
+        entries.put(entry);
+        payloads.put(payload);
+      });
+    },
+
+    async invalidate(tenant, keepVersion) {
+      await transact('readwrite', async (entries, payloads) => {
+        const existing: SnapshotEntry[] = await request(entries.getAll());
+        existing.forEach(entry => {
+          if (entry.tenant === tenant && entry.datasetVersion !== keepVersion) {
+            remove(entries, payloads, entry.key);
+          }
+        });
+      });
+    },
+
+    async usage() {
+      const usage = await transact('readonly', async entries => {
+        const existing: SnapshotEntry[] = await request(entries.getAll());
+        return {
+          entries: existing.length,
+          bytes: existing.reduce((sum, entry) => sum + entry.bytes, 0),
+        };
+      });
+      return usage ?? { entries: 0, bytes: 0 };
+    },
+
+    async clear() {
+      await transact('readwrite', async (entries, payloads) => {
+        entries.clear();
+        payloads.clear();
+      });
+    },
+  };
+}
+
+// The cache the dashboard uses
+export const snapshotCache = createSnapshotCache();
+
+if (typeof window !== 'undefined') {
+  (window as unknown as { __snapshotCache: object }).__snapshotCache = {
+    usage: snapshotCache.usage,
+    clear: snapshotCache.clear,
+  };
+}
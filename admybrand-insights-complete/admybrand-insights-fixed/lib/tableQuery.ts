@@ -0,0 +1,155 @@
+import type { CampaignData } from '@/data/mockData';
+
+export type TableSortField = keyof CampaignData;
+export type TableSortDirection = 'asc' | 'desc';
+
+export interface TableQuery {
+  search: string;
+  minRevenue: number | null;
+  maxRevenue: number | null;
+  sortField: TableSortField;
+  sortDirection: TableSortDirection;
+  page: number;
+  pageSize: number;
+}
+
+export interface TableQueryResult {
+  // Row ids of the requested page, in display order
+  rows: Uint32Array;
+  // Number of rows matching the filters
+  total: number;
+}
+
+// Columnar copy of the campaign table. Numeric columns are backed by their own
+// ArrayBuffers so the whole table can be transferred to a worker without copying
+export interface TableColumns {
+  length: number;
+  campaigns: string[];
+  names: string[];
+  revenue: Float64Array;
+  users: Float64Array;
+  conversions: Float64Array;
+  ctr: Float64Array;
+  cost: Float64Array;
+}
+
+// Columns plus one ascending sort permutation (row ids) per column, built once
+// per dataset; descending order walks the same permutation backwards.
+// ties[k] is 1 when permutation entry k equals entry k - 1, so descending walks
+// can keep equal rows in their original order like a stable sort would
+export interface TableIndex {
+  columns: TableColumns;
+  permutations: Record<TableSortField, Uint32Array>;
+  ties: Record<TableSortField, Uint8Array>;
+}
+
+const NUMERIC_FIELDS = ['revenue', 'users', 'conversions', 'ctr', 'cost'] as const;
+
+export function encodeTable(data: CampaignData[]): TableColumns {
+  const length = data.length;
+  const columns: TableColumns = {
+    length,
+    campaigns: data.map(item => item.campaign),
+    names: data.map(item => item.campaign.toLowerCase()),
+    revenue: new Float64Array(length),
+    users: new Float64Array(length),
+    conversions: new Float64Array(length),
+    ctr: new Float64Array(length),
+    cost: new Float64Array(length),
+  };
+
+  data.forEach((item, i) => {
+    NUMERIC_FIELDS.forEach(field => {
+      columns[field][i] = item[field];
+    });
+  });
+
+  return columns;
+}
+
+export function tableTransferables(columns: TableColumns): ArrayBuffer[] {
+  return NUMERIC_FIELDS.map(field => columns[field].buffer as ArrayBuffer);
+}
+
+function identity(length: number): Uint32Array {
+  const rows = new Uint32Array(length);
+  for (let i = 0; i < length; i++) rows[i] = i;
+  return rows;
+}
+
+function markTies(permutation: Uint32Array, equal: (a: number, b: number) => boolean): Uint8Array {
+  const ties = new Uint8Array(permutation.length);
+  for (let k = 1; k < permutation.length; k++) {
+    ties[k] = equal(permutation[k - 1], permutation[k]) ? 1 : 0;
+  }
+  return ties;
+}
+
+// Precompute the sort permutations; campaign names are collated only here
+export function indexTable(columns: TableColumns): TableIndex {
+  const { campaigns } = columns;
+  const campaignOrder = identity(columns.length).sort((a, b) => campaigns[a].localeCompare(campaigns[b]));
+  const permutations = { campaign: campaignOrder } as Record<TableSortField, Uint32Array>;
+  const ties = {
+    campaign: markTies(campaignOrder, (a, b) => campaigns[a] === campaigns[b]),
+  } as Record<TableSortField, Uint8Array>;
+
+  NUMERIC_FIELDS.forEach(field => {
+    const values = columns[field];
+    permutations[field] = identity(columns.length).sort((a, b) => values[a] - values[b]);
+    ties[field] = markTies(permutations[field], (a, b) => values[a] === values[b]);
+  });
+
+  return { columns, permutations, ties };
+}
+
+// Bitmap (one bit per row) of the rows that pass the search and revenue filters
+export function buildFilterMask(columns: TableColumns, query: TableQuery): Uint32Array {
+  const needle = query.search.toLowerCase();
+  const { minRevenue, maxRevenue } = query;
+  const mask = new Uint32Array((columns.length + 31) >>> 5);
+
+  for (let i = 0; i < columns.length; i++) {
+    if (needle && !columns.names[i].includes(needle)) continue;
+    if (minRevenue !== null && columns.revenue[i] < minRevenue) continue;
+    if (maxRevenue !== null && columns.revenue[i] > maxRevenue) continue;
+    mask[i >>> 5] |= 1 << (i & 31);
+  }
+
+  return mask;
+}
+
+// Walk the sort permutation in the requested direction, keeping rows set in
+// the filter mask; only the visible page's row ids are collected. O(n), no sort
+export function runTableQuery(
+  index: TableIndex,
+  query: TableQuery,
+  mask: Uint32Array = buildFilterMask(index.columns, query)
+): TableQueryResult {
+  const permutation = index.permutations[query.sortField];
+  const ties = index.ties[query.sortField];
+  const start = (query.page - 1) * query.pageSize;
+  const end = start + query.pageSize;
+  const rows: number[] = [];
+  let total = 0;
+
+  const visit = (row: number) => {
+    if ((mask[row >>> 5] & (1 << (row & 31))) === 0) return;
+    if (total >= start && total < end) rows.push(row);
+    total++;
+  };
+
+  if (query.sortDirection === 'asc') {
+    for (let k = 0; k < permutation.length; k++) visit(permutation[k]);
+  } else {
+    // Step backwards one run of equal values at a time, visiting each run forwards
+    for (let last = permutation.length - 1; last >= 0; ) {
+      let first = last;
+      while (first > 0 && ties[first]) first--;
+      for (let k = first; k <= last; k++) visit(permutation[k]);
+      last = first - 1;
+    }
+  }
+
+  return { rows: Uint32Array.from(rows), total };
+}
@@ -0,0 +1,39 @@
+import { useEffect } from 'react';
+
+// Dashboard load milestones, in milliseconds since navigation start. Each is
+// recorded once per page load, when its section first mounts with data, both
+// as a `dashboard:<milestone>` performance mark (shown in the DevTools
+// performance panel) and in the browser console:
+//
+//   __dashboardTimings.get()   // { firstMetric: 212, charts: 230, table: 241 }
+export type LoadMilestone = 'firstMetric' | 'charts' | 'table';
+
+const timings: Partial<Record<LoadMilestone, number>> = {};
+const listeners = new Set<(milestone: LoadMilestone, ms: number) => void>();
+
+export function getLoadTimings(): Partial<Record<LoadMilestone, number>> {
+  return { ...timings };
+}
+
+// Be told about each milestone as it is recorded, e.g. to forward it to analytics
+export function onLoadTiming(listener: (milestone: LoadMilestone, ms: number) => void): () => void {
+  listeners.add(listener);
+  return () => {
+    listeners.delete(listener);
+  };
+}
+
+if (typeof window !== 'undefined') {
+  (window as unknown as { __dashboardTimings: object }).__dashboardTimings = { get: getLoadTimings };
+}
+
+// Record `milestone` when the calling component first mounts
+export function useLoadTiming(milestone: LoadMilestone): void {
+  useEffect(() => {
+    if (timings[milestone] !== undefined) return;
+    const ms = Math.round(performance.now());
+    timings[milestone] = ms;
+    if (typeof performance.mark === 'function') performance.mark(`dashboard:${milestone}`);
+    listeners.forEach(listener => listener(milestone, ms));
+  }, [milestone]);
+}
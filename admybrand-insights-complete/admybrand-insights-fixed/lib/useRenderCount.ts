@@ -0,0 +1,36 @@
+// Development-only render accounting. Every component that calls
+// useRenderCount bumps its counter on each render, and the counters are
+// exposed in the browser console:
+//
+//   __renderCounts.reset()   // then toggle the theme or wait for a tick
+//   __renderCounts.get()     // { Charts: 0, RevenueTrendCard: 0, ... }
+//
+// Under React StrictMode development renders run twice, so counts are doubled.
+// Production builds skip the bookkeeping entirely.
+const enabled = process.env.NODE_ENV !== 'production';
+const counts = new Map<string, number>();
+
+export function getRenderCounts(): Record<string, number> {
+  const snapshot: Record<string, number> = {};
+  counts.forEach((count, name) => {
+    snapshot[name] = count;
+  });
+  return snapshot;
+}
+
+export function resetRenderCounts(): void {
+  counts.forEach((_, name) => counts.set(name, 0));
+}
+
+if (enabled && typeof window !== 'undefined') {
+  (window as unknown as { __renderCounts: object }).__renderCounts = {
+    get: getRenderCounts,
+    reset: resetRenderCounts,
+  };
+}
+
+// Count a render of `name`; call it unconditionally at the top of a component
+export function useRenderCount(name: string): void {
+  if (!enabled) return;
+  counts.set(name, (counts.get(name) ?? 0) + 1);
+}
@@ -0,0 +1,250 @@
+"""Content-addressed cache of Next.js build caches, kept outside the shipped tree.
+
+`next build` keeps webpack's persistent cache in `<project>/.next/cache`. That
+directory must not ship in the packaged project, but restoring it before a
+build turns a cold build into a warm one. This module stores it under
+BUILD_CACHE_DIR (default ~/.cache/admybrand-insights/next-build):
+
+  objects/ab/abcdef...   file contents, named by their SHA-256 (deduplicated
+                         across entries, so packs that didn't change between
+                         builds are stored once)
+  entries/<key>.json     one build: {relative path: object hash}, keyed by the
+                         hash of the project's sources
+
+Restore prefers the entry built from exactly the current sources and falls
+back to the most recent entry with the same toolchain (lockfile and build
+configs); webpack revalidates individual modules itself. Entries whose objects
+have gone missing are dropped and the next candidate is tried. Entries are evicted
+least-recently-used first once the cache exceeds its size or entry budget,
+and objects no entry references are removed.
+
+Usage:
+  python build_cache.py build   [PROJECT]   restore, npm run build, save, evict
+  python build_cache.py restore [PROJECT]
+  python build_cache.py save    [PROJECT]
+  python build_cache.py evict   [--max-bytes N] [--max-entries N]
+  python build_cache.py stats
+"""
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+DEFAULT_PROJECT_NAME = "admybrand-insights-fixed"
+BUILD_CACHE_DIR = Path(os.environ.get("BUILD_CACHE_DIR", Path.home() / ".cache" / "admybrand-insights" / "next-build"))
+DEFAULT_MAX_BYTES = 1 << 30
+DEFAULT_MAX_ENTRIES = 20
+
+# Inputs whose change invalidates webpack's cache wholesale
+TOOLCHAIN_FILES = [
+    "package-lock.json",
+    "package.json",
+    "next.config.js",
+    "tsconfig.json",
+    "tailwind.config.js",
+    "postcss.config.js",
+]
+SOURCE_EXCLUDED_DIRS = {".next", "node_modules", ".git", "fixtures", "results"}
+
+CACHE_SUBDIR = Path(".next") / "cache"
+# Webpack's previous-generation backups and dev-server hot updates are never reused
+CACHE_EXCLUDED_SUFFIXES = (".old", ".hot-update.js", ".hot-update.json")
+
+
+def sha256_file(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def hash_inputs(project, paths):
+    digest = hashlib.sha256()
+    for relative in paths:
+        path = project / relative
+        digest.update(relative.encode("utf-8") + b"\0")
+        digest.update((sha256_file(path) if path.exists() else "missing").encode("ascii") + b"\n")
+    return digest.hexdigest()
+
+
+def source_files(project):
+    files = []
+    for root, dirs, filenames in os.walk(project):
+        dirs[:] = sorted(d for d in dirs if d not in SOURCE_EXCLUDED_DIRS)
+        files.extend(Path(root, name).relative_to(project).as_posix() for name in filenames)
+    return sorted(files)
+
+
+def cache_keys(project):
+    """(source key, toolchain key) for the project as it is on disk."""
+    return hash_inputs(project, source_files(project)), hash_inputs(project, TOOLCHAIN_FILES)
+
+
+def object_path(digest):
+    return BUILD_CACHE_DIR / "objects" / digest[:2] / digest[2:]
+
+
+def load_entries():
+    entries = {}
+    for path in (BUILD_CACHE_DIR / "entries").glob("*.json"):
+        try:
+            entries[path.stem] = json.loads(path.read_text(encoding="utf-8"))
+        except ValueError:
+            path.unlink()
+    return entries
+
+
+def write_entry(key, entry):
+    path = BUILD_CACHE_DIR / "entries" / f"{key}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(entry, f, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def save(project):
+    """Store the project's .next/cache as an entry keyed by its current sources."""
+    cache_root = project / CACHE_SUBDIR
+    if not cache_root.is_dir():
+        return None
+
+    key, toolchain = cache_keys(project)
+    files = {}
+    size = 0
+    for root, _, filenames in os.walk(cache_root):
+        for name in filenames:
+            if name.endswith(CACHE_EXCLUDED_SUFFIXES):
+                continue
+            path = Path(root, name)
+            digest = sha256_file(path)
+            target = object_path(digest)
+            if not target.exists():
+                target.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp = tempfile.mkstemp(dir=target.parent)
+                os.close(fd)
+                shutil.copyfile(path, tmp)
+                os.replace(tmp, target)
+            files[path.relative_to(cache_root).as_posix()] = digest
+            size += path.stat().st_size
+
+    write_entry(key, {"toolchain": toolchain, "files": files, "size": size, "lastUsed": time.time()})
+    return key
+
+
+def restore(project):
+    """Materialize the best matching entry into .next/cache. Returns (key, exact) or None."""
+    key, toolchain = cache_keys(project)
+    entries = load_entries()
+    # The exact entry first, then same-toolchain entries, most recently used first
+    fallbacks = sorted(
+        (k for k, entry in entries.items() if k != key and entry["toolchain"] == toolchain),
+        key=lambda k: entries[k]["lastUsed"],
+        reverse=True,
+    )
+    candidates = ([key] if key in entries else []) + fallbacks
+
+    for chosen in candidates:
+        entry = entries[chosen]
+        if all(object_path(digest).exists() for digest in entry["files"].values()):
+            break
+        # An entry with missing objects can never be restored; drop it and try the next
+        (BUILD_CACHE_DIR / "entries" / f"{chosen}.json").unlink()
+    else:
+        return None
+    exact = chosen == key
+
+    cache_root = project / CACHE_SUBDIR
+    if cache_root.exists():
+        shutil.rmtree(cache_root)
+    for relative, digest in entry["files"].items():
+        target = cache_root / relative
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(object_path(digest), target)
+
+    entry["lastUsed"] = time.time()
+    write_entry(chosen, entry)
+    return chosen, exact
+
+
+def evict(max_bytes=DEFAULT_MAX_BYTES, max_entries=DEFAULT_MAX_ENTRIES):
+    """Drop least-recently-used entries over budget, then unreferenced objects."""
+    entries = load_entries()
+    order = sorted(entries, key=lambda k: entries[k]["lastUsed"], reverse=True)
+    kept, kept_entries, evicted, total = set(), 0, [], 0
+
+    for key in order:
+        files = set(entries[key]["files"].values())
+        # Objects are shared, so an entry costs only the bytes it adds
+        added = sum(object_path(digest).stat().st_size for digest in files - kept if object_path(digest).exists())
+        # The most recent entry is always kept; older ones until the first that is over budget
+        fits = kept_entries < max_entries and total + added <= max_bytes
+        if kept_entries == 0 or (not evicted and fits):
+            kept |= files
+            kept_entries += 1
+            total += added
+        else:
+            (BUILD_CACHE_DIR / "entries" / f"{key}.json").unlink()
+            evicted.append(key)
+
+    removed_bytes = 0
+    objects = BUILD_CACHE_DIR / "objects"
+    if objects.is_dir():
+        for path in objects.glob("*/*"):
+            if path.parent.name + path.name not in kept:
+                removed_bytes += path.stat().st_size
+                path.unlink()
+    return evicted, removed_bytes
+
+
+def stats():
+    entries = load_entries()
+    objects = list((BUILD_CACHE_DIR / "objects").glob("*/*"))
+    return {
+        "entries": len(entries),
+        "objects": len(objects),
+        "bytes": sum(path.stat().st_size for path in objects),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the cache of Next.js build caches")
+    parser.add_argument("command", choices=["build", "restore", "save", "evict", "stats"])
+    parser.add_argument("project", nargs="?", type=Path, default=Path(DEFAULT_PROJECT_NAME))
+    parser.add_argument("--max-bytes", type=int, default=DEFAULT_MAX_BYTES)
+    parser.add_argument("--max-entries", type=int, default=DEFAULT_MAX_ENTRIES)
+    args = parser.parse_args()
+
+    if args.command in ("build", "restore"):
+        restored = restore(args.project)
+        if restored:
+            key, exact = restored
+            print(f"♻️  Restored build cache {key[:12]} ({'exact' if exact else 'same toolchain'})")
+        else:
+            print("No build cache to restore; building cold")
+
+    if args.command == "build":
+        subprocess.run(["npm", "run", "build"], cwd=args.project, check=True)
+
+    if args.command in ("build", "save"):
+        key = save(args.project)
+        print(f"💾 Saved build cache {key[:12]}" if key else "No .next/cache to save")
+
+    if args.command in ("build", "evict"):
+        evicted, removed_bytes = evict(args.max_bytes, args.max_entries)
+        if evicted or removed_bytes:
+            print(f"🧹 Evicted {len(evicted)} entries, freed {removed_bytes / 1048576:.1f} MB")
+
+    if args.command == "stats":
+        info = stats()
+        print(f"{info['entries']} entries, {info['objects']} objects, {info['bytes'] / 1048576:.1f} MB in {BUILD_CACHE_DIR}")
+
+
+if __name__ == "__main__":
+    main()
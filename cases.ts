@@ -0,0 +1,203 @@
+import type { CampaignData, MetricData } from '@/data/mockData';
+import {
+  aggregateColumns,
+  buildDailyIndex,
+  queryLastDays,
+  summarize,
+  toColumns,
+  type MetricColumns,
+} from '@/lib/aggregate';
+import { createRollupStore, queryRecentDays } from '@/lib/rollups';
+import { groupBy } from '@/lib/dimensions';
+import { lttbIndices, minMaxIndices } from '@/lib/downsample';
+import { indexTable, runTableQuery, type TableColumns, type TableQuery } from '@/lib/tableQuery';
+import { csvChunks } from '@/lib/utils';
+
+export interface BenchCase<S = unknown> {
+  name: string;
+  description: string;
+  // Larger datasets are skipped unless run with --all: the case builds one
+  // object per row or sorts, and would dominate the suite's run time
+  maxRows?: number;
+  // Untimed preparation of the case's input
+  setup: (columns: MetricColumns) => S;
+  // The timed work; the return value is kept alive until memory is sampled
+  run: (state: S) => unknown;
+}
+
+function defineCase<S>(benchCase: BenchCase<S>): BenchCase {
+  return benchCase as BenchCase;
+}
+
+// Row objects in the MetricData shape the components receive
+function toRows(columns: MetricColumns): MetricData[] {
+  const rows: MetricData[] = new Array(columns.length);
+  for (let i = 0; i < columns.length; i++) {
+    rows[i] = {
+      date: columns.dates[columns.date[i]],
+      revenue: columns.revenue[i],
+      users: columns.users[i],
+      conversions: columns.conversions[i],
+      campaign: columns.campaigns[columns.campaign[i]],
+    };
+  }
+  return rows;
+}
+
+// Deterministic 2-7% click-through rate for row i
+function syntheticCtr(i: number): number {
+  return 2 + ((i * 7919) % 500) / 100;
+}
+
+// Treat every metric row as a table row; ctr and cost are derived
+// deterministically so sorts on them see realistic spreads and ties
+function toTableColumns(columns: MetricColumns): TableColumns {
+  const { length } = columns;
+  const names = columns.campaigns.map(campaign => campaign.toLowerCase());
+  const table: TableColumns = {
+    length,
+    campaigns: new Array(length),
+    names: new Array(length),
+    revenue: Float64Array.from(columns.revenue),
+    users: Float64Array.from(columns.users),
+    conversions: Float64Array.from(columns.conversions),
+    ctr: new Float64Array(length),
+    cost: new Float64Array(length),
+  };
+
+  for (let i = 0; i < length; i++) {
+    const code = columns.campaign[i];
+    table.campaigns[i] = columns.campaigns[code];
+    table.names[i] = names[code];
+    table.ctr[i] = syntheticCtr(i);
+    table.cost[i] = Math.floor(columns.revenue[i] * 0.35);
+  }
+
+  return table;
+}
+
+// Lazily yields CampaignData-shaped rows for the CSV encoder
+function* campaignRows(columns: MetricColumns): Generator<CampaignData> {
+  for (let i = 0; i < columns.length; i++) {
+    yield {
+      campaign: columns.campaigns[columns.campaign[i]],
+      revenue: columns.revenue[i],
+      users: columns.users[i],
+      conversions: columns.conversions[i],
+      ctr: syntheticCtr(i),
+      cost: Math.floor(columns.revenue[i] * 0.35),
+    };
+  }
+}
+
+const TABLE_QUERY: TableQuery = {
+  search: 'so',
+  minRevenue: 500,
+  maxRevenue: null,
+  sortField: 'revenue',
+  sortDirection: 'desc',
+  page: 1,
+  pageSize: 25,
+};
+
+export const benchCases: BenchCase[] = [
+  defineCase({
+    name: 'toColumns',
+    description: 'Encode MetricData rows into typed-array columns',
+    maxRows: 1_000_000,
+    setup: toRows,
+    run: rows => toColumns(rows),
+  }),
+  defineCase({
+    name: 'summaryMetrics',
+    description: 'Single-pass aggregation reduced to the summary KPIs',
+    setup: columns => columns,
+    run: columns => summarize(aggregateColumns(columns).totals),
+  }),
+  defineCase({
+    name: 'campaignData',
+    description: 'Per-campaign totals from the single-pass aggregation',
+    setup: columns => columns,
+    run: columns => aggregateColumns(columns).byCampaign,
+  }),
+  defineCase({
+    name: 'dailyData',
+    description: 'Build the daily index and query the 30-day chart window',
+    setup: columns => columns,
+    run: columns => queryLastDays(buildDailyIndex(columns), 30),
+  }),
+  defineCase({
+    name: 'dailyWindow',
+    description: 'Query the 90-day chart window on a prebuilt daily index',
+    setup: buildDailyIndex,
+    run: index => queryLastDays(index, 90),
+  }),
+  defineCase({
+    name: 'rollupBuild',
+    description: 'Bucket every row into the hour/day/week/month rollups',
+    setup: columns => columns,
+    run: columns => {
+      const store = createRollupStore();
+      store.addColumns(columns);
+      return store;
+    },
+  }),
+  defineCase({
+    name: 'rollupQuery',
+    description: 'Query every chart range at 800px on prebuilt rollups',
+    setup: columns => {
+      const store = createRollupStore();
+      store.addColumns(columns);
+      return store;
+    },
+    run: store => [1, 7, 30, 90, 365, 730].map(days => queryRecentDays(store, days, 800)),
+  }),
+  defineCase({
+    name: 'groupBy',
+    description: 'Group by campaign x region x device, then drill into one campaign by creative',
+    setup: columns => columns,
+    run: columns => [
+      groupBy(columns, ['campaign', 'region', 'device']),
+      groupBy(columns, ['creative'], { where: { campaign: columns.campaigns[0] } }),
+    ],
+  }),
+  defineCase({
+    name: 'lttb',
+    description: 'Downsample the revenue column to 1,600 points with LTTB',
+    setup: columns => columns.revenue,
+    run: revenue => lttbIndices(revenue, 1600),
+  }),
+  defineCase({
+    name: 'minMax',
+    description: 'Downsample the revenue column to 1,600 points with min/max decimation',
+    setup: columns => columns.revenue,
+    run: revenue => minMaxIndices(revenue, 1600),
+  }),
+  defineCase({
+    name: 'tableIndex',
+    description: 'Build the DataTable sort permutations',
+    maxRows: 1_000_000,
+    setup: toTableColumns,
+    run: table => indexTable(table),
+  }),
+  defineCase({
+    name: 'tableQuery',
+    description: 'Filter, sort and page the DataTable on a prebuilt index',
+    maxRows: 1_000_000,
+    setup: columns => indexTable(toTableColumns(columns)),
+    run: index => runTableQuery(index, TABLE_QUERY),
+  }),
+  defineCase({
+    name: 'csvExport',
+    description: 'Encode every row as CSV text, chunk by chunk',
+    setup: columns => columns,
+    run: columns => {
+      let bytes = 0;
+      const chunks = csvChunks(campaignRows(columns));
+      for (let step = chunks.next(); !step.done; step = chunks.next()) {
+        bytes += step.value.length;
+      }
+      return bytes;
+    },
+  }),
+];
@@ -0,0 +1,100 @@
+export type DownsampleMode = 'lttb' | 'minmax';
+
+// Positions of at most `threshold` points of `values` chosen by
+// Largest-Triangle-Three-Buckets: the first and last points are kept, and each
+// bucket in between keeps the point forming the largest triangle with the
+// previous pick and the next bucket's average, which preserves visible peaks
+export function lttbIndices(values: ArrayLike<number>, threshold: number): number[] {
+  const length = values.length;
+  if (threshold >= length || length <= 2) return Array.from({ length }, (_, i) => i);
+  if (threshold < 3) return [0, length - 1];
+
+  const picks = [0];
+  const bucketSize = (length - 2) / (threshold - 2);
+  let previous = 0;
+
+  for (let b = 0; b < threshold - 2; b++) {
+    const start = Math.floor(b * bucketSize) + 1;
+    const end = Math.floor((b + 1) * bucketSize) + 1;
+
+    // Average of the next bucket (the last point for the final bucket)
+    const nextStart = end;
+    const nextEnd = Math.min(Math.floor((b + 2) * bucketSize) + 1, length);
+    let averageX = 0;
+    let averageY = 0;
+    for (let i = nextStart; i < nextEnd; i++) {
+      averageX += i;
+      averageY += values[i];
+    }
+    const nextCount = nextEnd - nextStart;
+    averageX = nextCount > 0 ? averageX / nextCount : length - 1;
+    averageY = nextCount > 0 ? averageY / nextCount : values[length - 1];
+
+    let best = start;
+    let bestArea = -1;
+    const previousY = values[previous];
+    for (let i = start; i < end; i++) {
+      const area = Math.abs((previous - averageX) * (values[i] - previousY) - (previous - i) * (averageY - previousY));
+      if (area > bestArea) {
+        bestArea = area;
+        best = i;
+      }
+    }
+    picks.push(best);
+    previous = best;
+  }
+
+  picks.push(length - 1);
+  return picks;
+}
+
+// Positions of at most `threshold` points of `values`: the minimum and maximum
+// of each of threshold / 2 equal buckets, in order, so every extreme survives
+export function minMaxIndices(values: ArrayLike<number>, threshold: number): number[] {
+  const length = values.length;
+  if (threshold >= length || length <= 2) return Array.from({ length }, (_, i) => i);
+
+  const buckets = Math.max(1, Math.floor(threshold / 2));
+  const picks: number[] = [];
+  for (let b = 0; b < buckets; b++) {
+    const start = Math.floor((b * length) / buckets);
+    const end = Math.floor(((b + 1) * length) / buckets);
+    if (start >= end) continue;
+
+    let min = start;
+    let max = start;
+    for (let i = start + 1; i < end; i++) {
+      if (values[i] < values[min]) min = i;
+      if (values[i] > values[max]) max = i;
+    }
+    if (min === max) picks.push(min);
+    else picks.push(Math.min(min, max), Math.max(min, max));
+  }
+  return picks;
+}
+
+// Reduce chart points to roughly `threshold` while keeping the shape of each
+// metric in `keys`. Every metric is sampled separately and the union of the
+// picks is kept, so points stay shared across the series of one chart
+export function downsamplePoints<T>(
+  points: T[],
+  keys: (keyof T)[],
+  threshold: number,
+  mode: DownsampleMode = 'lttb'
+): T[] {
+  if (points.length <= threshold || keys.length === 0) return points;
+
+  const perSeries = Math.max(3, Math.floor(threshold / keys.length));
+  const select = mode === 'lttb' ? lttbIndices : minMaxIndices;
+  const keep = new Uint8Array(points.length);
+  const values = new Float64Array(points.length);
+
+  keys.forEach(key => {
+    for (let i = 0; i < points.length; i++) values[i] = Number(points[i][key]);
+    select(values, perSeries).forEach(i => {
+      keep[i] = 1;
+    });
+  });
+
+  return points.filter((_, i) => keep[i] === 1);
+}
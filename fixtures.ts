@@ -0,0 +1,101 @@
+import type { CampaignData } from '@/data/mockData';
+import { ATTRIBUTE_DIMENSIONS, type AttributeDimension, type MetricColumns } from './aggregate';
+
+type FixtureColumnName = 'revenue' | 'users' | 'conversions' | 'campaign' | 'date';
+
+interface FixtureColumn {
+  dtype: 'float64' | 'int32' | 'uint32' | 'uint16';
+  // Byte offset of the column within the binary file
+  offset: number;
+}
+
+// Written by generate_fixtures.py next to the binary column file
+export interface FixtureManifest {
+  version: number;
+  name: string;
+  seed: number;
+  rows: number;
+  days: number;
+  rowsPerDay: number;
+  campaigns: string[];
+  dates: string[];
+  binary: string | null;
+  columns: Record<FixtureColumnName, FixtureColumn> & Partial<Record<AttributeDimension, FixtureColumn>>;
+  // Attribute dictionaries (version 2); each has a uint16 column of codes
+  dimensions?: Partial<Record<AttributeDimension, string[]>>;
+  campaignData: CampaignData[];
+}
+
+export interface MetricFixture {
+  manifest: FixtureManifest;
+  columns: MetricColumns;
+  campaignData: CampaignData[];
+}
+
+// Version 1 fixtures predate the attribute columns and still load
+const FIXTURE_VERSIONS = [1, 2];
+
+const COLUMN_TYPES = {
+  revenue: Float64Array,
+  users: Int32Array,
+  conversions: Int32Array,
+  campaign: Uint32Array,
+  date: Uint32Array,
+};
+
+const DTYPES: Record<FixtureColumnName, FixtureColumn['dtype']> = {
+  revenue: 'float64',
+  users: 'int32',
+  conversions: 'int32',
+  campaign: 'uint32',
+  date: 'uint32',
+};
+
+async function fetchOk(url: string): Promise<Response> {
+  const response = await fetch(url);
+  if (!response.ok) throw new Error(`Failed to load fixture ${url}: ${response.status}`);
+  return response;
+}
+
+// Wrap the binary file in typed-array views; no per-row parsing or copying
+export function decodeFixture(manifest: FixtureManifest, buffer: ArrayBuffer): MetricColumns {
+  if (FIXTURE_VERSIONS.indexOf(manifest.version) < 0) {
+    throw new Error(`Unsupported fixture version ${manifest.version}`);
+  }
+
+  const view = <K extends FixtureColumnName>(name: K): InstanceType<(typeof COLUMN_TYPES)[K]> => {
+    const { dtype, offset } = manifest.columns[name];
+    if (dtype !== DTYPES[name]) throw new Error(`Fixture column ${name} has type ${dtype}`);
+    return new COLUMN_TYPES[name](buffer, offset, manifest.rows) as InstanceType<(typeof COLUMN_TYPES)[K]>;
+  };
+
+  const dimensions: MetricColumns['dimensions'] = {};
+  ATTRIBUTE_DIMENSIONS.forEach(dimension => {
+    const values = manifest.dimensions?.[dimension];
+    const column = manifest.columns[dimension];
+    if (!values || !column) return;
+    if (column.dtype !== 'uint16') throw new Error(`Fixture column ${dimension} has type ${column.dtype}`);
+    dimensions[dimension] = { codes: new Uint16Array(buffer, column.offset, manifest.rows), values };
+  });
+
+  return {
+    length: manifest.rows,
+    revenue: view('revenue'),
+    users: view('users'),
+    conversions: view('conversions'),
+    campaign: view('campaign'),
+    date: view('date'),
+    campaigns: manifest.campaigns,
+    dates: manifest.dates,
+    dimensions,
+  };
+}
+
+// Load a generated fixture, e.g. loadMetricFixture('metrics-365d-12c-100r-s7')
+export async function loadMetricFixture(name: string, baseUrl = '/fixtures'): Promise<MetricFixture> {
+  const manifest: FixtureManifest = await (await fetchOk(`${baseUrl}/${name}.manifest.json`)).json();
+  if (!manifest.binary) throw new Error(`Fixture ${name} was generated without binary columns`);
+
+  const buffer = await (await fetchOk(`${baseUrl}/${manifest.binary}`)).arrayBuffer();
+  return { manifest, columns: decodeFixture(manifest, buffer), campaignData: manifest.campaignData };
+}
@@ -0,0 +1,439 @@
+"""Generate the ADmyBRAND Insights project from the script_*.py templates.
+
+Single entry point replacing `script.py` ... `script_12.py` run in order. The
+scripts stay the source of the file templates: each is parsed (never executed)
+for its top-level string templates and its `with open(path, "w")` writes,
+giving a manifest of outputs.
+
+Independent file groups are rendered concurrently in a thread pool. Every
+output is hashed and only files whose content changed are written, atomically.
+The previous run's state lives in `<project>/.generate-manifest.json`; a group
+whose template scripts and outputs are untouched since then is skipped
+without being parsed, so regenerating an unchanged tree is close to a no-op.
+
+Batch mode renders one branded variant per tenant from a JSON list of tenant
+configs (see TENANT_SLOTS for the settings). Templates are parsed once in the
+parent, shared outputs outside the project tree are written once, and tenants
+are rendered in parallel worker processes, each with its own manifest:
+
+  [{"name": "acme-insights", "title": "Acme Insights", "brand": "Acme",
+    "campaigns": ["Search", "Video"], "colors": ["#0EA5E9", "#F97316"]}]
+
+Usage:
+  python generate.py [--project-name NAME] [--out-dir DIR] [--force] [--jobs N]
+  python generate.py --tenants tenants.json [--out-dir DIR] [--processes N]
+"""
+import argparse
+import ast
+import hashlib
+import json
+import os
+import re
+import stat
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+DEFAULT_PROJECT_NAME = "admybrand-insights-fixed"
+MANIFEST_NAME = ".generate-manifest.json"
+MANIFEST_VERSION = 2
+# Stands in for the project directory in parsed output paths
+PROJECT_PREFIX = "{project}/"
+
+# Output groups with no dependencies on each other, and the scripts holding their templates
+GROUPS = {
+    "configs": ["script_1.py", "script_2.py"],
+    "core": ["script_3.py"],
+    "components": ["script_4.py", "script_5.py", "script_6.py", "script_7.py"],
+    "app": ["script_8.py"],
+    "docs": ["script_9.py", "script_10.py", "script_12.py"],
+}
+
+# Outputs that are made executable (script_10.py chmods setup.sh)
+EXECUTABLE = {"setup.sh"}
+
+TENANT_NAME = re.compile(r"^[a-z0-9][a-z0-9._-]*$")
+
+
+def ts_string(value):
+    return "'" + value.replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+
+def ts_array(values):
+    return "[" + ", ".join(ts_string(value) for value in values) + "]"
+
+
+def jsx_text(value):
+    return "{" + ts_string(value) + "}" if re.search(r"[{}<>]", value) else value
+
+
+# Tenant settings: (project file, setting, template text, replacement).
+# A template that no longer contains its text fails loudly rather than
+# silently producing an unbranded variant
+TENANT_SLOTS = [
+    ("package.json", "name",
+     '"name": "admybrand-insights",', lambda name: f'"name": {json.dumps(name)},'),
+    ("app/layout.tsx", "title",
+     "title: 'ADmyBRAND Insights - Analytics Dashboard',", lambda title: f"title: {ts_string(title)},"),
+    ("app/layout.tsx", "description",
+     "description: 'Modern analytics dashboard for digital marketing agencies',",
+     lambda description: f"description: {ts_string(description)},"),
+    ("components/Sidebar.tsx", "brand",
+     "                ADmyBRAND\n", lambda brand: f"                {jsx_text(brand)}\n"),
+    ("components/Sidebar.tsx", "brand",
+     "              © 2025 ADmyBRAND Insights\n", lambda brand: f"              © 2025 {jsx_text(brand)} Insights\n"),
+    ("data/generators.ts", "campaigns",
+     "export const campaignNames = ['Search', 'Social', 'Display', 'Email'];",
+     lambda campaigns: f"export const campaignNames = {ts_array(campaigns)};"),
+    ("components/ConversionPieCard.tsx", "colors",
+     "const COLORS = ['#3B82F6', '#10B981', '#F59E0B', '#EF4444', '#8B5CF6'];",
+     lambda colors: f"const COLORS = {ts_array(colors)};"),
+]
+TENANT_SETTINGS = {setting for _, setting, _, _ in TENANT_SLOTS}
+LIST_SETTINGS = {"campaigns", "colors"}
+
+
+def sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def resolve_path(node):
+    """Evaluate an open() path: a literal or an f-string over `project_name`."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    if isinstance(node, ast.JoinedStr):
+        parts = []
+        for value in node.values:
+            if isinstance(value, ast.Constant):
+                parts.append(value.value)
+            elif isinstance(value, ast.FormattedValue) and isinstance(value.value, ast.Name) \
+                    and value.value.id == "project_name":
+                parts.append(PROJECT_PREFIX[:-1])
+            else:
+                return None
+        return "".join(parts)
+    return None
+
+
+def parse_outputs(script):
+    """Map each file a script writes to its template, as {path: content}.
+
+    Paths inside the project tree start with PROJECT_PREFIX.
+    """
+    tree = ast.parse((SCRIPTS_DIR / script).read_text(encoding="utf-8"), filename=script)
+    templates = {}
+    outputs = {}
+
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and isinstance(node.value, ast.Constant) \
+                and isinstance(node.value.value, str):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    templates[target.id] = node.value.value
+
+        elif isinstance(node, ast.With) and len(node.items) == 1:
+            call = node.items[0].context_expr
+            if not (isinstance(call, ast.Call) and isinstance(call.func, ast.Name) and call.func.id == "open"):
+                continue
+            mode = call.args[1] if len(call.args) > 1 else None
+            if not (isinstance(mode, ast.Constant) and mode.value == "w"):
+                continue
+            path = resolve_path(call.args[0])
+            body = node.body[0] if len(node.body) == 1 else None
+            if path is None or not (isinstance(body, ast.Expr) and isinstance(body.value, ast.Call)):
+                raise ValueError(f"{script}:{node.lineno}: unsupported write")
+            argument = body.value.args[0]
+            if not (isinstance(argument, ast.Name) and argument.id in templates):
+                raise ValueError(f"{script}:{node.lineno}: write of unknown template")
+            outputs[path] = templates[argument.id]
+
+    return outputs
+
+
+def file_state(path):
+    try:
+        info = path.stat()
+    except FileNotFoundError:
+        return None
+    return {"size": info.st_size, "mtime": info.st_mtime_ns}
+
+
+def write_atomic(path, data, executable):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        mode = 0o644 | (stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH if executable else 0)
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def apply_tenant(path, content, tenant):
+    """Substitute the tenant's settings into one project file's template."""
+    for slot_path, setting, text, replace in TENANT_SLOTS:
+        if setting not in tenant or PROJECT_PREFIX + slot_path != path:
+            continue
+        if text not in content:
+            raise ValueError(f"{slot_path}: template no longer contains the {setting!r} slot")
+        content = content.replace(text, replace(tenant[setting]))
+    return content
+
+
+def load_templates(groups=GROUPS):
+    """Parse every group's scripts once: {group: {path: content}}."""
+    return {
+        name: {path: content for script in scripts for path, content in parse_outputs(script).items()}
+        for name, scripts in groups.items()
+    }
+
+
+def group_inputs(name, script_hashes, tenant):
+    """Fingerprint of everything a group's outputs are rendered from."""
+    inputs = {"scripts": {script: script_hashes[script] for script in GROUPS[name]}, "tenant": tenant}
+    return sha256(json.dumps(inputs, sort_keys=True).encode("utf-8"))
+
+
+def group_unchanged(name, inputs, previous, out_dir):
+    """True when the group's inputs and every output it wrote are as recorded."""
+    recorded = previous["groups"].get(name)
+    if not recorded or recorded["inputs"] != inputs:
+        return False
+    for path in recorded["outputs"]:
+        entry = previous["files"].get(path)
+        if entry is None or file_state(out_dir / path) != entry["state"]:
+            return False
+    return True
+
+
+def write_if_changed(target, data, recorded, force):
+    """Write `data` unless the file already holds it. Returns (state, written)."""
+    digest = sha256(data)
+    executable = target.name in EXECUTABLE
+    state = file_state(target)
+
+    # The manifest vouches for untouched files; anything else is compared by content
+    up_to_date = not force and state is not None and (
+        (recorded is not None and recorded["sha256"] == digest and recorded["state"] == state)
+        or sha256(target.read_bytes()) == digest
+    )
+    if not up_to_date:
+        write_atomic(target, data, executable)
+        return file_state(target), True
+    if executable and not os.access(target, os.X_OK):
+        os.chmod(target, target.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+        return file_state(target), False
+    return state, False
+
+
+def render_group(name, project_name, out_dir, previous, inputs, force,
+                 templates=None, tenant=None, shared=True):
+    """Render one group and write the outputs that differ from what is on disk.
+
+    `templates` are parsed from the group's scripts when not supplied. With
+    `shared` false, outputs outside the project tree are left to the caller.
+    """
+    if not force and group_unchanged(name, inputs, previous, out_dir):
+        outputs = previous["groups"][name]["outputs"]
+        return name, {path: previous["files"][path] for path in outputs}, [], True
+
+    if templates is None:
+        templates = load_templates({name: GROUPS[name]})[name]
+
+    files = {}
+    written = []
+    for path, content in templates.items():
+        in_project = path.startswith(PROJECT_PREFIX)
+        if not in_project and not shared:
+            continue
+        if tenant:
+            content = apply_tenant(path, content, tenant)
+        if in_project:
+            path = f"{project_name}/{path[len(PROJECT_PREFIX):]}"
+
+        data = content.encode("utf-8")
+        state, changed = write_if_changed(out_dir / path, data, previous["files"].get(path), force)
+        if changed:
+            written.append(path)
+        files[path] = {"sha256": sha256(data), "group": name, "state": state}
+
+    return name, files, written, False
+
+
+def load_manifest(path, project_name):
+    empty = {"version": MANIFEST_VERSION, "project": project_name, "groups": {}, "files": {}}
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return empty
+    if manifest.get("version") != MANIFEST_VERSION or manifest.get("project") != project_name:
+        return empty
+    return manifest
+
+
+def hash_scripts():
+    return {
+        script: sha256((SCRIPTS_DIR / script).read_bytes())
+        for scripts in GROUPS.values()
+        for script in scripts
+    }
+
+
+def finish(project_name, out_dir, previous, results):
+    """Record a project's new manifest and drop outputs no template produces any more."""
+    manifest = {"version": MANIFEST_VERSION, "project": project_name, "groups": {}, "files": {}}
+    written, skipped = [], []
+    for name, inputs, (_, files, group_written, was_skipped) in results:
+        manifest["groups"][name] = {"inputs": inputs, "outputs": sorted(files)}
+        manifest["files"].update(files)
+        written.extend(group_written)
+        if was_skipped:
+            skipped.append(name)
+
+    # Stale outputs are only removed if they were not edited by hand
+    removed = []
+    for path, recorded in previous["files"].items():
+        target = out_dir / path
+        if path in manifest["files"] or not target.exists():
+            continue
+        if sha256(target.read_bytes()) == recorded["sha256"]:
+            target.unlink()
+            removed.append(path)
+
+    manifest_path = out_dir / project_name / MANIFEST_NAME
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    manifest_path.write_text(json.dumps(manifest, indent=1, sort_keys=True) + "\n", encoding="utf-8")
+    return sorted(written), skipped, sorted(removed)
+
+
+def generate(project_name=DEFAULT_PROJECT_NAME, out_dir=Path("."), force=False, jobs=None):
+    """Bring `out_dir` up to date with the templates. Returns (written, skipped groups, removed)."""
+    previous = load_manifest(out_dir / project_name / MANIFEST_NAME, project_name)
+    script_hashes = hash_scripts()
+    inputs = {name: group_inputs(name, script_hashes, None) for name in GROUPS}
+
+    with ThreadPoolExecutor(max_workers=jobs or len(GROUPS)) as pool:
+        futures = [
+            (name, pool.submit(render_group, name, project_name, out_dir, previous, inputs[name], force))
+            for name in GROUPS
+        ]
+        results = [(name, inputs[name], future.result()) for name, future in futures]
+
+    return finish(project_name, out_dir, previous, results)
+
+
+def load_tenants(path):
+    """Read and validate a JSON list of tenant configs."""
+    tenants = json.loads(Path(path).read_text(encoding="utf-8"))
+    if not isinstance(tenants, list):
+        raise ValueError("tenant file must contain a JSON list")
+
+    names = set()
+    for index, tenant in enumerate(tenants):
+        name = tenant.get("name") if isinstance(tenant, dict) else None
+        if not isinstance(name, str) or not TENANT_NAME.match(name):
+            raise ValueError(f"tenant {index}: 'name' must be a lowercase directory-safe string")
+        if name in names:
+            raise ValueError(f"tenant {index}: duplicate name {name!r}")
+        unknown = set(tenant) - TENANT_SETTINGS
+        if unknown:
+            raise ValueError(f"tenant {name}: unknown settings {', '.join(sorted(unknown))}")
+        for setting, value in tenant.items():
+            if setting in LIST_SETTINGS:
+                if not isinstance(value, list) or not value or not all(isinstance(item, str) for item in value):
+                    raise ValueError(f"tenant {name}: {setting!r} must be a non-empty list of strings")
+            elif not isinstance(value, str):
+                raise ValueError(f"tenant {name}: {setting!r} must be a string")
+        names.add(name)
+    return tenants
+
+
+# Per-process state for batch workers, set once by the pool initializer
+_worker_templates = None
+_worker_script_hashes = None
+
+
+def _init_worker(templates, script_hashes):
+    global _worker_templates, _worker_script_hashes
+    _worker_templates = templates
+    _worker_script_hashes = script_hashes
+
+
+def generate_tenant(tenant, out_dir, force):
+    """Render one tenant's project tree from the pre-parsed templates."""
+    project_name = tenant["name"]
+    previous = load_manifest(out_dir / project_name / MANIFEST_NAME, project_name)
+    results = []
+    for name in GROUPS:
+        inputs = group_inputs(name, _worker_script_hashes, tenant)
+        result = render_group(name, project_name, out_dir, previous, inputs, force,
+                              templates=_worker_templates[name], tenant=tenant, shared=False)
+        results.append((name, inputs, result))
+    return project_name, finish(project_name, out_dir, previous, results)
+
+
+def generate_tenants(tenants, out_dir=Path("."), force=False, processes=None):
+    """Render every tenant's variant in parallel processes; yields (name, result) as they finish."""
+    templates = load_templates()
+    script_hashes = hash_scripts()
+
+    # Outputs outside the project trees are the same for every tenant
+    for group in templates.values():
+        for path, content in group.items():
+            if not path.startswith(PROJECT_PREFIX):
+                write_if_changed(out_dir / path, content.encode("utf-8"), None, force)
+
+    with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker,
+                             initargs=(templates, script_hashes)) as pool:
+        futures = [pool.submit(generate_tenant, tenant, out_dir, force) for tenant in tenants]
+        for future in futures:
+            yield future.result()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the ADmyBRAND Insights project")
+    parser.add_argument("--project-name", default=DEFAULT_PROJECT_NAME)
+    parser.add_argument("--out-dir", type=Path, default=Path("."), help="directory the project is created in")
+    parser.add_argument("--force", action="store_true", help="rewrite every file, ignoring the manifest")
+    parser.add_argument("--jobs", type=int, default=None, help="worker threads (default: one per group)")
+    parser.add_argument("--tenants", type=Path, help="JSON list of tenant configs to render in batch")
+    parser.add_argument("--processes", type=int, default=None,
+                        help="worker processes for --tenants (default: one per CPU)")
+    args = parser.parse_args()
+
+    if args.tenants:
+        try:
+            tenants = load_tenants(args.tenants)
+        except ValueError as error:
+            parser.error(str(error))
+
+        total = 0
+        for name, (written, skipped, removed) in generate_tenants(tenants, args.out_dir, args.force,
+                                                                  args.processes):
+            total += len(written)
+            status = f"{len(written)} file(s) written" if written else "up to date"
+            print(f"  - {name}: {status}" + (f", {len(removed)} removed" if removed else ""))
+        print(f"Generated {len(tenants)} tenant project(s), {total} file(s) written")
+        return
+
+    written, skipped, removed = generate(args.project_name, args.out_dir, args.force, args.jobs)
+
+    print(f"Generated project: {args.project_name}")
+    if written:
+        print(f"Wrote {len(written)} file(s):")
+        for path in written:
+            print(f"  - {path}")
+    else:
+        print("All files up to date")
+    if skipped:
+        print(f"Unchanged groups: {', '.join(skipped)}")
+    for path in removed:
+        print(f"Removed stale file: {path}")
+
+
+if __name__ == "__main__":
+    main()
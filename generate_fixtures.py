@@ -0,0 +1,271 @@
+"""Generate seeded, large-scale mock datasets for the dashboard.
+
+Produces the same distributions as generateMetricRow / generateCampaignRates in
+data/generators.ts (users 200-699, 5-20% conversion rate, $25-75 per conversion,
+2-7% CTR, cost 20-50% of revenue, one channel per campaign, uniform regions,
+55/35/10% mobile/desktop/tablet, three creatives per campaign), vectorized with NumPy so that millions of
+rows take seconds. The same seed, shape and end date always yield the same
+fixture; the end date defaults to a fixed day so benchmark inputs never drift.
+
+Outputs, written to <project>/public/fixtures/ so Next.js serves them as-is:
+  <name>.manifest.json  shape, seed, dictionaries, column offsets, campaignData
+  <name>.bin            little-endian columns in MetricColumns layout
+                        (revenue f8, users i4, conversions i4, campaign u4, date u4,
+                        then channel, region, device and creative codes as u2)
+  <name>.json           optional MetricData[] / CampaignData[] rows (--format json|both)
+
+lib/fixtures.ts loads the binary form straight into typed arrays.
+
+Usage:
+  python generate_fixtures.py --days 365 --campaigns 12 --rows-per-day 100 --seed 7
+"""
+import argparse
+import json
+from contextlib import ExitStack
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+
+project_name = "admybrand-insights-fixed"
+
+FIXTURE_VERSION = 2
+MAX_ROWS = 10_000_000
+# Rows generated per batch; bounds memory regardless of fixture size
+CHUNK_ROWS = 1 << 20
+# Day after the last generated date unless --end-date says otherwise
+DEFAULT_END_DATE = date(2025, 1, 1)
+
+BASE_CAMPAIGNS = ["Search", "Social", "Display", "Email"]
+CHANNELS = ["Google Ads", "Meta", "Programmatic", "Newsletter"]
+REGIONS = ["North America", "Europe", "Asia Pacific", "Latin America"]
+DEVICES = ["Mobile", "Desktop", "Tablet"]
+DEVICE_WEIGHTS = [0.55, 0.35, 0.10]
+CREATIVE_VARIANTS = ["A", "B", "C"]
+# Code 0 of every attribute dictionary, as in lib/aggregate.ts
+UNSET = "(not set)"
+# Attribute codes are u2, and creatives are the largest dictionary
+MAX_CAMPAIGNS = (0xFFFF - 1) // len(CREATIVE_VARIANTS)
+
+# (name, dtype) in file order; widest first so every column stays aligned
+COLUMNS = [
+    ("revenue", "<f8"),
+    ("users", "<i4"),
+    ("conversions", "<i4"),
+    ("campaign", "<u4"),
+    ("date", "<u4"),
+    ("channel", "<u2"),
+    ("region", "<u2"),
+    ("device", "<u2"),
+    ("creative", "<u2"),
+]
+DTYPE_NAMES = {"<f8": "float64", "<i4": "int32", "<u4": "uint32", "<u2": "uint16"}
+ATTRIBUTES = ("channel", "region", "device", "creative")
+
+
+def campaign_names(count):
+    """The dashboard's four campaigns, then numbered ones."""
+    names = BASE_CAMPAIGNS[:count]
+    names += [f"Campaign {i + 1}" for i in range(len(names), count)]
+    return names
+
+
+def dimension_values(names):
+    """Attribute dictionaries for the campaigns, each starting with the unset value."""
+    return {
+        "channel": [UNSET] + CHANNELS,
+        "region": [UNSET] + REGIONS,
+        "device": [UNSET] + DEVICES,
+        "creative": [UNSET] + [f"{name} {variant}" for name in names for variant in CREATIVE_VARIANTS],
+    }
+
+
+def date_range(days, end):
+    """ISO dates for the `days` days before `end`, oldest first (like generateMockData)."""
+    start = end - timedelta(days=days)
+    return [(start + timedelta(days=i)).isoformat() for i in range(days)]
+
+
+def generate_chunk(rng, first_day, day_count, campaigns, rows_per_day):
+    """Rows for `day_count` days starting at day code `first_day`, ordered by day then campaign."""
+    per_day = campaigns * rows_per_day
+    size = day_count * per_day
+
+    users = rng.integers(200, 700, size=size, dtype=np.int32)
+    conversion_rate = rng.random(size) * 0.15 + 0.05
+    conversions = np.floor(users * conversion_rate).astype(np.int32)
+    revenue_per_conversion = rng.random(size) * 50 + 25
+    revenue = np.floor(conversions * revenue_per_conversion)
+
+    campaign = np.tile(np.repeat(np.arange(campaigns, dtype=np.uint32), rows_per_day), day_count)
+    day = np.repeat(np.arange(first_day, first_day + day_count, dtype=np.uint32), per_day)
+
+    # Attribute codes are offset by one for the unset value at code 0
+    channel = (campaign % len(CHANNELS) + 1).astype(np.uint16)
+    region = rng.integers(1, len(REGIONS) + 1, size=size, dtype=np.uint16)
+    device = (rng.choice(len(DEVICES), size=size, p=DEVICE_WEIGHTS) + 1).astype(np.uint16)
+    variant = rng.integers(0, len(CREATIVE_VARIANTS), size=size)
+    creative = (campaign * len(CREATIVE_VARIANTS) + variant + 1).astype(np.uint16)
+
+    return {
+        "revenue": revenue,
+        "users": users,
+        "conversions": conversions,
+        "campaign": campaign,
+        "date": day,
+        "channel": channel,
+        "region": region,
+        "device": device,
+        "creative": creative,
+    }
+
+
+def generate_fixture(out_dir, name, days, campaigns, rows_per_day, seed, end, fmt):
+    rows = days * campaigns * rows_per_day
+    if rows > MAX_ROWS:
+        raise ValueError(f"{rows:,} rows requested; the limit is {MAX_ROWS:,}")
+    if campaigns > MAX_CAMPAIGNS:
+        raise ValueError(f"{campaigns:,} campaigns requested; the limit is {MAX_CAMPAIGNS:,}")
+
+    rng = np.random.default_rng(seed)
+    names = campaign_names(campaigns)
+    dimensions = dimension_values(names)
+    dates = date_range(days, end)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    offsets = {}
+    offset = 0
+    for column, dtype in COLUMNS:
+        offsets[column] = offset
+        offset += rows * np.dtype(dtype).itemsize
+
+    totals = {key: np.zeros(campaigns) for key in ("revenue", "users", "conversions")}
+    days_per_chunk = max(1, CHUNK_ROWS // (campaigns * rows_per_day))
+    write_json = fmt in ("json", "both")
+    write_binary = fmt in ("binary", "both")
+
+    binary_path = out_dir / f"{name}.bin"
+    with ExitStack() as stack:
+        if write_binary:
+            f = stack.enter_context(open(binary_path, "wb"))
+            f.truncate(offset)
+        if write_json:
+            # Rows are streamed into the metrics array a chunk at a time
+            json_file = stack.enter_context(open(out_dir / f"{name}.json", "w"))
+            json_file.write('{"metrics":[')
+        written = 0
+        for first_day in range(0, days, days_per_chunk):
+            chunk = generate_chunk(rng, first_day, min(days_per_chunk, days - first_day), campaigns, rows_per_day)
+
+            for key in totals:
+                totals[key] += np.bincount(chunk["campaign"], weights=chunk[key], minlength=campaigns)
+
+            if write_binary:
+                for column, dtype in COLUMNS:
+                    f.seek(offsets[column] + written * np.dtype(dtype).itemsize)
+                    f.write(chunk[column].astype(dtype, copy=False).tobytes())
+
+            if write_json:
+                if written:
+                    json_file.write(",")
+                json_file.write(",".join(
+                    json.dumps({
+                        "date": dates[d],
+                        "revenue": int(r),
+                        "users": int(u),
+                        "conversions": int(c),
+                        "campaign": names[k],
+                        **{attribute: dimensions[attribute][code] for attribute, code in zip(ATTRIBUTES, codes)},
+                    }, separators=(",", ":"))
+                    for d, r, u, c, k, *codes in zip(
+                        chunk["date"].tolist(),
+                        chunk["revenue"].tolist(),
+                        chunk["users"].tolist(),
+                        chunk["conversions"].tolist(),
+                        chunk["campaign"].tolist(),
+                        *(chunk[attribute].tolist() for attribute in ATTRIBUTES),
+                    )
+                ))
+            written += len(chunk["users"])
+
+        # Campaign rates are drawn after the rows, mirroring campaignData in mockData.ts
+        ctr = rng.random(campaigns) * 5 + 2
+        cost_ratio = rng.random(campaigns) * 0.3 + 0.2
+        campaign_data = [
+            {
+                "campaign": names[k],
+                "revenue": int(totals["revenue"][k]),
+                "users": int(totals["users"][k]),
+                "conversions": int(totals["conversions"][k]),
+                "ctr": float(ctr[k]),
+                "cost": int(np.floor(totals["revenue"][k] * cost_ratio[k])),
+            }
+            for k in range(campaigns)
+        ]
+        if write_json:
+            json_file.write('],"campaigns":')
+            json.dump(campaign_data, json_file, separators=(",", ":"))
+            json_file.write("}")
+
+    manifest = {
+        "version": FIXTURE_VERSION,
+        "name": name,
+        "seed": seed,
+        "rows": rows,
+        "days": days,
+        "rowsPerDay": rows_per_day,
+        "campaigns": names,
+        "dates": dates,
+        "dimensions": dimensions,
+        "binary": binary_path.name if write_binary else None,
+        "columns": {
+            column: {"dtype": DTYPE_NAMES[dtype], "offset": offsets[column]} for column, dtype in COLUMNS
+        },
+        "campaignData": campaign_data,
+    }
+    with open(out_dir / f"{name}.manifest.json", "w") as f:
+        json.dump(manifest, f, separators=(",", ":"))
+
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate seeded mock datasets for ADmyBRAND Insights")
+    parser.add_argument("--name", help="fixture name (default: derived from the shape and seed)")
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--campaigns", type=int, default=len(BASE_CAMPAIGNS))
+    parser.add_argument("--rows-per-day", type=int, default=1, help="rows per campaign per day")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--end-date", type=date.fromisoformat, default=None,
+                        help=f"day after the last generated date (default: {DEFAULT_END_DATE})")
+    parser.add_argument("--format", choices=["binary", "json", "both"], default="binary")
+    parser.add_argument("--out-dir", type=Path, default=Path(project_name) / "public" / "fixtures")
+    args = parser.parse_args()
+
+    for option in ("days", "campaigns", "rows_per_day"):
+        if getattr(args, option) < 1:
+            parser.error(f"--{option.replace('_', '-')} must be at least 1")
+
+    name = args.name or f"metrics-{args.days}d-{args.campaigns}c-{args.rows_per_day}r-s{args.seed}"
+    try:
+        manifest = generate_fixture(
+            args.out_dir,
+            name,
+            args.days,
+            args.campaigns,
+            args.rows_per_day,
+            args.seed,
+            args.end_date or DEFAULT_END_DATE,
+            args.format,
+        )
+    except ValueError as error:
+        parser.error(str(error))
+
+    print(f"Generated fixture: {name}")
+    print(f"  - rows: {manifest['rows']:,} ({args.days} days x {args.campaigns} campaigns x {args.rows_per_day})")
+    print(f"  - seed: {args.seed}")
+    print(f"  - output: {args.out_dir}/")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import type { MetricData } from './mockData';
+
+export const campaignNames = ['Search', 'Social', 'Display', 'Email'];
+
+// Breakdown attributes; channels follow campaignNames' order
+export const channelNames = ['Google Ads', 'Meta', 'Programmatic', 'Newsletter'];
+export const regionNames = ['North America', 'Europe', 'Asia Pacific', 'Latin America'];
+export const deviceNames = ['Mobile', 'Desktop', 'Tablet'];
+export const creativeVariants = ['A', 'B', 'C'];
+
+// A campaign always runs on the same channel
+const channelFor = (campaign: string) => {
+  const known = campaignNames.indexOf(campaign);
+  if (known >= 0) return channelNames[known];
+  let hash = 0;
+  for (let i = 0; i < campaign.length; i++) hash = (hash * 31 + campaign.charCodeAt(i)) >>> 0;
+  return channelNames[hash % channelNames.length];
+};
+
+// 55% mobile, 35% desktop, 10% tablet
+const pickDevice = () => {
+  const draw = Math.random();
+  return deviceNames[draw < 0.55 ? 0 : draw < 0.9 ? 1 : 2];
+};
+
+const pick = (values: string[]) => values[Math.floor(Math.random() * values.length)];
+
+// Creative labels per campaign, built once so rows share the same strings
+const creativePools = new Map<string, string[]>();
+const creativesFor = (campaign: string) => {
+  let pool = creativePools.get(campaign);
+  if (!pool) {
+    pool = creativeVariants.map(variant => `${campaign} ${variant}`);
+    creativePools.set(campaign, pool);
+  }
+  return pool;
+};
+
+// Simulate one day of activity for a campaign. Metrics only: the live feeds
+// and the browser never group by the breakdown attributes
+export const generateMetricRow = (date: string, campaign: string): MetricData => {
+  const users = Math.floor(Math.random() * 500) + 200;
+  const conversionRate = Math.random() * 0.15 + 0.05; // 5-20% conversion rate
+  const conversions = Math.floor(users * conversionRate);
+  const revenuePerConversion = Math.random() * 50 + 25; // $25-75 per conversion
+  const revenue = Math.floor(conversions * revenuePerConversion);
+
+  return { date, revenue, users, conversions, campaign };
+};
+
+// A metric row with breakdown attributes, for the server-side dataset that
+// group-by queries run over (see lib/dimensions.ts)
+export const generateAttributedRow = (date: string, campaign: string): MetricData => ({
+  ...generateMetricRow(date, campaign),
+  channel: channelFor(campaign),
+  region: pick(regionNames),
+  device: pickDevice(),
+  creative: pick(creativesFor(campaign)),
+});
+
+// Simulated click-through rate and cost-to-revenue ratio for a campaign
+export const generateCampaignRates = () => ({
+  ctr: Math.random() * 5 + 2, // 2-7% CTR
+  costRatio: Math.random() * 0.3 + 0.2 // 20-50% of revenue as cost
+});
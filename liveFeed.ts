@@ -0,0 +1,86 @@
+import type { MetricData } from './mockData';
+import { campaignNames, generateMetricRow } from './generators';
+import { decodeRowDelta, type RowDelta } from '@/lib/rowDelta';
+
+interface MockFeedOptions {
+  intervalMs?: number;
+  rowsPerTick?: number;
+  campaigns?: string[];
+}
+
+// Timer-driven stand-in for a real event stream: every tick emits a batch of
+// rows for today drawn from the same distributions as the mock dataset.
+// Raise `rowsPerTick` to load-test the ingestion path offline.
+export function startMockFeed(
+  onRows: (rows: MetricData[]) => void,
+  { intervalMs = 5000, campaigns = campaignNames, rowsPerTick = campaigns.length }: MockFeedOptions = {}
+): () => void {
+  const interval = setInterval(() => {
+    const date = new Date().toISOString().split('T')[0];
+    const rows: MetricData[] = [];
+    for (let i = 0; i < rowsPerTick; i++) {
+      rows.push(generateMetricRow(date, campaigns[i % campaigns.length]));
+    }
+    onRows(rows);
+  }, intervalMs);
+
+  return () => clearInterval(interval);
+}
+
+interface RowPollOptions {
+  tenant?: string;
+  intervalMs?: number;
+  endpoint?: string;
+  // Read before every poll: the cursor to continue from, e.g. the snapshot's
+  // or that of the last rows applied. Without it the poll starts at the log's
+  // current end and follows its own responses
+  cursor?: () => string | null;
+}
+
+// Poll /api/dashboard/rows for rows appended since the current cursor. Each
+// request carries the cursor as `since` and If-None-Match, so an unchanged log
+// costs an empty 304; new rows arrive column-encoded (see lib/rowDelta.ts).
+// `onRows` gets every delta's rows, possibly none, with the cursor to continue
+// from. A response to a cursor that changed while it was in flight is dropped.
+// Failed polls are retried on the next tick.
+export function startRowPoll(
+  onRows: (rows: MetricData[], cursor: string) => void,
+  { tenant, intervalMs = 5000, endpoint = '/api/dashboard/rows', cursor: readCursor }: RowPollOptions = {}
+): () => void {
+  let last: string | null = null;
+  const currentCursor = readCursor ?? (() => last);
+  let inFlight = false;
+  let stopped = false;
+
+  const poll = async () => {
+    if (inFlight) return;
+    inFlight = true;
+    try {
+      const since = currentCursor();
+      const params = new URLSearchParams();
+      if (tenant) params.set('tenant', tenant);
+      if (since) params.set('since', since);
+      const response = await fetch(`${endpoint}?${params}`, {
+        cache: 'no-store',
+        headers: since ? { 'If-None-Match': `"${since}"` } : {},
+      });
+      if (stopped || response.status === 304 || !response.ok) return;
+
+      const delta: RowDelta = await response.json();
+      if (stopped || currentCursor() !== since) return;
+      last = delta.cursor;
+      onRows(decodeRowDelta(delta), delta.cursor);
+    } catch {
+      // Offline or a malformed body; the next tick tries again
+    } finally {
+      inFlight = false;
+    }
+  };
+
+  poll();
+  const interval = setInterval(poll, intervalMs);
+  return () => {
+    stopped = true;
+    clearInterval(interval);
+  };
+}
@@ -0,0 +1,21 @@
+import { NextResponse } from 'next/server';
+import type { DashboardQuery } from '@/lib/dashboardData';
+
+const ISO_DATE = /^\d{4}-\d{2}-\d{2}$/;
+
+// The shared tenant and range parameters, or a 400 response when they are malformed
+export function parseRangeParams(params: URLSearchParams, defaultTenant: string): DashboardQuery | NextResponse {
+  const tenant = params.get('tenant') ?? defaultTenant;
+  const from = params.get('from') ?? undefined;
+  const to = params.get('to') ?? undefined;
+  const daysParam = params.get('days');
+
+  if ((from && !ISO_DATE.test(from)) || (to && !ISO_DATE.test(to))) {
+    return NextResponse.json({ error: 'from and to must be YYYY-MM-DD dates' }, { status: 400 });
+  }
+  const days = daysParam === null ? undefined : Number(daysParam);
+  if (days !== undefined && (!Number.isInteger(days) || days <= 0)) {
+    return NextResponse.json({ error: 'days must be a positive integer' }, { status: 400 });
+  }
+  return { tenant, from, to, days };
+}
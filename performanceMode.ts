@@ -0,0 +1,103 @@
+import { useSyncExternalStore } from 'react';
+
+// Performance mode trades decoration for frame rate on slow machines: motion
+// wrappers skip their animations, chart entrance animations are skipped,
+// and the `perf-mode` class on <html> turns off backdrop blur and CSS
+// transitions (see styles/globals.css).
+//
+// An explicit choice from the toggle is kept in localStorage. Without one the
+// mode turns itself on when the OS asks for reduced motion, or when a short
+// frame-rate probe after load finds the device cannot hold PROBE_MIN_FPS.
+const STORAGE_KEY = 'performanceMode';
+const ROOT_CLASS = 'perf-mode';
+const PROBE_FRAMES = 60;
+const PROBE_MIN_FPS = 45;
+// Frames this long are spent in the background (e.g. a hidden tab), not rendering
+const PROBE_MAX_FRAME_MS = 250;
+
+export type PerformanceModeSource = 'user' | 'reduced-motion' | 'frame-rate' | 'default';
+
+interface PerformanceModeState {
+  enabled: boolean;
+  source: PerformanceModeSource;
+}
+
+const SERVER_STATE: PerformanceModeState = { enabled: false, source: 'default' };
+
+let state = SERVER_STATE;
+let initialized = false;
+const listeners = new Set<() => void>();
+
+function apply(next: PerformanceModeState) {
+  state = next;
+  document.documentElement.classList.toggle(ROOT_CLASS, next.enabled);
+  listeners.forEach(listener => listener());
+}
+
+// Average frame rate over the next PROBE_FRAMES animation frames
+function probeFrameRate(): Promise<number> {
+  return new Promise(resolve => {
+    const durations: number[] = [];
+    let last = 0;
+    const step = (time: number) => {
+      if (last > 0 && time - last < PROBE_MAX_FRAME_MS) durations.push(time - last);
+      last = time;
+      if (durations.length < PROBE_FRAMES) {
+        requestAnimationFrame(step);
+        return;
+      }
+      const total = durations.reduce((sum, duration) => sum + duration, 0);
+      resolve((1000 * durations.length) / total);
+    };
+    requestAnimationFrame(step);
+  });
+}
+
+// Restore the stored choice or detect a default; runs once per page load
+export function initPerformanceMode(): void {
+  if (initialized || typeof window === 'undefined') return;
+  initialized = true;
+
+  const stored = localStorage.getItem(STORAGE_KEY);
+  if (stored === 'on' || stored === 'off') {
+    apply({ enabled: stored === 'on', source: 'user' });
+    return;
+  }
+
+  const reducedMotion = window.matchMedia('(prefers-reduced-motion: reduce)');
+  if (reducedMotion.matches) {
+    apply({ enabled: true, source: 'reduced-motion' });
+    return;
+  }
+
+  probeFrameRate().then(fps => {
+    // The user may have chosen while the probe ran
+    if (state.source === 'user') return;
+    if (fps < PROBE_MIN_FPS) apply({ enabled: true, source: 'frame-rate' });
+  });
+}
+
+export function setPerformanceMode(enabled: boolean): void {
+  localStorage.setItem(STORAGE_KEY, enabled ? 'on' : 'off');
+  apply({ enabled, source: 'user' });
+}
+
+export function getPerformanceMode(): PerformanceModeState {
+  return state;
+}
+
+function subscribe(listener: () => void): () => void {
+  listeners.add(listener);
+  return () => {
+    listeners.delete(listener);
+  };
+}
+
+// Whether performance mode is on; false during server rendering and hydration
+export function usePerformanceMode(): boolean {
+  return useSyncExternalStore(
+    subscribe,
+    () => state.enabled,
+    () => SERVER_STATE.enabled
+  );
+}
@@ -0,0 +1,340 @@
+import type { MetricData } from '@/data/mockData';
+import type { CampaignSeries, MetricColumns, MetricTotals } from '@/lib/aggregate';
+
+export type Granularity = 'hour' | 'day' | 'week' | 'month';
+
+// Finest first; queries walk this list towards coarser levels
+export const GRANULARITIES: Granularity[] = ['hour', 'day', 'week', 'month'];
+
+const HOUR_MS = 3_600_000;
+const DAY_MS = 86_400_000;
+
+// Nominal bucket widths, used to estimate how many points a range produces
+const BUCKET_MS: Record<Granularity, number> = {
+  hour: HOUR_MS,
+  day: DAY_MS,
+  week: 7 * DAY_MS,
+  month: 30 * DAY_MS,
+};
+
+// One chart point: the bucket's start as an ISO label (2024-05-06T13:00Z for
+// hours, 2024-05-06 for days and weeks, 2024-05 for months) plus its sums
+export interface RollupPoint extends MetricTotals {
+  date: string;
+}
+
+export interface RollupQuery {
+  // Inclusive range in epoch milliseconds; defaults to the stored extent
+  from?: number;
+  to?: number;
+  // Chart width in pixels; the result has at most one point per pixel where a level allows it
+  width: number;
+  // Restrict the sums to one campaign
+  campaign?: string;
+}
+
+export interface RollupSeries {
+  granularity: Granularity;
+  points: RollupPoint[];
+}
+
+// The buckets of a RollupStore in flat typed arrays, compact enough to persist
+// (see lib/snapshotCache.ts). Bucket k of a level spans sums[k * width] to
+// sums[(k + 1) * width - 1], laid out as in Level below
+export interface RollupSnapshot {
+  // Campaign names in code order
+  campaigns: string[];
+  hasTimeOfDay: boolean;
+  // Sums per bucket: 3 totals plus 3 per campaign
+  width: number;
+  levels: Record<Granularity, { keys: Int32Array; sums: Float64Array }>;
+}
+
+export interface RollupStore {
+  add(date: string, campaign: string, revenue: number, users: number, conversions: number): void;
+  addRows(rows: MetricData[]): void;
+  addColumns(columns: MetricColumns): void;
+  addSeries(series: CampaignSeries): void;
+  // [first, last] bucket start in epoch milliseconds, or null when empty
+  extent(): [number, number] | null;
+  query(query: RollupQuery): RollupSeries;
+  // Copy the buckets out, or replace them with saved ones; load skips rebuilding from rows
+  save(): RollupSnapshot;
+  load(snapshot: RollupSnapshot): void;
+  clear(): void;
+}
+
+// Buckets of one granularity, ascending by key. Each bucket's sums are laid out
+// as [total revenue, users, conversions, then the same three per campaign code]
+interface Level {
+  keys: number[];
+  sums: number[][];
+}
+
+// Epoch milliseconds of an ISO date or date-time, read as UTC. Date-only values
+// fall at midnight, so they land in the day's first hour bucket
+function parseTime(date: string): number {
+  const hour = date.length >= 13 ? Number(date.slice(11, 13)) : 0;
+  return Date.UTC(Number(date.slice(0, 4)), Number(date.slice(5, 7)) - 1, Number(date.slice(8, 10)), hour);
+}
+
+function bucketKey(granularity: Granularity, time: number): number {
+  switch (granularity) {
+    case 'hour':
+      return Math.floor(time / HOUR_MS);
+    case 'day':
+      return Math.floor(time / DAY_MS);
+    case 'week':
+      // Day 0 (1970-01-01) was a Thursday; shift so weeks start on Monday
+      return Math.floor((Math.floor(time / DAY_MS) + 3) / 7);
+    case 'month': {
+      const at = new Date(time);
+      return (at.getUTCFullYear() - 1970) * 12 + at.getUTCMonth();
+    }
+  }
+}
+
+function bucketStart(granularity: Granularity, key: number): number {
+  switch (granularity) {
+    case 'hour':
+      return key * HOUR_MS;
+    case 'day':
+      return key * DAY_MS;
+    case 'week':
+      return (key * 7 - 3) * DAY_MS;
+    case 'month':
+      return Date.UTC(1970 + Math.floor(key / 12), key % 12, 1);
+  }
+}
+
+function bucketLabel(granularity: Granularity, key: number): string {
+  const iso = new Date(bucketStart(granularity, key)).toISOString();
+  switch (granularity) {
+    case 'hour':
+      return `${iso.slice(0, 13)}:00Z`;
+    case 'month':
+      return iso.slice(0, 7);
+    default:
+      return iso.slice(0, 10);
+  }
+}
+
+// First position in the ascending keys whose key is >= `key`
+function lowerBound(keys: number[], key: number): number {
+  let low = 0;
+  let high = keys.length;
+  while (low < high) {
+    const mid = (low + high) >>> 1;
+    if (keys[mid] < key) low = mid + 1;
+    else high = mid;
+  }
+  return low;
+}
+
+// Pre-aggregated buckets at hour, day, week and month granularity, per campaign.
+// Each added row updates one bucket per level: O(1) when it lands in or after
+// the newest bucket, as seeds and live rows do. An older timestamp costs a
+// binary search, plus an O(buckets) splice if its bucket is new. A query reads
+// only the buckets it returns, so range changes cost O(points rendered)
+export function createRollupStore(): RollupStore {
+  const levels: Record<Granularity, Level> = {
+    hour: { keys: [], sums: [] },
+    day: { keys: [], sums: [] },
+    week: { keys: [], sums: [] },
+    month: { keys: [], sums: [] },
+  };
+  const campaignCodes = new Map<string, number>();
+  // Hourly buckets are only meaningful once a row carries a time of day
+  let hasTimeOfDay = false;
+
+  const campaignCode = (campaign: string) => {
+    let code = campaignCodes.get(campaign);
+    if (code === undefined) {
+      code = campaignCodes.size;
+      campaignCodes.set(campaign, code);
+    }
+    return code;
+  };
+
+  // Find or insert the bucket; live data almost always hits the newest one
+  const bucket = (level: Level, key: number): number[] => {
+    const last = level.keys.length - 1;
+    if (last >= 0 && level.keys[last] === key) return level.sums[last];
+
+    const position = last >= 0 && level.keys[last] < key ? last + 1 : lowerBound(level.keys, key);
+    if (level.keys[position] === key) return level.sums[position];
+    const sums = [0, 0, 0];
+    level.keys.splice(position, 0, key);
+    level.sums.splice(position, 0, sums);
+    return sums;
+  };
+
+  // Bucket keys of one timestamp at every level, in GRANULARITIES order
+  const keysOf = (date: string) => {
+    if (date.length > 10) hasTimeOfDay = true;
+    const time = parseTime(date);
+    return GRANULARITIES.map(granularity => bucketKey(granularity, time));
+  };
+
+  const addAt = (keys: number[], code: number, revenue: number, users: number, conversions: number) => {
+    const slot = 3 + code * 3;
+    for (let g = 0; g < GRANULARITIES.length; g++) {
+      const sums = bucket(levels[GRANULARITIES[g]], keys[g]);
+      while (sums.length < slot + 3) sums.push(0);
+      sums[0] += revenue;
+      sums[1] += users;
+      sums[2] += conversions;
+      sums[slot] += revenue;
+      sums[slot + 1] += users;
+      sums[slot + 2] += conversions;
+    }
+  };
+
+  const clear = () => {
+    GRANULARITIES.forEach(granularity => {
+      levels[granularity] = { keys: [], sums: [] };
+    });
+    campaignCodes.clear();
+    hasTimeOfDay = false;
+  };
+
+  // Estimated points for the range at each level, from the nominal bucket width
+  const pickGranularity = (from: number, to: number, width: number): Granularity => {
+    const start = hasTimeOfDay ? 0 : 1;
+    for (let g = start; g < GRANULARITIES.length; g++) {
+      const granularity = GRANULARITIES[g];
+      if ((to - from) / BUCKET_MS[granularity] + 1 <= width) return granularity;
+    }
+    return 'month';
+  };
+
+  return {
+    add(date, campaign, revenue, users, conversions) {
+      addAt(keysOf(date), campaignCode(campaign), revenue, users, conversions);
+    },
+
+    addRows(rows) {
+      let lastDate = '';
+      let keys: number[] = [];
+      for (let i = 0; i < rows.length; i++) {
+        const row = rows[i];
+        if (row.date !== lastDate) {
+          lastDate = row.date;
+          keys = keysOf(row.date);
+        }
+        addAt(keys, campaignCode(row.campaign), row.revenue, row.users, row.conversions);
+      }
+    },
+
+    addColumns(columns) {
+      // Sum rows per (date, campaign) code pair first, so the levels are
+      // touched once per pair rather than once per row
+      const stride = columns.campaigns.length * 3;
+      const pairSums = new Float64Array(columns.dates.length * stride);
+      for (let i = 0; i < columns.length; i++) {
+        const g = columns.date[i] * stride + columns.campaign[i] * 3;
+        pairSums[g] += columns.revenue[i];
+        pairSums[g + 1] += columns.users[i];
+        pairSums[g + 2] += columns.conversions[i];
+      }
+
+      const codes = columns.campaigns.map(campaignCode);
+      columns.dates.forEach((date, d) => {
+        const keys = keysOf(date);
+        for (let c = 0; c < codes.length; c++) {
+          const g = d * stride + c * 3;
+          if (pairSums[g] === 0 && pairSums[g + 1] === 0 && pairSums[g + 2] === 0) continue;
+          addAt(keys, codes[c], pairSums[g], pairSums[g + 1], pairSums[g + 2]);
+        }
+      });
+    },
+
+    addSeries({ days, campaigns, values }) {
+      const codes = campaigns.map(campaignCode);
+      for (let k = 0; k < days.length; k++) {
+        const keys = keysOf(days[k]);
+        for (let c = 0; c < codes.length; c++) {
+          const v = (k * codes.length + c) * 3;
+          if (values[v] === 0 && values[v + 1] === 0 && values[v + 2] === 0) continue;
+          addAt(keys, codes[c], values[v], values[v + 1], values[v + 2]);
+        }
+      }
+    },
+
+    save() {
+      const width = 3 + campaignCodes.size * 3;
+      const saved = {} as RollupSnapshot['levels'];
+      GRANULARITIES.forEach(granularity => {
+        const { keys, sums } = levels[granularity];
+        const flat = new Float64Array(keys.length * width);
+        // Buckets only grow as wide as the highest campaign code they have seen
+        sums.forEach((bucketSums, k) => flat.set(bucketSums, k * width));
+        saved[granularity] = { keys: Int32Array.from(keys), sums: flat };
+      });
+      const campaigns: string[] = [];
+      campaignCodes.forEach((code, campaign) => {
+        campaigns[code] = campaign;
+      });
+      return { campaigns, hasTimeOfDay, width, levels: saved };
+    },
+
+    load(snapshot) {
+      clear();
+      snapshot.campaigns.forEach(campaignCode);
+      hasTimeOfDay = snapshot.hasTimeOfDay;
+      const { width } = snapshot;
+      GRANULARITIES.forEach(granularity => {
+        const { keys, sums } = snapshot.levels[granularity];
+        const level = levels[granularity];
+        for (let k = 0; k < keys.length; k++) {
+          level.keys.push(keys[k]);
+          level.sums.push(Array.prototype.slice.call(sums.subarray(k * width, (k + 1) * width)));
+        }
+      });
+    },
+
+    clear,
+
+    extent() {
+      const { keys } = levels.hour;
+      if (keys.length === 0) return null;
+      return [bucketStart('hour', keys[0]), bucketStart('hour', keys[keys.length - 1])];
+    },
+
+    query({ from, to, width, campaign }) {
+      const { keys: hours } = levels.hour;
+      if (hours.length === 0) return { granularity: hasTimeOfDay ? 'hour' : 'day', points: [] };
+      const rangeFrom = from ?? bucketStart('hour', hours[0]);
+      const rangeTo = to ?? bucketStart('hour', hours[hours.length - 1]);
+
+      const granularity = pickGranularity(rangeFrom, rangeTo, Math.max(1, width));
+      const level = levels[granularity];
+      const start = lowerBound(level.keys, bucketKey(granularity, rangeFrom));
+      const end = lowerBound(level.keys, bucketKey(granularity, rangeTo) + 1);
+
+      const code = campaign === undefined ? undefined : campaignCodes.get(campaign);
+      if (campaign !== undefined && code === undefined) return { granularity, points: [] };
+      const slot = code === undefined ? 0 : 3 + code * 3;
+
+      const points: RollupPoint[] = [];
+      for (let k = start; k < end; k++) {
+        const sums = level.sums[k];
+        points.push({
+          date: bucketLabel(granularity, level.keys[k]),
+          revenue: sums[slot] ?? 0,
+          users: sums[slot + 1] ?? 0,
+          conversions: sums[slot + 2] ?? 0,
+        });
+      }
+      return { granularity, points };
+    },
+  };
+}
+
+// The last `days` calendar days up to the newest bucket, bucketed for `width` pixels
+export function queryRecentDays(store: RollupStore, days: number, width: number, campaign?: string): RollupSeries {
+  const extent = store.extent();
+  if (!extent) return store.query({ width, campaign });
+  const from = (Math.floor(extent[1] / DAY_MS) - (days - 1)) * DAY_MS;
+  return store.query({ from, to: extent[1], width, campaign });
+}
@@ -0,0 +1,19 @@
+import { NextResponse, type NextRequest } from 'next/server';
+import { DEFAULT_TENANT, getDashboardSnapshot } from '@/lib/dashboardData';
+import { parseRangeParams } from './params';
+
+// GET /api/dashboard?tenant=acme&days=30 or ?from=2024-01-01&to=2024-03-31
+// Returns the aggregated snapshot for the tenant and range, never raw rows
+export async function GET(request: NextRequest) {
+  const query = parseRangeParams(request.nextUrl.searchParams, DEFAULT_TENANT);
+  if (query instanceof NextResponse) return query;
+
+  const snapshot = await getDashboardSnapshot(query);
+  if (!snapshot) {
+    return NextResponse.json({ error: `Unknown tenant: ${query.tenant}` }, { status: 404 });
+  }
+
+  return NextResponse.json(snapshot, {
+    headers: { 'Cache-Control': 'private, max-age=60' },
+  });
+}
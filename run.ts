@@ -0,0 +1,251 @@
+// Headless benchmarks for the dashboard's data-processing hot paths.
+//
+//   npm run bench -- [--sizes 1000,100000] [--cases summaryMetrics,csvExport]
+//                    [--budget 2000] [--all] [--out results.json]
+//                    [--compare baseline.json] [--threshold 10]
+//
+// Inputs are the seeded fixtures written by generate_fixtures.py to
+// public/fixtures/, one per dataset size. Results are written as JSON so runs
+// from different commits can be compared with --compare; a p50 slowdown beyond
+// --threshold percent is reported as a regression and fails the run.
+import { execSync } from 'child_process';
+import { existsSync, mkdirSync, readdirSync, readFileSync, writeFileSync } from 'fs';
+import path from 'path';
+import { performance } from 'perf_hooks';
+import { decodeFixture, type FixtureManifest } from '@/lib/fixtures';
+import type { MetricColumns } from '@/lib/aggregate';
+import { benchCases, type BenchCase } from './cases';
+
+interface BenchResult {
+  case: string;
+  rows: number;
+  fixture: string;
+  iterations: number;
+  p50Ms: number;
+  p99Ms: number;
+  meanMs: number;
+  rowsPerSec: number;
+  // Growth of heap plus ArrayBuffer memory over the post-setup baseline,
+  // sampled after every iteration while the iteration's result is still live
+  peakHeapBytes: number;
+}
+
+interface BenchReport {
+  version: number;
+  commit: string | null;
+  node: string;
+  platform: string;
+  date: string;
+  results: BenchResult[];
+}
+
+const REPORT_VERSION = 1;
+const DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000, 10_000_000];
+const FIXTURE_DIR = path.join(process.cwd(), 'public', 'fixtures');
+const RESULTS_DIR = path.join(process.cwd(), 'bench', 'results');
+const MIN_ITERATIONS = 3;
+const MAX_ITERATIONS = 200;
+
+const gc = (globalThis as { gc?: () => void }).gc;
+
+function parseArgs(argv: string[]) {
+  const options = {
+    sizes: DEFAULT_SIZES,
+    cases: null as string[] | null,
+    budgetMs: 2000,
+    all: false,
+    out: null as string | null,
+    compare: null as string | null,
+    threshold: 10,
+  };
+
+  for (let i = 0; i < argv.length; i++) {
+    const value = () => {
+      if (i + 1 >= argv.length) throw new Error(`Missing value for ${argv[i]}`);
+      return argv[++i];
+    };
+    switch (argv[i]) {
+      case '--sizes':
+        options.sizes = value().split(',').map(Number);
+        break;
+      case '--cases':
+        options.cases = value().split(',');
+        break;
+      case '--budget':
+        options.budgetMs = Number(value());
+        break;
+      case '--all':
+        options.all = true;
+        break;
+      case '--out':
+        options.out = value();
+        break;
+      case '--compare':
+        options.compare = value();
+        break;
+      case '--threshold':
+        options.threshold = Number(value());
+        break;
+      default:
+        throw new Error(`Unknown option ${argv[i]}`);
+    }
+  }
+
+  return options;
+}
+
+function currentCommit(): string | null {
+  try {
+    return execSync('git rev-parse --short HEAD', { stdio: ['ignore', 'pipe', 'ignore'] }).toString().trim();
+  } catch {
+    return null;
+  }
+}
+
+function memoryInUse(): number {
+  const { heapUsed, arrayBuffers } = process.memoryUsage();
+  return heapUsed + arrayBuffers;
+}
+
+// Nearest-rank percentile of an ascending sample
+function percentile(sorted: number[], p: number): number {
+  return sorted[Math.max(0, Math.ceil(p * sorted.length) - 1)];
+}
+
+// Find the fixture with exactly `rows` rows and map it into typed arrays
+function loadFixture(rows: number): { name: string; columns: MetricColumns } {
+  const manifests = existsSync(FIXTURE_DIR)
+    ? readdirSync(FIXTURE_DIR).filter(file => file.endsWith('.manifest.json'))
+    : [];
+
+  for (let i = 0; i < manifests.length; i++) {
+    const manifest: FixtureManifest = JSON.parse(readFileSync(path.join(FIXTURE_DIR, manifests[i]), 'utf8'));
+    if (manifest.rows !== rows || !manifest.binary) continue;
+
+    const file = readFileSync(path.join(FIXTURE_DIR, manifest.binary));
+    const buffer = file.buffer.slice(file.byteOffset, file.byteOffset + file.byteLength) as ArrayBuffer;
+    return { name: manifest.name, columns: decodeFixture(manifest, buffer) };
+  }
+
+  const rowsPerDay = Math.max(1, Math.round(rows / 1000));
+  throw new Error(
+    `No fixture with ${rows} rows in ${FIXTURE_DIR}. Generate one with:\n` +
+      `  python generate_fixtures.py --days 250 --campaigns 4 --rows-per-day ${rowsPerDay}`
+  );
+}
+
+// Time `run` until the budget is spent (at least MIN_ITERATIONS, after one warm-up)
+function measure(benchCase: BenchCase, state: unknown, budgetMs: number) {
+  const warmStart = performance.now();
+  benchCase.run(state);
+  const warmMs = performance.now() - warmStart;
+
+  gc?.();
+  const baseline = memoryInUse();
+  let peak = baseline;
+  const samples: number[] = [];
+  const deadline = performance.now() + Math.max(budgetMs - warmMs, 0);
+
+  while (samples.length < MIN_ITERATIONS || (samples.length < MAX_ITERATIONS && performance.now() < deadline)) {
+    const start = performance.now();
+    const result = benchCase.run(state);
+    samples.push(performance.now() - start);
+    peak = Math.max(peak, memoryInUse());
+    if (result === undefined) throw new Error(`${benchCase.name} returned nothing`);
+  }
+
+  return { samples, peakHeapBytes: peak - baseline };
+}
+
+function formatMs(ms: number): string {
+  return ms < 1 ? `${(ms * 1000).toFixed(1)}µs` : `${ms.toFixed(2)}ms`;
+}
+
+function compareReports(baseline: BenchReport, current: BenchReport, threshold: number): number {
+  let regressions = 0;
+  console.log(`\nCompared with ${baseline.commit ?? 'baseline'} (${baseline.date}):`);
+
+  current.results.forEach(result => {
+    const before = baseline.results.find(entry => entry.case === result.case && entry.rows === result.rows);
+    if (!before) return;
+
+    const change = ((result.p50Ms - before.p50Ms) / before.p50Ms) * 100;
+    const regressed = change > threshold;
+    if (regressed) regressions++;
+    console.log(
+      `  ${regressed ? '✗' : '✓'} ${result.case.padEnd(16)} ${String(result.rows).padStart(10)} rows  ` +
+        `p50 ${formatMs(before.p50Ms)} → ${formatMs(result.p50Ms)} (${change >= 0 ? '+' : ''}${change.toFixed(1)}%)`
+    );
+  });
+
+  return regressions;
+}
+
+function main() {
+  const options = parseArgs(process.argv.slice(2));
+  const cases = options.cases
+    ? benchCases.filter(benchCase => options.cases!.includes(benchCase.name))
+    : benchCases;
+  if (!gc) console.warn('Run node with --expose-gc for stable heap measurements');
+
+  const results: BenchResult[] = [];
+  options.sizes.forEach(rows => {
+    const { name, columns } = loadFixture(rows);
+    console.log(`\n${name} (${rows.toLocaleString('en-US')} rows)`);
+
+    cases.forEach(benchCase => {
+      if (!options.all && benchCase.maxRows !== undefined && rows > benchCase.maxRows) {
+        console.log(`  ${benchCase.name.padEnd(16)} skipped (over ${benchCase.maxRows.toLocaleString('en-US')} rows)`);
+        return;
+      }
+
+      const state = benchCase.setup(columns);
+      const { samples, peakHeapBytes } = measure(benchCase, state, options.budgetMs);
+      const sorted = samples.slice().sort((a, b) => a - b);
+      const p50Ms = percentile(sorted, 0.5);
+      const result: BenchResult = {
+        case: benchCase.name,
+        rows,
+        fixture: name,
+        iterations: samples.length,
+        p50Ms,
+        p99Ms: percentile(sorted, 0.99),
+        meanMs: samples.reduce((sum, sample) => sum + sample, 0) / samples.length,
+        rowsPerSec: Math.round(rows / (p50Ms / 1000)),
+        peakHeapBytes,
+      };
+      results.push(result);
+
+      console.log(
+        `  ${benchCase.name.padEnd(16)} p50 ${formatMs(result.p50Ms).padStart(10)}  p99 ${formatMs(result.p99Ms).padStart(10)}  ` +
+          `${(result.rowsPerSec / 1e6).toFixed(1).padStart(8)}M rows/s  ` +
+          `heap +${(peakHeapBytes / 1048576).toFixed(1)}MB  (${samples.length} runs)`
+      );
+    });
+  });
+
+  const report: BenchReport = {
+    version: REPORT_VERSION,
+    commit: currentCommit(),
+    node: process.version,
+    platform: `${process.platform}-${process.arch}`,
+    date: new Date().toISOString(),
+    results,
+  };
+
+  const out = options.out ?? path.join(RESULTS_DIR, `${report.commit ?? report.date.replace(/[:.]/g, '-')}.json`);
+  mkdirSync(path.dirname(out), { recursive: true });
+  writeFileSync(out, JSON.stringify(report, null, 2) + '\n');
+  console.log(`\nResults written to ${out}`);
+
+  if (options.compare) {
+    const baseline: BenchReport = JSON.parse(readFileSync(options.compare, 'utf8'));
+    const regressions = compareReports(baseline, report, options.threshold);
+    if (regressions > 0) {
+      console.error(`${regressions} regression(s) over ${options.threshold}%`);
+      process.exitCode = 1;
+    }
+  }
+}
+
+main();
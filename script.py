@@ -12,7 +12,11 @@ directories = [
     "components", 
     "data",
     "lib",
-    "styles"
+    "styles",
+    "bench",
+    "app/api/dashboard",
+    "app/api/dashboard/breakdown",
+    "app/api/dashboard/rows"
 ]
 
 for dir_name in directories:
@@ -7,7 +7,9 @@ package_json = """{
     "dev": "next dev",
     "build": "next build",
     "start": "next start",
-    "lint": "next lint"
+    "lint": "next lint",
+    "bench": "node --expose-gc --import tsx bench/run.ts",
+    "bundle": "node --import tsx bench/bundle.ts"
   },
   "dependencies": {
     "next": "14.2.5",
@@ -33,6 +35,7 @@ package_json = """{
     "autoprefixer": "^10.4.19",
     "postcss": "^8.4.40",
     "tailwindcss": "^3.4.7",
+    "tsx": "^4.16.2",
     "eslint": "^8.57.0",
     "eslint-config-next": "14.2.5"
   }
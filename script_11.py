@@ -1,63 +1,189 @@
 # Create the ZIP file with all project files
-import zipfile
+import json
 import os
+import struct
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 zip_filename = "admybrand-insights-complete.zip"
 
-# Get all files in the project directory
+# Directory names pruned from the walk, and individual file names left out
+EXCLUDED_DIRS = {'.git', 'node_modules', '.next', '__pycache__'}
+EXCLUDED_FILES = {'.generate-manifest.json'}
+
+COMPRESS_LEVEL = 6
+# Members compressed ahead of the writer; bounds memory on large trees
+MAX_IN_FLIGHT = (os.cpu_count() or 4) * 4
+# Copy the compressed bytes of members unchanged since the previous build
+# (same size and mtime) from the old archive instead of recompressing them
+REUSE_UNCHANGED = True
+INDEX_FILENAME = zip_filename + ".index.json"
+
+LOCAL_HEADER = struct.Struct('<IHHHHHIIIHH')
+CENTRAL_HEADER = struct.Struct('<IHHHHHHIIIHHHHHII')
+END_OF_CENTRAL_DIRECTORY = struct.Struct('<IHHHHIIH')
+ZIP32_LIMIT = 0xFFFFFFFF
+
+
+# Walk the project, pruning excluded directories instead of visiting them
 def get_all_files(directory):
     files = []
     for root, dirs, filenames in os.walk(directory):
-        for filename in filenames:
-            filepath = os.path.join(root, filename)
-            # Skip certain directories
-            if any(skip in filepath for skip in ['.git', 'node_modules', '.next', '__pycache__']):
-                continue
-            files.append(filepath)
+        dirs[:] = sorted(d for d in dirs if d not in EXCLUDED_DIRS)
+        for filename in sorted(filenames):
+            if filename not in EXCLUDED_FILES:
+                files.append(os.path.join(root, filename))
     return files
 
+
+def dos_datetime(mtime):
+    t = time.localtime(max(mtime, 315532800))  # DOS dates start in 1980
+    return (t.tm_hour << 11) | (t.tm_min << 5) | (t.tm_sec // 2), \
+        ((t.tm_year - 1980) << 9) | (t.tm_mon << 5) | t.tm_mday
+
+
+# Read, checksum and deflate one member (runs in a worker thread; zlib releases the GIL)
+def compress_member(file_path, reusable):
+    if reusable is not None:
+        return reusable
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    compressor = zlib.compressobj(COMPRESS_LEVEL, zlib.DEFLATED, -15)
+    packed = compressor.compress(data) + compressor.flush()
+    method = 8
+    if len(packed) >= len(data):
+        packed, method = data, 0
+    return {'crc': zlib.crc32(data), 'size': len(data), 'method': method, 'packed': packed}
+
+
+# Compressed bytes of an unchanged member, copied raw from the previous archive
+def reuse_member(previous_zip, entry):
+    previous_zip.seek(entry['data_offset'])
+    packed = previous_zip.read(entry['compressed_size'])
+    return {'crc': entry['crc'], 'size': entry['size'], 'method': entry['method'], 'packed': packed}
+
+
+def load_index():
+    try:
+        with open(INDEX_FILENAME) as f:
+            index = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+    return index.get('members', {}) if index.get('level') == COMPRESS_LEVEL else {}
+
+
+# Stream the archive to disk in member order while workers compress ahead.
+# CRCs and sizes are known before each local header is written, so the
+# manifest comes out of the write itself and the archive is never read back
+def write_zip(all_files):
+    previous = load_index() if REUSE_UNCHANGED and os.path.exists(zip_filename) else {}
+    previous_zip = open(zip_filename, 'rb') if previous else None
+    tmp_filename = zip_filename + '.tmp'
+    members = []
+    central = []
+    reused = 0
+
+    try:
+        with open(tmp_filename, 'wb') as out, ThreadPoolExecutor() as pool:
+            pending = deque()
+
+            def drain_one():
+                nonlocal reused
+                file_path, info, future = pending.popleft()
+                member = future.result()
+                name = file_path.replace(os.sep, '/').encode('utf-8')
+                flags = 0 if name.isascii() else 0x800
+                dos_time, dos_date = dos_datetime(info.st_mtime)
+                offset = out.tell()
+                if offset > ZIP32_LIMIT or member['size'] > ZIP32_LIMIT:
+                    raise ValueError(f"{file_path}: archive too large for a ZIP32 file")
+
+                out.write(LOCAL_HEADER.pack(
+                    0x04034b50, 20, flags, member['method'], dos_time, dos_date,
+                    member['crc'], len(member['packed']), member['size'], len(name), 0,
+                ))
+                out.write(name)
+                data_offset = out.tell()
+                out.write(member['packed'])
+
+                central.append(CENTRAL_HEADER.pack(
+                    0x02014b50, (3 << 8) | 20, 20, flags, member['method'], dos_time, dos_date,
+                    member['crc'], len(member['packed']), member['size'], len(name), 0, 0, 0, 0,
+                    (info.st_mode & 0xFFFF) << 16, offset,
+                ) + name)
+                members.append({
+                    'name': name.decode('utf-8'),
+                    'size': member['size'],
+                    'compressed_size': len(member['packed']),
+                    'crc': member['crc'],
+                    'method': member['method'],
+                    'data_offset': data_offset,
+                    'mtime_ns': info.st_mtime_ns,
+                })
+                if 'reused' in member:
+                    reused += 1
+
+            for file_path in all_files:
+                info = os.stat(file_path)
+                entry = previous.get(file_path.replace(os.sep, '/'))
+                reusable = None
+                if entry and entry['size'] == info.st_size and entry['mtime_ns'] == info.st_mtime_ns:
+                    reusable = dict(reuse_member(previous_zip, entry), reused=True)
+                pending.append((file_path, info, pool.submit(compress_member, file_path, reusable)))
+                if len(pending) >= MAX_IN_FLIGHT:
+                    drain_one()
+            while pending:
+                drain_one()
+
+            central_offset = out.tell()
+            for record in central:
+                out.write(record)
+            out.write(END_OF_CENTRAL_DIRECTORY.pack(
+                0x06054b50, 0, 0, len(central), len(central),
+                out.tell() - central_offset, central_offset, 0,
+            ))
+    except BaseException:
+        if os.path.exists(tmp_filename):
+            os.remove(tmp_filename)
+        raise
+    finally:
+        if previous_zip:
+            previous_zip.close()
+
+    os.replace(tmp_filename, zip_filename)
+    with open(INDEX_FILENAME, 'w') as f:
+        json.dump({'level': COMPRESS_LEVEL, 'members': {m['name']: m for m in members}}, f)
+    return members, reused
+
+
 # Create the ZIP file
-with zipfile.ZipFile(zip_filename, 'w', zipfile.ZIP_DEFLATED) as zipf:
-    all_files = get_all_files(project_name)
-    
-    for file_path in all_files:
-        # Add file to ZIP with proper path structure
-        arcname = file_path
-        zipf.write(file_path, arcname)
-        
+all_files = get_all_files(project_name)
+members, reused = write_zip(all_files)
+
 print(f"✅ Created ZIP file: {zip_filename}")
 print(f"📦 Total files included: {len(all_files)}")
+if reused:
+    print(f"♻️  Reused {reused} unchanged members from the previous build")
 
-# List all files in the ZIP for verification
+# List the archive from the manifest recorded while writing it
 print("\n📁 Project structure in ZIP:")
-with zipfile.ZipFile(zip_filename, 'r') as zipf:
-    file_list = zipf.namelist()
-    file_list.sort()
-    
-    current_dir = ""
-    for file_path in file_list:
-        dir_parts = file_path.split('/')
-        if len(dir_parts) > 1:
-            dir_name = '/'.join(dir_parts[:-1])
-            if dir_name != current_dir:
-                current_dir = dir_name
-                print(f"📂 {dir_name}/")
-        
-        file_name = dir_parts[-1]
-        if file_name:  # Skip directories
-            indent = "  " * (len(dir_parts) - 1)
-            print(f"{indent}📄 {file_name}")
+current_dir = ""
+for file_path in sorted(member['name'] for member in members):
+    dir_parts = file_path.split('/')
+    if len(dir_parts) > 1:
+        dir_name = '/'.join(dir_parts[:-1])
+        if dir_name != current_dir:
+            current_dir = dir_name
+            print(f"📂 {dir_name}/")
+
+    file_name = dir_parts[-1]
+    if file_name:  # Skip directories
+        indent = "  " * (len(dir_parts) - 1)
+        print(f"{indent}📄 {file_name}")
 
+total_size = sum(member['size'] for member in members)
 print(f"\n🎉 Complete project ready for download: {zip_filename}")
-print(f"📊 File size: {os.path.getsize(zip_filename) / 1024:.1f} KB")
-
-# Verify ZIP file integrity
-try:
-    with zipfile.ZipFile(zip_filename, 'r') as zipf:
-        bad_files = zipf.testzip()
-        if bad_files is None:
-            print("✅ ZIP file integrity verified - all files are good!")
-        else:
-            print(f"❌ Corrupted files found: {bad_files}")
-except Exception as e:
-    print(f"❌ Error verifying ZIP file: {e}")
\ No newline at end of file
+print(f"📊 File size: {os.path.getsize(zip_filename) / 1024:.1f} KB "
+      f"({total_size / 1024:.1f} KB uncompressed, CRC-32 computed for {len(members)} members)")
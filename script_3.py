@@ -49,6 +49,28 @@ a {
   border: 1px solid rgba(255, 255, 255, 0.1);
 }
 
+/* Performance mode (lib/performanceMode.ts): no blur, shadows or transitions */
+.perf-mode .glass-effect {
+  background: rgba(255, 255, 255, 0.85);
+  backdrop-filter: none;
+  box-shadow: none;
+}
+
+.dark.perf-mode .glass-effect {
+  background: rgba(31, 41, 55, 0.9);
+}
+
+.perf-mode *,
+.perf-mode *::before,
+.perf-mode *::after {
+  transition: none !important;
+  animation: none !important;
+}
+
+.perf-mode .hover\\:scale-105:hover {
+  transform: none;
+}
+
 /* Custom scrollbar */
 ::-webkit-scrollbar {
   width: 6px;
@@ -77,12 +99,20 @@ a {
 """
 
 # Create mockData.ts with realistic sample data
-mock_data = """export interface MetricData {
+mock_data = """import { toColumns, aggregateColumns, summarize, type SummaryMetrics } from '@/lib/aggregate';
+import { campaignNames, generateAttributedRow, generateCampaignRates } from './generators';
+
+export interface MetricData {
   date: string;
   revenue: number;
   users: number;
   conversions: number;
   campaign: string;
+  // Optional breakdown attributes; see ATTRIBUTE_DIMENSIONS in lib/aggregate.ts
+  channel?: string;
+  region?: string;
+  device?: string;
+  creative?: string;
 }
 
 export interface CampaignData {
@@ -94,31 +124,23 @@ export interface CampaignData {
   cost: number;
 }
 
+// Row generators live apart from the dataset so client code (e.g. the live
+// feed) can use them without building the mock dataset in the browser
+export { campaignNames, generateMetricRow, generateAttributedRow, generateCampaignRates } from './generators';
+
 // Generate realistic marketing data for the last 30 days
 const generateMockData = (): MetricData[] => {
   const data: MetricData[] = [];
-  const campaigns = ['Search', 'Social', 'Display', 'Email'];
   const baseDate = new Date();
   baseDate.setDate(baseDate.getDate() - 30);
 
   for (let i = 0; i < 30; i++) {
     const currentDate = new Date(baseDate);
     currentDate.setDate(baseDate.getDate() + i);
+    const date = currentDate.toISOString().split('T')[0];
     
-    campaigns.forEach(campaign => {
-      const users = Math.floor(Math.random() * 500) + 200;
-      const conversionRate = Math.random() * 0.15 + 0.05; // 5-20% conversion rate
-      const conversions = Math.floor(users * conversionRate);
-      const revenuePerConversion = Math.random() * 50 + 25; // $25-75 per conversion
-      const revenue = Math.floor(conversions * revenuePerConversion);
-
-      data.push({
-        date: currentDate.toISOString().split('T')[0],
-        revenue,
-        users,
-        conversions,
-        campaign
-      });
+    campaignNames.forEach(campaign => {
+      data.push(generateAttributedRow(date, campaign));
     });
   }
 
@@ -127,33 +149,27 @@ const generateMockData = (): MetricData[] => {
 
 export const mockData: MetricData[] = generateMockData();
 
-// Aggregate campaign performance
-export const campaignData: CampaignData[] = [
-  'Search', 'Social', 'Display', 'Email'
-].map(campaign => {
-  const campaignMetrics = mockData.filter(d => d.campaign === campaign);
-  const totalRevenue = campaignMetrics.reduce((sum, d) => sum + d.revenue, 0);
-  const totalUsers = campaignMetrics.reduce((sum, d) => sum + d.users, 0);
-  const totalConversions = campaignMetrics.reduce((sum, d) => sum + d.conversions, 0);
+// Columnar copy of the dataset and its single-pass aggregates
+export const metricColumns = toColumns(mockData);
+export const metricAggregates = aggregateColumns(metricColumns);
   
-  return {
-    campaign,
-    revenue: totalRevenue,
-    users: totalUsers,
-    conversions: totalConversions,
-    ctr: Math.random() * 5 + 2, // 2-7% CTR
-    cost: Math.floor(totalRevenue * (Math.random() * 0.3 + 0.2)) // 20-50% of revenue as cost
-  };
-});
+// Aggregate campaign performance
+export const campaignData: CampaignData[] = metricAggregates.byCampaign.map(
+  ({ campaign, revenue, users, conversions }) => {
+    const { ctr, costRatio } = generateCampaignRates();
+    return {
+      campaign,
+      revenue,
+      users,
+      conversions,
+      ctr,
+      cost: Math.floor(revenue * costRatio)
+    };
+  }
+);
 
 // Summary metrics
-export const summaryMetrics = {
-  totalRevenue: mockData.reduce((sum, d) => sum + d.revenue, 0),
-  totalUsers: mockData.reduce((sum, d) => sum + d.users, 0),
-  totalConversions: mockData.reduce((sum, d) => sum + d.conversions, 0),
-  averageOrderValue: mockData.reduce((sum, d) => sum + d.revenue, 0) / mockData.reduce((sum, d) => sum + d.conversions, 0),
-  conversionRate: (mockData.reduce((sum, d) => sum + d.conversions, 0) / mockData.reduce((sum, d) => sum + d.users, 0)) * 100
-};
+export const summaryMetrics: SummaryMetrics = summarize(metricAggregates.totals);
 """
 
 # Create utility functions
@@ -164,19 +180,74 @@ export function cn(...inputs: ClassValue[]) {
   return twMerge(clsx(inputs));
 }
 
+export interface NumberFormatOptions {
+  locale?: string;
+  style?: 'decimal' | 'currency' | 'percent';
+  currency?: string;
+  minimumFractionDigits?: number;
+  maximumFractionDigits?: number;
+}
+
+const FORMATTER_CACHE_LIMIT = 32;
+const formatterCache = new Map<string, Intl.NumberFormat>();
+
+// Intl.NumberFormat construction is expensive, so formatters are pooled by
+// (locale, style, currency, fraction digits), evicting the least recently used
+export function getNumberFormatter({
+  locale = 'en-US',
+  style = 'decimal',
+  currency,
+  minimumFractionDigits,
+  maximumFractionDigits,
+}: NumberFormatOptions = {}): Intl.NumberFormat {
+  const key = `${locale}|${style}|${currency}|${minimumFractionDigits}|${maximumFractionDigits}`;
+  const cached = formatterCache.get(key);
+  if (cached) {
+    // Re-insert so Map order tracks recency
+    formatterCache.delete(key);
+    formatterCache.set(key, cached);
+    return cached;
+  }
+
+  const formatter = new Intl.NumberFormat(locale, {
+    style,
+    currency,
+    minimumFractionDigits,
+    maximumFractionDigits,
+  });
+  formatterCache.set(key, formatter);
+  if (formatterCache.size > FORMATTER_CACHE_LIMIT) {
+    formatterCache.delete(formatterCache.keys().next().value as string);
+  }
+  return formatter;
+}
+
+function currencyOptions(currency: string, locale: string): NumberFormatOptions {
+  return { locale, style: 'currency', currency, minimumFractionDigits: 0, maximumFractionDigits: 0 };
+}
+
 // Format currency
-export function formatCurrency(amount: number): string {
-  return new Intl.NumberFormat('en-US', {
-    style: 'currency',
-    currency: 'USD',
-    minimumFractionDigits: 0,
-    maximumFractionDigits: 0,
-  }).format(amount);
+export function formatCurrency(amount: number, currency = 'USD', locale = 'en-US'): string {
+  return getNumberFormatter(currencyOptions(currency, locale)).format(amount);
 }
 
 // Format number with commas
-export function formatNumber(num: number): string {
-  return new Intl.NumberFormat('en-US').format(num);
+export function formatNumber(num: number, locale = 'en-US'): string {
+  return getNumberFormatter({ locale }).format(num);
+}
+
+// Format a whole column with a single formatter lookup
+export function formatColumn(values: ArrayLike<number>, options: NumberFormatOptions = {}): string[] {
+  const formatter = getNumberFormatter(options);
+  const formatted = new Array<string>(values.length);
+  for (let i = 0; i < values.length; i++) {
+    formatted[i] = formatter.format(values[i]);
+  }
+  return formatted;
+}
+
+export function formatCurrencyColumn(values: ArrayLike<number>, currency = 'USD', locale = 'en-US'): string[] {
+  return formatColumn(values, currencyOptions(currency, locale));
 }
 
 // Format percentage
@@ -190,31 +261,84 @@ export function calculateGrowth(current: number, previous: number): number {
   return ((current - previous) / previous) * 100;
 }
 
-// Export to CSV functionality
-export function exportToCSV(data: any[], filename: string) {
-  const csvContent = convertToCSV(data);
-  downloadCSV(csvContent, filename);
+// Any plain row object; its own keys become the CSV columns
+type CSVRow = object;
+  
+interface CSVExportOptions {
+  // Rows encoded per chunk before yielding back to the event loop
+  chunkSize?: number;
+  // Row count for progress reporting when `rows` is not an array
+  total?: number;
+  onProgress?: (written: number, total: number) => void;
 }
 
-function convertToCSV(data: any[]): string {
-  if (data.length === 0) return '';
-  
-  const headers = Object.keys(data[0]);
-  const csvRows = [
-    headers.join(','),
-    ...data.map(row => 
-      headers.map(header => {
-        const value = row[header];
-        return typeof value === 'string' ? `"${value}"` : value;
-      }).join(',')
-    )
-  ];
-  
-  return csvRows.join('\\n');
+const CSV_SPECIAL = /[",\\r\\n]/;
+
+// Quote strings (and anything containing a delimiter), doubling embedded quotes
+function escapeCSVField(value: unknown): string {
+  if (value === null || value === undefined) return '';
+  const text = String(value);
+  if (typeof value === 'string' || CSV_SPECIAL.test(text)) {
+    return `"${text.replace(/"/g, '""')}"`;
+  }
+  return text;
+}
+
+// Lazily encode rows as CSV text, `chunkSize` lines per yielded chunk.
+// The header is taken from the first row's keys
+export function* csvChunks(rows: Iterable<CSVRow>, chunkSize = 5000): Generator<string, void> {
+  let headers: string[] | null = null;
+  let lines: string[] = [];
+  let pending = 0;
+
+  // Iterated by hand: the ES5 type-check target only allows for...of over arrays
+  const iterator = rows[Symbol.iterator]();
+  for (let step = iterator.next(); !step.done; step = iterator.next()) {
+    const row = step.value;
+    if (headers === null) {
+      headers = Object.keys(row);
+      lines.push(headers.map(header => (CSV_SPECIAL.test(header) ? escapeCSVField(header) : header)).join(','));
+    }
+    const record = row as Record<string, unknown>;
+    lines.push(headers.map(header => escapeCSVField(record[header])).join(','));
+    if (++pending >= chunkSize) {
+      yield lines.join('\\n') + '\\n';
+      lines = [];
+      pending = 0;
+    }
+  }
+
+  if (lines.length > 0) {
+    yield lines.join('\\n') + '\\n';
+  }
+}
+
+const yieldToEventLoop = () => new Promise<void>(resolve => setTimeout(resolve, 0));
+
+// Export to CSV functionality. The file is assembled from per-chunk Blob parts
+// so no single string holds the whole export, and the main thread is released
+// between chunks
+export async function exportToCSV(
+  rows: Iterable<CSVRow>,
+  filename: string,
+  { chunkSize = 5000, total, onProgress }: CSVExportOptions = {}
+) {
+  const rowCount = total ?? (Array.isArray(rows) ? rows.length : 0);
+  const parts: Blob[] = [];
+  let written = 0;
+
+  const chunks = csvChunks(rows, chunkSize);
+  for (let step = chunks.next(); !step.done; step = chunks.next()) {
+    parts.push(new Blob([step.value]));
+    written = Math.min(written + chunkSize, rowCount);
+    onProgress?.(written, rowCount);
+    await yieldToEventLoop();
+  }
+
+  downloadCSV(new Blob(parts, { type: 'text/csv;charset=utf-8;' }), filename);
 }
 
-function downloadCSV(csvContent: string, filename: string) {
-  const blob = new Blob([csvContent], { type: 'text/csv;charset=utf-8;' });
+function downloadCSV(blob: Blob, filename: string) {
   const link = document.createElement('a');
   const url = URL.createObjectURL(blob);
   
@@ -225,20 +349,3313 @@ function downloadCSV(csvContent: string, filename: string) {
   document.body.appendChild(link);
   link.click();
   document.body.removeChild(link);
+  setTimeout(() => URL.revokeObjectURL(url), 0);
 }
 """
 
-# Write the files
-with open(f"{project_name}/styles/globals.css", "w") as f:
-    f.write(globals_css)
+# Create columnar aggregation engine
+aggregate_ts = """import type { MetricData } from '@/data/mockData';
 
-with open(f"{project_name}/data/mockData.ts", "w") as f:
-    f.write(mock_data)
+// Optional row attributes besides campaign, each dictionary-encoded like it
+export type AttributeDimension = 'channel' | 'region' | 'device' | 'creative';
 
-with open(f"{project_name}/lib/utils.ts", "w") as f:
-    f.write(utils_ts)
+export const ATTRIBUTE_DIMENSIONS: AttributeDimension[] = ['channel', 'region', 'device', 'creative'];
+
+// Code 0 of every attribute dictionary, for rows without a value
+export const UNSET_DIMENSION_VALUE = '(not set)';
+
+// One dictionary-encoded attribute: codes[i] indexes into `values`
+export interface DimensionColumn {
+  codes: Uint16Array;
+  values: string[];
+}
+
+// Columnar layout of MetricData rows: one typed array per measure plus
+// dictionary-encoded campaign and date columns (codes index into `campaigns` / `dates`).
+// Attributes only get a column when the data carries them
+export interface MetricColumns {
+  length: number;
+  revenue: Float64Array;
+  users: Int32Array;
+  conversions: Int32Array;
+  campaign: Uint32Array;
+  date: Uint32Array;
+  campaigns: string[];
+  dates: string[];
+  dimensions: Partial<Record<AttributeDimension, DimensionColumn>>;
+}
+
+export interface MetricTotals {
+  revenue: number;
+  users: number;
+  conversions: number;
+}
+
+export interface CampaignTotals extends MetricTotals {
+  campaign: string;
+}
+
+export interface DailyTotals extends MetricTotals {
+  date: string;
+}
+
+export interface SummaryMetrics {
+  totalRevenue: number;
+  totalUsers: number;
+  totalConversions: number;
+  averageOrderValue: number;
+  conversionRate: number;
+}
+
+// Per-campaign daily sums in a compact, JSON-friendly layout: the
+// [revenue, users, conversions] of day k and campaign c start at
+// values[(k * campaigns.length + c) * 3]
+export interface CampaignSeries {
+  days: string[];
+  campaigns: string[];
+  values: number[];
+}
+
+export interface MetricAggregates {
+  totals: MetricTotals;
+  byCampaign: CampaignTotals[];
+  byDate: DailyTotals[];
+  averageOrderValue: number;
+  conversionRate: number;
+}
+
+// Look up (or assign) the dictionary code for a value
+function encode(dictionary: string[], index: Map<string, number>, value: string): number {
+  let code = index.get(value);
+  if (code === undefined) {
+    code = dictionary.length;
+    index.set(value, code);
+    dictionary.push(value);
+  }
+  return code;
+}
+
+// Convert row objects into typed-array columns
+export function toColumns(rows: MetricData[]): MetricColumns {
+  const length = rows.length;
+  const columns: MetricColumns = {
+    length,
+    revenue: new Float64Array(length),
+    users: new Int32Array(length),
+    conversions: new Int32Array(length),
+    campaign: new Uint32Array(length),
+    date: new Uint32Array(length),
+    campaigns: [],
+    dates: [],
+    dimensions: {},
+  };
+  const campaignIndex = new Map<string, number>();
+  const dateIndex = new Map<string, number>();
+  const attributeIndexes: Partial<Record<AttributeDimension, Map<string, number>>> = {};
+
+  for (let i = 0; i < length; i++) {
+    const row = rows[i];
+    columns.revenue[i] = row.revenue;
+    columns.users[i] = row.users;
+    columns.conversions[i] = row.conversions;
+    columns.campaign[i] = encode(columns.campaigns, campaignIndex, row.campaign);
+    columns.date[i] = encode(columns.dates, dateIndex, row.date);
+
+    for (let a = 0; a < ATTRIBUTE_DIMENSIONS.length; a++) {
+      const dimension = ATTRIBUTE_DIMENSIONS[a];
+      const value = row[dimension];
+      if (value === undefined) continue;
+
+      // Created on first use; earlier rows keep code 0, the unset value
+      let column = columns.dimensions[dimension];
+      let index = attributeIndexes[dimension];
+      if (!column || !index) {
+        column = { codes: new Uint16Array(length), values: [UNSET_DIMENSION_VALUE] };
+        index = new Map([[UNSET_DIMENSION_VALUE, 0]]);
+        columns.dimensions[dimension] = column;
+        attributeIndexes[dimension] = index;
+      }
+      const code = encode(column.values, index, value);
+      if (code > 0xffff) throw new RangeError(`More than 65536 distinct ${dimension} values`);
+      column.codes[i] = code;
+    }
+  }
+
+  return columns;
+}
+
+function ratio(numerator: number, denominator: number): number {
+  return denominator === 0 ? 0 : numerator / denominator;
+}
+
+// Summary card values derived from running totals
+export function summarize(totals: MetricTotals): SummaryMetrics {
+  return {
+    totalRevenue: totals.revenue,
+    totalUsers: totals.users,
+    totalConversions: totals.conversions,
+    averageOrderValue: ratio(totals.revenue, totals.conversions),
+    conversionRate: ratio(totals.conversions, totals.users) * 100,
+  };
+}
+
+// Unpack interleaved [revenue, users, conversions] group sums
+function unpackGroups<K extends string>(sums: Float64Array, keys: string[], keyName: K) {
+  return keys.map((key, code) => ({
+    [keyName]: key,
+    revenue: sums[code * 3],
+    users: sums[code * 3 + 1],
+    conversions: sums[code * 3 + 2],
+  })) as (MetricTotals & Record<K, string>)[];
+}
+
+// Compute totals, per-campaign and per-date groups in a single scan
+export function aggregateColumns(columns: MetricColumns): MetricAggregates {
+  const { revenue, users, conversions, campaign, date } = columns;
+  const campaignSums = new Float64Array(columns.campaigns.length * 3);
+  const dateSums = new Float64Array(columns.dates.length * 3);
+  let totalRevenue = 0;
+  let totalUsers = 0;
+  let totalConversions = 0;
+
+  for (let i = 0; i < columns.length; i++) {
+    const r = revenue[i];
+    const u = users[i];
+    const c = conversions[i];
+    totalRevenue += r;
+    totalUsers += u;
+    totalConversions += c;
+
+    const g = campaign[i] * 3;
+    campaignSums[g] += r;
+    campaignSums[g + 1] += u;
+    campaignSums[g + 2] += c;
+
+    const d = date[i] * 3;
+    dateSums[d] += r;
+    dateSums[d + 1] += u;
+    dateSums[d + 2] += c;
+  }
+
+  return {
+    totals: { revenue: totalRevenue, users: totalUsers, conversions: totalConversions },
+    byCampaign: unpackGroups(campaignSums, columns.campaigns, 'campaign'),
+    byDate: unpackGroups(dateSums, columns.dates, 'date'),
+    averageOrderValue: ratio(totalRevenue, totalConversions),
+    conversionRate: ratio(totalConversions, totalUsers) * 100,
+  };
+}
+
+// Date-ordered index over a column set: row ids grouped by day, days ascending.
+// Rows of day k are rows[offsets[k]] .. rows[offsets[k + 1] - 1]
+export interface DailyIndex {
+  columns: MetricColumns;
+  days: string[];
+  offsets: Uint32Array;
+  rows: Uint32Array;
+}
+
+// Build the daily index with a counting sort over the date codes
+export function buildDailyIndex(columns: MetricColumns): DailyIndex {
+  const { dates, date } = columns;
+  const order = dates.map((_, code) => code).sort((a, b) => (dates[a] < dates[b] ? -1 : 1));
+  const rank = new Uint32Array(dates.length);
+  order.forEach((code, k) => {
+    rank[code] = k;
+  });
+
+  const offsets = new Uint32Array(order.length + 1);
+  for (let i = 0; i < columns.length; i++) {
+    offsets[rank[date[i]] + 1]++;
+  }
+  for (let k = 0; k < order.length; k++) {
+    offsets[k + 1] += offsets[k];
+  }
+
+  const cursor = offsets.slice(0, order.length);
+  const rows = new Uint32Array(columns.length);
+  for (let i = 0; i < columns.length; i++) {
+    rows[cursor[rank[date[i]]]++] = i;
+  }
+
+  return { columns, days: order.map(code => dates[code]), offsets, rows };
+}
+
+// Daily totals for the last `days` days; only rows inside the window are scanned
+export function queryLastDays(index: DailyIndex, days: number): DailyTotals[] {
+  const { columns, offsets, rows } = index;
+  const start = Math.max(0, index.days.length - days);
+  const result: DailyTotals[] = [];
+
+  for (let k = start; k < index.days.length; k++) {
+    let revenue = 0;
+    let users = 0;
+    let conversions = 0;
+    for (let j = offsets[k]; j < offsets[k + 1]; j++) {
+      const i = rows[j];
+      revenue += columns.revenue[i];
+      users += columns.users[i];
+      conversions += columns.conversions[i];
+    }
+    result.push({ date: index.days[k], revenue, users, conversions });
+  }
+
+  return result;
+}
+
+// Positions [start, end) of the index's days within the inclusive ISO date range
+export function dayRange(index: DailyIndex, from?: string, to?: string): [number, number] {
+  const lowerBound = (date: string, inclusive: boolean) => {
+    let low = 0;
+    let high = index.days.length;
+    while (low < high) {
+      const mid = (low + high) >>> 1;
+      if (index.days[mid] < date || (inclusive && index.days[mid] === date)) low = mid + 1;
+      else high = mid;
+    }
+    return low;
+  };
+
+  const start = from === undefined ? 0 : lowerBound(from, false);
+  const end = to === undefined ? index.days.length : lowerBound(to, true);
+  return [start, Math.max(start, end)];
+}
+
+// Totals, per-campaign and per-day groups over days [start, end) of the index.
+// Only rows inside the range are scanned
+export function aggregateDays(index: DailyIndex, start: number, end: number): MetricAggregates {
+  const { columns, offsets, rows } = index;
+  const campaignSums = new Float64Array(columns.campaigns.length * 3);
+  const byDate: DailyTotals[] = [];
+  let totalRevenue = 0;
+  let totalUsers = 0;
+  let totalConversions = 0;
+
+  for (let k = start; k < end; k++) {
+    let revenue = 0;
+    let users = 0;
+    let conversions = 0;
+    for (let j = offsets[k]; j < offsets[k + 1]; j++) {
+      const i = rows[j];
+      const r = columns.revenue[i];
+      const u = columns.users[i];
+      const c = columns.conversions[i];
+      revenue += r;
+      users += u;
+      conversions += c;
+
+      const g = columns.campaign[i] * 3;
+      campaignSums[g] += r;
+      campaignSums[g + 1] += u;
+      campaignSums[g + 2] += c;
+    }
+    byDate.push({ date: index.days[k], revenue, users, conversions });
+    totalRevenue += revenue;
+    totalUsers += users;
+    totalConversions += conversions;
+  }
+
+  return {
+    totals: { revenue: totalRevenue, users: totalUsers, conversions: totalConversions },
+    byCampaign: unpackGroups(campaignSums, columns.campaigns, 'campaign'),
+    byDate,
+    averageOrderValue: ratio(totalRevenue, totalConversions),
+    conversionRate: ratio(totalConversions, totalUsers) * 100,
+  };
+}
+
+// Per-campaign sums for each of days [start, end) of the index
+export function campaignSeries(index: DailyIndex, start: number, end: number): CampaignSeries {
+  const { columns, offsets, rows } = index;
+  const stride = columns.campaigns.length * 3;
+  const values = new Array<number>((end - start) * stride);
+  for (let v = 0; v < values.length; v++) values[v] = 0;
+
+  for (let k = start; k < end; k++) {
+    const base = (k - start) * stride;
+    for (let j = offsets[k]; j < offsets[k + 1]; j++) {
+      const i = rows[j];
+      const g = base + columns.campaign[i] * 3;
+      values[g] += columns.revenue[i];
+      values[g + 1] += columns.users[i];
+      values[g + 2] += columns.conversions[i];
+    }
+  }
+
+  return { days: index.days.slice(start, end), campaigns: columns.campaigns.slice(), values };
+}
+"""
+
+# Create incremental live-data store
+live_store_ts = """import { useSyncExternalStore } from 'react';
+import type { MetricData, CampaignData } from '@/data/mockData';
+import {
+  summarize,
+  type CampaignSeries,
+  type MetricTotals,
+  type SummaryMetrics,
+} from '@/lib/aggregate';
+import { createRollupStore, type RollupSnapshot, type RollupStore } from '@/lib/rollups';
+
+// Each slice keeps its reference until an ingested row touches it, so
+// subscribers selecting one slice skip re-renders caused by the others
+export interface LiveState {
+  // False until the seed aggregates have been loaded
+  seeded: boolean;
+  // True while the seed is a cached copy that no fresh snapshot has confirmed yet
+  stale: boolean;
+  datasetVersion: string | null;
+  summary: SummaryMetrics;
+  campaigns: CampaignData[];
+  // Bumped whenever ingested rows change the rollup buckets
+  rollupVersion: number;
+  lastUpdated: Date;
+}
+
+export interface LiveStore {
+  getState(): LiveState;
+  subscribe(listener: () => void): () => void;
+  // Load the seed aggregates. Once seeded, later calls are ignored unless the
+  // store holds a restored seed: one of the same dataset version confirms it,
+  // any other replaces it. Subscribers are notified synchronously, so call it
+  // from an effect rather than during render
+  seed(seed: LiveSeed): void;
+  // Load a cached seed while unseeded, marked stale until `seed` revalidates it
+  restore(seed: LiveSeed): void;
+  // The last seed loaded by `seed` rather than `restore`, or null; a new
+  // reference means fresh data worth persisting
+  freshSeed(): LiveSeed | null;
+  // Row log cursor the store is current to: the seed's, then that of the last
+  // rows ingested. Null until known, e.g. for a restored seed
+  rowCursor(): string | null;
+  // Fold in live rows; `cursor` is the row log position they bring the store to
+  ingest(rows: MetricData[], cursor?: string): void;
+  recentRows(limit?: number): MetricData[];
+  // Time-bucketed sums for the charts; read it when `rollupVersion` changes
+  rollups: RollupStore;
+}
+
+// Seed aggregates, as served by the dashboard snapshot
+export interface LiveSeed {
+  totals: MetricTotals;
+  series: CampaignSeries;
+  campaigns: CampaignData[];
+  generatedAt?: string;
+  datasetVersion?: string;
+  rowCursor?: string;
+  // Buckets already built from `series`, e.g. by a cached copy; saves rebuilding them
+  rollups?: RollupSnapshot;
+}
+
+interface LiveStoreOptions {
+  // Omit to create the store before its data arrives and seed it later
+  seed?: LiveSeed;
+  capacity?: number;
+  // Rates used for campaigns that first appear in the live feed
+  campaignRates?: () => { ctr: number; costRatio: number };
+}
+
+// Create a store seeded from pre-aggregated totals that afterwards absorbs deltas
+// in O(rows ingested): totals, campaign sums and rollup buckets are updated in place.
+// Rows should only be ingested once the store is seeded
+export function createLiveStore({
+  seed: initialSeed,
+  capacity = 4096,
+  campaignRates = () => ({ ctr: 0, costRatio: 0 }),
+}: LiveStoreOptions = {}): LiveStore {
+  const totals: MetricTotals = { revenue: 0, users: 0, conversions: 0 };
+  const campaignPosition = new Map<string, number>();
+  const costRatios: number[] = [];
+  const rollups = createRollupStore();
+
+  let state: LiveState = {
+    seeded: false,
+    stale: false,
+    datasetVersion: null,
+    summary: summarize(totals),
+    campaigns: [],
+    rollupVersion: 0,
+    lastUpdated: new Date(),
+  };
+  const listeners = new Set<() => void>();
+  let freshSeed: LiveSeed | null = null;
+  let rowCursor: string | null = null;
+
+  // Replaces everything, including rows ingested on top of an earlier seed
+  const applySeed = (seed: LiveSeed, stale: boolean) => {
+    const { totals: seedTotals, series, campaigns, generatedAt, datasetVersion } = seed;
+    totals.revenue = seedTotals.revenue;
+    totals.users = seedTotals.users;
+    totals.conversions = seedTotals.conversions;
+    campaignPosition.clear();
+    costRatios.length = 0;
+    campaigns.forEach((campaign, position) => {
+      campaignPosition.set(campaign.campaign, position);
+      costRatios.push(campaign.revenue === 0 ? 0 : campaign.cost / campaign.revenue);
+    });
+    if (seed.rollups) {
+      rollups.load(seed.rollups);
+    } else {
+      rollups.clear();
+      rollups.addSeries(series);
+    }
+    ring.next = 0;
+    ring.size = 0;
+    rowCursor = seed.rowCursor ?? null;
+
+    state = {
+      seeded: true,
+      stale,
+      datasetVersion: datasetVersion ?? null,
+      summary: summarize(totals),
+      campaigns: campaigns.slice(),
+      rollupVersion: state.rollupVersion + 1,
+      lastUpdated: generatedAt ? new Date(generatedAt) : new Date(),
+    };
+  };
+
+  // Ring buffer of the most recent raw rows, oldest overwritten first
+  const ring = {
+    revenue: new Float64Array(capacity),
+    users: new Int32Array(capacity),
+    conversions: new Int32Array(capacity),
+    campaign: new Array<string>(capacity),
+    date: new Array<string>(capacity),
+    next: 0,
+    size: 0,
+  };
+  if (initialSeed) {
+    applySeed(initialSeed, false);
+    freshSeed = initialSeed;
+  }
+
+  const pushRow = (row: MetricData) => {
+    const slot = ring.next;
+    ring.revenue[slot] = row.revenue;
+    ring.users[slot] = row.users;
+    ring.conversions[slot] = row.conversions;
+    ring.campaign[slot] = row.campaign;
+    ring.date[slot] = row.date;
+    ring.next = (slot + 1) % capacity;
+    ring.size = Math.min(ring.size + 1, capacity);
+  };
+
+  // The first touch in a batch clones the entry; later rows mutate the clone
+  const addCampaign = (nextCampaigns: CampaignData[], touched: Set<number>, row: MetricData) => {
+    let position = campaignPosition.get(row.campaign);
+    if (position === undefined) {
+      const { ctr, costRatio } = campaignRates();
+      position = nextCampaigns.length;
+      campaignPosition.set(row.campaign, position);
+      costRatios.push(costRatio);
+      nextCampaigns.push({ campaign: row.campaign, revenue: 0, users: 0, conversions: 0, ctr, cost: 0 });
+      touched.add(position);
+    } else if (!touched.has(position)) {
+      nextCampaigns[position] = { ...nextCampaigns[position] };
+      touched.add(position);
+    }
+    const entry = nextCampaigns[position];
+    entry.revenue += row.revenue;
+    entry.users += row.users;
+    entry.conversions += row.conversions;
+    entry.cost = Math.floor(entry.revenue * costRatios[position]);
+  };
+
+  return {
+    getState: () => state,
+
+    subscribe(listener) {
+      listeners.add(listener);
+      return () => {
+        listeners.delete(listener);
+      };
+    },
+
+    seed(seed) {
+      if (state.seeded && !state.stale) return;
+      if (state.stale && seed.datasetVersion !== undefined && seed.datasetVersion === state.datasetVersion) {
+        state = { ...state, stale: false };
+        // Rows polled on top of the restored seed stay, and so does their cursor
+        rowCursor = rowCursor ?? seed.rowCursor ?? null;
+      } else {
+        applySeed(seed, false);
+        freshSeed = seed;
+      }
+      listeners.forEach(listener => listener());
+    },
+
+    freshSeed: () => freshSeed,
+
+    rowCursor: () => rowCursor,
+
+    restore(seed) {
+      if (state.seeded) return;
+      applySeed(seed, true);
+      listeners.forEach(listener => listener());
+    },
+
+    ingest(rows, cursor) {
+      if (cursor !== undefined) rowCursor = cursor;
+      if (rows.length === 0) return;
+      const nextCampaigns = state.campaigns.slice();
+      const touchedCampaigns = new Set<number>();
+
+      for (const row of rows) {
+        pushRow(row);
+        totals.revenue += row.revenue;
+        totals.users += row.users;
+        totals.conversions += row.conversions;
+        addCampaign(nextCampaigns, touchedCampaigns, row);
+      }
+      rollups.addRows(rows);
+
+      state = {
+        seeded: state.seeded,
+        stale: state.stale,
+        datasetVersion: state.datasetVersion,
+        summary: summarize(totals),
+        campaigns: nextCampaigns,
+        rollupVersion: state.rollupVersion + 1,
+        lastUpdated: new Date(),
+      };
+      listeners.forEach(listener => listener());
+    },
+
+    rollups,
+
+    recentRows(limit = ring.size) {
+      const count = Math.min(limit, ring.size);
+      const result: MetricData[] = [];
+      for (let k = 1; k <= count; k++) {
+        const slot = (ring.next - k + capacity) % capacity;
+        result.push({
+          date: ring.date[slot],
+          revenue: ring.revenue[slot],
+          users: ring.users[slot],
+          conversions: ring.conversions[slot],
+          campaign: ring.campaign[slot],
+        });
+      }
+      return result;
+    },
+  };
+}
+
+// Subscribe a component to one slice of the live store
+export function useLiveSlice<T>(store: LiveStore, selector: (state: LiveState) => T): T {
+  return useSyncExternalStore(
+    store.subscribe,
+    () => selector(store.getState()),
+    () => selector(store.getState())
+  );
+}
+"""
+
+# Create mock real-time event source
+live_feed_ts = """import type { MetricData } from './mockData';
+import { campaignNames, generateMetricRow } from './generators';
+import { decodeRowDelta, type RowDelta } from '@/lib/rowDelta';
+
+interface MockFeedOptions {
+  intervalMs?: number;
+  rowsPerTick?: number;
+  campaigns?: string[];
+}
+
+// Timer-driven stand-in for a real event stream: every tick emits a batch of
+// rows for today drawn from the same distributions as the mock dataset.
+// Raise `rowsPerTick` to load-test the ingestion path offline.
+export function startMockFeed(
+  onRows: (rows: MetricData[]) => void,
+  { intervalMs = 5000, campaigns = campaignNames, rowsPerTick = campaigns.length }: MockFeedOptions = {}
+): () => void {
+  const interval = setInterval(() => {
+    const date = new Date().toISOString().split('T')[0];
+    const rows: MetricData[] = [];
+    for (let i = 0; i < rowsPerTick; i++) {
+      rows.push(generateMetricRow(date, campaigns[i % campaigns.length]));
+    }
+    onRows(rows);
+  }, intervalMs);
+
+  return () => clearInterval(interval);
+}
+
+interface RowPollOptions {
+  tenant?: string;
+  intervalMs?: number;
+  endpoint?: string;
+  // Read before every poll: the cursor to continue from, e.g. the snapshot's
+  // or that of the last rows applied. Without it the poll starts at the log's
+  // current end and follows its own responses
+  cursor?: () => string | null;
+}
+
+// Poll /api/dashboard/rows for rows appended since the current cursor. Each
+// request carries the cursor as `since` and If-None-Match, so an unchanged log
+// costs an empty 304; new rows arrive column-encoded (see lib/rowDelta.ts).
+// `onRows` gets every delta's rows, possibly none, with the cursor to continue
+// from. A response to a cursor that changed while it was in flight is dropped.
+// Failed polls are retried on the next tick.
+export function startRowPoll(
+  onRows: (rows: MetricData[], cursor: string) => void,
+  { tenant, intervalMs = 5000, endpoint = '/api/dashboard/rows', cursor: readCursor }: RowPollOptions = {}
+): () => void {
+  let last: string | null = null;
+  const currentCursor = readCursor ?? (() => last);
+  let inFlight = false;
+  let stopped = false;
+
+  const poll = async () => {
+    if (inFlight) return;
+    inFlight = true;
+    try {
+      const since = currentCursor();
+      const params = new URLSearchParams();
+      if (tenant) params.set('tenant', tenant);
+      if (since) params.set('since', since);
+      const response = await fetch(`${endpoint}?${params}`, {
+        cache: 'no-store',
+        headers: since ? { 'If-None-Match': `"${since}"` } : {},
+      });
+      if (stopped || response.status === 304 || !response.ok) return;
+
+      const delta: RowDelta = await response.json();
+      if (stopped || currentCursor() !== since) return;
+      last = delta.cursor;
+      onRows(decodeRowDelta(delta), delta.cursor);
+    } catch {
+      // Offline or a malformed body; the next tick tries again
+    } finally {
+      inFlight = false;
+    }
+  };
+
+  poll();
+  const interval = setInterval(poll, intervalMs);
+  return () => {
+    stopped = true;
+    clearInterval(interval);
+  };
+}
+"""
+
+# Create lib/fixtures.ts to load generated binary fixtures
+fixtures_ts = """import type { CampaignData } from '@/data/mockData';
+import { ATTRIBUTE_DIMENSIONS, type AttributeDimension, type MetricColumns } from './aggregate';
+
+type FixtureColumnName = 'revenue' | 'users' | 'conversions' | 'campaign' | 'date';
+
+interface FixtureColumn {
+  dtype: 'float64' | 'int32' | 'uint32' | 'uint16';
+  // Byte offset of the column within the binary file
+  offset: number;
+}
+
+// Written by generate_fixtures.py next to the binary column file
+export interface FixtureManifest {
+  version: number;
+  name: string;
+  seed: number;
+  rows: number;
+  days: number;
+  rowsPerDay: number;
+  campaigns: string[];
+  dates: string[];
+  binary: string | null;
+  columns: Record<FixtureColumnName, FixtureColumn> & Partial<Record<AttributeDimension, FixtureColumn>>;
+  // Attribute dictionaries (version 2); each has a uint16 column of codes
+  dimensions?: Partial<Record<AttributeDimension, string[]>>;
+  campaignData: CampaignData[];
+}
+
+export interface MetricFixture {
+  manifest: FixtureManifest;
+  columns: MetricColumns;
+  campaignData: CampaignData[];
+}
+
+// Version 1 fixtures predate the attribute columns and still load
+const FIXTURE_VERSIONS = [1, 2];
+
+const COLUMN_TYPES = {
+  revenue: Float64Array,
+  users: Int32Array,
+  conversions: Int32Array,
+  campaign: Uint32Array,
+  date: Uint32Array,
+};
+
+const DTYPES: Record<FixtureColumnName, FixtureColumn['dtype']> = {
+  revenue: 'float64',
+  users: 'int32',
+  conversions: 'int32',
+  campaign: 'uint32',
+  date: 'uint32',
+};
+
+async function fetchOk(url: string): Promise<Response> {
+  const response = await fetch(url);
+  if (!response.ok) throw new Error(`Failed to load fixture ${url}: ${response.status}`);
+  return response;
+}
+
+// Wrap the binary file in typed-array views; no per-row parsing or copying
+export function decodeFixture(manifest: FixtureManifest, buffer: ArrayBuffer): MetricColumns {
+  if (FIXTURE_VERSIONS.indexOf(manifest.version) < 0) {
+    throw new Error(`Unsupported fixture version ${manifest.version}`);
+  }
+
+  const view = <K extends FixtureColumnName>(name: K): InstanceType<(typeof COLUMN_TYPES)[K]> => {
+    const { dtype, offset } = manifest.columns[name];
+    if (dtype !== DTYPES[name]) throw new Error(`Fixture column ${name} has type ${dtype}`);
+    return new COLUMN_TYPES[name](buffer, offset, manifest.rows) as InstanceType<(typeof COLUMN_TYPES)[K]>;
+  };
+
+  const dimensions: MetricColumns['dimensions'] = {};
+  ATTRIBUTE_DIMENSIONS.forEach(dimension => {
+    const values = manifest.dimensions?.[dimension];
+    const column = manifest.columns[dimension];
+    if (!values || !column) return;
+    if (column.dtype !== 'uint16') throw new Error(`Fixture column ${dimension} has type ${column.dtype}`);
+    dimensions[dimension] = { codes: new Uint16Array(buffer, column.offset, manifest.rows), values };
+  });
+
+  return {
+    length: manifest.rows,
+    revenue: view('revenue'),
+    users: view('users'),
+    conversions: view('conversions'),
+    campaign: view('campaign'),
+    date: view('date'),
+    campaigns: manifest.campaigns,
+    dates: manifest.dates,
+    dimensions,
+  };
+}
+
+// Load a generated fixture, e.g. loadMetricFixture('metrics-365d-12c-100r-s7')
+export async function loadMetricFixture(name: string, baseUrl = '/fixtures'): Promise<MetricFixture> {
+  const manifest: FixtureManifest = await (await fetchOk(`${baseUrl}/${name}.manifest.json`)).json();
+  if (!manifest.binary) throw new Error(`Fixture ${name} was generated without binary columns`);
+
+  const buffer = await (await fetchOk(`${baseUrl}/${manifest.binary}`)).arrayBuffer();
+  return { manifest, columns: decodeFixture(manifest, buffer), campaignData: manifest.campaignData };
+}
+"""
+
+# Create bench/cases.ts with the benchmarked hot paths
+bench_cases_ts = """import type { CampaignData, MetricData } from '@/data/mockData';
+import {
+  aggregateColumns,
+  buildDailyIndex,
+  queryLastDays,
+  summarize,
+  toColumns,
+  type MetricColumns,
+} from '@/lib/aggregate';
+import { createRollupStore, queryRecentDays } from '@/lib/rollups';
+import { groupBy } from '@/lib/dimensions';
+import { lttbIndices, minMaxIndices } from '@/lib/downsample';
+import { indexTable, runTableQuery, type TableColumns, type TableQuery } from '@/lib/tableQuery';
+import { csvChunks } from '@/lib/utils';
+
+export interface BenchCase<S = unknown> {
+  name: string;
+  description: string;
+  // Larger datasets are skipped unless run with --all: the case builds one
+  // object per row or sorts, and would dominate the suite's run time
+  maxRows?: number;
+  // Untimed preparation of the case's input
+  setup: (columns: MetricColumns) => S;
+  // The timed work; the return value is kept alive until memory is sampled
+  run: (state: S) => unknown;
+}
+
+function defineCase<S>(benchCase: BenchCase<S>): BenchCase {
+  return benchCase as BenchCase;
+}
+
+// Row objects in the MetricData shape the components receive
+function toRows(columns: MetricColumns): MetricData[] {
+  const rows: MetricData[] = new Array(columns.length);
+  for (let i = 0; i < columns.length; i++) {
+    rows[i] = {
+      date: columns.dates[columns.date[i]],
+      revenue: columns.revenue[i],
+      users: columns.users[i],
+      conversions: columns.conversions[i],
+      campaign: columns.campaigns[columns.campaign[i]],
+    };
+  }
+  return rows;
+}
+
+// Deterministic 2-7% click-through rate for row i
+function syntheticCtr(i: number): number {
+  return 2 + ((i * 7919) % 500) / 100;
+}
+
+// Treat every metric row as a table row; ctr and cost are derived
+// deterministically so sorts on them see realistic spreads and ties
+function toTableColumns(columns: MetricColumns): TableColumns {
+  const { length } = columns;
+  const names = columns.campaigns.map(campaign => campaign.toLowerCase());
+  const table: TableColumns = {
+    length,
+    campaigns: new Array(length),
+    names: new Array(length),
+    revenue: Float64Array.from(columns.revenue),
+    users: Float64Array.from(columns.users),
+    conversions: Float64Array.from(columns.conversions),
+    ctr: new Float64Array(length),
+    cost: new Float64Array(length),
+  };
+
+  for (let i = 0; i < length; i++) {
+    const code = columns.campaign[i];
+    table.campaigns[i] = columns.campaigns[code];
+    table.names[i] = names[code];
+    table.ctr[i] = syntheticCtr(i);
+    table.cost[i] = Math.floor(columns.revenue[i] * 0.35);
+  }
+
+  return table;
+}
+
+// Lazily yields CampaignData-shaped rows for the CSV encoder
+function* campaignRows(columns: MetricColumns): Generator<CampaignData> {
+  for (let i = 0; i < columns.length; i++) {
+    yield {
+      campaign: columns.campaigns[columns.campaign[i]],
+      revenue: columns.revenue[i],
+      users: columns.users[i],
+      conversions: columns.conversions[i],
+      ctr: syntheticCtr(i),
+      cost: Math.floor(columns.revenue[i] * 0.35),
+    };
+  }
+}
+
+const TABLE_QUERY: TableQuery = {
+  search: 'so',
+  minRevenue: 500,
+  maxRevenue: null,
+  sortField: 'revenue',
+  sortDirection: 'desc',
+  page: 1,
+  pageSize: 25,
+};
+
+export const benchCases: BenchCase[] = [
+  defineCase({
+    name: 'toColumns',
+    description: 'Encode MetricData rows into typed-array columns',
+    maxRows: 1_000_000,
+    setup: toRows,
+    run: rows => toColumns(rows),
+  }),
+  defineCase({
+    name: 'summaryMetrics',
+    description: 'Single-pass aggregation reduced to the summary KPIs',
+    setup: columns => columns,
+    run: columns => summarize(aggregateColumns(columns).totals),
+  }),
+  defineCase({
+    name: 'campaignData',
+    description: 'Per-campaign totals from the single-pass aggregation',
+    setup: columns => columns,
+    run: columns => aggregateColumns(columns).byCampaign,
+  }),
+  defineCase({
+    name: 'dailyData',
+    description: 'Build the daily index and query the 30-day chart window',
+    setup: columns => columns,
+    run: columns => queryLastDays(buildDailyIndex(columns), 30),
+  }),
+  defineCase({
+    name: 'dailyWindow',
+    description: 'Query the 90-day chart window on a prebuilt daily index',
+    setup: buildDailyIndex,
+    run: index => queryLastDays(index, 90),
+  }),
+  defineCase({
+    name: 'rollupBuild',
+    description: 'Bucket every row into the hour/day/week/month rollups',
+    setup: columns => columns,
+    run: columns => {
+      const store = createRollupStore();
+      store.addColumns(columns);
+      return store;
+    },
+  }),
+  defineCase({
+    name: 'rollupQuery',
+    description: 'Query every chart range at 800px on prebuilt rollups',
+    setup: columns => {
+      const store = createRollupStore();
+      store.addColumns(columns);
+      return store;
+    },
+    run: store => [1, 7, 30, 90, 365, 730].map(days => queryRecentDays(store, days, 800)),
+  }),
+  defineCase({
+    name: 'groupBy',
+    description: 'Group by campaign x region x device, then drill into one campaign by creative',
+    setup: columns => columns,
+    run: columns => [
+      groupBy(columns, ['campaign', 'region', 'device']),
+      groupBy(columns, ['creative'], { where: { campaign: columns.campaigns[0] } }),
+    ],
+  }),
+  defineCase({
+    name: 'lttb',
+    description: 'Downsample the revenue column to 1,600 points with LTTB',
+    setup: columns => columns.revenue,
+    run: revenue => lttbIndices(revenue, 1600),
+  }),
+  defineCase({
+    name: 'minMax',
+    description: 'Downsample the revenue column to 1,600 points with min/max decimation',
+    setup: columns => columns.revenue,
+    run: revenue => minMaxIndices(revenue, 1600),
+  }),
+  defineCase({
+    name: 'tableIndex',
+    description: 'Build the DataTable sort permutations',
+    maxRows: 1_000_000,
+    setup: toTableColumns,
+    run: table => indexTable(table),
+  }),
+  defineCase({
+    name: 'tableQuery',
+    description: 'Filter, sort and page the DataTable on a prebuilt index',
+    maxRows: 1_000_000,
+    setup: columns => indexTable(toTableColumns(columns)),
+    run: index => runTableQuery(index, TABLE_QUERY),
+  }),
+  defineCase({
+    name: 'csvExport',
+    description: 'Encode every row as CSV text, chunk by chunk',
+    setup: columns => columns,
+    run: columns => {
+      let bytes = 0;
+      const chunks = csvChunks(campaignRows(columns));
+      for (let step = chunks.next(); !step.done; step = chunks.next()) {
+        bytes += step.value.length;
+      }
+      return bytes;
+    },
+  }),
+];
+"""
+
+# Create bench/run.ts, the headless benchmark runner
+bench_run_ts = """// Headless benchmarks for the dashboard's data-processing hot paths.
+//
+//   npm run bench -- [--sizes 1000,100000] [--cases summaryMetrics,csvExport]
+//                    [--budget 2000] [--all] [--out results.json]
+//                    [--compare baseline.json] [--threshold 10]
+//
+// Inputs are the seeded fixtures written by generate_fixtures.py to
+// public/fixtures/, one per dataset size. Results are written as JSON so runs
+// from different commits can be compared with --compare; a p50 slowdown beyond
+// --threshold percent is reported as a regression and fails the run.
+import { execSync } from 'child_process';
+import { existsSync, mkdirSync, readdirSync, readFileSync, writeFileSync } from 'fs';
+import path from 'path';
+import { performance } from 'perf_hooks';
+import { decodeFixture, type FixtureManifest } from '@/lib/fixtures';
+import type { MetricColumns } from '@/lib/aggregate';
+import { benchCases, type BenchCase } from './cases';
+
+interface BenchResult {
+  case: string;
+  rows: number;
+  fixture: string;
+  iterations: number;
+  p50Ms: number;
+  p99Ms: number;
+  meanMs: number;
+  rowsPerSec: number;
+  // Growth of heap plus ArrayBuffer memory over the post-setup baseline,
+  // sampled after every iteration while the iteration's result is still live
+  peakHeapBytes: number;
+}
+
+interface BenchReport {
+  version: number;
+  commit: string | null;
+  node: string;
+  platform: string;
+  date: string;
+  results: BenchResult[];
+}
+
+const REPORT_VERSION = 1;
+const DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000, 10_000_000];
+const FIXTURE_DIR = path.join(process.cwd(), 'public', 'fixtures');
+const RESULTS_DIR = path.join(process.cwd(), 'bench', 'results');
+const MIN_ITERATIONS = 3;
+const MAX_ITERATIONS = 200;
+
+const gc = (globalThis as { gc?: () => void }).gc;
+
+function parseArgs(argv: string[]) {
+  const options = {
+    sizes: DEFAULT_SIZES,
+    cases: null as string[] | null,
+    budgetMs: 2000,
+    all: false,
+    out: null as string | null,
+    compare: null as string | null,
+    threshold: 10,
+  };
+
+  for (let i = 0; i < argv.length; i++) {
+    const value = () => {
+      if (i + 1 >= argv.length) throw new Error(`Missing value for ${argv[i]}`);
+      return argv[++i];
+    };
+    switch (argv[i]) {
+      case '--sizes':
+        options.sizes = value().split(',').map(Number);
+        break;
+      case '--cases':
+        options.cases = value().split(',');
+        break;
+      case '--budget':
+        options.budgetMs = Number(value());
+        break;
+      case '--all':
+        options.all = true;
+        break;
+      case '--out':
+        options.out = value();
+        break;
+      case '--compare':
+        options.compare = value();
+        break;
+      case '--threshold':
+        options.threshold = Number(value());
+        break;
+      default:
+        throw new Error(`Unknown option ${argv[i]}`);
+    }
+  }
+
+  return options;
+}
+
+function currentCommit(): string | null {
+  try {
+    return execSync('git rev-parse --short HEAD', { stdio: ['ignore', 'pipe', 'ignore'] }).toString().trim();
+  } catch {
+    return null;
+  }
+}
+
+function memoryInUse(): number {
+  const { heapUsed, arrayBuffers } = process.memoryUsage();
+  return heapUsed + arrayBuffers;
+}
+
+// Nearest-rank percentile of an ascending sample
+function percentile(sorted: number[], p: number): number {
+  return sorted[Math.max(0, Math.ceil(p * sorted.length) - 1)];
+}
+
+// Find the fixture with exactly `rows` rows and map it into typed arrays
+function loadFixture(rows: number): { name: string; columns: MetricColumns } {
+  const manifests = existsSync(FIXTURE_DIR)
+    ? readdirSync(FIXTURE_DIR).filter(file => file.endsWith('.manifest.json'))
+    : [];
+
+  for (let i = 0; i < manifests.length; i++) {
+    const manifest: FixtureManifest = JSON.parse(readFileSync(path.join(FIXTURE_DIR, manifests[i]), 'utf8'));
+    if (manifest.rows !== rows || !manifest.binary) continue;
+
+    const file = readFileSync(path.join(FIXTURE_DIR, manifest.binary));
+    const buffer = file.buffer.slice(file.byteOffset, file.byteOffset + file.byteLength) as ArrayBuffer;
+    return { name: manifest.name, columns: decodeFixture(manifest, buffer) };
+  }
+
+  const rowsPerDay = Math.max(1, Math.round(rows / 1000));
+  throw new Error(
+    `No fixture with ${rows} rows in ${FIXTURE_DIR}. Generate one with:\\n` +
+      `  python generate_fixtures.py --days 250 --campaigns 4 --rows-per-day ${rowsPerDay}`
+  );
+}
+
+// Time `run` until the budget is spent (at least MIN_ITERATIONS, after one warm-up)
+function measure(benchCase: BenchCase, state: unknown, budgetMs: number) {
+  const warmStart = performance.now();
+  benchCase.run(state);
+  const warmMs = performance.now() - warmStart;
+
+  gc?.();
+  const baseline = memoryInUse();
+  let peak = baseline;
+  const samples: number[] = [];
+  const deadline = performance.now() + Math.max(budgetMs - warmMs, 0);
+
+  while (samples.length < MIN_ITERATIONS || (samples.length < MAX_ITERATIONS && performance.now() < deadline)) {
+    const start = performance.now();
+    const result = benchCase.run(state);
+    samples.push(performance.now() - start);
+    peak = Math.max(peak, memoryInUse());
+    if (result === undefined) throw new Error(`${benchCase.name} returned nothing`);
+  }
+
+  return { samples, peakHeapBytes: peak - baseline };
+}
+
+function formatMs(ms: number): string {
+  return ms < 1 ? `${(ms * 1000).toFixed(1)}µs` : `${ms.toFixed(2)}ms`;
+}
+
+function compareReports(baseline: BenchReport, current: BenchReport, threshold: number): number {
+  let regressions = 0;
+  console.log(`\\nCompared with ${baseline.commit ?? 'baseline'} (${baseline.date}):`);
+
+  current.results.forEach(result => {
+    const before = baseline.results.find(entry => entry.case === result.case && entry.rows === result.rows);
+    if (!before) return;
+
+    const change = ((result.p50Ms - before.p50Ms) / before.p50Ms) * 100;
+    const regressed = change > threshold;
+    if (regressed) regressions++;
+    console.log(
+      `  ${regressed ? '✗' : '✓'} ${result.case.padEnd(16)} ${String(result.rows).padStart(10)} rows  ` +
+        `p50 ${formatMs(before.p50Ms)} → ${formatMs(result.p50Ms)} (${change >= 0 ? '+' : ''}${change.toFixed(1)}%)`
+    );
+  });
+
+  return regressions;
+}
+
+function main() {
+  const options = parseArgs(process.argv.slice(2));
+  const cases = options.cases
+    ? benchCases.filter(benchCase => options.cases!.includes(benchCase.name))
+    : benchCases;
+  if (!gc) console.warn('Run node with --expose-gc for stable heap measurements');
+
+  const results: BenchResult[] = [];
+  options.sizes.forEach(rows => {
+    const { name, columns } = loadFixture(rows);
+    console.log(`\\n${name} (${rows.toLocaleString('en-US')} rows)`);
+
+    cases.forEach(benchCase => {
+      if (!options.all && benchCase.maxRows !== undefined && rows > benchCase.maxRows) {
+        console.log(`  ${benchCase.name.padEnd(16)} skipped (over ${benchCase.maxRows.toLocaleString('en-US')} rows)`);
+        return;
+      }
+
+      const state = benchCase.setup(columns);
+      const { samples, peakHeapBytes } = measure(benchCase, state, options.budgetMs);
+      const sorted = samples.slice().sort((a, b) => a - b);
+      const p50Ms = percentile(sorted, 0.5);
+      const result: BenchResult = {
+        case: benchCase.name,
+        rows,
+        fixture: name,
+        iterations: samples.length,
+        p50Ms,
+        p99Ms: percentile(sorted, 0.99),
+        meanMs: samples.reduce((sum, sample) => sum + sample, 0) / samples.length,
+        rowsPerSec: Math.round(rows / (p50Ms / 1000)),
+        peakHeapBytes,
+      };
+      results.push(result);
+
+      console.log(
+        `  ${benchCase.name.padEnd(16)} p50 ${formatMs(result.p50Ms).padStart(10)}  p99 ${formatMs(result.p99Ms).padStart(10)}  ` +
+          `${(result.rowsPerSec / 1e6).toFixed(1).padStart(8)}M rows/s  ` +
+          `heap +${(peakHeapBytes / 1048576).toFixed(1)}MB  (${samples.length} runs)`
+      );
+    });
+  });
+
+  const report: BenchReport = {
+    version: REPORT_VERSION,
+    commit: currentCommit(),
+    node: process.version,
+    platform: `${process.platform}-${process.arch}`,
+    date: new Date().toISOString(),
+    results,
+  };
+
+  const out = options.out ?? path.join(RESULTS_DIR, `${report.commit ?? report.date.replace(/[:.]/g, '-')}.json`);
+  mkdirSync(path.dirname(out), { recursive: true });
+  writeFileSync(out, JSON.stringify(report, null, 2) + '\\n');
+  console.log(`\\nResults written to ${out}`);
+
+  if (options.compare) {
+    const baseline: BenchReport = JSON.parse(readFileSync(options.compare, 'utf8'));
+    const regressions = compareReports(baseline, report, options.threshold);
+    if (regressions > 0) {
+      console.error(`${regressions} regression(s) over ${options.threshold}%`);
+      process.exitCode = 1;
+    }
+  }
+}
+
+main();
+"""
+
+# Row generators shared by the mock dataset and the live feed
+generators_ts = """import type { MetricData } from './mockData';
+
+export const campaignNames = ['Search', 'Social', 'Display', 'Email'];
+
+// Breakdown attributes; channels follow campaignNames' order
+export const channelNames = ['Google Ads', 'Meta', 'Programmatic', 'Newsletter'];
+export const regionNames = ['North America', 'Europe', 'Asia Pacific', 'Latin America'];
+export const deviceNames = ['Mobile', 'Desktop', 'Tablet'];
+export const creativeVariants = ['A', 'B', 'C'];
+
+// A campaign always runs on the same channel
+const channelFor = (campaign: string) => {
+  const known = campaignNames.indexOf(campaign);
+  if (known >= 0) return channelNames[known];
+  let hash = 0;
+  for (let i = 0; i < campaign.length; i++) hash = (hash * 31 + campaign.charCodeAt(i)) >>> 0;
+  return channelNames[hash % channelNames.length];
+};
+
+// 55% mobile, 35% desktop, 10% tablet
+const pickDevice = () => {
+  const draw = Math.random();
+  return deviceNames[draw < 0.55 ? 0 : draw < 0.9 ? 1 : 2];
+};
+
+const pick = (values: string[]) => values[Math.floor(Math.random() * values.length)];
+
+// Creative labels per campaign, built once so rows share the same strings
+const creativePools = new Map<string, string[]>();
+const creativesFor = (campaign: string) => {
+  let pool = creativePools.get(campaign);
+  if (!pool) {
+    pool = creativeVariants.map(variant => `${campaign} ${variant}`);
+    creativePools.set(campaign, pool);
+  }
+  return pool;
+};
+
+// Simulate one day of activity for a campaign. Metrics only: the live feeds
+// and the browser never group by the breakdown attributes
+export const generateMetricRow = (date: string, campaign: string): MetricData => {
+  const users = Math.floor(Math.random() * 500) + 200;
+  const conversionRate = Math.random() * 0.15 + 0.05; // 5-20% conversion rate
+  const conversions = Math.floor(users * conversionRate);
+  const revenuePerConversion = Math.random() * 50 + 25; // $25-75 per conversion
+  const revenue = Math.floor(conversions * revenuePerConversion);
+
+  return { date, revenue, users, conversions, campaign };
+};
+
+// A metric row with breakdown attributes, for the server-side dataset that
+// group-by queries run over (see lib/dimensions.ts)
+export const generateAttributedRow = (date: string, campaign: string): MetricData => ({
+  ...generateMetricRow(date, campaign),
+  channel: channelFor(campaign),
+  region: pick(regionNames),
+  device: pickDevice(),
+  creative: pick(creativesFor(campaign)),
+});
+
+// Simulated click-through rate and cost-to-revenue ratio for a campaign
+export const generateCampaignRates = () => ({
+  ctr: Math.random() * 5 + 2, // 2-7% CTR
+  costRatio: Math.random() * 0.3 + 0.2 // 20-50% of revenue as cost
+});
+"""
+
+# Server-side snapshot aggregation
+dashboard_data_ts = """// Server-side data layer: raw rows stay on the server and are reduced to the
+// compact aggregates the dashboard renders. Imports node modules, so only
+// server components and route handlers may import it.
+import { createHash } from 'crypto';
+import { access, readFile } from 'fs/promises';
+import path from 'path';
+import type { CampaignData } from '@/data/mockData';
+import { generateMetricRow } from '@/data/generators';
+import {
+  aggregateDays,
+  buildDailyIndex,
+  campaignSeries,
+  dayRange,
+  summarize,
+  type CampaignSeries,
+  type DailyIndex,
+  type MetricTotals,
+  type SummaryMetrics,
+} from './aggregate';
+import { groupBy, type Dimension, type DimensionFilter, type GroupTotals } from './dimensions';
+import { decodeFixture, type FixtureManifest } from './fixtures';
+import { encodeRowDelta, formatCursor, type RowCursor, type RowDelta } from './rowDelta';
+import { createRowLog, type RowLog } from './rowLog';
+
+export const DEFAULT_TENANT = 'default';
+// Enough days for the widest chart range
+export const DEFAULT_SNAPSHOT_DAYS = 730;
+
+export interface DashboardQuery {
+  tenant?: string;
+  // Inclusive ISO dates; `days` counts back from the newest day when `from` is unset
+  from?: string;
+  to?: string;
+  days?: number;
+}
+
+// Everything the client renders, independent of the number of raw rows
+export interface DashboardSnapshot {
+  tenant: string;
+  range: { from: string | null; to: string | null };
+  totals: MetricTotals;
+  summary: SummaryMetrics;
+  campaigns: CampaignData[];
+  // Per-campaign daily sums; the client rolls them up into chart buckets
+  series: CampaignSeries;
+  // Changes whenever the tenant's rows do; clients drop cached copies of other versions
+  datasetVersion: string;
+  // Position of the tenant's row log when the snapshot was taken; live rows
+  // are polled from here, so none appended in between are missed
+  rowCursor: string;
+  generatedAt: string;
+}
+
+// The headline numbers alone; cheaper than a snapshot, so the metric cards
+// can render before the chart series are ready
+export interface DashboardSummary {
+  tenant: string;
+  range: { from: string | null; to: string | null };
+  totals: MetricTotals;
+  summary: SummaryMetrics;
+  datasetVersion: string;
+  generatedAt: string;
+}
+
+export interface BreakdownQuery extends DashboardQuery {
+  // Dimensions to group by, e.g. ['region', 'device']
+  by: Dimension[];
+  // Drill-down filter, e.g. { campaign: 'Search' }
+  where?: DimensionFilter;
+}
+
+// Totals per dimension combination, highest revenue first
+export interface DashboardBreakdown {
+  tenant: string;
+  range: { from: string | null; to: string | null };
+  by: Dimension[];
+  where: DimensionFilter;
+  groups: GroupTotals[];
+  generatedAt: string;
+}
+
+interface TenantDataset {
+  version: string;
+  index: DailyIndex;
+  // Per-campaign CTR and the cost/revenue pair its cost ratio derives from
+  rates: Map<string, { ctr: number; cost: number; revenue: number }>;
+}
+
+const SNAPSHOT_TTL_MS = 60_000;
+// The stand-in row feed adds one row per campaign every tick, and at most
+// MAX_CATCH_UP_TICKS of them for a tenant nobody polled for a while
+const LIVE_TICK_MS = 5000;
+const MAX_CATCH_UP_TICKS = 60;
+const MAX_CACHED_SNAPSHOTS = 256;
+const FIXTURE_DIR = path.join(process.cwd(), 'public', 'fixtures');
+const TENANT_NAME = /^[a-z0-9][a-z0-9._-]*$/;
+
+const datasets = new Map<string, Promise<TenantDataset | null>>();
+type CachedResult = DashboardSnapshot | DashboardSummary | DashboardBreakdown;
+
+const snapshots = new Map<string, { snapshot: CachedResult; expires: number }>();
+const rowFeeds = new Map<string, { log: RowLog; tickedAt: number }>();
+
+function campaignRates(campaigns: CampaignData[]): TenantDataset['rates'] {
+  return new Map(
+    campaigns.map(({ campaign, ctr, cost, revenue }) => [campaign, { ctr, cost, revenue }])
+  );
+}
+
+function manifestPath(tenant: string): string {
+  return path.join(FIXTURE_DIR, `${tenant}.manifest.json`);
+}
+
+// Hash of a dataset's rows and campaign rates, so every server process holding
+// the same data reports the same version. The mock rows are random, so each
+// process that generates them (every restart, and each instance behind a load
+// balancer) has its own version, and browsers re-cache on reaching another one
+function contentVersion(parts: (ArrayBufferView | string)[]): string {
+  const hash = createHash('sha1');
+  parts.forEach(part =>
+    hash.update(typeof part === 'string' ? part : new Uint8Array(part.buffer, part.byteOffset, part.byteLength))
+  );
+  return hash.digest('hex').slice(0, 16);
+}
+
+// The built-in mock dataset serves the default tenant; any other tenant is a
+// fixture written by generate_fixtures.py as public/fixtures/<tenant>.manifest.json
+async function loadDataset(tenant: string): Promise<TenantDataset | null> {
+  if (tenant === DEFAULT_TENANT) {
+    const { metricColumns, campaignData } = await import('@/data/mockData');
+    const { revenue, users, conversions, campaign, date, campaigns, dates } = metricColumns;
+    return {
+      version: contentVersion([revenue, users, conversions, campaign, date, JSON.stringify([campaigns, dates, campaignData])]),
+      index: buildDailyIndex(metricColumns),
+      rates: campaignRates(campaignData),
+    };
+  }
+  if (!TENANT_NAME.test(tenant)) return null;
+
+  let manifestText: string;
+  let manifest: FixtureManifest;
+  try {
+    manifestText = await readFile(manifestPath(tenant), 'utf8');
+    manifest = JSON.parse(manifestText);
+  } catch {
+    return null;
+  }
+  if (!manifest.binary) return null;
+
+  const file = await readFile(path.join(FIXTURE_DIR, manifest.binary));
+  const buffer = file.buffer.slice(file.byteOffset, file.byteOffset + file.byteLength) as ArrayBuffer;
+  return {
+    version: contentVersion([file, manifestText]),
+    index: buildDailyIndex(decodeFixture(manifest, buffer)),
+    rates: campaignRates(manifest.campaignData),
+  };
+}
+
+// Whether the tenant exists, without loading its rows
+export async function hasTenant(tenant: string): Promise<boolean> {
+  if (tenant === DEFAULT_TENANT) return true;
+  if (!TENANT_NAME.test(tenant)) return false;
+  try {
+    await access(manifestPath(tenant));
+    return true;
+  } catch {
+    return false;
+  }
+}
+
+function getDataset(tenant: string): Promise<TenantDataset | null> {
+  let dataset = datasets.get(tenant);
+  if (!dataset) {
+    dataset = loadDataset(tenant);
+    datasets.set(tenant, dataset);
+  }
+  return dataset;
+}
+
+// Day positions [start, end) of the query's range
+function queryDays(index: DailyIndex, query: DashboardQuery): [number, number] {
+  const [start, end] = dayRange(index, query.from, query.to);
+  if (query.from !== undefined) return [start, end];
+  return [Math.max(start, end - (query.days ?? DEFAULT_SNAPSHOT_DAYS)), end];
+}
+
+function buildSnapshot(tenant: string, dataset: TenantDataset, query: DashboardQuery): DashboardSnapshot {
+  const { version, index, rates } = dataset;
+  const [start, end] = queryDays(index, query);
+  const aggregates = aggregateDays(index, start, end);
+  const campaigns = aggregates.byCampaign
+    .filter(({ users }) => users > 0)
+    .map(({ campaign, revenue, users, conversions }) => {
+      const rate = rates.get(campaign);
+      const cost = rate && rate.revenue !== 0 ? Math.floor((revenue * rate.cost) / rate.revenue) : 0;
+      return { campaign, revenue, users, conversions, ctr: rate ? rate.ctr : 0, cost };
+    });
+
+  return {
+    tenant,
+    range: { from: index.days[start] ?? null, to: index.days[end - 1] ?? null },
+    totals: aggregates.totals,
+    summary: summarize(aggregates.totals),
+    campaigns,
+    series: campaignSeries(index, start, end),
+    datasetVersion: version,
+    rowCursor: formatCursor(rowFeed(tenant, dataset).cursor()),
+    generatedAt: new Date().toISOString(),
+  };
+}
+
+function buildSummary(tenant: string, { version, index }: TenantDataset, query: DashboardQuery): DashboardSummary {
+  const [start, end] = queryDays(index, query);
+  const { totals } = aggregateDays(index, start, end);
+  return {
+    tenant,
+    range: { from: index.days[start] ?? null, to: index.days[end - 1] ?? null },
+    totals,
+    summary: summarize(totals),
+    datasetVersion: version,
+    generatedAt: new Date().toISOString(),
+  };
+}
+
+function buildBreakdown(tenant: string, { index }: TenantDataset, query: BreakdownQuery): DashboardBreakdown {
+  const [start, end] = queryDays(index, query);
+  const where = query.where ?? {};
+  const groups = groupBy(index.columns, query.by, {
+    where,
+    rows: index.rows.subarray(index.offsets[start], index.offsets[end]),
+  });
+  groups.sort((a, b) => b.revenue - a.revenue);
+
+  return {
+    tenant,
+    range: { from: index.days[start] ?? null, to: index.days[end - 1] ?? null },
+    by: query.by,
+    where,
+    groups,
+    generatedAt: new Date().toISOString(),
+  };
+}
+
+// The tenant's row log, first appended with the rows of the ticks elapsed
+// since it was last read. The log is a local stand-in for a real event store:
+// rows are simulated on demand, so no timer runs on the server
+function rowFeed(tenant: string, dataset: TenantDataset): RowLog {
+  const now = Date.now();
+  let feed = rowFeeds.get(tenant);
+  if (!feed) {
+    feed = { log: createRowLog(), tickedAt: now };
+    rowFeeds.set(tenant, feed);
+  }
+  const ticks = Math.floor((now - feed.tickedAt) / LIVE_TICK_MS);
+  if (ticks > 0) {
+    feed.tickedAt += ticks * LIVE_TICK_MS;
+    const date = new Date(now).toISOString().slice(0, 10);
+    const { campaigns } = dataset.index.columns;
+    for (let tick = Math.max(0, ticks - MAX_CATCH_UP_TICKS); tick < ticks; tick++) {
+      feed.log.append(campaigns.map(campaign => generateMetricRow(date, campaign)));
+    }
+  }
+  return feed.log;
+}
+
+// Cached per key for SNAPSHOT_TTL_MS; the least recently used entries are
+// dropped beyond MAX_CACHED_SNAPSHOTS. Null for an unknown tenant
+async function cachedSnapshot<T extends CachedResult>(
+  tenant: string,
+  key: string,
+  build: (dataset: TenantDataset) => T
+): Promise<T | null> {
+  const now = Date.now();
+  const cached = snapshots.get(key);
+  if (cached && cached.expires > now) {
+    snapshots.delete(key);
+    snapshots.set(key, cached);
+    return cached.snapshot as T;
+  }
+
+  const dataset = await getDataset(tenant);
+  if (!dataset) {
+    datasets.delete(tenant);
+    return null;
+  }
+
+  // Concurrent requests for the same key (e.g. two streamed sections) all
+  // waited on the dataset; only the first builds the result
+  const built = snapshots.get(key);
+  if (built && built.expires > Date.now()) return built.snapshot as T;
+
+  const snapshot = build(dataset);
+  snapshots.delete(key);
+  snapshots.set(key, { snapshot, expires: now + SNAPSHOT_TTL_MS });
+  if (snapshots.size > MAX_CACHED_SNAPSHOTS) {
+    snapshots.delete(snapshots.keys().next().value as string);
+  }
+  return snapshot;
+}
+
+// Aggregated dashboard data for a tenant and date range, or null for an
+// unknown tenant
+export function getDashboardSnapshot(query: DashboardQuery = {}): Promise<DashboardSnapshot | null> {
+  const tenant = query.tenant ?? DEFAULT_TENANT;
+  const key = JSON.stringify([tenant, query.from ?? null, query.to ?? null, query.days ?? null]);
+  return cachedSnapshot(tenant, key, dataset => buildSnapshot(tenant, dataset, query));
+}
+
+// Totals and summary metrics for a tenant and date range, or null for an
+// unknown tenant
+export function getDashboardSummary(query: DashboardQuery = {}): Promise<DashboardSummary | null> {
+  const tenant = query.tenant ?? DEFAULT_TENANT;
+  const key = JSON.stringify(['summary', tenant, query.from ?? null, query.to ?? null, query.days ?? null]);
+  return cachedSnapshot(tenant, key, dataset => buildSummary(tenant, dataset, query));
+}
+
+// Totals grouped by any combination of dimensions within a date range, for
+// drill-down views; null for an unknown tenant
+export function getDashboardBreakdown(query: BreakdownQuery): Promise<DashboardBreakdown | null> {
+  const tenant = query.tenant ?? DEFAULT_TENANT;
+  const where = query.where ?? {};
+  const filter = Object.keys(where)
+    .sort()
+    .map(dimension => [dimension, where[dimension as Dimension]]);
+  const key = JSON.stringify([
+    'breakdown',
+    tenant,
+    query.from ?? null,
+    query.to ?? null,
+    query.days ?? null,
+    query.by,
+    filter,
+  ]);
+  return cachedSnapshot(tenant, key, dataset => buildBreakdown(tenant, dataset, query));
+}
+
+// Rows appended to the tenant's row log after `since` (from now on when null),
+// encoded for /api/dashboard/rows; null for an unknown tenant
+export async function getRowDelta(tenant: string, since: RowCursor | null): Promise<RowDelta | null> {
+  const dataset = await getDataset(tenant);
+  if (!dataset) {
+    datasets.delete(tenant);
+    return null;
+  }
+
+  const { rows, cursor, reset } = rowFeed(tenant, dataset).read(since);
+  return encodeRowDelta(rows, cursor, reset);
+}
+"""
+
+# Time-bucketed rollups for the charts
+rollups_ts = """import type { MetricData } from '@/data/mockData';
+import type { CampaignSeries, MetricColumns, MetricTotals } from '@/lib/aggregate';
+
+export type Granularity = 'hour' | 'day' | 'week' | 'month';
+
+// Finest first; queries walk this list towards coarser levels
+export const GRANULARITIES: Granularity[] = ['hour', 'day', 'week', 'month'];
+
+const HOUR_MS = 3_600_000;
+const DAY_MS = 86_400_000;
+
+// Nominal bucket widths, used to estimate how many points a range produces
+const BUCKET_MS: Record<Granularity, number> = {
+  hour: HOUR_MS,
+  day: DAY_MS,
+  week: 7 * DAY_MS,
+  month: 30 * DAY_MS,
+};
+
+// One chart point: the bucket's start as an ISO label (2024-05-06T13:00Z for
+// hours, 2024-05-06 for days and weeks, 2024-05 for months) plus its sums
+export interface RollupPoint extends MetricTotals {
+  date: string;
+}
+
+export interface RollupQuery {
+  // Inclusive range in epoch milliseconds; defaults to the stored extent
+  from?: number;
+  to?: number;
+  // Chart width in pixels; the result has at most one point per pixel where a level allows it
+  width: number;
+  // Restrict the sums to one campaign
+  campaign?: string;
+}
+
+export interface RollupSeries {
+  granularity: Granularity;
+  points: RollupPoint[];
+}
+
+// The buckets of a RollupStore in flat typed arrays, compact enough to persist
+// (see lib/snapshotCache.ts). Bucket k of a level spans sums[k * width] to
+// sums[(k + 1) * width - 1], laid out as in Level below
+export interface RollupSnapshot {
+  // Campaign names in code order
+  campaigns: string[];
+  hasTimeOfDay: boolean;
+  // Sums per bucket: 3 totals plus 3 per campaign
+  width: number;
+  levels: Record<Granularity, { keys: Int32Array; sums: Float64Array }>;
+}
+
+export interface RollupStore {
+  add(date: string, campaign: string, revenue: number, users: number, conversions: number): void;
+  addRows(rows: MetricData[]): void;
+  addColumns(columns: MetricColumns): void;
+  addSeries(series: CampaignSeries): void;
+  // [first, last] bucket start in epoch milliseconds, or null when empty
+  extent(): [number, number] | null;
+  query(query: RollupQuery): RollupSeries;
+  // Copy the buckets out, or replace them with saved ones; load skips rebuilding from rows
+  save(): RollupSnapshot;
+  load(snapshot: RollupSnapshot): void;
+  clear(): void;
+}
+
+// Buckets of one granularity, ascending by key. Each bucket's sums are laid out
+// as [total revenue, users, conversions, then the same three per campaign code]
+interface Level {
+  keys: number[];
+  sums: number[][];
+}
+
+// Epoch milliseconds of an ISO date or date-time, read as UTC. Date-only values
+// fall at midnight, so they land in the day's first hour bucket
+function parseTime(date: string): number {
+  const hour = date.length >= 13 ? Number(date.slice(11, 13)) : 0;
+  return Date.UTC(Number(date.slice(0, 4)), Number(date.slice(5, 7)) - 1, Number(date.slice(8, 10)), hour);
+}
+
+function bucketKey(granularity: Granularity, time: number): number {
+  switch (granularity) {
+    case 'hour':
+      return Math.floor(time / HOUR_MS);
+    case 'day':
+      return Math.floor(time / DAY_MS);
+    case 'week':
+      // Day 0 (1970-01-01) was a Thursday; shift so weeks start on Monday
+      return Math.floor((Math.floor(time / DAY_MS) + 3) / 7);
+    case 'month': {
+      const at = new Date(time);
+      return (at.getUTCFullYear() - 1970) * 12 + at.getUTCMonth();
+    }
+  }
+}
+
+function bucketStart(granularity: Granularity, key: number): number {
+  switch (granularity) {
+    case 'hour':
+      return key * HOUR_MS;
+    case 'day':
+      return key * DAY_MS;
+    case 'week':
+      return (key * 7 - 3) * DAY_MS;
+    case 'month':
+      return Date.UTC(1970 + Math.floor(key / 12), key % 12, 1);
+  }
+}
+
+function bucketLabel(granularity: Granularity, key: number): string {
+  const iso = new Date(bucketStart(granularity, key)).toISOString();
+  switch (granularity) {
+    case 'hour':
+      return `${iso.slice(0, 13)}:00Z`;
+    case 'month':
+      return iso.slice(0, 7);
+    default:
+      return iso.slice(0, 10);
+  }
+}
+
+// First position in the ascending keys whose key is >= `key`
+function lowerBound(keys: number[], key: number): number {
+  let low = 0;
+  let high = keys.length;
+  while (low < high) {
+    const mid = (low + high) >>> 1;
+    if (keys[mid] < key) low = mid + 1;
+    else high = mid;
+  }
+  return low;
+}
+
+// Pre-aggregated buckets at hour, day, week and month granularity, per campaign.
+// Each added row updates one bucket per level: O(1) when it lands in or after
+// the newest bucket, as seeds and live rows do. An older timestamp costs a
+// binary search, plus an O(buckets) splice if its bucket is new. A query reads
+// only the buckets it returns, so range changes cost O(points rendered)
+export function createRollupStore(): RollupStore {
+  const levels: Record<Granularity, Level> = {
+    hour: { keys: [], sums: [] },
+    day: { keys: [], sums: [] },
+    week: { keys: [], sums: [] },
+    month: { keys: [], sums: [] },
+  };
+  const campaignCodes = new Map<string, number>();
+  // Hourly buckets are only meaningful once a row carries a time of day
+  let hasTimeOfDay = false;
+
+  const campaignCode = (campaign: string) => {
+    let code = campaignCodes.get(campaign);
+    if (code === undefined) {
+      code = campaignCodes.size;
+      campaignCodes.set(campaign, code);
+    }
+    return code;
+  };
+
+  // Find or insert the bucket; live data almost always hits the newest one
+  const bucket = (level: Level, key: number): number[] => {
+    const last = level.keys.length - 1;
+    if (last >= 0 && level.keys[last] === key) return level.sums[last];
+
+    const position = last >= 0 && level.keys[last] < key ? last + 1 : lowerBound(level.keys, key);
+    if (level.keys[position] === key) return level.sums[position];
+    const sums = [0, 0, 0];
+    level.keys.splice(position, 0, key);
+    level.sums.splice(position, 0, sums);
+    return sums;
+  };
+
+  // Bucket keys of one timestamp at every level, in GRANULARITIES order
+  const keysOf = (date: string) => {
+    if (date.length > 10) hasTimeOfDay = true;
+    const time = parseTime(date);
+    return GRANULARITIES.map(granularity => bucketKey(granularity, time));
+  };
+
+  const addAt = (keys: number[], code: number, revenue: number, users: number, conversions: number) => {
+    const slot = 3 + code * 3;
+    for (let g = 0; g < GRANULARITIES.length; g++) {
+      const sums = bucket(levels[GRANULARITIES[g]], keys[g]);
+      while (sums.length < slot + 3) sums.push(0);
+      sums[0] += revenue;
+      sums[1] += users;
+      sums[2] += conversions;
+      sums[slot] += revenue;
+      sums[slot + 1] += users;
+      sums[slot + 2] += conversions;
+    }
+  };
+
+  const clear = () => {
+    GRANULARITIES.forEach(granularity => {
+      levels[granularity] = { keys: [], sums: [] };
+    });
+    campaignCodes.clear();
+    hasTimeOfDay = false;
+  };
+
+  // Estimated points for the range at each level, from the nominal bucket width
+  const pickGranularity = (from: number, to: number, width: number): Granularity => {
+    const start = hasTimeOfDay ? 0 : 1;
+    for (let g = start; g < GRANULARITIES.length; g++) {
+      const granularity = GRANULARITIES[g];
+      if ((to - from) / BUCKET_MS[granularity] + 1 <= width) return granularity;
+    }
+    return 'month';
+  };
+
+  return {
+    add(date, campaign, revenue, users, conversions) {
+      addAt(keysOf(date), campaignCode(campaign), revenue, users, conversions);
+    },
+
+    addRows(rows) {
+      let lastDate = '';
+      let keys: number[] = [];
+      for (let i = 0; i < rows.length; i++) {
+        const row = rows[i];
+        if (row.date !== lastDate) {
+          lastDate = row.date;
+          keys = keysOf(row.date);
+        }
+        addAt(keys, campaignCode(row.campaign), row.revenue, row.users, row.conversions);
+      }
+    },
+
+    addColumns(columns) {
+      // Sum rows per (date, campaign) code pair first, so the levels are
+      // touched once per pair rather than once per row
+      const stride = columns.campaigns.length * 3;
+      const pairSums = new Float64Array(columns.dates.length * stride);
+      for (let i = 0; i < columns.length; i++) {
+        const g = columns.date[i] * stride + columns.campaign[i] * 3;
+        pairSums[g] += columns.revenue[i];
+        pairSums[g + 1] += columns.users[i];
+        pairSums[g + 2] += columns.conversions[i];
+      }
+
+      const codes = columns.campaigns.map(campaignCode);
+      columns.dates.forEach((date, d) => {
+        const keys = keysOf(date);
+        for (let c = 0; c < codes.length; c++) {
+          const g = d * stride + c * 3;
+          if (pairSums[g] === 0 && pairSums[g + 1] === 0 && pairSums[g + 2] === 0) continue;
+          addAt(keys, codes[c], pairSums[g], pairSums[g + 1], pairSums[g + 2]);
+        }
+      });
+    },
+
+    addSeries({ days, campaigns, values }) {
+      const codes = campaigns.map(campaignCode);
+      for (let k = 0; k < days.length; k++) {
+        const keys = keysOf(days[k]);
+        for (let c = 0; c < codes.length; c++) {
+          const v = (k * codes.length + c) * 3;
+          if (values[v] === 0 && values[v + 1] === 0 && values[v + 2] === 0) continue;
+          addAt(keys, codes[c], values[v], values[v + 1], values[v + 2]);
+        }
+      }
+    },
+
+    save() {
+      const width = 3 + campaignCodes.size * 3;
+      const saved = {} as RollupSnapshot['levels'];
+      GRANULARITIES.forEach(granularity => {
+        const { keys, sums } = levels[granularity];
+        const flat = new Float64Array(keys.length * width);
+        // Buckets only grow as wide as the highest campaign code they have seen
+        sums.forEach((bucketSums, k) => flat.set(bucketSums, k * width));
+        saved[granularity] = { keys: Int32Array.from(keys), sums: flat };
+      });
+      const campaigns: string[] = [];
+      campaignCodes.forEach((code, campaign) => {
+        campaigns[code] = campaign;
+      });
+      return { campaigns, hasTimeOfDay, width, levels: saved };
+    },
+
+    load(snapshot) {
+      clear();
+      snapshot.campaigns.forEach(campaignCode);
+      hasTimeOfDay = snapshot.hasTimeOfDay;
+      const { width } = snapshot;
+      GRANULARITIES.forEach(granularity => {
+        const { keys, sums } = snapshot.levels[granularity];
+        const level = levels[granularity];
+        for (let k = 0; k < keys.length; k++) {
+          level.keys.push(keys[k]);
+          level.sums.push(Array.prototype.slice.call(sums.subarray(k * width, (k + 1) * width)));
+        }
+      });
+    },
+
+    clear,
+
+    extent() {
+      const { keys } = levels.hour;
+      if (keys.length === 0) return null;
+      return [bucketStart('hour', keys[0]), bucketStart('hour', keys[keys.length - 1])];
+    },
+
+    query({ from, to, width, campaign }) {
+      const { keys: hours } = levels.hour;
+      if (hours.length === 0) return { granularity: hasTimeOfDay ? 'hour' : 'day', points: [] };
+      const rangeFrom = from ?? bucketStart('hour', hours[0]);
+      const rangeTo = to ?? bucketStart('hour', hours[hours.length - 1]);
+
+      const granularity = pickGranularity(rangeFrom, rangeTo, Math.max(1, width));
+      const level = levels[granularity];
+      const start = lowerBound(level.keys, bucketKey(granularity, rangeFrom));
+      const end = lowerBound(level.keys, bucketKey(granularity, rangeTo) + 1);
+
+      const code = campaign === undefined ? undefined : campaignCodes.get(campaign);
+      if (campaign !== undefined && code === undefined) return { granularity, points: [] };
+      const slot = code === undefined ? 0 : 3 + code * 3;
+
+      const points: RollupPoint[] = [];
+      for (let k = start; k < end; k++) {
+        const sums = level.sums[k];
+        points.push({
+          date: bucketLabel(granularity, level.keys[k]),
+          revenue: sums[slot] ?? 0,
+          users: sums[slot + 1] ?? 0,
+          conversions: sums[slot + 2] ?? 0,
+        });
+      }
+      return { granularity, points };
+    },
+  };
+}
+
+// The last `days` calendar days up to the newest bucket, bucketed for `width` pixels
+export function queryRecentDays(store: RollupStore, days: number, width: number, campaign?: string): RollupSeries {
+  const extent = store.extent();
+  if (!extent) return store.query({ width, campaign });
+  const from = (Math.floor(extent[1] / DAY_MS) - (days - 1)) * DAY_MS;
+  return store.query({ from, to: extent[1], width, campaign });
+}
+"""
+
+# Chart series downsampling
+downsample_ts = """export type DownsampleMode = 'lttb' | 'minmax';
+
+// Positions of at most `threshold` points of `values` chosen by
+// Largest-Triangle-Three-Buckets: the first and last points are kept, and each
+// bucket in between keeps the point forming the largest triangle with the
+// previous pick and the next bucket's average, which preserves visible peaks
+export function lttbIndices(values: ArrayLike<number>, threshold: number): number[] {
+  const length = values.length;
+  if (threshold >= length || length <= 2) return Array.from({ length }, (_, i) => i);
+  if (threshold < 3) return [0, length - 1];
+
+  const picks = [0];
+  const bucketSize = (length - 2) / (threshold - 2);
+  let previous = 0;
+
+  for (let b = 0; b < threshold - 2; b++) {
+    const start = Math.floor(b * bucketSize) + 1;
+    const end = Math.floor((b + 1) * bucketSize) + 1;
+
+    // Average of the next bucket (the last point for the final bucket)
+    const nextStart = end;
+    const nextEnd = Math.min(Math.floor((b + 2) * bucketSize) + 1, length);
+    let averageX = 0;
+    let averageY = 0;
+    for (let i = nextStart; i < nextEnd; i++) {
+      averageX += i;
+      averageY += values[i];
+    }
+    const nextCount = nextEnd - nextStart;
+    averageX = nextCount > 0 ? averageX / nextCount : length - 1;
+    averageY = nextCount > 0 ? averageY / nextCount : values[length - 1];
+
+    let best = start;
+    let bestArea = -1;
+    const previousY = values[previous];
+    for (let i = start; i < end; i++) {
+      const area = Math.abs((previous - averageX) * (values[i] - previousY) - (previous - i) * (averageY - previousY));
+      if (area > bestArea) {
+        bestArea = area;
+        best = i;
+      }
+    }
+    picks.push(best);
+    previous = best;
+  }
+
+  picks.push(length - 1);
+  return picks;
+}
+
+// Positions of at most `threshold` points of `values`: the minimum and maximum
+// of each of threshold / 2 equal buckets, in order, so every extreme survives
+export function minMaxIndices(values: ArrayLike<number>, threshold: number): number[] {
+  const length = values.length;
+  if (threshold >= length || length <= 2) return Array.from({ length }, (_, i) => i);
+
+  const buckets = Math.max(1, Math.floor(threshold / 2));
+  const picks: number[] = [];
+  for (let b = 0; b < buckets; b++) {
+    const start = Math.floor((b * length) / buckets);
+    const end = Math.floor(((b + 1) * length) / buckets);
+    if (start >= end) continue;
+
+    let min = start;
+    let max = start;
+    for (let i = start + 1; i < end; i++) {
+      if (values[i] < values[min]) min = i;
+      if (values[i] > values[max]) max = i;
+    }
+    if (min === max) picks.push(min);
+    else picks.push(Math.min(min, max), Math.max(min, max));
+  }
+  return picks;
+}
+
+// Reduce chart points to roughly `threshold` while keeping the shape of each
+// metric in `keys`. Every metric is sampled separately and the union of the
+// picks is kept, so points stay shared across the series of one chart
+export function downsamplePoints<T>(
+  points: T[],
+  keys: (keyof T)[],
+  threshold: number,
+  mode: DownsampleMode = 'lttb'
+): T[] {
+  if (points.length <= threshold || keys.length === 0) return points;
+
+  const perSeries = Math.max(3, Math.floor(threshold / keys.length));
+  const select = mode === 'lttb' ? lttbIndices : minMaxIndices;
+  const keep = new Uint8Array(points.length);
+  const values = new Float64Array(points.length);
+
+  keys.forEach(key => {
+    for (let i = 0; i < points.length; i++) values[i] = Number(points[i][key]);
+    select(values, perSeries).forEach(i => {
+      keep[i] = 1;
+    });
+  });
+
+  return points.filter((_, i) => keep[i] === 1);
+}
+"""
+
+# Memoized live-store selectors
+selectors_ts = """import type { LiveState } from '@/lib/liveStore';
+import type { SummaryMetrics } from '@/lib/aggregate';
+import type { CampaignData } from '@/data/mockData';
+import { calculateGrowth } from '@/lib/utils';
+
+type Selector<S, R> = (state: S) => R;
+
+// Memoize a derivation on the identity of its inputs. The live store replaces
+// a slice only when ingested rows touch it, so each slice reference acts as
+// that slice's dataset version: the result keeps its reference (and memoized
+// consumers skip rendering) until an input actually changes
+export function createSelector<S, I extends unknown[], R>(
+  inputs: { [K in keyof I]: Selector<S, I[K]> },
+  compute: (...args: I) => R
+): Selector<S, R> {
+  let lastArgs: unknown[] | null = null;
+  let lastResult: R;
+
+  return state => {
+    const args = inputs.map(input => input(state));
+    if (lastArgs && args.every((arg, i) => arg === lastArgs![i])) return lastResult;
+    lastArgs = args;
+    lastResult = compute(...(args as I));
+    return lastResult;
+  };
+}
+
+export interface GrowthMetrics {
+  revenue: number;
+  users: number;
+  conversions: number;
+  conversionRate: number;
+}
+
+export interface CampaignChartRow {
+  name: string;
+  revenue: number;
+  users: number;
+  conversions: number;
+}
+
+export const selectSeeded = (state: LiveState) => state.seeded;
+export const selectStale = (state: LiveState) => state.stale;
+export const selectDatasetVersion = (state: LiveState) => state.datasetVersion;
+export const selectSummary = (state: LiveState) => state.summary;
+export const selectCampaigns = (state: LiveState) => state.campaigns;
+export const selectRollupVersion = (state: LiveState) => state.rollupVersion;
+export const selectLastUpdated = (state: LiveState) => state.lastUpdated;
+
+// Growth percentages against simulated previous-period values
+export function growthMetrics(summary: SummaryMetrics): GrowthMetrics {
+  return {
+    revenue: calculateGrowth(summary.totalRevenue, summary.totalRevenue * 0.9),
+    users: calculateGrowth(summary.totalUsers, summary.totalUsers * 0.85),
+    conversions: calculateGrowth(summary.totalConversions, summary.totalConversions * 0.95),
+    conversionRate: calculateGrowth(summary.conversionRate, summary.conversionRate * 0.88),
+  };
+}
+
+// Rows for the campaign bar and pie charts; Charts memoizes them on the campaigns slice
+export function campaignChartRows(campaigns: CampaignData[]): CampaignChartRow[] {
+  return campaigns.map(campaign => ({
+    name: campaign.campaign,
+    revenue: campaign.revenue,
+    users: campaign.users,
+    conversions: campaign.conversions,
+  }));
+}
+
+export const selectGrowthMetrics = createSelector<LiveState, [SummaryMetrics], GrowthMetrics>(
+  [selectSummary],
+  growthMetrics
+);
+"""
+
+# Development render counter
+use_render_count_ts = """// Development-only render accounting. Every component that calls
+// useRenderCount bumps its counter on each render, and the counters are
+// exposed in the browser console:
+//
+//   __renderCounts.reset()   // then toggle the theme or wait for a tick
+//   __renderCounts.get()     // { Charts: 0, RevenueTrendCard: 0, ... }
+//
+// Under React StrictMode development renders run twice, so counts are doubled.
+// Production builds skip the bookkeeping entirely.
+const enabled = process.env.NODE_ENV !== 'production';
+const counts = new Map<string, number>();
+
+export function getRenderCounts(): Record<string, number> {
+  const snapshot: Record<string, number> = {};
+  counts.forEach((count, name) => {
+    snapshot[name] = count;
+  });
+  return snapshot;
+}
+
+export function resetRenderCounts(): void {
+  counts.forEach((_, name) => counts.set(name, 0));
+}
+
+if (enabled && typeof window !== 'undefined') {
+  (window as unknown as { __renderCounts: object }).__renderCounts = {
+    get: getRenderCounts,
+    reset: resetRenderCounts,
+  };
+}
+
+// Count a render of `name`; call it unconditionally at the top of a component
+export function useRenderCount(name: string): void {
+  if (!enabled) return;
+  counts.set(name, (counts.get(name) ?? 0) + 1);
+}
+"""
+
+# Dimension dictionaries and group-by
+dimensions_ts = """import {
+  ATTRIBUTE_DIMENSIONS,
+  UNSET_DIMENSION_VALUE,
+  type AttributeDimension,
+  type MetricColumns,
+  type MetricTotals,
+} from './aggregate';
+
+export type Dimension = 'campaign' | AttributeDimension;
+
+export const DIMENSIONS: Dimension[] = ['campaign', ...ATTRIBUTE_DIMENSIONS];
+
+// Dimension values to keep, e.g. { campaign: 'Search', region: 'Europe' } to
+// drill into one campaign's European rows
+export type DimensionFilter = Partial<Record<Dimension, string>>;
+
+export interface GroupByOptions {
+  where?: DimensionFilter;
+  // Only scan these row ids, e.g. one date range of a DailyIndex
+  rows?: ArrayLike<number>;
+}
+
+export interface GroupTotals extends MetricTotals {
+  // The group's value for each requested dimension
+  key: DimensionFilter;
+  rows: number;
+}
+
+// Above this many possible groups the sums are kept sparse
+const DENSE_GROUP_LIMIT = 1 << 20;
+
+// Codes and dictionary of a dimension. A missing attribute reads as a single
+// unset value, so it can still be grouped or filtered on
+export function dimensionColumn(
+  columns: MetricColumns,
+  dimension: Dimension
+): { codes: ArrayLike<number> | null; values: string[] } {
+  if (dimension === 'campaign') return { codes: columns.campaign, values: columns.campaigns };
+  const column = columns.dimensions[dimension];
+  return column ?? { codes: null, values: [UNSET_DIMENSION_VALUE] };
+}
+
+export function isDimension(value: string): value is Dimension {
+  return (DIMENSIONS as string[]).indexOf(value) >= 0;
+}
+
+// Totals per combination of `dimensions`, e.g. ['campaign', 'device'].
+// Each row's group is a mixed-radix number built from its dictionary codes,
+// so the scan compares and hashes integers only; filter values are turned
+// into codes once up front. Past 2^53 possible groups that number would lose
+// precision and merge groups, so such scans key groups by their code tuple
+// instead. Groups without rows are left out, and the rest come in ascending
+// code order
+export function groupBy(
+  columns: MetricColumns,
+  dimensions: Dimension[],
+  { where = {}, rows }: GroupByOptions = {}
+): GroupTotals[] {
+  const grouped = dimensions.map(dimension => dimensionColumn(columns, dimension));
+  const strides: number[] = [];
+  let groupCount = 1;
+  grouped.forEach(({ values }) => {
+    strides.push(groupCount);
+    groupCount *= values.length;
+  });
+
+  const filterCodes: ArrayLike<number>[] = [];
+  const filterValues: number[] = [];
+  for (let d = 0; d < DIMENSIONS.length; d++) {
+    const dimension = DIMENSIONS[d];
+    const value = where[dimension];
+    if (value === undefined) continue;
+    const { codes, values } = dimensionColumn(columns, dimension);
+    const code = values.indexOf(value);
+    if (code < 0) return [];
+    // A missing attribute is unset on every row, which only its unset value matches
+    if (codes === null) continue;
+    filterCodes.push(codes);
+    filterValues.push(code);
+  }
+
+  // Dense: the group number is the slot. Sparse: slots are handed out in scan order
+  const dense = groupCount <= DENSE_GROUP_LIMIT;
+  const wide = groupCount > Number.MAX_SAFE_INTEGER;
+  const slotOf = new Map<number | string, number>();
+  const groupKeys: (number | string)[] = [];
+  let sums = new Float64Array(dense ? groupCount * 3 : 3 * 64);
+  let counts = new Uint32Array(dense ? groupCount : 64);
+
+  const length = rows ? rows.length : columns.length;
+  for (let j = 0; j < length; j++) {
+    const i = rows ? rows[j] : j;
+
+    let matches = true;
+    for (let f = 0; f < filterCodes.length; f++) {
+      if (filterCodes[f][i] !== filterValues[f]) {
+        matches = false;
+        break;
+      }
+    }
+    if (!matches) continue;
+
+    let group = 0;
+    let tuple = '';
+    for (let d = 0; d < grouped.length; d++) {
+      const codes = grouped[d].codes;
+      const code = codes === null ? 0 : codes[i];
+      if (wide) tuple += `${code},`;
+      else group += code * strides[d];
+    }
+
+    let slot = group;
+    if (!dense) {
+      const id = wide ? tuple : group;
+      const known = slotOf.get(id);
+      if (known === undefined) {
+        slot = groupKeys.length;
+        slotOf.set(id, slot);
+        groupKeys.push(id);
+        if (slot >= counts.length) {
+          const grownSums = new Float64Array(sums.length * 2);
+          grownSums.set(sums);
+          sums = grownSums;
+          const grownCounts = new Uint32Array(counts.length * 2);
+          grownCounts.set(counts);
+          counts = grownCounts;
+        }
+      } else {
+        slot = known;
+      }
+    }
+
+    sums[slot * 3] += columns.revenue[i];
+    sums[slot * 3 + 1] += columns.users[i];
+    sums[slot * 3 + 2] += columns.conversions[i];
+    counts[slot]++;
+  }
+
+  // Dictionary codes of a group, one per dimension
+  const codesOf = (group: number | string): number[] =>
+    typeof group === 'string'
+      ? group.split(',', grouped.length).map(Number)
+      : grouped.map(({ values }, d) => Math.floor(group / strides[d]) % values.length);
+
+  const toTotals = (codes: number[], slot: number): GroupTotals => {
+    const key: DimensionFilter = {};
+    grouped.forEach(({ values }, d) => {
+      key[dimensions[d]] = values[codes[d]];
+    });
+    return {
+      key,
+      revenue: sums[slot * 3],
+      users: sums[slot * 3 + 1],
+      conversions: sums[slot * 3 + 2],
+      rows: counts[slot],
+    };
+  };
+
+  const result: GroupTotals[] = [];
+  if (dense) {
+    for (let group = 0; group < groupCount; group++) {
+      if (counts[group] > 0) result.push(toTotals(codesOf(group), group));
+    }
+  } else {
+    // The last dimension is the most significant digit of the group number
+    const compare = (a: number[], b: number[]) => {
+      for (let d = a.length - 1; d >= 0; d--) {
+        if (a[d] !== b[d]) return a[d] - b[d];
+      }
+      return 0;
+    };
+    groupKeys
+      .map((group, slot) => ({ codes: codesOf(group), slot }))
+      .sort((a, b) => compare(a.codes, b.codes))
+      .forEach(({ codes, slot }) => result.push(toTotals(codes, slot)));
+  }
+  return result;
+}
+"""
+
+# Bundle size report
+bench_bundle_ts = """// Per-chunk bundle size report with budgets, read from a production build.
+//
+//   npm run build && npm run bundle -- [--initial-budget 220] [--chunk-budget 160]
+//                                      [--out bundle.json]
+//
+// Every JavaScript chunk in .next/static/chunks is listed with its raw and
+// gzip size and the routes that load it at startup. Chunks no route loads at
+// startup are lazy (next/dynamic panels). Budgets are gzip KiB: the startup
+// JavaScript of each route, and any single lazy chunk. Exceeding either fails
+// the run, so the report can gate CI.
+import { execSync } from 'child_process';
+import { existsSync, mkdirSync, readdirSync, readFileSync, statSync, writeFileSync } from 'fs';
+import path from 'path';
+import { gzipSync } from 'zlib';
+
+type ChunkKind = 'initial' | 'lazy' | 'legacy';
+
+interface ChunkSize {
+  file: string;
+  kind: ChunkKind;
+  bytes: number;
+  gzipBytes: number;
+  // Routes that load the chunk at startup
+  routes: string[];
+}
+
+interface RouteSize {
+  route: string;
+  chunks: number;
+  bytes: number;
+  gzipBytes: number;
+}
+
+interface BundleReport {
+  version: number;
+  commit: string | null;
+  date: string;
+  budgets: { initialGzipBytes: number; chunkGzipBytes: number };
+  routes: RouteSize[];
+  chunks: ChunkSize[];
+  overBudget: string[];
+}
+
+const REPORT_VERSION = 1;
+const KIB = 1024;
+const NEXT_DIR = path.join(process.cwd(), '.next');
+const RESULTS_DIR = path.join(process.cwd(), 'bench', 'results');
+
+function parseArgs(argv: string[]) {
+  const options = {
+    initialBudgetKib: 220,
+    chunkBudgetKib: 160,
+    out: null as string | null,
+  };
+
+  for (let i = 0; i < argv.length; i++) {
+    const value = () => {
+      if (i + 1 >= argv.length) throw new Error(`Missing value for ${argv[i]}`);
+      return argv[++i];
+    };
+    switch (argv[i]) {
+      case '--initial-budget':
+        options.initialBudgetKib = Number(value());
+        break;
+      case '--chunk-budget':
+        options.chunkBudgetKib = Number(value());
+        break;
+      case '--out':
+        options.out = value();
+        break;
+      default:
+        throw new Error(`Unknown option ${argv[i]}`);
+    }
+  }
+
+  return options;
+}
+
+function currentCommit(): string | null {
+  try {
+    return execSync('git rev-parse --short HEAD', { stdio: ['ignore', 'pipe', 'ignore'] }).toString().trim();
+  } catch {
+    return null;
+  }
+}
+
+function readManifest<T>(name: string): T {
+  const file = path.join(NEXT_DIR, name);
+  if (!existsSync(file)) {
+    throw new Error(`${file} not found. Run \\`npm run build\\` first.`);
+  }
+  return JSON.parse(readFileSync(file, 'utf8'));
+}
+
+// Every .js file under dir, relative to .next (the form manifests use)
+function listChunks(dir: string): string[] {
+  if (!existsSync(dir)) return [];
+  const files: string[] = [];
+  readdirSync(dir).forEach(name => {
+    const full = path.join(dir, name);
+    if (statSync(full).isDirectory()) files.push(...listChunks(full));
+    else if (name.endsWith('.js')) files.push(path.relative(NEXT_DIR, full).split(path.sep).join('/'));
+  });
+  return files;
+}
+
+// Startup chunks per app route: the route's page entry plus the entries of
+// every layout above it, e.g. /reports/page -> /layout, /reports/layout
+function routeChunks(pages: Record<string, string[]>, rootMainFiles: string[]): Map<string, Set<string>> {
+  const routes = new Map<string, Set<string>>();
+  Object.keys(pages)
+    .filter(entry => entry.endsWith('/page'))
+    .forEach(entry => {
+      const segments = entry.split('/').slice(1, -1);
+      const files = new Set(rootMainFiles);
+      for (let depth = 0; depth <= segments.length; depth++) {
+        const layout = ['', ...segments.slice(0, depth), 'layout'].join('/');
+        (pages[layout] ?? []).forEach(file => files.add(file));
+      }
+      pages[entry].forEach(file => files.add(file));
+      const route = entry.slice(0, -'/page'.length) || '/';
+      routes.set(route, new Set(Array.from(files).filter(file => file.endsWith('.js'))));
+    });
+  return routes;
+}
+
+function formatKib(bytes: number): string {
+  return `${(bytes / KIB).toFixed(1)} KiB`;
+}
+
+function main() {
+  const options = parseArgs(process.argv.slice(2));
+  const appManifest = readManifest<{ pages: Record<string, string[]> }>('app-build-manifest.json');
+  const buildManifest = readManifest<{
+    rootMainFiles?: string[];
+    polyfillFiles?: string[];
+    pages?: Record<string, string[]>;
+  }>('build-manifest.json');
+
+  const routes = routeChunks(appManifest.pages, buildManifest.rootMainFiles ?? []);
+  // Pages-router runtime and polyfills; only loaded by legacy browsers or error pages
+  const legacy = new Set(buildManifest.polyfillFiles ?? []);
+  Object.keys(buildManifest.pages ?? {}).forEach(page => {
+    (buildManifest.pages ?? {})[page].forEach(file => legacy.add(file));
+  });
+
+  const chunks: ChunkSize[] = listChunks(path.join(NEXT_DIR, 'static', 'chunks')).map(file => {
+    const source = readFileSync(path.join(NEXT_DIR, file));
+    const loadedBy: string[] = [];
+    routes.forEach((files, route) => {
+      if (files.has(file)) loadedBy.push(route);
+    });
+    const kind: ChunkKind = loadedBy.length > 0 ? 'initial' : legacy.has(file) ? 'legacy' : 'lazy';
+    return { file, kind, bytes: source.length, gzipBytes: gzipSync(source).length, routes: loadedBy };
+  });
+  chunks.sort((a, b) => b.gzipBytes - a.gzipBytes);
+
+  const sizes = new Map(chunks.map(chunk => [chunk.file, chunk]));
+  const routeSizes: RouteSize[] = [];
+  routes.forEach((files, route) => {
+    let bytes = 0;
+    let gzipBytes = 0;
+    files.forEach(file => {
+      const chunk = sizes.get(file);
+      bytes += chunk ? chunk.bytes : 0;
+      gzipBytes += chunk ? chunk.gzipBytes : 0;
+    });
+    routeSizes.push({ route, chunks: files.size, bytes, gzipBytes });
+  });
+  routeSizes.sort((a, b) => (a.route < b.route ? -1 : 1));
+
+  const budgets = {
+    initialGzipBytes: options.initialBudgetKib * KIB,
+    chunkGzipBytes: options.chunkBudgetKib * KIB,
+  };
+  const overBudget: string[] = [];
+  routeSizes.forEach(({ route, gzipBytes }) => {
+    if (gzipBytes > budgets.initialGzipBytes) {
+      overBudget.push(`${route}: startup JS ${formatKib(gzipBytes)} > ${formatKib(budgets.initialGzipBytes)}`);
+    }
+  });
+  chunks.forEach(({ file, kind, gzipBytes }) => {
+    if (kind === 'lazy' && gzipBytes > budgets.chunkGzipBytes) {
+      overBudget.push(`${file}: ${formatKib(gzipBytes)} > ${formatKib(budgets.chunkGzipBytes)}`);
+    }
+  });
+
+  console.log('Startup JavaScript per route (gzip):');
+  routeSizes.forEach(({ route, chunks: count, bytes, gzipBytes }) => {
+    console.log(`  ${route.padEnd(32)} ${formatKib(gzipBytes).padStart(11)}  (${formatKib(bytes)} raw, ${count} chunks)`);
+  });
+  console.log('\\nChunks (gzip, largest first):');
+  chunks.forEach(({ file, kind, bytes, gzipBytes, routes: loadedBy }) => {
+    const where = kind === 'initial' ? loadedBy.join(', ') : kind;
+    console.log(`  ${formatKib(gzipBytes).padStart(11)} ${formatKib(bytes).padStart(11)}  ${file}  [${where}]`);
+  });
+
+  const report: BundleReport = {
+    version: REPORT_VERSION,
+    commit: currentCommit(),
+    date: new Date().toISOString(),
+    budgets,
+    routes: routeSizes,
+    chunks,
+    overBudget,
+  };
+  mkdirSync(RESULTS_DIR, { recursive: true });
+  const out = options.out ?? path.join(RESULTS_DIR, `bundle-${report.commit ?? 'local'}.json`);
+  writeFileSync(out, JSON.stringify(report, null, 2));
+  console.log(`\\nReport written to ${path.relative(process.cwd(), out)}`);
+
+  if (overBudget.length > 0) {
+    console.error('\\nOver budget:');
+    overBudget.forEach(line => console.error(`  ${line}`));
+    process.exitCode = 1;
+  }
+}
+
+main();
+"""
+
+# Dashboard load milestones
+use_load_timing_ts = """import { useEffect } from 'react';
+
+// Dashboard load milestones, in milliseconds since navigation start. Each is
+// recorded once per page load, when its section first mounts with data, both
+// as a `dashboard:<milestone>` performance mark (shown in the DevTools
+// performance panel) and in the browser console:
+//
+//   __dashboardTimings.get()   // { firstMetric: 212, charts: 230, table: 241 }
+export type LoadMilestone = 'firstMetric' | 'charts' | 'table';
+
+const timings: Partial<Record<LoadMilestone, number>> = {};
+const listeners = new Set<(milestone: LoadMilestone, ms: number) => void>();
+
+export function getLoadTimings(): Partial<Record<LoadMilestone, number>> {
+  return { ...timings };
+}
+
+// Be told about each milestone as it is recorded, e.g. to forward it to analytics
+export function onLoadTiming(listener: (milestone: LoadMilestone, ms: number) => void): () => void {
+  listeners.add(listener);
+  return () => {
+    listeners.delete(listener);
+  };
+}
+
+if (typeof window !== 'undefined') {
+  (window as unknown as { __dashboardTimings: object }).__dashboardTimings = { get: getLoadTimings };
+}
+
+// Record `milestone` when the calling component first mounts
+export function useLoadTiming(milestone: LoadMilestone): void {
+  useEffect(() => {
+    if (timings[milestone] !== undefined) return;
+    const ms = Math.round(performance.now());
+    timings[milestone] = ms;
+    if (typeof performance.mark === 'function') performance.mark(`dashboard:${milestone}`);
+    listeners.forEach(listener => listener(milestone, ms));
+  }, [milestone]);
+}
+"""
+
+# # Performance mode store
+performance_mode_ts = """import { useSyncExternalStore } from 'react';
+
+// Performance mode trades decoration for frame rate on slow machines: motion
+// wrappers skip their animations, chart entrance animations are skipped,
+// and the `perf-mode` class on <html> turns off backdrop blur and CSS
+// transitions (see styles/globals.css).
+//
+// An explicit choice from the toggle is kept in localStorage. Without one the
+// mode turns itself on when the OS asks for reduced motion, or when a short
+// frame-rate probe after load finds the device cannot hold PROBE_MIN_FPS.
+const STORAGE_KEY = 'performanceMode';
+const ROOT_CLASS = 'perf-mode';
+const PROBE_FRAMES = 60;
+const PROBE_MIN_FPS = 45;
+// Frames this long are spent in the background (e.g. a hidden tab), not rendering
+const PROBE_MAX_FRAME_MS = 250;
+
+export type PerformanceModeSource = 'user' | 'reduced-motion' | 'frame-rate' | 'default';
+
+interface PerformanceModeState {
+  enabled: boolean;
+  source: PerformanceModeSource;
+}
+
+const SERVER_STATE: PerformanceModeState = { enabled: false, source: 'default' };
+
+let state = SERVER_STATE;
+let initialized = false;
+const listeners = new Set<() => void>();
+
+function apply(next: PerformanceModeState) {
+  state = next;
+  document.documentElement.classList.toggle(ROOT_CLASS, next.enabled);
+  listeners.forEach(listener => listener());
+}
+
+// Average frame rate over the next PROBE_FRAMES animation frames
+function probeFrameRate(): Promise<number> {
+  return new Promise(resolve => {
+    const durations: number[] = [];
+    let last = 0;
+    const step = (time: number) => {
+      if (last > 0 && time - last < PROBE_MAX_FRAME_MS) durations.push(time - last);
+      last = time;
+      if (durations.length < PROBE_FRAMES) {
+        requestAnimationFrame(step);
+        return;
+      }
+      const total = durations.reduce((sum, duration) => sum + duration, 0);
+      resolve((1000 * durations.length) / total);
+    };
+    requestAnimationFrame(step);
+  });
+}
+
+// Restore the stored choice or detect a default; runs once per page load
+export function initPerformanceMode(): void {
+  if (initialized || typeof window === 'undefined') return;
+  initialized = true;
+
+  const stored = localStorage.getItem(STORAGE_KEY);
+  if (stored === 'on' || stored === 'off') {
+    apply({ enabled: stored === 'on', source: 'user' });
+    return;
+  }
+
+  const reducedMotion = window.matchMedia('(prefers-reduced-motion: reduce)');
+  if (reducedMotion.matches) {
+    apply({ enabled: true, source: 'reduced-motion' });
+    return;
+  }
+
+  probeFrameRate().then(fps => {
+    // The user may have chosen while the probe ran
+    if (state.source === 'user') return;
+    if (fps < PROBE_MIN_FPS) apply({ enabled: true, source: 'frame-rate' });
+  });
+}
+
+export function setPerformanceMode(enabled: boolean): void {
+  localStorage.setItem(STORAGE_KEY, enabled ? 'on' : 'off');
+  apply({ enabled, source: 'user' });
+}
+
+export function getPerformanceMode(): PerformanceModeState {
+  return state;
+}
+
+function subscribe(listener: () => void): () => void {
+  listeners.add(listener);
+  return () => {
+    listeners.delete(listener);
+  };
+}
+
+// Whether performance mode is on; false during server rendering and hydration
+export function usePerformanceMode(): boolean {
+  return useSyncExternalStore(
+    subscribe,
+    () => state.enabled,
+    () => SERVER_STATE.enabled
+  );
+}
+"""
+
+# # Persistent snapshot cache
+snapshot_cache_ts = """import type { CampaignData } from '@/data/mockData';
+import type { MetricTotals } from '@/lib/aggregate';
+import type { DashboardQuery } from '@/lib/dashboardData';
+import type { LiveSeed } from '@/lib/liveStore';
+import { GRANULARITIES, type RollupSnapshot } from '@/lib/rollups';
+
+// Browser-side persistence of dashboard snapshots in IndexedDB, so a reload
+// renders the last seen aggregates at once while the server revalidates them
+// (see components/Dashboard.tsx). Each entry holds a snapshot's seed, with its
+// per-campaign daily series in a Float64Array, and the rollup buckets built
+// from it, so neither has to be fetched or recomputed before the first paint.
+//
+// Entries are keyed by (schema version, tenant, date range). Small metadata
+// records live apart from the payloads so eviction never reads a payload:
+// storing a tenant's snapshot drops its entries of any other dataset version,
+// then the least recently used entries beyond the byte budget. In the console:
+//
+//   __snapshotCache.usage()   // { entries: 2, bytes: 1843200 }
+//   __snapshotCache.clear()
+//
+// Every operation is best effort: where IndexedDB is unavailable or fails
+// (server rendering, some private windows, quota errors) reads miss and
+// writes are dropped.
+
+// Bump when the stored layout of LiveSeed or RollupSnapshot changes; entries
+// of other schema versions are never read and are dropped on the next write
+export const SNAPSHOT_SCHEMA_VERSION = 1;
+export const DEFAULT_CACHE_BUDGET_BYTES = 32 * 1024 * 1024;
+
+const DB_NAME = 'admybrand-insights';
+const DB_VERSION = 1;
+const ENTRIES = 'snapshotEntries';
+const PAYLOADS = 'snapshotPayloads';
+
+// The tenant is required so entries can be invalidated per tenant
+export type SnapshotCacheQuery = DashboardQuery & { tenant: string };
+
+interface SnapshotEntry {
+  key: string;
+  tenant: string;
+  schemaVersion: number;
+  datasetVersion: string;
+  bytes: number;
+  storedAt: number;
+  lastUsed: number;
+}
+
+interface SnapshotPayload {
+  key: string;
+  totals: MetricTotals;
+  campaigns: CampaignData[];
+  series: { days: string[]; campaigns: string[]; values: Float64Array };
+  generatedAt?: string;
+  rollups: RollupSnapshot;
+}
+
+export interface SnapshotCacheOptions {
+  budgetBytes?: number;
+  dbName?: string;
+}
+
+export interface SnapshotCache {
+  // The cached seed for the query, rollups included, or null; marks it recently used
+  get(query: SnapshotCacheQuery): Promise<LiveSeed | null>;
+  // Store a fresh seed and its buckets, then evict; seeds without a dataset version are skipped
+  put(query: SnapshotCacheQuery, seed: LiveSeed, rollups: RollupSnapshot): Promise<void>;
+  // Drop the tenant's entries of every dataset version except `keepVersion`
+  invalidate(tenant: string, keepVersion?: string): Promise<void>;
+  usage(): Promise<{ entries: number; bytes: number }>;
+  clear(): Promise<void>;
+}
+
+function snapshotKey({ tenant, from, to, days }: SnapshotCacheQuery): string {
+  return JSON.stringify([SNAPSHOT_SCHEMA_VERSION, tenant, from ?? null, to ?? null, days ?? null]);
+}
+
+function request<T>(req: IDBRequest<T>): Promise<T> {
+  return new Promise((resolve, reject) => {
+    req.onsuccess = () => resolve(req.result);
+    req.onerror = () => reject(req.error);
+  });
+}
+
+function completion(tx: IDBTransaction): Promise<void> {
+  return new Promise((resolve, reject) => {
+    tx.oncomplete = () => resolve();
+    tx.onerror = () => reject(tx.error);
+    tx.onabort = () => reject(tx.error);
+  });
+}
+
+// Typed arrays at their byte length, everything else at two bytes per JSON character
+function payloadBytes(payload: SnapshotPayload): number {
+  let bytes = payload.series.values.byteLength;
+  GRANULARITIES.forEach(granularity => {
+    const { keys, sums } = payload.rollups.levels[granularity];
+    bytes += keys.byteLength + sums.byteLength;
+  });
+  const { totals, campaigns, series, rollups } = payload;
+  return bytes + 2 * JSON.stringify([totals, campaigns, series.days, series.campaigns, rollups.campaigns]).length;
+}
+
+export function createSnapshotCache({
+  budgetBytes = DEFAULT_CACHE_BUDGET_BYTES,
+  dbName = DB_NAME,
+}: SnapshotCacheOptions = {}): SnapshotCache {
+  let opened: Promise<IDBDatabase | null> | null = null;
+
+  // Opened on first use; resolves to null where IndexedDB cannot be used
+  const open = (): Promise<IDBDatabase | null> => {
+    if (!opened) {
+      opened = new Promise<IDBDatabase | null>(resolve => {
+        if (typeof indexedDB === 'undefined') {
+          resolve(null);
+          return;
+        }
+        const req = indexedDB.open(dbName, DB_VERSION);
+        req.onupgradeneeded = () => {
+          const db = req.result;
+          if (!db.objectStoreNames.contains(ENTRIES)) db.createObjectStore(ENTRIES, { keyPath: 'key' });
+          if (!db.objectStoreNames.contains(PAYLOADS)) db.createObjectStore(PAYLOADS, { keyPath: 'key' });
+        };
+        req.onsuccess = () => {
+          const db = req.result;
+          // Let another tab upgrade the database; the next call reopens it
+          db.onversionchange = () => {
+            db.close();
+            opened = null;
+          };
+          resolve(db);
+        };
+        req.onerror = () => resolve(null);
+        req.onblocked = () => resolve(null);
+      });
+    }
+    return opened;
+  };
+
+  // Run `body` in one transaction over both stores; null when the cache is unusable
+  const transact = async <T>(
+    mode: IDBTransactionMode,
+    body: (entries: IDBObjectStore, payloads: IDBObjectStore) => Promise<T>
+  ): Promise<T | null> => {
+    try {
+      const db = await open();
+      if (!db) return null;
+      const tx = db.transaction([ENTRIES, PAYLOADS], mode);
+      const done = completion(tx);
+      const result = await body(tx.objectStore(ENTRIES), tx.objectStore(PAYLOADS));
+      await done;
+      return result;
+    } catch {
+      return null;
+    }
+  };
+
+  const remove = (entries: IDBObjectStore, payloads: IDBObjectStore, key: string) => {
+    entries.delete(key);
+    payloads.delete(key);
+  };
+
+  return {
+    async get(query) {
+      const key = snapshotKey(query);
+      return transact('readwrite', async (entries, payloads) => {
+        const entry: SnapshotEntry | undefined = await request(entries.get(key));
+        if (!entry) return null;
+        const payload: SnapshotPayload | undefined = await request(payloads.get(key));
+        if (!payload) {
+          entries.delete(key);
+          return null;
+        }
+        entries.put({ ...entry, lastUsed: Date.now() });
+
+        const { totals, campaigns, series, generatedAt, rollups } = payload;
+        return {
+          totals,
+          campaigns,
+          series: { days: series.days, campaigns: series.campaigns, values: Array.from(series.values) },
+          generatedAt,
+          datasetVersion: entry.datasetVersion,
+          rollups,
+        };
+      });
+    },
+
+    async put(query, seed, rollups) {
+      const { datasetVersion } = seed;
+      if (datasetVersion === undefined) return;
+      const key = snapshotKey(query);
+      const payload: SnapshotPayload = {
+        key,
+        totals: seed.totals,
+        campaigns: seed.campaigns,
+        series: {
+          days: seed.series.days,
+          campaigns: seed.series.campaigns,
+          values: Float64Array.from(seed.series.values),
+        },
+        generatedAt: seed.generatedAt,
+        rollups,
+      };
+      const bytes = payloadBytes(payload);
+      // A snapshot larger than the whole budget is not kept, nor does it evict others
+      const fits = bytes <= budgetBytes;
+      const now = Date.now();
+
+      await transact('readwrite', async (entries, payloads) => {
+        const existing: SnapshotEntry[] = await request(entries.getAll());
+        // Outdated entries go first, then the least recently used beyond the budget
+        let used = fits ? bytes : 0;
+        existing
+          .filter(entry => {
+            const outdated =
+              entry.key === key ||
+              entry.schemaVersion !== SNAPSHOT_SCHEMA_VERSION ||
+              (entry.tenant === query.tenant && entry.datasetVersion !== datasetVersion);
+            if (outdated) remove(entries, payloads, entry.key);
+            return !outdated;
+          })
+          .sort((a, b) => b.lastUsed - a.lastUsed)
+          .forEach(entry => {
+            used += entry.bytes;
+            if (used > budgetBytes) remove(entries, payloads, entry.key);
+          });
+
+        if (!fits) return;
+        const entry: SnapshotEntry = {
+          key,
+          tenant: query.tenant,
+          schemaVersion: SNAPSHOT_SCHEMA_VERSION,
+          datasetVersion,
+          bytes,
+          storedAt: now,
+          lastUsed: now,
+        };
+        entries.put(entry);
+        payloads.put(payload);
+      });
+    },
+
+    async invalidate(tenant, keepVersion) {
+      await transact('readwrite', async (entries, payloads) => {
+        const existing: SnapshotEntry[] = await request(entries.getAll());
+        existing.forEach(entry => {
+          if (entry.tenant === tenant && entry.datasetVersion !== keepVersion) {
+            remove(entries, payloads, entry.key);
+          }
+        });
+      });
+    },
+
+    async usage() {
+      const usage = await transact('readonly', async entries => {
+        const existing: SnapshotEntry[] = await request(entries.getAll());
+        return {
+          entries: existing.length,
+          bytes: existing.reduce((sum, entry) => sum + entry.bytes, 0),
+        };
+      });
+      return usage ?? { entries: 0, bytes: 0 };
+    },
+
+    async clear() {
+      await transact('readwrite', async (entries, payloads) => {
+        entries.clear();
+        payloads.clear();
+      });
+    },
+  };
+}
+
+// The cache the dashboard uses
+export const snapshotCache = createSnapshotCache();
+
+if (typeof window !== 'undefined') {
+  (window as unknown as { __snapshotCache: object }).__snapshotCache = {
+    usage: snapshotCache.usage,
+    clear: snapshotCache.clear,
+  };
+}
+"""
+
+# # Row delta wire format
+row_delta_ts = """import type { MetricData } from '@/data/mockData';
+
+// Wire format of /api/dashboard/rows: the rows appended to a tenant's row log
+// after the client's cursor, column by column, with dates and campaigns sent
+// once each and referenced by index. A tick of four campaign rows is about
+// 250 bytes this way, against about 700 as an array of row objects, and an
+// unchanged log answers a poll with an empty 304.
+//
+// A cursor is `<epoch>.<version>`: the log's epoch changes whenever the log is
+// recreated (e.g. a server restart), and its version counts the rows ever
+// appended. The cursor of a response doubles as its ETag.
+export const ROW_DELTA_FORMAT = 1;
+
+export interface RowCursor {
+  epoch: string;
+  version: number;
+}
+
+export interface RowDelta {
+  format: number;
+  // Cursor to send with the next poll
+  cursor: string;
+  // True when the requested cursor was from another epoch or older than the
+  // retained rows; `rows` then restarts at the log's current end, and rows in
+  // the gap are only available from a fresh snapshot
+  reset: boolean;
+  dates: string[];
+  campaigns: string[];
+  date: number[];
+  campaign: number[];
+  revenue: number[];
+  users: number[];
+  conversions: number[];
+}
+
+export function formatCursor({ epoch, version }: RowCursor): string {
+  return `${epoch}.${version}`;
+}
+
+// Null for anything that is not a well-formed cursor
+export function parseCursor(value: string): RowCursor | null {
+  const dot = value.lastIndexOf('.');
+  if (dot <= 0) return null;
+  const version = Number(value.slice(dot + 1));
+  if (!Number.isInteger(version) || version < 0) return null;
+  return { epoch: value.slice(0, dot), version };
+}
+
+// Breakdown attributes are left out; the live store only sums the metrics
+export function encodeRowDelta(rows: MetricData[], cursor: RowCursor, reset: boolean): RowDelta {
+  const delta: RowDelta = {
+    format: ROW_DELTA_FORMAT,
+    cursor: formatCursor(cursor),
+    reset,
+    dates: [],
+    campaigns: [],
+    date: [],
+    campaign: [],
+    revenue: [],
+    users: [],
+    conversions: [],
+  };
+  const dateCodes = new Map<string, number>();
+  const campaignCodes = new Map<string, number>();
+  const code = (codes: Map<string, number>, values: string[], value: string) => {
+    let known = codes.get(value);
+    if (known === undefined) {
+      known = values.length;
+      codes.set(value, known);
+      values.push(value);
+    }
+    return known;
+  };
+
+  rows.forEach(row => {
+    delta.date.push(code(dateCodes, delta.dates, row.date));
+    delta.campaign.push(code(campaignCodes, delta.campaigns, row.campaign));
+    delta.revenue.push(row.revenue);
+    delta.users.push(row.users);
+    delta.conversions.push(row.conversions);
+  });
+  return delta;
+}
+
+export function decodeRowDelta(delta: RowDelta): MetricData[] {
+  if (delta.format !== ROW_DELTA_FORMAT) throw new Error(`Unsupported row delta format ${delta.format}`);
+  return delta.date.map((date, i) => ({
+    date: delta.dates[date],
+    campaign: delta.campaigns[delta.campaign[i]],
+    revenue: delta.revenue[i],
+    users: delta.users[i],
+    conversions: delta.conversions[i],
+  }));
+}
+"""
+
+# # Row log stand-in store
+row_log_ts = """import type { MetricData } from '@/data/mockData';
+import type { RowCursor } from './rowDelta';
+
+export interface RowLogRead {
+  rows: MetricData[];
+  cursor: RowCursor;
+  // The requested cursor could not be continued; see RowDelta.reset
+  reset: boolean;
+}
+
+export interface RowLog {
+  cursor(): RowCursor;
+  append(rows: MetricData[]): void;
+  // Rows appended after `since`, or from the current end when since is null
+  read(since: RowCursor | null): RowLogRead;
+}
+
+// Append-only log of a tenant's newest rows; the local stand-in for an event
+// store the dashboard would poll in production. Only the last `capacity` rows
+// are kept, so a client that falls further behind is told to reset.
+export function createRowLog(capacity = 20_000): RowLog {
+  const epoch = `${Date.now().toString(36)}${Math.floor(Math.random() * 1296).toString(36)}`;
+  const ring = new Array<MetricData>(capacity);
+  // Rows ever appended; row v (0-based) sits at ring[v % capacity]
+  let version = 0;
+
+  return {
+    cursor: () => ({ epoch, version }),
+
+    append(rows) {
+      rows.forEach(row => {
+        ring[version % capacity] = row;
+        version++;
+      });
+    },
+
+    read(since) {
+      const oldest = Math.max(0, version - capacity);
+      const cursor = { epoch, version };
+      if (since === null) return { rows: [], cursor, reset: false };
+      if (since.epoch !== epoch || since.version < oldest || since.version > version) {
+        return { rows: [], cursor, reset: true };
+      }
+
+      const rows: MetricData[] = [];
+      for (let v = since.version; v < version; v++) rows.push(ring[v % capacity]);
+      return { rows, cursor, reset: false };
+    },
+  };
+}
+"""
+
+# Write the files
+with open(f"{project_name}/styles/globals.css", "w") as f:
+    f.write(globals_css)
+
+with open(f"{project_name}/data/mockData.ts", "w") as f:
+    f.write(mock_data)
+
+with open(f"{project_name}/lib/utils.ts", "w") as f:
+    f.write(utils_ts)
+
+with open(f"{project_name}/lib/aggregate.ts", "w") as f:
+    f.write(aggregate_ts)
+
+with open(f"{project_name}/lib/liveStore.ts", "w") as f:
+    f.write(live_store_ts)
+
+with open(f"{project_name}/data/liveFeed.ts", "w") as f:
+    f.write(live_feed_ts)
+
+with open(f"{project_name}/lib/fixtures.ts", "w") as f:
+    f.write(fixtures_ts)
+
+with open(f"{project_name}/bench/cases.ts", "w") as f:
+    f.write(bench_cases_ts)
+
+with open(f"{project_name}/bench/run.ts", "w") as f:
+    f.write(bench_run_ts)
+
+with open(f"{project_name}/data/generators.ts", "w") as f:
+    f.write(generators_ts)
+
+with open(f"{project_name}/lib/dashboardData.ts", "w") as f:
+    f.write(dashboard_data_ts)
+
+with open(f"{project_name}/lib/rollups.ts", "w") as f:
+    f.write(rollups_ts)
+
+with open(f"{project_name}/lib/downsample.ts", "w") as f:
+    f.write(downsample_ts)
+
+with open(f"{project_name}/lib/selectors.ts", "w") as f:
+    f.write(selectors_ts)
+
+with open(f"{project_name}/lib/useRenderCount.ts", "w") as f:
+    f.write(use_render_count_ts)
+
+with open(f"{project_name}/lib/dimensions.ts", "w") as f:
+    f.write(dimensions_ts)
+
+with open(f"{project_name}/bench/bundle.ts", "w") as f:
+    f.write(bench_bundle_ts)
+
+with open(f"{project_name}/lib/useLoadTiming.ts", "w") as f:
+    f.write(use_load_timing_ts)
+
+with open(f"{project_name}/lib/performanceMode.ts", "w") as f:
+    f.write(performance_mode_ts)
+
+with open(f"{project_name}/lib/snapshotCache.ts", "w") as f:
+    f.write(snapshot_cache_ts)
+
+with open(f"{project_name}/lib/rowDelta.ts", "w") as f:
+    f.write(row_delta_ts)
+
+with open(f"{project_name}/lib/rowLog.ts", "w") as f:
+    f.write(row_log_ts)
 
 print("Created core files:")
 print("  - styles/globals.css")
 print("  - data/mockData.ts")
-print("  - lib/utils.ts")
\ No newline at end of file
+print("  - lib/utils.ts")
+print("  - lib/aggregate.ts")
+print("  - lib/liveStore.ts")
+print("  - data/liveFeed.ts")
+print("  - lib/fixtures.ts")
+print("  - bench/cases.ts")
+print("  - bench/run.ts")
+print("  - data/generators.ts")
+print("  - lib/dashboardData.ts")
+print("  - lib/rollups.ts")
+print("  - lib/downsample.ts")
+print("  - lib/selectors.ts")
+print("  - lib/useRenderCount.ts")
+print("  - lib/dimensions.ts")
+print("  - bench/bundle.ts")
+print("  - lib/useLoadTiming.ts")
+print("  - lib/performanceMode.ts")
+print("  - lib/snapshotCache.ts")
+print("  - lib/rowDelta.ts")
+print("  - lib/rowLog.ts")
\ No newline at end of file
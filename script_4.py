@@ -1,7 +1,7 @@
 # Create MetricCard component
 metric_card = """'use client';
 
-import { motion } from 'framer-motion';
+import { MotionDiv } from './Motion';
 import { TrendingUp, TrendingDown } from 'lucide-react';
 import { cn } from '@/lib/utils';
 
@@ -18,7 +18,7 @@ export function MetricCard({ title, value, change, icon, className }: MetricCard
   const isNegative = change && change < 0;
 
   return (
-    <motion.div
+    <MotionDiv
       initial={{ opacity: 0, y: 20 }}
       animate={{ opacity: 1, y: 0 }}
       transition={{ duration: 0.3 }}
@@ -50,7 +50,7 @@ export function MetricCard({ title, value, change, icon, className }: MetricCard
           </div>
         )}
       </div>
-    </motion.div>
+    </MotionDiv>
   );
 }
 """
@@ -60,7 +60,7 @@ theme_toggle = """'use client';
 
 import { useState, useEffect } from 'react';
 import { Sun, Moon } from 'lucide-react';
-import { motion } from 'framer-motion';
+import { MotionButton } from './Motion';
 
 export function ThemeToggle() {
   const [isDark, setIsDark] = useState(false);
@@ -90,7 +90,7 @@ export function ThemeToggle() {
   };
 
   return (
-    <motion.button
+    <MotionButton
       whileHover={{ scale: 1.05 }}
       whileTap={{ scale: 0.95 }}
       onClick={toggleTheme}
@@ -102,7 +102,7 @@ export function ThemeToggle() {
       ) : (
         <Moon className="w-5 h-5 text-blue-600" />
       )}
-    </motion.button>
+    </MotionButton>
   );
 }
 """
@@ -152,6 +152,151 @@ export function ChartSkeleton() {
     </div>
   );
 }
+
+export function TableSkeleton({ rows = 8 }: { rows?: number }) {
+  return (
+    <div className="glass-effect rounded-xl p-6 animate-pulse">
+      <div className="h-6 bg-gray-300 dark:bg-gray-700 rounded mb-6 w-48" />
+      <LoadingSkeleton rows={rows} />
+    </div>
+  );
+}
+
+export function MetricCardsSkeleton() {
+  return (
+    <div className="grid grid-cols-1 sm:grid-cols-2 lg:grid-cols-4 gap-6">
+      {Array.from({ length: 4 }).map((_, i) => (
+        <CardSkeleton key={i} />
+      ))}
+    </div>
+  );
+}
+
+export function ChartsSkeleton() {
+  return (
+    <div className="grid grid-cols-1 lg:grid-cols-2 gap-6">
+      {Array.from({ length: 4 }).map((_, i) => (
+        <ChartSkeleton key={i} />
+      ))}
+    </div>
+  );
+}
+"""
+
+# Viewport-deferred panel
+lazy_panel = """'use client';
+
+import { useEffect, useRef, useState, type ReactNode } from 'react';
+
+interface LazyPanelProps {
+  // Shown until the panel nears the viewport, sized like the real content
+  fallback: ReactNode;
+  children: ReactNode;
+  // How far outside the viewport a panel starts loading
+  rootMargin?: string;
+}
+
+// Defers mounting `children` until the panel scrolls near the viewport. Paired
+// with next/dynamic, a panel's code is only fetched and hydrated at that point,
+// so below-the-fold panels stay off the startup path. Once shown, a panel stays mounted
+export function LazyPanel({ fallback, children, rootMargin = '200px' }: LazyPanelProps) {
+  const ref = useRef<HTMLDivElement>(null);
+  const [visible, setVisible] = useState(false);
+
+  useEffect(() => {
+    const element = ref.current;
+    if (visible || !element) return;
+    if (typeof IntersectionObserver === 'undefined') {
+      setVisible(true);
+      return;
+    }
+
+    const observer = new IntersectionObserver(
+      entries => {
+        if (entries.some(entry => entry.isIntersecting)) {
+          setVisible(true);
+          observer.disconnect();
+        }
+      },
+      { rootMargin }
+    );
+    observer.observe(element);
+    return () => observer.disconnect();
+  }, [visible, rootMargin]);
+
+  return <div ref={ref}>{visible ? children : fallback}</div>;
+}
+"""
+
+# # Motion wrappers
+motion_component = """'use client';
+
+import { forwardRef } from 'react';
+import { motion, type HTMLMotionProps } from 'framer-motion';
+import { usePerformanceMode } from '@/lib/performanceMode';
+
+// Laid over the caller's props in performance mode: elements mount in their
+// `animate` state, later targets are applied in a single frame, and hover and
+// tap effects are off. The motion element itself is kept, so switching modes
+// never remounts the subtree or loses its state.
+const STILL = {
+  initial: false,
+  transition: { duration: 0 },
+  whileHover: undefined,
+  whileTap: undefined,
+  whileFocus: undefined,
+} as const;
+
+// Drop-in replacements for motion.div / motion.tr / motion.button that skip
+// their animations in performance mode
+export const MotionDiv = forwardRef<HTMLDivElement, HTMLMotionProps<'div'>>(function MotionDiv(props, ref) {
+  const performanceMode = usePerformanceMode();
+  return <motion.div ref={ref} {...props} {...(performanceMode ? STILL : null)} />;
+});
+
+export const MotionTr = forwardRef<HTMLTableRowElement, HTMLMotionProps<'tr'>>(function MotionTr(props, ref) {
+  const performanceMode = usePerformanceMode();
+  return <motion.tr ref={ref} {...props} {...(performanceMode ? STILL : null)} />;
+});
+
+export const MotionButton = forwardRef<HTMLButtonElement, HTMLMotionProps<'button'>>(function MotionButton(props, ref) {
+  const performanceMode = usePerformanceMode();
+  return <motion.button ref={ref} {...props} {...(performanceMode ? STILL : null)} />;
+});
+"""
+
+# # Performance mode toggle
+performance_toggle = """'use client';
+
+import { useEffect } from 'react';
+import { Gauge } from 'lucide-react';
+import { MotionButton } from './Motion';
+import { initPerformanceMode, setPerformanceMode, usePerformanceMode } from '@/lib/performanceMode';
+
+export function PerformanceToggle() {
+  const performanceMode = usePerformanceMode();
+
+  useEffect(() => {
+    // Restore the stored choice, or detect reduced motion / a slow frame rate
+    initPerformanceMode();
+  }, []);
+
+  return (
+    <MotionButton
+      whileHover={{ scale: 1.05 }}
+      whileTap={{ scale: 0.95 }}
+      onClick={() => setPerformanceMode(!performanceMode)}
+      className={`p-2 rounded-lg glass-effect hover:bg-white/20 dark:hover:bg-black/20 transition-colors ${
+        performanceMode ? 'text-green-600 dark:text-green-400' : 'text-gray-500 dark:text-gray-400'
+      }`}
+      aria-label="Toggle performance mode"
+      aria-pressed={performanceMode}
+      title={performanceMode ? 'Performance mode on: animations and blur off' : 'Performance mode off'}
+    >
+      <Gauge className="w-5 h-5" />
+    </MotionButton>
+  );
+}
 """
 
 # Write component files
@@ -164,7 +309,19 @@ with open(f"{project_name}/components/ThemeToggle.tsx", "w") as f:
 with open(f"{project_name}/components/LoadingSkeleton.tsx", "w") as f:
     f.write(loading_skeleton)
 
+with open(f"{project_name}/components/LazyPanel.tsx", "w") as f:
+    f.write(lazy_panel)
+
+with open(f"{project_name}/components/Motion.tsx", "w") as f:
+    f.write(motion_component)
+
+with open(f"{project_name}/components/PerformanceToggle.tsx", "w") as f:
+    f.write(performance_toggle)
+
 print("Created UI components:")
 print("  - components/MetricCard.tsx")
 print("  - components/ThemeToggle.tsx")
-print("  - components/LoadingSkeleton.tsx")
\ No newline at end of file
+print("  - components/LoadingSkeleton.tsx")
+print("  - components/LazyPanel.tsx")
+print("  - components/Motion.tsx")
+print("  - components/PerformanceToggle.tsx")
\ No newline at end of file
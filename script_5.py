@@ -1,106 +1,621 @@
 # Create Charts component with multiple chart types
 charts_component = """'use client';
 
-import { useState } from 'react';
-import {
-  LineChart,
-  Line,
-  AreaChart,
-  Area,
-  BarChart,
-  Bar,
-  PieChart,
-  Pie,
-  Cell,
-  XAxis,
-  YAxis,
-  CartesianGrid,
-  Tooltip,
-  Legend,
-  ResponsiveContainer,
-} from 'recharts';
-import { motion } from 'framer-motion';
-import { TrendingUp, BarChart3, PieChart as PieIcon, Activity } from 'lucide-react';
-import { MetricData, CampaignData } from '@/data/mockData';
-import { formatCurrency, formatNumber } from '@/lib/utils';
+import { memo, useCallback, useMemo, useState } from 'react';
+import dynamic from 'next/dynamic';
+import type { MetricData, CampaignData } from '@/data/mockData';
+import { campaignChartRows } from '@/lib/selectors';
+import { useRenderCount } from '@/lib/useRenderCount';
+import { createRollupStore, queryRecentDays, type Granularity, type RollupStore } from '@/lib/rollups';
+import { downsamplePoints } from '@/lib/downsample';
+import { LazyPanel } from './LazyPanel';
+import { ChartSkeleton } from './LoadingSkeleton';
 
-const COLORS = ['#3B82F6', '#10B981', '#F59E0B', '#EF4444', '#8B5CF6'];
+// Each card is its own chunk, so Recharts and the card's code load only once
+// the card scrolls into view; the skeleton holds its place until then
+const chartSkeleton = () => <ChartSkeleton />;
+const RevenueTrendCard = dynamic(() => import('./RevenueTrendCard').then(m => m.RevenueTrendCard), {
+  ssr: false,
+  loading: chartSkeleton,
+});
+const CampaignBarCard = dynamic(() => import('./CampaignBarCard').then(m => m.CampaignBarCard), {
+  ssr: false,
+  loading: chartSkeleton,
+});
+const ConversionPieCard = dynamic(() => import('./ConversionPieCard').then(m => m.ConversionPieCard), {
+  ssr: false,
+  loading: chartSkeleton,
+});
+const MetricTrendCard = dynamic(() => import('./MetricTrendCard').then(m => m.MetricTrendCard), {
+  ssr: false,
+  loading: chartSkeleton,
+});
+
+// Buckets read per pixel of chart width: a finer granularity is preferred and
+// then downsampled, so short spikes survive instead of averaging into days
+const BUCKET_OVERSAMPLE = 8;
+// Points handed to Recharts per pixel of chart width after downsampling
+const POINTS_PER_PIXEL = 2;
+// Point markers are drawn only on sparse series
+const MAX_DOTTED_POINTS = 60;
+
+const BUCKET_LABEL_FORMATS: Record<Granularity, Intl.DateTimeFormatOptions> = {
+  hour: { hour: 'numeric', timeZone: 'UTC' },
+  day: { month: 'short', day: 'numeric', timeZone: 'UTC' },
+  week: { month: 'short', day: 'numeric', timeZone: 'UTC' },
+  month: { month: 'short', year: 'numeric', timeZone: 'UTC' },
+};
 
 interface ChartsProps {
-  data: MetricData[];
+  // Raw rows; only needed when `rollups` is not supplied
+  data?: MetricData[];
   campaignData: CampaignData[];
+  // Pre-aggregated time buckets (e.g. from the live store); skips bucketing `data`
+  rollups?: RollupStore;
+  // Changes whenever `rollups` has absorbed new rows
+  rollupVersion?: number;
 }
 
-export function Charts({ data, campaignData }: ChartsProps) {
+export const Charts = memo(function Charts({ data, campaignData, rollups, rollupVersion }: ChartsProps) {
+  useRenderCount('Charts');
   const [activeChart, setActiveChart] = useState<'revenue' | 'users' | 'conversions'>('revenue');
+  const [rangeDays, setRangeDays] = useState(30);
+  const [chartWidth, setChartWidth] = useState(600);
 
-  // Prepare data for line/area charts (daily aggregates)
-  const dailyData = data.reduce((acc, item) => {
-    const existingDay = acc.find(d => d.date === item.date);
-    if (existingDay) {
-      existingDay.revenue += item.revenue;
-      existingDay.users += item.users;
-      existingDay.conversions += item.conversions;
-    } else {
-      acc.push({
-        date: item.date,
-        revenue: item.revenue,
-        users: item.users,
-        conversions: item.conversions,
-      });
-    }
-    return acc;
-  }, [] as any[]).slice(-14); // Last 14 days
+  // Prepare data for line/area charts: rollup buckets at the coarsest
+  // granularity that still fills the chart width, reduced with LTTB to about
+  // two points per pixel. Buckets are built once per dataset, so range and
+  // width changes only read the points they render
+  const store = useMemo(() => {
+    if (rollups) return rollups;
+    const fromRows = createRollupStore();
+    fromRows.addRows(data ?? []);
+    return fromRows;
+  }, [rollups, data]);
+  const { granularity, points } = useMemo(
+    () => queryRecentDays(store, rangeDays, chartWidth * BUCKET_OVERSAMPLE),
+    // rollupVersion signals in-place updates to the store
+    [store, rollupVersion, rangeDays, chartWidth]
+  );
+  const maxPoints = chartWidth * POINTS_PER_PIXEL;
+  const revenueData = useMemo(() => downsamplePoints(points, ['revenue'], maxPoints), [points, maxPoints]);
+  const metricData = useMemo(
+    () => downsamplePoints(points, ['users', 'conversions'], maxPoints),
+    [points, maxPoints]
+  );
+  const formatBucket = useCallback(
+    (value: string) => new Date(value).toLocaleString('en-US', BUCKET_LABEL_FORMATS[granularity]),
+    [granularity]
+  );
 
   // Prepare data for campaign performance
-  const campaignChartData = campaignData.map(campaign => ({
-    name: campaign.campaign,
-    revenue: campaign.revenue,
-    users: campaign.users,
-    conversions: campaign.conversions,
-  }));
-
-  const CustomTooltip = ({ active, payload, label }: any) => {
-    if (active && payload && payload.length) {
-      return (
-        <div className="glass-effect rounded-lg p-3 border border-white/20">
-          <p className="text-sm font-medium text-gray-900 dark:text-white">
-            {label}
-          </p>
-          {payload.map((entry: any, index: number) => (
-            <p key={index} className="text-sm" style={{ color: entry.color }}>
-              {entry.name}: {
-                entry.name === 'revenue' 
-                  ? formatCurrency(entry.value)
-                  : formatNumber(entry.value)
-              }
-            </p>
-          ))}
-        </div>
-      );
+  const campaignChartData = useMemo(() => campaignChartRows(campaignData), [campaignData]);
+
+  // Each card is memoized on its own inputs: live ticks re-render only the
+  // cards whose data changed, and unrelated parent renders re-render none
+  return (
+    <div className="grid grid-cols-1 lg:grid-cols-2 gap-6">
+      <LazyPanel fallback={<ChartSkeleton />}>
+        <RevenueTrendCard
+          data={revenueData}
+          rangeDays={rangeDays}
+          onRangeChange={setRangeDays}
+          formatBucket={formatBucket}
+          onResize={setChartWidth}
+        />
+      </LazyPanel>
+      <LazyPanel fallback={<ChartSkeleton />}>
+        <CampaignBarCard data={campaignChartData} />
+      </LazyPanel>
+      <LazyPanel fallback={<ChartSkeleton />}>
+        <ConversionPieCard data={campaignChartData} />
+      </LazyPanel>
+      <LazyPanel fallback={<ChartSkeleton />}>
+        <MetricTrendCard
+          data={metricData}
+          formatBucket={formatBucket}
+          showDots={metricData.length <= MAX_DOTTED_POINTS}
+        />
+      </LazyPanel>
+    </div>
+  );
+});
+"""
+
+# Canvas renderer for charts with many points
+canvas_chart_component = """'use client';
+
+import { useCallback, useEffect, useMemo, useRef, useState, type ComponentType, type MouseEvent } from 'react';
+
+export interface CanvasSeries<T> {
+  key: keyof T & string;
+  // #RRGGBB; the area fill derives its transparency from it
+  color: string;
+  // Shown in the tooltip and legend; defaults to the key, as in Recharts
+  name?: string;
+  // Plot against a second scale on the right
+  axis?: 'left' | 'right';
+}
+
+// The props Recharts passes to a custom tooltip `content` component
+export interface CanvasTooltipProps {
+  active: boolean;
+  label: string;
+  payload: { name: string; value: number; color: string; dataKey: string }[];
+}
+
+interface CanvasChartProps<T> {
+  kind: 'line' | 'area' | 'bar';
+  data: T[];
+  xKey: keyof T & string;
+  series: CanvasSeries<T>[];
+  height: number;
+  tooltip: ComponentType<CanvasTooltipProps>;
+  // Formatters are redraw inputs: pass module-level or memoized functions
+  formatX?: (value: string) => string;
+  formatY?: (value: number) => string;
+  formatRightY?: (value: number) => string;
+  dots?: boolean;
+  legend?: boolean;
+  onResize?: (width: number) => void;
+}
+
+interface Layout {
+  left: number;
+  top: number;
+  width: number;
+  height: number;
+}
+
+// Matches Recharts' default tick, grid and cursor styling
+const TICK_COLOR = '#666';
+const GRID_COLOR = 'rgba(204, 204, 204, 0.3)';
+const CURSOR_COLOR = '#ccc';
+const FONT = '12px sans-serif';
+const MARGIN = { top: 8, right: 12, bottom: 28, axis: 56 };
+const Y_TICKS = 5;
+const X_LABEL_SPACING = 80;
+
+// Default formatters live at module scope so they never trigger a redraw
+const formatLabel = (value: string) => value;
+const formatValue = (value: number) => String(value);
+
+// Round the axis maximum up to 1, 2, 2.5 or 5 times a power of ten
+function niceMax(value: number): number {
+  if (value <= 0) return 1;
+  const magnitude = Math.pow(10, Math.floor(Math.log10(value)));
+  const steps = [1, 2, 2.5, 5, 10];
+  for (let i = 0; i < steps.length; i++) {
+    if (value <= steps[i] * magnitude) return steps[i] * magnitude;
+  }
+  return 10 * magnitude;
+}
+
+function seriesMax<T>(data: T[], series: CanvasSeries<T>[], axis: 'left' | 'right'): number {
+  let max = 0;
+  series.forEach(entry => {
+    if ((entry.axis ?? 'left') !== axis) return;
+    for (let i = 0; i < data.length; i++) max = Math.max(max, Number(data[i][entry.key]));
+  });
+  return niceMax(max);
+}
+
+// Canvas renderer for line, area and bar charts with too many points for SVG.
+// The chart is drawn once per data or size change; hovering only repaints a
+// transparent overlay (cursor and active dots), so a hover frame costs
+// O(series) regardless of how many points are plotted
+export function CanvasChart<T extends object>({
+  kind,
+  data,
+  xKey,
+  series,
+  height,
+  tooltip: Tooltip,
+  formatX = formatLabel,
+  formatY = formatValue,
+  formatRightY = formatY,
+  dots = false,
+  legend = false,
+  onResize,
+}: CanvasChartProps<T>) {
+  const containerRef = useRef<HTMLDivElement>(null);
+  const chartRef = useRef<HTMLCanvasElement>(null);
+  const overlayRef = useRef<HTMLCanvasElement>(null);
+  const frameRef = useRef(0);
+  const onResizeRef = useRef(onResize);
+  onResizeRef.current = onResize;
+  const [width, setWidth] = useState(0);
+  const [hover, setHover] = useState<{ index: number; x: number; y: number } | null>(null);
+
+  const hasRightAxis = series.some(entry => entry.axis === 'right');
+  // Scales scan every point, so they are kept out of the per-hover render
+  const leftMax = useMemo(() => seriesMax(data, series, 'left'), [data, series]);
+  const rightMax = useMemo(() => seriesMax(data, series, 'right'), [data, series]);
+
+  // Plot geometry, rebuilt only when a scale or the size changes
+  const scale = useMemo(() => {
+    const count = data.length;
+    const layout: Layout = {
+      left: MARGIN.axis,
+      top: MARGIN.top,
+      width: Math.max(0, width - MARGIN.axis - (hasRightAxis ? MARGIN.axis : MARGIN.right)),
+      height: Math.max(0, height - MARGIN.top - MARGIN.bottom),
+    };
+    const band = count > 0 ? layout.width / count : 0;
+    const xAt = (index: number) => {
+      if (kind === 'bar') return layout.left + band * (index + 0.5);
+      if (count < 2) return layout.left + layout.width / 2;
+      return layout.left + (index / (count - 1)) * layout.width;
+    };
+    const yAt = (value: number, axis: 'left' | 'right' = 'left') =>
+      layout.top + layout.height * (1 - value / (axis === 'right' ? rightMax : leftMax));
+    return { layout, band, xAt, yAt };
+  }, [data.length, kind, width, height, hasRightAxis, leftMax, rightMax]);
+  const { layout, band } = scale;
+
+  useEffect(() => {
+    const container = containerRef.current;
+    if (!container) return;
+    const observer = new ResizeObserver(entries => {
+      const next = Math.floor(entries[0].contentRect.width);
+      setWidth(next);
+      onResizeRef.current?.(next);
+    });
+    observer.observe(container);
+    return () => observer.disconnect();
+  }, []);
+
+  // Size a canvas for the device pixel ratio and return its context in CSS pixels
+  const prepare = useCallback((canvas: HTMLCanvasElement | null) => {
+    if (!canvas || width === 0) return null;
+    const ratio = window.devicePixelRatio || 1;
+    // Backing stores are whole pixels; comparing unrounded sizes at fractional
+    // ratios (1.25, 1.5) would reallocate, and so clear, the canvas every draw
+    const pixelWidth = Math.round(width * ratio);
+    const pixelHeight = Math.round(height * ratio);
+    if (canvas.width !== pixelWidth || canvas.height !== pixelHeight) {
+      canvas.width = pixelWidth;
+      canvas.height = pixelHeight;
+    }
+    const context = canvas.getContext('2d');
+    if (!context) return null;
+    context.setTransform(ratio, 0, 0, ratio, 0, 0);
+    context.clearRect(0, 0, width, height);
+    return context;
+  }, [width, height]);
+
+  // Full redraw: grid, axes and every series
+  useEffect(() => {
+    const context = prepare(chartRef.current);
+    if (!context) return;
+    const { layout, band, xAt, yAt } = scale;
+
+    context.font = FONT;
+    context.fillStyle = TICK_COLOR;
+    context.strokeStyle = GRID_COLOR;
+    context.lineWidth = 1;
+    context.setLineDash([3, 3]);
+    for (let t = 0; t <= Y_TICKS; t++) {
+      const y = layout.top + (layout.height * t) / Y_TICKS;
+      context.beginPath();
+      context.moveTo(layout.left, y);
+      context.lineTo(layout.left + layout.width, y);
+      context.stroke();
+
+      context.textBaseline = 'middle';
+      context.textAlign = 'right';
+      context.fillText(formatY(leftMax * (1 - t / Y_TICKS)), layout.left - 6, y);
+      if (hasRightAxis) {
+        context.textAlign = 'left';
+        context.fillText(formatRightY(rightMax * (1 - t / Y_TICKS)), layout.left + layout.width + 6, y);
+      }
+    }
+    context.setLineDash([]);
+
+    const labelEvery = Math.max(1, Math.ceil(data.length / Math.max(1, layout.width / X_LABEL_SPACING)));
+    context.textAlign = 'center';
+    context.textBaseline = 'top';
+    for (let i = 0; i < data.length; i += labelEvery) {
+      context.fillText(formatX(String(data[i][xKey])), xAt(i), layout.top + layout.height + 8);
     }
-    return null;
+
+    series.forEach((entry, s) => {
+      const axis = entry.axis ?? 'left';
+      if (kind === 'bar') {
+        const barWidth = Math.max(1, (band * 0.8) / series.length);
+        context.fillStyle = entry.color;
+        for (let i = 0; i < data.length; i++) {
+          const x = layout.left + band * i + band * 0.1 + barWidth * s;
+          const y = yAt(Number(data[i][entry.key]), axis);
+          const barHeight = layout.top + layout.height - y;
+          context.beginPath();
+          if (barWidth >= 8) context.roundRect(x, y, barWidth, barHeight, [4, 4, 0, 0]);
+          else context.rect(x, y, barWidth, barHeight);
+          context.fill();
+        }
+        return;
+      }
+
+      context.beginPath();
+      for (let i = 0; i < data.length; i++) {
+        const x = xAt(i);
+        const y = yAt(Number(data[i][entry.key]), axis);
+        if (i === 0) context.moveTo(x, y);
+        else context.lineTo(x, y);
+      }
+      context.strokeStyle = entry.color;
+      context.lineWidth = 2;
+      context.stroke();
+
+      if (kind === 'area' && data.length > 0) {
+        context.lineTo(xAt(data.length - 1), layout.top + layout.height);
+        context.lineTo(xAt(0), layout.top + layout.height);
+        context.closePath();
+        const gradient = context.createLinearGradient(0, layout.top, 0, layout.top + layout.height);
+        gradient.addColorStop(0.05, `${entry.color}4D`);
+        gradient.addColorStop(0.95, `${entry.color}00`);
+        context.fillStyle = gradient;
+        context.fill();
+      }
+
+      if (dots) {
+        context.fillStyle = '#fff';
+        for (let i = 0; i < data.length; i++) {
+          context.beginPath();
+          context.arc(xAt(i), yAt(Number(data[i][entry.key]), axis), 4, 0, Math.PI * 2);
+          context.fill();
+          context.stroke();
+        }
+      }
+    });
+  }, [
+    prepare,
+    scale,
+    data,
+    xKey,
+    series,
+    kind,
+    dots,
+    hasRightAxis,
+    leftMax,
+    rightMax,
+    formatX,
+    formatY,
+    formatRightY,
+  ]);
+
+  // Hover repaint: only the overlay canvas is touched
+  useEffect(() => {
+    const context = prepare(overlayRef.current);
+    if (!context || !hover || hover.index >= data.length) return;
+    const { layout, band, xAt, yAt } = scale;
+    const x = xAt(hover.index);
+
+    if (kind === 'bar') {
+      context.fillStyle = 'rgba(204, 204, 204, 0.5)';
+      context.fillRect(layout.left + band * hover.index, layout.top, band, layout.height);
+      return;
+    }
+
+    context.strokeStyle = CURSOR_COLOR;
+    context.lineWidth = 1;
+    context.beginPath();
+    context.moveTo(x, layout.top);
+    context.lineTo(x, layout.top + layout.height);
+    context.stroke();
+
+    context.lineWidth = 2;
+    context.strokeStyle = '#fff';
+    series.forEach(entry => {
+      context.fillStyle = entry.color;
+      context.beginPath();
+      context.arc(x, yAt(Number(data[hover.index][entry.key]), entry.axis), 4, 0, Math.PI * 2);
+      context.fill();
+      context.stroke();
+    });
+  }, [prepare, scale, hover, data, series, kind]);
+
+  useEffect(() => () => cancelAnimationFrame(frameRef.current), []);
+
+  // Pointer moves are coalesced to one hit test per animation frame
+  const handleMouseMove = (event: MouseEvent<HTMLCanvasElement>) => {
+    const bounds = event.currentTarget.getBoundingClientRect();
+    const x = event.clientX - bounds.left;
+    const y = event.clientY - bounds.top;
+    cancelAnimationFrame(frameRef.current);
+    frameRef.current = requestAnimationFrame(() => {
+      if (data.length === 0 || x < layout.left || x > layout.left + layout.width) {
+        setHover(null);
+        return;
+      }
+      const index =
+        kind === 'bar'
+          ? Math.min(data.length - 1, Math.floor((x - layout.left) / band))
+          : Math.round(((x - layout.left) / Math.max(1, layout.width)) * (data.length - 1));
+      setHover(current => (current && current.index === index && current.y === y ? current : { index, x, y }));
+    });
   };
 
+  const handleMouseLeave = () => {
+    cancelAnimationFrame(frameRef.current);
+    setHover(null);
+  };
+
+  const active = hover !== null && hover.index < data.length;
+  const row = active ? data[hover.index] : null;
+
   return (
-    <div className="grid grid-cols-1 lg:grid-cols-2 gap-6">
-      {/* Revenue Trend Chart */}
-      <motion.div
-        initial={{ opacity: 0, y: 20 }}
-        animate={{ opacity: 1, y: 0 }}
-        transition={{ duration: 0.3, delay: 0.1 }}
-        className="glass-effect rounded-xl p-6"
-      >
-        <div className="flex items-center justify-between mb-4">
-          <div className="flex items-center space-x-2">
-            <TrendingUp className="w-5 h-5 text-blue-600" />
-            <h3 className="text-lg font-semibold text-gray-900 dark:text-white">
-              Revenue Trend
-            </h3>
+    <div>
+      <div ref={containerRef} className="relative w-full" style={{ height }}>
+        <canvas ref={chartRef} className="absolute inset-0" style={{ width: '100%', height }} />
+        <canvas
+          ref={overlayRef}
+          className="absolute inset-0"
+          style={{ width: '100%', height }}
+          onMouseMove={handleMouseMove}
+          onMouseLeave={handleMouseLeave}
+        />
+        {active && row && (
+          <div
+            className="absolute pointer-events-none z-10"
+            style={{
+              left: hover.x > width / 2 ? undefined : hover.x + 12,
+              right: hover.x > width / 2 ? width - hover.x + 12 : undefined,
+              top: Math.max(0, Math.min(hover.y, height - 80)),
+            }}
+          >
+            <Tooltip
+              active
+              label={String(row[xKey])}
+              payload={series.map(entry => ({
+                name: entry.name ?? entry.key,
+                value: Number(row[entry.key]),
+                color: entry.color,
+                dataKey: entry.key,
+              }))}
+            />
           </div>
+        )}
+      </div>
+      {legend && (
+        <ul className="flex justify-center space-x-4 text-sm">
+          {series.map(entry => (
+            <li key={entry.key} className="flex items-center space-x-1" style={{ color: entry.color }}>
+              <span className="inline-block w-3 h-0.5" style={{ backgroundColor: entry.color }} />
+              <span>{entry.name ?? entry.key}</span>
+            </li>
+          ))}
+        </ul>
+      )}
+    </div>
+  );
+}
+"""
+
+# Shared chart tooltip
+chart_tooltip_component = """'use client';
+
+import { formatCurrency, formatNumber } from '@/lib/utils';
+
+// Above this many points a chart is drawn on canvas instead of as SVG nodes
+export const CANVAS_POINT_THRESHOLD = 500;
+
+export const formatDollars = (value: number) => `$${value}`;
+
+// Shared by every chart card, and by CanvasChart as its tooltip; defined at
+// module scope so each chart sees a stable component type
+export function ChartTooltip({ active, payload, label }: any) {
+  if (active && payload && payload.length) {
+    return (
+      <div className="glass-effect rounded-lg p-3 border border-white/20">
+        <p className="text-sm font-medium text-gray-900 dark:text-white">
+          {label}
+        </p>
+        {payload.map((entry: any, index: number) => (
+          <p key={index} className="text-sm" style={{ color: entry.color }}>
+            {entry.name}: {
+              entry.name === 'revenue' 
+                ? formatCurrency(entry.value)
+                : formatNumber(entry.value)
+            }
+          </p>
+        ))}
+      </div>
+    );
+  }
+  return null;
+}
+"""
+
+# Revenue trend chart card
+revenue_trend_card = """'use client';
+
+import { memo } from 'react';
+import { AreaChart, Area, XAxis, YAxis, CartesianGrid, Tooltip, ResponsiveContainer } from 'recharts';
+import { MotionDiv } from './Motion';
+import { TrendingUp } from 'lucide-react';
+import type { RollupPoint } from '@/lib/rollups';
+import { usePerformanceMode } from '@/lib/performanceMode';
+import { useRenderCount } from '@/lib/useRenderCount';
+import { CanvasChart, type CanvasSeries } from './CanvasChart';
+import { CANVAS_POINT_THRESHOLD, ChartTooltip, formatDollars } from './ChartTooltip';
+
+const DAY_RANGES = [
+  { days: 1, label: '1d' },
+  { days: 7, label: '7d' },
+  { days: 30, label: '30d' },
+  { days: 90, label: '90d' },
+  { days: 365, label: '1y' },
+  { days: 730, label: '2y' },
+];
+
+// Canvas series mirroring the Recharts <Area> below
+const REVENUE_SERIES: CanvasSeries<RollupPoint>[] = [{ key: 'revenue', color: '#3B82F6' }];
+
+// Revenue Trend Chart
+interface RevenueTrendCardProps {
+  data: RollupPoint[];
+  rangeDays: number;
+  onRangeChange: (days: number) => void;
+  formatBucket: (value: string) => string;
+  onResize: (width: number) => void;
+}
+
+export const RevenueTrendCard = memo(function RevenueTrendCard({
+  data,
+  rangeDays,
+  onRangeChange,
+  formatBucket,
+  onResize,
+}: RevenueTrendCardProps) {
+  useRenderCount('RevenueTrendCard');
+  const performanceMode = usePerformanceMode();
+
+  return (
+    <MotionDiv
+      initial={{ opacity: 0, y: 20 }}
+      animate={{ opacity: 1, y: 0 }}
+      transition={{ duration: 0.3, delay: 0.1 }}
+      className="glass-effect rounded-xl p-6"
+    >
+      <div className="flex items-center justify-between mb-4">
+        <div className="flex items-center space-x-2">
+          <TrendingUp className="w-5 h-5 text-blue-600" />
+          <h3 className="text-lg font-semibold text-gray-900 dark:text-white">
+            Revenue Trend
+          </h3>
         </div>
-        <ResponsiveContainer width="100%" height={250}>
-          <AreaChart data={dailyData}>
+        <div className="flex items-center space-x-1">
+          {DAY_RANGES.map(({ days, label }) => (
+            <button
+              key={days}
+              onClick={() => onRangeChange(days)}
+              className={`px-2 py-1 text-xs rounded-md transition-colors ${
+                rangeDays === days
+                  ? 'bg-blue-600 text-white'
+                  : 'text-gray-600 dark:text-gray-400 hover:bg-gray-100 dark:hover:bg-gray-700'
+              }`}
+            >
+              {label}
+            </button>
+          ))}
+        </div>
+      </div>
+      {data.length > CANVAS_POINT_THRESHOLD ? (
+        <CanvasChart
+          kind="area"
+          data={data}
+          xKey="date"
+          series={REVENUE_SERIES}
+          height={250}
+          tooltip={ChartTooltip}
+          formatX={formatBucket}
+          formatY={formatDollars}
+          onResize={onResize}
+        />
+      ) : (
+        <ResponsiveContainer width="100%" height={250} onResize={onResize}>
+          <AreaChart data={data}>
             <defs>
               <linearGradient id="revenueGradient" x1="0" y1="0" x2="0" y2="1">
                 <stop offset="5%" stopColor="#3B82F6" stopOpacity={0.3}/>
@@ -111,111 +626,233 @@ export function Charts({ data, campaignData }: ChartsProps) {
             <XAxis 
               dataKey="date" 
               tick={{ fontSize: 12 }}
-              tickFormatter={(value) => new Date(value).toLocaleDateString('en-US', { month: 'short', day: 'numeric' })}
+              tickFormatter={formatBucket}
             />
-            <YAxis tick={{ fontSize: 12 }} tickFormatter={(value) => `$${value}`} />
-            <Tooltip content={<CustomTooltip />} />
+            <YAxis tick={{ fontSize: 12 }} tickFormatter={formatDollars} />
+            <Tooltip content={<ChartTooltip />} />
             <Area
               type="monotone"
               dataKey="revenue"
               stroke="#3B82F6"
               strokeWidth={2}
               fill="url(#revenueGradient)"
+              isAnimationActive={!performanceMode}
             />
           </AreaChart>
         </ResponsiveContainer>
-      </motion.div>
-
-      {/* Campaign Performance Bar Chart */}
-      <motion.div
-        initial={{ opacity: 0, y: 20 }}
-        animate={{ opacity: 1, y: 0 }}
-        transition={{ duration: 0.3, delay: 0.2 }}
-        className="glass-effect rounded-xl p-6"
-      >
-        <div className="flex items-center justify-between mb-4">
-          <div className="flex items-center space-x-2">
-            <BarChart3 className="w-5 h-5 text-green-600" />
-            <h3 className="text-lg font-semibold text-gray-900 dark:text-white">
-              Campaign Performance
-            </h3>
-          </div>
+      )}
+    </MotionDiv>
+  );
+});
+"""
+
+# Campaign performance chart card
+campaign_bar_card = """'use client';
+
+import { memo } from 'react';
+import { BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, ResponsiveContainer } from 'recharts';
+import { MotionDiv } from './Motion';
+import { BarChart3 } from 'lucide-react';
+import type { CampaignChartRow } from '@/lib/selectors';
+import { usePerformanceMode } from '@/lib/performanceMode';
+import { useRenderCount } from '@/lib/useRenderCount';
+import { CanvasChart, type CanvasSeries } from './CanvasChart';
+import { CANVAS_POINT_THRESHOLD, ChartTooltip, formatDollars } from './ChartTooltip';
+
+// Canvas series mirroring the Recharts <Bar> below
+const CAMPAIGN_SERIES: CanvasSeries<CampaignChartRow>[] = [{ key: 'revenue', color: '#10B981' }];
+
+// Campaign Performance Bar Chart
+interface CampaignBarCardProps {
+  data: CampaignChartRow[];
+}
+
+export const CampaignBarCard = memo(function CampaignBarCard({ data }: CampaignBarCardProps) {
+  useRenderCount('CampaignBarCard');
+  const performanceMode = usePerformanceMode();
+
+  return (
+    <MotionDiv
+      initial={{ opacity: 0, y: 20 }}
+      animate={{ opacity: 1, y: 0 }}
+      transition={{ duration: 0.3, delay: 0.2 }}
+      className="glass-effect rounded-xl p-6"
+    >
+      <div className="flex items-center justify-between mb-4">
+        <div className="flex items-center space-x-2">
+          <BarChart3 className="w-5 h-5 text-green-600" />
+          <h3 className="text-lg font-semibold text-gray-900 dark:text-white">
+            Campaign Performance
+          </h3>
         </div>
+      </div>
+      {data.length > CANVAS_POINT_THRESHOLD ? (
+        <CanvasChart
+          kind="bar"
+          data={data}
+          xKey="name"
+          series={CAMPAIGN_SERIES}
+          height={250}
+          tooltip={ChartTooltip}
+          formatY={formatDollars}
+        />
+      ) : (
         <ResponsiveContainer width="100%" height={250}>
-          <BarChart data={campaignChartData}>
+          <BarChart data={data}>
             <CartesianGrid strokeDasharray="3 3" opacity={0.3} />
             <XAxis dataKey="name" tick={{ fontSize: 12 }} />
-            <YAxis tick={{ fontSize: 12 }} tickFormatter={(value) => `$${value}`} />
-            <Tooltip content={<CustomTooltip />} />
-            <Bar dataKey="revenue" fill="#10B981" radius={[4, 4, 0, 0]} />
+            <YAxis tick={{ fontSize: 12 }} tickFormatter={formatDollars} />
+            <Tooltip content={<ChartTooltip />} />
+            <Bar
+              dataKey="revenue"
+              fill="#10B981"
+              radius={[4, 4, 0, 0]}
+              isAnimationActive={!performanceMode}
+            />
           </BarChart>
         </ResponsiveContainer>
-      </motion.div>
-
-      {/* Conversion Distribution Pie Chart */}
-      <motion.div
-        initial={{ opacity: 0, y: 20 }}
-        animate={{ opacity: 1, y: 0 }}
-        transition={{ duration: 0.3, delay: 0.3 }}
-        className="glass-effect rounded-xl p-6"
-      >
-        <div className="flex items-center justify-between mb-4">
-          <div className="flex items-center space-x-2">
-            <PieIcon className="w-5 h-5 text-purple-600" />
-            <h3 className="text-lg font-semibold text-gray-900 dark:text-white">
-              Conversion Distribution
-            </h3>
-          </div>
+      )}
+    </MotionDiv>
+  );
+});
+"""
+
+# Conversion distribution chart card
+conversion_pie_card = """'use client';
+
+import { memo } from 'react';
+import { PieChart, Pie, Cell, Tooltip, Legend, ResponsiveContainer } from 'recharts';
+import { MotionDiv } from './Motion';
+import { PieChart as PieIcon } from 'lucide-react';
+import type { CampaignChartRow } from '@/lib/selectors';
+import { formatNumber } from '@/lib/utils';
+import { usePerformanceMode } from '@/lib/performanceMode';
+import { useRenderCount } from '@/lib/useRenderCount';
+
+const COLORS = ['#3B82F6', '#10B981', '#F59E0B', '#EF4444', '#8B5CF6'];
+
+// Conversion Distribution Pie Chart
+interface ConversionPieCardProps {
+  data: CampaignChartRow[];
+}
+
+export const ConversionPieCard = memo(function ConversionPieCard({ data }: ConversionPieCardProps) {
+  useRenderCount('ConversionPieCard');
+  const performanceMode = usePerformanceMode();
+
+  return (
+    <MotionDiv
+      initial={{ opacity: 0, y: 20 }}
+      animate={{ opacity: 1, y: 0 }}
+      transition={{ duration: 0.3, delay: 0.3 }}
+      className="glass-effect rounded-xl p-6"
+    >
+      <div className="flex items-center justify-between mb-4">
+        <div className="flex items-center space-x-2">
+          <PieIcon className="w-5 h-5 text-purple-600" />
+          <h3 className="text-lg font-semibold text-gray-900 dark:text-white">
+            Conversion Distribution
+          </h3>
         </div>
-        <ResponsiveContainer width="100%" height={250}>
-          <PieChart>
-            <Pie
-              data={campaignChartData}
-              cx="50%"
-              cy="50%"
-              innerRadius={60}
-              outerRadius={100}
-              paddingAngle={5}
-              dataKey="conversions"
-            >
-              {campaignChartData.map((entry, index) => (
-                <Cell key={`cell-${index}`} fill={COLORS[index % COLORS.length]} />
-              ))}
-            </Pie>
-            <Tooltip
-              formatter={(value) => [formatNumber(Number(value)), 'Conversions']}
-            />
-            <Legend />
-          </PieChart>
-        </ResponsiveContainer>
-      </motion.div>
-
-      {/* Multi-Metric Line Chart */}
-      <motion.div
-        initial={{ opacity: 0, y: 20 }}
-        animate={{ opacity: 1, y: 0 }}
-        transition={{ duration: 0.3, delay: 0.4 }}
-        className="glass-effect rounded-xl p-6"
-      >
-        <div className="flex items-center justify-between mb-4">
-          <div className="flex items-center space-x-2">
-            <Activity className="w-5 h-5 text-orange-600" />
-            <h3 className="text-lg font-semibold text-gray-900 dark:text-white">
-              Multi-Metric Overview
-            </h3>
-          </div>
+      </div>
+      <ResponsiveContainer width="100%" height={250}>
+        <PieChart>
+          <Pie
+            data={data}
+            cx="50%"
+            cy="50%"
+            innerRadius={60}
+            outerRadius={100}
+            paddingAngle={5}
+            dataKey="conversions"
+            isAnimationActive={!performanceMode}
+          >
+            {data.map((entry, index) => (
+              <Cell key={`cell-${index}`} fill={COLORS[index % COLORS.length]} />
+            ))}
+          </Pie>
+          <Tooltip
+            formatter={(value) => [formatNumber(Number(value)), 'Conversions']}
+          />
+          <Legend />
+        </PieChart>
+      </ResponsiveContainer>
+    </MotionDiv>
+  );
+});
+"""
+
+# Multi-metric chart card
+metric_trend_card = """'use client';
+
+import { memo } from 'react';
+import { LineChart, Line, XAxis, YAxis, CartesianGrid, Tooltip, Legend, ResponsiveContainer } from 'recharts';
+import { MotionDiv } from './Motion';
+import { Activity } from 'lucide-react';
+import type { RollupPoint } from '@/lib/rollups';
+import { usePerformanceMode } from '@/lib/performanceMode';
+import { useRenderCount } from '@/lib/useRenderCount';
+import { CanvasChart, type CanvasSeries } from './CanvasChart';
+import { CANVAS_POINT_THRESHOLD, ChartTooltip } from './ChartTooltip';
+
+const DOT = { r: 4 };
+
+// Canvas series mirroring the Recharts <Line> elements below
+const METRIC_SERIES: CanvasSeries<RollupPoint>[] = [
+  { key: 'users', color: '#3B82F6', name: 'Users' },
+  { key: 'conversions', color: '#10B981', name: 'Conversions', axis: 'right' },
+];
+
+// Multi-Metric Line Chart
+interface MetricTrendCardProps {
+  data: RollupPoint[];
+  formatBucket: (value: string) => string;
+  showDots: boolean;
+}
+
+export const MetricTrendCard = memo(function MetricTrendCard({ data, formatBucket, showDots }: MetricTrendCardProps) {
+  useRenderCount('MetricTrendCard');
+  const performanceMode = usePerformanceMode();
+
+  return (
+    <MotionDiv
+      initial={{ opacity: 0, y: 20 }}
+      animate={{ opacity: 1, y: 0 }}
+      transition={{ duration: 0.3, delay: 0.4 }}
+      className="glass-effect rounded-xl p-6"
+    >
+      <div className="flex items-center justify-between mb-4">
+        <div className="flex items-center space-x-2">
+          <Activity className="w-5 h-5 text-orange-600" />
+          <h3 className="text-lg font-semibold text-gray-900 dark:text-white">
+            Multi-Metric Overview
+          </h3>
         </div>
+      </div>
+      {data.length > CANVAS_POINT_THRESHOLD ? (
+        <CanvasChart
+          kind="line"
+          data={data}
+          xKey="date"
+          series={METRIC_SERIES}
+          height={250}
+          tooltip={ChartTooltip}
+          formatX={formatBucket}
+          dots={showDots}
+          legend
+        />
+      ) : (
         <ResponsiveContainer width="100%" height={250}>
-          <LineChart data={dailyData}>
+          <LineChart data={data}>
             <CartesianGrid strokeDasharray="3 3" opacity={0.3} />
             <XAxis 
               dataKey="date" 
               tick={{ fontSize: 12 }}
-              tickFormatter={(value) => new Date(value).toLocaleDateString('en-US', { month: 'short', day: 'numeric' })}
+              tickFormatter={formatBucket}
             />
             <YAxis yAxisId="left" tick={{ fontSize: 12 }} />
             <YAxis yAxisId="right" orientation="right" tick={{ fontSize: 12 }} />
-            <Tooltip content={<CustomTooltip />} />
+            <Tooltip content={<ChartTooltip />} />
             <Legend />
             <Line
               yAxisId="left"
@@ -223,8 +860,9 @@ export function Charts({ data, campaignData }: ChartsProps) {
               dataKey="users"
               stroke="#3B82F6"
               strokeWidth={2}
-              dot={{ r: 4 }}
+              dot={showDots ? DOT : false}
               name="Users"
+              isAnimationActive={!performanceMode}
             />
             <Line
               yAxisId="right"
@@ -232,20 +870,45 @@ export function Charts({ data, campaignData }: ChartsProps) {
               dataKey="conversions"
               stroke="#10B981"
               strokeWidth={2}
-              dot={{ r: 4 }}
+              dot={showDots ? DOT : false}
               name="Conversions"
+              isAnimationActive={!performanceMode}
             />
           </LineChart>
         </ResponsiveContainer>
-      </motion.div>
-    </div>
+      )}
+    </MotionDiv>
   );
-}
+});
 """
 
 # Write the Charts component
 with open(f"{project_name}/components/Charts.tsx", "w") as f:
     f.write(charts_component)
 
+with open(f"{project_name}/components/CanvasChart.tsx", "w") as f:
+    f.write(canvas_chart_component)
+
+with open(f"{project_name}/components/ChartTooltip.tsx", "w") as f:
+    f.write(chart_tooltip_component)
+
+with open(f"{project_name}/components/RevenueTrendCard.tsx", "w") as f:
+    f.write(revenue_trend_card)
+
+with open(f"{project_name}/components/CampaignBarCard.tsx", "w") as f:
+    f.write(campaign_bar_card)
+
+with open(f"{project_name}/components/ConversionPieCard.tsx", "w") as f:
+    f.write(conversion_pie_card)
+
+with open(f"{project_name}/components/MetricTrendCard.tsx", "w") as f:
+    f.write(metric_trend_card)
+
 print("Created Charts component:")
-print("  - components/Charts.tsx")
\ No newline at end of file
+print("  - components/Charts.tsx")
+print("  - components/CanvasChart.tsx")
+print("  - components/ChartTooltip.tsx")
+print("  - components/RevenueTrendCard.tsx")
+print("  - components/CampaignBarCard.tsx")
+print("  - components/ConversionPieCard.tsx")
+print("  - components/MetricTrendCard.tsx")
\ No newline at end of file
@@ -2,7 +2,7 @@
 data_table_component = """'use client';
 
 import { useState, useMemo } from 'react';
-import { motion } from 'framer-motion';
+import { MotionDiv, MotionTr } from './Motion';
 import { 
   Search, 
   Download, 
@@ -11,15 +11,32 @@ import {
   Filter,
   X 
 } from 'lucide-react';
-import { CampaignData } from '@/data/mockData';
+import type { CampaignData } from '@/data/mockData';
 import { formatCurrency, formatNumber, formatPercentage, exportToCSV } from '@/lib/utils';
+import {
+  type TableQuery,
+  type TableSortField,
+  type TableSortDirection,
+} from '@/lib/tableQuery';
+import { useTableQuery } from '@/lib/useTableQuery';
+import { useVirtualRows } from '@/lib/useVirtualRows';
 
 interface DataTableProps {
   data: CampaignData[];
 }
 
-type SortField = keyof CampaignData;
-type SortDirection = 'asc' | 'desc';
+type SortField = TableSortField;
+type SortDirection = TableSortDirection;
+
+// Page size 0 shows every row in one scrollable list
+const ALL_ROWS = 0;
+const PAGE_SIZE_OPTIONS = [10, 25, 50, 100, ALL_ROWS];
+
+// Pages longer than this are windowed: only visible rows are mounted and
+// row entrance animations are skipped
+const VIRTUAL_ROW_THRESHOLD = 25;
+const ROW_HEIGHT = 45;
+const VIEWPORT_HEIGHT = 540;
 
 export function DataTable({ data }: DataTableProps) {
   const [searchTerm, setSearchTerm] = useState('');
@@ -29,46 +46,33 @@ export function DataTable({ data }: DataTableProps) {
   const [showFilters, setShowFilters] = useState(false);
   const [minRevenue, setMinRevenue] = useState('');
   const [maxRevenue, setMaxRevenue] = useState('');
+  const [pageSize, setPageSize] = useState(10);
+  const [exportProgress, setExportProgress] = useState<number | null>(null);
 
-  const itemsPerPage = 10;
+  const itemsPerPage = pageSize === ALL_ROWS ? Math.max(data.length, 1) : pageSize;
 
-  // Filter and sort data
-  const filteredAndSortedData = useMemo(() => {
-    let filtered = data.filter(item =>
-      item.campaign.toLowerCase().includes(searchTerm.toLowerCase())
-    );
-
-    // Apply revenue filters
-    if (minRevenue) {
-      filtered = filtered.filter(item => item.revenue >= parseInt(minRevenue));
-    }
-    if (maxRevenue) {
-      filtered = filtered.filter(item => item.revenue <= parseInt(maxRevenue));
-    }
+  // Parse the revenue bounds once per change instead of on every comparison
+  const query = useMemo<TableQuery>(() => {
+    const min = parseInt(minRevenue);
+    const max = parseInt(maxRevenue);
+    return {
+      search: searchTerm,
+      minRevenue: Number.isNaN(min) ? null : min,
+      maxRevenue: Number.isNaN(max) ? null : max,
+      sortField,
+      sortDirection,
+      page: pageSize === ALL_ROWS ? 1 : currentPage,
+      pageSize: itemsPerPage,
+    };
+  }, [searchTerm, minRevenue, maxRevenue, sortField, sortDirection, currentPage, pageSize, itemsPerPage]);
 
-    // Sort data
-    return filtered.sort((a, b) => {
-      const aValue = a[sortField];
-      const bValue = b[sortField];
-      
-      if (typeof aValue === 'string' && typeof bValue === 'string') {
-        return sortDirection === 'asc' 
-          ? aValue.localeCompare(bValue)
-          : bValue.localeCompare(aValue);
-      }
-      
-      return sortDirection === 'asc' 
-        ? (aValue as number) - (bValue as number)
-        : (bValue as number) - (aValue as number);
-    });
-  }, [data, searchTerm, sortField, sortDirection, minRevenue, maxRevenue]);
+  // Filtering, sorting and pagination run in a worker
+  const { rows: paginatedData, total: totalRows, queryAll } = useTableQuery(data, query);
+  const totalPages = Math.ceil(totalRows / itemsPerPage);
 
-  // Pagination
-  const totalPages = Math.ceil(filteredAndSortedData.length / itemsPerPage);
-  const paginatedData = filteredAndSortedData.slice(
-    (currentPage - 1) * itemsPerPage,
-    currentPage * itemsPerPage
-  );
+  const isVirtual = paginatedData.length > VIRTUAL_ROW_THRESHOLD;
+  const virtualRows = useVirtualRows(isVirtual ? paginatedData.length : 0, ROW_HEIGHT, VIEWPORT_HEIGHT);
+  const windowSize = virtualRows.end - virtualRows.start;
 
   const handleSort = (field: SortField) => {
     if (field === sortField) {
@@ -79,8 +83,22 @@ export function DataTable({ data }: DataTableProps) {
     }
   };
 
-  const handleExport = () => {
-    exportToCSV(filteredAndSortedData, 'campaign-data.csv');
+  const handleExport = async () => {
+    setExportProgress(0);
+    try {
+      // The worker already holds the index; only the matching row ids come back
+      const { rows, data: source } = await queryAll(query);
+      const exportRows = function* () {
+        for (let k = 0; k < rows.length; k++) yield source[rows[k]];
+      };
+
+      await exportToCSV(exportRows(), 'campaign-data.csv', {
+        total: rows.length,
+        onProgress: (written, total) => setExportProgress(total === 0 ? 100 : (written / total) * 100),
+      });
+    } finally {
+      setExportProgress(null);
+    }
   };
 
   const clearFilters = () => {
@@ -90,6 +108,34 @@ export function DataTable({ data }: DataTableProps) {
     setCurrentPage(1);
   };
 
+  const handlePageSizeChange = (size: number) => {
+    setPageSize(size);
+    setCurrentPage(1);
+  };
+
+  const renderCells = (item: CampaignData) => (
+    <>
+      <td className="px-4 py-3 text-sm font-medium text-gray-900 dark:text-white">
+        {item.campaign}
+      </td>
+      <td className="px-4 py-3 text-sm text-gray-700 dark:text-gray-300">
+        {formatCurrency(item.revenue)}
+      </td>
+      <td className="px-4 py-3 text-sm text-gray-700 dark:text-gray-300">
+        {formatNumber(item.users)}
+      </td>
+      <td className="px-4 py-3 text-sm text-gray-700 dark:text-gray-300">
+        {formatNumber(item.conversions)}
+      </td>
+      <td className="px-4 py-3 text-sm text-gray-700 dark:text-gray-300">
+        {formatPercentage(item.ctr)}
+      </td>
+      <td className="px-4 py-3 text-sm text-gray-700 dark:text-gray-300">
+        {formatCurrency(item.cost)}
+      </td>
+    </>
+  );
+
   const SortIcon = ({ field }: { field: SortField }) => {
     if (sortField !== field) return null;
     return sortDirection === 'asc' ? 
@@ -98,7 +144,7 @@ export function DataTable({ data }: DataTableProps) {
   };
 
   return (
-    <motion.div
+    <MotionDiv
       initial={{ opacity: 0, y: 20 }}
       animate={{ opacity: 1, y: 0 }}
       transition={{ duration: 0.3, delay: 0.5 }}
@@ -110,6 +156,18 @@ export function DataTable({ data }: DataTableProps) {
           Campaign Performance Data
         </h3>
         <div className="flex flex-wrap items-center gap-2">
+          <select
+            value={pageSize}
+            onChange={(e) => handlePageSizeChange(Number(e.target.value))}
+            aria-label="Rows per page"
+            className="px-3 py-2 text-sm border border-gray-300 dark:border-gray-600 rounded-lg bg-white dark:bg-gray-700 text-gray-900 dark:text-white"
+          >
+            {PAGE_SIZE_OPTIONS.map(size => (
+              <option key={size} value={size}>
+                {size === ALL_ROWS ? 'All rows' : `${size} rows`}
+              </option>
+            ))}
+          </select>
           <button
             onClick={() => setShowFilters(!showFilters)}
             className="flex items-center space-x-2 px-3 py-2 bg-blue-600 text-white rounded-lg hover:bg-blue-700 transition-colors"
@@ -119,17 +177,20 @@ export function DataTable({ data }: DataTableProps) {
           </button>
           <button
             onClick={handleExport}
-            className="flex items-center space-x-2 px-3 py-2 bg-green-600 text-white rounded-lg hover:bg-green-700 transition-colors"
+            disabled={exportProgress !== null}
+            className="flex items-center space-x-2 px-3 py-2 bg-green-600 text-white rounded-lg hover:bg-green-700 disabled:opacity-75 disabled:cursor-wait transition-colors"
           >
             <Download className="w-4 h-4" />
-            <span>Export CSV</span>
+            <span>
+              {exportProgress === null ? 'Export CSV' : `Exporting ${exportProgress.toFixed(0)}%`}
+            </span>
           </button>
         </div>
       </div>
 
       {/* Filters */}
       {showFilters && (
-        <motion.div
+        <MotionDiv
           initial={{ opacity: 0, height: 0 }}
           animate={{ opacity: 1, height: 'auto' }}
           exit={{ opacity: 0, height: 0 }}
@@ -185,13 +246,17 @@ export function DataTable({ data }: DataTableProps) {
               <span>Clear Filters</span>
             </button>
           </div>
-        </motion.div>
+        </MotionDiv>
       )}
 
       {/* Table */}
-      <div className="overflow-x-auto">
+      <div
+        className={isVirtual ? 'overflow-auto' : 'overflow-x-auto'}
+        style={isVirtual ? { maxHeight: VIEWPORT_HEIGHT } : undefined}
+        onScroll={isVirtual ? virtualRows.onScroll : undefined}
+      >
         <table className="w-full">
-          <thead>
+          <thead className={isVirtual ? 'sticky top-0 z-10 bg-white dark:bg-gray-900' : undefined}>
             <tr className="border-b border-gray-200 dark:border-gray-700">
               {[
                 { key: 'campaign', label: 'Campaign' },
@@ -215,45 +280,50 @@ export function DataTable({ data }: DataTableProps) {
             </tr>
           </thead>
           <tbody className="divide-y divide-gray-200 dark:divide-gray-700">
-            {paginatedData.map((item, index) => (
-              <motion.tr
-                key={item.campaign}
-                initial={{ opacity: 0 }}
-                animate={{ opacity: 1 }}
-                transition={{ delay: index * 0.05 }}
-                className="hover:bg-gray-50 dark:hover:bg-gray-800/50 transition-colors"
-              >
-                <td className="px-4 py-3 text-sm font-medium text-gray-900 dark:text-white">
-                  {item.campaign}
-                </td>
-                <td className="px-4 py-3 text-sm text-gray-700 dark:text-gray-300">
-                  {formatCurrency(item.revenue)}
-                </td>
-                <td className="px-4 py-3 text-sm text-gray-700 dark:text-gray-300">
-                  {formatNumber(item.users)}
-                </td>
-                <td className="px-4 py-3 text-sm text-gray-700 dark:text-gray-300">
-                  {formatNumber(item.conversions)}
-                </td>
-                <td className="px-4 py-3 text-sm text-gray-700 dark:text-gray-300">
-                  {formatPercentage(item.ctr)}
-                </td>
-                <td className="px-4 py-3 text-sm text-gray-700 dark:text-gray-300">
-                  {formatCurrency(item.cost)}
-                </td>
-              </motion.tr>
-            ))}
+            {isVirtual ? (
+              <>
+                {virtualRows.padTop > 0 && <tr style={{ height: virtualRows.padTop }} />}
+                {paginatedData.slice(virtualRows.start, virtualRows.end).map((item, offset) => (
+                  // Keys cycle through a fixed pool so scrolled-out rows are reused
+                  <tr
+                    key={(virtualRows.start + offset) % windowSize}
+                    style={{ height: ROW_HEIGHT }}
+                    className="hover:bg-gray-50 dark:hover:bg-gray-800/50 transition-colors"
+                  >
+                    {renderCells(item)}
+                  </tr>
+                ))}
+                {virtualRows.padBottom > 0 && <tr style={{ height: virtualRows.padBottom }} />}
+              </>
+            ) : (
+              paginatedData.map((item, index) => (
+                <MotionTr
+                  key={item.campaign}
+                  initial={{ opacity: 0 }}
+                  animate={{ opacity: 1 }}
+                  transition={{ delay: index * 0.05 }}
+                  className="hover:bg-gray-50 dark:hover:bg-gray-800/50 transition-colors"
+                >
+                  {renderCells(item)}
+                </MotionTr>
+              ))
+            )}
           </tbody>
         </table>
       </div>
 
       {/* Pagination */}
-      {totalPages > 1 && (
+      {pageSize === ALL_ROWS && (
+        <div className="mt-6 text-sm text-gray-700 dark:text-gray-300">
+          Showing all {totalRows} results
+        </div>
+      )}
+      {pageSize !== ALL_ROWS && totalPages > 1 && (
         <div className="flex items-center justify-between mt-6">
           <div className="text-sm text-gray-700 dark:text-gray-300">
             Showing {(currentPage - 1) * itemsPerPage + 1} to{' '}
-            {Math.min(currentPage * itemsPerPage, filteredAndSortedData.length)} of{' '}
-            {filteredAndSortedData.length} results
+            {Math.min(currentPage * itemsPerPage, totalRows)} of{' '}
+            {totalRows} results
           </div>
           <div className="flex items-center space-x-2">
             <button
@@ -276,8 +346,430 @@ export function DataTable({ data }: DataTableProps) {
           </div>
         </div>
       )}
-    </motion.div>
+    </MotionDiv>
+  );
+}
+"""
+
+# Create columnar table query engine
+table_query_ts = """import type { CampaignData } from '@/data/mockData';
+
+export type TableSortField = keyof CampaignData;
+export type TableSortDirection = 'asc' | 'desc';
+
+export interface TableQuery {
+  search: string;
+  minRevenue: number | null;
+  maxRevenue: number | null;
+  sortField: TableSortField;
+  sortDirection: TableSortDirection;
+  page: number;
+  pageSize: number;
+}
+
+export interface TableQueryResult {
+  // Row ids of the requested page, in display order
+  rows: Uint32Array;
+  // Number of rows matching the filters
+  total: number;
+}
+
+// Columnar copy of the campaign table. Numeric columns are backed by their own
+// ArrayBuffers so the whole table can be transferred to a worker without copying
+export interface TableColumns {
+  length: number;
+  campaigns: string[];
+  names: string[];
+  revenue: Float64Array;
+  users: Float64Array;
+  conversions: Float64Array;
+  ctr: Float64Array;
+  cost: Float64Array;
+}
+
+// Columns plus one ascending sort permutation (row ids) per column, built once
+// per dataset; descending order walks the same permutation backwards.
+// ties[k] is 1 when permutation entry k equals entry k - 1, so descending walks
+// can keep equal rows in their original order like a stable sort would
+export interface TableIndex {
+  columns: TableColumns;
+  permutations: Record<TableSortField, Uint32Array>;
+  ties: Record<TableSortField, Uint8Array>;
+}
+
+const NUMERIC_FIELDS = ['revenue', 'users', 'conversions', 'ctr', 'cost'] as const;
+
+export function encodeTable(data: CampaignData[]): TableColumns {
+  const length = data.length;
+  const columns: TableColumns = {
+    length,
+    campaigns: data.map(item => item.campaign),
+    names: data.map(item => item.campaign.toLowerCase()),
+    revenue: new Float64Array(length),
+    users: new Float64Array(length),
+    conversions: new Float64Array(length),
+    ctr: new Float64Array(length),
+    cost: new Float64Array(length),
+  };
+
+  data.forEach((item, i) => {
+    NUMERIC_FIELDS.forEach(field => {
+      columns[field][i] = item[field];
+    });
+  });
+
+  return columns;
+}
+
+export function tableTransferables(columns: TableColumns): ArrayBuffer[] {
+  return NUMERIC_FIELDS.map(field => columns[field].buffer as ArrayBuffer);
+}
+
+function identity(length: number): Uint32Array {
+  const rows = new Uint32Array(length);
+  for (let i = 0; i < length; i++) rows[i] = i;
+  return rows;
+}
+
+function markTies(permutation: Uint32Array, equal: (a: number, b: number) => boolean): Uint8Array {
+  const ties = new Uint8Array(permutation.length);
+  for (let k = 1; k < permutation.length; k++) {
+    ties[k] = equal(permutation[k - 1], permutation[k]) ? 1 : 0;
+  }
+  return ties;
+}
+
+// Precompute the sort permutations; campaign names are collated only here
+export function indexTable(columns: TableColumns): TableIndex {
+  const { campaigns } = columns;
+  const campaignOrder = identity(columns.length).sort((a, b) => campaigns[a].localeCompare(campaigns[b]));
+  const permutations = { campaign: campaignOrder } as Record<TableSortField, Uint32Array>;
+  const ties = {
+    campaign: markTies(campaignOrder, (a, b) => campaigns[a] === campaigns[b]),
+  } as Record<TableSortField, Uint8Array>;
+
+  NUMERIC_FIELDS.forEach(field => {
+    const values = columns[field];
+    permutations[field] = identity(columns.length).sort((a, b) => values[a] - values[b]);
+    ties[field] = markTies(permutations[field], (a, b) => values[a] === values[b]);
+  });
+
+  return { columns, permutations, ties };
+}
+
+// Bitmap (one bit per row) of the rows that pass the search and revenue filters
+export function buildFilterMask(columns: TableColumns, query: TableQuery): Uint32Array {
+  const needle = query.search.toLowerCase();
+  const { minRevenue, maxRevenue } = query;
+  const mask = new Uint32Array((columns.length + 31) >>> 5);
+
+  for (let i = 0; i < columns.length; i++) {
+    if (needle && !columns.names[i].includes(needle)) continue;
+    if (minRevenue !== null && columns.revenue[i] < minRevenue) continue;
+    if (maxRevenue !== null && columns.revenue[i] > maxRevenue) continue;
+    mask[i >>> 5] |= 1 << (i & 31);
+  }
+
+  return mask;
+}
+
+// Walk the sort permutation in the requested direction, keeping rows set in
+// the filter mask; only the visible page's row ids are collected. O(n), no sort
+export function runTableQuery(
+  index: TableIndex,
+  query: TableQuery,
+  mask: Uint32Array = buildFilterMask(index.columns, query)
+): TableQueryResult {
+  const permutation = index.permutations[query.sortField];
+  const ties = index.ties[query.sortField];
+  const start = (query.page - 1) * query.pageSize;
+  const end = start + query.pageSize;
+  const rows: number[] = [];
+  let total = 0;
+
+  const visit = (row: number) => {
+    if ((mask[row >>> 5] & (1 << (row & 31))) === 0) return;
+    if (total >= start && total < end) rows.push(row);
+    total++;
+  };
+
+  if (query.sortDirection === 'asc') {
+    for (let k = 0; k < permutation.length; k++) visit(permutation[k]);
+  } else {
+    // Step backwards one run of equal values at a time, visiting each run forwards
+    for (let last = permutation.length - 1; last >= 0; ) {
+      let first = last;
+      while (first > 0 && ties[first]) first--;
+      for (let k = first; k <= last; k++) visit(permutation[k]);
+      last = first - 1;
+    }
+  }
+
+  return { rows: Uint32Array.from(rows), total };
+}
+"""
+
+# Create table query worker
+table_query_worker_ts = """import {
+  indexTable,
+  buildFilterMask,
+  runTableQuery,
+  type TableColumns,
+  type TableIndex,
+  type TableQuery,
+} from './tableQuery';
+
+export type TableWorkerRequest =
+  | { type: 'load'; columns: TableColumns }
+  | { type: 'query'; id: number; query: TableQuery }
+  // Every matching row in sort order, ignoring the query's page; never superseded
+  | { type: 'export'; id: number; query: TableQuery };
+
+export interface TableWorkerResponse {
+  id: number;
+  rows: Uint32Array;
+  total: number;
+}
+
+let index: TableIndex | null = null;
+let pending: { id: number; query: TableQuery } | null = null;
+let exports: { id: number; query: TableQuery }[] = [];
+let scheduled = false;
+
+// The filter bitmap is reused while only the sort or page changes
+let cachedFilter: { key: string; mask: Uint32Array } | null = null;
+
+function filterMask(table: TableIndex, query: TableQuery): Uint32Array {
+  const key = JSON.stringify([query.search, query.minRevenue, query.maxRevenue]);
+  if (cachedFilter?.key !== key) {
+    cachedFilter = { key, mask: buildFilterMask(table.columns, query) };
+  }
+  return cachedFilter.mask;
+}
+
+function respond(id: number, table: TableIndex, query: TableQuery) {
+  const { rows, total } = runTableQuery(table, query, filterMask(table, query));
+  const response: TableWorkerResponse = { id, rows, total };
+  self.postMessage(response, { transfer: [rows.buffer] });
+}
+
+// Answers every export, then only the newest pending query; anything it
+// superseded is dropped unrun
+function flush() {
+  scheduled = false;
+  if (!index) return;
+
+  const table = index;
+  exports.forEach(({ id, query }) => respond(id, table, { ...query, page: 1, pageSize: table.columns.length }));
+  exports = [];
+  if (!pending) return;
+
+  const { id, query } = pending;
+  pending = null;
+  respond(id, table, query);
+}
+
+self.onmessage = (event: MessageEvent<TableWorkerRequest>) => {
+  const message = event.data;
+  if (message.type === 'load') {
+    index = indexTable(message.columns);
+    cachedFilter = null;
+  } else if (message.type === 'export') {
+    exports.push({ id: message.id, query: message.query });
+  } else {
+    pending = { id: message.id, query: message.query };
+  }
+
+  if (!scheduled) {
+    scheduled = true;
+    setTimeout(flush, 0);
+  }
+};
+"""
+
+# Create worker-backed table query hook
+use_table_query_ts = """import { useCallback, useEffect, useRef, useState } from 'react';
+import type { CampaignData } from '@/data/mockData';
+import {
+  encodeTable,
+  indexTable,
+  runTableQuery,
+  tableTransferables,
+  type TableIndex,
+  type TableQuery,
+} from './tableQuery';
+import type { TableWorkerRequest, TableWorkerResponse } from './tableQuery.worker';
+
+interface TableQueryState {
+  rows: CampaignData[];
+  total: number;
+}
+
+export interface TableQueryExport {
+  // Ids of every row matching the filters, in sort order
+  rows: Uint32Array;
+  // The dataset the ids index into
+  data: CampaignData[];
+}
+
+interface TableQueryHook extends TableQueryState {
+  // Every matching row of a query regardless of its page, resolved by the
+  // worker from the index it already holds
+  queryAll(query: TableQuery): Promise<TableQueryExport>;
+}
+
+interface PendingExport {
+  data: CampaignData[];
+  resolve: (result: TableQueryExport) => void;
+  reject: (error: Error) => void;
+}
+
+// Answer table queries off the main thread. The dataset is transferred to the
+// worker once per `data` change, where its sort permutations are built. Every
+// query gets an id and only the answer to the newest one is applied, so stale
+// keystrokes never overwrite fresh results. Falls back to running the query
+// inline where workers are unavailable.
+export function useTableQuery(data: CampaignData[], query: TableQuery): TableQueryHook {
+  const workerRef = useRef<Worker | null>(null);
+  const latestId = useRef(0);
+  // Exports take negative ids so they never collide with page queries
+  const exportId = useRef(0);
+  const pendingExports = useRef(new Map<number, PendingExport>());
+  const queriedData = useRef(data);
+  const [result, setResult] = useState<TableQueryState>({ rows: [], total: 0 });
+  // The inline fallback's index, built on first use and rebuilt only when `data` changes
+  const inlineIndex = useRef<{ data: CampaignData[]; index: TableIndex } | null>(null);
+
+  const indexInline = useCallback((source: CampaignData[]): TableIndex => {
+    if (inlineIndex.current?.data !== source) {
+      inlineIndex.current = { data: source, index: indexTable(encodeTable(source)) };
+    }
+    return inlineIndex.current.index;
+  }, []);
+
+  useEffect(() => {
+    if (typeof Worker === 'undefined') return;
+
+    const worker = new Worker(new URL('./tableQuery.worker.ts', import.meta.url));
+    worker.onmessage = (event: MessageEvent<TableWorkerResponse>) => {
+      const { id, rows, total } = event.data;
+      const pendingExport = pendingExports.current.get(id);
+      if (pendingExport) {
+        pendingExports.current.delete(id);
+        pendingExport.resolve({ rows, data: pendingExport.data });
+        return;
+      }
+      if (id !== latestId.current) return;
+      const source = queriedData.current;
+      setResult({ rows: Array.from(rows, row => source[row]), total });
+    };
+    workerRef.current = worker;
+    const exportsInFlight = pendingExports.current;
+
+    return () => {
+      worker.terminate();
+      workerRef.current = null;
+      exportsInFlight.forEach(({ reject }) => reject(new Error('Table worker terminated')));
+      exportsInFlight.clear();
+    };
+  }, []);
+
+  useEffect(() => {
+    const worker = workerRef.current;
+    if (!worker) return;
+
+    const columns = encodeTable(data);
+    const message: TableWorkerRequest = { type: 'load', columns };
+    worker.postMessage(message, tableTransferables(columns));
+  }, [data]);
+
+  useEffect(() => {
+    const id = ++latestId.current;
+    queriedData.current = data;
+
+    const worker = workerRef.current;
+    if (worker) {
+      const message: TableWorkerRequest = { type: 'query', id, query };
+      worker.postMessage(message);
+    } else {
+      const { rows, total } = runTableQuery(indexInline(data), query);
+      setResult({ rows: Array.from(rows, row => data[row]), total });
+    }
+  }, [data, query, indexInline]);
+
+  const queryAll = useCallback(
+    (exportQuery: TableQuery): Promise<TableQueryExport> => {
+      const worker = workerRef.current;
+      if (!worker) {
+        const { rows } = runTableQuery(indexInline(data), { ...exportQuery, page: 1, pageSize: data.length });
+        return Promise.resolve({ rows, data });
+      }
+
+      const id = -++exportId.current;
+      return new Promise((resolve, reject) => {
+        pendingExports.current.set(id, { data, resolve, reject });
+        const message: TableWorkerRequest = { type: 'export', id, query: exportQuery };
+        worker.postMessage(message);
+      });
+    },
+    [data, indexInline]
   );
+
+  return { ...result, queryAll };
+}
+"""
+
+# Create row virtualization hook
+use_virtual_rows_ts = """import { useCallback, useEffect, useRef, useState, type UIEvent } from 'react';
+
+interface VirtualRows {
+  // Rows [start, end) are mounted; the paddings stand in for the rest
+  start: number;
+  end: number;
+  padTop: number;
+  padBottom: number;
+  onScroll: (event: UIEvent<HTMLElement>) => void;
+}
+
+// Window a long list of fixed-height rows to those visible in a scroll viewport.
+// Scroll updates are coalesced to one per animation frame.
+export function useVirtualRows(
+  count: number,
+  rowHeight: number,
+  viewportHeight: number,
+  overscan = 8
+): VirtualRows {
+  const [scrollTop, setScrollTop] = useState(0);
+  const frame = useRef<number | null>(null);
+
+  const onScroll = useCallback((event: UIEvent<HTMLElement>) => {
+    const top = event.currentTarget.scrollTop;
+    if (frame.current !== null) cancelAnimationFrame(frame.current);
+    frame.current = requestAnimationFrame(() => {
+      frame.current = null;
+      setScrollTop(top);
+    });
+  }, []);
+
+  useEffect(
+    () => () => {
+      if (frame.current !== null) cancelAnimationFrame(frame.current);
+    },
+    []
+  );
+
+  const visible = Math.ceil(viewportHeight / rowHeight);
+  const first = Math.min(Math.floor(scrollTop / rowHeight), count - visible);
+  const start = Math.max(0, first - overscan);
+  const end = Math.min(count, Math.max(first, 0) + visible + overscan);
+
+  return {
+    start,
+    end,
+    padTop: start * rowHeight,
+    padBottom: (count - end) * rowHeight,
+    onScroll,
+  };
 }
 """
 
@@ -285,5 +777,21 @@ export function DataTable({ data }: DataTableProps) {
 with open(f"{project_name}/components/DataTable.tsx", "w") as f:
     f.write(data_table_component)
 
+with open(f"{project_name}/lib/tableQuery.ts", "w") as f:
+    f.write(table_query_ts)
+
+with open(f"{project_name}/lib/tableQuery.worker.ts", "w") as f:
+    f.write(table_query_worker_ts)
+
+with open(f"{project_name}/lib/useTableQuery.ts", "w") as f:
+    f.write(use_table_query_ts)
+
+with open(f"{project_name}/lib/useVirtualRows.ts", "w") as f:
+    f.write(use_virtual_rows_ts)
+
 print("Created DataTable component:")
-print("  - components/DataTable.tsx")
\ No newline at end of file
+print("  - components/DataTable.tsx")
+print("  - lib/tableQuery.ts")
+print("  - lib/tableQuery.worker.ts")
+print("  - lib/useTableQuery.ts")
+print("  - lib/useVirtualRows.ts")
\ No newline at end of file
@@ -2,7 +2,6 @@
 sidebar_component = """'use client';
 
 import { useState } from 'react';
-import { motion } from 'framer-motion';
 import {
   BarChart3,
   Users,
@@ -15,6 +14,8 @@ import {
   DollarSign,
 } from 'lucide-react';
 import { ThemeToggle } from './ThemeToggle';
+import { PerformanceToggle } from './PerformanceToggle';
+import { MotionDiv } from './Motion';
 
 const navigation = [
   { name: 'Dashboard', icon: Home, current: true },
@@ -46,7 +47,7 @@ export function Sidebar({ children }: SidebarProps) {
       )}
 
       {/* Sidebar */}
-      <motion.div
+      <MotionDiv
         initial={false}
         animate={{
           x: sidebarOpen ? 0 : '-100%',
@@ -99,14 +100,17 @@ export function Sidebar({ children }: SidebarProps) {
               <div className="text-sm text-gray-600 dark:text-gray-400">
                 Theme
               </div>
-              <ThemeToggle />
+              <div className="flex items-center space-x-2">
+                <PerformanceToggle />
+                <ThemeToggle />
+              </div>
             </div>
             <div className="mt-4 text-xs text-gray-500 dark:text-gray-400">
               © 2025 ADmyBRAND Insights
             </div>
           </div>
         </div>
-      </motion.div>
+      </MotionDiv>
 
       {/* Main content */}
       <div className="flex-1 flex flex-col overflow-hidden">
@@ -143,8 +147,9 @@ export function Sidebar({ children }: SidebarProps) {
 # Create main Dashboard component
 dashboard_component = """'use client';
 
-import { useState, useEffect } from 'react';
-import { motion } from 'framer-motion';
+import { createContext, useCallback, useContext, useEffect, useMemo, useState, memo, type ReactNode } from 'react';
+import dynamic from 'next/dynamic';
+import { MotionDiv } from './Motion';
 import { 
   DollarSign, 
   Users, 
@@ -154,148 +159,380 @@ import {
 } from 'lucide-react';
 import { MetricCard } from './MetricCard';
 import { Charts } from './Charts';
-import { DataTable } from './DataTable';
-import { CardSkeleton, ChartSkeleton } from './LoadingSkeleton';
-import { mockData, campaignData, summaryMetrics } from '@/data/mockData';
-import { formatCurrency, formatNumber, formatPercentage, calculateGrowth } from '@/lib/utils';
+import { LazyPanel } from './LazyPanel';
+import { ChartsSkeleton, TableSkeleton } from './LoadingSkeleton';
+import type { CampaignData } from '@/data/mockData';
+import { generateCampaignRates } from '@/data/generators';
+import { startRowPoll } from '@/data/liveFeed';
+import type { SummaryMetrics } from '@/lib/aggregate';
+import { createLiveStore, useLiveSlice, type LiveSeed, type LiveStore } from '@/lib/liveStore';
+import {
+  growthMetrics,
+  selectCampaigns,
+  selectDatasetVersion,
+  selectGrowthMetrics,
+  selectLastUpdated,
+  selectRollupVersion,
+  selectSeeded,
+  selectStale,
+  selectSummary,
+  type GrowthMetrics,
+} from '@/lib/selectors';
+import { snapshotCache, type SnapshotCacheQuery } from '@/lib/snapshotCache';
+import { useLoadTiming } from '@/lib/useLoadTiming';
+import { useRenderCount } from '@/lib/useRenderCount';
+import { formatCurrency, formatNumber, formatPercentage } from '@/lib/utils';
 
-export function Dashboard() {
-  const [isLoading, setIsLoading] = useState(true);
-  const [isRealTimeEnabled, setIsRealTimeEnabled] = useState(false);
-  const [lastUpdated, setLastUpdated] = useState(new Date());
+// The table sits below the charts, so its chunk loads as it scrolls into view
+const DataTable = dynamic(() => import('./DataTable').then(m => m.DataTable), {
+  ssr: false,
+  loading: () => <TableSkeleton />,
+});
+
+// The live store shared by the dashboard's separately streamed sections
+const DashboardStoreContext = createContext<LiveStore | null>(null);
+
+type DashboardSection = 'metrics' | 'charts' | 'table';
+
+const SectionArrivalContext = createContext<(section: DashboardSection) => void>(() => {});
+
+function useDashboardStore(): LiveStore {
+  const store = useContext(DashboardStoreContext);
+  if (!store) throw new Error('Dashboard sections must be rendered inside <Dashboard>');
+  return store;
+}
+
+// A streamed section shows the store's data over its own props once the store
+// is seeded, unless the store holds a cached copy of another dataset version
+function useStoreIsCurrent(store: LiveStore, datasetVersion: string): boolean {
+  const seeded = useLiveSlice(store, selectSeeded);
+  const stale = useLiveSlice(store, selectStale);
+  const storeVersion = useLiveSlice(store, selectDatasetVersion);
+  return seeded && (!stale || storeVersion === datasetVersion);
+}
+
+// Tell the dashboard a streamed section has mounted, so the cached copy
+// standing in for it can go
+function useSectionArrived(section: DashboardSection): void {
+  const arrive = useContext(SectionArrivalContext);
+  useEffect(() => arrive(section), [arrive, section]);
+}
+
+interface MetricCardGridProps {
+  summary: SummaryMetrics;
+  growth: GrowthMetrics;
+}
+
+const MetricCardGrid = memo(function MetricCardGrid({ summary, growth }: MetricCardGridProps) {
+  useLoadTiming('firstMetric');
+
+  return (
+    <div className="grid grid-cols-1 sm:grid-cols-2 lg:grid-cols-4 gap-6">
+      <MetricCard
+        title="Total Revenue"
+        value={formatCurrency(summary.totalRevenue)}
+        change={growth.revenue}
+        icon={<DollarSign className="w-6 h-6" />}
+      />
+      <MetricCard
+        title="Total Users"
+        value={formatNumber(summary.totalUsers)}
+        change={growth.users}
+        icon={<Users className="w-6 h-6" />}
+      />
+      <MetricCard
+        title="Conversions"
+        value={formatNumber(summary.totalConversions)}
+        change={growth.conversions}
+        icon={<Target className="w-6 h-6" />}
+      />
+      <MetricCard
+        title="Conversion Rate"
+        value={formatPercentage(summary.conversionRate)}
+        change={growth.conversionRate}
+        icon={<TrendingUp className="w-6 h-6" />}
+      />
+    </div>
+  );
+});
+
+// Views of the store alone, used both by the streamed sections and, before
+// those arrive, to show a snapshot restored from the persistent cache
+const StoreMetricCards = memo(function StoreMetricCards() {
+  const store = useDashboardStore();
+  const summary = useLiveSlice(store, selectSummary);
+  // Growth percentages (simulated), recomputed only when the summary changes
+  const growth = useLiveSlice(store, selectGrowthMetrics);
+  return <MetricCardGrid summary={summary} growth={growth} />;
+});
+
+const StoreCharts = memo(function StoreCharts() {
+  useLoadTiming('charts');
+  const store = useDashboardStore();
+  const campaigns = useLiveSlice(store, selectCampaigns);
+  const rollupVersion = useLiveSlice(store, selectRollupVersion);
 
-  // Simulate loading
+  return <Charts campaignData={campaigns} rollups={store.rollups} rollupVersion={rollupVersion} />;
+});
+
+const CampaignTable = memo(function CampaignTable({ data }: { data: CampaignData[] }) {
+  useLoadTiming('table');
+  return (
+    <LazyPanel fallback={<TableSkeleton />}>
+      <DataTable data={data} />
+    </LazyPanel>
+  );
+});
+
+const StoreDataTable = memo(function StoreDataTable() {
+  const store = useDashboardStore();
+  const campaigns = useLiveSlice(store, selectCampaigns);
+  return <CampaignTable data={campaigns} />;
+});
+
+// Each live section subscribes to its own store slice, so an ingest tick only
+// re-renders the sections whose data changed. Sections stream in separately
+// (see components/DashboardSections.tsx): the charts section seeds the store,
+// and the cards and table show their streamed props until it has
+interface LiveMetricCardsProps {
+  summary: SummaryMetrics;
+  datasetVersion: string;
+}
+
+export const LiveMetricCards = memo(function LiveMetricCards({ summary, datasetVersion }: LiveMetricCardsProps) {
+  useRenderCount('LiveMetricCards');
+  useSectionArrived('metrics');
+  const store = useDashboardStore();
+  const current = useStoreIsCurrent(store, datasetVersion);
+  const streamedGrowth = useMemo(() => growthMetrics(summary), [summary]);
+
+  if (current) return <StoreMetricCards />;
+  return <MetricCardGrid summary={summary} growth={streamedGrowth} />;
+});
+
+interface LiveChartsProps {
+  seed: LiveSeed;
+}
+
+export const LiveCharts = memo(function LiveCharts({ seed }: LiveChartsProps) {
+  useRenderCount('LiveCharts');
+  useSectionArrived('charts');
+  const store = useDashboardStore();
+  const seeded = useLiveSlice(store, selectSeeded);
+  // Seeded once committed, never during render. Ignored once seeded, so a
+  // second snapshot is harmless; a restored cached copy is confirmed or replaced
   useEffect(() => {
-    const timer = setTimeout(() => {
-      setIsLoading(false);
-    }, 1500);
+    store.seed(seed);
+  }, [store, seed]);
+
+  return seeded ? <StoreCharts /> : <ChartsSkeleton />;
+});
+
+interface LiveDataTableProps {
+  campaigns: CampaignData[];
+  datasetVersion: string;
+}
+
+export const LiveDataTable = memo(function LiveDataTable({ campaigns, datasetVersion }: LiveDataTableProps) {
+  useRenderCount('LiveDataTable');
+  useSectionArrived('table');
+  const store = useDashboardStore();
+  const current = useStoreIsCurrent(store, datasetVersion);
+
+  if (current) return <StoreDataTable />;
+  return <CampaignTable data={campaigns} />;
+});
+
+interface LiveFooterProps {
+  store: LiveStore;
+  isRealTimeEnabled: boolean;
+}
+
+const LiveFooter = memo(function LiveFooter({ store, isRealTimeEnabled }: LiveFooterProps) {
+  useRenderCount('LiveFooter');
+  const seeded = useLiveSlice(store, selectSeeded);
+  const stale = useLiveSlice(store, selectStale);
+  const lastUpdated = useLiveSlice(store, selectLastUpdated);
+
+  return (
+    <MotionDiv
+      initial={{ opacity: 0 }}
+      animate={{ opacity: 1 }}
+      transition={{ delay: 0.8 }}
+      className="text-center text-sm text-gray-500 dark:text-gray-400 mt-8"
+    >
+      Last updated: {seeded ? lastUpdated.toLocaleString() : 'loading…'}
+      {stale && ' (cached, refreshing…)'} | 
+      Data refreshes every {isRealTimeEnabled ? '5 seconds' : 'manual refresh'}
+    </MotionDiv>
+  );
+});
+
+interface DashboardProps {
+  // Keys the persistent snapshot cache
+  query: SnapshotCacheQuery;
+  // Streamed sections, each inside its own Suspense boundary (see app/page.tsx)
+  metrics: ReactNode;
+  charts: ReactNode;
+  table: ReactNode;
+}
 
-    return () => clearTimeout(timer);
+export function Dashboard({ query, metrics, charts, table }: DashboardProps) {
+  useRenderCount('Dashboard');
+  const [isRealTimeEnabled, setIsRealTimeEnabled] = useState(false);
+  const [store] = useState(() => createLiveStore({ campaignRates: generateCampaignRates }));
+  const seeded = useLiveSlice(store, selectSeeded);
+  const [arrived, setArrived] = useState<Record<DashboardSection, boolean>>({
+    metrics: false,
+    charts: false,
+    table: false,
+  });
+  const arrive = useCallback((section: DashboardSection) => {
+    setArrived(current => (current[section] ? current : { ...current, [section]: true }));
   }, []);
 
-  // Real-time updates simulation
+  // Stale-while-revalidate: show the cached snapshot for this query as soon as
+  // IndexedDB returns it, then let the streamed snapshot confirm or replace it.
+  // A snapshot that streamed in first wins, since restore only fills an unseeded store
   useEffect(() => {
-    if (!isRealTimeEnabled) return;
-
-    const interval = setInterval(() => {
-      setLastUpdated(new Date());
-      // In a real app, you would fetch new data here
-    }, 5000);
-
-    return () => clearInterval(interval);
-  }, [isRealTimeEnabled]);
-
-  // Calculate growth percentages (simulated)
-  const growthMetrics = {
-    revenue: calculateGrowth(summaryMetrics.totalRevenue, summaryMetrics.totalRevenue * 0.9),
-    users: calculateGrowth(summaryMetrics.totalUsers, summaryMetrics.totalUsers * 0.85),
-    conversions: calculateGrowth(summaryMetrics.totalConversions, summaryMetrics.totalConversions * 0.95),
-    conversionRate: calculateGrowth(summaryMetrics.conversionRate, summaryMetrics.conversionRate * 0.88),
-  };
+    let active = true;
+    snapshotCache.get(query).then(seed => {
+      if (active && seed) store.restore(seed);
+    });
+    return () => {
+      active = false;
+    };
+  }, [query, store]);
 
-  if (isLoading) {
+  // Keep each fresh snapshot for the next visit, which also drops the tenant's
+  // cached snapshots of older dataset versions. The store notifies as soon as
+  // it is seeded, so the buckets saved are the seed's own, before any live rows
+  useEffect(() => {
+    let persisted: LiveSeed | null = null;
+    const persist = () => {
+      const seed = store.freshSeed();
+      if (!seed || seed === persisted) return;
+      persisted = seed;
+      snapshotCache.put(query, seed, store.rollups.save());
+    };
+    // A section that streamed in before this effect ran has already seeded the store
+    persist();
+    return store.subscribe(persist);
+  }, [query, store]);
+
+  // Real-time updates: poll the tenant's row log from the store's cursor, i.e.
+  // from the snapshot on screen or the last rows applied, so turning updates
+  // off and on again misses nothing. New rows are folded into the store
+  // incrementally, and a poll with nothing new costs an empty 304
+  useEffect(() => {
+    if (!isRealTimeEnabled || !seeded) return;
+    return startRowPoll((rows, cursor) => store.ingest(rows, cursor), {
+      tenant: query.tenant,
+      intervalMs: 5000,
+      cursor: store.rowCursor,
+    });
+  }, [isRealTimeEnabled, seeded, store, query.tenant]);
+
+  // Until a streamed section arrives, a seeded store (usually restored from the
+  // cache) renders it instead of the skeleton; the pending section stays
+  // mounted but hidden so it can take over without a flash
+  const sectionSlot = (section: DashboardSection, cached: ReactNode, streamed: ReactNode) => {
+    const showCached = seeded && !arrived[section];
     return (
-      <div className="space-y-6">
-        {/* Skeleton for metric cards */}
-        <div className="grid grid-cols-1 sm:grid-cols-2 lg:grid-cols-4 gap-6">
-          {Array.from({ length: 4 }).map((_, i) => (
-            <CardSkeleton key={i} />
-          ))}
-        </div>
-        
-        {/* Skeleton for charts */}
-        <div className="grid grid-cols-1 lg:grid-cols-2 gap-6">
-          {Array.from({ length: 4 }).map((_, i) => (
-            <ChartSkeleton key={i} />
-          ))}
-        </div>
-      </div>
+      <>
+        {showCached && cached}
+        <div hidden={showCached}>{streamed}</div>
+      </>
     );
-  }
+  };
 
   return (
-    <div className="space-y-6">
-      {/* Real-time toggle */}
-      <div className="flex justify-between items-center">
-        <h2 className="text-3xl font-bold text-gray-900 dark:text-white">
-          Dashboard Overview
-        </h2>
-        <div className="flex items-center space-x-4">
-          <div className="flex items-center space-x-2">
-            <label className="text-sm font-medium text-gray-700 dark:text-gray-300">
-              Real-time Updates
-            </label>
-            <button
-              onClick={() => setIsRealTimeEnabled(!isRealTimeEnabled)}
-              className={`relative inline-flex h-6 w-11 items-center rounded-full transition-colors ${
-                isRealTimeEnabled ? 'bg-blue-600' : 'bg-gray-200 dark:bg-gray-700'
-              }`}
-            >
-              <span
-                className={`inline-block h-4 w-4 transform rounded-full bg-white transition-transform ${
-                  isRealTimeEnabled ? 'translate-x-6' : 'translate-x-1'
-                }`}
-              />
-            </button>
-          </div>
-          {isRealTimeEnabled && (
-            <div className="flex items-center space-x-2 text-sm text-green-600 dark:text-green-400">
-              <RefreshCw className="w-4 h-4 animate-spin" />
-              <span>Live</span>
+    <DashboardStoreContext.Provider value={store}>
+      <SectionArrivalContext.Provider value={arrive}>
+        <div className="space-y-6">
+          {/* Real-time toggle */}
+          <div className="flex justify-between items-center">
+            <h2 className="text-3xl font-bold text-gray-900 dark:text-white">
+              Dashboard Overview
+            </h2>
+            <div className="flex items-center space-x-4">
+              <div className="flex items-center space-x-2">
+                <label className="text-sm font-medium text-gray-700 dark:text-gray-300">
+                  Real-time Updates
+                </label>
+                <button
+                  onClick={() => setIsRealTimeEnabled(!isRealTimeEnabled)}
+                  className={`relative inline-flex h-6 w-11 items-center rounded-full transition-colors ${
+                    isRealTimeEnabled ? 'bg-blue-600' : 'bg-gray-200 dark:bg-gray-700'
+                  }`}
+                >
+                  <span
+                    className={`inline-block h-4 w-4 transform rounded-full bg-white transition-transform ${
+                      isRealTimeEnabled ? 'translate-x-6' : 'translate-x-1'
+                    }`}
+                  />
+                </button>
+              </div>
+              {isRealTimeEnabled && (
+                <div className="flex items-center space-x-2 text-sm text-green-600 dark:text-green-400">
+                  <RefreshCw className="w-4 h-4 animate-spin" />
+                  <span>Live</span>
+                </div>
+              )}
             </div>
-          )}
-        </div>
-      </div>
+          </div>
 
-      {/* Metric Cards */}
-      <div className="grid grid-cols-1 sm:grid-cols-2 lg:grid-cols-4 gap-6">
-        <MetricCard
-          title="Total Revenue"
-          value={formatCurrency(summaryMetrics.totalRevenue)}
-          change={growthMetrics.revenue}
-          icon={<DollarSign className="w-6 h-6" />}
-        />
-        <MetricCard
-          title="Total Users"
-          value={formatNumber(summaryMetrics.totalUsers)}
-          change={growthMetrics.users}
-          icon={<Users className="w-6 h-6" />}
-        />
-        <MetricCard
-          title="Conversions"
-          value={formatNumber(summaryMetrics.totalConversions)}
-          change={growthMetrics.conversions}
-          icon={<Target className="w-6 h-6" />}
-        />
-        <MetricCard
-          title="Conversion Rate"
-          value={formatPercentage(summaryMetrics.conversionRate)}
-          change={growthMetrics.conversionRate}
-          icon={<TrendingUp className="w-6 h-6" />}
-        />
-      </div>
+          {/* Metric Cards */}
+          {sectionSlot('metrics', <StoreMetricCards />, metrics)}
 
-      {/* Charts */}
-      <Charts data={mockData} campaignData={campaignData} />
+          {/* Charts */}
+          {sectionSlot('charts', <StoreCharts />, charts)}
 
-      {/* Data Table */}
-      <DataTable data={campaignData} />
+          {/* Data Table */}
+          {sectionSlot('table', <StoreDataTable />, table)}
 
-      {/* Footer info */}
-      <motion.div
-        initial={{ opacity: 0 }}
-        animate={{ opacity: 1 }}
-        transition={{ delay: 0.8 }}
-        className="text-center text-sm text-gray-500 dark:text-gray-400 mt-8"
-      >
-        Last updated: {lastUpdated.toLocaleString()} | 
-        Data refreshes every {isRealTimeEnabled ? '5 seconds' : 'manual refresh'}
-      </motion.div>
-    </div>
+          {/* Footer info */}
+          <LiveFooter store={store} isRealTimeEnabled={isRealTimeEnabled} />
+        </div>
+      </SectionArrivalContext.Provider>
+    </DashboardStoreContext.Provider>
   );
 }
 """
 
+# Streamed dashboard sections (server components)
+dashboard_sections_component = """// Server components for the dashboard's streamed sections. Each awaits only
+// the data it renders inside its own Suspense boundary (see app/page.tsx), so
+// the metric cards flush as soon as the summary is ready while the charts and
+// table follow with the full snapshot
+import { getDashboardSnapshot, getDashboardSummary, type DashboardQuery } from '@/lib/dashboardData';
+import { LiveCharts, LiveDataTable, LiveMetricCards } from './Dashboard';
+
+interface SectionProps {
+  query: DashboardQuery;
+}
+
+export async function MetricsSection({ query }: SectionProps) {
+  const summary = await getDashboardSummary(query);
+  return summary ? <LiveMetricCards summary={summary.summary} datasetVersion={summary.datasetVersion} /> : null;
+}
+
+export async function ChartsSection({ query }: SectionProps) {
+  const snapshot = await getDashboardSnapshot(query);
+  if (!snapshot) return null;
+
+  const { totals, series, campaigns, generatedAt, datasetVersion, rowCursor } = snapshot;
+  return <LiveCharts seed={{ totals, series, campaigns, generatedAt, datasetVersion, rowCursor }} />;
+}
+
+export async function TableSection({ query }: SectionProps) {
+  const snapshot = await getDashboardSnapshot(query);
+  return snapshot ? (
+    <LiveDataTable campaigns={snapshot.campaigns} datasetVersion={snapshot.datasetVersion} />
+  ) : null;
+}
+"""
+
 # Write the components
 with open(f"{project_name}/components/Sidebar.tsx", "w") as f:
     f.write(sidebar_component)
@@ -303,6 +540,10 @@ with open(f"{project_name}/components/Sidebar.tsx", "w") as f:
 with open(f"{project_name}/components/Dashboard.tsx", "w") as f:
     f.write(dashboard_component)
 
+with open(f"{project_name}/components/DashboardSections.tsx", "w") as f:
+    f.write(dashboard_sections_component)
+
 print("Created layout and dashboard components:")
 print("  - components/Sidebar.tsx")
-print("  - components/Dashboard.tsx")
\ No newline at end of file
+print("  - components/Dashboard.tsx")
+print("  - components/DashboardSections.tsx")
\ No newline at end of file
@@ -27,20 +27,175 @@ export default function RootLayout({
 """
 
 # Create app/page.tsx (main page)
-app_page = """'use client';
-
+app_page = """import { Suspense } from 'react';
+import { notFound } from 'next/navigation';
 import { Sidebar } from '@/components/Sidebar';
 import { Dashboard } from '@/components/Dashboard';
+import { ChartsSection, MetricsSection, TableSection } from '@/components/DashboardSections';
+import { ChartsSkeleton, MetricCardsSkeleton, TableSkeleton } from '@/components/LoadingSkeleton';
+import { DEFAULT_TENANT, hasTenant } from '@/lib/dashboardData';
+
+interface HomeProps {
+  searchParams: { tenant?: string };
+}
+
+// Aggregates are computed on the server so the page ships totals and daily
+// buckets instead of every raw row. The shell is sent at once; each section
+// streams in behind its skeleton as soon as its own data resolves
+export default async function Home({ searchParams }: HomeProps) {
+  const query = { tenant: searchParams.tenant ?? DEFAULT_TENANT };
+  // Checked before streaming starts, so an unknown tenant still gets a 404 status
+  if (!(await hasTenant(query.tenant))) notFound();
 
-export default function Home() {
   return (
     <Sidebar>
-      <Dashboard />
+      <Dashboard
+        query={query}
+        metrics={
+          <Suspense fallback={<MetricCardsSkeleton />}>
+            <MetricsSection query={query} />
+          </Suspense>
+        }
+        charts={
+          <Suspense fallback={<ChartsSkeleton />}>
+            <ChartsSection query={query} />
+          </Suspense>
+        }
+        table={
+          <Suspense fallback={<TableSkeleton />}>
+            <TableSection query={query} />
+          </Suspense>
+        }
+      />
     </Sidebar>
   );
 }
 """
 
+# Dashboard aggregates API
+dashboard_route_ts = """import { NextResponse, type NextRequest } from 'next/server';
+import { DEFAULT_TENANT, getDashboardSnapshot } from '@/lib/dashboardData';
+import { parseRangeParams } from './params';
+
+// GET /api/dashboard?tenant=acme&days=30 or ?from=2024-01-01&to=2024-03-31
+// Returns the aggregated snapshot for the tenant and range, never raw rows
+export async function GET(request: NextRequest) {
+  const query = parseRangeParams(request.nextUrl.searchParams, DEFAULT_TENANT);
+  if (query instanceof NextResponse) return query;
+
+  const snapshot = await getDashboardSnapshot(query);
+  if (!snapshot) {
+    return NextResponse.json({ error: `Unknown tenant: ${query.tenant}` }, { status: 404 });
+  }
+
+  return NextResponse.json(snapshot, {
+    headers: { 'Cache-Control': 'private, max-age=60' },
+  });
+}
+"""
+
+# Shared dashboard API parameters
+dashboard_params_ts = """import { NextResponse } from 'next/server';
+import type { DashboardQuery } from '@/lib/dashboardData';
+
+const ISO_DATE = /^\\d{4}-\\d{2}-\\d{2}$/;
+
+// The shared tenant and range parameters, or a 400 response when they are malformed
+export function parseRangeParams(params: URLSearchParams, defaultTenant: string): DashboardQuery | NextResponse {
+  const tenant = params.get('tenant') ?? defaultTenant;
+  const from = params.get('from') ?? undefined;
+  const to = params.get('to') ?? undefined;
+  const daysParam = params.get('days');
+
+  if ((from && !ISO_DATE.test(from)) || (to && !ISO_DATE.test(to))) {
+    return NextResponse.json({ error: 'from and to must be YYYY-MM-DD dates' }, { status: 400 });
+  }
+  const days = daysParam === null ? undefined : Number(daysParam);
+  if (days !== undefined && (!Number.isInteger(days) || days <= 0)) {
+    return NextResponse.json({ error: 'days must be a positive integer' }, { status: 400 });
+  }
+  return { tenant, from, to, days };
+}
+"""
+
+# Dashboard breakdown API
+breakdown_route_ts = """import { NextResponse, type NextRequest } from 'next/server';
+import { DEFAULT_TENANT, getDashboardBreakdown } from '@/lib/dashboardData';
+import { DIMENSIONS, isDimension, type DimensionFilter } from '@/lib/dimensions';
+import { parseRangeParams } from '../params';
+
+// GET /api/dashboard/breakdown?by=region,device&campaign=Search&days=30
+// Totals per combination of the `by` dimensions; any dimension given as a
+// parameter narrows the rows first, so each level of a drill-down is one request
+export async function GET(request: NextRequest) {
+  const params = request.nextUrl.searchParams;
+  const query = parseRangeParams(params, DEFAULT_TENANT);
+  if (query instanceof NextResponse) return query;
+
+  const by = (params.get('by') ?? '').split(',').filter(Boolean);
+  if (by.length === 0 || !by.every(isDimension) || new Set(by).size !== by.length) {
+    return NextResponse.json(
+      { error: `by must list distinct dimensions out of ${DIMENSIONS.join(', ')}` },
+      { status: 400 }
+    );
+  }
+
+  const where: DimensionFilter = {};
+  DIMENSIONS.forEach(dimension => {
+    const value = params.get(dimension);
+    if (value !== null) where[dimension] = value;
+  });
+
+  const breakdown = await getDashboardBreakdown({ ...query, by: by.filter(isDimension), where });
+  if (!breakdown) {
+    return NextResponse.json({ error: `Unknown tenant: ${query.tenant}` }, { status: 404 });
+  }
+
+  return NextResponse.json(breakdown, {
+    headers: { 'Cache-Control': 'private, max-age=60' },
+  });
+}
+"""
+
+# # Dashboard rows API
+rows_route_ts = """import { NextResponse, type NextRequest } from 'next/server';
+import { DEFAULT_TENANT, getRowDelta } from '@/lib/dashboardData';
+import { parseCursor } from '@/lib/rowDelta';
+
+// GET /api/dashboard/rows?tenant=acme&since=<cursor>
+// Rows appended since a cursor, taken from the dashboard snapshot or the
+// previous response, in the compact encoding of lib/rowDelta.ts; without
+// `since`, an empty delta whose cursor is the log's current end. The cursor is also the ETag, so a poll sent with
+// If-None-Match gets an empty 304 while nothing has changed
+export async function GET(request: NextRequest) {
+  const params = request.nextUrl.searchParams;
+  const tenant = params.get('tenant') ?? DEFAULT_TENANT;
+  const sinceParam = params.get('since');
+  const since = sinceParam === null ? null : parseCursor(sinceParam);
+  if (sinceParam !== null && !since) {
+    return NextResponse.json({ error: 'since must be a cursor from a snapshot or a previous response' }, { status: 400 });
+  }
+
+  const delta = await getRowDelta(tenant, since);
+  if (!delta) {
+    return NextResponse.json({ error: `Unknown tenant: ${tenant}` }, { status: 404 });
+  }
+
+  // Revalidated on every poll; the body is never reused without asking
+  const headers = { ETag: `"${delta.cursor}"`, 'Cache-Control': 'private, no-cache' };
+  const ifNoneMatch = request.headers.get('if-none-match');
+  const matches =
+    ifNoneMatch !== null &&
+    ifNoneMatch.split(',').some(tag => {
+      const value = tag.trim().replace(/^W\\//, '');
+      return value === '*' || value === headers.ETag;
+    });
+  if (matches && !delta.reset) return new NextResponse(null, { status: 304, headers });
+
+  return NextResponse.json(delta, { headers });
+}
+"""
+
 # Write the app files
 with open(f"{project_name}/app/layout.tsx", "w") as f:
     f.write(app_layout)
@@ -48,6 +203,22 @@ with open(f"{project_name}/app/layout.tsx", "w") as f:
 with open(f"{project_name}/app/page.tsx", "w") as f:
     f.write(app_page)
 
+with open(f"{project_name}/app/api/dashboard/route.ts", "w") as f:
+    f.write(dashboard_route_ts)
+
+with open(f"{project_name}/app/api/dashboard/params.ts", "w") as f:
+    f.write(dashboard_params_ts)
+
+with open(f"{project_name}/app/api/dashboard/breakdown/route.ts", "w") as f:
+    f.write(breakdown_route_ts)
+
+with open(f"{project_name}/app/api/dashboard/rows/route.ts", "w") as f:
+    f.write(rows_route_ts)
+
 print("Created Next.js App Router files:")
 print("  - app/layout.tsx")
-print("  - app/page.tsx")
\ No newline at end of file
+print("  - app/page.tsx")
+print("  - app/api/dashboard/route.ts")
+print("  - app/api/dashboard/params.ts")
+print("  - app/api/dashboard/breakdown/route.ts")
+print("  - app/api/dashboard/rows/route.ts")
\ No newline at end of file
@@ -17,6 +17,7 @@ A modern, interactive analytics dashboard built with Next.js 14, TypeScript, Tai
 - **Dark/Light Theme Toggle**: Seamless theme switching with persistent preferences
 - **Glassmorphism Effects**: Modern glass-style cards with backdrop blur
 - **Smooth Animations**: Framer Motion powered micro-interactions
+- **Performance Mode**: Gauge toggle in the sidebar that turns off animations, blur and transitions on slower machines
 - **Loading Skeletons**: Elegant loading states for better UX
 
 ### 📱 Advanced Features
@@ -76,9 +77,11 @@ npm run start
 ```
 admybrand-insights-fixed/
 ├── app/                    # Next.js App Router
+│   ├── api/dashboard/     # Aggregated dashboard data API
 │   ├── layout.tsx         # Root layout component
 │   └── page.tsx           # Main dashboard page
 ├── components/            # React components
+│   ├── CanvasChart.tsx    # Canvas renderer for large charts
 │   ├── Charts.tsx         # Interactive chart components
 │   ├── Dashboard.tsx      # Main dashboard component
 │   ├── DataTable.tsx      # Advanced data table
@@ -110,6 +113,10 @@ Interactive data visualizations including:
 - Conversion distribution pie chart
 - Multi-metric line chart
 
+Trend charts zoom from one day to two years. They read pre-aggregated hour/day/week/month buckets from `lib/rollups.ts` at the coarsest granularity that still fills the chart width, so a range change costs O(points rendered) and live rows update the buckets in place. Before reaching Recharts, each series is downsampled with Largest-Triangle-Three-Buckets (`lib/downsample.ts`) to about two points per pixel, re-applied whenever the chart resizes, so spikes stay visible on long ranges.
+
+Charts with more than 500 points (long ranges, or hundreds of campaigns in the bar chart) switch from SVG to a canvas renderer (`components/CanvasChart.tsx`) with the same tooltip and legend. Hovering repaints only a lightweight overlay, so frames stay cheap however many points are plotted.
+
 ### DataTable
 Advanced table with:
 - Column sorting
@@ -121,6 +128,14 @@ Advanced table with:
 ### Dashboard
 Main component orchestrating all features with real-time updates and loading states.
 
+Each dashboard section subscribes to its own slice of the live store through memoized selectors (`lib/selectors.ts`), and every chart card is memoized on its own data, so a live tick re-renders only what changed and a theme toggle re-renders no chart. In development, `__renderCounts.reset()` and `__renderCounts.get()` in the browser console show per-component render counts.
+
+There is no artificial loading delay. The page shell is sent at once, and the metric cards, charts and table each stream in behind their own skeleton and Suspense boundary (`components/DashboardSections.tsx`) as soon as their data resolves on the server. The cards only need the summary totals, so they usually arrive first. Load milestones are recorded as `dashboard:firstMetric`, `dashboard:charts` and `dashboard:table` performance marks and are also available from `__dashboardTimings.get()` in the console, in milliseconds since navigation start. `onLoadTiming` in `lib/useLoadTiming.ts` forwards them to analytics.
+
+Snapshots are also kept in the browser. `lib/snapshotCache.ts` stores each dashboard snapshot in IndexedDB, keyed by tenant, date range and schema version. An entry holds the per-campaign daily series and the chart rollup buckets already built from it. On a reload the cached entry is shown at once in place of the skeletons, and the footer reads "cached, refreshing…". The streamed snapshot then confirms it when its `datasetVersion` matches, or replaces it when it does not. The version is a hash of the tenant's rows, so servers holding the same fixture agree on it. The sample data is random per server process, though, so each restart, and each instance behind a load balancer, has its own version and replaces the cached copy. Storing a snapshot drops the tenant's entries of other dataset versions, then the least recently used entries beyond a 32 MiB budget. `__snapshotCache.usage()` and `__snapshotCache.clear()` in the console inspect and reset the cache.
+
+Performance mode (`lib/performanceMode.ts`) trades decoration for frame rate. The motion wrappers in `components/Motion.tsx` jump straight to their final state, chart entrance animations are skipped, and the `perf-mode` class on `<html>` turns off backdrop blur, shadows and CSS transitions. The gauge button next to the theme toggle switches it, and the choice is kept in `localStorage`. Without a stored choice it turns on by itself when the OS asks for reduced motion, or when a 60-frame probe after load measures less than 45 fps.
+
 ## 📊 Sample Data
 
 The dashboard uses realistic sample marketing data including:
@@ -128,6 +143,53 @@ The dashboard uses realistic sample marketing data including:
 - **Campaign Data**: Performance across Search, Social, Display, and Email channels
 - **Summary Statistics**: Aggregated KPIs and growth percentages
 
+For benchmarks and scale testing, `generate_fixtures.py` (requires NumPy) writes seeded datasets of up to 10 million rows with the same distributions to `public/fixtures/`. The same seed and shape always give the same files, with dates ending on 2024-12-31 unless `--end-date` moves them; load them with `loadMetricFixture` from `lib/fixtures.ts`:
+
+```bash
+python generate_fixtures.py --days 365 --campaigns 12 --rows-per-day 100 --seed 7
+```
+
+### Dashboard API
+
+Raw rows never reach the browser: the dashboard page is rendered on the server from a pre-aggregated snapshot (totals, per-campaign sums and daily buckets) built by `lib/dashboardData.ts`. The same snapshot is served as JSON, cached per tenant and date range for 60 seconds. The default tenant is the sample data; any fixture name in `public/fixtures/` is also a tenant:
+
+```bash
+curl 'http://localhost:3000/api/dashboard?days=30'
+curl 'http://localhost:3000/api/dashboard?tenant=acme&from=2024-01-01&to=2024-03-31'
+```
+
+Open `/?tenant=acme` to view a fixture in the dashboard.
+
+Rows carry a campaign plus channel, region, device and creative attributes, stored as dictionary codes. `/api/dashboard/breakdown` groups them by any combination of these dimensions; every dimension passed as a parameter filters the rows first, so drilling down is one request per level:
+
+```bash
+curl 'http://localhost:3000/api/dashboard/breakdown?by=region,device&days=30'
+curl 'http://localhost:3000/api/dashboard/breakdown?by=creative&campaign=Search&region=Europe'
+```
+
+Real-time updates come from `/api/dashboard/rows`, which returns the rows appended to the tenant's row log since a cursor. The row log (`lib/rowLog.ts`) is a local stand-in for an event store: it simulates one row per campaign every 5 seconds. Each response's `cursor` is also its ETag. The dashboard snapshot carries the log's cursor as `rowCursor`, and the dashboard polls from there with `since=<cursor>` and `If-None-Match`, keeping the last cursor when real-time updates are switched off and on, so no row appended in between is missed. An unchanged log answers with an empty `304 Not Modified`. New rows come back column by column, with dates and campaigns sent once and referenced by index (`lib/rowDelta.ts`). A cursor from before a server restart, or older than the retained rows, gets `reset: true` and continues from the log's current end:
+
+```bash
+curl -i 'http://localhost:3000/api/dashboard/rows'                          # empty delta, ETag "<cursor>"
+curl -i -H 'If-None-Match: "<cursor>"' 'http://localhost:3000/api/dashboard/rows?since=<cursor>'
+```
+
+### Benchmarks
+
+`npm run bench` times the data-processing hot paths (aggregation, daily rollups, dimension group-by, table indexing and queries, CSV encoding) on fixtures from 1k to 10M rows and reports throughput, p50/p99 latency and peak heap growth. Results are saved as JSON in `bench/results/`; pass `--compare <file>` to flag p50 regressions against an earlier run:
+
+```bash
+npm run bench -- --sizes 1000,100000 --compare bench/results/<commit>.json
+```
+
+### Bundle budget
+
+Each chart card (`RevenueTrendCard`, `CampaignBarCard`, `ConversionPieCard`, `MetricTrendCard`) and the campaign table is its own chunk. Recharts and the table code are loaded with `next/dynamic` only when their panel scrolls near the viewport (`LazyPanel`), and skeletons hold the layout until then. `npm run bundle` lists every chunk of a production build with its raw and gzip size and the routes that load it at startup. The run fails when a route's startup JavaScript or a single lazy chunk exceeds its gzip budget:
+
+```bash
+npm run build && npm run bundle -- --initial-budget 220 --chunk-budget 160
+```
+
 ## 🔧 Customization
 
 ### Adding New Charts
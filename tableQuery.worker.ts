@@ -0,0 +1,75 @@
+import {
+  indexTable,
+  buildFilterMask,
+  runTableQuery,
+  type TableColumns,
+  type TableIndex,
+  type TableQuery,
+} from './tableQuery';
+
+export type TableWorkerRequest =
+  | { type: 'load'; columns: TableColumns }
+  | { type: 'query'; id: number; query: TableQuery }
+  // Every matching row in sort order, ignoring the query's page; never superseded
+  | { type: 'export'; id: number; query: TableQuery };
+
+export interface TableWorkerResponse {
+  id: number;
+  rows: Uint32Array;
+  total: number;
+}
+
+let index: TableIndex | null = null;
+let pending: { id: number; query: TableQuery } | null = null;
+let exports: { id: number; query: TableQuery }[] = [];
+let scheduled = false;
+
+// The filter bitmap is reused while only the sort or page changes
+let cachedFilter: { key: string; mask: Uint32Array } | null = null;
+
+function filterMask(table: TableIndex, query: TableQuery): Uint32Array {
+  const key = JSON.stringify([query.search, query.minRevenue, query.maxRevenue]);
+  if (cachedFilter?.key !== key) {
+    cachedFilter = { key, mask: buildFilterMask(table.columns, query) };
+  }
+  return cachedFilter.mask;
+}
+
+function respond(id: number, table: TableIndex, query: TableQuery) {
+  const { rows, total } = runTableQuery(table, query, filterMask(table, query));
+  const response: TableWorkerResponse = { id, rows, total };
+  self.postMessage(response, { transfer: [rows.buffer] });
+}
+
+// Answers every export, then only the newest pending query; anything it
+// superseded is dropped unrun
+function flush() {
+  scheduled = false;
+  if (!index) return;
+
+  const table = index;
+  exports.forEach(({ id, query }) => respond(id, table, { ...query, page: 1, pageSize: table.columns.length }));
+  exports = [];
+  if (!pending) return;
+
+  const { id, query } = pending;
+  pending = null;
+  respond(id, table, query);
+}
+
+self.onmessage = (event: MessageEvent<TableWorkerRequest>) => {
+  const message = event.data;
+  if (message.type === 'load') {
+    index = indexTable(message.columns);
+    cachedFilter = null;
+  } else if (message.type === 'export') {
+    exports.push({ id: message.id, query: message.query });
+  } else {
+    pending = { id: message.id, query: message.query };
+  }
+
+  if (!scheduled) {
+    scheduled = true;
+    setTimeout(flush, 0);
+  }
+};
@@ -0,0 +1,129 @@
+import { useCallback, useEffect, useRef, useState } from 'react';
+import type { CampaignData } from '@/data/mockData';
+import {
+  encodeTable,
+  indexTable,
+  runTableQuery,
+  tableTransferables,
+  type TableIndex,
+  type TableQuery,
+} from './tableQuery';
+import type { TableWorkerRequest, TableWorkerResponse } from './tableQuery.worker';
+
+interface TableQueryState {
+  rows: CampaignData[];
+  total: number;
+}
+
+export interface TableQueryExport {
+  // Ids of every row matching the filters, in sort order
+  rows: Uint32Array;
+  // The dataset the ids index into
+  data: CampaignData[];
+}
+
+interface TableQueryHook extends TableQueryState {
+  // Every matching row of a query regardless of its page, resolved by the
+  // worker from the index it already holds
+  queryAll(query: TableQuery): Promise<TableQueryExport>;
+}
+
+interface PendingExport {
+  data: CampaignData[];
+  resolve: (result: TableQueryExport) => void;
+  reject: (error: Error) => void;
+}
+
+// Answer table queries off the main thread. The dataset is transferred to the
+// worker once per `data` change, where its sort permutations are built. Every
+// query gets an id and only the answer to the newest one is applied, so stale
+// keystrokes never overwrite fresh results. Falls back to running the query
+// inline where workers are unavailable.
+export function useTableQuery(data: CampaignData[], query: TableQuery): TableQueryHook {
+  const workerRef = useRef<Worker | null>(null);
+  const latestId = useRef(0);
+  // Exports take negative ids so they never collide with page queries
+  const exportId = useRef(0);
+  const pendingExports = useRef(new Map<number, PendingExport>());
+  const queriedData = useRef(data);
+  const [result, setResult] = useState<TableQueryState>({ rows: [], total: 0 });
+  // The inline fallback's index, built on first use and rebuilt only when `data` changes
+  const inlineIndex = useRef<{ data: CampaignData[]; index: TableIndex } | null>(null);
+
+  const indexInline = useCallback((source: CampaignData[]): TableIndex => {
+    if (inlineIndex.current?.data !== source) {
+      inlineIndex.current = { data: source, index: indexTable(encodeTable(source)) };
+    }
+    return inlineIndex.current.index;
+  }, []);
+
+  useEffect(() => {
+    if (typeof Worker === 'undefined') return;
+
+    const worker = new Worker(new URL('./tableQuery.worker.ts', import.meta.url));
+    worker.onmessage = (event: MessageEvent<TableWorkerResponse>) => {
+      const { id, rows, total } = event.data;
+      const pendingExport = pendingExports.current.get(id);
+      if (pendingExport) {
+        pendingExports.current.delete(id);
+        pendingExport.resolve({ rows, data: pendingExport.data });
+        return;
+      }
+      if (id !== latestId.current) return;
+      const source = queriedData.current;
+      setResult({ rows: Array.from(rows, row => source[row]), total });
+    };
+    workerRef.current = worker;
+    const exportsInFlight = pendingExports.current;
+
+    return () => {
+      worker.terminate();
+      workerRef.current = null;
+      exportsInFlight.forEach(({ reject }) => reject(new Error('Table worker terminated')));
+      exportsInFlight.clear();
+    };
+  }, []);
+
+  useEffect(() => {
+    const worker = workerRef.current;
+    if (!worker) return;
+
+    const columns = encodeTable(data);
+    const message: TableWorkerRequest = { type: 'load', columns };
+    worker.postMessage(message, tableTransferables(columns));
+  }, [data]);
+
+  useEffect(() => {
+    const id = ++latestId.current;
+    queriedData.current = data;
+
+    const worker = workerRef.current;
+    if (worker) {
+      const message: TableWorkerRequest = { type: 'query', id, query };
+      worker.postMessage(message);
+    } else {
+      const { rows, total } = runTableQuery(indexInline(data), query);
+      setResult({ rows: Array.from(rows, row => data[row]), total });
+    }
+  }, [data, query, indexInline]);
+
+  const queryAll = useCallback(
+    (exportQuery: TableQuery): Promise<TableQueryExport> => {
+      const worker = workerRef.current;
+      if (!worker) {
+        const { rows } = runTableQuery(indexInline(data), { ...exportQuery, page: 1, pageSize: data.length });
+        return Promise.resolve({ rows, data });
+      }
+
+      const id = -++exportId.current;
+      return new Promise((resolve, reject) => {
+        pendingExports.current.set(id, { data, resolve, reject });
+        const message: TableWorkerRequest = { type: 'export', id, query: exportQuery };
+        worker.postMessage(message);
+      });
+    },
+    [data, indexInline]
+  );
+
+  return { ...result, queryAll };
+}
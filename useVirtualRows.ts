@@ -0,0 +1,51 @@
+import { useCallback, useEffect, useRef, useState, type UIEvent } from 'react';
+
+interface VirtualRows {
+  // Rows [start, end) are mounted; the paddings stand in for the rest
+  start: number;
+  end: number;
+  padTop: number;
+  padBottom: number;
+  onScroll: (event: UIEvent<HTMLElement>) => void;
+}
+
+// Window a long list of fixed-height rows to those visible in a scroll viewport.
+// Scroll updates are coalesced to one per animation frame.
+export function useVirtualRows(
+  count: number,
+  rowHeight: number,
+  viewportHeight: number,
+  overscan = 8
+): VirtualRows {
+  const [scrollTop, setScrollTop] = useState(0);
+  const frame = useRef<number | null>(null);
+
+  const onScroll = useCallback((event: UIEvent<HTMLElement>) => {
+    const top = event.currentTarget.scrollTop;
+    if (frame.current !== null) cancelAnimationFrame(frame.current);
+    frame.current = requestAnimationFrame(() => {
+      frame.current = null;
+      setScrollTop(top);
+    });
+  }, []);
+
+  useEffect(
+    () => () => {
+      if (frame.current !== null) cancelAnimationFrame(frame.current);
+    },
+    []
+  );
+
+  const visible = Math.ceil(viewportHeight / rowHeight);
+  const first = Math.min(Math.floor(scrollTop / rowHeight), count - visible);
+  const start = Math.max(0, first - overscan);
+  const end = Math.min(count, Math.max(first, 0) + visible + overscan);
+
+  return {
+    start,
+    end,
+    padTop: start * rowHeight,
+    padBottom: (count - end) * rowHeight,
+    onScroll,
+  };
+}
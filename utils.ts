@@ -5,19 +5,74 @@ export function cn(...inputs: ClassValue[]) {
   return twMerge(clsx(inputs));
 }
 
+export interface NumberFormatOptions {
+  locale?: string;
+  style?: 'decimal' | 'currency' | 'percent';
+  currency?: string;
+  minimumFractionDigits?: number;
+  maximumFractionDigits?: number;
+}
+
+const FORMATTER_CACHE_LIMIT = 32;
+const formatterCache = new Map<string, Intl.NumberFormat>();
+
+// Intl.NumberFormat construction is expensive, so formatters are pooled by
+// (locale, style, currency, fraction digits), evicting the least recently used
+export function getNumberFormatter({
+  locale = 'en-US',
+  style = 'decimal',
+  currency,
+  minimumFractionDigits,
+  maximumFractionDigits,
+}: NumberFormatOptions = {}): Intl.NumberFormat {
+  const key = `${locale}|${style}|${currency}|${minimumFractionDigits}|${maximumFractionDigits}`;
+  const cached = formatterCache.get(key);
+  if (cached) {
+    // Re-insert so Map order tracks recency
+    formatterCache.delete(key);
+    formatterCache.set(key, cached);
+    return cached;
+  }
+
+  const formatter = new Intl.NumberFormat(locale, {
+    style,
+    currency,
+    minimumFractionDigits,
+    maximumFractionDigits,
+  });
+  formatterCache.set(key, formatter);
+  if (formatterCache.size > FORMATTER_CACHE_LIMIT) {
+    formatterCache.delete(formatterCache.keys().next().value as string);
+  }
+  return formatter;
+}
+
+function currencyOptions(currency: string, locale: string): NumberFormatOptions {
+  return { locale, style: 'currency', currency, minimumFractionDigits: 0, maximumFractionDigits: 0 };
+}
+
 // Format currency
-export function formatCurrency(amount: number): string {
-  return new Intl.NumberFormat('en-US', {
-    style: 'currency',
-    currency: 'USD',
-    minimumFractionDigits: 0,
-    maximumFractionDigits: 0,
-  }).format(amount);
+export function formatCurrency(amount: number, currency = 'USD', locale = 'en-US'): string {
+  return getNumberFormatter(currencyOptions(currency, locale)).format(amount);
 }
 
 // Format number with commas
-export function formatNumber(num: number): string {
-  return new Intl.NumberFormat('en-US').format(num);
+export function formatNumber(num: number, locale = 'en-US'): string {
+  return getNumberFormatter({ locale }).format(num);
+}
+
+// Format a whole column with a single formatter lookup
+export function formatColumn(values: ArrayLike<number>, options: NumberFormatOptions = {}): string[] {
+  const formatter = getNumberFormatter(options);
+  const formatted = new Array<string>(values.length);
+  for (let i = 0; i < values.length; i++) {
+    formatted[i] = formatter.format(values[i]);
+  }
+  return formatted;
+}
+
+export function formatCurrencyColumn(values: ArrayLike<number>, currency = 'USD', locale = 'en-US'): string[] {
+  return formatColumn(values, currencyOptions(currency, locale));
 }
 
 // Format percentage
@@ -31,31 +86,84 @@ export function calculateGrowth(current: number, previous: number): number {
   return ((current - previous) / previous) * 100;
 }
 
-// Export to CSV functionality
-export function exportToCSV(data: any[], filename: string) {
-  const csvContent = convertToCSV(data);
-  downloadCSV(csvContent, filename);
+// Any plain row object; its own keys become the CSV columns
+type CSVRow = object;
+
+interface CSVExportOptions {
+  // Rows encoded per chunk before yielding back to the event loop
+  chunkSize?: number;
+  // Row count for progress reporting when `rows` is not an array
+  total?: number;
+  onProgress?: (written: number, total: number) => void;
+}
+
+const CSV_SPECIAL = /[",\r\n]/;
+
+// Quote strings (and anything containing a delimiter), doubling embedded quotes
+function escapeCSVField(value: unknown): string {
+  if (value === null || value === undefined) return '';
+  const text = String(value);
+  if (typeof value === 'string' || CSV_SPECIAL.test(text)) {
+    return `"${text.replace(/"/g, '""')}"`;
+  }
+  return text;
 }
 
-function convertToCSV(data: any[]): string {
-  if (data.length === 0) return '';
-
-  const headers = Object.keys(data[0]);
-  const csvRows = [
-    headers.join(','),
-    ...data.map(row => 
-      headers.map(header => {
-        const value = row[header];
-        return typeof value === 'string' ? `"${value}"` : value;
-      }).join(',')
-    )
-  ];
-
-  return csvRows.join('\n');
+// Lazily encode rows as CSV text, `chunkSize` lines per yielded chunk.
+// The header is taken from the first row's keys
+export function* csvChunks(rows: Iterable<CSVRow>, chunkSize = 5000): Generator<string, void> {
+  let headers: string[] | null = null;
+  let lines: string[] = [];
+  let pending = 0;
+
+  // Iterated by hand: the ES5 type-check target only allows for...of over arrays
+  const iterator = rows[Symbol.iterator]();
+  for (let step = iterator.next(); !step.done; step = iterator.next()) {
+    const row = step.value;
+    if (headers === null) {
+      headers = Object.keys(row);
+      lines.push(headers.map(header => (CSV_SPECIAL.test(header) ? escapeCSVField(header) : header)).join(','));
+    }
+    const record = row as Record<string, unknown>;
+    lines.push(headers.map(header => escapeCSVField(record[header])).join(','));
+    if (++pending >= chunkSize) {
+      yield lines.join('\n') + '\n';
+      lines = [];
+      pending = 0;
+    }
+  }
+
+  if (lines.length > 0) {
+    yield lines.join('\n') + '\n';
+  }
+}
+
+const yieldToEventLoop = () => new Promise<void>(resolve => setTimeout(resolve, 0));
+
+// Export to CSV functionality. The file is assembled from per-chunk Blob parts
+// so no single string holds the whole export, and the main thread is released
+// between chunks
+export async function exportToCSV(
+  rows: Iterable<CSVRow>,
+  filename: string,
+  { chunkSize = 5000, total, onProgress }: CSVExportOptions = {}
+) {
+  const rowCount = total ?? (Array.isArray(rows) ? rows.length : 0);
+  const parts: Blob[] = [];
+  let written = 0;
+
+  const chunks = csvChunks(rows, chunkSize);
+  for (let step = chunks.next(); !step.done; step = chunks.next()) {
+    parts.push(new Blob([step.value]));
+    written = Math.min(written + chunkSize, rowCount);
+    onProgress?.(written, rowCount);
+    await yieldToEventLoop();
+  }
+
+  downloadCSV(new Blob(parts, { type: 'text/csv;charset=utf-8;' }), filename);
 }
 
-function downloadCSV(csvContent: string, filename: string) {
-  const blob = new Blob([csvContent], { type: 'text/csv;charset=utf-8;' });
+function downloadCSV(blob: Blob, filename: string) {
   const link = document.createElement('a');
   const url = URL.createObjectURL(blob);
 
@@ -66,4 +174,5 @@ function downloadCSV(csvContent: string, filename: string) {
   document.body.appendChild(link);
   link.click();
   document.body.removeChild(link);
+  setTimeout(() => URL.revokeObjectURL(url), 0);
 }